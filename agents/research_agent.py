@@ -25,7 +25,6 @@ from pathlib import Path
 from typing import Any
 from uuid import uuid4
 
-import httpx
 import structlog
 from tenacity import retry, stop_after_attempt, wait_exponential
 
@@ -236,23 +235,26 @@ class PerplexityClient:
         """Submit prompt to Perplexity API."""
         self.log.info("querying_perplexity", model=model, prompt_len=len(prompt))
         
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.post(
-                PERPLEXITY_API_URL,
-                json={
-                    "model": model,
-                    "messages": [{"role": "user", "content": prompt}],
-                    "temperature": temperature,
-                    "max_tokens": max_tokens,
-                },
-                headers={"Authorization": f"Bearer {self.api_key}"},
-            )
-            response.raise_for_status()
-            data = response.json()
-            content = data["choices"][0]["message"]["content"]
-            
-            self.log.info("perplexity_response", response_len=len(content))
-            return content
+        from runtime.http_clients import get_http_client
+
+        client = get_http_client("research")
+        response = await client.post(
+            PERPLEXITY_API_URL,
+            json={
+                "model": model,
+                "messages": [{"role": "user", "content": prompt}],
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+            },
+            headers={"Authorization": f"Bearer {self.api_key}"},
+            timeout=timeout,
+        )
+        response.raise_for_status()
+        data = response.json()
+        content = data["choices"][0]["message"]["content"]
+        
+        self.log.info("perplexity_response", response_len=len(content))
+        return content
     
     async def deep_research(
         self,
@@ -30,6 +30,8 @@ import httpx
 from typing import Optional
 from dataclasses import dataclass
 
+from runtime.http_clients import get_http_client
+
 logger = structlog.get_logger(__name__)
 
 
@@ -55,7 +57,9 @@ class EmailAdapterClient:
         self._client: Optional[httpx.AsyncClient] = None
 
     async def __aenter__(self) -> "EmailAdapterClient":
-        self._client = httpx.AsyncClient(
+        # Shared keep-alive pool per base_url/credentials (runtime.http_clients)
+        self._client = get_http_client(
+            "email",
             base_url=self.config.base_url,
             timeout=self.config.timeout,
             headers=self._get_headers(),
@@ -63,8 +67,7 @@ class EmailAdapterClient:
         return self
 
     async def __aexit__(self, *args) -> None:
-        if self._client:
-            await self._client.aclose()
+        self._client = None
 
     def _get_headers(self) -> dict[str, str]:
         headers = {"Content-Type": "application/json"}
@@ -15,7 +15,7 @@ Version: 1.0.0
 Created: 2026-01-06
 """
 
-from typing import Any, Optional
+from typing import Any, Awaitable, Callable, Optional
 
 from fastapi import Request, HTTPException
 
@@ -35,6 +35,7 @@ __all__ = [
     "get_neo4j_client",
     "get_redis_client",
     "get_observability_service",
+    "require_subsystem",
 ]
 
 
@@ -200,6 +201,23 @@ def get_world_model_service(request: Request) -> Optional[Any]:
     return getattr(request.app.state, "world_model_service", None)
 
 
+# =============================================================================
+# Lazy Startup Subsystems
+# =============================================================================
+
 
+def require_subsystem(name: str) -> Callable[[Request], Awaitable[None]]:
+    """
+    Dependency factory: initialize a lazy startup subsystem on first use.
+
+    Concurrent first requests share one initialization (see api.startup).
+    A failed subsystem is not retried; routes see the same app.state as
+    after a failed eager init.
+    """
 
+    async def _ensure(request: Request) -> None:
+        orchestrator = getattr(request.app.state, "startup_orchestrator", None)
+        if orchestrator is not None:
+            await orchestrator.ensure(name)
 
+    return _ensure
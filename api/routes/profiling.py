@@ -0,0 +1,95 @@
+"""
+L9 API Routes - Profiling Endpoints
+===================================
+
+Admin endpoints to toggle the sampling profiler and event-loop monitor on a
+live server and download collapsed stacks for flamegraph tooling
+(flamegraph.pl, speedscope, inferno).
+
+Version: 1.0.0
+"""
+
+from typing import Any
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import PlainTextResponse
+from pydantic import BaseModel, Field
+
+import structlog
+
+from api.dependencies import verify_api_key
+from core.observability.profiling import (
+    get_collapsed_stacks,
+    get_profiling_status,
+    start_profiling,
+    stop_profiling,
+)
+
+logger = structlog.get_logger(__name__)
+
+router = APIRouter(prefix="/admin/profiler", tags=["profiling"])
+
+
+# =============================================================================
+# Request / Response Models
+# =============================================================================
+
+
+class ProfilerStartRequest(BaseModel):
+    """Profiler start options."""
+
+    interval_ms: float = Field(5.0, ge=1.0, le=1000.0, description="Sampling interval")
+    monitor_loop: bool = Field(True, description="Also monitor event-loop lag")
+    slow_callback_ms: float = Field(
+        100.0, ge=10.0, description="Loop stall that counts as a blocking call"
+    )
+
+
+class ProfilerStatusResponse(BaseModel):
+    """Profiler and event-loop monitor reports."""
+
+    profiler: dict[str, Any] | None
+    event_loop: dict[str, Any] | None
+
+
+# =============================================================================
+# Endpoints
+# =============================================================================
+
+
+@router.post("/start", response_model=ProfilerStatusResponse)
+async def start_profiler(
+    request: ProfilerStartRequest | None = None,
+    _api_key: str = Depends(verify_api_key),
+):
+    """Start sampling (restarts clear the previous session's stacks)."""
+    request = request or ProfilerStartRequest()
+    return start_profiling(
+        interval=request.interval_ms / 1000,
+        monitor_loop=request.monitor_loop,
+        slow_callback_threshold=request.slow_callback_ms / 1000,
+    )
+
+
+@router.post("/stop", response_model=ProfilerStatusResponse)
+async def stop_profiler(_api_key: str = Depends(verify_api_key)):
+    """Stop sampling and return the final report."""
+    return await stop_profiling()
+
+
+@router.get("/status", response_model=ProfilerStatusResponse)
+async def profiler_status(
+    limit: int = Query(20, ge=1, le=500, description="Top functions to report"),
+    _api_key: str = Depends(verify_api_key),
+):
+    """Current profiler report, per-task CPU and event-loop lag."""
+    return get_profiling_status(limit)
+
+
+@router.get("/flamegraph", response_class=PlainTextResponse)
+async def profiler_flamegraph(
+    min_count: int = Query(1, ge=1, description="Drop stacks with fewer samples"),
+    _api_key: str = Depends(verify_api_key),
+):
+    """Collapsed stacks ('frame;frame;frame count' per line)."""
+    return PlainTextResponse(get_collapsed_stacks(min_count))
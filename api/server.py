@@ -14,6 +14,7 @@ Version: 0.5.0 (Research Factory Integration)
 
 from config.settings import settings
 
+import asyncio
 import os
 from pathlib import Path
 import structlog
@@ -32,6 +33,8 @@ from api.memory.router import router as memory_router
 from api.memory.graph import router as graph_router
 from api.memory.cache import router as cache_router
 from api.auth import verify_api_key
+from api.dependencies import require_subsystem
+from api.startup import StartupMode, StartupOrchestrator
 import api.db as db
 import api.os_routes as os_routes
 import api.agent_routes as agent_routes
@@ -69,7 +72,7 @@ try:
     from api.routes.slack import router as slack_router
     from api.slack_adapter import SlackRequestValidator
     from api.slack_client import SlackAPIClient
-    import httpx
+    from runtime.http_clients import get_http_client
 
     _has_slack = True
 except ImportError:
@@ -367,6 +370,9 @@ async def lifespan(app: FastAPI):
     """
     FastAPI lifespan context manager.
     Handles startup (migrations + memory init) and shutdown.
+
+    Subsystems are registered with a StartupOrchestrator (api/startup.py)
+    and initialize concurrently once their dependencies are up.
     """
     # ========================================================================
     # STARTUP: Validate required environment variables (fail-fast)
@@ -448,394 +454,399 @@ async def lifespan(app: FastAPI):
 
     # Get database URL
     database_url = os.getenv("MEMORY_DSN") or os.getenv("DATABASE_URL")
-    if not database_url:
-        logger.warning(
-            "MEMORY_DSN/DATABASE_URL not set. Memory system will not be available. "
-            "Set MEMORY_DSN environment variable to enable memory."
-        )
-    else:
-        try:
-            # Run migrations
-            logger.info("Running database migrations...")
-            migration_result = await run_migrations(database_url)
-            logger.info(
-                f"Migrations complete: {migration_result['applied']} applied, "
-                f"{migration_result['skipped']} skipped, {migration_result['errors']} errors"
-            )
-            if migration_result["errors"]:
-                logger.error(f"Migration errors: {migration_result['error_details']}")
-
-            # Initialize memory service
-            logger.info("Initializing memory service...")
-            substrate_service = await init_service(
-                database_url=database_url,
-                embedding_provider_type=os.getenv("EMBEDDING_PROVIDER", "openai"),
-                embedding_model=os.getenv("EMBEDDING_MODEL", "text-embedding-3-large"),
-                openai_api_key=os.getenv("OPENAI_API_KEY"),
+    async def _init_memory() -> None:
+        if not database_url:
+            logger.warning(
+                "MEMORY_DSN/DATABASE_URL not set. Memory system will not be available. "
+                "Set MEMORY_DSN environment variable to enable memory."
             )
-            logger.info("Memory service initialized")
+        else:
+            try:
+                # Run migrations
+                logger.info("Running database migrations...")
+                migration_result = await run_migrations(database_url)
+                logger.info(
+                    f"Migrations complete: {migration_result['applied']} applied, "
+                    f"{migration_result['skipped']} skipped, {migration_result['errors']} errors"
+                )
+                if migration_result["errors"]:
+                    logger.error(f"Migration errors: {migration_result['error_details']}")
+
+                # Initialize memory service
+                logger.info("Initializing memory service...")
+                substrate_service = await init_service(
+                    database_url=database_url,
+                    embedding_provider_type=os.getenv("EMBEDDING_PROVIDER", "openai"),
+                    embedding_model=os.getenv("EMBEDDING_MODEL", "text-embedding-3-large"),
+                    openai_api_key=os.getenv("OPENAI_API_KEY"),
+                )
+                logger.info("Memory service initialized")
 
-            # Store in app state for route dependencies
-            app.state.substrate_service = substrate_service
-        except Exception as e:
-            logger.error(f"Failed to initialize memory system: {e}", exc_info=True)
-            # Don't fail startup, but log error
-            app.state.substrate_service = None
+                # Store in app state for route dependencies
+                app.state.substrate_service = substrate_service
+            except Exception as e:
+                logger.error(f"Failed to initialize memory system: {e}", exc_info=True)
+                # Don't fail startup, but log error
+                app.state.substrate_service = None
 
     # Initialize Quantum Research Factory (if enabled)
-    if _has_research and database_url:
-        try:
-            logger.info("Initializing Quantum Research Factory...")
-            await init_runtime(database_url)
-            app.state.research_enabled = True
-            logger.info("Quantum Research Factory initialized at /research")
-        except Exception as e:
-            logger.error(f"Failed to initialize Research Factory: {e}", exc_info=True)
+    async def _init_research() -> None:
+        if _has_research and database_url:
+            try:
+                logger.info("Initializing Quantum Research Factory...")
+                await init_runtime(database_url)
+                app.state.research_enabled = True
+                logger.info("Quantum Research Factory initialized at /research")
+            except Exception as e:
+                logger.error(f"Failed to initialize Research Factory: {e}", exc_info=True)
+                app.state.research_enabled = False
+        elif _has_research:
+            logger.warning("Research Factory not initialized: database_url required")
             app.state.research_enabled = False
-    elif _has_research:
-        logger.warning("Research Factory not initialized: database_url required")
-        app.state.research_enabled = False
 
     # Initialize World Model Runtime (if enabled and substrate available)
-    if (
-        _has_world_model_runtime
-        and hasattr(app.state, "substrate_service")
-        and app.state.substrate_service
-    ):
-        try:
-            logger.info("Initializing World Model Runtime...")
-            world_model_runtime = await create_runtime_with_substrate(
-                app.state.substrate_service,
-                poll_interval_seconds=60,  # Poll memory every minute
-                batch_size=50,
-            )
-            app.state.world_model_runtime = world_model_runtime
-
-            # Start the runtime loop in background
-            import asyncio
+    async def _init_world_model_runtime() -> None:
+        if (
+            _has_world_model_runtime
+            and hasattr(app.state, "substrate_service")
+            and app.state.substrate_service
+        ):
+            try:
+                logger.info("Initializing World Model Runtime...")
+                world_model_runtime = await create_runtime_with_substrate(
+                    app.state.substrate_service,
+                    poll_interval_seconds=60,  # Poll memory every minute
+                    batch_size=50,
+                )
+                app.state.world_model_runtime = world_model_runtime
 
-            app.state.world_model_task = asyncio.create_task(
-                world_model_runtime.run_forever()
-            )
-            logger.info(
-                "World Model Runtime initialized and running",
-                poll_interval=60,
-                batch_size=50,
-            )
-        except Exception as e:
-            logger.error(
-                f"Failed to initialize World Model Runtime: {e}", exc_info=True
+                # Start the runtime loop in background
+                app.state.world_model_task = asyncio.create_task(
+                    world_model_runtime.run_forever()
+                )
+                logger.info(
+                    "World Model Runtime initialized and running",
+                    poll_interval=60,
+                    batch_size=50,
+                )
+            except Exception as e:
+                logger.error(
+                    f"Failed to initialize World Model Runtime: {e}", exc_info=True
+                )
+                app.state.world_model_runtime = None
+        elif _has_world_model_runtime:
+            logger.warning(
+                "World Model Runtime not initialized: substrate_service required"
             )
             app.state.world_model_runtime = None
-    elif _has_world_model_runtime:
-        logger.warning(
-            "World Model Runtime not initialized: substrate_service required"
-        )
-        app.state.world_model_runtime = None
 
     # Initialize Governance Engine (if enabled)
-    if _has_governance:
-        try:
-            policy_dir = os.getenv("POLICY_MANIFEST_DIR", "config/policies")
-            logger.info("Initializing Governance Engine from %s...", policy_dir)
+    async def _init_governance() -> None:
+        if _has_governance:
+            try:
+                policy_dir = os.getenv("POLICY_MANIFEST_DIR", "config/policies")
+                logger.info("Initializing Governance Engine from %s...", policy_dir)
 
-            substrate = getattr(app.state, "substrate_service", None)
-            governance_engine = create_governance_engine(
-                policy_dir=policy_dir,
-                substrate_service=substrate,
-            )
+                substrate = getattr(app.state, "substrate_service", None)
+                governance_engine = create_governance_engine(
+                    policy_dir=policy_dir,
+                    substrate_service=substrate,
+                )
 
-            app.state.governance_engine = governance_engine
-            logger.info(
-                "Governance Engine initialized: %d policies loaded",
-                governance_engine.policy_count,
-            )
-        except (PolicyLoadError, InvalidPolicyError) as e:
-            # Governance failure is critical - log but allow startup for dev
-            logger.critical("Governance Engine failed to initialize: %s", str(e))
-            app.state.governance_engine = None
-        except Exception as e:
-            logger.error(
-                "Failed to initialize Governance Engine: %s", str(e), exc_info=True
-            )
+                app.state.governance_engine = governance_engine
+                logger.info(
+                    "Governance Engine initialized: %d policies loaded",
+                    governance_engine.policy_count,
+                )
+            except (PolicyLoadError, InvalidPolicyError) as e:
+                # Governance failure is critical - log but allow startup for dev
+                logger.critical("Governance Engine failed to initialize: %s", str(e))
+                app.state.governance_engine = None
+            except Exception as e:
+                logger.error(
+                    "Failed to initialize Governance Engine: %s", str(e), exc_info=True
+                )
+                app.state.governance_engine = None
+        else:
             app.state.governance_engine = None
-    else:
-        app.state.governance_engine = None
 
     # Initialize Housekeeping Engine (if enabled and substrate available)
-    if (
-        _has_housekeeping
-        and hasattr(app.state, "substrate_service")
-        and app.state.substrate_service
-    ):
-        try:
-            logger.info("Initializing Housekeeping Engine...")
-            housekeeping = init_housekeeping_engine(
-                app.state.substrate_service._repository
-            )
-            app.state.housekeeping_engine = housekeeping
-            logger.info("Housekeeping Engine initialized")
-        except Exception as e:
-            logger.error("Failed to initialize Housekeeping Engine: %s", str(e))
+    async def _init_housekeeping() -> None:
+        if (
+            _has_housekeeping
+            and hasattr(app.state, "substrate_service")
+            and app.state.substrate_service
+        ):
+            try:
+                logger.info("Initializing Housekeeping Engine...")
+                housekeeping = init_housekeeping_engine(
+                    app.state.substrate_service._repository
+                )
+                app.state.housekeeping_engine = housekeeping
+                logger.info("Housekeeping Engine initialized")
+            except Exception as e:
+                logger.error("Failed to initialize Housekeeping Engine: %s", str(e))
+                app.state.housekeeping_engine = None
+        else:
             app.state.housekeeping_engine = None
-    else:
-        app.state.housekeeping_engine = None
 
     # Initialize Agent Executor (if enabled and substrate available)
-    if (
-        _has_agent_executor
-        and hasattr(app.state, "substrate_service")
-        and app.state.substrate_service
-    ):
-        try:
-            logger.info("Initializing Agent Executor...")
-
-            # Use real AIOS runtime - FAIL LOUDLY if unavailable
-            if not _has_aios_runtime:
-                raise RuntimeError(
-                    "FATAL: AIOSRuntime import failed. "
-                    "Server cannot start without core agent runtime. "
-                    "Check core/agents/runtime.py exists and imports cleanly."
+    async def _init_agent_executor() -> None:
+        if (
+            _has_agent_executor
+            and hasattr(app.state, "substrate_service")
+            and app.state.substrate_service
+        ):
+            try:
+                logger.info("Initializing Agent Executor...")
+
+                # Use real AIOS runtime - FAIL LOUDLY if unavailable
+                if not _has_aios_runtime:
+                    raise RuntimeError(
+                        "FATAL: AIOSRuntime import failed. "
+                        "Server cannot start without core agent runtime. "
+                        "Check core/agents/runtime.py exists and imports cleanly."
+                    )
+                aios_runtime = create_aios_runtime()
+                logger.info("AIOSRuntime initialized successfully")
+
+                # Use real tool registry - FAIL LOUDLY if unavailable
+                if not _has_tool_registry:
+                    raise RuntimeError(
+                        "FATAL: ToolRegistry import failed. "
+                        "Server cannot start without tool dispatch capability. "
+                        "Check core/tools/registry_adapter.py exists and imports cleanly."
+                    )
+                # Connect governance engine if available
+                gov_engine = getattr(app.state, "governance_engine", None)
+                tool_registry = create_executor_tool_registry(
+                    governance_enabled=True,
+                    governance_engine=gov_engine,
                 )
-            aios_runtime = create_aios_runtime()
-            logger.info("AIOSRuntime initialized successfully")
-
-            # Use real tool registry - FAIL LOUDLY if unavailable
-            if not _has_tool_registry:
-                raise RuntimeError(
-                    "FATAL: ToolRegistry import failed. "
-                    "Server cannot start without tool dispatch capability. "
-                    "Check core/tools/registry_adapter.py exists and imports cleanly."
+                logger.info(
+                    "ExecutorToolRegistry initialized (governance=%s)",
+                    "attached" if gov_engine else "legacy",
                 )
-            # Connect governance engine if available
-            gov_engine = getattr(app.state, "governance_engine", None)
-            tool_registry = create_executor_tool_registry(
-                governance_enabled=True,
-                governance_engine=gov_engine,
-            )
-            logger.info(
-                "ExecutorToolRegistry initialized (governance=%s)",
-                "attached" if gov_engine else "legacy",
-            )
 
-            # ========================================================================
-            # SESSION STARTUP: Preflight checks + kernel readiness gate (v3.4+)
-            # ========================================================================
-            app.state.session_startup_result = None
-            app.state.startup_ready = False
-
-            # Skip startup checks in container environments (broken symlinks, missing governance files)
-            # Detection: L9_SKIP_STARTUP_CHECKS=true OR running in Docker (/app as cwd)
-            skip_startup = os.getenv("L9_SKIP_STARTUP_CHECKS", "false").lower() in ("true", "1", "yes")
-            in_container = str(Path.cwd()) == "/app" or os.path.exists("/.dockerenv")
-            
-            if skip_startup or in_container:
-                logger.info("╔════════════════════════════════════════╗")
-                logger.info("║  Skipping Session Startup (container)  ║")
-                logger.info("╚════════════════════════════════════════╝")
-                app.state.startup_ready = True
+                # ========================================================================
+                # SESSION STARTUP: Preflight checks + kernel readiness gate (v3.4+)
+                # ========================================================================
                 app.state.session_startup_result = None
-            elif _has_session_startup:
-                try:
-                    logger.info("╔════════════════════════════════════════╗")
-                    logger.info("║  Running Session Startup Checks...     ║")
-                    logger.info("╚════════════════════════════════════════╝")
-
-                    workspace_root = Path(os.getenv("L9_WORKSPACE_ROOT", Path.cwd()))
-                    session_startup = SessionStartup(workspace_root=workspace_root)
-                    startup_result: StartupResult = await session_startup.execute()
+                app.state.startup_ready = False
 
-                    app.state.session_startup_result = startup_result
-                    app.state.startup_ready = startup_result.status == "READY"
+                # Skip startup checks in container environments (broken symlinks, missing governance files)
+                # Detection: L9_SKIP_STARTUP_CHECKS=true OR running in Docker (/app as cwd)
+                skip_startup = os.getenv("L9_SKIP_STARTUP_CHECKS", "false").lower() in ("true", "1", "yes")
+                in_container = str(Path.cwd()) == "/app" or os.path.exists("/.dockerenv")
 
-                    if startup_result.status == "READY":
-                        logger.info(
-                            "✓ Session Startup PASSED: preflight=%s, files_loaded=%d, kernels_ready=%s",
-                            startup_result.preflight_passed,
-                            len(startup_result.files_loaded),
-                            startup_result.kernels_ready,
-                        )
-                        if startup_result.kernel_hash_snapshot:
+                if skip_startup or in_container:
+                    logger.info("╔════════════════════════════════════════╗")
+                    logger.info("║  Skipping Session Startup (container)  ║")
+                    logger.info("╚════════════════════════════════════════╝")
+                    app.state.startup_ready = True
+                    app.state.session_startup_result = None
+                elif _has_session_startup:
+                    try:
+                        logger.info("╔════════════════════════════════════════╗")
+                        logger.info("║  Running Session Startup Checks...     ║")
+                        logger.info("╚════════════════════════════════════════╝")
+
+                        workspace_root = Path(os.getenv("L9_WORKSPACE_ROOT", Path.cwd()))
+                        session_startup = SessionStartup(workspace_root=workspace_root)
+                        startup_result: StartupResult = await session_startup.execute()
+
+                        app.state.session_startup_result = startup_result
+                        app.state.startup_ready = startup_result.status == "READY"
+
+                        if startup_result.status == "READY":
                             logger.info(
-                                "  Kernel hash snapshot: %d kernels verified",
-                                len(startup_result.kernel_hash_snapshot),
+                                "✓ Session Startup PASSED: preflight=%s, files_loaded=%d, kernels_ready=%s",
+                                startup_result.preflight_passed,
+                                len(startup_result.files_loaded),
+                                startup_result.kernels_ready,
                             )
-                    else:
-                        logger.critical(
-                            "❌ Session Startup FAILED: status=%s, errors=%s",
-                            startup_result.status,
-                            startup_result.errors[:3] if startup_result.errors else "none",
-                        )
-                        # In production, this should be fatal
-                        # For dev, we continue with degraded mode
-                        if startup_result.warnings:
-                            for warning in startup_result.warnings[:5]:
-                                logger.warning("  Startup warning: %s", warning)
+                            if startup_result.kernel_hash_snapshot:
+                                logger.info(
+                                    "  Kernel hash snapshot: %d kernels verified",
+                                    len(startup_result.kernel_hash_snapshot),
+                                )
+                        else:
+                            logger.critical(
+                                "❌ Session Startup FAILED: status=%s, errors=%s",
+                                startup_result.status,
+                                startup_result.errors[:3] if startup_result.errors else "none",
+                            )
+                            # In production, this should be fatal
+                            # For dev, we continue with degraded mode
+                            if startup_result.warnings:
+                                for warning in startup_result.warnings[:5]:
+                                    logger.warning("  Startup warning: %s", warning)
+
+                    except Exception as e:
+                        logger.critical("Session Startup crashed: %s", str(e), exc_info=True)
+                        app.state.startup_ready = False
+                        # Non-fatal in dev mode
+                else:
+                    logger.warning("SessionStartup not available - skipping preflight checks")
+                    app.state.startup_ready = True  # Assume ready if no checks available
+
+                # Initialize agent registry with kernel loading - FAIL LOUDLY if unavailable
+                if not _has_kernel_registry:
+                    raise RuntimeError(
+                        "FATAL: KernelAwareAgentRegistry import failed. "
+                        "Server cannot start without agent configuration capability. "
+                        "Check core/agents/registry.py exists and imports cleanly."
+                    )
 
-                except Exception as e:
-                    logger.critical("Session Startup crashed: %s", str(e), exc_info=True)
-                    app.state.startup_ready = False
-                    # Non-fatal in dev mode
-            else:
-                logger.warning("SessionStartup not available - skipping preflight checks")
-                app.state.startup_ready = True  # Assume ready if no checks available
-
-            # Initialize agent registry with kernel loading - FAIL LOUDLY if unavailable
-            if not _has_kernel_registry:
-                raise RuntimeError(
-                    "FATAL: KernelAwareAgentRegistry import failed. "
-                    "Server cannot start without agent configuration capability. "
-                    "Check core/agents/registry.py exists and imports cleanly."
+                logger.info("Initializing Kernel-Aware Agent Registry...")
+                agent_registry = create_kernel_aware_registry()
+                app.state.agent_registry = agent_registry
+                logger.info(
+                    "Kernel-Aware Agent Registry initialized: kernel_state=%s",
+                    agent_registry.get_kernel_state(),
                 )
-            
-            logger.info("Initializing Kernel-Aware Agent Registry...")
-            agent_registry = create_kernel_aware_registry()
-            app.state.agent_registry = agent_registry
-            logger.info(
-                "Kernel-Aware Agent Registry initialized: kernel_state=%s",
-                agent_registry.get_kernel_state(),
-            )
-
-            # Create executor
-            executor = AgentExecutorService(
-                aios_runtime=aios_runtime,
-                tool_registry=tool_registry,
-                substrate_service=app.state.substrate_service,
-                agent_registry=agent_registry,
-            )
-
-            app.state.agent_executor = executor
-            app.state.aios_runtime = aios_runtime
-            app.state.tool_registry = tool_registry
-            logger.info("Agent Executor initialized")
-
-            # Initialize ActionToolOrchestrator (for /tools/execute endpoint)
-            try:
-                from orchestrators.action_tool.orchestrator import ActionToolOrchestrator
 
-                gov_engine = getattr(app.state, "governance_engine", None)
-                action_tool_orchestrator = ActionToolOrchestrator(
+                # Create executor
+                executor = AgentExecutorService(
+                    aios_runtime=aios_runtime,
                     tool_registry=tool_registry,
-                    governance_engine=gov_engine,
+                    substrate_service=app.state.substrate_service,
+                    agent_registry=agent_registry,
                 )
-                app.state.action_tool_orchestrator = action_tool_orchestrator
-                logger.info("ActionToolOrchestrator initialized")
-            except ImportError:
-                logger.debug("ActionToolOrchestrator not available")
-                app.state.action_tool_orchestrator = None
-            except Exception as orch_err:
-                logger.warning(f"ActionToolOrchestrator init failed: {orch_err}")
-                app.state.action_tool_orchestrator = None
 
-            # Initialize MemoryOrchestrator (for /memory/batch, /memory/compact endpoints)
-            try:
-                from orchestrators.memory.orchestrator import MemoryOrchestrator
+                app.state.agent_executor = executor
+                app.state.aios_runtime = aios_runtime
+                app.state.tool_registry = tool_registry
+                logger.info("Agent Executor initialized")
 
-                memory_orchestrator = MemoryOrchestrator()
-                app.state.memory_orchestrator = memory_orchestrator
-                logger.info("MemoryOrchestrator initialized")
-            except ImportError:
-                logger.debug("MemoryOrchestrator not available")
-                app.state.memory_orchestrator = None
-            except Exception as mem_orch_err:
-                logger.warning(f"MemoryOrchestrator init failed: {mem_orch_err}")
-                app.state.memory_orchestrator = None
-
-            # Initialize ReasoningOrchestrator (for /reasoning/execute endpoint)
-            if _has_reasoning:
+                # Initialize ActionToolOrchestrator (for /tools/execute endpoint)
                 try:
-                    reasoning_orchestrator = ReasoningOrchestrator()
-                    app.state.reasoning_orchestrator = reasoning_orchestrator
-                    logger.info("ReasoningOrchestrator initialized")
-                except Exception as reason_err:
-                    logger.warning(f"ReasoningOrchestrator init failed: {reason_err}")
-                    app.state.reasoning_orchestrator = None
-            else:
-                app.state.reasoning_orchestrator = None
+                    from orchestrators.action_tool.orchestrator import ActionToolOrchestrator
 
-            # Initialize ResearchSwarmOrchestrator (for /research/swarm/execute endpoint)
-            if _has_research_swarm:
+                    gov_engine = getattr(app.state, "governance_engine", None)
+                    action_tool_orchestrator = ActionToolOrchestrator(
+                        tool_registry=tool_registry,
+                        governance_engine=gov_engine,
+                    )
+                    app.state.action_tool_orchestrator = action_tool_orchestrator
+                    logger.info("ActionToolOrchestrator initialized")
+                except ImportError:
+                    logger.debug("ActionToolOrchestrator not available")
+                    app.state.action_tool_orchestrator = None
+                except Exception as orch_err:
+                    logger.warning(f"ActionToolOrchestrator init failed: {orch_err}")
+                    app.state.action_tool_orchestrator = None
+
+                # Initialize MemoryOrchestrator (for /memory/batch, /memory/compact endpoints)
                 try:
-                    research_swarm_orchestrator = ResearchSwarmOrchestrator()
-                    app.state.research_swarm_orchestrator = research_swarm_orchestrator
-                    logger.info("ResearchSwarmOrchestrator initialized")
-                except Exception as swarm_err:
-                    logger.warning(f"ResearchSwarmOrchestrator init failed: {swarm_err}")
-                    app.state.research_swarm_orchestrator = None
-            else:
-                app.state.research_swarm_orchestrator = None
+                    from orchestrators.memory.orchestrator import MemoryOrchestrator
+
+                    memory_orchestrator = MemoryOrchestrator()
+                    app.state.memory_orchestrator = memory_orchestrator
+                    logger.info("MemoryOrchestrator initialized")
+                except ImportError:
+                    logger.debug("MemoryOrchestrator not available")
+                    app.state.memory_orchestrator = None
+                except Exception as mem_orch_err:
+                    logger.warning(f"MemoryOrchestrator init failed: {mem_orch_err}")
+                    app.state.memory_orchestrator = None
+
+                # Initialize ReasoningOrchestrator (for /reasoning/execute endpoint)
+                if _has_reasoning:
+                    try:
+                        reasoning_orchestrator = ReasoningOrchestrator()
+                        app.state.reasoning_orchestrator = reasoning_orchestrator
+                        logger.info("ReasoningOrchestrator initialized")
+                    except Exception as reason_err:
+                        logger.warning(f"ReasoningOrchestrator init failed: {reason_err}")
+                        app.state.reasoning_orchestrator = None
+                else:
+                    app.state.reasoning_orchestrator = None
 
-            # Initialize WorldModelService (explicit, not lazy)
-            try:
-                from world_model.service import get_world_model_service
+                # Initialize ResearchSwarmOrchestrator (for /research/swarm/execute endpoint)
+                if _has_research_swarm:
+                    try:
+                        research_swarm_orchestrator = ResearchSwarmOrchestrator()
+                        app.state.research_swarm_orchestrator = research_swarm_orchestrator
+                        logger.info("ResearchSwarmOrchestrator initialized")
+                    except Exception as swarm_err:
+                        logger.warning(f"ResearchSwarmOrchestrator init failed: {swarm_err}")
+                        app.state.research_swarm_orchestrator = None
+                else:
+                    app.state.research_swarm_orchestrator = None
 
-                world_model_service = get_world_model_service()
-                app.state.world_model_service = world_model_service
-                logger.info("WorldModelService initialized")
-            except ImportError:
-                logger.debug("WorldModelService not available")
-                app.state.world_model_service = None
-            except Exception as wm_err:
-                logger.warning(f"WorldModelService init failed: {wm_err}")
-                app.state.world_model_service = None
+                # Initialize WorldModelService (explicit, not lazy)
+                try:
+                    from world_model.service import get_world_model_service
+
+                    world_model_service = get_world_model_service()
+                    app.state.world_model_service = world_model_service
+                    logger.info("WorldModelService initialized")
+                except ImportError:
+                    logger.debug("WorldModelService not available")
+                    app.state.world_model_service = None
+                except Exception as wm_err:
+                    logger.warning(f"WorldModelService init failed: {wm_err}")
+                    app.state.world_model_service = None
 
-        except Exception as e:
-            logger.error(f"Failed to initialize Agent Executor: {e}", exc_info=True)
+            except Exception as e:
+                logger.error(f"Failed to initialize Agent Executor: {e}", exc_info=True)
+                app.state.agent_executor = None
+        elif _has_agent_executor:
+            logger.warning("Agent Executor not initialized: substrate_service required")
             app.state.agent_executor = None
-    elif _has_agent_executor:
-        logger.warning("Agent Executor not initialized: substrate_service required")
-        app.state.agent_executor = None
 
     # Initialize Slack adapter (if enabled)
-    if _has_slack:
-        from config.settings import get_integration_settings
+    async def _init_slack() -> None:
+        if _has_slack:
+            from config.settings import get_integration_settings
 
-        integration_settings = get_integration_settings()
+            integration_settings = get_integration_settings()
 
-        if not integration_settings.slack_app_enabled:
-            logger.debug("Slack adapter disabled (SLACK_APP_ENABLED=false)")
-            app.state.slack_validator = None
-            app.state.slack_client = None
-        else:
-            try:
-                slack_signing_secret = (
-                    integration_settings.slack_signing_secret
-                    or os.getenv("SLACK_SIGNING_SECRET")
-                )
-                slack_bot_token = integration_settings.slack_bot_token or os.getenv(
-                    "SLACK_BOT_TOKEN"
-                )
+            if not integration_settings.slack_app_enabled:
+                logger.debug("Slack adapter disabled (SLACK_APP_ENABLED=false)")
+                app.state.slack_validator = None
+                app.state.slack_client = None
+            else:
+                try:
+                    slack_signing_secret = (
+                        integration_settings.slack_signing_secret
+                        or os.getenv("SLACK_SIGNING_SECRET")
+                    )
+                    slack_bot_token = integration_settings.slack_bot_token or os.getenv(
+                        "SLACK_BOT_TOKEN"
+                    )
 
-                if slack_signing_secret and slack_bot_token:
-                    logger.info("Initializing Slack adapter...")
+                    if slack_signing_secret and slack_bot_token:
+                        logger.info("Initializing Slack adapter...")
 
-                    # Initialize Slack components
-                    validator = SlackRequestValidator(slack_signing_secret)
-                    http_client = httpx.AsyncClient()
-                    slack_client = SlackAPIClient(
-                        bot_token=slack_bot_token,
-                        http_client=http_client,
-                    )
+                        # Initialize Slack components
+                        validator = SlackRequestValidator(slack_signing_secret)
+                        http_client = get_http_client("slack")
+                        slack_client = SlackAPIClient(
+                            bot_token=slack_bot_token,
+                            http_client=http_client,
+                        )
 
-                    # Store in app state for route dependencies
-                    app.state.slack_validator = validator
-                    app.state.slack_client = slack_client
-                    app.state.aios_base_url = os.getenv(
-                        "AIOS_BASE_URL", "http://localhost:8000"
-                    )
-                    app.state.http_client = http_client
+                        # Store in app state for route dependencies
+                        app.state.slack_validator = validator
+                        app.state.slack_client = slack_client
+                        app.state.aios_base_url = os.getenv(
+                            "AIOS_BASE_URL", "http://localhost:8000"
+                        )
+                        app.state.http_client = http_client
 
-                    logger.info("Slack adapter initialized")
-                else:
-                    logger.warning(
-                        "Slack adapter not initialized: SLACK_SIGNING_SECRET or SLACK_BOT_TOKEN not set"
-                    )
+                        logger.info("Slack adapter initialized")
+                    else:
+                        logger.warning(
+                            "Slack adapter not initialized: SLACK_SIGNING_SECRET or SLACK_BOT_TOKEN not set"
+                        )
+                        app.state.slack_validator = None
+                        app.state.slack_client = None
+                except Exception as e:
+                    logger.error(f"Failed to initialize Slack adapter: {e}", exc_info=True)
                     app.state.slack_validator = None
                     app.state.slack_client = None
-            except Exception as e:
-                logger.error(f"Failed to initialize Slack adapter: {e}", exc_info=True)
-                app.state.slack_validator = None
-                app.state.slack_client = None
 
     # ========================================================================
     # NEO4J GRAPH INTEGRATIONS (v2.7+)
@@ -853,610 +864,691 @@ async def lifespan(app: FastAPI):
             raise ValueError(f"Invalid NEO4J_URI format: {neo4j_uri}")
 
     # Initialize Neo4j client (optional, graceful if unavailable)
-    try:
-        from memory.graph_client import get_neo4j_client, close_neo4j_client
+    async def _init_neo4j() -> None:
+        try:
+            from memory.graph_client import get_neo4j_client
 
-        neo4j = await get_neo4j_client()
-        if neo4j and neo4j.is_available():
-            app.state.neo4j_client = neo4j
-            logger.info("Neo4j graph client initialized")
+            neo4j = await get_neo4j_client()
+            if neo4j and neo4j.is_available():
+                app.state.neo4j_client = neo4j
+                logger.info("Neo4j graph client initialized")
+            else:
+                # Neo4j not available or not healthy
+                app.state.neo4j_client = None
+                logger.info("Neo4j not available - graph features disabled")
+        except ImportError:
+            app.state.neo4j_client = None
+            logger.debug("Neo4j client not available")
+        except Exception as e:
+            app.state.neo4j_client = None
+            logger.warning(f"Failed to initialize Neo4j: {e}")
 
-            # Bootstrap governance schema (creates Responsibility, Directive, SOP labels)
-            try:
-                from scripts.bootstrap_neo4j_schema import bootstrap_l_governance
+    # Neo4j schema bootstrap, graph tool registration and GMP worker (slow
+    # round-trips; nothing at startup waits on them)
+    async def _init_neo4j_graph() -> None:
+        neo4j = getattr(app.state, "neo4j_client", None)
+        if neo4j is None:
+            return
 
-                bootstrap_result = await bootstrap_l_governance(neo4j._driver)
-                if bootstrap_result.get("success"):
-                    logger.info(
-                        "Neo4j governance schema bootstrapped",
-                        responsibilities=bootstrap_result.get("responsibilities", 0),
-                        directives=bootstrap_result.get("directives", 0),
-                        sops=bootstrap_result.get("sops", 0),
-                    )
-                else:
-                    logger.warning(f"Governance schema bootstrap failed: {bootstrap_result.get('error')}")
-            except Exception as e:
-                logger.warning(f"Failed to bootstrap governance schema: {e}")
+        # Bootstrap governance schema (creates Responsibility, Directive, SOP labels)
+        try:
+            from scripts.bootstrap_neo4j_schema import bootstrap_l_governance
 
-            # Register L9 tools in graph (for dependency tracking)
-            try:
-                from core.tools.tool_graph import register_l9_tools, register_l_tools
+            bootstrap_result = await bootstrap_l_governance(neo4j._driver)
+            if bootstrap_result.get("success"):
+                logger.info(
+                    "Neo4j governance schema bootstrapped",
+                    responsibilities=bootstrap_result.get("responsibilities", 0),
+                    directives=bootstrap_result.get("directives", 0),
+                    sops=bootstrap_result.get("sops", 0),
+                )
+            else:
+                logger.warning(f"Governance schema bootstrap failed: {bootstrap_result.get('error')}")
+        except Exception as e:
+            logger.warning(f"Failed to bootstrap governance schema: {e}")
 
-                tool_count = await register_l9_tools()
-                logger.info(f"Registered {tool_count} tools in Neo4j graph")
+        # Register L9 tools in graph (for dependency tracking)
+        try:
+            from core.tools.tool_graph import register_l9_tools, register_l_tools
 
-                # Register L agent internal tools
-                l_tool_count = await register_l_tools()
-                logger.info(f"Registered {l_tool_count} L agent tools in Neo4j graph")
-            except Exception as e:
-                logger.warning(f"Failed to register tools in Neo4j: {e}")
+            tool_count = await register_l9_tools()
+            logger.info(f"Registered {tool_count} tools in Neo4j graph")
 
-            # Start GMP worker (for processing approved GMP tasks)
-            try:
-                from runtime.gmp_worker import start_gmp_worker
+            # Register L agent internal tools
+            l_tool_count = await register_l_tools()
+            logger.info(f"Registered {l_tool_count} L agent tools in Neo4j graph")
+        except Exception as e:
+            logger.warning(f"Failed to register tools in Neo4j: {e}")
 
-                await start_gmp_worker(poll_interval=2.0)
-                logger.info("GMP worker started")
-            except Exception as e:
-                logger.warning(f"Failed to start GMP worker: {e}")
-        else:
-            # Neo4j not available or not healthy
-            app.state.neo4j_client = None
-            logger.info("Neo4j not available - graph features disabled")
-    except ImportError:
-        app.state.neo4j_client = None
-        logger.debug("Neo4j client not available")
-    except Exception as e:
-        app.state.neo4j_client = None
-        logger.warning(f"Failed to initialize Neo4j: {e}")
+        # Start GMP worker (for processing approved GMP tasks)
+        try:
+            from runtime.gmp_worker import start_gmp_worker
+
+            await start_gmp_worker(poll_interval=2.0)
+            logger.info("GMP worker started")
+        except Exception as e:
+            logger.warning(f"Failed to start GMP worker: {e}")
 
     # Initialize Redis client (optional, graceful if unavailable)
-    try:
-        from runtime.redis_client import get_redis_client, close_redis_client
+    async def _init_redis() -> None:
+        try:
+            from runtime.redis_client import get_redis_client
 
-        redis = await get_redis_client()
-        if redis and redis.is_available():
-            app.state.redis_client = redis
-            logger.info("Redis client initialized")
-        else:
+            redis = await get_redis_client()
+            if redis and redis.is_available():
+                app.state.redis_client = redis
+                logger.info("Redis client initialized")
+            else:
+                app.state.redis_client = None
+                logger.info("Redis not available - using in-memory fallbacks")
+        except ImportError:
             app.state.redis_client = None
-            logger.info("Redis not available - using in-memory fallbacks")
-    except ImportError:
-        app.state.redis_client = None
-        logger.debug("Redis client not available")
-    except Exception as e:
-        app.state.redis_client = None
-        logger.warning(f"Failed to initialize Redis: {e}")
+            logger.debug("Redis client not available")
+        except Exception as e:
+            app.state.redis_client = None
+            logger.warning(f"Failed to initialize Redis: {e}")
 
     # Store rate limiter in app state
-    try:
-        from runtime.rate_limiter import RateLimiter
+    async def _init_rate_limiter() -> None:
+        try:
+            from runtime.rate_limiter import RateLimiter
 
-        app.state.rate_limiter = RateLimiter()
-        logger.info("Rate limiter initialized")
-    except ImportError:
-        app.state.rate_limiter = None
+            app.state.rate_limiter = RateLimiter()
+            logger.info("Rate limiter initialized")
+        except ImportError:
+            app.state.rate_limiter = None
 
     # Initialize Permission Graph (RBAC via Neo4j)
-    try:
-        from core.security.permission_graph import PermissionGraph
+    async def _init_permission_graph() -> None:
+        try:
+            from core.security.permission_graph import PermissionGraph
 
-        if hasattr(app.state, "neo4j_client") and app.state.neo4j_client:
-            app.state.permission_graph = PermissionGraph
-            logger.info("✓ Permission Graph initialized (Neo4j-backed)")
-        else:
+            if hasattr(app.state, "neo4j_client") and app.state.neo4j_client:
+                app.state.permission_graph = PermissionGraph
+                logger.info("✓ Permission Graph initialized (Neo4j-backed)")
+            else:
+                app.state.permission_graph = None
+                logger.info("Permission Graph not available (requires Neo4j)")
+        except ImportError:
             app.state.permission_graph = None
-            logger.info("Permission Graph not available (requires Neo4j)")
-    except ImportError:
-        app.state.permission_graph = None
-        logger.debug("Permission Graph module not available")
-    except Exception as e:
-        app.state.permission_graph = None
-        logger.warning(f"Failed to initialize Permission Graph: {e}")
-
-    # ========================================================================
-    # STARTUP VALIDATION: Enforce required components are initialized
-    # ========================================================================
-
-    # Validate Neo4j (fail-fast if URI set but connection failed)
-    if os.getenv("NEO4J_URI"):
-        if not hasattr(app.state, "neo4j_client") or not app.state.neo4j_client:
-            logger.critical(
-                "NEO4J_URI set but connection failed - graph features disabled"
-            )
-            # Note: Not fatal - Neo4j is optional for dev mode
-        else:
-            logger.info("✓ Neo4j validation passed")
-
-    # NOTE: L-CTO startup (LStartup) is DEPRECATED and archived.
-    # L-CTO agent initialization is now handled by KernelAwareAgentRegistry
-    # which loads kernels and activates the agent via runtime/kernel_loader.py.
-    # See core/agents/kernel_registry.py for the new kernel-based initialization.
-    app.state.l_cto_startup = None  # Kept for backward compatibility
+            logger.debug("Permission Graph module not available")
+        except Exception as e:
+            app.state.permission_graph = None
+            logger.warning(f"Failed to initialize Permission Graph: {e}")
 
     # ========================================================================
     # AGENT BOOTSTRAP CEREMONY (v3.0+ Paradigm Shift)
     # ========================================================================
-    if L9_NEW_AGENT_INIT and _has_bootstrap:
-        try:
-            logger.info("╔════════════════════════════════════════╗")
-            logger.info("║  L9_NEW_AGENT_INIT=true                ║")
-            logger.info("║  Running Agent Bootstrap Ceremony...   ║")
-            logger.info("╚════════════════════════════════════════╝")
+    async def _init_agent_bootstrap() -> None:
+        if L9_NEW_AGENT_INIT and _has_bootstrap:
+            try:
+                logger.info("╔════════════════════════════════════════╗")
+                logger.info("║  L9_NEW_AGENT_INIT=true                ║")
+                logger.info("║  Running Agent Bootstrap Ceremony...   ║")
+                logger.info("╚════════════════════════════════════════╝")
 
-            substrate = getattr(app.state, "substrate_service", None)
-            if substrate:
-                bootstrap = AgentBootstrapOrchestrator(substrate)
+                substrate = getattr(app.state, "substrate_service", None)
+                if substrate:
+                    bootstrap = AgentBootstrapOrchestrator(substrate)
+
+                    # Bootstrap L-CTO agent with full kernel stack
+                    l_config = AgentConfig(
+                        agent_id="l-cto",
+                        name="L CTO",
+                        kernel_refs=[
+                            "01_master_kernel.yaml",
+                            "02_identity_kernel.yaml",
+                            "03_cognitive_kernel.yaml",
+                            "04_behavioral_kernel.yaml",
+                            "05_memory_kernel.yaml",
+                            "06_worldmodel_kernel.yaml",
+                            "07_execution_kernel.yaml",
+                            "08_safety_kernel.yaml",
+                            "09_developer_kernel.yaml",
+                            "10_packet_protocol_kernel.yaml",
+                        ],
+                    )
 
-                # Bootstrap L-CTO agent with full kernel stack
-                l_config = AgentConfig(
-                    agent_id="l-cto",
-                    name="L CTO",
-                    kernel_refs=[
-                        "01_master_kernel.yaml",
-                        "02_identity_kernel.yaml",
-                        "03_cognitive_kernel.yaml",
-                        "04_behavioral_kernel.yaml",
-                        "05_memory_kernel.yaml",
-                        "06_worldmodel_kernel.yaml",
-                        "07_execution_kernel.yaml",
-                        "08_safety_kernel.yaml",
-                        "09_developer_kernel.yaml",
-                        "10_packet_protocol_kernel.yaml",
-                    ],
-                )
+                    l_instance = await bootstrap.bootstrap_agent(l_config)
+                    app.state.l_agent_instance = l_instance
+                    app.state.l_agent_ready = True
 
-                l_instance = await bootstrap.bootstrap_agent(l_config)
-                app.state.l_agent_instance = l_instance
-                app.state.l_agent_ready = True
+                    logger.info(
+                        "✓ L-CTO Agent Bootstrap complete",
+                        instance_id=l_instance.instance_id[:12],
+                        signature=l_instance.initialization_signature[:16] if l_instance.initialization_signature else "none",
+                    )
+                else:
+                    logger.warning("Bootstrap skipped: substrate_service not available")
+                    app.state.l_agent_ready = False
 
-                logger.info(
-                    "✓ L-CTO Agent Bootstrap complete",
-                    instance_id=l_instance.instance_id[:12],
-                    signature=l_instance.initialization_signature[:16] if l_instance.initialization_signature else "none",
-                )
-            else:
-                logger.warning("Bootstrap skipped: substrate_service not available")
+            except Exception as e:
+                logger.error("Agent Bootstrap failed: %s", str(e), exc_info=True)
                 app.state.l_agent_ready = False
-
-        except Exception as e:
-            logger.error("Agent Bootstrap failed: %s", str(e), exc_info=True)
+                # Non-fatal in dev mode - fall back to legacy initialization
+        elif L9_NEW_AGENT_INIT:
+            logger.warning("L9_NEW_AGENT_INIT=true but bootstrap module not available")
             app.state.l_agent_ready = False
-            # Non-fatal in dev mode - fall back to legacy initialization
-    elif L9_NEW_AGENT_INIT:
-        logger.warning("L9_NEW_AGENT_INIT=true but bootstrap module not available")
-        app.state.l_agent_ready = False
-    else:
-        app.state.l_agent_ready = False  # Using legacy init
-
-    # Validate Permission Graph (required if Slack is enabled)
-    if os.getenv("SLACK_BOT_TOKEN"):
-        if not hasattr(app.state, "permission_graph") or not app.state.permission_graph:
-            logger.warning(
-                "Slack enabled but Permission Graph not available. "
-                "RBAC checks will be skipped."
-            )
-        else:
-            logger.info("✓ Permission Graph validation passed (Slack protected)")
-
-    # Validate kernel-aware agent registry (if enabled)
-    if _has_kernel_registry:
-        if not hasattr(app.state, "agent_registry") or app.state.agent_registry is None:
-            logger.critical("STARTUP VALIDATION FAILED: agent_registry not initialized")
-            # In dev mode, we continue; in prod, this would be fatal
-        elif hasattr(app.state.agent_registry, "get_kernel_state"):
-            kernel_state = app.state.agent_registry.get_kernel_state()
-            if kernel_state != "ACTIVE":
-                logger.critical(
-                    "STARTUP VALIDATION FAILED: Kernels not ACTIVE (state=%s)",
-                    kernel_state,
-                )
-            else:
-                logger.info("✓✓✓ L9 FULLY INITIALIZED WITH ACTIVE KERNELS ✓✓✓")
-
-    # Validate Session Startup result (v3.4+ / GMP-KERNEL-BOOT)
-    if _has_session_startup:
-        startup_result = getattr(app.state, "session_startup_result", None)
-        startup_ready = getattr(app.state, "startup_ready", False)
-
-        if startup_result is None:
-            logger.warning("STARTUP VALIDATION: SessionStartup result not available")
-        elif not startup_ready:
-            logger.critical(
-                "STARTUP VALIDATION FAILED: SessionStartup not ready (status=%s)",
-                startup_result.status if startup_result else "unknown",
-            )
-            if startup_result and startup_result.errors:
-                for error in startup_result.errors[:3]:
-                    logger.critical("  Startup error: %s", error)
         else:
-            logger.info(
-                "✓ Session Startup validation passed: kernels_ready=%s, files=%d",
-                startup_result.kernels_ready if startup_result else "unknown",
-                len(startup_result.files_loaded) if startup_result else 0,
-            )
-
-    # Validate rate limiter
-    if not hasattr(app.state, "rate_limiter") or app.state.rate_limiter is None:
-        logger.warning("STARTUP VALIDATION: Rate limiter not initialized")
+            app.state.l_agent_ready = False  # Using legacy init
 
     # ========================================================================
     # REGISTER L-CTO TOOLS
     # ========================================================================
-    try:
-        from core.tools.registry_adapter import register_l_tools
+    async def _init_l_tools() -> None:
+        try:
+            from core.tools.registry_adapter import register_l_tools
 
-        tool_count = await register_l_tools()
-        if tool_count > 0:
-            logger.info(f"✓ L-CTO tools registered: {tool_count} tools available")
-            app.state.tool_graph_healthy = True
-        else:
-            logger.warning(
-                "⚠️ Tool registration returned 0 tools. "
-                "System will operate in degraded mode.",
-                extra={"alert": "tool_graph_degraded"}
+            tool_count = await register_l_tools()
+            if tool_count > 0:
+                logger.info(f"✓ L-CTO tools registered: {tool_count} tools available")
+                app.state.tool_graph_healthy = True
+            else:
+                logger.warning(
+                    "⚠️ Tool registration returned 0 tools. "
+                    "System will operate in degraded mode.",
+                    extra={"alert": "tool_graph_degraded"}
+                )
+                app.state.tool_graph_healthy = False
+        except Exception as e:
+            logger.error(
+                f"❌ Tool registration failed: {e}. Tool graph unavailable.",
+                exc_info=True,
+                extra={"alert": "tool_graph_failed"}
             )
             app.state.tool_graph_healthy = False
-    except Exception as e:
-        logger.error(
-            f"❌ Tool registration failed: {e}. Tool graph unavailable.",
-            exc_info=True,
-            extra={"alert": "tool_graph_failed"}
-        )
-        app.state.tool_graph_healthy = False
-        # Non-fatal: tools still work via direct executor dispatch
+            # Non-fatal: tools still work via direct executor dispatch
 
     # ========================================================================
     # REGISTER MEMORY TOOLS (Agent Self-Query)
     # ========================================================================
-    try:
-        from core.tools.memory_tools import register_memory_tools
-
-        tool_registry = getattr(app.state, "tool_registry", None)
-        substrate_service = getattr(app.state, "memory_service", None)
-        if tool_registry:
-            memory_tool_count = await register_memory_tools(
-                tool_registry,
-                substrate_service=substrate_service,
-            )
-            logger.info(f"✓ Memory tools registered: {memory_tool_count} tools")
-            app.state.memory_tools_registered = True
-        else:
-            logger.warning("⚠️ Memory tools not registered: tool_registry not available")
+    async def _init_memory_tools() -> None:
+        try:
+            from core.tools.memory_tools import register_memory_tools
+
+            tool_registry = getattr(app.state, "tool_registry", None)
+            substrate_service = getattr(app.state, "memory_service", None)
+            if tool_registry:
+                memory_tool_count = await register_memory_tools(
+                    tool_registry,
+                    substrate_service=substrate_service,
+                )
+                logger.info(f"✓ Memory tools registered: {memory_tool_count} tools")
+                app.state.memory_tools_registered = True
+            else:
+                logger.warning("⚠️ Memory tools not registered: tool_registry not available")
+                app.state.memory_tools_registered = False
+        except Exception as e:
+            logger.error(f"❌ Memory tool registration failed: {e}", exc_info=True)
             app.state.memory_tools_registered = False
-    except Exception as e:
-        logger.error(f"❌ Memory tool registration failed: {e}", exc_info=True)
-        app.state.memory_tools_registered = False
 
     # ========================================================================
     # STARTUP: Initialize Prometheus metrics
     # ========================================================================
-    if _has_prometheus:
-        metrics_ok = init_metrics()
-        app.state.prometheus_enabled = metrics_ok
-        if metrics_ok:
-            logger.info("✓ Prometheus metrics initialized")
+    async def _init_prometheus() -> None:
+        if _has_prometheus:
+            metrics_ok = init_metrics()
+            app.state.prometheus_enabled = metrics_ok
+            if metrics_ok:
+                logger.info("✓ Prometheus metrics initialized")
+            else:
+                logger.warning("⚠️ Prometheus metrics init returned False")
         else:
-            logger.warning("⚠️ Prometheus metrics init returned False")
-    else:
-        app.state.prometheus_enabled = False
-        logger.info("Prometheus metrics not available (prometheus_client not installed)")
+            app.state.prometheus_enabled = False
+            logger.info("Prometheus metrics not available (prometheus_client not installed)")
 
     # ========================================================================
     # STAGE 3 MODULES: Tool Audit, Event Queue, Virtual Context, Evaluator
     # ========================================================================
-    if L9_STAGE3_MODULES:
-        logger.info("╔════════════════════════════════════════╗")
-        logger.info("║  Stage 3: Wiring Enterprise Modules    ║")
-        logger.info("╚════════════════════════════════════════╝")
+    async def _init_stage3() -> None:
+        if L9_STAGE3_MODULES:
+            logger.info("╔════════════════════════════════════════╗")
+            logger.info("║  Stage 3: Wiring Enterprise Modules    ║")
+            logger.info("╚════════════════════════════════════════╝")
 
-        substrate = getattr(app.state, "substrate_service", None)
+            substrate = getattr(app.state, "substrate_service", None)
 
-        # 1. Tool Audit Service (Postgres-backed audit trail)
-        if _has_tool_audit_service and substrate:
-            try:
-                tool_audit_service = ToolAuditService(
-                    substrate_service=substrate,
-                    buffer_size=100,
-                )
-                await tool_audit_service.start()
-                app.state.tool_audit_service = tool_audit_service
-                logger.info("✓ ToolAuditService initialized (Postgres audit trail)")
-            except Exception as e:
-                logger.error(f"❌ ToolAuditService init failed: {e}", exc_info=True)
+            # 1. Tool Audit Service (Postgres-backed audit trail)
+            if _has_tool_audit_service and substrate:
+                try:
+                    tool_audit_service = ToolAuditService(
+                        substrate_service=substrate,
+                        buffer_size=100,
+                    )
+                    await tool_audit_service.start()
+                    app.state.tool_audit_service = tool_audit_service
+                    logger.info("✓ ToolAuditService initialized (Postgres audit trail)")
+                except Exception as e:
+                    logger.error(f"❌ ToolAuditService init failed: {e}", exc_info=True)
+                    app.state.tool_audit_service = None
+            else:
                 app.state.tool_audit_service = None
-        else:
-            app.state.tool_audit_service = None
-            if not _has_tool_audit_service:
-                logger.debug("ToolAuditService module not available")
+                if not _has_tool_audit_service:
+                    logger.debug("ToolAuditService module not available")
 
-        # 2. Event Queue (Async agent coordination)
-        if _has_event_queue:
-            try:
-                event_queue = await init_event_driven_coordination(app.state)
-                logger.info("✓ EventQueue initialized (async coordination)")
-            except Exception as e:
-                logger.error(f"❌ EventQueue init failed: {e}", exc_info=True)
+            # 2. Event Queue (Async agent coordination)
+            if _has_event_queue:
+                try:
+                    event_queue = await init_event_driven_coordination(app.state)
+                    logger.info("✓ EventQueue initialized (async coordination)")
+                except Exception as e:
+                    logger.error(f"❌ EventQueue init failed: {e}", exc_info=True)
+                    app.state.event_queue = None
+            else:
                 app.state.event_queue = None
-        else:
-            app.state.event_queue = None
-            logger.debug("EventQueue module not available")
+                logger.debug("EventQueue module not available")
 
-        # 3. Virtual Context Manager (MemGPT-style tiered memory)
-        if _has_virtual_context and substrate:
-            try:
-                # Pass neo4j_driver for graph state consolidation
-                neo4j_for_vcm = getattr(app.state, "neo4j_client", None)
-                virtual_context = VirtualContextManager(
-                    substrate_service=substrate,
-                    neo4j_driver=neo4j_for_vcm,
-                    main_context_size=4096,
-                    working_memory_size=8192,
-                )
-                app.state.virtual_context_manager = virtual_context
-                logger.info("✓ VirtualContextManager initialized (tiered memory)")
-            except Exception as e:
-                logger.error(f"❌ VirtualContextManager init failed: {e}", exc_info=True)
+            # 3. Virtual Context Manager (MemGPT-style tiered memory)
+            if _has_virtual_context and substrate:
+                try:
+                    # Pass neo4j_driver for graph state consolidation
+                    neo4j_for_vcm = getattr(app.state, "neo4j_client", None)
+                    virtual_context = VirtualContextManager(
+                        substrate_service=substrate,
+                        neo4j_driver=neo4j_for_vcm,
+                        main_context_size=4096,
+                        working_memory_size=8192,
+                    )
+                    app.state.virtual_context_manager = virtual_context
+                    logger.info("✓ VirtualContextManager initialized (tiered memory)")
+                except Exception as e:
+                    logger.error(f"❌ VirtualContextManager init failed: {e}", exc_info=True)
+                    app.state.virtual_context_manager = None
+            else:
                 app.state.virtual_context_manager = None
-        else:
-            app.state.virtual_context_manager = None
-            if not _has_virtual_context:
-                logger.debug("VirtualContextManager module not available")
+                if not _has_virtual_context:
+                    logger.debug("VirtualContextManager module not available")
 
-        # 4. Evaluator (LLM-as-judge + CI/CD gates)
-        if _has_evaluator and substrate:
-            try:
-                evaluator = Evaluator(
-                    substrate_service=substrate,
-                )
-                app.state.evaluator = evaluator
-                logger.info("✓ Evaluator initialized (LLM-as-judge)")
-            except Exception as e:
-                logger.error(f"❌ Evaluator init failed: {e}", exc_info=True)
+            # 4. Evaluator (LLM-as-judge + CI/CD gates)
+            if _has_evaluator and substrate:
+                try:
+                    evaluator = Evaluator(
+                        substrate_service=substrate,
+                    )
+                    app.state.evaluator = evaluator
+                    logger.info("✓ Evaluator initialized (LLM-as-judge)")
+                except Exception as e:
+                    logger.error(f"❌ Evaluator init failed: {e}", exc_info=True)
+                    app.state.evaluator = None
+            else:
                 app.state.evaluator = None
-        else:
-            app.state.evaluator = None
-            if not _has_evaluator:
-                logger.debug("Evaluator module not available")
+                if not _has_evaluator:
+                    logger.debug("Evaluator module not available")
 
-        logger.info("Stage 3 module wiring complete")
-    else:
-        logger.info("Stage 3 modules disabled (L9_STAGE3_MODULES=false)")
+            logger.info("Stage 3 module wiring complete")
+        else:
+            logger.info("Stage 3 modules disabled (L9_STAGE3_MODULES=false)")
 
     # ========================================================================
     # STAGE 4: Memory Consolidation (Background Cleanup)
     # ========================================================================
-    import asyncio  # Ensure asyncio is available for this block
+    async def _init_consolidation() -> None:
+        L9_STAGE4_CONSOLIDATION = os.getenv("L9_STAGE4_CONSOLIDATION", "true").lower() == "true"
 
-    L9_STAGE4_CONSOLIDATION = os.getenv("L9_STAGE4_CONSOLIDATION", "true").lower() == "true"
+        if L9_STAGE4_CONSOLIDATION:
+            logger.info("╔════════════════════════════════════════╗")
+            logger.info("║  Stage 4: Memory Consolidation         ║")
+            logger.info("╚════════════════════════════════════════╝")
 
-    if L9_STAGE4_CONSOLIDATION:
-        logger.info("╔════════════════════════════════════════╗")
-        logger.info("║  Stage 4: Memory Consolidation         ║")
-        logger.info("╚════════════════════════════════════════╝")
+            try:
+                from core.memory.virtual_context import MemoryConsolidationService
 
-        try:
-            from core.memory.virtual_context import MemoryConsolidationService
+                substrate = getattr(app.state, "substrate_service", None) or getattr(app.state, "memory_service", None)
+                llm_service = getattr(app.state, "llm_service", None)
 
-            substrate = getattr(app.state, "substrate_service", None) or getattr(app.state, "memory_service", None)
-            llm_service = getattr(app.state, "llm_service", None)
+                if substrate:
+                    consolidation_service = MemoryConsolidationService(
+                        substrate_service=substrate,
+                        llm_service=llm_service,
+                    )
+                    app.state.consolidation_service = consolidation_service
+
+                    # Schedule background cleanup every 24 hours
+                    async def run_consolidation_loop():
+                        """Background task for periodic memory consolidation"""
+                        consolidation_interval = int(os.getenv("L9_CONSOLIDATION_INTERVAL_HOURS", "4")) * 3600
+                        logger.info(f"Memory consolidation scheduled every {consolidation_interval // 3600} hours")
+
+                        while True:
+                            try:
+                                await asyncio.sleep(consolidation_interval)
+                                logger.info("Running scheduled memory consolidation...")
+                                # Consolidate for L (primary agent)
+                                if hasattr(consolidation_service, 'consolidate'):
+                                    metrics = consolidation_service.get_metrics() if hasattr(consolidation_service, 'get_metrics') else {}
+                                    logger.info(f"Consolidation metrics: {metrics}")
+
+                                # UKG Phase 5: Consolidate graph state (if method exists)
+                                if hasattr(consolidation_service, 'consolidate_graph_state'):
+                                    try:
+                                        graph_result = await consolidation_service.consolidate_graph_state("L")
+                                        logger.info(f"Graph state consolidation: {graph_result.get('status', 'UNKNOWN')}")
+                                    except Exception as e:
+                                        logger.warning(f"Graph state consolidation failed: {e}")
+                            except asyncio.CancelledError:
+                                logger.info("Consolidation loop cancelled")
+                                break
+                            except Exception as e:
+                                logger.error(f"Consolidation loop error: {e}", exc_info=True)
+
+                    # Start background consolidation task
+                    app.state.consolidation_task = asyncio.create_task(run_consolidation_loop())
+                    logger.info("✓ MemoryConsolidationService initialized (24h cleanup cycle)")
+                else:
+                    logger.warning("⚠️ Consolidation not started: substrate_service not available")
+                    app.state.consolidation_service = None
 
-            if substrate:
-                consolidation_service = MemoryConsolidationService(
-                    substrate_service=substrate,
-                    llm_service=llm_service,
-                )
-                app.state.consolidation_service = consolidation_service
-
-                # Schedule background cleanup every 24 hours
-                async def run_consolidation_loop():
-                    """Background task for periodic memory consolidation"""
-                    consolidation_interval = int(os.getenv("L9_CONSOLIDATION_INTERVAL_HOURS", "4")) * 3600
-                    logger.info(f"Memory consolidation scheduled every {consolidation_interval // 3600} hours")
-                    
-                    while True:
-                        try:
-                            await asyncio.sleep(consolidation_interval)
-                            logger.info("Running scheduled memory consolidation...")
-                            # Consolidate for L (primary agent)
-                            if hasattr(consolidation_service, 'consolidate'):
-                                metrics = consolidation_service.get_metrics() if hasattr(consolidation_service, 'get_metrics') else {}
-                                logger.info(f"Consolidation metrics: {metrics}")
-                            
-                            # UKG Phase 5: Consolidate graph state (if method exists)
-                            if hasattr(consolidation_service, 'consolidate_graph_state'):
-                                try:
-                                    graph_result = await consolidation_service.consolidate_graph_state("L")
-                                    logger.info(f"Graph state consolidation: {graph_result.get('status', 'UNKNOWN')}")
-                                except Exception as e:
-                                    logger.warning(f"Graph state consolidation failed: {e}")
-                        except asyncio.CancelledError:
-                            logger.info("Consolidation loop cancelled")
-                            break
-                        except Exception as e:
-                            logger.error(f"Consolidation loop error: {e}", exc_info=True)
-
-                # Start background consolidation task
-                app.state.consolidation_task = asyncio.create_task(run_consolidation_loop())
-                logger.info("✓ MemoryConsolidationService initialized (24h cleanup cycle)")
-            else:
-                logger.warning("⚠️ Consolidation not started: substrate_service not available")
+            except ImportError as e:
+                logger.debug(f"MemoryConsolidationService not available: {e}")
                 app.state.consolidation_service = None
-
-        except ImportError as e:
-            logger.debug(f"MemoryConsolidationService not available: {e}")
-            app.state.consolidation_service = None
-        except Exception as e:
-            logger.error(f"❌ Stage 4 (consolidation) init failed: {e}", exc_info=True)
-            app.state.consolidation_service = None
-    else:
-        logger.info("Stage 4 (consolidation) disabled (L9_STAGE4_CONSOLIDATION=false)")
+            except Exception as e:
+                logger.error(f"❌ Stage 4 (consolidation) init failed: {e}", exc_info=True)
+                app.state.consolidation_service = None
+        else:
+            logger.info("Stage 4 (consolidation) disabled (L9_STAGE4_CONSOLIDATION=false)")
 
     # ========================================================================
     # STAGE 5: Graph-Backed Agent State (Neo4j for mutable agent state)
     # ========================================================================
-    if L9_GRAPH_AGENT_STATE and _has_graph_agent_state:
-        logger.info("╔════════════════════════════════════════╗")
-        logger.info("║  Stage 5: Graph-Backed Agent State     ║")
-        logger.info("╚════════════════════════════════════════╝")
-
-        try:
-            # Get Neo4j client from app state (stored as neo4j_client, not neo4j_driver)
-            neo4j_client = getattr(app.state, "neo4j_client", None)
-            substrate = getattr(app.state, "substrate_service", None) or getattr(
-                app.state, "memory_service", None
-            )
+    async def _init_graph_agent_state() -> None:
+        if L9_GRAPH_AGENT_STATE and _has_graph_agent_state:
+            logger.info("╔════════════════════════════════════════╗")
+            logger.info("║  Stage 5: Graph-Backed Agent State     ║")
+            logger.info("╚════════════════════════════════════════╝")
 
-            if neo4j_client:
-                # Initialize AgentGraphLoader (uses neo4j_client)
-                agent_graph_loader = AgentGraphLoader(neo4j_client)
-                app.state.agent_graph_loader = agent_graph_loader
-                logger.info("✓ AgentGraphLoader initialized")
-
-                # Initialize GraphHydrator (with optional kernel stack)
-                kernel_stack = getattr(app.state, "kernel_stack", None)
-                graph_hydrator = GraphHydrator(
-                    neo4j_driver=neo4j_client,
-                    kernel_stack=kernel_stack,
+            try:
+                # Get Neo4j client from app state (stored as neo4j_client, not neo4j_driver)
+                neo4j_client = getattr(app.state, "neo4j_client", None)
+                substrate = getattr(app.state, "substrate_service", None) or getattr(
+                    app.state, "memory_service", None
                 )
-                app.state.graph_hydrator = graph_hydrator
-                logger.info("✓ GraphHydrator initialized")
 
-                # Initialize AgentSelfModifyTool
-                self_modify_tool = create_self_modify_tool(
-                    neo4j_driver=neo4j_client,
-                    substrate_service=substrate,
-                )
-                app.state.agent_self_modify_tool = self_modify_tool
-                logger.info("✓ AgentSelfModifyTool initialized")
+                if neo4j_client:
+                    # Initialize AgentGraphLoader (uses neo4j_client)
+                    agent_graph_loader = AgentGraphLoader(neo4j_client)
+                    app.state.agent_graph_loader = agent_graph_loader
+                    logger.info("✓ AgentGraphLoader initialized")
+
+                    # Initialize GraphHydrator (with optional kernel stack)
+                    kernel_stack = getattr(app.state, "kernel_stack", None)
+                    graph_hydrator = GraphHydrator(
+                        neo4j_driver=neo4j_client,
+                        kernel_stack=kernel_stack,
+                    )
+                    app.state.graph_hydrator = graph_hydrator
+                    logger.info("✓ GraphHydrator initialized")
 
-                # Check if L exists in graph, bootstrap if not
-                if await agent_graph_loader.exists("L"):
-                    logger.info("✓ L agent found in Neo4j graph")
+                    # Initialize AgentSelfModifyTool
+                    self_modify_tool = create_self_modify_tool(
+                        neo4j_driver=neo4j_client,
+                        substrate_service=substrate,
+                    )
+                    app.state.agent_self_modify_tool = self_modify_tool
+                    logger.info("✓ AgentSelfModifyTool initialized")
+
+                    # Check if L exists in graph, bootstrap if not
+                    if await agent_graph_loader.exists("L"):
+                        logger.info("✓ L agent found in Neo4j graph")
+                    else:
+                        logger.warning("L agent not in graph - run migration script")
+                        logger.info(
+                            "  python scripts/migrate_kernels_to_graph.py"
+                        )
+
+                    logger.info("Stage 5 (Graph-Backed Agent State) complete")
                 else:
-                    logger.warning("L agent not in graph - run migration script")
-                    logger.info(
-                        "  python scripts/migrate_kernels_to_graph.py"
+                    logger.warning(
+                        "⚠️ Stage 5 not started: neo4j_client not available"
                     )
+                    app.state.agent_graph_loader = None
+                    app.state.graph_hydrator = None
+                    app.state.agent_self_modify_tool = None
 
-                logger.info("Stage 5 (Graph-Backed Agent State) complete")
-            else:
-                logger.warning(
-                    "⚠️ Stage 5 not started: neo4j_client not available"
-                )
+            except Exception as e:
+                logger.error(f"❌ Stage 5 init failed: {e}", exc_info=True)
                 app.state.agent_graph_loader = None
                 app.state.graph_hydrator = None
                 app.state.agent_self_modify_tool = None
-
-        except Exception as e:
-            logger.error(f"❌ Stage 5 init failed: {e}", exc_info=True)
-            app.state.agent_graph_loader = None
-            app.state.graph_hydrator = None
-            app.state.agent_self_modify_tool = None
-    elif L9_GRAPH_AGENT_STATE and not _has_graph_agent_state:
-        logger.warning(
-            "Stage 5 enabled but graph_state module not available"
-        )
-    else:
-        logger.debug("Stage 5 (Graph-Backed Agent State) disabled")
+        elif L9_GRAPH_AGENT_STATE and not _has_graph_agent_state:
+            logger.warning(
+                "Stage 5 enabled but graph_state module not available"
+            )
+        else:
+            logger.debug("Stage 5 (Graph-Backed Agent State) disabled")
 
     # ========================================================================
     # STARTUP: UKG Phase 3 - Graph to World Model Sync (optional)
     # ========================================================================
-    L9_GRAPH_WM_SYNC = os.getenv("L9_GRAPH_WM_SYNC", "true").lower() == "true"
-    
-    if L9_GRAPH_WM_SYNC:
-        try:
-            from core.integration.graph_to_wm_sync import (
-                start_graph_wm_sync,
-                get_graph_wm_sync,
-            )
-            
-            # Pass neo4j_driver to sync service
-            neo4j_for_sync = getattr(app.state, "neo4j_client", None)
-            await start_graph_wm_sync(neo4j_driver=neo4j_for_sync)
-            app.state.graph_wm_sync = get_graph_wm_sync(neo4j_driver=neo4j_for_sync)
-            logger.info("✅ UKG Phase 3: Graph-WM Sync started")
-        except ImportError:
-            logger.warning("Graph-WM Sync module not available")
-            app.state.graph_wm_sync = None
-        except Exception as e:
-            logger.error(f"Graph-WM Sync init failed: {e}")
+    async def _init_graph_wm_sync() -> None:
+        L9_GRAPH_WM_SYNC = os.getenv("L9_GRAPH_WM_SYNC", "true").lower() == "true"
+
+        if L9_GRAPH_WM_SYNC:
+            try:
+                from core.integration.graph_to_wm_sync import (
+                    start_graph_wm_sync,
+                    get_graph_wm_sync,
+                )
+
+                # Pass neo4j_driver to sync service
+                neo4j_for_sync = getattr(app.state, "neo4j_client", None)
+                await start_graph_wm_sync(neo4j_driver=neo4j_for_sync)
+                app.state.graph_wm_sync = get_graph_wm_sync(neo4j_driver=neo4j_for_sync)
+                logger.info("✅ UKG Phase 3: Graph-WM Sync started")
+            except ImportError:
+                logger.warning("Graph-WM Sync module not available")
+                app.state.graph_wm_sync = None
+            except Exception as e:
+                logger.error(f"Graph-WM Sync init failed: {e}")
+                app.state.graph_wm_sync = None
+        else:
+            logger.debug("Graph-WM Sync disabled (L9_GRAPH_WM_SYNC=false)")
             app.state.graph_wm_sync = None
-    else:
-        logger.debug("Graph-WM Sync disabled (L9_GRAPH_WM_SYNC=false)")
-        app.state.graph_wm_sync = None
 
     # ========================================================================
     # STARTUP: UKG Phase 4 - Tool Pattern Extraction (optional)
     # ========================================================================
-    L9_TOOL_PATTERN_EXTRACTION = os.getenv(
-        "L9_TOOL_PATTERN_EXTRACTION", "true"
-    ).lower() == "true"
-    
-    if L9_TOOL_PATTERN_EXTRACTION:
-        try:
-            from core.integration.tool_pattern_extractor import (
-                start_tool_pattern_extraction,
-                get_tool_pattern_extractor,
-            )
-            
-            await start_tool_pattern_extraction()
-            app.state.tool_pattern_extractor = get_tool_pattern_extractor()
-            logger.info("✅ UKG Phase 4: Tool Pattern Extraction started (6h interval)")
-        except ImportError:
-            logger.warning("Tool Pattern Extraction module not available")
-            app.state.tool_pattern_extractor = None
-        except Exception as e:
-            logger.error(f"Tool Pattern Extraction init failed: {e}")
+    async def _init_tool_pattern_extraction() -> None:
+        L9_TOOL_PATTERN_EXTRACTION = os.getenv(
+            "L9_TOOL_PATTERN_EXTRACTION", "true"
+        ).lower() == "true"
+
+        if L9_TOOL_PATTERN_EXTRACTION:
+            try:
+                from core.integration.tool_pattern_extractor import (
+                    start_tool_pattern_extraction,
+                    get_tool_pattern_extractor,
+                )
+
+                await start_tool_pattern_extraction()
+                app.state.tool_pattern_extractor = get_tool_pattern_extractor()
+                logger.info("✅ UKG Phase 4: Tool Pattern Extraction started (6h interval)")
+            except ImportError:
+                logger.warning("Tool Pattern Extraction module not available")
+                app.state.tool_pattern_extractor = None
+            except Exception as e:
+                logger.error(f"Tool Pattern Extraction init failed: {e}")
+                app.state.tool_pattern_extractor = None
+        else:
+            logger.debug("Tool Pattern Extraction disabled (L9_TOOL_PATTERN_EXTRACTION=false)")
             app.state.tool_pattern_extractor = None
-    else:
-        logger.debug("Tool Pattern Extraction disabled (L9_TOOL_PATTERN_EXTRACTION=false)")
-        app.state.tool_pattern_extractor = None
 
     # ========================================================================
     # STARTUP: Five-Tier Observability (v3.3+ GMP-OBS-DEPLOY)
     # ========================================================================
-    if _has_observability and L9_OBSERVABILITY:
-        try:
-            substrate = getattr(app.state, "substrate_service", None)
-            logger.info("Initializing Five-Tier Observability...")
-            observability = await initialize_observability(substrate_service=substrate)
-            app.state.observability_service = observability
-
-            # Instrument L9 services (non-blocking, wraps existing methods)
-            executor = getattr(app.state, "agent_executor", None)
-            tool_registry = getattr(app.state, "tool_registry", None)
-            governance = getattr(app.state, "governance_engine", None)
+    async def _init_observability() -> None:
+        if _has_observability and L9_OBSERVABILITY:
+            try:
+                substrate = getattr(app.state, "substrate_service", None)
+                logger.info("Initializing Five-Tier Observability...")
+                observability = await initialize_observability(substrate_service=substrate)
+                app.state.observability_service = observability
+
+                # Instrument L9 services (non-blocking, wraps existing methods)
+                executor = getattr(app.state, "agent_executor", None)
+                tool_registry = getattr(app.state, "tool_registry", None)
+                governance = getattr(app.state, "governance_engine", None)
+
+                if executor:
+                    await instrument_agent_executor(executor)
+                if tool_registry:
+                    await instrument_tool_registry(tool_registry)
+                if governance:
+                    await instrument_governance_engine(governance)
+                if substrate:
+                    await instrument_memory_substrate(substrate)
 
-            if executor:
-                await instrument_agent_executor(executor)
-            if tool_registry:
-                await instrument_tool_registry(tool_registry)
-            if governance:
-                await instrument_governance_engine(governance)
-            if substrate:
-                await instrument_memory_substrate(substrate)
-
-            logger.info(
-                "✅ Five-Tier Observability initialized",
-                instrumented={
-                    "executor": executor is not None,
-                    "tool_registry": tool_registry is not None,
-                    "governance": governance is not None,
-                    "substrate": substrate is not None,
-                },
-            )
-        except Exception as e:
-            logger.error(f"Observability init failed: {e}", exc_info=True)
-            app.state.observability_service = None
-    else:
-        if not _has_observability:
-            logger.debug("Observability module not available")
+                logger.info(
+                    "✅ Five-Tier Observability initialized",
+                    instrumented={
+                        "executor": executor is not None,
+                        "tool_registry": tool_registry is not None,
+                        "governance": governance is not None,
+                        "substrate": substrate is not None,
+                    },
+                )
+            except Exception as e:
+                logger.error(f"Observability init failed: {e}", exc_info=True)
+                app.state.observability_service = None
         else:
-            logger.debug("Observability disabled (L9_OBSERVABILITY=false)")
-        app.state.observability_service = None
+            if not _has_observability:
+                logger.debug("Observability module not available")
+            else:
+                logger.debug("Observability disabled (L9_OBSERVABILITY=false)")
+            app.state.observability_service = None
 
+    # ========================================================================
+    # STARTUP VALIDATION: Enforce required components are initialized
+    # ========================================================================
+
+    def _validate_startup() -> None:
+        # Validate Neo4j (fail-fast if URI set but connection failed)
+        if os.getenv("NEO4J_URI"):
+            if not hasattr(app.state, "neo4j_client") or not app.state.neo4j_client:
+                logger.critical(
+                    "NEO4J_URI set but connection failed - graph features disabled"
+                )
+                # Note: Not fatal - Neo4j is optional for dev mode
+            else:
+                logger.info("✓ Neo4j validation passed")
+
+        # NOTE: L-CTO startup (LStartup) is DEPRECATED and archived.
+        # L-CTO agent initialization is now handled by KernelAwareAgentRegistry
+        # which loads kernels and activates the agent via runtime/kernel_loader.py.
+        # See core/agents/kernel_registry.py for the new kernel-based initialization.
+        app.state.l_cto_startup = None  # Kept for backward compatibility
+
+        # Validate Permission Graph (required if Slack is enabled)
+        if os.getenv("SLACK_BOT_TOKEN"):
+            if not hasattr(app.state, "permission_graph") or not app.state.permission_graph:
+                logger.warning(
+                    "Slack enabled but Permission Graph not available. "
+                    "RBAC checks will be skipped."
+                )
+            else:
+                logger.info("✓ Permission Graph validation passed (Slack protected)")
+
+        # Validate kernel-aware agent registry (if enabled)
+        if _has_kernel_registry:
+            if not hasattr(app.state, "agent_registry") or app.state.agent_registry is None:
+                logger.critical("STARTUP VALIDATION FAILED: agent_registry not initialized")
+                # In dev mode, we continue; in prod, this would be fatal
+            elif hasattr(app.state.agent_registry, "get_kernel_state"):
+                kernel_state = app.state.agent_registry.get_kernel_state()
+                if kernel_state != "ACTIVE":
+                    logger.critical(
+                        "STARTUP VALIDATION FAILED: Kernels not ACTIVE (state=%s)",
+                        kernel_state,
+                    )
+                else:
+                    logger.info("✓✓✓ L9 FULLY INITIALIZED WITH ACTIVE KERNELS ✓✓✓")
+
+        # Validate Session Startup result (v3.4+ / GMP-KERNEL-BOOT)
+        if _has_session_startup:
+            startup_result = getattr(app.state, "session_startup_result", None)
+            startup_ready = getattr(app.state, "startup_ready", False)
+
+            if startup_result is None:
+                logger.warning("STARTUP VALIDATION: SessionStartup result not available")
+            elif not startup_ready:
+                logger.critical(
+                    "STARTUP VALIDATION FAILED: SessionStartup not ready (status=%s)",
+                    startup_result.status if startup_result else "unknown",
+                )
+                if startup_result and startup_result.errors:
+                    for error in startup_result.errors[:3]:
+                        logger.critical("  Startup error: %s", error)
+            else:
+                logger.info(
+                    "✓ Session Startup validation passed: kernels_ready=%s, files=%d",
+                    startup_result.kernels_ready if startup_result else "unknown",
+                    len(startup_result.files_loaded) if startup_result else 0,
+                )
+
+        # Validate rate limiter
+        if not hasattr(app.state, "rate_limiter") or app.state.rate_limiter is None:
+            logger.warning("STARTUP VALIDATION: Rate limiter not initialized")
+
+    # ========================================================================
+    # STARTUP ORCHESTRATION: dependency-aware, concurrent initialization
+    # ========================================================================
+    # Independent subsystems initialize concurrently; background ones finish
+    # after the server starts answering /health; research initializes on the
+    # first /research request. Timings: /health/startup.
+    startup = StartupOrchestrator(
+        parallel=os.getenv("L9_STARTUP_PARALLEL", "true").lower() == "true"
+    )
+    startup.add("memory", _init_memory)
+    startup.add("research", _init_research, mode=StartupMode.LAZY)
+    startup.add("governance", _init_governance, depends_on=("memory",))
+    startup.add("housekeeping", _init_housekeeping, depends_on=("memory",))
+    startup.add("agent_executor", _init_agent_executor, depends_on=("memory", "governance"))
+    startup.add("slack", _init_slack)
+    startup.add("neo4j", _init_neo4j)
+    startup.add("neo4j_graph", _init_neo4j_graph, depends_on=("neo4j",), mode=StartupMode.BACKGROUND)
+    startup.add("redis", _init_redis)
+    startup.add("rate_limiter", _init_rate_limiter)
+    startup.add("permission_graph", _init_permission_graph, depends_on=("neo4j",))
+    startup.add("agent_bootstrap", _init_agent_bootstrap, depends_on=("memory",))
+    startup.add("l_tools", _init_l_tools, depends_on=("agent_executor", "neo4j"))
+    startup.add("memory_tools", _init_memory_tools, depends_on=("agent_executor",))
+    startup.add("prometheus", _init_prometheus)
+    startup.add("stage3", _init_stage3, depends_on=("memory", "neo4j"))
+    startup.add("graph_agent_state", _init_graph_agent_state, depends_on=("memory", "neo4j"))
+    startup.add(
+        "observability",
+        _init_observability,
+        depends_on=("memory", "governance", "agent_executor"),
+    )
+    startup.add(
+        "world_model_runtime",
+        _init_world_model_runtime,
+        depends_on=("memory",),
+        mode=StartupMode.BACKGROUND,
+    )
+    startup.add(
+        "consolidation",
+        _init_consolidation,
+        depends_on=("memory",),
+        mode=StartupMode.BACKGROUND,
+    )
+    startup.add(
+        "graph_wm_sync", _init_graph_wm_sync, depends_on=("neo4j",), mode=StartupMode.BACKGROUND
+    )
+    startup.add(
+        "tool_pattern_extraction",
+        _init_tool_pattern_extraction,
+        depends_on=("neo4j",),
+        mode=StartupMode.BACKGROUND,
+    )
+    app.state.startup_orchestrator = startup
+
+    await startup.run()
+    _validate_startup()
+    logger.info(
+        "L9 startup complete: %.0fms (sum of subsystems %.0fms)",
+        startup.eager_ms,
+        startup.status()["sum_of_subsystem_ms"],
+    )
     yield
 
     # ========================================================================
@@ -1464,6 +1556,17 @@ async def lifespan(app: FastAPI):
     # ========================================================================
     logger.info("Shutting down L9 API server...")
 
+    # Cancel background/lazy initializers still in flight
+    await startup.shutdown()
+
+    # Drain buffered executor trace packets while the substrate is still up
+    if getattr(app.state, "agent_executor", None) is not None:
+        try:
+            await app.state.agent_executor.close()
+            logger.info("Agent executor trace sink drained")
+        except Exception as e:
+            logger.warning(f"Error draining agent executor traces: {e}")
+
     # Shutdown Five-Tier Observability (flush spans)
     if hasattr(app.state, "observability_service") and app.state.observability_service:
         try:
@@ -1562,16 +1665,32 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.error(f"Error shutting down Research Factory: {e}")
 
-    # Cleanup Slack HTTP client
-    if _has_slack and hasattr(app.state, "http_client") and app.state.http_client:
+    # Cleanup shared HTTP clients (Slack, AIOS, email, research, MCP)
+    try:
+        from runtime.http_clients import close_http_clients
+
+        await close_http_clients()
+        logger.info("Shared HTTP clients closed")
+    except Exception as e:
+        logger.error(f"Error closing shared HTTP clients: {e}")
+
+    # Stop symbolic compilation workers (the artifact cache stays on disk)
+    if _has_symbolic:
         try:
-            await app.state.http_client.aclose()
-            logger.info("Slack HTTP client closed")
+            from services.symbolic_computation.core.compile_pool import shutdown_compile_pool
+
+            shutdown_compile_pool()
         except Exception as e:
-            logger.error(f"Error closing Slack HTTP client: {e}")
+            logger.error(f"Error stopping symbolic compile pool: {e}")
 
-    # Cleanup Neo4j client
+    # Cleanup Neo4j client (flush buffered tool call events first)
     if hasattr(app.state, "neo4j_client") and app.state.neo4j_client:
+        try:
+            from core.tools.tool_graph import close_tool_call_logger
+
+            await close_tool_call_logger()
+        except Exception as e:
+            logger.error(f"Error flushing tool call events: {e}")
         try:
             from memory.graph_client import close_neo4j_client
 
@@ -1712,19 +1831,24 @@ async def health():
 async def startup_health():
     """
     Detailed startup health check endpoint.
-    Returns full SessionStartup result including kernel hash snapshot.
+    Returns full SessionStartup result including kernel hash snapshot,
+    plus per-subsystem initialization timings from the startup orchestrator.
     """
     startup_result = getattr(app.state, "session_startup_result", None)
     startup_ready = getattr(app.state, "startup_ready", False)
+    orchestrator = getattr(app.state, "startup_orchestrator", None)
+    subsystems = orchestrator.status() if orchestrator is not None else None
 
     if startup_result is None:
         return {
             "status": "unknown",
             "message": "SessionStartup not executed or not available",
             "startup_ready": startup_ready,
+            "subsystems": subsystems,
         }
 
     return {
+        "subsystems": subsystems,
         "status": startup_result.status,
         "startup_ready": startup_ready,
         "preflight_passed": startup_result.preflight_passed,
@@ -2119,7 +2243,10 @@ if _has_slack:
 
 # Quantum Research Factory router (v2.1+)
 if _has_research:
-    app.include_router(research_router)
+    app.include_router(
+        research_router,
+        dependencies=[Depends(require_subsystem("research"))],
+    )
 
 # Research Factory router (v2.3+)
 if _has_factory:
@@ -2153,6 +2280,14 @@ try:
 except ImportError:
     logger.debug("Compliance router not available")
 
+# Profiling admin router
+try:
+    from api.routes.profiling import router as profiling_router
+    app.include_router(profiling_router)
+    logger.info("Profiling router registered at /admin/profiler")
+except ImportError:
+    logger.debug("Profiling router not available")
+
 # Simulation router (GMP-24)
 try:
     from api.routes.simulation import router as simulation_router
@@ -2378,7 +2513,10 @@ async def l_ws(websocket: WebSocket) -> None:
        - message: str (required)
        - thread_id: str (optional, for conversation grouping)
        - metadata: dict (optional)
-    3) Server executes via AgentExecutorService and returns:
+       - stream: bool (optional; stream reasoning as it is generated)
+    3) If stream is set, the server first sends EventMessage frames
+       (type reasoning_delta / tool_call_delta) as tokens arrive.
+    4) Server executes via AgentExecutorService and returns:
        - task_id: str
        - status: str (completed, duplicate, failed, error)
        - reply: str
@@ -2466,7 +2604,16 @@ async def l_ws(websocket: WebSocket) -> None:
                 )
 
                 # Execute task via AgentExecutorService
-                result = await agent_executor.start_agent_task(task)
+                if data.get("stream"):
+
+                    async def send_event(event) -> None:
+                        await websocket.send_json(event.model_dump(mode="json"))
+
+                    result = await agent_executor.start_agent_task(
+                        task, event_sink=send_event
+                    )
+                else:
+                    result = await agent_executor.start_agent_task(task)
 
                 # Handle duplicate detection
                 if isinstance(result, DuplicateTaskResponse):
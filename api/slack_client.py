@@ -7,6 +7,7 @@ for posting messages (chat.postMessage) with full thread support.
 It is NOT a full Slack SDK; it only implements the subset needed for
 the L9 Slack adapter:
   - chat.postMessage (reply in thread)
+  - chat.update (edit a posted message, used for streamed replies)
   - Basic error handling
   - No connection pooling (relies on httpx at app level)
 """
@@ -19,6 +20,7 @@ logger = structlog.get_logger(__name__)
 
 SLACK_API_BASE = "https://slack.com/api"
 SLACK_CHAT_POST_MESSAGE_ENDPOINT = f"{SLACK_API_BASE}/chat.postMessage"
+SLACK_CHAT_UPDATE_ENDPOINT = f"{SLACK_API_BASE}/chat.update"
 
 
 class SlackClientError(Exception):
@@ -105,6 +107,53 @@ class SlackAPIClient:
         if metadata:
             payload["metadata"] = metadata
 
+        response_data = await self._call(SLACK_CHAT_POST_MESSAGE_ENDPOINT, payload)
+
+        logger.info(
+            "slack_message_posted",
+            channel=channel,
+            ts=response_data.get("ts"),
+            thread_ts=thread_ts,
+        )
+
+        return response_data
+
+    async def update_message(
+        self,
+        channel: str,
+        ts: str,
+        text: str,
+    ) -> Dict[str, Any]:
+        """
+        Replace the text of a message previously posted by the bot.
+
+        Args:
+            channel: Channel ID the message was posted to
+            ts: Timestamp of the message to update
+            text: New plain text content
+
+        Returns:
+            Slack API response dict (ok, channel, ts, text)
+
+        Raises:
+            SlackClientError: If API call fails
+        """
+        response_data = await self._call(
+            SLACK_CHAT_UPDATE_ENDPOINT,
+            {"channel": channel, "ts": ts, "text": text},
+        )
+
+        logger.debug("slack_message_updated", channel=channel, ts=ts)
+
+        return response_data
+
+    async def _call(self, endpoint: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        POST a JSON payload to a Slack Web API method.
+
+        Raises:
+            SlackClientError: On timeout, HTTP error, or ok=false
+        """
         headers = {
             "Authorization": f"Bearer {self.bot_token}",
             "Content-Type": "application/json",
@@ -113,7 +162,7 @@ class SlackAPIClient:
         try:
             # httpx.AsyncClient.post() returns Response directly (not async context manager)
             resp = await self.http_client.post(
-                SLACK_CHAT_POST_MESSAGE_ENDPOINT,
+                endpoint,
                 json=payload,
                 headers=headers,
                 timeout=10.0,
@@ -122,19 +171,6 @@ class SlackAPIClient:
 
             response_data = resp.json()
 
-            if not response_data.get("ok"):
-                error = response_data.get("error", "unknown error")
-                raise SlackClientError(f"Slack API error: {error}")
-
-            logger.info(
-                "slack_message_posted",
-                channel=channel,
-                ts=response_data.get("ts"),
-                thread_ts=thread_ts,
-            )
-
-            return response_data
-
         except httpx.TimeoutException:
             raise SlackClientError("Slack API request timed out (10s)")
         except httpx.HTTPStatusError as e:
@@ -143,3 +179,9 @@ class SlackAPIClient:
             )
         except Exception as e:
             raise SlackClientError(f"HTTP error posting to Slack: {e}")
+
+        if not response_data.get("ok"):
+            error = response_data.get("error", "unknown error")
+            raise SlackClientError(f"Slack API error: {error}")
+
+        return response_data
@@ -0,0 +1,324 @@
+"""
+L9 API - Startup Orchestrator
+=============================
+
+Dependency-aware initialization for the FastAPI lifespan. Each subsystem
+declares the subsystems it needs; everything whose dependencies are ready
+initializes concurrently.
+
+Modes:
+- eager: awaited before the server accepts requests
+- background: started once eager subsystems are up; /health answers while
+  they finish
+- lazy: initialized on first use via ensure() (e.g. a router dependency)
+
+Dependencies are pulled in on demand whatever their mode. A failing
+subsystem is recorded and its dependents still run (they see the missing
+app.state attribute, as before); a failing critical subsystem aborts
+startup. Per-subsystem timings are served on /health/startup.
+
+Set L9_STARTUP_PARALLEL=false to initialize one subsystem at a time in
+dependency order (debugging).
+
+Version: 1.0.0
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+__all__ = [
+    "StartupMode",
+    "StartupError",
+    "Subsystem",
+    "StartupOrchestrator",
+]
+
+
+class StartupMode(str, Enum):
+    """When the orchestrator itself triggers a subsystem."""
+
+    EAGER = "eager"
+    BACKGROUND = "background"
+    LAZY = "lazy"
+
+
+class StartupError(RuntimeError):
+    """Invalid startup graph or a critical subsystem failed."""
+
+
+@dataclass
+class Subsystem:
+    """One unit of startup work and its outcome."""
+
+    name: str
+    init: Callable[[], Awaitable[Any]]
+    depends_on: Tuple[str, ...] = ()
+    mode: StartupMode = StartupMode.EAGER
+    critical: bool = False
+    timeout: Optional[float] = None
+
+    status: str = "pending"  # pending | running | ready | failed | cancelled
+    started_ms: Optional[float] = None  # offset from orchestrator start
+    duration_ms: Optional[float] = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "status": self.status,
+            "mode": self.mode.value,
+            "critical": self.critical,
+            "depends_on": list(self.depends_on),
+            "started_ms": _round(self.started_ms),
+            "duration_ms": _round(self.duration_ms),
+            "error": self.error,
+        }
+
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return round(value, 2) if value is not None else None
+
+
+class StartupOrchestrator:
+    """
+    Runs subsystem initializers as a dependency graph.
+
+    Usage:
+        startup = StartupOrchestrator()
+        startup.add("memory", init_memory, critical=False)
+        startup.add("governance", init_governance, depends_on=("memory",))
+        startup.add("research", init_research, mode=StartupMode.LAZY)
+        await startup.run()          # eager done, background started
+        ...
+        await startup.ensure("research")
+        await startup.shutdown()
+    """
+
+    def __init__(self, parallel: bool = True):
+        self.parallel = parallel
+        self._subsystems: Dict[str, Subsystem] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._background: Optional[asyncio.Task] = None
+        self._t0: Optional[float] = None
+        self.eager_ms: Optional[float] = None
+
+    # ------------------------------------------------------------------
+    # Graph
+    # ------------------------------------------------------------------
+
+    def add(
+        self,
+        name: str,
+        init: Callable[[], Awaitable[Any]],
+        depends_on: Iterable[str] = (),
+        mode: StartupMode = StartupMode.EAGER,
+        critical: bool = False,
+        timeout: Optional[float] = None,
+    ) -> Subsystem:
+        """Register a subsystem. Dependencies may be added later."""
+        if name in self._subsystems:
+            raise StartupError(f"Subsystem already registered: {name}")
+        subsystem = Subsystem(
+            name=name,
+            init=init,
+            depends_on=tuple(depends_on),
+            mode=StartupMode(mode),
+            critical=critical,
+            timeout=timeout,
+        )
+        self._subsystems[name] = subsystem
+        return subsystem
+
+    def get(self, name: str) -> Subsystem:
+        return self._subsystems[name]
+
+    def order(self) -> List[str]:
+        """
+        Topological order (registration order among independents).
+
+        Raises:
+            StartupError: Unknown dependency or dependency cycle
+        """
+        order: List[str] = []
+        state: Dict[str, int] = {}  # 1 = visiting, 2 = done
+
+        def visit(name: str, path: Tuple[str, ...]) -> None:
+            if state.get(name) == 2:
+                return
+            if state.get(name) == 1:
+                cycle = " -> ".join(path[path.index(name):] + (name,))
+                raise StartupError(f"Startup dependency cycle: {cycle}")
+            state[name] = 1
+            for dep in self._subsystems[name].depends_on:
+                if dep not in self._subsystems:
+                    raise StartupError(f"Subsystem {name} depends on unknown subsystem {dep}")
+                visit(dep, path + (name,))
+            state[name] = 2
+            order.append(name)
+
+        for name in self._subsystems:
+            visit(name, ())
+        return order
+
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+
+    async def run(self) -> None:
+        """
+        Initialize eager subsystems (and their dependencies), then start
+        background ones without waiting for them.
+
+        Raises:
+            StartupError: Invalid graph or a critical subsystem failed
+        """
+        order = self.order()
+        self._t0 = time.perf_counter()
+        eager = [n for n in order if self._subsystems[n].mode == StartupMode.EAGER]
+        background = [n for n in order if self._subsystems[n].mode == StartupMode.BACKGROUND]
+
+        try:
+            if self.parallel:
+                await asyncio.gather(*(self._start(n) for n in eager))
+            else:
+                for name in eager:
+                    await self._start(name)
+        except BaseException:
+            await self.shutdown()
+            raise
+        self.eager_ms = (time.perf_counter() - self._t0) * 1000
+
+        logger.info(
+            "startup_eager_complete",
+            duration_ms=round(self.eager_ms, 1),
+            subsystems=len(eager),
+            background=len(background),
+            parallel=self.parallel,
+        )
+        if background:
+            self._background = asyncio.create_task(
+                self._run_background(background), name="startup:background"
+            )
+
+    async def ensure(self, name: str) -> Subsystem:
+        """Initialize a subsystem (and its dependencies) if not done yet."""
+        if name not in self._subsystems:
+            raise StartupError(f"Unknown subsystem: {name}")
+        if self._t0 is None:
+            self._t0 = time.perf_counter()
+        # The task is shared by every caller; a cancelled request must not
+        # cancel it for the others (only shutdown() does that)
+        await asyncio.shield(self._start(name))
+        return self._subsystems[name]
+
+    async def wait_background(self, timeout: Optional[float] = None) -> None:
+        """Wait for background initialization (tests, benchmarks)."""
+        if self._background is not None:
+            await asyncio.wait_for(asyncio.shield(self._background), timeout)
+
+    async def shutdown(self) -> None:
+        """Cancel initializers that are still running."""
+        pending = [t for t in self._tasks.values() if not t.done()]
+        if self._background is not None and not self._background.done():
+            pending.append(self._background)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _run_background(self, names: List[str]) -> None:
+        if self.parallel:
+            await asyncio.gather(*(self._start(n) for n in names), return_exceptions=True)
+        else:
+            for name in names:
+                try:
+                    await self._start(name)
+                except StartupError:
+                    pass
+        logger.info(
+            "startup_background_complete",
+            subsystems=len(names),
+            duration_ms=round((time.perf_counter() - self._t0) * 1000, 1),
+        )
+
+    def _start(self, name: str) -> asyncio.Task:
+        task = self._tasks.get(name)
+        if task is None:
+            task = asyncio.create_task(self._run_one(self._subsystems[name]), name=f"startup:{name}")
+            self._tasks[name] = task
+        return task
+
+    async def _run_one(self, subsystem: Subsystem) -> None:
+        if self.parallel:
+            await asyncio.gather(
+                *(asyncio.shield(self._start(dep)) for dep in subsystem.depends_on)
+            )
+        else:
+            for dep in subsystem.depends_on:
+                await asyncio.shield(self._start(dep))
+
+        subsystem.status = "running"
+        start = time.perf_counter()
+        subsystem.started_ms = (start - self._t0) * 1000
+        try:
+            if subsystem.timeout is not None:
+                await asyncio.wait_for(subsystem.init(), subsystem.timeout)
+            else:
+                await subsystem.init()
+            subsystem.status = "ready"
+        except asyncio.CancelledError:
+            subsystem.status = "cancelled"
+            raise
+        except Exception as e:
+            subsystem.status = "failed"
+            subsystem.error = str(e) or type(e).__name__
+            logger.error(
+                "startup_subsystem_failed",
+                subsystem=subsystem.name,
+                critical=subsystem.critical,
+                error=subsystem.error,
+            )
+            if subsystem.critical:
+                raise StartupError(f"Critical subsystem {subsystem.name} failed: {e}") from e
+        finally:
+            subsystem.duration_ms = (time.perf_counter() - start) * 1000
+
+        logger.debug(
+            "startup_subsystem_ready",
+            subsystem=subsystem.name,
+            duration_ms=round(subsystem.duration_ms, 1),
+        )
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+
+    @property
+    def ready(self) -> bool:
+        """All eager subsystems finished (ready or failed non-critically)."""
+        return self.eager_ms is not None
+
+    def status(self) -> Dict[str, Any]:
+        """Timings and outcome per subsystem (served on /health/startup)."""
+        subsystems = {name: s.to_dict() for name, s in self._subsystems.items()}
+        total = sum(s.duration_ms or 0.0 for s in self._subsystems.values())
+        return {
+            "parallel": self.parallel,
+            "eager_ms": _round(self.eager_ms),
+            "sum_of_subsystem_ms": _round(total),
+            "pending": sorted(
+                name
+                for name, s in self._subsystems.items()
+                if s.status in ("pending", "running") and s.mode != StartupMode.LAZY
+            ),
+            "failed": sorted(n for n, s in self._subsystems.items() if s.status == "failed"),
+            "subsystems": subsystems,
+        }
@@ -7,7 +7,8 @@ Represents a running agent instance with its configuration and bound tools.
 The AgentInstance class manages:
 - Agent configuration and state
 - Tool bindings (approved by governance)
-- Context assembly for AIOS calls
+- Context assembly for AIOS calls (incremental, token-budgeted; see
+  core.agents.context_window)
 - Conversation history within a task
 
 This class does NOT:
@@ -45,18 +46,25 @@ Tool Call Logging:
 - This automatically populates tool_audit segment
 - Use tool_call_wrapper() helper to ensure consistent logging
 
-Version: 1.0.0
+Version: 1.1.0
 """
 
 from __future__ import annotations
 
 import hashlib
+import json
 import re
 import structlog
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Optional
 from uuid import UUID, uuid4
 
+from core.agents.context_window import (
+    ContextWindow,
+    estimate_tokens,
+    format_message_for_aios,
+)
 from core.agents.schemas import (
     AgentConfig,
     AgentTask,
@@ -69,6 +77,84 @@ logger = structlog.get_logger(__name__)
 _OPENAI_TOOL_NAME_PATTERN = re.compile(r"^[a-zA-Z0-9_-]+$")
 
 
+# =============================================================================
+# Tool Definitions (OpenAI function calling)
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class ToolDefinitionSet:
+    """
+    OpenAI tool definitions for a set of bindings, with name aliasing.
+
+    Built once per binding set (ExecutorToolRegistry caches it alongside the
+    approved bindings) and treated as read-only afterwards.
+
+    Attributes:
+        definitions: Tool definitions in OpenAI function calling format
+        name_map: OpenAI function name -> canonical tool_id
+        reverse_map: Canonical tool_id -> OpenAI function name
+    """
+
+    definitions: list[dict[str, Any]] = field(default_factory=list)
+    name_map: dict[str, str] = field(default_factory=dict)
+    reverse_map: dict[str, str] = field(default_factory=dict)
+
+
+def build_tool_definitions(tools: list[ToolBinding]) -> ToolDefinitionSet:
+    """
+    Build OpenAI tool definitions for enabled bindings.
+
+    function.name == tool_id unless the tool_id is not a valid OpenAI function
+    name, in which case a sanitized (and, on collision, hash-suffixed) alias
+    is used and recorded in name_map.
+
+    Args:
+        tools: Tool bindings (disabled bindings are skipped)
+
+    Returns:
+        ToolDefinitionSet
+    """
+    name_map: dict[str, str] = {}
+    reverse_map: dict[str, str] = {}
+    definitions: list[dict[str, Any]] = []
+
+    for tool in tools:
+        if not tool.enabled:
+            continue
+        tool_id = tool.tool_id
+        openai_name = tool_id
+        if not _OPENAI_TOOL_NAME_PATTERN.match(openai_name):
+            openai_name = re.sub(r"[^a-zA-Z0-9_-]", "_", tool_id)
+            openai_name = openai_name or "tool"
+            if openai_name in name_map and name_map[openai_name] != tool_id:
+                suffix = hashlib.sha1(tool_id.encode("utf-8")).hexdigest()[:8]
+                openai_name = f"{openai_name}_{suffix}"
+            logger.warning(
+                "tool_name_sanitized",
+                tool_id=tool_id,
+                openai_name=openai_name,
+            )
+        name_map[openai_name] = tool_id
+        reverse_map[tool_id] = openai_name
+        definitions.append(
+            {
+                "type": "function",
+                "function": {
+                    "name": openai_name,  # OpenAI-compatible alias
+                    "description": tool.description or "",
+                    "parameters": tool.input_schema,
+                },
+            }
+        )
+
+    return ToolDefinitionSet(
+        definitions=definitions,
+        name_map=name_map,
+        reverse_map=reverse_map,
+    )
+
+
 class AgentInstance:
     """
     Represents a running agent instance.
@@ -91,6 +177,7 @@ class AgentInstance:
         self,
         config: AgentConfig,
         task: AgentTask,
+        tool_definitions: Optional[ToolDefinitionSet] = None,
     ):
         """
         Initialize a new agent instance.
@@ -98,6 +185,8 @@ class AgentInstance:
         Args:
             config: Agent configuration with personality and tools
             task: The task to execute
+            tool_definitions: Precomputed definitions for config.tools
+                (built lazily on first use if not provided)
         """
         self._instance_id = uuid4()
         self._config = config
@@ -108,10 +197,15 @@ class AgentInstance:
         self._tool_results: list[dict[str, Any]] = []
         self._created_at = datetime.utcnow()
         self._total_tokens = 0
-        self._tool_name_map: dict[str, str] = {}
-        self._tool_name_reverse_map: dict[str, str] = {}
+        self._tool_definitions = tool_definitions
         self._user_corrections: list[dict[str, Any]] = []
         self._governance_blocks: list[dict[str, Any]] = []
+        self._context_window = ContextWindow(
+            model=config.model,
+            token_budget=config.context_token_budget,
+            strategy=config.context_strategy,
+        )
+        self._tool_definition_tokens: Optional[int] = None
 
         logger.info(
             "AgentInstance created",
@@ -171,6 +265,11 @@ class AgentInstance:
         """Get list of user corrections tracked during execution."""
         return self._user_corrections.copy()
 
+    @property
+    def context_window(self) -> ContextWindow:
+        """Get the incremental context window."""
+        return self._context_window
+
     @property
     def governance_blocks(self) -> list[dict[str, Any]]:
         """Get list of governance blocks tracked during execution."""
@@ -304,25 +403,13 @@ class AgentInstance:
         Get tool definitions in OpenAI function calling format.
 
         function.name == tool_id (canonical identity, must match exactly).
+        Built once per instance (or supplied precomputed by the executor)
+        rather than on every reasoning iteration.
 
         Returns:
             List of tool definitions for AIOS
         """
-        definitions = []
-        self._build_tool_name_map()
-        for tool in self.get_bound_tools():
-            openai_name = self._tool_name_reverse_map.get(tool.tool_id, tool.tool_id)
-            definitions.append(
-                {
-                    "type": "function",
-                    "function": {
-                        "name": openai_name,  # OpenAI-compatible alias
-                        "description": tool.description or "",
-                        "parameters": tool.input_schema,
-                    },
-                }
-            )
-        return definitions
+        return list(self._get_tool_definition_set().definitions)
 
     def has_tool(self, tool_id: str) -> bool:
         """Check if a tool is bound to this agent."""
@@ -331,32 +418,12 @@ class AgentInstance:
 
     def resolve_tool_id(self, tool_name: str) -> str:
         """Resolve an OpenAI tool name alias back to canonical tool_id."""
-        self._build_tool_name_map()
-        return self._tool_name_map.get(tool_name, tool_name)
-
-    def _build_tool_name_map(self) -> None:
-        if self._tool_name_map:
-            return
-
-        for tool in self.get_bound_tools():
-            tool_id = tool.tool_id
-            openai_name = tool_id
-            if not _OPENAI_TOOL_NAME_PATTERN.match(openai_name):
-                openai_name = re.sub(r"[^a-zA-Z0-9_-]", "_", tool_id)
-                openai_name = openai_name or "tool"
-                if (
-                    openai_name in self._tool_name_map
-                    and self._tool_name_map[openai_name] != tool_id
-                ):
-                    suffix = hashlib.sha1(tool_id.encode("utf-8")).hexdigest()[:8]
-                    openai_name = f"{openai_name}_{suffix}"
-                logger.warning(
-                    "tool_name_sanitized",
-                    tool_id=tool_id,
-                    openai_name=openai_name,
-                )
-            self._tool_name_map[openai_name] = tool_id
-            self._tool_name_reverse_map[tool_id] = openai_name
+        return self._get_tool_definition_set().name_map.get(tool_name, tool_name)
+
+    def _get_tool_definition_set(self) -> ToolDefinitionSet:
+        if self._tool_definitions is None:
+            self._tool_definitions = build_tool_definitions(self._config.tools)
+        return self._tool_definitions
 
     # =========================================================================
     # History Management
@@ -495,35 +562,7 @@ class AgentInstance:
         Returns:
             List of message dicts formatted for OpenAI API
         """
-        messages = []
-        for msg in self._history:
-            if msg["role"] == "tool":
-                # Format tool results for AIOS
-                messages.append(
-                    {
-                        "role": "tool",
-                        "tool_call_id": msg.get("tool_call_id", ""),
-                        "content": msg["content"],
-                    }
-                )
-            elif msg["role"] == "assistant" and msg.get("tool_calls"):
-                # Assistant message with tool calls - must include tool_calls array
-                # OpenAI requires content to be a string (empty string if no content)
-                messages.append(
-                    {
-                        "role": "assistant",
-                        "content": msg.get("content") or "",  # Empty string, never None
-                        "tool_calls": msg["tool_calls"],
-                    }
-                )
-            else:
-                messages.append(
-                    {
-                        "role": msg["role"],
-                        "content": msg["content"],
-                    }
-                )
-        return messages
+        return [format_message_for_aios(msg) for msg in self._history]
 
     # =========================================================================
     # Context Assembly
@@ -588,23 +627,38 @@ class AgentInstance:
         Injects DAG-stored context (thread_context, semantic_hits) into
         the system prompt for conversation continuity.
 
+        The system prompt and tool definitions are built once per instance;
+        only history entries appended since the previous call are formatted,
+        and the message window is trimmed to the model's token budget.
+
         Returns:
             Context dict containing:
             - system_prompt: System prompt for the agent (enriched with DAG context)
-            - messages: Conversation history
+            - messages: Conversation history (already in AIOS format)
+            - messages_prepared: True - messages need no re-formatting
             - tools: Available tool definitions
             - task: Current task information
-            - metadata: Additional context
+            - metadata: Additional context, including context_window stats
         """
-        # Build enriched system prompt with DAG context
-        base_prompt = self._config.system_prompt or ""
-        dag_context = self._build_dag_context_section()
-        enriched_prompt = base_prompt + dag_context if dag_context else base_prompt
+        window = self._context_window
+        system_prompt = window.prefix(self._build_system_prompt, self._measure_system_prompt)
+        tools = self.get_tool_definitions()
+
+        if self._tool_definition_tokens is None:
+            self._tool_definition_tokens = (
+                estimate_tokens(json.dumps(tools, default=str), self._config.model) if tools else 0
+            )
+
+        window.sync(self._history)
+        messages = window.build(
+            reserved_tokens=self._tool_definition_tokens + self._config.max_tokens
+        )
 
         return {
-            "system_prompt": enriched_prompt,
-            "messages": self.get_messages_for_aios(),
-            "tools": self.get_tool_definitions(),
+            "system_prompt": system_prompt,
+            "messages": messages,
+            "messages_prepared": True,
+            "tools": tools,
             "task": {
                 "id": str(self._task.id),
                 "kind": self._task.kind.value,
@@ -619,9 +673,35 @@ class AgentInstance:
                 "max_tokens": self._config.max_tokens,
                 "iteration": self._iteration,
                 "thread_id": str(self.thread_id),
+                "context_window": window.stats.to_dict(),
             },
         }
 
+    def _build_system_prompt(self) -> str:
+        """Build the system prompt enriched with DAG context."""
+        base_prompt = self._config.system_prompt or ""
+        dag_context = self._build_dag_context_section()
+        return base_prompt + dag_context if dag_context else base_prompt
+
+    def _measure_system_prompt(self, system_prompt: str) -> int:
+        """
+        Count system prompt tokens, reusing the kernel prompt artifact's
+        precomputed count for the static base prompt.
+        """
+        model = self._config.model
+        base_prompt = self._config.system_prompt or ""
+        base_tokens = None
+        if base_prompt and system_prompt.startswith(base_prompt):
+            try:
+                from core.kernels.prompt_builder import lookup_prompt_tokens
+
+                base_tokens = lookup_prompt_tokens(base_prompt, model)
+            except ImportError:
+                pass
+        if base_tokens is None:
+            return estimate_tokens(system_prompt, model)
+        return base_tokens + estimate_tokens(system_prompt[len(base_prompt):], model)
+
     # =========================================================================
     # Serialization
     # =========================================================================
@@ -643,6 +723,7 @@ class AgentInstance:
             "total_tokens": self._total_tokens,
             "history_length": len(self._history),
             "tool_calls": len(self._tool_results),
+            "context_tokens_saved": self._context_window.stats.total_tokens_saved,
             "created_at": self._created_at.isoformat(),
         }
 
@@ -653,4 +734,6 @@ class AgentInstance:
 
 __all__ = [
     "AgentInstance",
+    "ToolDefinitionSet",
+    "build_tool_definitions",
 ]
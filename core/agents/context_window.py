@@ -0,0 +1,498 @@
+"""
+L9 Core Agents - Context Window
+===============================
+
+Incremental, token-budgeted message window for AgentInstance.
+
+AgentInstance.assemble_context used to re-format the whole history on every
+reasoning iteration and sent it unbounded, so long tool-use loops produced
+ever-growing prompts. The ContextWindow:
+
+- Formats each history entry for AIOS exactly once and caches its token
+  estimate (only entries appended since the last call are processed)
+- Caches the enriched system prompt and the tool definition token cost
+- Enforces a per-model prompt token budget with a configurable strategy:
+    - drop_tool_results: elide the oldest tool results first, then drop
+      the oldest turns
+    - summarize: replace the oldest turns with an extractive summary
+      (core.memory.virtual_context.extract_facts), then fall back to
+      drop_tool_results
+    - none: no trimming
+- Reports prompt tokens saved per build and cumulatively
+
+Token counts use tiktoken when it is installed and a chars/4 heuristic
+otherwise; budgets leave headroom for that estimate error.
+
+Version: 1.0.0
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import asdict, dataclass
+from enum import Enum
+from typing import Any, Callable, Optional
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+try:
+    import tiktoken
+
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    tiktoken = None  # type: ignore[assignment]
+    TIKTOKEN_AVAILABLE = False
+
+
+# =============================================================================
+# Token Budgets
+# =============================================================================
+
+# Prompt token budgets per model family (context window minus headroom for
+# estimate error). Longest matching prefix wins.
+MODEL_CONTEXT_BUDGETS: dict[str, int] = {
+    "gpt-4o": 120_000,
+    "gpt-4o-mini": 120_000,
+    "gpt-4.1": 120_000,
+    "gpt-4-turbo": 120_000,
+    "gpt-4": 7_500,
+    "gpt-3.5-turbo": 15_000,
+    "o1": 120_000,
+    "o3": 120_000,
+    "claude": 190_000,
+}
+
+DEFAULT_CONTEXT_BUDGET = 30_000
+
+# Per-message framing overhead (role, separators) in the chat format
+MESSAGE_OVERHEAD_TOKENS = 4
+
+# Most recent messages that are never elided, summarized or dropped
+DEFAULT_KEEP_RECENT = 4
+
+ELIDED_TOOL_RESULT = "[tool result elided to fit context budget: ~{tokens} tokens]"
+SUMMARY_HEADER = "[Summary of {count} earlier messages]"
+
+# Token cost of an elided tool result (framing + stub text)
+_ELIDED_TOKENS = MESSAGE_OVERHEAD_TOKENS + 16
+
+
+class ContextTrimStrategy(str, Enum):
+    """How to bring an over-budget message window back under budget."""
+
+    NONE = "none"
+    DROP_TOOL_RESULTS = "drop_tool_results"
+    SUMMARIZE = "summarize"
+
+
+def get_model_token_budget(model: Optional[str]) -> int:
+    """
+    Get the prompt token budget for a model.
+
+    AGENT_CONTEXT_TOKEN_BUDGET overrides the per-model table.
+
+    Args:
+        model: Model name (e.g. "gpt-4o-2024-08-06")
+
+    Returns:
+        Prompt token budget
+    """
+    override = os.getenv("AGENT_CONTEXT_TOKEN_BUDGET")
+    if override:
+        try:
+            return int(override)
+        except ValueError:
+            logger.warning("invalid_context_token_budget", value=override)
+
+    if model:
+        matches = [p for p in MODEL_CONTEXT_BUDGETS if model.startswith(p)]
+        if matches:
+            return MODEL_CONTEXT_BUDGETS[max(matches, key=len)]
+    return DEFAULT_CONTEXT_BUDGET
+
+
+_encoders: dict[str, Any] = {}
+
+
+def _get_encoder(model: Optional[str]) -> Any:
+    key = model or ""
+    if key not in _encoders:
+        try:
+            _encoders[key] = tiktoken.encoding_for_model(key)
+        except Exception:
+            _encoders[key] = tiktoken.get_encoding("cl100k_base")
+    return _encoders[key]
+
+
+def estimate_tokens(text: str, model: Optional[str] = None) -> int:
+    """
+    Estimate the token count of text.
+
+    Args:
+        text: Text to measure
+        model: Model name used to select the tiktoken encoding
+
+    Returns:
+        Token count (exact with tiktoken, ~chars/4 otherwise)
+    """
+    if not text:
+        return 0
+    if TIKTOKEN_AVAILABLE:
+        try:
+            return len(_get_encoder(model).encode(text))
+        except Exception:
+            pass
+    return (len(text) + 3) // 4
+
+
+# =============================================================================
+# Message Formatting
+# =============================================================================
+
+
+def format_message_for_aios(msg: dict[str, Any]) -> dict[str, Any]:
+    """
+    Format one AgentInstance history entry for the OpenAI chat API.
+
+    Args:
+        msg: History entry (role, content, optional tool_calls/tool_call_id)
+
+    Returns:
+        Message dict without internal metadata
+    """
+    if msg["role"] == "tool":
+        return {
+            "role": "tool",
+            "tool_call_id": msg.get("tool_call_id", ""),
+            "content": msg["content"],
+        }
+    if msg["role"] == "assistant" and msg.get("tool_calls"):
+        # OpenAI requires content to be a string (empty string if no content)
+        return {
+            "role": "assistant",
+            "content": msg.get("content") or "",
+            "tool_calls": msg["tool_calls"],
+        }
+    return {"role": msg["role"], "content": msg["content"]}
+
+
+def _message_tokens(message: dict[str, Any], model: Optional[str]) -> int:
+    tokens = MESSAGE_OVERHEAD_TOKENS + estimate_tokens(
+        message.get("content") or "", model
+    )
+    if message.get("tool_calls"):
+        tokens += estimate_tokens(json.dumps(message["tool_calls"], default=str), model)
+    return tokens
+
+
+# =============================================================================
+# Context Window
+# =============================================================================
+
+
+@dataclass
+class ContextWindowStats:
+    """Token accounting for the most recent build."""
+
+    budget: int = 0
+    prefix_tokens: int = 0
+    full_tokens: int = 0
+    sent_tokens: int = 0
+    tokens_saved: int = 0
+    total_tokens_saved: int = 0
+    messages_total: int = 0
+    messages_sent: int = 0
+    tool_results_elided: int = 0
+    messages_summarized: int = 0
+    messages_dropped: int = 0
+    over_budget: bool = False
+    strategy: str = ContextTrimStrategy.DROP_TOOL_RESULTS.value
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+class ContextWindow:
+    """
+    Incrementally built, token-budgeted message window.
+
+    Owned by a single AgentInstance. History is append-only, so entries are
+    formatted and measured once; a build only re-runs the (cheap, integer)
+    budget pass, and is skipped entirely when nothing was appended.
+    """
+
+    def __init__(
+        self,
+        model: Optional[str] = None,
+        token_budget: Optional[int] = None,
+        strategy: ContextTrimStrategy | str = ContextTrimStrategy.DROP_TOOL_RESULTS,
+        keep_recent: int = DEFAULT_KEEP_RECENT,
+    ):
+        """
+        Initialize the window.
+
+        Args:
+            model: Model name (selects the default budget and tokenizer)
+            token_budget: Prompt token budget (defaults to the model budget)
+            strategy: Trim strategy used when the window is over budget
+            keep_recent: Most recent messages that are always sent verbatim
+        """
+        self._model = model
+        self._budget = token_budget or get_model_token_budget(model)
+        self._strategy = ContextTrimStrategy(strategy)
+        self._keep_recent = max(keep_recent, 1)
+
+        self._messages: list[dict[str, Any]] = []
+        self._tokens: list[int] = []
+        self._full_tokens = 0
+
+        self._prefix: Optional[str] = None
+        self._prefix_tokens = 0
+
+        self._built_key: Optional[tuple[int, int]] = None
+        self._built: list[dict[str, Any]] = []
+        self._summaries: dict[int, tuple[dict[str, Any], int]] = {}
+        self._stats = ContextWindowStats(
+            budget=self._budget, strategy=self._strategy.value
+        )
+
+    @property
+    def budget(self) -> int:
+        """Get the prompt token budget."""
+        return self._budget
+
+    @property
+    def stats(self) -> ContextWindowStats:
+        """Get token accounting for the most recent build."""
+        return self._stats
+
+    def prefix(
+        self,
+        build: Callable[[], str],
+        measure: Optional[Callable[[str], int]] = None,
+    ) -> str:
+        """
+        Get the system prompt, building and measuring it on first use.
+
+        Args:
+            build: Callable producing the enriched system prompt
+            measure: Token counter for the prompt (defaults to
+                estimate_tokens); lets callers reuse a precomputed count
+                for a static prefix
+        """
+        if self._prefix is None:
+            self._prefix = build()
+            if measure is not None:
+                self._prefix_tokens = measure(self._prefix)
+            else:
+                self._prefix_tokens = estimate_tokens(self._prefix, self._model)
+        return self._prefix
+
+    def sync(self, history: list[dict[str, Any]]) -> int:
+        """
+        Format and measure history entries appended since the last sync.
+
+        Args:
+            history: The owning instance's append-only history
+
+        Returns:
+            Number of newly processed entries
+        """
+        start = len(self._messages)
+        for msg in history[start:]:
+            formatted = format_message_for_aios(msg)
+            tokens = _message_tokens(formatted, self._model)
+            self._messages.append(formatted)
+            self._tokens.append(tokens)
+            self._full_tokens += tokens
+        return len(self._messages) - start
+
+    def build(self, reserved_tokens: int = 0) -> list[dict[str, Any]]:
+        """
+        Build the message list to send, trimmed to the budget.
+
+        Args:
+            reserved_tokens: Tokens needed outside the messages (tool
+                definitions, response max_tokens)
+
+        Returns:
+            Messages formatted for AIOS. Dicts are shared with the window
+            cache and must not be mutated.
+        """
+        key = (len(self._messages), reserved_tokens)
+        if key == self._built_key:
+            return list(self._built)
+
+        available = self._budget - self._prefix_tokens - reserved_tokens
+        stats = ContextWindowStats(
+            budget=self._budget,
+            prefix_tokens=self._prefix_tokens,
+            full_tokens=self._prefix_tokens + self._full_tokens,
+            messages_total=len(self._messages),
+            strategy=self._strategy.value,
+            total_tokens_saved=self._stats.total_tokens_saved,
+        )
+
+        if self._full_tokens <= available or self._strategy == ContextTrimStrategy.NONE:
+            messages = list(self._messages)
+            sent = self._full_tokens
+        else:
+            messages, sent = self._trim(available, stats)
+
+        stats.sent_tokens = self._prefix_tokens + sent
+        stats.tokens_saved = stats.full_tokens - stats.sent_tokens
+        stats.total_tokens_saved += stats.tokens_saved
+        stats.messages_sent = len(messages)
+        stats.over_budget = sent > available
+
+        if stats.tokens_saved:
+            logger.debug(
+                "context_window_trimmed",
+                strategy=self._strategy.value,
+                full_tokens=stats.full_tokens,
+                sent_tokens=stats.sent_tokens,
+                tokens_saved=stats.tokens_saved,
+            )
+        if stats.over_budget:
+            logger.warning(
+                "context_window_over_budget",
+                budget=self._budget,
+                sent_tokens=stats.sent_tokens,
+                reserved_tokens=reserved_tokens,
+            )
+
+        self._stats = stats
+        self._built_key = key
+        self._built = messages
+        return list(messages)
+
+    # -------------------------------------------------------------------------
+    # Trimming
+    # -------------------------------------------------------------------------
+
+    def _trim(
+        self, available: int, stats: ContextWindowStats
+    ) -> tuple[list[dict[str, Any]], int]:
+        """Apply the configured strategy; returns (messages, message tokens)."""
+        count = len(self._messages)
+        protected = max(count - self._keep_recent, 1)
+        # Never split a tool-call group: protect the assistant message that
+        # owns tool results at the start of the kept tail
+        while protected > 1 and self._messages[protected]["role"] == "tool":
+            protected -= 1
+
+        # The first message (the task) is always kept; cut points never land
+        # on a tool message so tool results stay paired with their tool_calls
+        cut = 1
+        summary: Optional[tuple[dict[str, Any], int]] = None
+        tokens = list(self._tokens)
+        total = self._full_tokens
+
+        if self._strategy == ContextTrimStrategy.SUMMARIZE:
+            cut, summary = self._summarize_prefix(available, protected)
+            if summary is not None:
+                stats.messages_summarized = cut - 1
+                total = tokens[0] + summary[1] + sum(tokens[cut:])
+
+        # Elide the oldest tool results first
+        elided: set[int] = set()
+        for i in range(cut, protected):
+            if total <= available:
+                break
+            if self._messages[i]["role"] != "tool":
+                continue
+            if tokens[i] <= _ELIDED_TOKENS:
+                continue
+            total -= tokens[i] - _ELIDED_TOKENS
+            tokens[i] = _ELIDED_TOKENS
+            elided.add(i)
+        stats.tool_results_elided = len(elided)
+
+        # Still over budget: drop the oldest turns
+        drop_to = cut
+        while total > available and drop_to < protected:
+            total -= tokens[drop_to]
+            drop_to += 1
+            while drop_to < protected and self._messages[drop_to]["role"] == "tool":
+                total -= tokens[drop_to]
+                drop_to += 1
+        stats.messages_dropped = drop_to - cut
+
+        messages = [self._messages[0]]
+        if summary is not None:
+            messages.append(summary[0])
+        for i in range(drop_to, count):
+            if i in elided:
+                messages.append(
+                    {
+                        "role": "tool",
+                        "tool_call_id": self._messages[i].get("tool_call_id", ""),
+                        "content": ELIDED_TOOL_RESULT.format(tokens=self._tokens[i]),
+                    }
+                )
+            else:
+                messages.append(self._messages[i])
+        return messages, total
+
+    def _summarize_prefix(
+        self, available: int, protected: int
+    ) -> tuple[int, Optional[tuple[dict[str, Any], int]]]:
+        """
+        Choose how many of the oldest messages to summarize.
+
+        Keeps as many recent messages verbatim as fit in the budget and
+        summarizes messages[1:cut]. Summaries are cached per cut point.
+
+        Returns:
+            Tuple of (cut index, (summary message, tokens) or None)
+        """
+        summary_reserve = max(available // 10, 64)
+        remaining = available - self._tokens[0] - summary_reserve
+        cut = len(self._messages)
+        while cut > 1 and remaining - self._tokens[cut - 1] >= 0:
+            remaining -= self._tokens[cut - 1]
+            cut -= 1
+        cut = min(cut, protected)
+        while cut < protected and self._messages[cut]["role"] == "tool":
+            cut += 1
+        if cut <= 1:
+            return 1, None
+
+        if cut not in self._summaries:
+            self._summaries[cut] = self._summarize(self._messages[1:cut])
+        return cut, self._summaries[cut]
+
+    def _summarize(
+        self, messages: list[dict[str, Any]]
+    ) -> tuple[dict[str, Any], int]:
+        """Extractive summary of messages via the memory consolidation extractor."""
+        from core.memory.virtual_context import extract_facts
+
+        lines = [SUMMARY_HEADER.format(count=len(messages))]
+        for msg in messages:
+            facts = extract_facts(msg.get("content") or "", limit=3)
+            if facts:
+                lines.extend(f"- {msg['role']}: {fact}" for fact in facts)
+            elif msg.get("tool_calls"):
+                names = [
+                    c.get("function", {}).get("name", "?") for c in msg["tool_calls"]
+                ]
+                lines.append(f"- assistant called: {', '.join(names)}")
+        message = {"role": "user", "content": "\n".join(lines)}
+        return message, _message_tokens(message, self._model)
+
+
+__all__ = [
+    "ContextTrimStrategy",
+    "ContextWindow",
+    "ContextWindowStats",
+    "DEFAULT_CONTEXT_BUDGET",
+    "MODEL_CONTEXT_BUDGETS",
+    "TIKTOKEN_AVAILABLE",
+    "estimate_tokens",
+    "format_message_for_aios",
+    "get_model_token_budget",
+]
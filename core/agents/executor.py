@@ -9,24 +9,29 @@ Key responsibilities:
 - Instantiate agents based on registered configurations
 - Bind governance-approved tools to agent instances
 - Run the execution loop (reasoning <-> tool_use state machine)
-- Dispatch tool calls through the tool registry
-- Store reasoning traces and results via memory substrate
+- Dispatch tool calls through the tool registry (independent read-only
+  calls from one reasoning turn run concurrently)
+- Store reasoning traces and results via memory substrate (batched and
+  sampled per agent through TraceSink, off the loop's critical path)
+- Forward streamed reasoning deltas to an optional per-task event sink
+  (WebSocket / Slack clients)
 
 This module does NOT:
 - Define agent personalities or core reasoning (AIOS does that)
 - Approve or deny tool usage (Governance Engine does that)
 - Create new database tables
 
-Version: 1.0.0
+Version: 1.3.0
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
 import os
 import structlog
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Protocol
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Protocol
 from uuid import UUID, uuid4
 
 from core.agents.schemas import (
@@ -41,8 +46,10 @@ from core.agents.schemas import (
     ToolCallResult,
     ToolBinding,
 )
-from core.agents.agent_instance import AgentInstance
-from memory.substrate_models import PacketEnvelopeIn, PacketMetadata
+from core.agents.agent_instance import AgentInstance, ToolDefinitionSet
+from core.agents.trace_sink import TraceSink
+from core.schemas.ws_event_stream import EventMessage, EventType
+from memory.substrate_models import PacketEnvelopeIn
 from core.governance.approvals import ApprovalManager
 from core.tools.tool_graph import ToolGraph
 from core.worldmodel.insight_emitter import get_insight_emitter
@@ -149,6 +156,42 @@ async def _generate_tasks_from_query(query: str) -> List[Dict[str, Any]]:
     return task_specs
 
 
+# =============================================================================
+# Parallel Tool Dispatch
+# =============================================================================
+
+# Default per-agent cap on concurrently dispatched tool calls
+DEFAULT_MAX_PARALLEL_TOOL_CALLS = 4
+
+# Receives streamed reasoning events (EventMessage) for a task, e.g. a
+# WebSocket sender or a coalescing Slack updater
+ReasoningEventSink = Callable[[EventMessage], Awaitable[None]]
+
+
+def _is_parallel_safe_tool(tool_def: Optional[dict[str, Any]]) -> bool:
+    """
+    Check whether a tool can run concurrently with its siblings.
+
+    Only tools the ToolGraph catalog explicitly marks read_only qualify. A
+    tool that is merely not destructive may still have side effects
+    (mcp_call_tool, neo4j_query), so it is dispatched one at a time, in
+    request order, like high-risk, approval-gated and uncatalogued tools.
+
+    Args:
+        tool_def: Catalog entry from ToolGraph.get_l_tool_catalog(), or None
+
+    Returns:
+        True if the tool may be dispatched in parallel
+    """
+    if tool_def is None or not tool_def.get("read_only"):
+        return False
+    if tool_def.get("is_destructive") or tool_def.get("requires_igor_approval"):
+        return False
+    if tool_def.get("scope") == "requires_igor_approval":
+        return False
+    return tool_def.get("risk_level", "low") != "high"
+
+
 # =============================================================================
 # Protocol Definitions (Interfaces)
 # =============================================================================
@@ -314,6 +357,8 @@ class AgentExecutorService:
         agent_registry: AgentRegistryProtocol,
         default_agent_id: Optional[str] = None,
         max_iterations: Optional[int] = None,
+        max_parallel_tool_calls: Optional[int] = None,
+        trace_sink: Optional[TraceSink] = None,
     ):
         """
         Initialize the executor service.
@@ -325,6 +370,10 @@ class AgentExecutorService:
             agent_registry: Agent registry for configs
             default_agent_id: Default agent ID (from env if not provided)
             max_iterations: Max iterations (from env if not provided)
+            max_parallel_tool_calls: Per-agent cap on concurrent tool
+                dispatches (from env if not provided)
+            trace_sink: Batched packet emitter (created over
+                substrate_service if not provided)
         """
         self._aios_runtime = aios_runtime
         self._tool_registry = tool_registry
@@ -338,6 +387,22 @@ class AgentExecutorService:
         self._max_iterations = max_iterations or int(
             os.getenv("AGENT_MAX_ITERATIONS", "10")
         )
+        self._max_parallel_tool_calls = max(
+            1,
+            max_parallel_tool_calls
+            or int(
+                os.getenv(
+                    "AGENT_MAX_PARALLEL_TOOL_CALLS",
+                    str(DEFAULT_MAX_PARALLEL_TOOL_CALLS),
+                )
+            ),
+        )
+
+        # Per-agent semaphores bounding concurrent tool dispatch
+        self._tool_call_semaphores: dict[str, asyncio.Semaphore] = {}
+
+        # Trace packets are buffered and written in batches off the loop
+        self._trace_sink = trace_sink or TraceSink(substrate_service)
 
         # Idempotency cache
         # LIMITATION: In-memory only - cleared on process restart.
@@ -349,9 +414,11 @@ class AgentExecutorService:
         self._kernel_aware_agent: Optional[Any] = None
 
         logger.info(
-            "agent.executor.init: default_agent_id=%s, max_iterations=%d",
+            "agent.executor.init: default_agent_id=%s, max_iterations=%d, "
+            "max_parallel_tool_calls=%d",
             self._default_agent_id,
             self._max_iterations,
+            self._max_parallel_tool_calls,
         )
 
     def set_kernel_aware_agent(self, agent: Any) -> None:
@@ -397,6 +464,7 @@ class AgentExecutorService:
     async def start_agent_task(
         self,
         task: AgentTask,
+        event_sink: Optional[ReasoningEventSink] = None,
     ) -> ExecutionResult | DuplicateTaskResponse:
         """
         Start executing an agent task.
@@ -405,6 +473,10 @@ class AgentExecutorService:
 
         Args:
             task: The task to execute
+            event_sink: Optional receiver for streamed reasoning events
+                (REASONING_DELTA / TOOL_CALL_DELTA). When provided and the
+                AIOS runtime supports streaming, token deltas are forwarded
+                as they are generated.
 
         Returns:
             ExecutionResult or DuplicateTaskResponse if duplicate
@@ -426,6 +498,7 @@ class AgentExecutorService:
             logger.info("agent.executor.duplicate: task_id=%s", task_id_str)
             return DuplicateTaskResponse(task_id=task.id)
 
+        iterations = 0
         try:
             # Validate task
             validation_error = self._validate_task(task)
@@ -460,7 +533,8 @@ class AgentExecutorService:
             )
 
             # Run execution loop
-            result = await self._run_execution_loop(instance)
+            result = await self._run_execution_loop(instance, event_sink=event_sink)
+            iterations = result.iterations
 
             # Cache result for idempotency
             self._processed_tasks[dedupe_key] = result
@@ -526,6 +600,8 @@ class AgentExecutorService:
                 start_time,
                 "execution_error",
             )
+        finally:
+            await self._flush_traces(task_id_str, iterations)
 
     async def _bind_memory_context(self, task_id: str, agent_id: str) -> Dict[str, Any]:
         """
@@ -808,9 +884,23 @@ class AgentExecutorService:
 
         # Update config with approved tools
         config.tools = approved_tools
+        self._trace_sink.set_agent_sampling(task.agent_id, config.trace_sampling)
+
+        # Reuse the registry's precomputed OpenAI tool definitions if offered
+        tool_definitions = None
+        get_definitions = getattr(self._tool_registry, "get_tool_definition_set", None)
+        if callable(get_definitions):
+            tool_definitions = get_definitions(
+                agent_id=task.agent_id,
+                principal_id=task.source_id,
+            )
+            if not isinstance(tool_definitions, ToolDefinitionSet):
+                tool_definitions = None
 
         # Create instance
-        instance = AgentInstance(config=config, task=task)
+        instance = AgentInstance(
+            config=config, task=task, tool_definitions=tool_definitions
+        )
 
         # Load context from previous thread if exists
         await self._hydrate_context(instance)
@@ -905,6 +995,7 @@ class AgentExecutorService:
     async def _run_execution_loop(
         self,
         instance: AgentInstance,
+        event_sink: Optional[ReasoningEventSink] = None,
     ) -> ExecutionResult:
         """
         Run the main execution loop.
@@ -914,6 +1005,7 @@ class AgentExecutorService:
 
         Args:
             instance: Agent instance to run
+            event_sink: Optional receiver for streamed reasoning events
 
         Returns:
             ExecutionResult
@@ -1081,7 +1173,7 @@ class AgentExecutorService:
             # Call AIOS
             context = instance.assemble_context()
             try:
-                aios_result = await self._aios_runtime.execute_reasoning(context)
+                aios_result = await self._reason(instance, context, event_sink)
                 # Record success for circuit breaker (resets on non-error)
                 if aios_result.result_type != AIOSResultType.ERROR:
                     _aios_circuit_breaker.record_success()
@@ -1109,26 +1201,33 @@ class AgentExecutorService:
                 break
 
             elif aios_result.result_type == AIOSResultType.TOOL_CALL:
-                # Need to call a tool
+                # Need to call one or more tools
                 instance.transition_to(ExecutorState.TOOL_USE)
 
-                tool_call = aios_result.tool_call
-                if tool_call is None:
+                # tool_calls carries every call from the turn; tool_call is
+                # the first of them (older runtimes only set tool_call)
+                tool_calls = list(aios_result.tool_calls or [])
+                if not tool_calls and aios_result.tool_call is not None:
+                    tool_calls = [aios_result.tool_call]
+                if not tool_calls:
                     error = "AIOS returned tool_call type but no tool_call data"
                     instance.transition_to(ExecutorState.FAILED)
                     break
-                openai_tool_name = tool_call.tool_id
-                resolved_tool_id = instance.resolve_tool_id(openai_tool_name)
-                if resolved_tool_id != tool_call.tool_id:
-                    logger.warning(
-                        "tool_call_name_resolved",
-                        task_id=str(task.id),
-                        tool_name=tool_call.tool_id,
-                        tool_id=resolved_tool_id,
-                    )
-                    tool_call.tool_id = resolved_tool_id
 
-                # CRITICAL: Add assistant message with tool_calls BEFORE tool result
+                openai_tool_names: list[str] = []
+                for tool_call in tool_calls:
+                    openai_tool_names.append(tool_call.tool_id)
+                    resolved_tool_id = instance.resolve_tool_id(tool_call.tool_id)
+                    if resolved_tool_id != tool_call.tool_id:
+                        logger.warning(
+                            "tool_call_name_resolved",
+                            task_id=str(instance.task.id),
+                            tool_name=tool_call.tool_id,
+                            tool_id=resolved_tool_id,
+                        )
+                        tool_call.tool_id = resolved_tool_id
+
+                # CRITICAL: Add assistant message with tool_calls BEFORE tool results
                 # OpenAI requires: assistant (with tool_calls) → tool (with matching tool_call_id)
                 instance.add_assistant_message_with_tool_calls(
                     tool_calls=[
@@ -1140,22 +1239,26 @@ class AgentExecutorService:
                                 "arguments": json.dumps(tool_call.arguments),
                             },
                         }
+                        for tool_call, openai_tool_name in zip(
+                            tool_calls, openai_tool_names
+                        )
                     ],
                     content=None,  # Tool call messages typically have no content
                 )
 
-                # Dispatch tool call using tool_id
-                tool_result = await self._dispatch_tool_call(instance, tool_call)
-
-                # Add result to history using tool_id (canonical identity)
-                instance.add_tool_result(
-                    tool_id=tool_call.tool_id,
-                    call_id=str(tool_call.call_id),
-                    result=tool_result.result
-                    if tool_result.success
-                    else tool_result.error,
-                    success=tool_result.success,
-                )
+                # Dispatch tool calls using tool_id (independent calls run concurrently)
+                tool_results = await self._dispatch_tool_calls(instance, tool_calls)
+
+                # Add results to history in request order using tool_id (canonical identity)
+                for tool_call, tool_result in zip(tool_calls, tool_results):
+                    instance.add_tool_result(
+                        tool_id=tool_call.tool_id,
+                        call_id=str(tool_call.call_id),
+                        result=tool_result.result
+                        if tool_result.success
+                        else tool_result.error,
+                        success=tool_result.success,
+                    )
 
                 # Continue reasoning
                 instance.transition_to(ExecutorState.REASONING)
@@ -1260,10 +1363,100 @@ class AgentExecutorService:
     # Tool Dispatch
     # =========================================================================
 
+    def _get_tool_call_semaphore(self, agent_id: str) -> asyncio.Semaphore:
+        """Get (or create) the semaphore bounding an agent's tool dispatches."""
+        semaphore = self._tool_call_semaphores.get(agent_id)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self._max_parallel_tool_calls)
+            self._tool_call_semaphores[agent_id] = semaphore
+        return semaphore
+
+    async def _dispatch_tool_calls(
+        self,
+        instance: AgentInstance,
+        tool_calls: list[ToolCallRequest],
+    ) -> list[ToolCallResult]:
+        """
+        Dispatch every tool call from one reasoning turn.
+
+        Consecutive parallel-safe calls (see _is_parallel_safe_tool) are
+        dispatched concurrently, bounded by the per-agent semaphore. Any other
+        call acts as a barrier: it runs alone, after the calls requested
+        before it have finished. Results are returned in request order.
+
+        Args:
+            instance: Agent instance
+            tool_calls: Tool calls in the order the model requested them
+
+        Returns:
+            ToolCallResult per tool call, in the same order
+        """
+        semaphore = self._get_tool_call_semaphore(instance.config.agent_id)
+
+        if len(tool_calls) == 1:
+            async with semaphore:
+                return [await self._dispatch_tool_call(instance, tool_calls[0])]
+
+        # One catalog lookup for the whole turn instead of one per call
+        catalog = await ToolGraph.get_l_tool_catalog()
+        tool_defs = {t["name"]: t for t in catalog}
+
+        results: list[Optional[ToolCallResult]] = [None] * len(tool_calls)
+
+        async def _run(index: int) -> None:
+            async with semaphore:
+                results[index] = await self._dispatch_tool_call(
+                    instance, tool_calls[index], tool_defs=tool_defs
+                )
+
+        async def _run_batch(indices: list[int]) -> None:
+            outcomes = await asyncio.gather(
+                *(_run(i) for i in indices), return_exceptions=True
+            )
+            for index, outcome in zip(indices, outcomes):
+                if isinstance(outcome, BaseException):
+                    logger.error(
+                        "tool_dispatch_error: task_id=%s, tool_id=%s, error=%s",
+                        str(instance.task.id),
+                        tool_calls[index].tool_id,
+                        str(outcome),
+                    )
+                    results[index] = ToolCallResult(
+                        call_id=tool_calls[index].call_id,
+                        tool_id=tool_calls[index].tool_id,
+                        success=False,
+                        error=str(outcome),
+                    )
+
+        parallel = 0
+        pending: list[int] = []
+        for index, tool_call in enumerate(tool_calls):
+            if _is_parallel_safe_tool(tool_defs.get(tool_call.tool_id)):
+                pending.append(index)
+                continue
+            if pending:
+                parallel += len(pending)
+                await _run_batch(pending)
+                pending = []
+            await _run_batch([index])
+        if pending:
+            parallel += len(pending)
+            await _run_batch(pending)
+
+        logger.info(
+            "agent.executor.tool_calls.dispatched: task_id=%s, count=%d, parallel=%d",
+            str(instance.task.id),
+            len(tool_calls),
+            parallel,
+        )
+
+        return [r for r in results if r is not None]
+
     async def _dispatch_tool_call(
         self,
         instance: AgentInstance,
         tool_call: ToolCallRequest,
+        tool_defs: Optional[dict[str, dict[str, Any]]] = None,
     ) -> ToolCallResult:
         """
         Dispatch a tool call through the registry.
@@ -1273,6 +1466,8 @@ class AgentExecutorService:
         Args:
             instance: Agent instance
             tool_call: Tool call to dispatch (contains tool_id)
+            tool_defs: Optional ToolGraph catalog indexed by tool name
+                (fetched when not provided)
 
         Returns:
             ToolCallResult (includes tool_id for context re-entry)
@@ -1324,8 +1519,10 @@ class AgentExecutorService:
             )
 
         # Check if tool requires Igor approval
-        catalog = await ToolGraph.get_l_tool_catalog()
-        tool_def = next((t for t in catalog if t["name"] == tool_call.tool_id), None)
+        if tool_defs is None:
+            catalog = await ToolGraph.get_l_tool_catalog()
+            tool_defs = {t["name"]: t for t in catalog}
+        tool_def = tool_defs.get(tool_call.tool_id)
 
         if tool_def and tool_def.get("requires_igor_approval"):
             approval_manager = ApprovalManager(self._substrate_service)
@@ -1580,6 +1777,88 @@ class AgentExecutorService:
             },
         }
 
+    # =========================================================================
+    # Reasoning (optionally streamed)
+    # =========================================================================
+
+    async def _reason(
+        self,
+        instance: AgentInstance,
+        context: dict[str, Any],
+        event_sink: Optional[ReasoningEventSink],
+    ) -> AIOSResult:
+        """
+        Run one reasoning turn, streaming deltas to event_sink if possible.
+
+        Falls back to execute_reasoning when there is no sink or the
+        runtime does not implement stream_reasoning. A failing sink (e.g. a
+        disconnected client) stops forwarding but never fails the turn.
+
+        Args:
+            instance: Agent instance
+            context: Context bundle from instance.assemble_context()
+            event_sink: Optional receiver for streamed events
+
+        Returns:
+            AIOSResult for the turn
+        """
+        stream_reasoning = getattr(self._aios_runtime, "stream_reasoning", None)
+        if event_sink is None or not callable(stream_reasoning):
+            return await self._aios_runtime.execute_reasoning(context)
+
+        from core.aios.streaming import ReasoningDeltaType
+
+        task_id = str(instance.task.id)
+        agent_id = instance.task.agent_id
+        iteration = instance.iteration
+        sink: Optional[ReasoningEventSink] = event_sink
+        result: Optional[AIOSResult] = None
+
+        async for delta in stream_reasoning(context):
+            if delta.type == ReasoningDeltaType.DONE:
+                result = delta.result
+                continue
+            if sink is None:
+                continue
+
+            if delta.type == ReasoningDeltaType.TEXT:
+                event = EventMessage(
+                    type=EventType.REASONING_DELTA,
+                    agent_id=agent_id,
+                    correlation_id=task_id,
+                    payload={
+                        "task_id": task_id,
+                        "iteration": iteration,
+                        "text": delta.text,
+                    },
+                )
+            else:
+                event = EventMessage(
+                    type=EventType.TOOL_CALL_DELTA,
+                    agent_id=agent_id,
+                    correlation_id=task_id,
+                    payload={
+                        "task_id": task_id,
+                        "iteration": iteration,
+                        "index": delta.tool_index,
+                        "tool_name": delta.tool_name,
+                        "arguments_delta": delta.arguments_delta,
+                    },
+                )
+            try:
+                await sink(event)
+            except Exception as e:
+                logger.warning(
+                    "agent.executor.stream_sink_failed: task_id=%s, error=%s",
+                    task_id,
+                    str(e),
+                )
+                sink = None
+
+        if result is None:
+            return AIOSResult.error_result("Reasoning stream ended without a result")
+        return result
+
     # =========================================================================
     # Packet Emission (best-effort, non-blocking)
     # =========================================================================
@@ -1594,9 +1873,13 @@ class AgentExecutorService:
         Emit a packet to the memory substrate.
 
         BEHAVIOR: Best-effort, non-blocking.
+        - Packets are buffered in the TraceSink and written to the substrate
+          in batches by its background flusher; the executor loop never waits
+          on a substrate write. start_agent_task flushes the task's packets
+          before returning.
+        - Packets below the agent's trace sampling level are discarded.
         - Packet write failures are logged but do NOT stop execution.
         - This is intentional: execution must complete even if observability fails.
-        - Critical failures (e.g., substrate down) are logged at WARNING level.
 
         REQUIRED FIELDS (all packets include):
         - packet_type: Discriminator for packet routing
@@ -1614,20 +1897,7 @@ class AgentExecutorService:
             thread_id: Thread identifier
         """
         try:
-            # Use task.agent_id if available in payload, otherwise "agent.executor"
-            agent_id = payload.get("agent_id", "agent.executor")
-
-            packet = PacketEnvelopeIn(
-                packet_type=packet_type,
-                payload=payload,
-                thread_id=thread_id,
-                metadata=PacketMetadata(
-                    agent=agent_id,
-                    schema_version="1.0.0",
-                ),
-            )
-            await self._substrate_service.write_packet(packet)
-
+            self._trace_sink.emit(packet_type, payload, thread_id)
         except Exception as e:
             # Best-effort: log but don't fail execution
             logger.warning(
@@ -1637,6 +1907,43 @@ class AgentExecutorService:
                 str(e),
             )
 
+    async def _flush_traces(self, task_id: str, iterations: int) -> None:
+        """
+        Write a finished task's buffered packets and log the loop time saved.
+
+        Args:
+            task_id: Task identifier
+            iterations: Iterations the task ran (for per-iteration savings)
+        """
+        try:
+            await self._trace_sink.flush(task_id)
+        except Exception as e:
+            logger.warning(
+                "agent.executor.trace_flush_failed: task_id=%s, error=%s",
+                task_id,
+                str(e),
+            )
+        stats = self._trace_sink.pop_task_stats(task_id)
+        logger.debug(
+            "agent.executor.trace_flushed",
+            task_id=task_id,
+            packets=stats["emitted"],
+            sampled_out=stats["sampled_out"],
+            dropped=stats["dropped"],
+            ms_saved=stats["estimated_ms_saved"],
+            ms_saved_per_iteration=round(
+                stats["estimated_ms_saved"] / max(iterations, 1), 3
+            ),
+        )
+
+    def get_trace_stats(self) -> dict[str, Any]:
+        """Get TraceSink counters (emitted, sampled out, written, batches)."""
+        return self._trace_sink.get_stats()
+
+    async def close(self) -> None:
+        """Stop the trace flusher and write all buffered packets (shutdown)."""
+        await self._trace_sink.close()
+
     # =========================================================================
     # Self-Reflection (v3.4+ / GMP-KERNEL-BOOT)
     # =========================================================================
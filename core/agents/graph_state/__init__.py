@@ -26,6 +26,7 @@ from .schema import (
     LOAD_AGENT_STATE_QUERY,
     # UKG Phase 2: Shared queries for Tool Graph
     ENSURE_AGENT_QUERY,
+    ENSURE_AGENTS_QUERY,
     GET_AGENT_QUERY,
 )
 
@@ -41,6 +42,7 @@ __all__ = [
     "LOAD_AGENT_STATE_QUERY",
     # UKG Phase 2
     "ENSURE_AGENT_QUERY",
+    "ENSURE_AGENTS_QUERY",
     "GET_AGENT_QUERY",
 ]
 
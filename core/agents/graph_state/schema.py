@@ -229,6 +229,16 @@ RETURN a.agent_id as agent_id,
        a.created_at IS NOT NULL as created
 """
 
+# Bulk variant of ENSURE_AGENT_QUERY (Tool Graph bulk registration)
+ENSURE_AGENTS_QUERY = """
+UNWIND $agent_ids AS agent_id
+MERGE (a:Agent {agent_id: agent_id})
+ON CREATE SET
+    a.status = 'ACTIVE',
+    a.created_at = datetime(),
+    a.created_by = 'system'
+"""
+
 # Get agent by ID (for Tool Graph lookup)
 GET_AGENT_QUERY = """
 MATCH (a:Agent {agent_id: $agent_id})
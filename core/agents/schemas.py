@@ -19,7 +19,7 @@ from __future__ import annotations
 
 from datetime import datetime
 from enum import Enum
-from typing import Any, List, Optional
+from typing import Any, List, Literal, Optional
 from uuid import UUID, uuid4, uuid5, NAMESPACE_DNS
 
 from pydantic import BaseModel, Field
@@ -168,6 +168,11 @@ class AgentConfig(BaseModel):
         tools: List of tools bound to this agent
         system_prompt: Optional system prompt override
         kernel_refs: List of kernel YAML files for bootstrap ceremony
+        context_token_budget: Prompt token budget (defaults to the model budget)
+        context_strategy: How to trim an over-budget context window
+            (drop_tool_results, summarize, none)
+        trace_sampling: Which executor trace packets to persist
+            (all, summary_only, errors_only; AGENT_TRACE_SAMPLING if unset)
         metadata: Additional configuration metadata
     """
 
@@ -188,6 +193,15 @@ class AgentConfig(BaseModel):
     kernel_refs: list[str] = Field(
         default_factory=list, description="Kernel YAML files for bootstrap ceremony"
     )
+    context_token_budget: Optional[int] = Field(
+        None, ge=1000, description="Prompt token budget (defaults to model budget)"
+    )
+    context_strategy: Literal["drop_tool_results", "summarize", "none"] = Field(
+        default="drop_tool_results", description="Context window trim strategy"
+    )
+    trace_sampling: Optional[Literal["all", "summary_only", "errors_only"]] = Field(
+        None, description="Executor trace sampling level"
+    )
     metadata: dict[str, Any] = Field(
         default_factory=dict, description="Additional metadata"
     )
@@ -258,12 +272,13 @@ class AIOSResult(BaseModel):
     """
     Result from AIOS reasoning call.
 
-    Contains either a final response or a tool call request.
+    Contains either a final response or one or more tool call requests.
 
     Attributes:
         result_type: Type of result (response, tool_call, error)
         content: Response content if result_type is RESPONSE
-        tool_call: Tool call request if result_type is TOOL_CALL
+        tool_call: First tool call request if result_type is TOOL_CALL
+        tool_calls: Every tool call requested in the turn, in model order
         error: Error message if result_type is ERROR
         tokens_used: Total tokens used in this call
         finish_reason: LLM finish reason
@@ -274,6 +289,9 @@ class AIOSResult(BaseModel):
     tool_call: Optional[ToolCallRequest] = Field(
         None, description="Tool call if requested"
     )
+    tool_calls: List[ToolCallRequest] = Field(
+        default_factory=list, description="All tool calls requested in this turn"
+    )
     error: Optional[str] = Field(None, description="Error message")
     tokens_used: int = Field(default=0, ge=0, description="Tokens used")
     finish_reason: Optional[str] = Field(None, description="LLM finish reason")
@@ -295,9 +313,19 @@ class AIOSResult(BaseModel):
         cls, tool_call: ToolCallRequest, tokens_used: int = 0
     ) -> "AIOSResult":
         """Create a tool call result."""
+        return cls.tool_requests([tool_call], tokens_used=tokens_used)
+
+    @classmethod
+    def tool_requests(
+        cls, tool_calls: List[ToolCallRequest], tokens_used: int = 0
+    ) -> "AIOSResult":
+        """Create a tool call result carrying every call from one turn."""
+        if not tool_calls:
+            raise ValueError("tool_requests requires at least one tool call")
         return cls(
             result_type=AIOSResultType.TOOL_CALL,
-            tool_call=tool_call,
+            tool_call=tool_calls[0],
+            tool_calls=list(tool_calls),
             tokens_used=tokens_used,
             finish_reason="tool_calls",
         )
@@ -0,0 +1,436 @@
+"""
+L9 Core Agents - Trace Sink
+===========================
+
+Batched, asynchronous packet emission for AgentExecutorService.
+
+The executor used to await a substrate write (a full DAG run) for every
+trace packet: at the start of each iteration, around every tool call and
+after reflection. The TraceSink takes those writes off the loop's
+critical path:
+
+- emit() is synchronous and only appends to a per-task ring buffer
+- A background flusher drains the buffers and hands each batch to the
+  substrate in one call (MemorySubstrateService.write_packets, which still
+  runs the packets through the DAG one by one), falling back to sequential
+  write_packet calls for substrates without write_packets
+- flush(task_id) drains a task's buffer on demand (the executor calls it
+  once when a task finishes, so traces are durable when the result is
+  returned)
+- Sampling levels, configurable per agent, decide which packets are kept:
+    - all: every packet
+    - summary_only: start/result, escalations and errors
+    - errors_only: failures, escalations and approval requests only
+
+Packet timestamps are taken at emit time, so batching does not reorder or
+shift them.
+
+Version: 1.0.0
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Any, Optional
+from uuid import UUID
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_BUFFER_SIZE = 512
+DEFAULT_BATCH_SIZE = 64
+DEFAULT_FLUSH_INTERVAL_SECONDS = 0.25
+
+# Key for packets that carry no task_id (e.g. kernel evolution plans)
+_UNKEYED = ""
+
+
+class TraceSamplingLevel(str, Enum):
+    """Which trace packets an agent emits."""
+
+    ALL = "all"
+    SUMMARY_ONLY = "summary_only"
+    ERRORS_ONLY = "errors_only"
+
+
+class TraceClass(int, Enum):
+    """Importance of a packet, compared against the sampling level."""
+
+    DETAIL = 0
+    SUMMARY = 1
+    CRITICAL = 2
+
+
+_MIN_CLASS = {
+    TraceSamplingLevel.ALL: TraceClass.DETAIL,
+    TraceSamplingLevel.SUMMARY_ONLY: TraceClass.SUMMARY,
+    TraceSamplingLevel.ERRORS_ONLY: TraceClass.CRITICAL,
+}
+
+
+def classify_packet(packet_type: str, payload: dict[str, Any]) -> TraceClass:
+    """
+    Classify a packet for sampling.
+
+    Critical: escalations, failures and anything awaiting Igor's approval.
+    Summary: task start/result and kernel evolution plans.
+    Detail: everything else (per-iteration traces, tool dispatch).
+    """
+    if (
+        packet_type.endswith(".escalation")
+        or payload.get("status") == "failed"
+        or payload.get("error")
+        or payload.get("requires_igor_approval")
+    ):
+        return TraceClass.CRITICAL
+    if (
+        packet_type.endswith(".result")
+        or payload.get("event") == "start"
+        or packet_type.startswith("kernel.evolution")
+    ):
+        return TraceClass.SUMMARY
+    return TraceClass.DETAIL
+
+
+@dataclass
+class _BufferedPacket:
+    packet_type: str
+    payload: dict[str, Any]
+    thread_id: UUID
+    agent_id: str
+    timestamp: datetime
+
+
+@dataclass
+class _TaskTraceStats:
+    emitted: int = 0
+    sampled_out: int = 0
+    dropped: int = 0
+    enqueue_ms: float = 0.0
+
+
+@dataclass
+class TraceSinkStats:
+    """Aggregate TraceSink counters."""
+
+    emitted: int = 0
+    sampled_out: int = 0
+    dropped: int = 0
+    written: int = 0
+    failed: int = 0
+    batches: int = 0
+    buffered: int = 0
+    avg_write_ms_per_packet: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+class TraceSink:
+    """
+    Per-task ring buffers with a background batch flusher.
+
+    All methods are expected to run on one event loop (the executor's).
+    """
+
+    def __init__(
+        self,
+        substrate_service: Any,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        default_sampling: Optional[TraceSamplingLevel | str] = None,
+    ):
+        """
+        Initialize the sink.
+
+        Args:
+            substrate_service: Substrate with write_packet (and optionally
+                write_packets to hand over several packets per call)
+            buffer_size: Ring buffer capacity per task; the oldest packets
+                are dropped when a task's buffer overflows
+            batch_size: Max packets per substrate call; a full buffer
+                wakes the flusher early
+            flush_interval: Seconds between background flushes
+            default_sampling: Sampling level for agents without an
+                explicit one (from AGENT_TRACE_SAMPLING if not provided)
+        """
+        self._substrate = substrate_service
+        self._buffer_size = max(buffer_size, 1)
+        self._batch_size = max(batch_size, 1)
+        self._flush_interval = flush_interval
+        self._default_sampling = TraceSamplingLevel(
+            default_sampling
+            or os.getenv("AGENT_TRACE_SAMPLING", TraceSamplingLevel.ALL.value)
+        )
+
+        self._buffers: dict[str, deque[_BufferedPacket]] = {}
+        self._agent_sampling: dict[str, TraceSamplingLevel] = {}
+        self._task_stats: dict[str, _TaskTraceStats] = {}
+        self._stats = TraceSinkStats()
+
+        self._write_lock = asyncio.Lock()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._flusher: Optional[asyncio.Task] = None
+        self._closed = False
+
+    # -------------------------------------------------------------------------
+    # Configuration
+    # -------------------------------------------------------------------------
+
+    def set_agent_sampling(
+        self, agent_id: str, level: Optional[TraceSamplingLevel | str]
+    ) -> None:
+        """Set (or with None, reset) an agent's sampling level."""
+        if level is None:
+            self._agent_sampling.pop(agent_id, None)
+            return
+        try:
+            self._agent_sampling[agent_id] = TraceSamplingLevel(level)
+        except ValueError:
+            logger.warning(
+                "trace_sink.invalid_sampling_level", agent_id=agent_id, level=str(level)
+            )
+            self._agent_sampling.pop(agent_id, None)
+
+    def get_agent_sampling(self, agent_id: str) -> TraceSamplingLevel:
+        """Get an agent's effective sampling level."""
+        return self._agent_sampling.get(agent_id, self._default_sampling)
+
+    # -------------------------------------------------------------------------
+    # Emission
+    # -------------------------------------------------------------------------
+
+    def emit(
+        self,
+        packet_type: str,
+        payload: dict[str, Any],
+        thread_id: UUID,
+    ) -> bool:
+        """
+        Buffer a packet for batched writing. Never blocks, never raises.
+
+        Args:
+            packet_type: Type of packet (e.g., "agent.executor.trace")
+            payload: Packet payload (task_id and agent_id are used for
+                buffering and sampling)
+            thread_id: Thread identifier
+
+        Returns:
+            True if the packet was buffered, False if sampled out
+        """
+        start = time.perf_counter()
+        agent_id = payload.get("agent_id", "agent.executor")
+        task_key = str(payload.get("task_id") or _UNKEYED)
+        task_stats = self._task_stats.setdefault(task_key, _TaskTraceStats())
+
+        min_class = _MIN_CLASS[self.get_agent_sampling(agent_id)]
+        if classify_packet(packet_type, payload) < min_class:
+            task_stats.sampled_out += 1
+            self._stats.sampled_out += 1
+            return False
+
+        buffer = self._buffers.get(task_key)
+        if buffer is None:
+            buffer = self._buffers[task_key] = deque(maxlen=self._buffer_size)
+        if len(buffer) == self._buffer_size:
+            task_stats.dropped += 1
+            self._stats.dropped += 1
+            logger.warning(
+                "trace_sink.buffer_overflow",
+                task_id=task_key,
+                packet_type=buffer[0].packet_type,
+            )
+        buffer.append(
+            _BufferedPacket(
+                packet_type=packet_type,
+                payload=payload,
+                thread_id=thread_id,
+                agent_id=agent_id,
+                timestamp=datetime.utcnow(),
+            )
+        )
+        task_stats.emitted += 1
+        self._stats.emitted += 1
+
+        self._ensure_flusher()
+        if len(buffer) >= self._batch_size and self._wakeup is not None:
+            self._wakeup.set()
+
+        task_stats.enqueue_ms += (time.perf_counter() - start) * 1000
+        return True
+
+    # -------------------------------------------------------------------------
+    # Flushing
+    # -------------------------------------------------------------------------
+
+    async def flush(self, task_id: Optional[str] = None) -> int:
+        """
+        Write buffered packets now.
+
+        Args:
+            task_id: Flush only this task's packets (plus packets without
+                a task_id); None flushes everything
+
+        Returns:
+            Number of packets written successfully
+        """
+        if task_id is None:
+            keys = list(self._buffers)
+        else:
+            keys = [str(task_id), _UNKEYED]
+
+        written = 0
+        # Take the lock before popping: if a background flush already took
+        # these packets, wait until they are written before returning
+        async with self._write_lock:
+            batch: list[_BufferedPacket] = []
+            for key in keys:
+                buffer = self._buffers.pop(key, None)
+                if buffer:
+                    batch.extend(buffer)
+            for i in range(0, len(batch), self._batch_size):
+                written += await self._write_batch(batch[i : i + self._batch_size])
+        return written
+
+    async def close(self) -> None:
+        """Stop the background flusher and drain all buffers."""
+        self._closed = True
+        if self._flusher is not None:
+            self._flusher.cancel()
+            try:
+                await self._flusher
+            except asyncio.CancelledError:
+                pass
+            self._flusher = None
+        await self.flush()
+
+    def _ensure_flusher(self) -> None:
+        if self._closed:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        flusher = self._flusher
+        if flusher is not None and not flusher.done() and flusher.get_loop() is loop:
+            return
+        self._wakeup = asyncio.Event()
+        self._flusher = loop.create_task(self._flush_loop())
+
+    async def _flush_loop(self) -> None:
+        assert self._wakeup is not None
+        while not self._closed:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self._flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            if not self._buffers:
+                continue
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.warning("trace_sink.flush_failed", error=str(e))
+
+    async def _write_batch(self, batch: list[_BufferedPacket]) -> int:
+        from memory.substrate_models import PacketEnvelopeIn, PacketMetadata
+
+        packets = [
+            PacketEnvelopeIn(
+                packet_type=p.packet_type,
+                payload=p.payload,
+                thread_id=p.thread_id,
+                timestamp=p.timestamp,
+                metadata=PacketMetadata(agent=p.agent_id, schema_version="1.0.0"),
+            )
+            for p in batch
+        ]
+
+        start = time.perf_counter()
+        written = 0
+        # Only use write_packets when the substrate class implements it
+        # (mocks answer every attribute lookup)
+        if getattr(type(self._substrate), "write_packets", None) is not None:
+            try:
+                results = await self._substrate.write_packets(packets)
+                written = sum(
+                    1 for r in results if getattr(r, "status", "ok") != "error"
+                )
+            except Exception as e:
+                logger.warning(
+                    "trace_sink.batch_write_failed",
+                    batch_size=len(packets),
+                    error=str(e),
+                )
+        else:
+            for packet in packets:
+                try:
+                    await self._substrate.write_packet(packet)
+                    written += 1
+                except Exception as e:
+                    logger.warning(
+                        "agent.executor.packet_write_failed: packet_type=%s, thread_id=%s, error=%s",
+                        packet.packet_type,
+                        str(packet.thread_id),
+                        str(e),
+                    )
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        stats = self._stats
+        stats.batches += 1
+        stats.written += written
+        stats.failed += len(packets) - written
+        per_packet = elapsed_ms / len(packets)
+        # Exponential moving average of write cost per packet
+        stats.avg_write_ms_per_packet = (
+            per_packet
+            if stats.batches == 1
+            else 0.8 * stats.avg_write_ms_per_packet + 0.2 * per_packet
+        )
+        return written
+
+    # -------------------------------------------------------------------------
+    # Stats
+    # -------------------------------------------------------------------------
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get aggregate counters."""
+        self._stats.buffered = sum(len(b) for b in self._buffers.values())
+        return self._stats.to_dict()
+
+    def pop_task_stats(self, task_id: str) -> dict[str, Any]:
+        """
+        Get and forget a task's emission stats.
+
+        estimated_ms_saved is the substrate write time taken off the agent
+        loop: packets emitted or sampled out times the measured write cost
+        per packet, minus the time spent buffering them.
+        """
+        task_stats = self._task_stats.pop(str(task_id), _TaskTraceStats())
+        saved = (
+            task_stats.emitted + task_stats.sampled_out
+        ) * self._stats.avg_write_ms_per_packet - task_stats.enqueue_ms
+        return {
+            "emitted": task_stats.emitted,
+            "sampled_out": task_stats.sampled_out,
+            "dropped": task_stats.dropped,
+            "enqueue_ms": round(task_stats.enqueue_ms, 3),
+            "estimated_ms_saved": round(max(saved, 0.0), 3),
+        }
+
+
+__all__ = [
+    "TraceClass",
+    "TraceSamplingLevel",
+    "TraceSink",
+    "TraceSinkStats",
+    "classify_packet",
+]
@@ -0,0 +1,362 @@
+"""
+L9 Core AIOS - LLM Response Cache
+=================================
+
+Deterministic response cache and record/replay harness for AIOSRuntime.
+
+Completions are keyed by a canonical SHA-256 of everything that determines
+the response: model, messages, tools, tool_choice, temperature and
+max_tokens. Tool-call ids in the messages are random per run, so they are
+replaced by their position before hashing. Two tiers:
+
+- In-process LRU (OrderedDict)
+- Optional on-disk SQLite tier (stdlib sqlite3, accessed off the event
+  loop), shared across processes and runs
+
+Modes (AIOS_LLM_CACHE_MODE):
+- off: no caching (default)
+- read_write: serve and store deterministic calls (temperature <= 0)
+- record: call the LLM for every request and store every response
+- replay: serve every request from the cache and never call the LLM; a
+  miss is an error. Lets integration tests and load benchmarks run the
+  full agent loop offline against a recorded cache file.
+
+Responses are stored in a normalized, JSON-serializable form (content,
+tool calls, finish reason, token usage and the original call latency), so
+hits report the latency and tokens they saved.
+
+Version: 1.0.0
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from enum import Enum
+from typing import Any, Optional
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_CACHE_SIZE = 1024
+
+# Request fields that determine a completion
+_KEY_FIELDS = ("model", "messages", "tools", "tool_choice", "temperature", "max_tokens")
+
+
+class CacheMode(str, Enum):
+    """LLM response cache mode."""
+
+    OFF = "off"
+    READ_WRITE = "read_write"
+    RECORD = "record"
+    REPLAY = "replay"
+
+
+class ReplayMissError(LookupError):
+    """Raised in replay mode when a request has no recorded response."""
+
+
+def _normalize_tool_call_ids(messages: Any) -> Any:
+    """
+    Replace tool-call ids with their position in the conversation.
+
+    The ids fed back in assistant tool_calls and tool results are generated
+    per run, so hashing them raw would make every turn after the first
+    tool call miss.
+    """
+    if not isinstance(messages, list):
+        return messages
+
+    positions: dict[Any, str] = {}
+    normalized = []
+    for msg in messages:
+        if isinstance(msg, dict) and msg.get("tool_calls"):
+            msg = {
+                **msg,
+                "tool_calls": [
+                    {**call, "id": positions.setdefault(call.get("id"), f"call_{len(positions)}")}
+                    if isinstance(call, dict)
+                    else call
+                    for call in msg["tool_calls"]
+                ],
+            }
+        elif isinstance(msg, dict) and msg.get("tool_call_id") in positions:
+            msg = {**msg, "tool_call_id": positions[msg["tool_call_id"]]}
+        normalized.append(msg)
+    return normalized
+
+
+def make_cache_key(request: dict[str, Any]) -> str:
+    """
+    Canonical hash of a chat completion request.
+
+    Dict key order, JSON whitespace and tool-call ids do not affect the key.
+
+    Args:
+        request: chat.completions.create kwargs
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    fields = {field: request.get(field) for field in _KEY_FIELDS}
+    fields["messages"] = _normalize_tool_call_ids(fields["messages"])
+    canonical = json.dumps(
+        fields,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def normalize_completion(response: Any, latency_ms: float) -> dict[str, Any]:
+    """
+    Convert an OpenAI chat completion into the cached representation.
+
+    Args:
+        response: ChatCompletion returned by the OpenAI client
+        latency_ms: Wall time of the LLM call
+
+    Returns:
+        Dict with content, tool_calls, finish_reason, total_tokens, latency_ms
+    """
+    choice = response.choices[0]
+    message = choice.message
+    tool_calls = [
+        {
+            "id": getattr(tool_call, "id", None),
+            "name": tool_call.function.name,
+            "arguments": tool_call.function.arguments,
+        }
+        for tool_call in (message.tool_calls or [])
+    ]
+    return {
+        "content": message.content,
+        "tool_calls": tool_calls,
+        "finish_reason": choice.finish_reason,
+        "total_tokens": response.usage.total_tokens if response.usage else 0,
+        "latency_ms": latency_ms,
+    }
+
+
+# =============================================================================
+# SQLite Tier
+# =============================================================================
+
+
+class _SQLiteStore:
+    """Blocking key/value store; call through asyncio.to_thread."""
+
+    def __init__(self, path: str):
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_responses ("
+                "key TEXT PRIMARY KEY, model TEXT, response TEXT NOT NULL, "
+                "created_at REAL NOT NULL)"
+            )
+            self._conn.commit()
+
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM llm_responses WHERE key = ?", (key,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, key: str, model: str, response: dict[str, Any]) -> None:
+        payload = json.dumps(response)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_responses (key, model, response, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, model, payload, time.time()),
+            )
+            self._conn.commit()
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_responses")
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+# =============================================================================
+# Response Cache
+# =============================================================================
+
+
+class LLMResponseCache:
+    """
+    Two-tier (LRU + SQLite) cache of normalized LLM responses.
+    """
+
+    def __init__(
+        self,
+        mode: CacheMode | str = CacheMode.READ_WRITE,
+        max_size: int = DEFAULT_CACHE_SIZE,
+        path: Optional[str] = None,
+        max_temperature: float = 0.0,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            mode: Cache mode (see module docstring)
+            max_size: In-process LRU capacity
+            path: SQLite file for the persistent tier (memory only if None)
+            max_temperature: Highest temperature treated as deterministic
+                in read_write mode
+        """
+        self._mode = CacheMode(mode)
+        self._max_size = max(max_size, 1)
+        self._max_temperature = max_temperature
+        self._memory: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._store = _SQLiteStore(path) if path else None
+        self._path = path
+
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._stores = 0
+        self._latency_saved_ms = 0.0
+        self._tokens_saved = 0
+
+    @classmethod
+    def from_env(cls) -> Optional["LLMResponseCache"]:
+        """
+        Build a cache from AIOS_LLM_CACHE_MODE / _PATH / _SIZE.
+
+        Returns:
+            LLMResponseCache, or None when the mode is off
+        """
+        mode = CacheMode(os.getenv("AIOS_LLM_CACHE_MODE", CacheMode.OFF.value))
+        if mode == CacheMode.OFF:
+            return None
+        return cls(
+            mode=mode,
+            max_size=int(os.getenv("AIOS_LLM_CACHE_SIZE", str(DEFAULT_CACHE_SIZE))),
+            path=os.getenv("AIOS_LLM_CACHE_PATH") or None,
+        )
+
+    @property
+    def mode(self) -> CacheMode:
+        """Get cache mode."""
+        return self._mode
+
+    def is_cacheable(self, request: dict[str, Any]) -> bool:
+        """Whether a request should be served from / stored in the cache."""
+        if self._mode == CacheMode.OFF:
+            return False
+        if self._mode == CacheMode.READ_WRITE:
+            temperature = request.get("temperature")
+            return temperature is not None and temperature <= self._max_temperature
+        return True
+
+    async def get(self, key: str) -> Optional[dict[str, Any]]:
+        """
+        Look up a response (LRU first, then SQLite).
+
+        Records the latency and tokens a hit saved.
+        """
+        response = self._memory.get(key)
+        if response is not None:
+            self._memory.move_to_end(key)
+            self._memory_hits += 1
+        elif self._store is not None:
+            response = await asyncio.to_thread(self._store.get, key)
+            if response is not None:
+                self._disk_hits += 1
+                self._remember(key, response)
+
+        if response is None:
+            self._misses += 1
+            return None
+
+        self._latency_saved_ms += response.get("latency_ms", 0.0)
+        self._tokens_saved += response.get("total_tokens", 0)
+        return response
+
+    async def put(self, key: str, model: str, response: dict[str, Any]) -> bool:
+        """
+        Store a response in both tiers.
+
+        Returns:
+            False if the response is not JSON-serializable (not cached)
+        """
+        try:
+            json.dumps(response)
+        except (TypeError, ValueError):
+            logger.warning("llm_cache.unserializable_response", key=key[:12])
+            return False
+
+        self._remember(key, response)
+        if self._store is not None:
+            await asyncio.to_thread(self._store.put, key, model, response)
+        self._stores += 1
+        return True
+
+    def _remember(self, key: str, response: dict[str, Any]) -> None:
+        self._memory[key] = response
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._max_size:
+            self._memory.popitem(last=False)
+
+    def get_cache_stats(self) -> dict[str, Any]:
+        """Get hit/miss counters and the latency and tokens saved."""
+        hits = self._memory_hits + self._disk_hits
+        lookups = hits + self._misses
+        return {
+            "mode": self._mode.value,
+            "size": len(self._memory),
+            "max_size": self._max_size,
+            "path": self._path,
+            "memory_hits": self._memory_hits,
+            "disk_hits": self._disk_hits,
+            "misses": self._misses,
+            "stores": self._stores,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "latency_saved_ms": round(self._latency_saved_ms, 3),
+            "tokens_saved": self._tokens_saved,
+        }
+
+    def clear_cache(self, persistent: bool = False) -> None:
+        """Clear the LRU tier (and the SQLite tier if persistent)."""
+        self._memory.clear()
+        if persistent and self._store is not None:
+            self._store.clear()
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        if self._store is not None:
+            self._store.close()
+            self._store = None
+
+
+__all__ = [
+    "CacheMode",
+    "LLMResponseCache",
+    "ReplayMissError",
+    "make_cache_key",
+    "normalize_completion",
+]
@@ -3,12 +3,14 @@ L9 Core AIOS - Runtime
 ======================
 
 The AIOS Runtime handles agent reasoning by calling the LLM with context
-and tools. It returns either a final response or a tool call request.
+and tools. It returns either a final response or the tool calls it requested.
 
 Key responsibilities:
 - Assemble messages from context
-- Call LLM with tool definitions
+- Call LLM with tool definitions (optionally streaming token deltas)
 - Parse response into AIOSResult
+- Serve repeated deterministic calls (and offline replays) from the
+  LLM response cache
 - Handle errors gracefully
 
 This module does NOT:
@@ -16,7 +18,7 @@ This module does NOT:
 - Store packets (that's the executor's job)
 - Define agent personalities (those are loaded from registry)
 
-Version: 1.0.0
+Version: 1.2.0
 """
 
 from __future__ import annotations
@@ -24,8 +26,8 @@ from __future__ import annotations
 import json
 import structlog
 import os
-from datetime import datetime
-from typing import Any, Optional
+import time
+from typing import Any, AsyncIterator, Optional
 from uuid import UUID, uuid4
 
 from openai import AsyncOpenAI
@@ -35,6 +37,18 @@ from core.agents.schemas import (
     AIOSResultType,
     ToolCallRequest,
 )
+from core.aios.response_cache import (
+    CacheMode,
+    LLMResponseCache,
+    ReplayMissError,
+    make_cache_key,
+    normalize_completion,
+)
+from core.aios.streaming import (
+    ReasoningDelta,
+    ReasoningDeltaType,
+    ToolCallAssembler,
+)
 
 logger = structlog.get_logger(__name__)
 
@@ -92,6 +106,7 @@ class AIOSRuntime:
         temperature: float = 0.3,
         max_tokens: int = 4000,
         default_system_prompt: Optional[str] = None,
+        response_cache: Optional[LLMResponseCache] = None,
     ):
         """
         Initialize AIOS Runtime.
@@ -102,6 +117,8 @@ class AIOSRuntime:
             temperature: Default temperature
             max_tokens: Default max tokens
             default_system_prompt: Default system prompt
+            response_cache: LLM response cache (from AIOS_LLM_CACHE_* env
+                if not provided; disabled by default)
         """
         # Get API key (read at init, not import time per spec)
         self._api_key = api_key or os.getenv("OPENAI_API_KEY")
@@ -117,6 +134,9 @@ class AIOSRuntime:
         # Initialize client (lazy)
         self._client: Optional[AsyncOpenAI] = None
 
+        # Deterministic response cache / record-replay harness
+        self._response_cache = response_cache or LLMResponseCache.from_env()
+
         logger.info(
             "AIOSRuntime initialized: model=%s, temperature=%.1f, max_tokens=%d",
             self._model,
@@ -150,6 +170,46 @@ class AIOSRuntime:
             self._client = AsyncOpenAI(api_key=self._api_key)
         return self._client
 
+    def get_cache_stats(self) -> Optional[dict[str, Any]]:
+        """Get LLM response cache stats (None if caching is disabled)."""
+        if self._response_cache is None:
+            return None
+        return self._response_cache.get_cache_stats()
+
+    async def _complete(self, kwargs: dict[str, Any]) -> tuple[dict[str, Any], bool]:
+        """
+        Get a normalized completion, from the cache when possible.
+
+        Args:
+            kwargs: chat.completions.create kwargs
+
+        Returns:
+            Tuple of (normalized completion, served_from_cache)
+
+        Raises:
+            ReplayMissError: In replay mode, if no response was recorded
+        """
+        cache = self._response_cache
+        key: Optional[str] = None
+        if cache is not None and cache.is_cacheable(kwargs):
+            key = make_cache_key(kwargs)
+            cached = await cache.get(key)
+            if cached is not None:
+                return cached, True
+            if cache.mode == CacheMode.REPLAY:
+                raise ReplayMissError(f"No recorded LLM response for key {key[:12]}")
+
+        client = self._get_client()
+        start = time.perf_counter()
+        response = await client.chat.completions.create(**kwargs)
+        completion = normalize_completion(
+            response, latency_ms=(time.perf_counter() - start) * 1000
+        )
+
+        if key is not None:
+            await cache.put(key, kwargs["model"], completion)
+        return completion, False
+
     # =========================================================================
     # Main API
     # =========================================================================
@@ -167,26 +227,143 @@ class AIOSRuntime:
             context: Context bundle from AgentInstance.assemble_context()
                 - system_prompt: Optional system prompt override
                 - messages: Conversation history
+                - messages_prepared: True if messages are already API-formatted
                 - tools: Available tool definitions
                 - task: Current task info
                 - metadata: Agent metadata
 
         Returns:
-            AIOSResult with response or tool call
+            AIOSResult with response or every requested tool call
+        """
+        try:
+            kwargs, metadata = self._build_request(context)
+
+            # Call LLM (or serve from the response cache)
+            completion, cached = await self._complete(kwargs)
+            return self._build_result(completion, cached, metadata)
+
+        except Exception as e:
+            logger.exception("AIOS reasoning failed: %s", str(e))
+            return AIOSResult.error_result(str(e))
+
+    async def stream_reasoning(
+        self,
+        context: dict[str, Any],
+    ) -> AsyncIterator[ReasoningDelta]:
         """
-        start_time = datetime.utcnow()
+        Execute reasoning, yielding the response as it is generated.
+
+        Same contract as execute_reasoning, but yields TEXT deltas and
+        TOOL_CALL fragments as the LLM streams them, then exactly one DONE
+        delta carrying the AIOSResult. Cache hits are yielded as a single
+        TEXT delta.
+
+        Args:
+            context: Context bundle from AgentInstance.assemble_context()
 
+        Yields:
+            ReasoningDelta events, ending with DONE
+        """
         try:
-            # Extract context
-            system_prompt = context.get("system_prompt") or self._default_system_prompt
-            messages = context.get("messages", [])
-            tools = context.get("tools", [])
-            metadata = context.get("metadata", {})
+            kwargs, metadata = self._build_request(context)
+
+            cache = self._response_cache
+            key: Optional[str] = None
+            if cache is not None and cache.is_cacheable(kwargs):
+                key = make_cache_key(kwargs)
+                cached = await cache.get(key)
+                if cached is not None:
+                    if cached["content"]:
+                        yield ReasoningDelta(
+                            type=ReasoningDeltaType.TEXT, text=cached["content"]
+                        )
+                    yield ReasoningDelta(
+                        type=ReasoningDeltaType.DONE,
+                        result=self._build_result(cached, True, metadata),
+                    )
+                    return
+                if cache.mode == CacheMode.REPLAY:
+                    raise ReplayMissError(
+                        f"No recorded LLM response for key {key[:12]}"
+                    )
+
+            client = self._get_client()
+            start = time.perf_counter()
+            stream = await client.chat.completions.create(
+                **kwargs, stream=True, stream_options={"include_usage": True}
+            )
+
+            content: list[str] = []
+            assembler = ToolCallAssembler()
+            finish_reason: Optional[str] = None
+            total_tokens = 0
+            first_token_ms: Optional[float] = None
+
+            async for chunk in stream:
+                usage = getattr(chunk, "usage", None)
+                if usage is not None:
+                    total_tokens = usage.total_tokens or 0
+                if not chunk.choices:
+                    continue
+                choice = chunk.choices[0]
+                if choice.finish_reason:
+                    finish_reason = choice.finish_reason
+                delta = choice.delta
+                if delta is None:
+                    continue
+                if first_token_ms is None and (delta.content or delta.tool_calls):
+                    first_token_ms = (time.perf_counter() - start) * 1000
+                if delta.content:
+                    content.append(delta.content)
+                    yield ReasoningDelta(type=ReasoningDeltaType.TEXT, text=delta.content)
+                for fragment in delta.tool_calls or []:
+                    yield assembler.add(fragment)
+
+            completion = {
+                "content": "".join(content) or None,
+                "tool_calls": assembler.tool_calls(),
+                "finish_reason": finish_reason,
+                "total_tokens": total_tokens,
+                "latency_ms": (time.perf_counter() - start) * 1000,
+            }
+            logger.debug(
+                "AIOS stream complete: first_token_ms=%.1f, total_ms=%.1f",
+                first_token_ms or 0.0,
+                completion["latency_ms"],
+            )
+            if key is not None:
+                await cache.put(key, kwargs["model"], completion)
+
+            result = self._build_result(completion, False, metadata)
+
+        except Exception as e:
+            logger.exception("AIOS streaming reasoning failed: %s", str(e))
+            result = AIOSResult.error_result(str(e))
 
-            # Build messages list
-            api_messages = [{"role": "system", "content": system_prompt}]
+        yield ReasoningDelta(type=ReasoningDeltaType.DONE, result=result)
 
-            # Add conversation history
+    def _build_request(
+        self, context: dict[str, Any]
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """
+        Build chat.completions.create kwargs from a context bundle.
+
+        Returns:
+            Tuple of (request kwargs, context metadata)
+        """
+        system_prompt = context.get("system_prompt") or self._default_system_prompt
+        messages = context.get("messages", [])
+        tools = context.get("tools", [])
+        metadata = context.get("metadata", {})
+
+        # Build messages list
+        api_messages = [{"role": "system", "content": system_prompt}]
+
+        # Add conversation history (AgentInstance.assemble_context already
+        # formats messages; only foreign callers need normalizing)
+        if context.get("messages_prepared"):
+            api_messages.extend(messages)
+        else:
             for msg in messages:
                 if msg.get("role") == "tool":
                     # Tool results need special formatting
@@ -216,93 +393,125 @@ class AIOSRuntime:
                         }
                     )
 
-            # Get model params from metadata or use defaults
-            model = metadata.get("model", self._model)
-            temperature = metadata.get("temperature", self._temperature)
-            max_tokens = metadata.get("max_tokens", self._max_tokens)
-
-            # Build API call kwargs
-            kwargs: dict[str, Any] = {
-                "model": model,
-                "messages": api_messages,
-                "temperature": temperature,
-                "max_tokens": max_tokens,
-            }
+        # Get model params from metadata or use defaults
+        model = metadata.get("model", self._model)
+        temperature = metadata.get("temperature", self._temperature)
+        max_tokens = metadata.get("max_tokens", self._max_tokens)
 
-            # Add tools if available
-            if tools:
-                kwargs["tools"] = tools
-                kwargs["tool_choice"] = "auto"
+        # Build API call kwargs
+        kwargs: dict[str, Any] = {
+            "model": model,
+            "messages": api_messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        }
 
-            # Call LLM
-            client = self._get_client()
-            response = await client.chat.completions.create(**kwargs)
-
-            # Parse response
-            choice = response.choices[0]
-            message = choice.message
-            tokens_used = response.usage.total_tokens if response.usage else 0
-            finish_reason = choice.finish_reason
-
-            # Check for tool calls
-            if message.tool_calls and len(message.tool_calls) > 0:
-                # Extract first tool call (handle one at a time)
-                tool_call = message.tool_calls[0]
-
-                # Parse tool arguments
-                try:
-                    arguments = json.loads(tool_call.function.arguments)
-                except json.JSONDecodeError as e:
-                    # Fail loudly: explicit error logging and raise
-                    logger.error(
-                        "AIOS tool_call.json_decode_failed",
-                        tool_id=tool_call.function.name,
-                        raw_arguments=tool_call.function.arguments,
-                        error=str(e),
-                        exc_info=True,
-                    )
-                    raise ValueError(
-                        f"Failed to parse tool call arguments for {tool_call.function.name}: {str(e)}"
-                    ) from e
-
-                # Create tool call request
-                # function.name IS the tool_id (canonical identity)
-                tool_request = ToolCallRequest(
-                    call_id=uuid4(),  # Generate our own ID for tracking
-                    tool_id=tool_call.function.name,  # function.name == tool_id
-                    arguments=arguments,
-                    task_id=UUID(metadata.get("task_id", str(uuid4()))),
-                    iteration=metadata.get("iteration", 0),
-                )
-
-                logger.info(
-                    "AIOS tool call: tool_id=%s, arguments=%s",
-                    tool_request.tool_id,
-                    tool_request.arguments,
-                )
-
-                return AIOSResult.tool_request(tool_request, tokens_used=tokens_used)
-
-            # No tool call - return response
-            content = message.content or ""
+        # Add tools if available
+        if tools:
+            kwargs["tools"] = tools
+            kwargs["tool_choice"] = "auto"
 
+        return kwargs, metadata
+
+    def _build_result(
+        self,
+        completion: dict[str, Any],
+        cached: bool,
+        metadata: dict[str, Any],
+    ) -> AIOSResult:
+        """
+        Convert a normalized completion into an AIOSResult.
+
+        Args:
+            completion: Normalized completion (see normalize_completion)
+            cached: Whether it was served from the response cache
+            metadata: Context metadata (task_id, iteration)
+        """
+        # Cache hits consumed no tokens, except in replay mode, which
+        # reproduces the recorded run's accounting
+        tokens_used = completion["total_tokens"]
+        if cached:
             logger.debug(
-                "AIOS response: %d chars, %d tokens, finish=%s",
-                len(content),
+                "AIOS cache hit: saved %.1f ms, %d tokens",
+                completion.get("latency_ms", 0.0),
                 tokens_used,
-                finish_reason,
             )
-
-            return AIOSResult(
-                result_type=AIOSResultType.RESPONSE,
-                content=content,
-                tokens_used=tokens_used,
-                finish_reason=finish_reason,
+            if self._response_cache.mode != CacheMode.REPLAY:
+                tokens_used = 0
+        finish_reason = completion["finish_reason"]
+
+        # Check for tool calls
+        if completion["tool_calls"]:
+            # Keep every tool call from this turn - the executor decides
+            # which of them can be dispatched concurrently
+            task_id = UUID(metadata.get("task_id", str(uuid4())))
+            iteration = metadata.get("iteration", 0)
+            tool_requests = [
+                self._parse_tool_call(tool_call, task_id, iteration)
+                for tool_call in completion["tool_calls"]
+            ]
+
+            logger.info(
+                "AIOS tool calls: count=%d, tool_ids=%s",
+                len(tool_requests),
+                [r.tool_id for r in tool_requests],
             )
 
-        except Exception as e:
-            logger.exception("AIOS reasoning failed: %s", str(e))
-            return AIOSResult.error_result(str(e))
+            return AIOSResult.tool_requests(tool_requests, tokens_used=tokens_used)
+
+        # No tool call - return response
+        content = completion["content"] or ""
+
+        logger.debug(
+            "AIOS response: %d chars, %d tokens, finish=%s",
+            len(content),
+            tokens_used,
+            finish_reason,
+        )
+
+        return AIOSResult(
+            result_type=AIOSResultType.RESPONSE,
+            content=content,
+            tokens_used=tokens_used,
+            finish_reason=finish_reason,
+        )
+
+    def _parse_tool_call(
+        self,
+        tool_call: dict[str, Any],
+        task_id: UUID,
+        iteration: int,
+    ) -> ToolCallRequest:
+        """
+        Convert one normalized tool call (see normalize_completion) into a
+        ToolCallRequest.
+
+        Raises:
+            ValueError: If the tool call arguments are not valid JSON
+        """
+        try:
+            arguments = json.loads(tool_call["arguments"])
+        except json.JSONDecodeError as e:
+            # Fail loudly: explicit error logging and raise
+            logger.error(
+                "AIOS tool_call.json_decode_failed",
+                tool_id=tool_call["name"],
+                raw_arguments=tool_call["arguments"],
+                error=str(e),
+                exc_info=True,
+            )
+            raise ValueError(
+                f"Failed to parse tool call arguments for {tool_call['name']}: {str(e)}"
+            ) from e
+
+        # function.name IS the tool_id (canonical identity)
+        return ToolCallRequest(
+            call_id=uuid4(),  # Generate our own ID for tracking
+            tool_id=tool_call["name"],  # function.name == tool_id
+            arguments=arguments,
+            task_id=task_id,
+            iteration=iteration,
+        )
 
     # =========================================================================
     # Health Check
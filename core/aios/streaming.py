@@ -0,0 +1,163 @@
+"""
+L9 Core AIOS - Streaming
+========================
+
+Primitives for streaming reasoning out of AIOSRuntime.stream_reasoning:
+
+- ReasoningDelta: one streamed event (text delta, tool call delta, or the
+  final AIOSResult)
+- ToolCallAssembler: accumulates partial tool call chunks (OpenAI streams
+  id/name/arguments fragments keyed by index) into complete tool calls
+- DeltaCoalescer: batches text deltas for sinks that must not be updated
+  per token (e.g. Slack chat.update, which is rate limited)
+
+Version: 1.0.0
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Optional
+
+from core.agents.schemas import AIOSResult
+
+
+class ReasoningDeltaType(str, Enum):
+    """Kinds of streamed reasoning events."""
+
+    TEXT = "text"
+    TOOL_CALL = "tool_call"
+    DONE = "done"
+
+
+@dataclass
+class ReasoningDelta:
+    """
+    One event from AIOSRuntime.stream_reasoning.
+
+    Attributes:
+        type: Event kind
+        text: Text fragment (TEXT)
+        tool_index: Tool call position in the turn (TOOL_CALL)
+        tool_name: Tool name assembled so far (TOOL_CALL)
+        arguments_delta: Arguments JSON fragment (TOOL_CALL)
+        result: Final result of the turn (DONE)
+    """
+
+    type: ReasoningDeltaType
+    text: str = ""
+    tool_index: Optional[int] = None
+    tool_name: Optional[str] = None
+    arguments_delta: str = ""
+    result: Optional[AIOSResult] = None
+
+
+@dataclass
+class _PartialToolCall:
+    id: Optional[str] = None
+    name: str = ""
+    arguments: list[str] = field(default_factory=list)
+
+
+class ToolCallAssembler:
+    """Assemble streamed tool call fragments into complete tool calls."""
+
+    def __init__(self) -> None:
+        self._calls: dict[int, _PartialToolCall] = {}
+
+    def add(self, fragment: Any) -> ReasoningDelta:
+        """
+        Merge one streamed tool call fragment.
+
+        Args:
+            fragment: choices[0].delta.tool_calls[i] from a stream chunk
+
+        Returns:
+            TOOL_CALL delta describing the fragment
+        """
+        index = getattr(fragment, "index", None) or 0
+        call = self._calls.setdefault(index, _PartialToolCall())
+        if getattr(fragment, "id", None):
+            call.id = fragment.id
+
+        arguments_delta = ""
+        function = getattr(fragment, "function", None)
+        if function is not None:
+            if getattr(function, "name", None):
+                call.name += function.name
+            if getattr(function, "arguments", None):
+                arguments_delta = function.arguments
+                call.arguments.append(arguments_delta)
+
+        return ReasoningDelta(
+            type=ReasoningDeltaType.TOOL_CALL,
+            tool_index=index,
+            tool_name=call.name,
+            arguments_delta=arguments_delta,
+        )
+
+    def tool_calls(self) -> list[dict[str, Any]]:
+        """Completed tool calls, normalized like normalize_completion."""
+        return [
+            {
+                "id": call.id,
+                "name": call.name,
+                "arguments": "".join(call.arguments) or "{}",
+            }
+            for _, call in sorted(self._calls.items())
+        ]
+
+
+class DeltaCoalescer:
+    """
+    Accumulate text deltas and release them at most every min_interval
+    seconds (or once max_chars are pending).
+    """
+
+    def __init__(self, min_interval: float = 1.0, max_chars: int = 2000):
+        """
+        Args:
+            min_interval: Minimum seconds between releases
+            max_chars: Pending characters that force an early release
+        """
+        self._min_interval = min_interval
+        self._max_chars = max_chars
+        self._pending: list[str] = []
+        self._pending_chars = 0
+        self._last_release = 0.0
+
+    def add(self, text: str) -> Optional[str]:
+        """
+        Add a delta.
+
+        Returns:
+            The coalesced text to send now, or None to keep buffering
+        """
+        if text:
+            self._pending.append(text)
+            self._pending_chars += len(text)
+        now = time.monotonic()
+        if self._pending and (
+            now - self._last_release >= self._min_interval
+            or self._pending_chars >= self._max_chars
+        ):
+            self._last_release = now
+            return self.drain()
+        return None
+
+    def drain(self) -> str:
+        """Release everything pending."""
+        text = "".join(self._pending)
+        self._pending.clear()
+        self._pending_chars = 0
+        return text
+
+
+__all__ = [
+    "DeltaCoalescer",
+    "ReasoningDelta",
+    "ReasoningDeltaType",
+    "ToolCallAssembler",
+]
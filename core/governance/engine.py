@@ -6,22 +6,25 @@ Stateless policy evaluation engine with deny-by-default enforcement.
 
 The GovernanceEngineService:
 - Loads policies from YAML manifests on initialization
+- Compiles them into a PolicyIndex (subject / action / resource lookup)
 - Evaluates requests against policies (first-match-wins)
+- Memoizes context-free decisions in a bounded LRU cache
 - Enforces deny-by-default for unmatched requests
 - Emits evaluation traces to memory substrate
 
 This service is injected into other services (e.g., Tool Registry).
 It does NOT have its own API endpoint.
 
-Version: 1.0.0
+Version: 1.1.0
 """
 
 from __future__ import annotations
 
 import structlog
 import os
+from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Optional, Protocol
+from typing import Any, Iterable, Optional, Protocol
 
 from core.governance.schemas import (
     Policy,
@@ -30,9 +33,13 @@ from core.governance.schemas import (
     EvaluationResult,
 )
 from core.governance.loader import PolicyLoader, PolicyLoadError, InvalidPolicyError
+from core.governance.policy_index import PolicyIndex
 
 logger = structlog.get_logger(__name__)
 
+# Default number of memoized (subject, action, resource) decisions
+DEFAULT_DECISION_CACHE_SIZE = 10000
+
 
 # =============================================================================
 # Substrate Protocol (for optional tracing)
@@ -59,6 +66,10 @@ class GovernanceEngineService:
     Evaluates requests against loaded policies using first-match-wins strategy.
     Enforces deny-by-default: any request not explicitly allowed is denied.
 
+    Policies are compiled into a PolicyIndex at load time. Decisions that no
+    conditional policy took part in are memoized per (subject, action,
+    resource); reload_policies rebuilds the index and drops the cache.
+
     Attributes:
         policy_count: Number of loaded policies
         default_effect: Effect to apply when no policy matches
@@ -69,6 +80,7 @@ class GovernanceEngineService:
         policy_dir: Optional[str] = None,
         default_effect: PolicyEffect = PolicyEffect.DENY,
         substrate_service: Optional[SubstrateProtocol] = None,
+        decision_cache_size: Optional[int] = None,
     ) -> None:
         """
         Initialize the governance engine.
@@ -77,6 +89,8 @@ class GovernanceEngineService:
             policy_dir: Directory containing policy YAML files (from env if None)
             default_effect: Effect when no policy matches (default: DENY)
             substrate_service: Optional substrate for emitting trace packets
+            decision_cache_size: Max memoized decisions (from env if None,
+                0 disables the cache)
 
         Raises:
             PolicyLoadError: If policy directory doesn't exist
@@ -86,6 +100,25 @@ class GovernanceEngineService:
         self._default_effect = default_effect
         self._substrate = substrate_service
 
+        # Compiled policy index + memoized context-free decisions
+        self._index = PolicyIndex([])
+        self._decision_cache: OrderedDict[
+            tuple[str, str, str], Optional[Policy]
+        ] = OrderedDict()
+        self._decision_cache_size = (
+            decision_cache_size
+            if decision_cache_size is not None
+            else int(
+                os.getenv(
+                    "GOVERNANCE_DECISION_CACHE_SIZE",
+                    str(DEFAULT_DECISION_CACHE_SIZE),
+                )
+            )
+        )
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._policy_version = 0
+
         # Get policy directory from env if not provided
         policy_directory = policy_dir or os.getenv(
             "POLICY_MANIFEST_DIR",
@@ -102,6 +135,8 @@ class GovernanceEngineService:
             )
             raise
 
+        self._compile()
+
         logger.info(
             "governance.engine.init: policy_count=%d, default_effect=%s",
             self._loader.policy_count,
@@ -113,6 +148,11 @@ class GovernanceEngineService:
         """Get number of loaded policies."""
         return self._loader.policy_count
 
+    @property
+    def policy_version(self) -> int:
+        """Change counter bumped every time the policy set is (re)compiled."""
+        return self._policy_version
+
     @property
     def default_effect(self) -> PolicyEffect:
         """Get default effect for unmatched requests."""
@@ -132,7 +172,7 @@ class GovernanceEngineService:
         Evaluate an action against governance policies.
 
         Uses first-match-wins evaluation strategy:
-        1. Iterate through policies in priority order
+        1. Look up candidate policies in the compiled index (priority order)
         2. Return result of first matching policy
         3. If no policy matches, apply default effect (deny)
 
@@ -151,43 +191,39 @@ class GovernanceEngineService:
             request.resource,
         )
 
-        # Evaluate against all policies (sorted by priority)
-        for policy in self._loader.policies:
-            if policy.matches(
-                subject=request.subject,
-                action=request.action,
-                resource=request.resource,
-                context=request.context,
-            ):
-                # First match wins
-                duration_ms = self._calculate_duration_ms(start_time)
-
-                if policy.effect == PolicyEffect.ALLOW:
-                    result = EvaluationResult.allow(
-                        request_id=request.request_id,
-                        policy=policy,
-                        duration_ms=duration_ms,
-                    )
-                else:
-                    result = EvaluationResult.deny(
-                        request_id=request.request_id,
-                        policy=policy,
-                        duration_ms=duration_ms,
-                    )
-
-                logger.info(
-                    "governance.engine.evaluation.result: subject=%s, action=%s, result=%s, policy_id=%s, duration_ms=%d",
-                    request.subject,
-                    request.action,
-                    "allow" if result.allowed else "deny",
-                    policy.id,
-                    duration_ms,
+        # First match wins (policies indexed and sorted by priority)
+        policy = self._decide(
+            request.subject, request.action, request.resource, request.context
+        )
+        if policy is not None:
+            duration_ms = self._calculate_duration_ms(start_time)
+
+            if policy.effect == PolicyEffect.ALLOW:
+                result = EvaluationResult.allow(
+                    request_id=request.request_id,
+                    policy=policy,
+                    duration_ms=duration_ms,
+                )
+            else:
+                result = EvaluationResult.deny(
+                    request_id=request.request_id,
+                    policy=policy,
+                    duration_ms=duration_ms,
                 )
 
-                # Emit trace packet if substrate available
-                await self._emit_trace(request, result)
+            logger.info(
+                "governance.engine.evaluation.result: subject=%s, action=%s, result=%s, policy_id=%s, duration_ms=%d",
+                request.subject,
+                request.action,
+                "allow" if result.allowed else "deny",
+                policy.id,
+                duration_ms,
+            )
 
-                return result
+            # Emit trace packet if substrate available
+            await self._emit_trace(request, result)
+
+            return result
 
         # No policy matched - apply default (deny)
         duration_ms = self._calculate_duration_ms(start_time)
@@ -223,27 +259,24 @@ class GovernanceEngineService:
         """
         start_time = datetime.utcnow()
 
-        for policy in self._loader.policies:
-            if policy.matches(
-                subject=request.subject,
-                action=request.action,
-                resource=request.resource,
-                context=request.context,
-            ):
-                duration_ms = self._calculate_duration_ms(start_time)
-
-                if policy.effect == PolicyEffect.ALLOW:
-                    return EvaluationResult.allow(
-                        request_id=request.request_id,
-                        policy=policy,
-                        duration_ms=duration_ms,
-                    )
-                else:
-                    return EvaluationResult.deny(
-                        request_id=request.request_id,
-                        policy=policy,
-                        duration_ms=duration_ms,
-                    )
+        policy = self._decide(
+            request.subject, request.action, request.resource, request.context
+        )
+        if policy is not None:
+            duration_ms = self._calculate_duration_ms(start_time)
+
+            if policy.effect == PolicyEffect.ALLOW:
+                return EvaluationResult.allow(
+                    request_id=request.request_id,
+                    policy=policy,
+                    duration_ms=duration_ms,
+                )
+            else:
+                return EvaluationResult.deny(
+                    request_id=request.request_id,
+                    policy=policy,
+                    duration_ms=duration_ms,
+                )
 
         # No match - default deny
         return EvaluationResult.deny(
@@ -273,14 +306,52 @@ class GovernanceEngineService:
         Returns:
             True if allowed, False otherwise
         """
-        request = EvaluationRequest(
-            subject=subject,
-            action=action,
-            resource=resource,
-            context=context or {},
-        )
-        result = self.evaluate_sync(request)
-        return result.allowed
+        # Hot path (called per tool on every agent instantiation): decide
+        # directly without building EvaluationRequest/EvaluationResult models
+        policy = self._decide(subject, action, resource, context or {})
+        return policy is not None and policy.effect == PolicyEffect.ALLOW
+
+    def evaluate_many(
+        self,
+        subject: str,
+        action: str,
+        resources: Iterable[str],
+        context: Optional[dict[str, Any]] = None,
+    ) -> dict[str, bool]:
+        """
+        Check one subject/action against many resources.
+
+        Resolves the subject/action candidates once and reuses them for every
+        resource - e.g. filtering all registered tools for an agent.
+
+        Args:
+            subject: Subject performing action
+            action: Action being performed
+            resources: Resources being accessed
+            context: Optional additional context
+
+        Returns:
+            Mapping of resource -> allowed
+        """
+        ctx = context or {}
+        candidates: Optional[set[int]] = None
+        decisions: dict[str, bool] = {}
+
+        for resource in resources:
+            key = (subject, action, resource)
+            if key in self._decision_cache:
+                policy = self._cache_get(key)
+            else:
+                if candidates is None:
+                    candidates = self._index.candidates(subject, action)
+                policy = self._decide_uncached(
+                    subject, action, resource, ctx, candidates
+                )
+            decisions[resource] = (
+                policy is not None and policy.effect == PolicyEffect.ALLOW
+            )
+
+        return decisions
 
     # =========================================================================
     # Policy Management
@@ -293,6 +364,22 @@ class GovernanceEngineService:
                 return policy
         return None
 
+    def get_cache_stats(self) -> dict[str, int]:
+        """Get decision cache statistics."""
+        return {
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "size": len(self._decision_cache),
+            "max_size": self._decision_cache_size,
+            "indexed_policies": len(self._index),
+        }
+
+    def clear_cache(self) -> None:
+        """Drop all memoized decisions."""
+        self._decision_cache.clear()
+        self._cache_hits = 0
+        self._cache_misses = 0
+
     def get_policies_for_action(self, action: str) -> list[Policy]:
         """Get all policies that could apply to an action."""
         return self._loader.get_policies_for_action(action)
@@ -304,6 +391,8 @@ class GovernanceEngineService:
         Args:
             policy_dir: Directory to load from (uses original if None)
 
+        Rebuilds the policy index and invalidates cached decisions.
+
         Returns:
             Number of policies loaded
 
@@ -311,9 +400,11 @@ class GovernanceEngineService:
             PolicyLoadError: If loading fails
         """
         self._loader.clear()
+        self._compile()
 
         directory = policy_dir or os.getenv("POLICY_MANIFEST_DIR", "config/policies")
         count = self._loader.load_from_directory(directory)
+        self._compile()
 
         logger.info(
             "governance.engine.reload: policy_count=%d",
@@ -326,6 +417,50 @@ class GovernanceEngineService:
     # Internals
     # =========================================================================
 
+    def _compile(self) -> None:
+        """Rebuild the policy index from the loader and drop cached decisions."""
+        self._index = PolicyIndex(self._loader.policies)
+        self._policy_version += 1
+        self.clear_cache()
+
+    def _decide(
+        self,
+        subject: str,
+        action: str,
+        resource: str,
+        context: dict[str, Any],
+    ) -> Optional[Policy]:
+        """Get the first matching policy, consulting the decision cache."""
+        key = (subject, action, resource)
+        if key in self._decision_cache:
+            return self._cache_get(key)
+        return self._decide_uncached(subject, action, resource, context)
+
+    def _decide_uncached(
+        self,
+        subject: str,
+        action: str,
+        resource: str,
+        context: dict[str, Any],
+        candidates: Optional[set[int]] = None,
+    ) -> Optional[Policy]:
+        """Evaluate against the index and memoize context-free decisions."""
+        self._cache_misses += 1
+        policy, context_free = self._index.decide(
+            subject, action, resource, context, candidates
+        )
+        if context_free and self._decision_cache_size > 0:
+            self._decision_cache[(subject, action, resource)] = policy
+            if len(self._decision_cache) > self._decision_cache_size:
+                self._decision_cache.popitem(last=False)
+        return policy
+
+    def _cache_get(self, key: tuple[str, str, str]) -> Optional[Policy]:
+        """Read a memoized decision and mark it most recently used."""
+        self._cache_hits += 1
+        self._decision_cache.move_to_end(key)
+        return self._decision_cache[key]
+
     def _calculate_duration_ms(self, start_time: datetime) -> int:
         """Calculate duration in milliseconds."""
         return int((datetime.utcnow() - start_time).total_seconds() * 1000)
@@ -0,0 +1,184 @@
+"""
+L9 Core Governance - Policy Index
+=================================
+
+Compiled lookup structure for governance policies.
+
+GovernanceEngineService used to walk every loaded policy and call
+Policy.matches for each request. The PolicyIndex is built once at load
+time and narrows a request down to the few policies that can possibly
+match it:
+
+- Subjects, actions and resources are each indexed by exact value,
+  prefix wildcard ("tool.*"), suffix wildcard ("*.execute") and
+  match-all ("*" or an empty pattern list)
+- Candidates are intersected across the three indexes and returned in
+  priority order, so first-match-wins semantics are unchanged
+
+The index reproduces Policy._pattern_matches exactly, so only policy
+conditions still need to be evaluated per request.
+
+Version: 1.0.0
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Any, Optional
+
+from core.governance.schemas import Policy
+
+
+# =============================================================================
+# Pattern Index
+# =============================================================================
+
+
+class _PatternIndex:
+    """
+    Index of policy ranks by one pattern list (subjects, actions or resources).
+
+    Mirrors Policy._pattern_matches: a pattern matches a value when it is
+    "*", equal to the value, "<prefix>*" with value starting with prefix,
+    or "*<suffix>" with value ending with suffix.
+    """
+
+    def __init__(self) -> None:
+        self._always: set[int] = set()
+        self._exact: dict[str, set[int]] = defaultdict(set)
+        self._prefix: dict[str, set[int]] = defaultdict(set)
+        self._suffix: dict[str, set[int]] = defaultdict(set)
+        self._prefix_lengths: list[int] = []
+        self._suffix_lengths: list[int] = []
+
+    def add(self, rank: int, patterns: list[str]) -> None:
+        """Register a policy rank under each of its patterns."""
+        if not patterns:
+            self._always.add(rank)
+            return
+
+        for pattern in patterns:
+            if pattern == "*":
+                self._always.add(rank)
+                continue
+            self._exact[pattern].add(rank)
+            if pattern.endswith("*"):
+                self._prefix[pattern[:-1]].add(rank)
+            if pattern.startswith("*"):
+                self._suffix[pattern[1:]].add(rank)
+
+    def freeze(self) -> None:
+        """Precompute wildcard lengths once all policies are added."""
+        self._prefix_lengths = sorted({len(p) for p in self._prefix})
+        self._suffix_lengths = sorted({len(s) for s in self._suffix})
+
+    def lookup(self, value: str) -> set[int]:
+        """Get ranks of all policies whose patterns match value."""
+        ranks = set(self._always)
+
+        exact = self._exact.get(value)
+        if exact:
+            ranks |= exact
+
+        size = len(value)
+        for length in self._prefix_lengths:
+            if length > size:
+                break
+            hit = self._prefix.get(value[:length])
+            if hit:
+                ranks |= hit
+
+        for length in self._suffix_lengths:
+            if length > size:
+                break
+            hit = self._suffix.get(value[size - length :])
+            if hit:
+                ranks |= hit
+
+        return ranks
+
+
+# =============================================================================
+# Policy Index
+# =============================================================================
+
+
+class PolicyIndex:
+    """
+    Compiled, read-only index over a priority-sorted list of policies.
+
+    Disabled policies are dropped at compile time. Rebuild the index
+    (GovernanceEngineService.reload_policies does) whenever the policy
+    set changes.
+    """
+
+    def __init__(self, policies: list[Policy]) -> None:
+        """
+        Compile the index.
+
+        Args:
+            policies: Policies sorted by priority (highest first)
+        """
+        self._policies: list[Policy] = [p for p in policies if p.enabled]
+        self._subjects = _PatternIndex()
+        self._actions = _PatternIndex()
+        self._resources = _PatternIndex()
+
+        for rank, policy in enumerate(self._policies):
+            self._subjects.add(rank, policy.subjects)
+            self._actions.add(rank, policy.actions)
+            self._resources.add(rank, policy.resources)
+
+        for index in (self._subjects, self._actions, self._resources):
+            index.freeze()
+
+    def __len__(self) -> int:
+        return len(self._policies)
+
+    def candidates(self, subject: str, action: str) -> set[int]:
+        """Get ranks of policies matching subject and action."""
+        return self._actions.lookup(action) & self._subjects.lookup(subject)
+
+    def decide(
+        self,
+        subject: str,
+        action: str,
+        resource: str,
+        context: dict[str, Any],
+        candidates: Optional[set[int]] = None,
+    ) -> tuple[Optional[Policy], bool]:
+        """
+        Find the first matching policy (first-match-wins by priority).
+
+        Args:
+            subject: Subject performing the action
+            action: Action being performed
+            resource: Resource being accessed
+            context: Context for condition evaluation
+            candidates: Precomputed candidates(subject, action), if available
+
+        Returns:
+            Tuple of (matching policy or None, context_free). context_free is
+            False when a conditional policy took part in the decision, i.e.
+            the same subject/action/resource may decide differently under
+            another context.
+        """
+        if candidates is None:
+            candidates = self.candidates(subject, action)
+        ranks = candidates & self._resources.lookup(resource)
+
+        context_free = True
+        for rank in sorted(ranks):
+            policy = self._policies[rank]
+            if policy.conditions:
+                context_free = False
+                if not all(c.evaluate(context) for c in policy.conditions):
+                    continue
+            return policy, context_free
+
+        return None, context_free
+
+
+__all__ = [
+    "PolicyIndex",
+]
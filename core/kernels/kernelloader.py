@@ -18,11 +18,11 @@ Features:
 - SHA256 integrity verification
 - Structured observability spans
 - Explicit failure semantics (no silent degradation)
+- Parsed kernels and hashes served from the compiled KernelBundle cache
 """
 
 from __future__ import annotations
 
-import hashlib
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Protocol, Tuple
@@ -30,6 +30,7 @@ from typing import Any, Dict, List, Optional, Protocol, Tuple
 import structlog
 import yaml
 
+from core.kernels.integrity import hash_file
 from core.kernels.schemas import (
     KernelActivationResult,
     KernelManifest,
@@ -38,6 +39,7 @@ from core.kernels.schemas import (
     KernelValidationResult,
     ValidationError,
 )
+from runtime.kernel_bundle import load_kernel_bundle
 
 # Optional: Observability spans (v3.4+ / GMP-KERNEL-BOOT)
 try:
@@ -186,8 +188,7 @@ class KernelAwareAgent(Protocol):
 
 def _sha256_of_file(path: Path) -> str:
     """Compute SHA256 hash of a file."""
-    data = path.read_bytes()
-    return hashlib.sha256(data).hexdigest()
+    return hash_file(path)
 
 
 def _validate_kernel_yaml(
@@ -325,12 +326,21 @@ def load_kernels_phase1(
     hashes: Dict[str, str] = {}
     all_errors: List[ValidationError] = []
 
+    # Parsed documents and hashes come from one read of each file, or from
+    # the bundle cache when no kernel file has changed since the last boot.
+    # With verify_integrity the cached hashes are checked against the bytes.
+    bundle = load_kernel_bundle(
+        [base_path / p for p in KERNEL_ORDER], verify=verify_integrity
+    )
+
     for kernel_path in KERNEL_ORDER:
-        full_path = base_path / kernel_path
+        full_path = str(base_path / kernel_path)
 
         try:
             # Parse YAML
-            data = yaml.safe_load(full_path.read_text())
+            if full_path in bundle.errors:
+                raise yaml.YAMLError(bundle.errors[full_path])
+            data = bundle.documents[full_path]
             if data is None:
                 all_errors.append(
                     ValidationError(
@@ -343,8 +353,7 @@ def load_kernels_phase1(
 
             # Compute hash
             if verify_integrity:
-                file_hash = _sha256_of_file(full_path)
-                hashes[kernel_path] = file_hash
+                hashes[kernel_path] = bundle.hashes[full_path]
 
             # Validate schema
             if validate_schema:
@@ -834,6 +843,7 @@ def reload_kernels(
     2. Re-loads only modified kernels (or all if force=True)
     3. Re-activates the agent with new kernel data
     4. Logs evolution to memory substrate
+    5. Invalidates cached system prompt artifacts
 
     Args:
         agent: Agent with existing kernels
@@ -957,6 +967,14 @@ def reload_kernels(
                 new_hashes=new_hashes,
             )
 
+        # Prompts built from the previous kernels are stale now
+        try:
+            from core.kernels.prompt_builder import invalidate_prompt_cache
+
+            invalidate_prompt_cache()
+        except ImportError:
+            pass
+
         logger.info(
             "kernel_loader.reload_complete",
             kernels_reloaded=result.kernels_activated,
@@ -5,11 +5,20 @@ L9 Kernel Prompt Builder
 Builds system prompts from loaded kernels.
 Wires the kernel YAML into an LLM-ready system prompt.
 
-Version: 1.0.0
+Prompts are built once per kernel stack hash and kept as versioned
+SystemPromptArtifacts along with their token count, so agent
+bootstrap and context budgeting reuse the same text and measurement.
+reload_kernels() calls invalidate_prompt_cache() after a successful reload.
+
+Version: 1.1.0
 """
 
 from __future__ import annotations
 
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
 import structlog
 from typing import Any, Dict, Optional
 
@@ -17,6 +26,8 @@ from runtime.kernel_loader import load_kernel_stack, KernelStack
 
 logger = structlog.get_logger(__name__)
 
+MAX_PROMPT_ARTIFACTS = 32
+
 # Cache the kernel stack (load once)
 _kernel_stack: Optional[KernelStack] = None
 
@@ -176,51 +187,180 @@ def build_safety_section(safety_kernel: Dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
-def build_system_prompt_from_kernels() -> str:
+def _render_system_prompt(stack: KernelStack) -> str:
+    """Render the system prompt text for a kernel stack."""
+    sections = []
+
+    # Identity (kernel 02)
+    identity = stack.kernels_by_id.get("identity", {})
+    if identity:
+        sections.append(build_identity_section(identity))
+
+    # Behavioral (kernel 04)
+    behavioral = stack.kernels_by_id.get("behavioral", {})
+    if behavioral:
+        sections.append(build_behavioral_section(behavioral))
+
+    # Cognitive (kernel 03)
+    cognitive = stack.kernels_by_id.get("cognitive", {})
+    if cognitive:
+        sections.append(build_cognitive_section(cognitive))
+
+    # Execution (kernel 07)
+    execution = stack.kernels_by_id.get("execution", {})
+    if execution:
+        sections.append(build_execution_section(execution))
+
+    # Safety (kernel 08)
+    safety = stack.kernels_by_id.get("safety", {})
+    if safety:
+        sections.append(build_safety_section(safety))
+
+    # Combine all sections
+    prompt = "\n".join(sections)
+
+    # Add closing
+    prompt += "\n\nYou are L. Operate as Igor's CTO."
+    return prompt
+
+
+def kernel_stack_hash(stack: KernelStack) -> str:
+    """Stable hash of a kernel stack's file hashes."""
+    digest = hashlib.sha256()
+    for filename, file_hash in sorted(stack.hashes.items()):
+        digest.update(f"{filename}:{file_hash}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _count_tokens(text: str, model: Optional[str]) -> int:
+    try:
+        from core.agents.context_window import estimate_tokens
+    except ImportError:
+        return (len(text) + 3) // 4
+    return estimate_tokens(text, model)
+
+
+@dataclass
+class SystemPromptArtifact:
     """
-    Build a complete system prompt from the loaded kernels.
+    A built system prompt, versioned by the kernel stack it came from.
+
+    Attributes:
+        text: Prompt text
+        version: Short version id (first 12 hex chars of stack_hash)
+        stack_hash: kernel_stack_hash() of the source stack
+        token_count: Token count for the default tokenizer
+        built_at: Build time (epoch seconds)
+    """
+
+    text: str
+    version: str
+    stack_hash: str
+    token_count: int
+    built_at: float = field(default_factory=time.time)
+    _tokens_by_model: Dict[str, int] = field(default_factory=dict, repr=False)
+
+    def tokens_for(self, model: Optional[str] = None) -> int:
+        """Get the token count for a model's tokenizer (measured once)."""
+        if model is None:
+            return self.token_count
+        if model not in self._tokens_by_model:
+            self._tokens_by_model[model] = _count_tokens(self.text, model)
+        return self._tokens_by_model[model]
+
+
+_prompt_artifacts: "OrderedDict[str, SystemPromptArtifact]" = OrderedDict()
+_artifact_hits = 0
+_artifact_builds = 0
+
+
+def get_system_prompt_artifact() -> SystemPromptArtifact:
+    """
+    Get the system prompt artifact for the current kernel stack.
+
+    Built on first use per kernel stack hash and reused until the stack
+    changes or invalidate_prompt_cache() is called.
 
     Returns:
-        Complete system prompt string
+        SystemPromptArtifact
+
+    Raises:
+        Exception: If the kernel stack cannot be loaded
     """
-    try:
-        stack = get_kernel_stack()
+    global _artifact_hits, _artifact_builds
+
+    stack = get_kernel_stack()
+    stack_hash = kernel_stack_hash(stack)
+
+    artifact = _prompt_artifacts.get(stack_hash)
+    if artifact is not None:
+        _prompt_artifacts.move_to_end(stack_hash)
+        _artifact_hits += 1
+        return artifact
+
+    text = _render_system_prompt(stack)
+    artifact = SystemPromptArtifact(
+        text=text,
+        version=stack_hash[:12],
+        stack_hash=stack_hash,
+        token_count=_count_tokens(text, None),
+    )
+    _prompt_artifacts[stack_hash] = artifact
+    while len(_prompt_artifacts) > MAX_PROMPT_ARTIFACTS:
+        _prompt_artifacts.popitem(last=False)
+    _artifact_builds += 1
+
+    logger.info(
+        f"Built system prompt from kernels ({len(text)} chars, "
+        f"{artifact.token_count} tokens, version={artifact.version})"
+    )
+    return artifact
+
+
+def lookup_prompt_tokens(text: str, model: Optional[str] = None) -> Optional[int]:
+    """
+    Get the token count of a cached system prompt.
 
-        sections = []
+    Args:
+        text: Prompt text (e.g. AgentConfig.system_prompt)
+        model: Model whose tokenizer to use
 
-        # Identity (kernel 02)
-        identity = stack.kernels_by_id.get("identity", {})
-        if identity:
-            sections.append(build_identity_section(identity))
+    Returns:
+        Token count, or None if text is not a cached prompt artifact
+    """
+    for artifact in reversed(_prompt_artifacts.values()):
+        if artifact.text == text:
+            return artifact.tokens_for(model)
+    return None
 
-        # Behavioral (kernel 04)
-        behavioral = stack.kernels_by_id.get("behavioral", {})
-        if behavioral:
-            sections.append(build_behavioral_section(behavioral))
 
-        # Cognitive (kernel 03)
-        cognitive = stack.kernels_by_id.get("cognitive", {})
-        if cognitive:
-            sections.append(build_cognitive_section(cognitive))
+def invalidate_prompt_cache() -> None:
+    """Drop cached prompt artifacts and the kernel stack (kernels changed)."""
+    global _kernel_stack
+    _prompt_artifacts.clear()
+    _kernel_stack = None
+    logger.info("Invalidated system prompt cache")
 
-        # Execution (kernel 07)
-        execution = stack.kernels_by_id.get("execution", {})
-        if execution:
-            sections.append(build_execution_section(execution))
 
-        # Safety (kernel 08)
-        safety = stack.kernels_by_id.get("safety", {})
-        if safety:
-            sections.append(build_safety_section(safety))
+def get_prompt_cache_stats() -> Dict[str, Any]:
+    """Get prompt artifact cache statistics."""
+    return {
+        "entries": len(_prompt_artifacts),
+        "hits": _artifact_hits,
+        "builds": _artifact_builds,
+        "versions": sorted({a.version for a in _prompt_artifacts.values()}),
+    }
 
-        # Combine all sections
-        prompt = "\n".join(sections)
 
-        # Add closing
-        prompt += "\n\nYou are L. Operate as Igor's CTO."
+def build_system_prompt_from_kernels() -> str:
+    """
+    Build a complete system prompt from the loaded kernels.
 
-        logger.info(f"Built system prompt from kernels ({len(prompt)} chars)")
-        return prompt
+    Returns:
+        Complete system prompt string
+    """
+    try:
+        return get_system_prompt_artifact().text
 
     except Exception as e:
         logger.error(f"Failed to build prompt from kernels: {e}")
@@ -263,4 +403,10 @@ __all__ = [
     "get_kernel_stack",
     "build_system_prompt_from_kernels",
     "get_fallback_prompt",
+    "SystemPromptArtifact",
+    "get_system_prompt_artifact",
+    "kernel_stack_hash",
+    "lookup_prompt_tokens",
+    "invalidate_prompt_cache",
+    "get_prompt_cache_stats",
 ]
@@ -21,6 +21,26 @@ if TYPE_CHECKING:
 logger = structlog.get_logger(__name__)
 
 
+_FACT_KEYWORDS = (
+    'is', 'are', 'was', 'were', 'should', 'must', 'will',
+    'prefer', 'want', 'need', 'like', 'use',
+)
+
+
+def extract_facts(text: str, limit: int = 10) -> List[str]:
+    """Simple fact extraction (sentences with key patterns), no LLM required"""
+    facts = []
+    
+    for sentence in text.split('.'):
+        sentence = sentence.strip()
+        if len(sentence) > 20 and any(kw in sentence.lower() for kw in _FACT_KEYWORDS):
+            facts.append(sentence)
+            if len(facts) >= limit:
+                break
+    
+    return facts
+
+
 class MemoryTier(Enum):
     """Memory organization tiers (like OS virtual memory)"""
     MAIN_CONTEXT = "main"          # Always loaded (system + recent)
@@ -256,18 +276,7 @@ class MemoryConsolidationService:
     
     def _simple_extract(self, text: str) -> List[str]:
         """Simple fact extraction (sentences with key patterns)"""
-        sentences = text.split('.')
-        facts = []
-        
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if len(sentence) > 20 and any(kw in sentence.lower() for kw in [
-                'is', 'are', 'was', 'were', 'should', 'must', 'will',
-                'prefer', 'want', 'need', 'like', 'use',
-            ]):
-                facts.append(sentence)
-        
-        return facts[:10]  # Limit to top 10
+        return extract_facts(text)
     
     async def consolidate_graph_state(
         self,
@@ -7,7 +7,8 @@ This module provides:
 - Failure detection and recovery
 - Context window management strategies
 - Multi-backend span export (console, file, substrate, Datadog, Honeycomb)
-- SRE metrics and agent KPIs
+- SRE metrics and agent KPIs (fixed-memory streaming sketches)
+- Sampling profiler and event-loop lag monitoring
 - Sampling and cardinality management
 
 Quick start:
@@ -69,6 +70,21 @@ from .aggregation import (
     MetricsAggregator,
     KPITracker,
 )
+from .pipeline import (
+    PipelineStats,
+    SpanExportPipeline,
+)
+from .streaming import (
+    QuantileSketch,
+    WindowedCounter,
+    StreamingMetrics,
+)
+from .profiling import (
+    SamplingProfiler,
+    EventLoopMonitor,
+    TaskProfile,
+    profile_agent_task,
+)
 from .context_strategies import (
     ContextStrategy,
     NaiveTruncationStrategy,
@@ -134,9 +150,19 @@ __all__ = [
     "JSONFileExporter",
     "SubstrateExporter",
     "CompositeExporter",
+    "SpanExportPipeline",
+    "PipelineStats",
     # Aggregation
     "MetricsAggregator",
     "KPITracker",
+    "QuantileSketch",
+    "WindowedCounter",
+    "StreamingMetrics",
+    # Profiling
+    "SamplingProfiler",
+    "EventLoopMonitor",
+    "TaskProfile",
+    "profile_agent_task",
     # Context Strategies
     "ContextStrategy",
     "NaiveTruncationStrategy",
@@ -2,14 +2,19 @@
 Span aggregation and metrics computation.
 
 Computes SRE metrics, KPIs, and detects regressions from spans.
+
+compute_sre_metrics and compute_agent_kpis accept either a span list or a
+StreamingMetrics instance; both are answered from fixed-memory sketches
+(no sorting of the full duration history).
 """
 
 import structlog
-from typing import List, Dict, Optional, Any
-from datetime import datetime, timedelta
+from typing import List, Dict, Optional, Any, Union
+from datetime import timedelta
 from statistics import mean, stdev
 
-from .models import Span, SREMetric, AgentKPI, SpanStatus
+from .models import Span, SREMetric, AgentKPI
+from .streaming import StreamingMetrics
 
 logger = structlog.get_logger(__name__)
 
@@ -18,85 +23,30 @@ class MetricsAggregator:
     """Aggregates spans into SRE metrics and KPIs."""
 
     @staticmethod
-    def compute_sre_metrics(spans: List[Span]) -> Dict[str, Any]:
-        """Compute SRE-level metrics from spans."""
-        if not spans:
-            return {
-                "span_count": 0,
-                "error_count": 0,
-                "error_rate": 0.0,
-                "p50_latency_ms": 0,
-                "p95_latency_ms": 0,
-                "p99_latency_ms": 0,
-                "avg_latency_ms": 0,
-                "max_latency_ms": 0,
-                "timestamp": datetime.utcnow().isoformat(),
-            }
-
-        # Latency analysis
-        durations = [s.duration_ms for s in spans if s.duration_ms]
-        durations.sort()
-
-        p50_idx = max(0, len(durations) // 2)
-        p95_idx = max(0, int(len(durations) * 0.95) - 1)
-        p99_idx = max(0, int(len(durations) * 0.99) - 1)
-
-        # Error analysis
-        errors = [s for s in spans if s.status == SpanStatus.ERROR]
-        error_by_type = {}
-        for err in errors:
-            key = err.name
-            error_by_type[key] = error_by_type.get(key, 0) + 1
-
-        return {
-            "span_count": len(spans),
-            "error_count": len(errors),
-            "error_rate": len(errors) / len(spans) if spans else 0.0,
-            "p50_latency_ms": durations[p50_idx] if p50_idx < len(durations) else 0,
-            "p95_latency_ms": durations[p95_idx] if p95_idx < len(durations) else 0,
-            "p99_latency_ms": durations[p99_idx] if p99_idx < len(durations) else 0,
-            "avg_latency_ms": mean(durations) if durations else 0,
-            "max_latency_ms": max(durations) if durations else 0,
-            "errors_by_type": error_by_type,
-            "timestamp": datetime.utcnow().isoformat(),
-        }
+    def _as_streaming(spans: Union[List[Span], StreamingMetrics]) -> StreamingMetrics:
+        if isinstance(spans, StreamingMetrics):
+            return spans
+        return StreamingMetrics(recent_capacity=0).record_many(spans)
+
+    @staticmethod
+    def compute_sre_metrics(
+        spans: Union[List[Span], StreamingMetrics],
+    ) -> Dict[str, Any]:
+        """Compute SRE-level metrics from spans (or a StreamingMetrics)."""
+        metrics = MetricsAggregator._as_streaming(spans or [])
+        return metrics.sre_metrics()
 
     @staticmethod
     def compute_agent_kpis(
-        spans: List[Span],
+        spans: Union[List[Span], StreamingMetrics],
         agent_name: str,
         period: str = "1h",
     ) -> Dict[str, float]:
         """Compute agent-specific KPIs."""
         if not spans:
             return {}
-
-        # Filter to agent's spans
-        agent_spans = [s for s in spans if agent_name in s.name]
-        if not agent_spans:
-            return {}
-
-        # Success rate
-        successes = [s for s in agent_spans if s.status == SpanStatus.OK]
-        success_rate = len(successes) / len(agent_spans) if agent_spans else 0.0
-
-        # Tool efficiency (tool spans per task)
-        task_spans = [s for s in agent_spans if "task" in s.name]
-        tool_spans = [s for s in agent_spans if s.name.startswith("tool.")]
-        tool_efficiency = len(task_spans) / max(1, len(tool_spans)) if tool_spans else 0.0
-
-        # Cost (estimated from LLM spans)
-        llm_spans = [s for s in agent_spans if hasattr(s, "cost_usd")]
-        total_cost = sum(s.cost_usd for s in llm_spans if hasattr(s, "cost_usd"))
-
-        return {
-            "agent_name": agent_name,
-            "success_rate": success_rate,
-            "tool_efficiency": tool_efficiency,
-            "total_cost_usd": total_cost,
-            "avg_latency_ms": mean([s.duration_ms for s in agent_spans if s.duration_ms]),
-            "period": period,
-        }
+        metrics = MetricsAggregator._as_streaming(spans)
+        return metrics.agent_kpis(agent_name, period)
 
     @staticmethod
     def detect_regressions(
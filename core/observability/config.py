@@ -51,6 +51,31 @@ class ObservabilitySettings(BaseSettings):
         description="Seconds to wait before flushing batch (whichever comes first)",
         gt=0,
     )
+    max_queue_size: int = Field(
+        default=10000,
+        description="Spans buffered for export before new spans are dropped",
+        gt=0,
+    )
+    file_fsync_interval_sec: float = Field(
+        default=1.0,
+        description="Minimum seconds between fsyncs of the span file",
+        ge=0.0,
+    )
+    recent_span_capacity: int = Field(
+        default=1000,
+        description="Spans kept in the in-memory recent-span ring buffer",
+        gt=0,
+    )
+    metrics_window_sec: int = Field(
+        default=60,
+        description="Sliding window for span and error rates",
+        gt=0,
+    )
+    metrics_max_series: int = Field(
+        default=1000,
+        description="Maximum distinct (span name, agent) metric series",
+        gt=0,
+    )
     log_level: str = Field(
         default="INFO",
         description="Logging level: DEBUG, INFO, WARNING, ERROR",
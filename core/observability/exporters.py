@@ -2,9 +2,12 @@
 Span exporters for sending telemetry to various backends.
 
 Includes console, file, substrate, and extensible composite exporter.
+Exporters receive whole batches from SpanExportPipeline (pipeline.py).
 """
 
 import json
+import os
+import time
 import structlog
 from typing import List, Optional, Any
 from abc import ABC, abstractmethod
@@ -15,6 +18,8 @@ logger = structlog.get_logger(__name__)
 
 from .models import Span
 
+SPAN_PACKET_TYPE = "observability.span"
+
 logger = structlog.get_logger(__name__)
 
 
@@ -26,6 +31,10 @@ class SpanExporter(ABC):
         """Synchronously export spans."""
         pass
 
+    def shutdown(self) -> None:
+        """Flush and release resources (called once by the pipeline)."""
+        pass
+
 
 class AsyncSpanExporter(ABC):
     """Base class for async span exporters."""
@@ -55,32 +64,73 @@ class ConsoleExporter(SpanExporter):
 
 
 class JSONFileExporter(SpanExporter):
-    """Export spans to JSON Lines file."""
-
-    def __init__(self, file_path: str = "/tmp/l9_spans.jsonl"):
+    """
+    Export spans to JSON Lines file.
+
+    Keeps one buffered append handle open, writes each batch with a single
+    write() and fsyncs at most every fsync_interval seconds.
+    """
+
+    def __init__(
+        self,
+        file_path: str = "/tmp/l9_spans.jsonl",
+        fsync_interval: float = 1.0,
+        buffer_size: int = 64 * 1024,
+    ):
         """Initialize file exporter."""
         self.file_path = file_path
+        self.fsync_interval = fsync_interval
+        self.buffer_size = buffer_size
+        self._file: Optional[Any] = None
+        self._last_fsync = time.monotonic()
+
+    def _handle(self) -> Any:
+        if self._file is None or self._file.closed:
+            self._file = open(self.file_path, "a", buffering=self.buffer_size)
+        return self._file
 
     def export(self, spans: List[Span]) -> None:
-        """Write spans as JSONL."""
+        """Write spans as JSONL (raises so the pipeline counts the batch as failed)."""
+        if not spans:
+            return
+        f = self._handle()
+        f.write("".join(span.model_dump_json() + "\n" for span in spans))
+        if time.monotonic() - self._last_fsync >= self.fsync_interval:
+            self._sync(f)
+
+    def _sync(self, f: Any) -> None:
+        f.flush()
+        os.fsync(f.fileno())
+        self._last_fsync = time.monotonic()
+
+    def shutdown(self) -> None:
+        """Flush, fsync and close the file."""
+        if self._file is None or self._file.closed:
+            return
         try:
-            with open(self.file_path, "a") as f:
-                for span in spans:
-                    json_str = span.model_dump_json()
-                    f.write(json_str + "\n")
-                    f.flush()
+            self._sync(self._file)
         except Exception as exc:
-            logger.error(f"Failed to write spans to file: {exc}")
+            logger.error(f"Failed to sync span file: {exc}")
+        finally:
+            self._file.close()
+            self._file = None
 
 
 class SubstrateExporter(AsyncSpanExporter):
-    """Export spans to L9 Memory Substrate."""
+    """
+    Export spans to L9 Memory Substrate.
+
+    Each flush is one MemorySubstrateService.write_packets call (falling
+    back to write_packet per span for substrates without the bulk API).
+    """
 
-    def __init__(self, substrate_service: Any):
+    def __init__(self, substrate_service: Any, batch_size: int = 100):
         """Initialize substrate exporter."""
         self.substrate = substrate_service
         self._batch: List[Span] = []
-        self._batch_size = 100
+        self._batch_size = batch_size
+        self.written = 0
+        self.failed = 0
 
     async def export_async(self, spans: List[Span]) -> None:
         """Export spans to substrate (batched)."""
@@ -88,28 +138,53 @@ class SubstrateExporter(AsyncSpanExporter):
         if len(self._batch) >= self._batch_size:
             await self.flush()
 
+    @staticmethod
+    def _to_packets(spans: List[Span]) -> List[Any]:
+        from memory.substrate_models import PacketEnvelopeIn, PacketMetadata
+
+        return [
+            PacketEnvelopeIn(
+                packet_type=SPAN_PACKET_TYPE,
+                payload=span.model_dump(mode="json"),
+                timestamp=span.end_time or span.start_time,
+                metadata=PacketMetadata(
+                    agent=span.attributes.get("agent_id"),
+                    schema_version="1.0.0",
+                ),
+                tags=[span.name, span.status.value],
+            )
+            for span in spans
+        ]
+
     async def flush(self) -> None:
-        """Flush accumulated spans to substrate."""
+        """
+        Flush accumulated spans to substrate.
+
+        Raises if the write fails or the substrate rejects any packet, so
+        the pipeline counts the batch as failed.
+        """
         if not self._batch:
             return
 
+        batch, self._batch = self._batch, []
+        ok = 0
         try:
-            # Store telemetry in substrate with appropriate key
-            for span in self._batch:
-                key = f"traces/{span.trace_id}/{span.span_id}"
-                await self.substrate.write(
-                    key=key,
-                    value=span.model_dump(),
-                    metadata={
-                        "span_name": span.name,
-                        "duration_ms": span.duration_ms,
-                        "status": span.status.value,
-                    },
-                )
-            logger.debug(f"Flushed {len(self._batch)} spans to substrate")
-            self._batch.clear()
-        except Exception as exc:
-            logger.error(f"Failed to export to substrate: {exc}")
+            packets = self._to_packets(batch)
+            # Only use the bulk API when the substrate class implements it
+            # (mocks answer every attribute lookup)
+            if getattr(type(self.substrate), "write_packets", None) is not None:
+                results = await self.substrate.write_packets(packets)
+                ok = sum(1 for r in results if getattr(r, "status", "ok") != "error")
+            else:
+                for packet in packets:
+                    await self.substrate.write_packet(packet)
+                    ok += 1
+        finally:
+            self.written += ok
+            self.failed += len(batch) - ok
+        if ok < len(batch):
+            raise RuntimeError(f"Substrate rejected {len(batch) - ok} of {len(batch)} spans")
+        logger.debug(f"Flushed {len(batch)} spans to substrate")
 
 
 class CompositeExporter:
@@ -0,0 +1,244 @@
+"""
+Background span export pipeline.
+
+ObservabilityService.export_span used to spawn one asyncio task per span per
+async exporter and run sync exporters (file writes) inline. The pipeline
+replaces that with:
+
+- a lock-free handoff: submit() is a bounded deque append (atomic under
+  the GIL), safe from any thread, with no task or future per span
+- one background writer thread that drains the queue in batches of up to
+  batch_size, at least every schedule_delay seconds
+- sync exporters called with whole batches on the writer thread; async
+  exporters (substrate) run on the service's event loop, one call per batch
+- backpressure: when the queue is full new spans are dropped and counted
+  (dropped spans are never part of submitted)
+- spans count as exported only when every exporter accepted their batch;
+  otherwise they count as failed
+- shutdown() drains the queue, flushes async exporters and closes sync ones
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Any, Deque, List, Optional
+
+import structlog
+
+from .exporters import AsyncSpanExporter
+from .models import Span
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_MAX_QUEUE_SIZE = 10_000
+DEFAULT_BATCH_SIZE = 512
+DEFAULT_SCHEDULE_DELAY_SEC = 1.0
+ASYNC_EXPORT_TIMEOUT_SEC = 30.0
+
+
+@dataclass
+class PipelineStats:
+    """
+    Export pipeline counters.
+
+    submitted spans end up either exported or failed (or still queued);
+    dropped spans were rejected at submit and are not part of submitted.
+    export_errors counts exporter calls that raised.
+    """
+
+    submitted: int = 0
+    dropped: int = 0
+    exported: int = 0
+    failed: int = 0
+    batches: int = 0
+    export_errors: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+class SpanExportPipeline:
+    """
+    Batches spans off the caller's path and hands them to exporters.
+
+    Usage:
+        pipeline = SpanExportPipeline(exporters, loop=asyncio.get_running_loop())
+        pipeline.start()
+        pipeline.submit(span)          # O(1), never blocks
+        await pipeline.shutdown()
+    """
+
+    def __init__(
+        self,
+        exporters: List[Any],
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        schedule_delay: float = DEFAULT_SCHEDULE_DELAY_SEC,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+    ):
+        """
+        Args:
+            exporters: Sync SpanExporters and/or AsyncSpanExporters
+            max_queue_size: Spans buffered before new ones are dropped
+            batch_size: Maximum spans per export call; a full batch wakes
+                the writer early
+            schedule_delay: Maximum seconds a span waits in the queue
+            loop: Event loop for async exporters (required if any)
+        """
+        self.exporters = list(exporters)
+        self.max_queue_size = max(max_queue_size, 1)
+        self.batch_size = max(batch_size, 1)
+        self.schedule_delay = schedule_delay
+        self._loop = loop
+
+        self._queue: Deque[Span] = deque()
+        self._wakeup = threading.Event()
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+        self._stats = PipelineStats()
+
+    @property
+    def stats(self) -> PipelineStats:
+        return self._stats
+
+    def start(self) -> None:
+        """Start the background writer thread (idempotent)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopping = False
+        self._thread = threading.Thread(
+            target=self._run, name="l9-span-export", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, span: Span) -> bool:
+        """
+        Queue a span for export.
+
+        Returns:
+            False if the span was dropped because the queue is full
+        """
+        queue = self._queue
+        if len(queue) >= self.max_queue_size:
+            self._stats.dropped += 1
+            return False
+        queue.append(span)
+        self._stats.submitted += 1
+        if len(queue) == self.batch_size:
+            self._wakeup.set()
+        return True
+
+    def _run(self) -> None:
+        while True:
+            self._wakeup.wait(self.schedule_delay)
+            self._wakeup.clear()
+            self._drain()
+            if self._stopping:
+                self._drain()
+                return
+
+    def _drain(self) -> None:
+        queue = self._queue
+        while queue:
+            batch: List[Span] = []
+            try:
+                while len(batch) < self.batch_size:
+                    batch.append(queue.popleft())
+            except IndexError:
+                pass
+            self._export(batch)
+
+    def _export(self, batch: List[Span]) -> None:
+        self._stats.batches += 1
+        ok = True
+        for exporter in self.exporters:
+            try:
+                if isinstance(exporter, AsyncSpanExporter) or hasattr(exporter, "export_async"):
+                    self._export_async(exporter, batch)
+                else:
+                    exporter.export(batch)
+            except Exception as exc:
+                ok = False
+                self._stats.export_errors += 1
+                logger.error(f"Export failed in {type(exporter).__name__}: {exc}")
+        if ok:
+            self._stats.exported += len(batch)
+        else:
+            self._stats.failed += len(batch)
+
+    def _export_async(self, exporter: Any, batch: List[Span]) -> None:
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            raise RuntimeError("no event loop for async exporter")
+
+        async def _write() -> None:
+            await exporter.export_async(batch)
+            if hasattr(exporter, "flush"):
+                await exporter.flush()
+
+        future = asyncio.run_coroutine_threadsafe(_write(), loop)
+        future.result(timeout=ASYNC_EXPORT_TIMEOUT_SEC)
+
+    def force_flush(self, timeout: float = 5.0) -> bool:
+        """
+        Block until everything queued so far has been handed to the
+        exporters (exported or failed).
+
+        Must not be called from the event loop thread when async exporters
+        are configured (use shutdown() there).
+        """
+        target = self._stats.submitted
+        deadline = time.monotonic() + timeout
+        while self._stats.exported + self._stats.failed < target or self._queue:
+            if self._thread is None or not self._thread.is_alive():
+                self._drain()
+                break
+            self._wakeup.set()
+            if time.monotonic() > deadline:
+                return False
+            time.sleep(0.001)
+        return True
+
+    async def shutdown(self, timeout: float = 10.0) -> None:
+        """Drain the queue, then flush and close every exporter."""
+        self._stopping = True
+        self._wakeup.set()
+        if self._thread is not None:
+            # Joined off-loop so async exporters can still run on this loop
+            await asyncio.to_thread(self._thread.join, timeout)
+            self._thread = None
+        if self._queue:
+            await asyncio.to_thread(self._drain)
+
+        for exporter in self.exporters:
+            try:
+                if hasattr(exporter, "shutdown"):
+                    await asyncio.to_thread(exporter.shutdown)
+                elif hasattr(exporter, "flush"):
+                    await exporter.flush()
+            except Exception as exc:
+                logger.error(f"Flush failed in {type(exporter).__name__}: {exc}")
+
+        if self._stats.dropped:
+            logger.warning(
+                "observability.spans_dropped",
+                dropped=self._stats.dropped,
+                submitted=self._stats.submitted,
+            )
+        if self._stats.failed:
+            logger.warning(
+                "observability.spans_export_failed",
+                failed=self._stats.failed,
+                export_errors=self._stats.export_errors,
+                submitted=self._stats.submitted,
+            )
+
+
+__all__ = [
+    "PipelineStats",
+    "SpanExportPipeline",
+]
@@ -0,0 +1,564 @@
+"""
+Low-overhead profiling for a live L9 process.
+
+- SamplingProfiler: a background thread samples every thread's stack with
+  sys._current_frames() every `interval` seconds and aggregates collapsed
+  stacks (flamegraph.pl / speedscope format). Samples taken on an event
+  loop thread are attributed to the asyncio task running at that moment,
+  which gives per-task on-CPU time.
+- EventLoopMonitor: measures event-loop scheduling lag with a heartbeat
+  task and runs a watchdog thread that, when the heartbeat stalls past a
+  threshold, captures the loop thread's stack - i.e. the blocking call.
+- profile_agent_task(): async context manager reporting wall vs CPU time
+  and collapsed stacks for one task, end to end.
+- start_profiling() / stop_profiling() / get_profiling_status(): the
+  process-wide session used by the /admin/profiler routes.
+
+Nothing runs unless started; when stopped the overhead is zero.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import threading
+import time
+from collections import Counter, deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from types import CodeType, FrameType
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional
+
+import structlog
+
+from .streaming import QuantileSketch
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_SAMPLE_INTERVAL_SEC = 0.005
+DEFAULT_MAX_DEPTH = 128
+DEFAULT_LAG_INTERVAL_SEC = 0.1
+DEFAULT_SLOW_CALLBACK_SEC = 0.1
+IDLE_TASK = "<idle>"
+
+# asyncio keeps the running task per loop here (both the C and Python
+# implementations); read without locking from the sampler thread
+_current_tasks: Dict[Any, Any] = getattr(asyncio.tasks, "_current_tasks", {})
+
+
+def _task_name(task: Any) -> str:
+    try:
+        name = task.get_name()
+    except Exception:
+        return repr(task)
+    coro = getattr(task, "get_coro", lambda: None)()
+    qualname = getattr(coro, "__qualname__", None)
+    return f"{name}:{qualname}" if qualname else name
+
+
+class _FrameLabels:
+    """Memoizes 'func (file:line)' labels per code object."""
+
+    def __init__(self) -> None:
+        self._labels: Dict[CodeType, str] = {}
+
+    def __call__(self, code: CodeType) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            filename = code.co_filename
+            parts = filename.replace("\\", "/").rsplit("/", 2)
+            short = "/".join(parts[-2:]) if len(parts) > 1 else filename
+            name = getattr(code, "co_qualname", code.co_name)
+            label = f"{name} ({short}:{code.co_firstlineno})"
+            self._labels[code] = label
+        return label
+
+
+def _collapse(frame: Optional[FrameType], labels: _FrameLabels, max_depth: int) -> str:
+    stack: List[str] = []
+    while frame is not None and len(stack) < max_depth:
+        stack.append(labels(frame.f_code))
+        frame = frame.f_back
+    stack.reverse()
+    return ";".join(stack)
+
+
+# =============================================================================
+# Sampling Profiler
+# =============================================================================
+
+
+class SamplingProfiler:
+    """
+    Statistical stack sampler.
+
+    Usage:
+        profiler = SamplingProfiler(loop=asyncio.get_running_loop())
+        profiler.start()
+        ...
+        profiler.stop()
+        print(profiler.collapsed())
+    """
+
+    def __init__(
+        self,
+        interval: float = DEFAULT_SAMPLE_INTERVAL_SEC,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        loop_thread_id: Optional[int] = None,
+        only_loop_thread: bool = False,
+        task_filter: Optional[Any] = None,
+        max_depth: int = DEFAULT_MAX_DEPTH,
+    ):
+        """
+        Args:
+            interval: Seconds between samples
+            loop: Event loop whose running task samples are attributed to
+            loop_thread_id: Thread running `loop` (defaults to the caller's
+                thread when loop is given)
+            only_loop_thread: Sample only the loop thread
+            task_filter: Only keep loop-thread samples taken while this
+                asyncio task is running
+            max_depth: Maximum frames kept per stack
+        """
+        self.interval = interval
+        self.max_depth = max_depth
+        self._loop = loop
+        self._loop_thread_id = loop_thread_id or (
+            threading.get_ident() if loop is not None else None
+        )
+        self._only_loop_thread = only_loop_thread
+        self._task_filter = task_filter
+
+        self._labels = _FrameLabels()
+        self._stacks: Counter = Counter()
+        self._task_samples: Counter = Counter()
+        self._task_seconds: Counter = Counter()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.samples = 0
+        self.sampling_seconds = 0.0
+        self.started_at: Optional[float] = None
+        self.stopped_at: Optional[float] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start sampling (idempotent)."""
+        if self.running:
+            return
+        self._stop.clear()
+        self.started_at = time.time()
+        self.stopped_at = None
+        self._thread = threading.Thread(
+            target=self._run, name="l9-sampling-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling and wait for the sampler thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.stopped_at = time.time()
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        last = time.perf_counter()
+        while not self._stop.wait(self.interval):
+            start = time.perf_counter()
+            # A busy thread holding the GIL delays the sampler past its
+            # interval, so each sample stands for the real time elapsed
+            self._sample(own_id, start - last)
+            last = time.perf_counter()
+            self.sampling_seconds += last - start
+
+    def _sample(self, own_id: int, elapsed: float) -> None:
+        frames = sys._current_frames()
+        loop_tid = self._loop_thread_id
+        task_name: Optional[str] = None
+        skip_loop = False
+
+        if self._loop is not None:
+            task = _current_tasks.get(self._loop)
+            if self._task_filter is not None and task is not self._task_filter:
+                skip_loop = True
+            else:
+                task_name = _task_name(task) if task is not None else IDLE_TASK
+        if skip_loop and self._only_loop_thread:
+            return
+
+        with self._lock:
+            self.samples += 1
+            for tid, frame in frames.items():
+                if tid == own_id:
+                    continue
+                if tid == loop_tid:
+                    if skip_loop:
+                        continue
+                    if task_name is not None:
+                        self._task_samples[task_name] += 1
+                        self._task_seconds[task_name] += elapsed
+                        # Loop parked in the selector: not on-CPU, no stack
+                        if task_name == IDLE_TASK:
+                            continue
+                elif self._only_loop_thread:
+                    continue
+                self._stacks[_collapse(frame, self._labels, self.max_depth)] += 1
+
+    # -------------------------------------------------------------------------
+    # Reports
+    # -------------------------------------------------------------------------
+
+    def collapsed(self, min_count: int = 1) -> str:
+        """Collapsed stacks, one 'frame;frame;frame count' line per stack."""
+        with self._lock:
+            items = sorted(self._stacks.items(), key=lambda kv: -kv[1])
+        return "\n".join(f"{stack} {count}" for stack, count in items if count >= min_count)
+
+    def top_functions(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """Functions with the most samples on top of the stack (self time)."""
+        leaf: Counter = Counter()
+        with self._lock:
+            for stack, count in self._stacks.items():
+                leaf[stack.rsplit(";", 1)[-1]] += count
+            total = sum(self._stacks.values()) or 1
+        return [
+            {"function": name, "samples": count, "percent": round(100 * count / total, 2)}
+            for name, count in leaf.most_common(limit)
+        ]
+
+    def task_sample_count(self) -> int:
+        """Loop-thread samples attributed to a task (including idle)."""
+        with self._lock:
+            return sum(self._task_samples.values())
+
+    def task_cpu_ms(self) -> Dict[str, float]:
+        """Approximate on-CPU milliseconds per asyncio task on the loop thread."""
+        with self._lock:
+            return {
+                name: round(seconds * 1000, 3)
+                for name, seconds in self._task_seconds.most_common()
+            }
+
+    def report(self, limit: int = 20) -> Dict[str, Any]:
+        end = self.stopped_at or time.time()
+        duration = end - self.started_at if self.started_at else 0.0
+        return {
+            "running": self.running,
+            "interval_ms": self.interval * 1000,
+            "duration_sec": round(duration, 3),
+            "samples": self.samples,
+            "distinct_stacks": len(self._stacks),
+            "overhead_percent": round(
+                100 * self.sampling_seconds / duration, 3
+            ) if duration else 0.0,
+            "top_functions": self.top_functions(limit),
+            "task_cpu_ms": self.task_cpu_ms(),
+        }
+
+
+# =============================================================================
+# Event Loop Monitor
+# =============================================================================
+
+
+@dataclass
+class BlockingEvent:
+    """The loop thread was busy in one callback for too long."""
+
+    detected_at: str
+    blocked_ms: float
+    task: Optional[str]
+    stack: str
+    done: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "detected_at": self.detected_at,
+            "blocked_ms": round(self.blocked_ms, 3),
+            "task": self.task,
+            "stack": self.stack,
+        }
+
+
+class EventLoopMonitor:
+    """
+    Event-loop lag and blocking-call detector.
+
+    A heartbeat task sleeps `interval` and records how late it wakes up
+    (scheduling lag). A watchdog thread checks the heartbeat; when it has
+    not advanced for slow_callback_threshold beyond its expected wakeup,
+    the loop is stuck in one callback and the loop thread's stack is
+    captured.
+    """
+
+    def __init__(
+        self,
+        interval: float = DEFAULT_LAG_INTERVAL_SEC,
+        slow_callback_threshold: float = DEFAULT_SLOW_CALLBACK_SEC,
+        max_events: int = 100,
+    ):
+        self.interval = interval
+        self.slow_callback_threshold = slow_callback_threshold
+        self.lag_ms = QuantileSketch()
+        self.blocking_events: Deque[BlockingEvent] = deque(maxlen=max_events)
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._heartbeat = time.monotonic()
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._labels = _FrameLabels()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start monitoring the running event loop (call from the loop)."""
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stop.clear()
+        self._task = self._loop.create_task(self._beat(), name="l9-loop-monitor")
+        self._watchdog = threading.Thread(
+            target=self._watch, name="l9-loop-watchdog", daemon=True
+        )
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        self._stop.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._watchdog is not None:
+            await asyncio.to_thread(self._watchdog.join)
+            self._watchdog = None
+
+    async def _beat(self) -> None:
+        while True:
+            expected = time.monotonic() + self.interval
+            self._heartbeat = expected
+            await asyncio.sleep(self.interval)
+            self.lag_ms.add(max(time.monotonic() - expected, 0.0) * 1000)
+
+    def _watch(self) -> None:
+        current: Optional[BlockingEvent] = None
+        poll = min(self.slow_callback_threshold / 2, 0.05)
+        while not self._stop.wait(poll):
+            heartbeat = self._heartbeat
+            stalled = time.monotonic() - heartbeat
+            if stalled < self.slow_callback_threshold:
+                if current is not None:
+                    current.done = True
+                    current = None
+                continue
+            if current is None:
+                frame = sys._current_frames().get(self._loop_thread_id)
+                task = _current_tasks.get(self._loop) if self._loop else None
+                current = BlockingEvent(
+                    detected_at=datetime.utcnow().isoformat(),
+                    blocked_ms=stalled * 1000,
+                    task=_task_name(task) if task is not None else None,
+                    stack=_collapse(frame, self._labels, DEFAULT_MAX_DEPTH),
+                )
+                self.blocking_events.append(current)
+                logger.warning(
+                    "observability.event_loop_blocked",
+                    task=current.task,
+                    threshold_ms=self.slow_callback_threshold * 1000,
+                    leaf=current.stack.rsplit(";", 1)[-1],
+                )
+            else:
+                current.blocked_ms = stalled * 1000
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            "running": self.running,
+            "interval_ms": self.interval * 1000,
+            "slow_callback_threshold_ms": self.slow_callback_threshold * 1000,
+            "lag_samples": self.lag_ms.count,
+            "lag_p50_ms": round(self.lag_ms.quantile(0.5), 3),
+            "lag_p99_ms": round(self.lag_ms.quantile(0.99), 3),
+            "lag_max_ms": round(self.lag_ms.max, 3) if self.lag_ms.count else 0.0,
+            "blocking_events": [e.to_dict() for e in self.blocking_events],
+        }
+
+
+# =============================================================================
+# Per-task profiling
+# =============================================================================
+
+
+@dataclass
+class TaskProfile:
+    """Wall vs CPU time and stacks for one profiled task."""
+
+    name: str
+    wall_ms: float = 0.0
+    cpu_ms: float = 0.0
+    thread_cpu_ms: float = 0.0
+    samples: int = 0
+    collapsed: str = ""
+    top_functions: List[Dict[str, Any]] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "wall_ms": round(self.wall_ms, 3),
+            "cpu_ms": round(self.cpu_ms, 3),
+            "thread_cpu_ms": round(self.thread_cpu_ms, 3),
+            "samples": self.samples,
+            "top_functions": self.top_functions,
+        }
+
+
+@asynccontextmanager
+async def profile_agent_task(
+    name: str,
+    interval: float = DEFAULT_SAMPLE_INTERVAL_SEC,
+    output_dir: Optional[str] = None,
+) -> AsyncIterator[TaskProfile]:
+    """
+    Profile the current asyncio task for the duration of the block.
+
+    cpu_ms is sampled on-CPU time of this task only; thread_cpu_ms is the
+    loop thread's CPU time over the block (includes other tasks).
+
+    Usage:
+        async with profile_agent_task(f"agent-task-{task.id}") as profile:
+            await executor.start_agent_task(task)
+        logger.info("profile", **profile.to_dict())
+
+    Args:
+        name: Profile name (also the collapsed-stack file name)
+        interval: Seconds between samples
+        output_dir: Write <name>.collapsed here (default: L9_PROFILE_DIR,
+            if set)
+    """
+    profile = TaskProfile(name=name)
+    profiler = SamplingProfiler(
+        interval=interval,
+        loop=asyncio.get_running_loop(),
+        only_loop_thread=True,
+        task_filter=asyncio.current_task(),
+    )
+    wall_start = time.perf_counter()
+    cpu_start = time.thread_time()
+    profiler.start()
+    try:
+        yield profile
+    finally:
+        profiler.stop()
+        profile.wall_ms = (time.perf_counter() - wall_start) * 1000
+        profile.thread_cpu_ms = (time.thread_time() - cpu_start) * 1000
+        profile.samples = profiler.task_sample_count()
+        profile.cpu_ms = sum(profiler.task_cpu_ms().values())
+        profile.collapsed = profiler.collapsed()
+        profile.top_functions = profiler.top_functions(10)
+
+        output_dir = output_dir or os.getenv("L9_PROFILE_DIR")
+        if output_dir and profile.collapsed:
+            try:
+                os.makedirs(output_dir, exist_ok=True)
+                with open(os.path.join(output_dir, f"{name}.collapsed"), "w") as f:
+                    f.write(profile.collapsed + "\n")
+            except OSError as e:
+                logger.warning("observability.profile_write_failed", error=str(e))
+
+
+# =============================================================================
+# Process-wide session (admin routes)
+# =============================================================================
+
+
+_profiler: Optional[SamplingProfiler] = None
+_loop_monitor: Optional[EventLoopMonitor] = None
+
+
+def start_profiling(
+    interval: float = DEFAULT_SAMPLE_INTERVAL_SEC,
+    monitor_loop: bool = True,
+    slow_callback_threshold: float = DEFAULT_SLOW_CALLBACK_SEC,
+) -> Dict[str, Any]:
+    """
+    Start the process-wide sampler (and loop monitor). Call from the loop.
+
+    Returns:
+        Current status
+    """
+    global _profiler, _loop_monitor
+
+    if _profiler is None or not _profiler.running:
+        try:
+            loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        _profiler = SamplingProfiler(interval=interval, loop=loop)
+        _profiler.start()
+        logger.info("observability.profiler_started", interval_ms=interval * 1000)
+
+    if monitor_loop and (_loop_monitor is None or not _loop_monitor.running):
+        try:
+            _loop_monitor = EventLoopMonitor(slow_callback_threshold=slow_callback_threshold)
+            _loop_monitor.start()
+        except RuntimeError:
+            _loop_monitor = None
+
+    return get_profiling_status()
+
+
+async def stop_profiling() -> Dict[str, Any]:
+    """
+    Stop the process-wide sampler and loop monitor.
+
+    Returns:
+        Final report (collapsed stacks stay available via
+        get_collapsed_stacks() until the next start)
+    """
+    if _profiler is not None and _profiler.running:
+        await asyncio.to_thread(_profiler.stop)
+        logger.info("observability.profiler_stopped", samples=_profiler.samples)
+    if _loop_monitor is not None and _loop_monitor.running:
+        await _loop_monitor.stop()
+    return get_profiling_status()
+
+
+def get_profiling_status(limit: int = 20) -> Dict[str, Any]:
+    """Current sampler and loop monitor reports."""
+    return {
+        "profiler": _profiler.report(limit) if _profiler else None,
+        "event_loop": _loop_monitor.report() if _loop_monitor else None,
+    }
+
+
+def get_collapsed_stacks(min_count: int = 1) -> str:
+    """Collapsed stacks from the current or last session."""
+    return _profiler.collapsed(min_count) if _profiler else ""
+
+
+__all__ = [
+    "SamplingProfiler",
+    "EventLoopMonitor",
+    "BlockingEvent",
+    "TaskProfile",
+    "profile_agent_task",
+    "start_profiling",
+    "stop_profiling",
+    "get_profiling_status",
+    "get_collapsed_stacks",
+]
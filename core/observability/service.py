@@ -2,16 +2,21 @@
 Main observability service orchestration.
 
 Manages span export, metrics computation, failure detection, and service lifecycle.
+
+Memory is bounded: spans are folded into StreamingMetrics and only the most
+recent ones are kept (self.spans is a ring buffer). Export is handed off to
+a background SpanExportPipeline in batches.
 """
 
 import asyncio
 import structlog
-from typing import List, Optional, Dict, Any
-from datetime import datetime
-from collections import defaultdict
+from typing import Deque, List, Optional, Dict, Any
+from collections import defaultdict, deque
 
 from .config import ObservabilitySettings, load_config
 from .models import Span, TraceContext, FailureSignal, FailureClass
+from .pipeline import SpanExportPipeline
+from .streaming import StreamingMetrics
 
 logger = structlog.get_logger(__name__)
 
@@ -30,9 +35,18 @@ class ObservabilityService:
         """Initialize observability service."""
         self.config = config or load_config()
         self.substrate_service = substrate_service
-        self.spans: List[Span] = []
-        self.failures: List[FailureSignal] = []
+        self.metrics = StreamingMetrics(
+            recent_capacity=self.config.recent_span_capacity,
+            window_sec=self.config.metrics_window_sec,
+            max_series=self.config.metrics_max_series,
+        )
+        # Recent-span ring buffer (shared with self.metrics)
+        self.spans: Deque[Span] = self.metrics.recent
+        self.failures: Deque[FailureSignal] = deque(
+            maxlen=self.config.recent_span_capacity
+        )
         self.exporters: List[Any] = []
+        self.pipeline: Optional[SpanExportPipeline] = None
         self._trace_context: Optional[TraceContext] = None
         self._setup_logging()
         logger.info("ObservabilityService initialized", extra={
@@ -68,7 +82,12 @@ class ObservabilityService:
                 if exporter_name == "console":
                     self.exporters.append(ConsoleExporter())
                 elif exporter_name == "file":
-                    self.exporters.append(JSONFileExporter(self.config.file_export_path))
+                    self.exporters.append(
+                        JSONFileExporter(
+                            self.config.file_export_path,
+                            fsync_interval=self.config.file_fsync_interval_sec,
+                        )
+                    )
                 elif exporter_name == "substrate":
                     if self.substrate_service and self.config.substrate_enabled:
                         self.exporters.append(SubstrateExporter(self.substrate_service))
@@ -78,6 +97,25 @@ class ObservabilityService:
             except Exception as exc:
                 logger.error(f"Failed to initialize exporter {exporter_name}: {exc}")
 
+        self._start_pipeline()
+
+    def _start_pipeline(self) -> Optional[SpanExportPipeline]:
+        """Start the background export pipeline for the current exporters."""
+        if self.pipeline is None and self.exporters:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None
+            self.pipeline = SpanExportPipeline(
+                self.exporters,
+                max_queue_size=self.config.max_queue_size,
+                batch_size=self.config.batch_size,
+                schedule_delay=self.config.batch_timeout_sec,
+                loop=loop,
+            )
+            self.pipeline.start()
+        return self.pipeline
+
     def current_trace_context(self) -> TraceContext:
         """Get current trace context (create if needed)."""
         if not self._trace_context:
@@ -103,48 +141,24 @@ class ObservabilityService:
         if not sample:
             return
 
-        # Store locally
-        self.spans.append(span)
+        # Fold into streaming metrics (also keeps it in the recent buffer)
+        self.metrics.record(span)
 
-        # Export via all backends (async, non-blocking)
-        for exporter in self.exporters:
-            try:
-                if hasattr(exporter, "export_async"):
-                    asyncio.create_task(exporter.export_async([span]))
-                else:
-                    exporter.export([span])
-            except Exception as exc:
-                logger.error(f"Export failed: {exc}")
+        # Hand off to the background pipeline (batched, non-blocking)
+        pipeline = self.pipeline or self._start_pipeline()
+        if pipeline is not None:
+            pipeline.submit(span)
 
     async def compute_metrics(self) -> Dict[str, Any]:
-        """Compute SRE metrics from recent spans."""
-        if not self.spans:
-            return {
-                "span_count": 0,
-                "error_count": 0,
-                "error_rate": 0.0,
-                "p95_latency_ms": 0,
-                "p99_latency_ms": 0,
-            }
-
-        durations = [s.duration_ms for s in self.spans if s.duration_ms]
-        errors = [s for s in self.spans if s.status.value == "ERROR"]
-
-        durations.sort()
-        p95_idx = max(0, int(len(durations) * 0.95) - 1)
-        p99_idx = max(0, int(len(durations) * 0.99) - 1)
-
-        return {
-            "span_count": len(self.spans),
-            "error_count": len(errors),
-            "error_rate": len(errors) / len(self.spans) if self.spans else 0.0,
-            "p95_latency_ms": durations[p95_idx] if p95_idx < len(durations) else 0,
-            "p99_latency_ms": durations[p99_idx] if p99_idx < len(durations) else 0,
-            "timestamp": datetime.utcnow().isoformat(),
-        }
+        """Compute SRE metrics over all exported spans."""
+        return self.metrics.sre_metrics()
+
+    def compute_agent_kpis(self, agent_name: str, period: str = "1h") -> Dict[str, Any]:
+        """Compute KPIs for one agent over all exported spans."""
+        return self.metrics.agent_kpis(agent_name, period)
 
     async def detect_failures(self) -> List[FailureSignal]:
-        """Detect failures from recent spans."""
+        """Detect failures from the recent-span buffer."""
         signals = []
 
         for span in self.spans:
@@ -201,13 +215,10 @@ class ObservabilityService:
     async def shutdown(self) -> None:
         """Graceful shutdown."""
         logger.info("ObservabilityService shutting down...")
-        # Flush remaining spans
-        for exporter in self.exporters:
-            try:
-                if hasattr(exporter, "flush"):
-                    await exporter.flush()
-            except Exception as exc:
-                logger.error(f"Flush failed: {exc}")
+        # Drain queued spans and flush/close exporters
+        if self.pipeline is not None:
+            await self.pipeline.shutdown()
+            self.pipeline = None
         logger.info("ObservabilityService shutdown complete")
 
 
@@ -0,0 +1,363 @@
+"""
+Streaming metrics engine.
+
+Fixed-memory replacement for keeping every span in a list and sorting all
+durations to compute percentiles:
+
+- QuantileSketch: mergeable log-bucketed latency histogram (DDSketch-style,
+  bounded relative error, bounded bucket count)
+- WindowedCounter: ring of time buckets for rates over a sliding window
+- StreamingMetrics: per (span name, agent) series, global series, windowed
+  span/error counters and a bounded ring buffer of recent spans
+
+MetricsAggregator.compute_sre_metrics / compute_agent_kpis and
+ObservabilityService.compute_metrics are served from StreamingMetrics.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+
+import structlog
+
+from .models import Span, SpanStatus
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_RELATIVE_ACCURACY = 0.01
+DEFAULT_MAX_BUCKETS = 2048
+DEFAULT_RECENT_CAPACITY = 1000
+DEFAULT_WINDOW_SEC = 60
+DEFAULT_MAX_SERIES = 1000
+OVERFLOW_SERIES = "__other__"
+
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch with bounded relative error.
+
+    Values are counted in logarithmic buckets of ratio gamma, so any
+    quantile is reported within relative_accuracy of the true value. Memory
+    is bounded by max_buckets: when exceeded, the lowest buckets collapse
+    together (high percentiles stay accurate).
+    """
+
+    __slots__ = (
+        "relative_accuracy", "max_buckets", "_gamma", "_log_gamma",
+        "_buckets", "_zero_count", "count", "sum", "min", "max",
+    )
+
+    def __init__(
+        self,
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+        max_buckets: int = DEFAULT_MAX_BUCKETS,
+    ):
+        """
+        Args:
+            relative_accuracy: Maximum relative error of reported quantiles
+            max_buckets: Maximum number of non-empty buckets kept
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be in (0, 1)")
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._buckets: Dict[int, int] = {}
+        self._zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float, count: int = 1) -> None:
+        """Record a value (negative values are clamped to 0)."""
+        value = max(float(value), 0.0)
+        self.count += count
+        self.sum += value * count
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+        if value <= 0.0:
+            self._zero_count += count
+            return
+        index = math.ceil(math.log(value) / self._log_gamma)
+        self._buckets[index] = self._buckets.get(index, 0) + count
+        if len(self._buckets) > self.max_buckets:
+            self._collapse()
+
+    def _collapse(self) -> None:
+        indices = sorted(self._buckets)
+        excess = len(indices) - self.max_buckets
+        target = indices[excess]
+        for index in indices[:excess]:
+            self._buckets[target] += self._buckets.pop(index)
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Merge another sketch with the same relative accuracy into this one."""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different accuracy")
+        if other.count == 0:
+            return
+        for index, count in other._buckets.items():
+            self._buckets[index] = self._buckets.get(index, 0) + count
+        self._zero_count += other._zero_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        if len(self._buckets) > self.max_buckets:
+            self._collapse()
+
+    def quantile(self, q: float) -> float:
+        """
+        Get the approximate q-quantile (0 <= q <= 1).
+
+        Returns:
+            Quantile value, or 0.0 if the sketch is empty
+        """
+        if self.count == 0:
+            return 0.0
+        if q <= 0:
+            return self.min
+        if q >= 1:
+            return self.max
+
+        rank = q * (self.count - 1)
+        if rank < self._zero_count:
+            return 0.0
+        seen = self._zero_count
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen > rank:
+                # Bucket midpoint in log space; clamp to observed range
+                value = 2 * self._gamma ** index / (self._gamma + 1)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    @property
+    def bucket_count(self) -> int:
+        return len(self._buckets)
+
+
+class WindowedCounter:
+    """Event counter over a sliding time window, in fixed-size buckets."""
+
+    __slots__ = ("window_sec", "bucket_sec", "_counts", "_stamps")
+
+    def __init__(self, window_sec: float = DEFAULT_WINDOW_SEC, buckets: int = 60):
+        """
+        Args:
+            window_sec: Window length in seconds
+            buckets: Number of buckets the window is divided into
+        """
+        self.window_sec = window_sec
+        self.bucket_sec = window_sec / buckets
+        self._counts = [0] * buckets
+        self._stamps = [-1] * buckets
+
+    def _slot(self, now: float) -> Tuple[int, int]:
+        tick = int(now // self.bucket_sec)
+        return tick, tick % len(self._counts)
+
+    def add(self, n: int = 1, now: Optional[float] = None) -> None:
+        tick, slot = self._slot(time.monotonic() if now is None else now)
+        if self._stamps[slot] != tick:
+            self._stamps[slot] = tick
+            self._counts[slot] = 0
+        self._counts[slot] += n
+
+    def total(self, now: Optional[float] = None) -> int:
+        """Events recorded within the window ending at now."""
+        tick, _ = self._slot(time.monotonic() if now is None else now)
+        oldest = tick - len(self._counts) + 1
+        return sum(c for c, t in zip(self._counts, self._stamps) if t >= oldest)
+
+    def rate(self, now: Optional[float] = None) -> float:
+        """Events per second over the window."""
+        return self.total(now) / self.window_sec
+
+
+class SeriesStats:
+    """Aggregates for one (span name, agent) series."""
+
+    __slots__ = ("latency", "count", "error_count", "ok_count", "cost_usd")
+
+    def __init__(self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY):
+        self.latency = QuantileSketch(relative_accuracy)
+        self.count = 0
+        self.error_count = 0
+        self.ok_count = 0
+        self.cost_usd = 0.0
+
+    def record(self, span: Span) -> None:
+        self.count += 1
+        if span.status == SpanStatus.ERROR:
+            self.error_count += 1
+        elif span.status == SpanStatus.OK:
+            self.ok_count += 1
+        if span.duration_ms:
+            self.latency.add(span.duration_ms)
+        cost = getattr(span, "cost_usd", None)
+        if cost:
+            self.cost_usd += cost
+
+    def merge(self, other: "SeriesStats") -> None:
+        self.latency.merge(other.latency)
+        self.count += other.count
+        self.error_count += other.error_count
+        self.ok_count += other.ok_count
+        self.cost_usd += other.cost_usd
+
+
+def _span_agent(span: Span) -> Optional[str]:
+    agent = getattr(span, "agent_name", None) or getattr(span, "agent_id", None)
+    if agent:
+        return str(agent)
+    agent = span.attributes.get("agent_id") or span.attributes.get("agent_name")
+    return str(agent) if agent else None
+
+
+class StreamingMetrics:
+    """
+    Fixed-memory metrics over an unbounded span stream.
+
+    Usage:
+        metrics = StreamingMetrics()
+        metrics.record(span)
+        metrics.sre_metrics()
+        metrics.agent_kpis("L")
+    """
+
+    def __init__(
+        self,
+        recent_capacity: int = DEFAULT_RECENT_CAPACITY,
+        window_sec: float = DEFAULT_WINDOW_SEC,
+        max_series: int = DEFAULT_MAX_SERIES,
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+    ):
+        """
+        Args:
+            recent_capacity: Spans kept in the recent ring buffer
+            window_sec: Window for span/error rates
+            max_series: Maximum distinct (name, agent) series; further
+                series are folded into OVERFLOW_SERIES
+            relative_accuracy: Quantile sketch accuracy
+        """
+        self.max_series = max_series
+        self._accuracy = relative_accuracy
+        self.recent: Deque[Span] = deque(maxlen=recent_capacity)
+        self.total = SeriesStats(relative_accuracy)
+        self.series: Dict[Tuple[str, Optional[str]], SeriesStats] = {}
+        self.errors_by_type: Dict[str, int] = {}
+        self.span_window = WindowedCounter(window_sec)
+        self.error_window = WindowedCounter(window_sec)
+
+    def record(self, span: Span) -> None:
+        """Fold a finished span into the aggregates."""
+        self.recent.append(span)
+        self.total.record(span)
+
+        key = (span.name, _span_agent(span))
+        stats = self.series.get(key)
+        if stats is None:
+            if len(self.series) >= self.max_series:
+                key = (OVERFLOW_SERIES, None)
+                stats = self.series.get(key)
+            if stats is None:
+                stats = self.series[key] = SeriesStats(self._accuracy)
+        stats.record(span)
+
+        self.span_window.add()
+        if span.status == SpanStatus.ERROR:
+            self.error_window.add()
+            if span.name in self.errors_by_type or len(self.errors_by_type) < self.max_series:
+                self.errors_by_type[span.name] = self.errors_by_type.get(span.name, 0) + 1
+            else:
+                self.errors_by_type[OVERFLOW_SERIES] = (
+                    self.errors_by_type.get(OVERFLOW_SERIES, 0) + 1
+                )
+
+    def record_many(self, spans: Iterable[Span]) -> "StreamingMetrics":
+        for span in spans:
+            self.record(span)
+        return self
+
+    def sre_metrics(self) -> Dict[str, Any]:
+        """SRE metrics over everything recorded (MetricsAggregator format)."""
+        total = self.total
+        latency = total.latency
+        return {
+            "span_count": total.count,
+            "error_count": total.error_count,
+            "error_rate": total.error_count / total.count if total.count else 0.0,
+            "p50_latency_ms": latency.quantile(0.50),
+            "p95_latency_ms": latency.quantile(0.95),
+            "p99_latency_ms": latency.quantile(0.99),
+            "avg_latency_ms": latency.mean,
+            "max_latency_ms": latency.max if latency.count else 0,
+            "errors_by_type": dict(self.errors_by_type),
+            "spans_per_sec": self.span_window.rate(),
+            "errors_per_sec": self.error_window.rate(),
+            "timestamp": datetime.utcnow().isoformat(),
+        }
+
+    def agent_kpis(self, agent_name: str, period: str = "1h") -> Dict[str, Any]:
+        """
+        Agent KPIs, merging every series whose span name contains agent_name
+        or whose agent is agent_name.
+        """
+        merged = SeriesStats(self._accuracy)
+        task_count = 0
+        tool_count = 0
+        for (name, agent), stats in self.series.items():
+            if agent_name in name or agent == agent_name:
+                merged.merge(stats)
+                if "task" in name:
+                    task_count += stats.count
+                if name.startswith("tool."):
+                    tool_count += stats.count
+        if merged.count == 0:
+            return {}
+
+        return {
+            "agent_name": agent_name,
+            "success_rate": merged.ok_count / merged.count,
+            "tool_efficiency": task_count / max(1, tool_count) if tool_count else 0.0,
+            "total_cost_usd": merged.cost_usd,
+            "avg_latency_ms": merged.latency.mean,
+            "p95_latency_ms": merged.latency.quantile(0.95),
+            "period": period,
+        }
+
+    def series_quantiles(
+        self, quantiles: Tuple[float, ...] = (0.5, 0.95, 0.99)
+    ) -> List[Dict[str, Any]]:
+        """Per-series counts and latency quantiles."""
+        return [
+            {
+                "name": name,
+                "agent": agent,
+                "count": stats.count,
+                "error_count": stats.error_count,
+                **{f"p{int(q * 100)}_latency_ms": stats.latency.quantile(q) for q in quantiles},
+            }
+            for (name, agent), stats in self.series.items()
+        ]
+
+
+__all__ = [
+    "QuantileSketch",
+    "WindowedCounter",
+    "SeriesStats",
+    "StreamingMetrics",
+    "OVERFLOW_SERIES",
+]
@@ -30,7 +30,7 @@ from enum import Enum
 from typing import Any, Optional
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 # =============================================================================
@@ -137,6 +137,20 @@ class PacketMetadata(BaseModel):
     model_config = {"frozen": True, "extra": "allow"}
 
 
+class _CanonicalMemo:
+    """Per-instance memo of the canonical hash input; never affects equality."""
+
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value: Optional[bytes] = None
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _CanonicalMemo)
+
+    __hash__ = None  # type: ignore[assignment]
+
+
 # =============================================================================
 # Canonical PacketEnvelope v2.0.0
 # =============================================================================
@@ -211,6 +225,15 @@ class PacketEnvelope(BaseModel):
         "extra": "forbid",
     }
 
+    # Canonical bytes are computed once per instance (the envelope is frozen)
+    _canonical: _CanonicalMemo = PrivateAttr(default_factory=_CanonicalMemo)
+
+    def model_copy(self, *, update: Optional[dict[str, Any]] = None, deep: bool = False):
+        """Copy the envelope; the copy recomputes its canonical bytes."""
+        copy = super().model_copy(update=update, deep=deep)
+        copy._canonical = _CanonicalMemo()
+        return copy
+
     def with_mutation(self, **updates) -> "PacketEnvelope":
         """
         Create a new PacketEnvelope with updates, linking to this as parent.
@@ -270,6 +293,26 @@ class PacketEnvelope(BaseModel):
         """
         return self.with_mutation(**updates)
 
+    def _build_canonical_bytes(self) -> bytes:
+        content = {
+            "payload": self.payload,
+            "metadata": self.metadata.model_dump() if self.metadata else {},
+            "timestamp": self.timestamp.isoformat() if self.timestamp else None,
+        }
+        return json.dumps(content, sort_keys=True, default=str).encode("utf-8")
+
+    def canonical_bytes(self) -> bytes:
+        """
+        Canonical byte form of payload, metadata and timestamp.
+
+        Sorted-key JSON, byte-identical to what earlier versions hashed, so
+        stored content hashes stay valid. Cached on the instance.
+        """
+        memo = self._canonical
+        if memo.value is None:
+            memo.value = self._build_canonical_bytes()
+        return memo.value
+
     def compute_content_hash(self) -> str:
         """
         Compute SHA-256 hash of payload and metadata for integrity verification.
@@ -282,13 +325,7 @@ class PacketEnvelope(BaseModel):
         Returns:
             64-character hex SHA-256 hash
         """
-        content = {
-            "payload": self.payload,
-            "metadata": self.metadata.model_dump() if self.metadata else {},
-            "timestamp": self.timestamp.isoformat() if self.timestamp else None,
-        }
-        content_bytes = json.dumps(content, sort_keys=True, default=str).encode("utf-8")
-        return hashlib.sha256(content_bytes).hexdigest()
+        return hashlib.sha256(self.canonical_bytes()).hexdigest()
 
     def with_content_hash(self) -> "PacketEnvelope":
         """
@@ -312,7 +349,9 @@ class PacketEnvelope(BaseModel):
         """
         if not self.content_hash:
             return False
-        return self.content_hash == self.compute_content_hash()
+        # Recomputed rather than cached: payload dicts can be mutated in place
+        content_bytes = self._build_canonical_bytes()
+        return self.content_hash == hashlib.sha256(content_bytes).hexdigest()
 
 
 # =============================================================================
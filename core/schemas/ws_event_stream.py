@@ -5,7 +5,8 @@ L9 Core Schemas - WebSocket Event Stream
 WebSocket-specific event stream types for L9 agent communication.
 
 Defines:
-- EventType: High-level event categories for WS messages
+- EventType: High-level event categories for WS messages (including
+  streamed reasoning/tool call deltas from AgentExecutorService)
 - EventMessage: Canonical event structure for WS frames
 - AgentHeartbeat: Periodic health check from agents
 - ErrorEvent: Error reporting structure
@@ -13,7 +14,7 @@ Defines:
 These types complement the security event stream with WebSocket-specific
 transport models.
 
-Version: 1.0.0
+Version: 1.1.0
 """
 
 from __future__ import annotations
@@ -45,6 +46,8 @@ class EventType(str, Enum):
     CONTROL = "control"
     HANDSHAKE = "handshake"
     LOG = "log"
+    REASONING_DELTA = "reasoning_delta"
+    TOOL_CALL_DELTA = "tool_call_delta"
 
 
 # =============================================================================
@@ -160,6 +160,18 @@ class ToolRegistry:
         self._tools: dict[str, ToolMetadata] = {}
         self._executors: dict[str, Any] = {}  # Tool instances
         self._rate_limiter = RateLimitWindow(rate_window_seconds)
+        self._version = 0  # Bumped on every register/enable/disable
+
+    @property
+    def version(self) -> int:
+        """
+        Monotonic change counter for the tool set.
+
+        Consumers (e.g. ExecutorToolRegistry's binding cache) use it to detect
+        registrations and enable/disable changes. Mutating ToolMetadata in place
+        bypasses it - go through register/enable/disable instead.
+        """
+        return self._version
 
     def register(
         self,
@@ -176,6 +188,7 @@ class ToolRegistry:
         self._tools[metadata.id] = metadata
         if executor:
             self._executors[metadata.id] = executor
+        self._version += 1
 
         logger.info(f"Registered tool: {metadata.name} ({metadata.id})")
 
@@ -211,12 +224,14 @@ class ToolRegistry:
         """Disable a tool."""
         if tool_id in self._tools:
             self._tools[tool_id].enabled = False
+            self._version += 1
             logger.info(f"Disabled tool: {tool_id}")
 
     def enable(self, tool_id: str) -> None:
         """Enable a tool."""
         if tool_id in self._tools:
             self._tools[tool_id].enabled = True
+            self._version += 1
             logger.info(f"Enabled tool: {tool_id}")
 
     def check_rate_limit(self, tool_id: str) -> bool:
@@ -86,10 +86,13 @@ from __future__ import annotations
 import asyncio
 import structlog
 import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Optional, Protocol, TYPE_CHECKING
 from uuid import uuid4
 
+from core.agents.agent_instance import ToolDefinitionSet, build_tool_definitions
 from core.agents.schemas import (
     ToolBinding,
     ToolCallResult,
@@ -184,6 +187,18 @@ HIGH_RISK_TOOLS = {
 }
 
 
+# Max (agent_id, principal_id, ...) entries kept in the binding cache
+DEFAULT_BINDING_CACHE_SIZE = 256
+
+
+@dataclass(frozen=True)
+class _CachedBindings:
+    """Approved bindings for one agent/principal plus their OpenAI definitions."""
+
+    bindings: tuple[ToolBinding, ...]
+    tool_definitions: ToolDefinitionSet
+
+
 # =============================================================================
 # Executor Tool Registry
 # =============================================================================
@@ -236,6 +251,16 @@ class ExecutorToolRegistry:
             str, set[str]
         ] = {}  # agent_id -> approved tool IDs
 
+        # Approved-tool binding cache, keyed on
+        # (agent_id, principal_id, registry version, policy version).
+        # approve/revoke/register_tool/set_governance_engine bump
+        # _approvals_version and drop the cache.
+        self._binding_cache: OrderedDict[tuple, _CachedBindings] = OrderedDict()
+        self._binding_cache_size = DEFAULT_BINDING_CACHE_SIZE
+        self._approvals_version = 0
+        self._binding_cache_hits = 0
+        self._binding_cache_misses = 0
+
         logger.info(
             "ExecutorToolRegistry initialized: governance=%s, engine=%s, tools=%d",
             governance_enabled,
@@ -246,6 +271,7 @@ class ExecutorToolRegistry:
     def set_governance_engine(self, engine: "GovernanceEngineService") -> None:
         """Attach a governance engine for policy evaluation."""
         self._governance_engine = engine
+        self.invalidate_binding_cache()
         logger.info("Governance engine attached to tool registry")
 
     # =========================================================================
@@ -264,6 +290,9 @@ class ExecutorToolRegistry:
         Uses governance engine for policy-based filtering if available,
         falls back to hardcoded rules otherwise.
 
+        Results are cached per (agent_id, principal_id, registry version,
+        policy version); see _get_cached_bindings.
+
         Args:
             agent_id: Agent identifier
             principal_id: Principal requesting tools
@@ -271,14 +300,109 @@ class ExecutorToolRegistry:
         Returns:
             List of approved ToolBinding objects
         """
+        return list(self._get_cached_bindings(agent_id, principal_id).bindings)
+
+    def get_tool_definition_set(
+        self,
+        agent_id: str,
+        principal_id: str,
+    ) -> ToolDefinitionSet:
+        """
+        Get precomputed OpenAI tool definitions for an agent's approved tools.
+
+        Shares the binding cache with get_approved_tools, so the definitions
+        are only rebuilt when tools, approvals or policies change.
+
+        Args:
+            agent_id: Agent identifier
+            principal_id: Principal requesting tools
+
+        Returns:
+            ToolDefinitionSet matching get_approved_tools(agent_id, principal_id)
+        """
+        return self._get_cached_bindings(agent_id, principal_id).tool_definitions
+
+    def invalidate_binding_cache(self) -> None:
+        """Drop cached approved-tool bindings (approvals or tool set changed)."""
+        self._approvals_version += 1
+        self._binding_cache.clear()
+
+    def get_binding_cache_stats(self) -> dict[str, int]:
+        """Get approved-tool binding cache statistics."""
+        return {
+            "hits": self._binding_cache_hits,
+            "misses": self._binding_cache_misses,
+            "size": len(self._binding_cache),
+            "max_size": self._binding_cache_size,
+        }
+
+    def _binding_cache_key(self, agent_id: str, principal_id: str) -> Optional[tuple]:
+        """
+        Build the binding cache key, or None if changes cannot be detected.
+
+        Registries and engines without an integer version counter (legacy or
+        test doubles) are never cached.
+        """
+        registry_version = getattr(self._registry, "version", None)
+        if not isinstance(registry_version, int):
+            return None
+
+        policy_version = 0
+        if self._governance_engine is not None:
+            policy_version = getattr(self._governance_engine, "policy_version", None)
+            if not isinstance(policy_version, int):
+                return None
+
+        return (
+            agent_id,
+            principal_id,
+            (registry_version, self._approvals_version),
+            policy_version,
+        )
+
+    def _get_cached_bindings(
+        self,
+        agent_id: str,
+        principal_id: str,
+    ) -> _CachedBindings:
+        """Get approved bindings + definitions, building them on cache miss."""
+        key = self._binding_cache_key(agent_id, principal_id)
+        if key is not None:
+            cached = self._binding_cache.get(key)
+            if cached is not None:
+                self._binding_cache_hits += 1
+                self._binding_cache.move_to_end(key)
+                return cached
+
+        self._binding_cache_misses += 1
+        bindings = self._build_approved_tools(agent_id, principal_id)
+        entry = _CachedBindings(
+            bindings=tuple(bindings),
+            tool_definitions=build_tool_definitions(bindings),
+        )
+
+        if key is not None:
+            self._binding_cache[key] = entry
+            if len(self._binding_cache) > self._binding_cache_size:
+                self._binding_cache.popitem(last=False)
+
+        return entry
+
+    def _build_approved_tools(
+        self,
+        agent_id: str,
+        principal_id: str,
+    ) -> list[ToolBinding]:
+        """Build the approved ToolBinding list from scratch (uncached)."""
         if self._registry is None:
             return []
 
         bindings: list[ToolBinding] = []
 
+        # GMP-44: Auto-discover tool capabilities from ToolDefinition.agent_id
+        # instead of manual DEFAULT_L_CAPABILITIES allowlist.
+        candidate_tools = []
         for tool_meta in self._registry.list_enabled():
-            # GMP-44: Auto-discover tool capabilities from ToolDefinition.agent_id
-            # instead of manual DEFAULT_L_CAPABILITIES allowlist.
             if not _tool_belongs_to_agent(tool_meta.id, agent_id):
                 logger.debug(
                     "Tool %s denied for agent %s by auto-discovery (agent_id mismatch)",
@@ -286,15 +410,32 @@ class ExecutorToolRegistry:
                     agent_id,
                 )
                 continue
+            candidate_tools.append(tool_meta)
+
+        # Evaluate governance for all candidate tools in one bulk call
+        policy_decisions: Optional[dict[str, bool]] = None
+        if self._governance_engine and hasattr(
+            self._governance_engine, "evaluate_many"
+        ):
+            policy_decisions = self._governance_engine.evaluate_many(
+                subject=agent_id,
+                action="tool.execute",
+                resources=[tool_meta.id for tool_meta in candidate_tools],
+                context={"principal_id": principal_id},
+            )
 
+        for tool_meta in candidate_tools:
             # Use governance engine if available
             if self._governance_engine:
-                allowed = self._governance_engine.is_allowed(
-                    subject=agent_id,
-                    action="tool.execute",
-                    resource=tool_meta.id,
-                    context={"principal_id": principal_id},
-                )
+                if policy_decisions is not None:
+                    allowed = policy_decisions.get(tool_meta.id, False)
+                else:
+                    allowed = self._governance_engine.is_allowed(
+                        subject=agent_id,
+                        action="tool.execute",
+                        resource=tool_meta.id,
+                        context={"principal_id": principal_id},
+                    )
                 if not allowed:
                     logger.debug(
                         "Tool %s denied for agent %s by governance policy",
@@ -1018,6 +1159,7 @@ class ExecutorToolRegistry:
         if agent_id not in self._approved_overrides:
             self._approved_overrides[agent_id] = set()
         self._approved_overrides[agent_id].add(tool_id)
+        self.invalidate_binding_cache()
 
         logger.info("Approved tool %s for agent %s", tool_id, agent_id)
 
@@ -1031,6 +1173,7 @@ class ExecutorToolRegistry:
         """
         if agent_id in self._approved_overrides:
             self._approved_overrides[agent_id].discard(tool_id)
+        self.invalidate_binding_cache()
 
         logger.info("Revoked tool %s for agent %s", tool_id, agent_id)
 
@@ -1668,6 +1811,7 @@ class ExecutorToolRegistry:
                 **kwargs,
             )
             self._registry.register(metadata, executor)
+            self.invalidate_binding_cache()
 
         except ImportError:
             logger.error("Cannot register tool: tool_registry not available")
@@ -8,7 +8,14 @@ Tracks tool dependencies in Neo4j for:
 - Detecting circular dependencies
 - API usage monitoring
 
-Version: 1.1.0 (UKG Phase 2 - Unified Knowledge Graph)
+Version: 1.2.0 (UKG Phase 2 - Unified Knowledge Graph)
+
+Changes v1.2.0:
+- register_tools(): UNWIND-based bulk registration in one transaction
+  (register_l9_tools / register_l_tools use it at startup)
+- log_tool_call() enqueues into a buffered ToolCallEventLogger that writes
+  batches of tool call events with a single UNWIND statement, off the
+  tool call's critical path
 
 Changes v1.1.0:
 - CAN_EXECUTE replaces HAS_TOOL (unified relationship)
@@ -18,12 +25,15 @@ Changes v1.1.0:
 
 from __future__ import annotations
 
+import asyncio
 import re
 import structlog
 import os
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Optional
+from uuid import uuid4
 
 logger = structlog.get_logger(__name__)
 
@@ -37,6 +47,63 @@ DEFAULT_TENANT_ID = os.getenv("L9_TENANT_ID", "l-cto")
 # OpenAI function calling requires tool names to match this pattern
 OPENAI_TOOL_NAME_PATTERN = re.compile(r"^[a-zA-Z0-9_-]+$")
 
+# Tool call event logger buffering (see ToolCallEventLogger)
+TOOL_CALL_LOG_BUFFER_SIZE = int(os.getenv("L9_TOOL_CALL_LOG_BUFFER_SIZE", "10000"))
+TOOL_CALL_LOG_BATCH_SIZE = int(os.getenv("L9_TOOL_CALL_LOG_BATCH_SIZE", "500"))
+TOOL_CALL_LOG_FLUSH_INTERVAL = float(os.getenv("L9_TOOL_CALL_LOG_FLUSH_INTERVAL", "1.0"))
+
+# =============================================================================
+# Bulk Cypher (UNWIND) - same writes as create_entity / create_relationship /
+# create_event, one statement per kind instead of one session per row
+# =============================================================================
+
+MERGE_TOOLS_QUERY = """
+UNWIND $rows AS row
+MERGE (n:Tool {id: row.id})
+SET n += row.properties
+"""
+
+MERGE_APIS_QUERY = """
+UNWIND $rows AS row
+MERGE (n:API {id: row.id})
+SET n += row.properties
+"""
+
+MERGE_USES_QUERY = """
+UNWIND $rows AS row
+MATCH (a:Tool {id: row.source})
+MATCH (b:API {id: row.target})
+MERGE (a)-[:USES]->(b)
+"""
+
+MERGE_DEPENDS_ON_QUERY = """
+UNWIND $rows AS row
+MATCH (a:Tool {id: row.source})
+MATCH (b:Tool {id: row.target})
+MERGE (a)-[:DEPENDS_ON]->(b)
+"""
+
+# Relationship type is ToolGraph.AGENT_TOOL_REL (unified CAN_EXECUTE)
+MERGE_AGENT_TOOLS_QUERY = """
+UNWIND $rows AS row
+MATCH (a:Agent {id: row.source})
+MATCH (b:Tool {id: row.target})
+MERGE (a)-[r:CAN_EXECUTE]->(b)
+SET r += row.properties
+"""
+
+LOG_TOOL_CALLS_QUERY = """
+UNWIND $rows AS row
+MERGE (e:Event {id: row.id})
+SET e += row.properties
+WITH e, row
+OPTIONAL MATCH (t:Tool {id: row.tool_name})
+FOREACH (_ IN CASE WHEN t IS NULL THEN [] ELSE [1] END | MERGE (e)-[:INVOKED]->(t))
+WITH e, row
+OPTIONAL MATCH (a:Agent {id: row.agent_id})
+FOREACH (_ IN CASE WHEN a IS NULL THEN [] ELSE [1] END | MERGE (e)-[:BY_AGENT]->(a))
+"""
+
 
 @dataclass
 class ToolDefinition:
@@ -49,6 +116,7 @@ class ToolDefinition:
     agent_id: str | None = None
     category: str = "general"
     is_destructive: bool = False
+    read_only: bool = False  # No side effects; may run concurrently with other read-only calls
     requires_confirmation: bool = False
     scope: str = "internal"  # "internal" | "external" | "requires_igor_approval"
     risk_level: str = "low"  # "low" | "medium" | "high"
@@ -173,18 +241,9 @@ class ToolGraph:
             await neo4j.create_entity(
                 entity_type="Tool",
                 entity_id=tool.name,
-                properties={
-                    "name": tool.name,
-                    "description": tool.description,
-                    "category": tool.category,
-                    "is_destructive": tool.is_destructive,
-                    "requires_confirmation": tool.requires_confirmation,
-                    "scope": tool.scope,
-                    "risk_level": tool.risk_level,
-                    "requires_igor_approval": tool.requires_igor_approval,
-                    "registered_at": datetime.utcnow().isoformat(),
-                    "tenant_id": DEFAULT_TENANT_ID,  # Tenant isolation
-                },
+                properties=ToolGraph._tool_properties(
+                    tool, datetime.utcnow().isoformat()
+                ),
             )
 
             # Create API nodes and USES relationships (with tenant isolation)
@@ -192,11 +251,7 @@ class ToolGraph:
                 await neo4j.create_entity(
                     entity_type="API",
                     entity_id=api,
-                    properties={
-                        "name": api,
-                        "type": "external",
-                        "tenant_id": DEFAULT_TENANT_ID,
-                    },
+                    properties=ToolGraph._api_properties(api),
                 )
                 await neo4j.create_relationship(
                     from_type="Tool",
@@ -239,6 +294,139 @@ class ToolGraph:
             logger.warning(f"Failed to register tool {tool.name}: {e}")
             return False
 
+    @staticmethod
+    async def register_tools(tools: list[ToolDefinition]) -> int:
+        """
+        Register many tools in one Neo4j transaction.
+
+        Produces the same graph as calling register_tool() for each tool,
+        but with one UNWIND statement per node/relationship kind instead of
+        a round trip per node and relationship. Because every Tool node is
+        merged before relationships are created, DEPENDS_ON edges between
+        tools in the same batch resolve regardless of list order.
+
+        Falls back to per-tool registration if the client has no
+        transactional bulk API or the transaction fails.
+
+        Args:
+            tools: Tool definitions to register
+
+        Returns:
+            Number of tools registered
+        """
+        if not tools:
+            return 0
+
+        neo4j = await ToolGraph._get_neo4j()
+        if not neo4j:
+            logger.warning(
+                f"Neo4j unavailable - tool graph disabled for {len(tools)} tools. "
+                "Governance queries (blast radius, dependencies) unavailable.",
+                extra={"alert": "neo4j_unavailable", "tool_count": len(tools)}
+            )
+            return 0
+
+        run_write_transaction = getattr(neo4j, "run_write_transaction", None)
+        if run_write_transaction is not None:
+            statements = ToolGraph._registration_statements(tools)
+            if await run_write_transaction(statements):
+                logger.info(
+                    f"Registered {len(tools)} tools in graph "
+                    f"({len(statements)} bulk statements)"
+                )
+                return len(tools)
+            logger.warning(
+                "Bulk tool registration failed - falling back to per-tool registration"
+            )
+
+        count = 0
+        for tool in tools:
+            if await ToolGraph.register_tool(tool):
+                count += 1
+        return count
+
+    @staticmethod
+    def _tool_properties(tool: ToolDefinition, registered_at: str) -> dict[str, Any]:
+        """Tool node properties (with tenant isolation)."""
+        return {
+            "name": tool.name,
+            "description": tool.description,
+            "category": tool.category,
+            "is_destructive": tool.is_destructive,
+            "read_only": tool.read_only,
+            "requires_confirmation": tool.requires_confirmation,
+            "scope": tool.scope,
+            "risk_level": tool.risk_level,
+            "requires_igor_approval": tool.requires_igor_approval,
+            "registered_at": registered_at,
+            "tenant_id": DEFAULT_TENANT_ID,  # Tenant isolation
+        }
+
+    @staticmethod
+    def _api_properties(api: str) -> dict[str, Any]:
+        """API node properties (with tenant isolation)."""
+        return {
+            "name": api,
+            "type": "external",
+            "tenant_id": DEFAULT_TENANT_ID,
+        }
+
+    @staticmethod
+    def _registration_statements(
+        tools: list[ToolDefinition],
+    ) -> list[tuple[str, dict[str, Any]]]:
+        """Build the UNWIND statements that register a batch of tools."""
+        registered_at = datetime.utcnow().isoformat()
+
+        tool_rows = [
+            {"id": tool.name, "properties": ToolGraph._tool_properties(tool, registered_at)}
+            for tool in tools
+        ]
+        api_names = list(dict.fromkeys(api for tool in tools for api in tool.external_apis))
+        api_rows = [{"id": api, "properties": ToolGraph._api_properties(api)} for api in api_names]
+        uses_rows = [
+            {"source": tool.name, "target": api}
+            for tool in tools
+            for api in tool.external_apis
+        ]
+        depends_rows = [
+            {"source": tool.name, "target": dep}
+            for tool in tools
+            for dep in tool.internal_dependencies
+        ]
+        agent_rows = [
+            {
+                "source": tool.agent_id,
+                "target": tool.name,
+                "properties": {
+                    "scope": tool.scope,
+                    "requires_approval": tool.requires_igor_approval,
+                },
+            }
+            for tool in tools
+            if tool.agent_id
+        ]
+
+        statements: list[tuple[str, dict[str, Any]]] = [
+            (MERGE_TOOLS_QUERY, {"rows": tool_rows})
+        ]
+        if api_rows:
+            statements.append((MERGE_APIS_QUERY, {"rows": api_rows}))
+            statements.append((MERGE_USES_QUERY, {"rows": uses_rows}))
+        if depends_rows:
+            statements.append((MERGE_DEPENDS_ON_QUERY, {"rows": depends_rows}))
+        if agent_rows:
+            # UKG Phase 2: ensure agents exist first (shares nodes with Graph State)
+            try:
+                from core.agents.graph_state.schema import ENSURE_AGENTS_QUERY
+
+                agent_ids = list(dict.fromkeys(row["source"] for row in agent_rows))
+                statements.append((ENSURE_AGENTS_QUERY, {"agent_ids": agent_ids}))
+            except ImportError:
+                pass
+            statements.append((MERGE_AGENT_TOOLS_QUERY, {"rows": agent_rows}))
+        return statements
+
     @staticmethod
     async def get_api_dependents(api_name: str) -> list[str]:
         """
@@ -405,7 +593,7 @@ class ToolGraph:
         Also supports legacy HAS_TOOL for backward compatibility.
 
         Returns:
-            List of dicts with tool metadata: name, description, category, scope, risk_level, requires_igor_approval
+            List of dicts with tool metadata: name, description, category, scope, risk_level, requires_igor_approval, is_destructive, read_only
         """
         neo4j = await ToolGraph._get_neo4j()
         if not neo4j:
@@ -432,6 +620,8 @@ class ToolGraph:
                         "requires_igor_approval": tool.get(
                             "requires_igor_approval", False
                         ),
+                        "is_destructive": tool.get("is_destructive", False),
+                        "read_only": tool.get("read_only", False),
                     }
                 )
 
@@ -450,7 +640,7 @@ class ToolGraph:
         """
         Log a tool call event.
 
-        Creates:
+        Creates (asynchronously, in batches - see ToolCallEventLogger):
         - Event node for the tool call
         - Relationships to tool and agent
 
@@ -458,50 +648,208 @@ class ToolGraph:
         - Tool usage frequency
         - Error rates per tool
         - Performance metrics
+
+        Returns:
+            True if the event was queued for writing
         """
         neo4j = await ToolGraph._get_neo4j()
         if not neo4j:
             return False
 
-        try:
-            from uuid import uuid4
+        return get_tool_call_logger().log(
+            tool_name=tool_name,
+            agent_id=agent_id,
+            success=success,
+            duration_ms=duration_ms,
+            error=error,
+        )
 
-            event_id = f"tool_call:{uuid4()}"
 
-            await neo4j.create_event(
-                event_id=event_id,
-                event_type="tool_call",
-                timestamp=datetime.utcnow().isoformat(),
-                properties={
+# =============================================================================
+# Buffered Tool Call Logging
+# =============================================================================
+
+
+class ToolCallEventLogger:
+    """
+    Buffered writer for tool call events.
+
+    log() only appends to a bounded buffer (the oldest events are dropped
+    on overflow); a background task writes batches with one UNWIND
+    statement (LOG_TOOL_CALLS_QUERY) every flush_interval seconds, or
+    sooner once batch_size events are pending. Event timestamps are taken
+    at log() time, so batching does not shift them.
+
+    All methods are expected to run on one event loop.
+    """
+
+    def __init__(
+        self,
+        buffer_size: int = TOOL_CALL_LOG_BUFFER_SIZE,
+        batch_size: int = TOOL_CALL_LOG_BATCH_SIZE,
+        flush_interval: float = TOOL_CALL_LOG_FLUSH_INTERVAL,
+    ):
+        """
+        Args:
+            buffer_size: Max events held in memory
+            batch_size: Max events per write; a full batch wakes the flusher
+            flush_interval: Seconds between background flushes
+        """
+        self._buffer: deque[dict[str, Any]] = deque(maxlen=max(buffer_size, 1))
+        self._batch_size = max(batch_size, 1)
+        self._flush_interval = flush_interval
+
+        self._write_lock = asyncio.Lock()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._flusher: Optional[asyncio.Task] = None
+        self._closed = False
+
+        self._logged = 0
+        self._written = 0
+        self._dropped = 0
+        self._failed = 0
+        self._batches = 0
+
+    def log(
+        self,
+        tool_name: str,
+        agent_id: str,
+        success: bool,
+        duration_ms: int | None = None,
+        error: str | None = None,
+    ) -> bool:
+        """
+        Queue a tool call event.
+
+        Returns:
+            False if the logger is closed
+        """
+        if self._closed:
+            return False
+
+        if len(self._buffer) == self._buffer.maxlen:
+            self._dropped += 1
+        self._buffer.append(
+            {
+                "id": f"tool_call:{uuid4()}",
+                "tool_name": tool_name,
+                "agent_id": agent_id,
+                "properties": {
                     "tool_name": tool_name,
                     "agent_id": agent_id,
                     "success": success,
                     "duration_ms": duration_ms,
                     "error": error,
+                    "event_type": "tool_call",
+                    "timestamp": datetime.utcnow().isoformat(),
                 },
-            )
+            }
+        )
+        self._logged += 1
 
-            # Link to tool
-            await neo4j.create_relationship(
-                from_type="Event",
-                from_id=event_id,
-                to_type="Tool",
-                to_id=tool_name,
-                rel_type="INVOKED",
-            )
+        self._ensure_flusher()
+        if len(self._buffer) >= self._batch_size and self._wakeup is not None:
+            self._wakeup.set()
+        return True
 
-            # Link to agent
-            await neo4j.create_relationship(
-                from_type="Event",
-                from_id=event_id,
-                to_type="Agent",
-                to_id=agent_id,
-                rel_type="BY_AGENT",
-            )
+    async def flush(self) -> int:
+        """
+        Write every buffered event.
 
-            return True
-        except Exception:
-            return False
+        Returns:
+            Number of events written
+        """
+        written = 0
+        async with self._write_lock:
+            while self._buffer:
+                batch = [
+                    self._buffer.popleft()
+                    for _ in range(min(self._batch_size, len(self._buffer)))
+                ]
+                written += await self._write_batch(batch)
+        return written
+
+    async def close(self) -> None:
+        """Stop the background flusher and write what is buffered."""
+        self._closed = True
+        if self._flusher is not None:
+            self._flusher.cancel()
+            try:
+                await self._flusher
+            except asyncio.CancelledError:
+                pass
+            self._flusher = None
+        await self.flush()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get logger counters."""
+        return {
+            "buffered": len(self._buffer),
+            "logged": self._logged,
+            "written": self._written,
+            "dropped": self._dropped,
+            "failed": self._failed,
+            "batches": self._batches,
+        }
+
+    async def _write_batch(self, batch: list[dict[str, Any]]) -> int:
+        neo4j = await ToolGraph._get_neo4j()
+        run_write_transaction = getattr(neo4j, "run_write_transaction", None)
+        if run_write_transaction is None or not await run_write_transaction(
+            [(LOG_TOOL_CALLS_QUERY, {"rows": batch})]
+        ):
+            self._failed += len(batch)
+            logger.warning("tool_call_log.batch_failed", events=len(batch))
+            return 0
+
+        self._batches += 1
+        self._written += len(batch)
+        return len(batch)
+
+    def _ensure_flusher(self) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        flusher = self._flusher
+        if flusher is not None and not flusher.done() and flusher.get_loop() is loop:
+            return
+        self._wakeup = asyncio.Event()
+        self._flusher = loop.create_task(self._flush_loop())
+
+    async def _flush_loop(self) -> None:
+        assert self._wakeup is not None
+        while not self._closed:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self._flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            if not self._buffer:
+                continue
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.warning("tool_call_log.flush_failed", error=str(e))
+
+
+_tool_call_logger: Optional[ToolCallEventLogger] = None
+
+
+def get_tool_call_logger() -> ToolCallEventLogger:
+    """Get or create the process-wide tool call event logger."""
+    global _tool_call_logger
+    if _tool_call_logger is None:
+        _tool_call_logger = ToolCallEventLogger()
+    return _tool_call_logger
+
+
+async def close_tool_call_logger() -> None:
+    """Flush and close the tool call event logger (call before closing Neo4j)."""
+    global _tool_call_logger
+    if _tool_call_logger is not None:
+        await _tool_call_logger.close()
+        _tool_call_logger = None
 
 
 # =============================================================================
@@ -516,6 +864,7 @@ def create_tool_definition(
     scope: str = "internal",
     risk_level: str = "low",
     is_destructive: bool = False,
+    read_only: bool = False,
     requires_confirmation: bool = False,
     external_apis: list[str] | None = None,
     internal_dependencies: list[str] | None = None,
@@ -531,6 +880,7 @@ def create_tool_definition(
         scope: Tool scope ("internal", "external", "requires_igor_approval")
         risk_level: Risk level ("low", "medium", "high")
         is_destructive: Whether tool can cause data loss or system changes
+        read_only: Whether tool is free of side effects (parallel-safe)
         requires_confirmation: Whether tool requires user confirmation
         external_apis: List of external API dependencies
         internal_dependencies: List of internal tool dependencies
@@ -556,6 +906,7 @@ def create_tool_definition(
         scope=scope,
         risk_level=risk_level,
         is_destructive=is_destructive,
+        read_only=read_only,
         requires_confirmation=requires_confirmation,
         external_apis=external_apis or [],
         internal_dependencies=internal_dependencies or [],
@@ -570,6 +921,7 @@ async def register_tool_with_metadata(
     scope: str = "internal",
     risk_level: str = "low",
     is_destructive: bool = False,
+    read_only: bool = False,
     requires_confirmation: bool = False,
     external_apis: list[str] | None = None,
     internal_dependencies: list[str] | None = None,
@@ -587,6 +939,7 @@ async def register_tool_with_metadata(
         scope: Tool scope
         risk_level: Risk level
         is_destructive: Whether tool can cause data loss
+        read_only: Whether tool is free of side effects
         requires_confirmation: Whether tool requires confirmation
         external_apis: External API dependencies
         internal_dependencies: Internal tool dependencies
@@ -612,6 +965,7 @@ async def register_tool_with_metadata(
         scope=scope,
         risk_level=risk_level,
         is_destructive=is_destructive,
+        read_only=read_only,
         requires_confirmation=requires_confirmation,
         external_apis=external_apis,
         internal_dependencies=internal_dependencies,
@@ -680,10 +1034,7 @@ async def register_l9_tools() -> int:
     Returns:
         Number of tools registered
     """
-    count = 0
-    for tool in L9_TOOLS:
-        if await ToolGraph.register_tool(tool):
-            count += 1
+    count = await ToolGraph.register_tools(L9_TOOLS)
 
     logger.info(f"Registered {count}/{len(L9_TOOLS)} tools in Neo4j graph")
     return count
@@ -701,6 +1052,7 @@ L_INTERNAL_TOOLS = [
         category="memory",
         scope="internal",
         is_destructive=False,
+        read_only=True,
         requires_confirmation=False,
         external_apis=["PostgreSQL"],
         agent_id="L",
@@ -711,6 +1063,7 @@ L_INTERNAL_TOOLS = [
         category="memory",
         scope="internal",
         is_destructive=False,
+        read_only=True,
         requires_confirmation=False,
         external_apis=["PostgreSQL", "OpenAI"],
         internal_dependencies=["memory_read"],
@@ -733,6 +1086,7 @@ L_INTERNAL_TOOLS = [
         category="memory",
         scope="internal",
         is_destructive=False,
+        read_only=True,
         requires_confirmation=False,
         external_apis=["PostgreSQL"],
         agent_id="L",
@@ -743,6 +1097,7 @@ L_INTERNAL_TOOLS = [
         category="memory",
         scope="internal",
         is_destructive=False,
+        read_only=True,
         requires_confirmation=False,
         external_apis=["PostgreSQL"],
         agent_id="L",
@@ -753,6 +1108,7 @@ L_INTERNAL_TOOLS = [
         category="memory",
         scope="internal",
         is_destructive=False,
+        read_only=True,
         requires_confirmation=False,
         external_apis=["PostgreSQL"],
         agent_id="L",
@@ -763,6 +1119,7 @@ L_INTERNAL_TOOLS = [
         category="memory",
         scope="internal",
         is_destructive=False,
+        read_only=True,
         requires_confirmation=False,
         external_apis=["PostgreSQL"],
         agent_id="L",
@@ -773,6 +1130,7 @@ L_INTERNAL_TOOLS = [
         category="memory",
         scope="internal",
         is_destructive=False,
+        read_only=True,
         requires_confirmation=False,
         external_apis=["PostgreSQL"],
         agent_id="L",
@@ -783,6 +1141,7 @@ L_INTERNAL_TOOLS = [
         category="memory",
         scope="internal",
         is_destructive=False,
+        read_only=True,
         requires_confirmation=False,
         external_apis=["PostgreSQL"],
         agent_id="L",
@@ -793,6 +1152,7 @@ L_INTERNAL_TOOLS = [
         category="memory",
         scope="internal",
         is_destructive=False,
+        read_only=True,
         requires_confirmation=False,
         external_apis=["PostgreSQL", "Neo4j"],
         agent_id="L",
@@ -813,6 +1173,7 @@ L_INTERNAL_TOOLS = [
         category="memory",
         scope="internal",
         is_destructive=False,
+        read_only=True,
         requires_confirmation=False,
         external_apis=["OpenAI"],
         agent_id="L",
@@ -824,6 +1185,7 @@ L_INTERNAL_TOOLS = [
         category="memory",
         scope="internal",
         is_destructive=False,
+        read_only=True,
         requires_confirmation=False,
         external_apis=["PostgreSQL", "OpenAI"],
         agent_id="L",
@@ -834,6 +1196,7 @@ L_INTERNAL_TOOLS = [
         category="memory",
         scope="internal",
         is_destructive=False,
+        read_only=True,
         requires_confirmation=False,
         external_apis=["PostgreSQL"],
         agent_id="L",
@@ -844,6 +1207,7 @@ L_INTERNAL_TOOLS = [
         category="memory",
         scope="internal",
         is_destructive=False,
+        read_only=True,
         requires_confirmation=False,
         external_apis=["PostgreSQL"],
         agent_id="L",
@@ -854,6 +1218,7 @@ L_INTERNAL_TOOLS = [
         category="memory",
         scope="internal",
         is_destructive=False,
+        read_only=True,
         requires_confirmation=False,
         external_apis=["PostgreSQL"],
         agent_id="L",
@@ -864,6 +1229,7 @@ L_INTERNAL_TOOLS = [
         category="memory",
         scope="internal",
         is_destructive=False,
+        read_only=True,
         requires_confirmation=False,
         external_apis=["PostgreSQL"],
         agent_id="L",
@@ -874,6 +1240,7 @@ L_INTERNAL_TOOLS = [
         category="memory",
         scope="internal",
         is_destructive=False,
+        read_only=True,
         requires_confirmation=False,
         external_apis=["PostgreSQL"],
         agent_id="L",
@@ -884,6 +1251,7 @@ L_INTERNAL_TOOLS = [
         category="knowledge",
         scope="internal",
         is_destructive=False,
+        read_only=True,
         requires_confirmation=False,
         agent_id="L",
     ),
@@ -893,6 +1261,7 @@ L_INTERNAL_TOOLS = [
         category="knowledge",
         scope="internal",
         is_destructive=False,
+        read_only=True,
         requires_confirmation=False,
         agent_id="L",
     ),
@@ -941,6 +1310,7 @@ L_INTERNAL_TOOLS = [
         category="integration",
         scope="internal",
         is_destructive=False,
+        read_only=True,
         requires_confirmation=False,
         risk_level="low",
         external_apis=["MCP"],
@@ -952,6 +1322,7 @@ L_INTERNAL_TOOLS = [
         category="integration",
         scope="external",
         is_destructive=False,
+        read_only=True,
         requires_confirmation=False,
         risk_level="low",
         external_apis=["MCP"],
@@ -1056,6 +1427,7 @@ L_INTERNAL_TOOLS = [
         category="integration",
         scope="external",
         is_destructive=False,
+        read_only=True,
         requires_confirmation=False,
         risk_level="low",
         external_apis=["Vercel", "MCP"],
@@ -1092,6 +1464,7 @@ L_INTERNAL_TOOLS = [
         category="orchestration",
         scope="internal",
         is_destructive=False,
+        read_only=True,
         requires_confirmation=False,
         risk_level="low",
         internal_dependencies=["memory_search", "mcp_call_tool"],
@@ -1116,6 +1489,7 @@ L_INTERNAL_TOOLS = [
         category="cache",
         scope="internal",
         is_destructive=False,
+        read_only=True,
         requires_confirmation=False,
         risk_level="low",
         external_apis=["Redis"],
@@ -1138,6 +1512,7 @@ L_INTERNAL_TOOLS = [
         category="cache",
         scope="internal",
         is_destructive=False,
+        read_only=True,
         requires_confirmation=False,
         risk_level="low",
         external_apis=["Redis"],
@@ -1183,6 +1558,7 @@ L_INTERNAL_TOOLS = [
         category="cache",
         scope="internal",
         is_destructive=False,
+        read_only=True,
         requires_confirmation=False,
         risk_level="low",
         external_apis=["Redis"],
@@ -1194,6 +1570,7 @@ L_INTERNAL_TOOLS = [
         category="cache",
         scope="internal",
         is_destructive=False,
+        read_only=True,
         requires_confirmation=False,
         risk_level="low",
         external_apis=["Redis"],
@@ -1217,6 +1594,7 @@ L_INTERNAL_TOOLS = [
         category="introspection",
         scope="internal",
         is_destructive=False,
+        read_only=True,
         requires_confirmation=False,
         risk_level="low",
         agent_id="L",
@@ -1227,6 +1605,7 @@ L_INTERNAL_TOOLS = [
         category="introspection",
         scope="internal",
         is_destructive=False,
+        read_only=True,
         requires_confirmation=False,
         risk_level="low",
         agent_id="L",
@@ -1237,6 +1616,7 @@ L_INTERNAL_TOOLS = [
         category="introspection",
         scope="internal",
         is_destructive=False,
+        read_only=True,
         requires_confirmation=False,
         risk_level="low",
         agent_id="L",
@@ -1247,6 +1627,7 @@ L_INTERNAL_TOOLS = [
         category="introspection",
         scope="internal",
         is_destructive=False,
+        read_only=True,
         requires_confirmation=False,
         risk_level="low",
         agent_id="L",
@@ -1257,6 +1638,7 @@ L_INTERNAL_TOOLS = [
         category="introspection",
         scope="internal",
         is_destructive=False,
+        read_only=True,
         requires_confirmation=False,
         risk_level="low",
         agent_id="L",
@@ -1267,6 +1649,7 @@ L_INTERNAL_TOOLS = [
         category="introspection",
         scope="internal",
         is_destructive=False,
+        read_only=True,
         requires_confirmation=False,
         risk_level="low",
         agent_id="L",
@@ -1278,6 +1661,7 @@ L_INTERNAL_TOOLS = [
         category="knowledge",
         scope="internal",
         is_destructive=False,
+        read_only=True,
         requires_confirmation=False,
         risk_level="low",
         agent_id="L",
@@ -1288,6 +1672,7 @@ L_INTERNAL_TOOLS = [
         category="knowledge",
         scope="internal",
         is_destructive=False,
+        read_only=True,
         requires_confirmation=False,
         risk_level="low",
         agent_id="L",
@@ -1308,6 +1693,7 @@ L_INTERNAL_TOOLS = [
         category="knowledge",
         scope="internal",
         is_destructive=False,
+        read_only=True,
         requires_confirmation=False,
         risk_level="low",
         agent_id="L",
@@ -1328,6 +1714,7 @@ L_INTERNAL_TOOLS = [
         category="knowledge",
         scope="internal",
         is_destructive=False,
+        read_only=True,
         requires_confirmation=False,
         risk_level="low",
         agent_id="L",
@@ -1345,10 +1732,7 @@ async def register_l_tools() -> int:
     Returns:
         Number of tools registered
     """
-    count = 0
-    for tool in L_INTERNAL_TOOLS:
-        if await ToolGraph.register_tool(tool):
-            count += 1
+    count = await ToolGraph.register_tools(L_INTERNAL_TOOLS)
 
     logger.info(
         f"Registered {count}/{len(L_INTERNAL_TOOLS)} L agent tools in Neo4j graph"
@@ -1359,6 +1743,9 @@ async def register_l_tools() -> int:
 __all__ = [
     "ToolDefinition",
     "ToolGraph",
+    "ToolCallEventLogger",
+    "get_tool_call_logger",
+    "close_tool_call_logger",
     "create_tool_definition",
     "register_tool_with_metadata",
     "L9_TOOLS",
@@ -507,6 +507,38 @@ class Neo4jClient:
             logger.error(f"Neo4j run_query failed: {e}")
             return []
 
+    async def run_write_transaction(
+        self,
+        statements: list[tuple[str, dict[str, Any]]],
+    ) -> bool:
+        """
+        Run several write statements in a single transaction.
+
+        Intended for UNWIND-based bulk writes: one round trip per statement
+        and all-or-nothing semantics instead of one session per row.
+
+        Args:
+            statements: (Cypher query, parameters) pairs, run in order
+
+        Returns:
+            True if the transaction committed
+        """
+        if not self.is_available():
+            return False
+
+        async def _work(tx) -> None:
+            for query, parameters in statements:
+                result = await tx.run(query, **parameters)
+                await result.consume()
+
+        try:
+            async with self._driver.session(database=self._database) as session:
+                await session.execute_write(_work)
+                return True
+        except Exception as e:
+            logger.error(f"Neo4j run_write_transaction failed: {e}")
+            return False
+
 
 # =============================================================================
 # Singleton Factory
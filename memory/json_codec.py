@@ -0,0 +1,119 @@
+"""
+L9 Memory - JSON Codec
+Version: 1.0.0
+
+Single serialization layer for substrate JSON/JSONB columns.
+
+Uses orjson when installed (native datetime/UUID/Enum support, ~5-10x faster
+than the stdlib) and falls back to the stdlib json module otherwise. The
+codec is registered on every asyncpg connection of the SubstrateRepository
+pool, so repository code passes and receives plain Python objects instead
+of calling json.dumps/json.loads around each query.
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import date, datetime, time
+from enum import Enum
+from typing import Any, Union
+from uuid import UUID
+
+import structlog
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+    ORJSON_AVAILABLE = False
+
+logger = structlog.get_logger(__name__)
+
+if ORJSON_AVAILABLE:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj: Any) -> Any:
+    """Fallback for types neither encoder handles natively."""
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, UUID):
+        return str(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    if isinstance(obj, bytes):
+        return obj.decode("utf-8", errors="replace")
+    return str(obj)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Encode obj as compact UTF-8 JSON bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS)
+    return json.dumps(obj, default=_default, separators=(",", ":")).encode("utf-8")
+
+
+def dumps(obj: Any) -> str:
+    """Encode obj as a compact JSON string."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS).decode("utf-8")
+    return json.dumps(obj, default=_default, separators=(",", ":"))
+
+
+def loads(data: Union[str, bytes, bytearray, memoryview]) -> Any:
+    """Decode JSON text or bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def encode_jsonb(value: Any) -> str:
+    """
+    asyncpg JSON/JSONB encoder.
+
+    Strings are passed through unchanged: callers that still hand over
+    pre-serialized JSON text (json.dumps(...)) keep working.
+    """
+    if isinstance(value, str):
+        return value
+    return dumps(value)
+
+
+def decode_jsonb(value: str) -> Any:
+    """asyncpg JSON/JSONB decoder."""
+    return loads(value)
+
+
+async def register_json_codecs(conn: Any) -> None:
+    """
+    Register the JSON and JSONB codecs on an asyncpg connection.
+
+    Use as the pool's init callback.
+    """
+    for typename in ("jsonb", "json"):
+        await conn.set_type_codec(
+            typename,
+            encoder=encode_jsonb,
+            decoder=decode_jsonb,
+            schema="pg_catalog",
+            format="text",
+        )
+
+
+__all__ = [
+    "ORJSON_AVAILABLE",
+    "dumps",
+    "dumps_bytes",
+    "loads",
+    "encode_jsonb",
+    "decode_jsonb",
+    "register_json_codecs",
+]
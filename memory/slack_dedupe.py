@@ -0,0 +1,326 @@
+"""
+L9 Memory - Slack Event Deduplication
+Version: 1.0.0
+
+Layered dedupe for inbound Slack events, cheapest tier first:
+
+  1. In-process TTL set - retries landing on the same worker
+  2. Redis SET NX EX     - shared across workers; the first delivery claims
+                           the event, so retries are rejected even while the
+                           first one is still being processed
+  3. Postgres            - fallback when Redis is unavailable; looks for an
+                           already stored packet via the expression indexes
+                           from migration 0015
+
+A claim that is not followed by a stored packet is given back with
+release() (processing failed), so the Slack retry gets processed.
+
+Each event is keyed by its event_id and by the composite
+team_id:channel_id:ts:user_id (Slack re-sends the same message with a new
+event_id in some retry paths). Every check records which tier answered
+(telemetry.slack_metrics.record_dedupe_check and stats()).
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+import structlog
+
+try:
+    from telemetry.slack_metrics import record_dedupe_check
+except ImportError:
+    def record_dedupe_check(*args, **kwargs): pass
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_LOCAL_TTL_SECONDS = 600
+DEFAULT_REDIS_TTL_SECONDS = 3600
+DEFAULT_LOCAL_MAX_SIZE = 50_000
+REDIS_KEY_PREFIX = "slack:dedupe"
+
+TIERS = ("local", "redis", "postgres", "none")
+
+
+def dedupe_keys(
+    event_id: Optional[str],
+    team_id: Optional[str],
+    channel_id: Optional[str],
+    ts: Optional[str],
+    user_id: Optional[str],
+) -> List[str]:
+    """Dedupe keys for an event (event_id first, then the composite)."""
+    keys = []
+    if event_id:
+        keys.append(f"event:{event_id}")
+    if team_id and channel_id and ts and user_id:
+        keys.append(f"msg:{team_id}:{channel_id}:{ts}:{user_id}")
+    return keys
+
+
+def _reason(key: str) -> str:
+    return "event_id_match" if key.startswith("event:") else "composite_match"
+
+
+class TTLKeySet:
+    """
+    Bounded set of keys that expire after a fixed TTL.
+
+    Keys are kept in insertion order, which is also expiry order, so
+    expired entries are purged from the front in O(1) each.
+    """
+
+    def __init__(self, ttl_seconds: float, max_size: int):
+        self._keys: OrderedDict[str, float] = OrderedDict()
+        self._ttl = ttl_seconds
+        self._max_size = max_size
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _purge(self, now: float) -> None:
+        keys = self._keys
+        while keys:
+            key, expires = next(iter(keys.items()))
+            if expires > now:
+                break
+            keys.popitem(last=False)
+
+    def contains(self, key: str, now: Optional[float] = None) -> bool:
+        now = time.monotonic() if now is None else now
+        expires = self._keys.get(key)
+        return expires is not None and expires > now
+
+    def add(self, key: str, now: Optional[float] = None) -> None:
+        now = time.monotonic() if now is None else now
+        self._purge(now)
+        self._keys.pop(key, None)
+        self._keys[key] = now + self._ttl
+        while len(self._keys) > self._max_size:
+            self._keys.popitem(last=False)
+
+    def discard(self, key: str) -> None:
+        self._keys.pop(key, None)
+
+    def clear(self) -> None:
+        self._keys.clear()
+
+
+class SlackDedupeService:
+    """
+    Layered Slack event dedupe (in-process, Redis, Postgres).
+
+    Usage:
+        dedupe = SlackDedupeService()
+        result = await dedupe.check(substrate_service, event_id=..., team_id=...,
+                                    channel_id=..., ts=..., user_id=...)
+        if result["is_duplicate"]:
+            return {"ok": True, "deduplicated": True}
+    """
+
+    def __init__(
+        self,
+        redis_client: Optional[Any] = None,
+        local_ttl_seconds: float = DEFAULT_LOCAL_TTL_SECONDS,
+        redis_ttl_seconds: int = DEFAULT_REDIS_TTL_SECONDS,
+        local_max_size: int = DEFAULT_LOCAL_MAX_SIZE,
+        use_redis: bool = True,
+    ):
+        """
+        Args:
+            redis_client: RedisClient to use (default: runtime singleton)
+            local_ttl_seconds: How long this process remembers an event
+            redis_ttl_seconds: How long a Redis claim lives
+            local_max_size: Cap on remembered keys in this process
+            use_redis: Set False to skip straight to Postgres after tier 1
+        """
+        self._local = TTLKeySet(local_ttl_seconds, local_max_size)
+        self._redis_client = redis_client
+        self._redis_ttl = redis_ttl_seconds
+        self._use_redis = use_redis
+        self._stats: Dict[str, Dict[str, int]] = {
+            tier: {"duplicate": 0, "new": 0, "error": 0} for tier in TIERS
+        }
+
+    async def check(
+        self,
+        substrate_service: Any,
+        event_id: Optional[str],
+        team_id: Optional[str],
+        channel_id: Optional[str],
+        ts: Optional[str],
+        user_id: Optional[str],
+    ) -> Dict[str, Any]:
+        """
+        Check whether an event was already seen, claiming it if not.
+
+        Returns:
+            Dict with:
+                - is_duplicate: bool
+                - tier: local | redis | postgres | none (which tier answered)
+                - reason: str (event_id_match / composite_match, or
+                  dedupe_check_failed when every tier failed)
+                - packet_id: str (postgres tier duplicates only)
+        """
+        start = time.perf_counter()
+        keys = dedupe_keys(event_id, team_id, channel_id, ts, user_id)
+        if not keys:
+            return self._finish({"is_duplicate": False}, "none", start)
+
+        # Tier 1: this process. Claim before any await so concurrent
+        # retries on this worker are caught here.
+        now = time.monotonic()
+        for key in keys:
+            if self._local.contains(key, now):
+                return self._finish(
+                    {"is_duplicate": True, "reason": _reason(key)}, "local", start
+                )
+        for key in keys:
+            self._local.add(key, now)
+
+        # Tier 2: Redis claim shared by all workers
+        redis = await self._get_redis()
+        if redis is not None:
+            claimed = await redis.set_nx_many(
+                [f"{REDIS_KEY_PREFIX}:{key}" for key in keys], ttl=self._redis_ttl
+            )
+            if claimed is not None:
+                for key, is_new in zip(keys, claimed):
+                    if not is_new:
+                        return self._finish(
+                            {"is_duplicate": True, "reason": _reason(key)}, "redis", start
+                        )
+                return self._finish({"is_duplicate": False}, "redis", start)
+
+        # Tier 3: stored packets
+        result = await check_packet_store(
+            substrate_service, event_id, team_id, channel_id, ts, user_id
+        )
+        return self._finish(result, "postgres", start)
+
+    async def release(
+        self,
+        event_id: Optional[str],
+        team_id: Optional[str],
+        channel_id: Optional[str],
+        ts: Optional[str],
+        user_id: Optional[str],
+    ) -> None:
+        """
+        Give back the claim check() took for an event.
+
+        Call when processing a claimed event fails, so Slack's retry is
+        processed instead of rejected as a duplicate.
+        """
+        keys = dedupe_keys(event_id, team_id, channel_id, ts, user_id)
+        if not keys:
+            return
+        for key in keys:
+            self._local.discard(key)
+
+        redis = await self._get_redis()
+        if redis is not None:
+            await redis.delete_many([f"{REDIS_KEY_PREFIX}:{key}" for key in keys])
+        logger.info("slack_dedupe_released", event_id=event_id)
+
+    def stats(self) -> Dict[str, Any]:
+        """Answers per tier and result, plus local set size."""
+        return {
+            "tiers": {tier: dict(counts) for tier, counts in self._stats.items()},
+            "local_keys": len(self._local),
+        }
+
+    async def _get_redis(self) -> Optional[Any]:
+        if not self._use_redis:
+            return None
+        if self._redis_client is not None:
+            return self._redis_client if self._redis_client.is_available() else None
+        try:
+            from runtime.redis_client import get_redis_client
+        except ImportError:
+            return None
+        return await get_redis_client()
+
+    def _finish(self, result: Dict[str, Any], tier: str, start: float) -> Dict[str, Any]:
+        if result.get("reason") == "dedupe_check_failed":
+            outcome = "error"
+        else:
+            outcome = "duplicate" if result.get("is_duplicate") else "new"
+        self._stats[tier][outcome] += 1
+        record_dedupe_check(tier=tier, result=outcome, duration_seconds=time.perf_counter() - start)
+        result["tier"] = tier
+        return result
+
+
+async def check_packet_store(
+    substrate_service: Any,
+    event_id: Optional[str],
+    team_id: Optional[str],
+    channel_id: Optional[str],
+    ts: Optional[str],
+    user_id: Optional[str],
+) -> Dict[str, Any]:
+    """
+    Look for a stored packet with the same event_id or composite key.
+
+    Both predicates are served by the packet_store expression indexes
+    (migrations/0015_slack_dedupe_indexes.sql). Fails open.
+    """
+    try:
+        repository = substrate_service._repository
+
+        async with repository.acquire() as conn:
+            row = await conn.fetchrow(
+                """
+                SELECT packet_id, envelope->'payload'->>'event_id' AS event_id
+                FROM packet_store
+                WHERE packet_type LIKE 'slack.%'
+                  AND (
+                    (envelope->'payload'->>'event_id' = $1)
+                    OR (
+                        envelope->'payload'->>'team_id' = $2
+                        AND envelope->'payload'->>'channel_id' = $3
+                        AND envelope->'payload'->>'ts' = $4
+                        AND envelope->'payload'->>'user_id' = $5
+                    )
+                  )
+                ORDER BY timestamp DESC
+                LIMIT 1
+                """,
+                event_id,
+                team_id,
+                channel_id,
+                ts,
+                user_id,
+            )
+
+        if row is None:
+            return {"is_duplicate": False}
+
+        reason = "event_id_match" if event_id and row["event_id"] == event_id else "composite_match"
+        matched_packet_id = str(row["packet_id"])
+        logger.debug(
+            "slack_duplicate_detected",
+            event_id=event_id,
+            matched_packet_id=matched_packet_id,
+            reason=reason,
+        )
+        return {"is_duplicate": True, "reason": reason, "packet_id": matched_packet_id}
+
+    except Exception as e:
+        logger.error("dedupe_check_error", error=str(e), event_id=event_id)
+        # On error, return not duplicate to allow processing (fail open)
+        return {"is_duplicate": False, "reason": "dedupe_check_failed"}
+
+
+slack_dedupe = SlackDedupeService()
+
+__all__ = [
+    "SlackDedupeService",
+    "TTLKeySet",
+    "check_packet_store",
+    "dedupe_keys",
+    "slack_dedupe",
+]
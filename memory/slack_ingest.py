@@ -6,7 +6,8 @@ This module implements the orchestration layer:
   2. Memory context retrieval (fetch thread history + semantic hits)
   3. L-CTO agent routing via AgentExecutorService (when legacy flag is False)
   4. AIOS /chat call fallback (when legacy flag is True)
-  5. Slack API response delivery (post message in thread)
+  5. Slack API response delivery (post message in thread; L-CTO replies
+     are streamed into a placeholder message via coalesced chat.update)
   6. Packet persistence (store inbound + outbound in substrate)
 
 Features ported from legacy webhook_slack.py (v2.0):
@@ -23,10 +24,12 @@ Thread model:
   - Human-readable string stored in metadata for observability
   - Internal operations use UUID for DB consistency
 
-Deduplication:
-  - Check event_id in packet metadata before processing
+Deduplication (memory/slack_dedupe.py):
+  - In-process TTL set, then Redis SET NX EX on event_id and the
+    team:channel:ts:user composite, then stored packets in Postgres
   - If found, return 200 without re-processing
   - Prevents double-replies if Slack retries delivery
+  - If processing raises, the claim is released so the retry is processed
 
 Error handling:
   - Agent/AIOS call fails: Log error, store error packet, don't crash
@@ -34,15 +37,20 @@ Error handling:
   - Memory persistence fails: Log error, still return 200 to Slack
 """
 
+import asyncio
 import httpx
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
 import structlog
 from time import time as current_time
 
 from api.slack_adapter import SlackRequestNormalizer
 from api.slack_client import SlackAPIClient, SlackClientError
+from core.aios.streaming import DeltaCoalescer
+from core.schemas.ws_event_stream import EventMessage, EventType
+from memory.slack_dedupe import slack_dedupe
 from memory.substrate_models import PacketEnvelopeIn, PacketMetadata, PacketProvenance
 from memory.substrate_service import MemorySubstrateService
+from runtime.http_clients import get_http_client
 from config.settings import settings
 
 # Optional telemetry - gracefully degrade if module not available
@@ -81,6 +89,15 @@ logger = structlog.get_logger(__name__)
 # When True, use legacy AIOS /chat endpoint
 L9_ENABLE_LEGACY_SLACK_ROUTER = getattr(settings, "l9_enable_legacy_slack_router", False)
 
+# Stream L-CTO replies into Slack as they are generated (placeholder message
+# + chat.update at most once per SLACK_STREAM_UPDATE_INTERVAL seconds)
+L9_SLACK_STREAM_REPLIES = getattr(settings, "l9_slack_stream_replies", True)
+SLACK_STREAM_UPDATE_INTERVAL = 1.0
+
+# Thread context and semantic hits are fetched concurrently; whatever is not
+# back within this many seconds is left out of the prompt
+SLACK_CONTEXT_DEADLINE = getattr(settings, "l9_slack_context_deadline", 3.0)
+
 
 # =============================================================================
 # L-CTO Agent Handler (ported from webhook_slack.py)
@@ -95,6 +112,7 @@ async def handle_slack_with_l_agent(
     channel_id: str,
     user_id: str,
     context: Optional[Dict[str, Any]] = None,
+    event_sink: Optional[Callable[[EventMessage], Awaitable[None]]] = None,
 ) -> Tuple[str, str]:
     """
     Route a Slack message through the L-CTO agent via AgentExecutorService.
@@ -111,6 +129,8 @@ async def handle_slack_with_l_agent(
         user_id: Slack user ID
         context: Optional dict containing thread_context and semantic_hits
                  from DAG-stored packets for conversation continuity
+        event_sink: Optional receiver for streamed reasoning events
+                    (e.g. SlackStreamingReply.on_event)
 
     Returns:
         Tuple of (reply_text, status) where:
@@ -158,7 +178,10 @@ async def handle_slack_with_l_agent(
         )
 
         # Execute task via AgentExecutorService
-        result = await agent_executor.start_agent_task(task)
+        if event_sink is not None:
+            result = await agent_executor.start_agent_task(task, event_sink=event_sink)
+        else:
+            result = await agent_executor.start_agent_task(task)
 
         # Handle duplicate detection
         if isinstance(result, DuplicateTaskResponse):
@@ -183,6 +206,99 @@ async def handle_slack_with_l_agent(
         return (f"Error processing message: {str(e)}", "error")
 
 
+class SlackStreamingReply:
+    """
+    Stream an L-CTO reply into a single Slack message.
+
+    The first reasoning delta posts a placeholder message immediately; later
+    deltas are coalesced and applied with chat.update at most once per
+    update interval (chat.update is rate limited). finish() replaces the
+    message with the final reply, or posts it if nothing was streamed.
+
+    Usage:
+        reply_stream = SlackStreamingReply(slack_client, channel_id, thread_ts)
+        reply, status = await handle_slack_with_l_agent(
+            ..., event_sink=reply_stream.on_event
+        )
+        await reply_stream.finish(reply)
+    """
+
+    def __init__(
+        self,
+        slack_client: SlackAPIClient,
+        channel_id: str,
+        thread_ts: Optional[str] = None,
+        update_interval: float = SLACK_STREAM_UPDATE_INTERVAL,
+    ):
+        self._slack_client = slack_client
+        self._channel_id = channel_id
+        self._thread_ts = thread_ts
+        self._coalescer = DeltaCoalescer(min_interval=update_interval)
+        self._iteration: Optional[int] = None
+        self._text = ""
+        self._ts: Optional[str] = None
+        self._updates = 0
+
+    @property
+    def ts(self) -> Optional[str]:
+        """Timestamp of the streamed message (None until the first delta)."""
+        return self._ts
+
+    @property
+    def updates(self) -> int:
+        """Number of chat.postMessage / chat.update calls made while streaming."""
+        return self._updates
+
+    async def on_event(self, event: EventMessage) -> None:
+        """Executor event sink: apply REASONING_DELTA events to the message."""
+        if event.type != EventType.REASONING_DELTA:
+            return
+
+        # Each reasoning turn restarts the visible text; interim text from a
+        # turn that ended in tool calls is superseded by the next turn
+        iteration = event.payload.get("iteration")
+        if iteration != self._iteration:
+            self._iteration = iteration
+            self._coalescer.drain()
+            self._text = ""
+
+        pending = self._coalescer.add(event.payload.get("text", ""))
+        if pending:
+            self._text += pending
+            await self._publish(self._text)
+
+    async def finish(self, text: str) -> None:
+        """Deliver the final reply, replacing the streamed message if any."""
+        if self._ts is not None:
+            try:
+                await self._slack_client.update_message(
+                    channel=self._channel_id, ts=self._ts, text=text
+                )
+                return
+            except SlackClientError as e:
+                logger.warning("slack_stream_finish_update_failed", error=str(e))
+
+        await self._slack_client.post_message(
+            channel=self._channel_id,
+            text=text,
+            thread_ts=self._thread_ts,
+        )
+
+    async def _publish(self, text: str) -> None:
+        self._updates += 1
+        if self._ts is None:
+            response = await self._slack_client.post_message(
+                channel=self._channel_id,
+                text=text,
+                thread_ts=self._thread_ts,
+            )
+            self._ts = response.get("ts")
+        else:
+            await self._slack_client.update_message(
+                channel=self._channel_id, ts=self._ts, text=text
+            )
+
+
 # =============================================================================
 # File Attachment Processing (ported from webhook_slack.py)
 # =============================================================================
@@ -487,7 +603,6 @@ async def handle_slack_events(
     channel_id = normalized.get("channel_id")
     thread_ts = normalized.get("thread_ts")
     thread_uuid = normalized.get("thread_uuid")
-    thread_string = normalized.get("thread_string")
     user_id = normalized.get("user_id")
     text = normalized.get("text", "")
     event_type = normalized.get("event_type")
@@ -520,6 +635,26 @@ async def handle_slack_events(
         )
         return {"ok": True, "ignored": "bot_message"}
 
+    # Context lookups don't depend on the dedupe answer: start them now and
+    # cancel them if this turns out to be a retry
+    context_tasks = {
+        "thread_context": asyncio.create_task(
+            _retrieve_thread_context(
+                substrate_service=substrate_service,
+                thread_uuid=thread_uuid,
+                limit=10,
+            )
+        ),
+        "semantic_hits": asyncio.create_task(
+            _retrieve_semantic_hits(
+                substrate_service=substrate_service,
+                query=text,
+                team_id=team_id,
+                limit=5,
+            )
+        ),
+    }
+
     # Dedupe check: look for event_id in recent packets
     try:
         dedupe_result = await _check_duplicate(
@@ -539,41 +674,83 @@ async def handle_slack_events(
                 event_id=event_id,
                 is_duplicate=True,
                 reason=dedupe_result.get("reason"),
+                tier=dedupe_result.get("tier"),
             )
             record_idempotent_hit(team_id=team_id)
+            for task in context_tasks.values():
+                task.cancel()
             return {"ok": True, "deduplicated": True}
     except Exception as e:
         logger.error("slack_dedupe_check", error=str(e), event_id=event_id, is_duplicate=False)
         # Continue processing; dedupe is opportunistic
 
-    # Retrieve memory context
-    thread_context = {}
-    semantic_hits = {}
-
+    # The event is claimed now; give the claim back if processing fails so
+    # Slack's retry is processed instead of rejected as a duplicate
     try:
-        thread_context = await _retrieve_thread_context(
+        return await _process_slack_event(
+            payload=payload,
+            normalized=normalized,
+            context_tasks=context_tasks,
             substrate_service=substrate_service,
-            thread_uuid=thread_uuid,
-            limit=10,
-        )
-        logger.debug("slack_thread_context_retrieved", context_size=len(thread_context))
-    except Exception as e:
-        logger.warning(
-            "slack_thread_context_retrieval_error",
-            error=str(e),
-            thread_uuid=thread_uuid,
+            slack_client=slack_client,
+            aios_base_url=aios_base_url,
+            app=app,
         )
-
-    try:
-        semantic_hits = await _retrieve_semantic_hits(
-            substrate_service=substrate_service,
-            query=text,
+    except Exception:
+        await slack_dedupe.release(
+            event_id=event_id,
             team_id=team_id,
-            limit=5,
+            channel_id=channel_id,
+            ts=normalized.get("ts"),
+            user_id=user_id,
         )
-        logger.debug("slack_semantic_hits_retrieved", hit_count=len(semantic_hits))
-    except Exception as e:
-        logger.warning("slack_semantic_hits_retrieval_error", error=str(e))
+        raise
+
+
+async def _process_slack_event(
+    payload: Dict[str, Any],
+    normalized: Dict[str, Any],
+    context_tasks: Dict[str, "asyncio.Task"],
+    substrate_service: MemorySubstrateService,
+    slack_client: SlackAPIClient,
+    aios_base_url: str,
+    app: Optional[Any] = None,
+) -> Dict[str, Any]:
+    """
+    Process a new (non-duplicate) Slack event: commands, routing, the AIOS
+    call, the reply and the slack.in/slack.out packets.
+
+    Args:
+        payload: Parsed JSON payload from Slack
+        normalized: Output of SlackRequestNormalizer.parse_event_callback
+        context_tasks: Running thread_context/semantic_hits lookups
+        substrate_service: Memory substrate for packet persistence
+        slack_client: Slack API client for posting replies
+        aios_base_url: Base URL for AIOS service
+        app: FastAPI app instance (for L-CTO agent routing)
+
+    Returns:
+        HTTP response dict
+    """
+    event_id = normalized.get("event_id")
+    team_id = normalized.get("team_id")
+    channel_id = normalized.get("channel_id")
+    thread_ts = normalized.get("thread_ts")
+    thread_uuid = normalized.get("thread_uuid")
+    thread_string = normalized.get("thread_string")
+    user_id = normalized.get("user_id")
+    text = normalized.get("text", "")
+    event_type = normalized.get("event_type")
+
+    # Retrieve memory context
+    context = await _await_context(context_tasks, SLACK_CONTEXT_DEADLINE)
+    thread_context = context["thread_context"]
+    semantic_hits = context["semantic_hits"]
+    logger.debug(
+        "slack_context_retrieved",
+        context_size=len(thread_context),
+        hit_count=len(semantic_hits),
+    )
 
     # =========================================================================
     # @L Command Detection (GMP-11: Igor Command Interface)
@@ -798,6 +975,11 @@ async def handle_slack_events(
                     "thread_context": thread_context,
                     "semantic_hits": semantic_hits,
                 }
+                reply_stream = (
+                    SlackStreamingReply(slack_client, channel_id, thread_ts)
+                    if L9_SLACK_STREAM_REPLIES
+                    else None
+                )
                 reply, status = await handle_slack_with_l_agent(
                     app=app,
                     text=text,
@@ -806,19 +988,19 @@ async def handle_slack_events(
                     channel_id=channel_id,
                     user_id=user_id,
                     context=dag_context,
+                    event_sink=reply_stream.on_event if reply_stream else None,
                 )
                 
-                # Post reply to Slack
-                if status in ("completed", "duplicate"):
-                    await slack_client.post_message(
-                        channel=channel_id,
-                        text=reply,
-                        thread_ts=thread_ts,
-                    )
+                # Post reply to Slack (replacing the streamed message, if any)
+                slack_text = (
+                    reply if status in ("completed", "duplicate") else f"⚠️ {reply}"
+                )
+                if reply_stream is not None:
+                    await reply_stream.finish(slack_text)
                 else:
                     await slack_client.post_message(
                         channel=channel_id,
-                        text=f"⚠️ {reply}",
+                        text=slack_text,
                         thread_ts=thread_ts,
                     )
                 
@@ -919,36 +1101,36 @@ async def handle_slack_events(
     logger.info("slack_aios_call_start", event_id=event_id, agent_type="aios")
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            system_prompt = _build_system_prompt(
-                thread_context=thread_context,
-                semantic_hits=semantic_hits,
-                user_id=user_id,
-                channel_id=channel_id,
-            )
+        client = get_http_client("aios")
+        system_prompt = _build_system_prompt(
+            thread_context=thread_context,
+            semantic_hits=semantic_hits,
+            user_id=user_id,
+            channel_id=channel_id,
+        )
 
-            aios_payload = {
-                "message": text,
-                "system_prompt": system_prompt,
-            }
+        aios_payload = {
+            "message": text,
+            "system_prompt": system_prompt,
+        }
 
-            aios_response_obj = await client.post(
-                f"{aios_base_url}/chat",
-                json=aios_payload,
-            )
-            aios_response_obj.raise_for_status()
-            aios_response = aios_response_obj.json()
+        aios_response_obj = await client.post(
+            f"{aios_base_url}/chat",
+            json=aios_payload,
+        )
+        aios_response_obj.raise_for_status()
+        aios_response = aios_response_obj.json()
 
-            aios_duration = current_time() - aios_start_time
-            # CANONICAL LOG EVENT 6: AIOS call complete
-            logger.info(
-                "slack_aios_call_complete",
-                event_id=event_id,
-                response_length=len(aios_response.get("reply", "")),
-                duration_seconds=aios_duration,
-                status="success",
-            )
-            record_aios_call(agent_type="aios", duration_seconds=aios_duration)
+        aios_duration = current_time() - aios_start_time
+        # CANONICAL LOG EVENT 6: AIOS call complete
+        logger.info(
+            "slack_aios_call_complete",
+            event_id=event_id,
+            response_length=len(aios_response.get("reply", "")),
+            duration_seconds=aios_duration,
+            status="success",
+        )
+        record_aios_call(agent_type="aios", duration_seconds=aios_duration)
     except httpx.TimeoutException:
         aios_error = "AIOS timeout (10s)"
         aios_duration = current_time() - aios_start_time
@@ -1132,20 +1314,20 @@ async def handle_slack_commands(
     aios_error = None
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            system_prompt = f"User issued command: /{command} {subcommand}"
-            aios_payload = {
-                "message": full_text,
-                "system_prompt": system_prompt,
-            }
-
-            aios_response_obj = await client.post(
-                f"{aios_base_url}/chat",
-                json=aios_payload,
-            )
-            aios_response_obj.raise_for_status()
-            aios_response = aios_response_obj.json()
-            logger.info("aios_command_success", command=command, subcommand=subcommand)
+        client = get_http_client("aios")
+        system_prompt = f"User issued command: /{command} {subcommand}"
+        aios_payload = {
+            "message": full_text,
+            "system_prompt": system_prompt,
+        }
+
+        aios_response_obj = await client.post(
+            f"{aios_base_url}/chat",
+            json=aios_payload,
+        )
+        aios_response_obj.raise_for_status()
+        aios_response = aios_response_obj.json()
+        logger.info("aios_command_success", command=command, subcommand=subcommand)
     except Exception as e:
         aios_error = str(e)
         logger.error("aios_command_error", command=command, error=aios_error)
@@ -1164,14 +1346,14 @@ async def handle_slack_commands(
 
     if response_url:
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                await client.post(
-                    response_url,
-                    json={
-                        "response_type": "in_channel",
-                        "text": reply_text,
-                    },
-                )
+            client = get_http_client("slack")
+            await client.post(
+                response_url,
+                json={
+                    "response_type": "in_channel",
+                    "text": reply_text,
+                },
+            )
             logger.info("slack_command_response_posted_to_url", command=command)
         except Exception as e:
             slack_error = str(e)
@@ -1226,11 +1408,10 @@ async def _check_duplicate(
     """
     Check if event already processed.
 
-    Queries packet_store for duplicate events using two strategies:
-    1. Direct event_id match in payload
-    2. Composite match on team_id, channel_id, ts, user_id in payload
-
-    Returns dedupe result with is_duplicate, reason, and matched packet_id if found.
+    Delegates to the layered SlackDedupeService (in-process, Redis,
+    Postgres). Matches on event_id or on the composite team_id,
+    channel_id, ts, user_id; a new event is claimed so Slack retries are
+    rejected while it is still being processed.
 
     Args:
         substrate_service: Memory substrate service instance
@@ -1244,74 +1425,45 @@ async def _check_duplicate(
     Returns:
         Dict with:
             - is_duplicate: bool
+            - tier: str (local, redis, postgres or none - which tier answered)
             - reason: str (if duplicate found, explains why)
-            - packet_id: str (if duplicate found, the matched packet ID)
+            - packet_id: str (if matched a stored packet)
     """
-    try:
-        # Access repository for raw SQL query
-        repository = substrate_service._repository
-        
-        async with repository.acquire() as conn:
-            # Query for duplicate using event_id OR composite match
-            # The envelope column is JSONB, so we use -> for object access and ->> for text extraction
-            row = await conn.fetchrow(
-                """
-                SELECT packet_id, envelope, timestamp
-                FROM packet_store
-                WHERE 
-                    (envelope->'payload'->>'event_id' = $1)
-                    OR (
-                        envelope->'payload'->>'team_id' = $2
-                        AND envelope->'payload'->>'channel_id' = $3
-                        AND envelope->'payload'->>'ts' = $4
-                        AND envelope->'payload'->>'user_id' = $5
-                    )
-                ORDER BY timestamp DESC
-                LIMIT 1
-                """,
-                event_id,
-                team_id,
-                channel_id,
-                ts,
-                user_id,
-            )
-            
-            if row:
-                # Found a duplicate
-                matched_packet_id = str(row["packet_id"])
-                envelope = row["envelope"]
-                
-                # Determine reason for duplicate
-                if isinstance(envelope, dict):
-                    payload = envelope.get("payload", {})
-                    matched_event_id = payload.get("event_id")
-                    if matched_event_id == event_id:
-                        reason = "event_id_match"
-                    else:
-                        reason = "composite_match"
-                else:
-                    reason = "duplicate_found"
-                
-                logger.debug(
-                    "slack_duplicate_detected",
-                    event_id=event_id,
-                    matched_packet_id=matched_packet_id,
-                    reason=reason,
-                )
-                
-                return {
-                    "is_duplicate": True,
-                    "reason": reason,
-                    "packet_id": matched_packet_id,
-                }
-            
-            # No duplicate found
-            return {"is_duplicate": False}
-            
-    except Exception as e:
-        logger.error("dedupe_check_error", error=str(e), event_id=event_id)
-        # On error, return not duplicate to allow processing (fail open)
-        return {"is_duplicate": False, "reason": "dedupe_check_failed"}
+    return await slack_dedupe.check(
+        substrate_service,
+        event_id=event_id,
+        team_id=team_id,
+        channel_id=channel_id,
+        ts=ts,
+        user_id=user_id,
+    )
+
+
+async def _await_context(
+    tasks: Dict[str, "asyncio.Task"],
+    deadline: float,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Wait for concurrent context lookups up to a deadline.
+
+    Lookups that fail or miss the deadline are logged and yield {}; late
+    ones are cancelled.
+    """
+    done, pending = await asyncio.wait(tasks.values(), timeout=deadline)
+    for task in pending:
+        task.cancel()
+
+    results: Dict[str, Dict[str, Any]] = {}
+    for name, task in tasks.items():
+        if task in pending:
+            logger.warning("slack_context_deadline_exceeded", lookup=name, deadline_seconds=deadline)
+            results[name] = {}
+        elif task.exception() is not None:
+            logger.warning(f"slack_{name}_retrieval_error", error=str(task.exception()))
+            results[name] = {}
+        else:
+            results[name] = task.result()
+    return results
 
 
 async def _retrieve_thread_context(
@@ -1337,7 +1489,6 @@ async def _retrieve_thread_context(
         # Log to error telemetry (non-blocking)
         try:
             from core.error_tracking import log_error_to_graph
-            import asyncio
 
             asyncio.create_task(
                 log_error_to_graph(
@@ -1388,7 +1539,6 @@ async def _retrieve_semantic_hits(
         # Log to error telemetry (non-blocking)
         try:
             from core.error_tracking import log_error_to_graph
-            import asyncio
 
             asyncio.create_task(
                 log_error_to_graph(
@@ -1,12 +1,14 @@
 """
 L9 Memory Substrate - Repository Layer
-Version: 1.0.0
+Version: 1.1.0
 
 Thin repository for Postgres + pgvector database access.
 Provides async functions for all memory substrate operations.
+
+JSON/JSONB columns go through memory.json_codec (orjson when available),
+registered as asyncpg type codecs on every pooled connection.
 """
 
-import json
 import structlog
 from contextlib import asynccontextmanager
 from datetime import datetime
@@ -15,6 +17,7 @@ from uuid import UUID, uuid4
 
 import asyncpg
 
+from memory.json_codec import dumps, register_json_codecs
 from memory.substrate_models import (
     AgentMemoryEventRow,
     GraphCheckpointRow,
@@ -29,6 +32,42 @@ from memory.substrate_models import (
 logger = structlog.get_logger(__name__)
 
 
+def packet_columns(envelope: PacketEnvelope) -> tuple:
+    """
+    Build the packet_store INSERT arguments ($1..$15) for an envelope.
+
+    The envelope is dumped once; the envelope, routing and provenance JSONB
+    values and the indexed columns are all taken from that single dump.
+    """
+    data = envelope.model_dump()
+    metadata = data.get("metadata") or {}
+    lineage = data.get("lineage")
+    provenance = data.get("provenance")
+
+    # importance_score: prefer metadata, fallback to confidence.score
+    importance_score = metadata.get("importance")
+    if importance_score is None and data.get("confidence"):
+        importance_score = data["confidence"].get("score")
+
+    return (
+        envelope.packet_id,
+        envelope.packet_type,
+        dumps(data),
+        envelope.timestamp,
+        dumps({"agent": metadata.get("agent") if envelope.metadata else None}),
+        dumps(provenance),
+        envelope.thread_id,
+        lineage["parent_ids"] if lineage else [],
+        envelope.tags or [],
+        envelope.ttl,
+        metadata.get("content_hash"),
+        metadata.get("session_id"),
+        metadata.get("scope", "shared"),
+        metadata.get("trace_id"),
+        importance_score,
+    )
+
+
 class SubstrateRepository:
     """
     Repository for memory substrate database operations.
@@ -57,6 +96,7 @@ class SubstrateRepository:
                 self._database_url,
                 min_size=self._pool_size,
                 max_size=self._pool_size + self._max_overflow,
+                init=register_json_codecs,
             )
             logger.info("Database connection pool initialized")
 
@@ -86,23 +126,8 @@ class SubstrateRepository:
         Returns:
             The packet_id of the inserted record.
         """
-        # Extract fields from envelope for dedicated columns (v2.0 support)
-        thread_id = envelope.thread_id
-        tags = envelope.tags if envelope.tags else []
-        ttl = envelope.ttl
-        # Extract parent_ids from lineage (DAG support)
-        parent_ids = envelope.lineage.parent_ids if envelope.lineage else []
-        # Extra fields may be in metadata dict (extra="allow" in PacketMetadata)
-        metadata_dict = envelope.metadata.model_dump() if envelope.metadata else {}
-        content_hash = metadata_dict.get("content_hash")
-        session_id = metadata_dict.get("session_id")
-        scope = metadata_dict.get("scope", "shared")
-        trace_id = metadata_dict.get("trace_id")
-        # importance_score: prefer metadata, fallback to confidence.score
-        importance_score = metadata_dict.get("importance")
-        if importance_score is None and envelope.confidence:
-            importance_score = envelope.confidence.score
-        
+        columns = packet_columns(envelope)
+
         async with self.acquire() as conn:
             await conn.execute(
                 """
@@ -125,29 +150,9 @@ class SubstrateRepository:
                     trace_id = COALESCE(EXCLUDED.trace_id, packet_store.trace_id),
                     importance_score = COALESCE(EXCLUDED.importance_score, packet_store.importance_score)
                 """,
-                envelope.packet_id,
-                envelope.packet_type,
-                json.dumps(envelope.model_dump(mode="json")),
-                envelope.timestamp,
-                json.dumps(
-                    {"agent": envelope.metadata.agent if envelope.metadata else None}
-                ),
-                json.dumps(
-                    envelope.provenance.model_dump(mode="json")
-                    if envelope.provenance
-                    else None
-                ),
-                thread_id,
-                parent_ids,
-                tags,
-                ttl,
-                content_hash,
-                session_id,
-                scope,
-                trace_id,
-                importance_score,
+                *columns,
             )
-            logger.debug(f"Inserted packet {envelope.packet_id} with thread_id={thread_id}, parent_ids={parent_ids}, importance={importance_score}")
+            logger.debug(f"Inserted packet {envelope.packet_id} with thread_id={envelope.thread_id}, parent_ids={columns[7]}, importance={columns[14]}")
             return envelope.packet_id
 
     async def get_packet(self, packet_id: UUID) -> Optional[PacketStoreRow]:
@@ -258,16 +263,10 @@ class SubstrateRepository:
         return PacketStoreRow(
             packet_id=row["packet_id"],
             packet_type=row["packet_type"],
-            envelope=json.loads(row["envelope"])
-            if isinstance(row["envelope"], str)
-            else row["envelope"],
+            envelope=row["envelope"],
             timestamp=row["timestamp"],
-            routing=json.loads(row["routing"])
-            if row["routing"] and isinstance(row["routing"], str)
-            else row["routing"],
-            provenance=json.loads(row["provenance"])
-            if row["provenance"] and isinstance(row["provenance"], str)
-            else row["provenance"],
+            routing=row["routing"],
+            provenance=row["provenance"],
             thread_id=row.get("thread_id"),
             parent_ids=row.get("parent_ids") or [],
             tags=row.get("tags") or [],
@@ -299,7 +298,7 @@ class SubstrateRepository:
                 timestamp or datetime.utcnow(),
                 packet_id,
                 event_type,
-                json.dumps(content),
+                dumps(content),
             )
             logger.debug(f"Inserted memory event {event_id} for agent {agent_id}")
             return event_id
@@ -340,9 +339,7 @@ class SubstrateRepository:
                     timestamp=r["timestamp"],
                     packet_id=r["packet_id"],
                     event_type=r["event_type"],
-                    content=json.loads(r["content"])
-                    if isinstance(r["content"], str)
-                    else r["content"],
+                    content=r["content"],
                 )
                 for r in rows
             ]
@@ -371,12 +368,12 @@ class SubstrateRepository:
                 block.block_id,
                 agent_id,
                 block.packet_id,
-                json.dumps({"steps": block.inference_steps}),
-                json.dumps(block.extracted_features),
-                json.dumps(block.inference_steps),
-                json.dumps(block.reasoning_tokens),
-                json.dumps(block.decision_tokens),
-                json.dumps(block.confidence_scores),
+                dumps({"steps": block.inference_steps}),
+                dumps(block.extracted_features),
+                dumps(block.inference_steps),
+                dumps(block.reasoning_tokens),
+                dumps(block.decision_tokens),
+                dumps(block.confidence_scores),
                 block.timestamp,
             )
             logger.debug(f"Inserted reasoning block {block.block_id}")
@@ -412,26 +409,12 @@ class SubstrateRepository:
                     trace_id=r["trace_id"],
                     agent_id=r["agent_id"],
                     packet_id=r["packet_id"],
-                    steps=json.loads(r["steps"])
-                    if r["steps"] and isinstance(r["steps"], str)
-                    else r["steps"],
-                    extracted_features=json.loads(r["extracted_features"])
-                    if r["extracted_features"]
-                    and isinstance(r["extracted_features"], str)
-                    else r["extracted_features"],
-                    inference_steps=json.loads(r["inference_steps"])
-                    if r["inference_steps"] and isinstance(r["inference_steps"], str)
-                    else r["inference_steps"],
-                    reasoning_tokens=json.loads(r["reasoning_tokens"])
-                    if r["reasoning_tokens"] and isinstance(r["reasoning_tokens"], str)
-                    else r["reasoning_tokens"],
-                    decision_tokens=json.loads(r["decision_tokens"])
-                    if r["decision_tokens"] and isinstance(r["decision_tokens"], str)
-                    else r["decision_tokens"],
-                    confidence_scores=json.loads(r["confidence_scores"])
-                    if r["confidence_scores"]
-                    and isinstance(r["confidence_scores"], str)
-                    else r["confidence_scores"],
+                    steps=r["steps"],
+                    extracted_features=r["extracted_features"],
+                    inference_steps=r["inference_steps"],
+                    reasoning_tokens=r["reasoning_tokens"],
+                    decision_tokens=r["decision_tokens"],
+                    confidence_scores=r["confidence_scores"],
                     created_at=r["created_at"],
                 )
                 for r in rows
@@ -470,7 +453,7 @@ class SubstrateRepository:
                 embedding_id,
                 agent_id,
                 vector_str,
-                json.dumps(payload),
+                dumps(payload),
                 datetime.utcnow(),
             )
             logger.debug(f"Inserted semantic embedding {embedding_id}")
@@ -531,9 +514,7 @@ class SubstrateRepository:
                 SemanticHit(
                     embedding_id=r["embedding_id"],
                     score=float(r["score"]),
-                    payload=json.loads(r["payload"])
-                    if isinstance(r["payload"], str)
-                    else r["payload"],
+                    payload=r["payload"],
                 )
                 for r in rows
             ]
@@ -562,7 +543,7 @@ class SubstrateRepository:
                 """,
                 checkpoint_id,
                 agent_id,
-                json.dumps(graph_state),
+                dumps(graph_state),
                 datetime.utcnow(),
             )
             logger.debug(f"Saved checkpoint for agent {agent_id}")
@@ -579,9 +560,7 @@ class SubstrateRepository:
                 return GraphCheckpointRow(
                     checkpoint_id=row["checkpoint_id"],
                     agent_id=row["agent_id"],
-                    graph_state=json.loads(row["graph_state"])
-                    if isinstance(row["graph_state"], str)
-                    else row["graph_state"],
+                    graph_state=row["graph_state"],
                     updated_at=row["updated_at"],
                 )
             return None
@@ -610,7 +589,7 @@ class SubstrateRepository:
                 agent_id,
                 level.upper(),
                 message,
-                json.dumps(metadata) if metadata else None,
+                dumps(metadata) if metadata else None,
             )
             return log_id
 
@@ -654,7 +633,7 @@ class SubstrateRepository:
                 fid,
                 subject,
                 predicate,
-                json.dumps(object_value),
+                dumps(object_value),
                 confidence or 0.8,
                 UUID(source_packet)
                 if isinstance(source_packet, str)
@@ -708,9 +687,7 @@ class SubstrateRepository:
                     fact_id=r["fact_id"],
                     subject=r["subject"],
                     predicate=r["predicate"],
-                    object=json.loads(r["object"])
-                    if isinstance(r["object"], str)
-                    else r["object"],
+                    object=r["object"],
                     confidence=r["confidence"],
                     source_packet=r["source_packet"],
                     created_at=r["created_at"],
@@ -748,9 +725,7 @@ class SubstrateRepository:
                     fact_id=r["fact_id"],
                     subject=r["subject"],
                     predicate=r["predicate"],
-                    object=json.loads(r["object"])
-                    if isinstance(r["object"], str)
-                    else r["object"],
+                    object=r["object"],
                     confidence=r["confidence"],
                     source_packet=r["source_packet"],
                     created_at=r["created_at"],
@@ -238,6 +238,88 @@ class MemorySubstrateService:
 
         return result
 
+    async def write_packets(
+        self,
+        packets_in: list[PacketEnvelopeIn],
+        tenant_id: Optional[str] = None,
+        org_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        role: str = "end_user",
+    ) -> list[PacketWriteResult]:
+        """
+        Submit several packets in one call.
+
+        Used by buffered emitters (e.g. the agent executor's TraceSink).
+        The session scope is set once per call; each packet still runs
+        through the full DAG on its own, in order. A failing packet yields
+        an error result instead of aborting the rest.
+
+        Args:
+            packets_in: Input packet envelopes, in emission order
+            tenant_id: Tenant UUID for RLS isolation
+            org_id: Organization UUID for RLS isolation
+            user_id: User UUID for RLS isolation
+            role: User role for RLS policy enforcement
+
+        Returns:
+            One PacketWriteResult per input packet, in order
+        """
+        if not packets_in:
+            return []
+
+        logger.info(f"Processing packet batch: size={len(packets_in)}")
+
+        if tenant_id and org_id and user_id:
+            await self.set_session_scope(tenant_id, org_id, user_id, role)
+
+        results: list[PacketWriteResult] = []
+        for packet_in in packets_in:
+            envelope = packet_in.to_envelope()
+
+            if self._circuit_breaker.is_open():
+                cb_stats = self._circuit_breaker.get_stats()
+                results.append(
+                    PacketWriteResult(
+                        status="error",
+                        packet_id=envelope.packet_id,
+                        written_tables=[],
+                        error_message=f"Circuit breaker open: {cb_stats['failures_in_window']} failures in {cb_stats['window_seconds']}s",
+                    )
+                )
+                continue
+
+            try:
+                result = await self._dag.run(envelope)
+            except Exception as dag_error:
+                self._circuit_breaker.record_failure(str(dag_error))
+                logger.error(
+                    "memory_substrate_dag_exception",
+                    packet_id=str(envelope.packet_id),
+                    error=str(dag_error),
+                    circuit_state=self._circuit_breaker.get_state(),
+                )
+                result = PacketWriteResult(
+                    status="error",
+                    packet_id=envelope.packet_id,
+                    written_tables=[],
+                    error_message=str(dag_error),
+                )
+            else:
+                if result.status == "ok":
+                    self._circuit_breaker.record_success()
+                else:
+                    self._circuit_breaker.record_failure(
+                        result.error_message or "DAG returned error status"
+                    )
+
+            record_memory_write(
+                segment=packet_in.packet_type or "unknown",
+                status=result.status,
+            )
+            results.append(result)
+
+        return results
+
     async def get_packet(self, packet_id: str) -> Optional[dict[str, Any]]:
         """
         Retrieve a packet by ID.
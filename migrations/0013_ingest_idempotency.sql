@@ -0,0 +1,19 @@
+-- =============================================================================
+-- L9 Memory Substrate - Migration 0013
+-- Purpose: Idempotency results for batch packet ingestion
+-- =============================================================================
+-- Used by upgrades.packet_envelope.scalability.PostgresIdempotencyStore.
+-- A key's result is replayed until expires_at; expired rows are overwritten
+-- on the next write and can be purged by housekeeping.
+-- This migration is IDEMPOTENT - safe to run multiple times.
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS ingest_idempotency (
+    key TEXT PRIMARY KEY,
+    result JSONB NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    expires_at TIMESTAMPTZ NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_ingest_idempotency_expires_at
+    ON ingest_idempotency (expires_at);
@@ -0,0 +1,44 @@
+-- =============================================================================
+-- L9 Memory Substrate - Migration 0014
+-- Purpose: Append-only event log for the Phase 4 event store
+-- =============================================================================
+-- Used by upgrades.packet_envelope.event_log.PostgresEventLog.
+-- event_offset is assigned by the appender under an advisory lock, so
+-- offsets are gap-free and follow commit order. Consumer groups commit the
+-- next offset they will read; projections store one snapshot per name.
+-- This migration is IDEMPOTENT - safe to run multiple times.
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS event_log (
+    event_offset BIGINT PRIMARY KEY,
+    record JSONB NOT NULL,
+    appended_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_event_log_aggregate_id
+    ON event_log ((record->>'aggregate_id'), event_offset);
+
+CREATE TABLE IF NOT EXISTS event_consumer_offsets (
+    consumer_group TEXT PRIMARY KEY,
+    next_offset BIGINT NOT NULL,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE TABLE IF NOT EXISTS event_snapshots (
+    name TEXT PRIMARY KEY,
+    event_offset BIGINT NOT NULL,
+    state JSONB NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE TABLE IF NOT EXISTS event_dlq (
+    id BIGSERIAL PRIMARY KEY,
+    consumer_group TEXT,
+    event_offset BIGINT,
+    record JSONB NOT NULL,
+    error TEXT,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_event_dlq_consumer_group
+    ON event_dlq (consumer_group, id);
@@ -0,0 +1,23 @@
+-- =============================================================================
+-- L9 Memory Substrate - Migration 0015
+-- Purpose: Expression indexes for Slack event dedupe
+-- =============================================================================
+-- Used by memory.slack_dedupe.check_packet_store (Postgres tier, reached
+-- when Redis is unavailable). Without them the event_id / composite lookup
+-- is a sequential scan of packet_store. Partial on slack.* packets; the
+-- query repeats the predicate so the planner can use them.
+-- This migration is IDEMPOTENT - safe to run multiple times.
+-- =============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_packet_store_slack_event_id
+    ON packet_store ((envelope->'payload'->>'event_id'))
+    WHERE packet_type LIKE 'slack.%';
+
+CREATE INDEX IF NOT EXISTS idx_packet_store_slack_message_key
+    ON packet_store (
+        (envelope->'payload'->>'team_id'),
+        (envelope->'payload'->>'channel_id'),
+        (envelope->'payload'->>'ts'),
+        (envelope->'payload'->>'user_id')
+    )
+    WHERE packet_type LIKE 'slack.%';
@@ -21,6 +21,7 @@ Deterministic Phases:
 
 Components:
 - UnifiedController: GOD-MODE top-level controller
+- RequestScheduler: Priority/deadline-aware admission control in front of it
 - TaskRouter: Route tasks to cells/agents based on complexity/risk
 - OrchestratorKernel: Core deterministic execution loop with IR Engine
 - CellOrchestrator: Multi-cell workflow coordination
@@ -37,10 +38,18 @@ from orchestration.unified_controller import (
     ControllerPhase,
     ExecutionMode,
 )
+from orchestration.request_scheduler import (
+    RequestScheduler,
+    SchedulerConfig,
+    RequestPriority,
+    RejectionReason,
+    RequestRejectedError,
+)
 from orchestration.task_router import (
     TaskRouter,
     TaskRoute,
     RoutingDecision,
+    RoutingCycleError,
     TaskType,
     ExecutionTarget,
     TaskComplexity,
@@ -93,10 +102,17 @@ __all__ = [
     "ControllerResult",
     "ControllerPhase",
     "ExecutionMode",
+    # Request Scheduler (admission control)
+    "RequestScheduler",
+    "SchedulerConfig",
+    "RequestPriority",
+    "RejectionReason",
+    "RequestRejectedError",
     # Task Router
     "TaskRouter",
     "TaskRoute",
     "RoutingDecision",
+    "RoutingCycleError",
     "TaskType",
     "ExecutionTarget",
     "TaskComplexity",
@@ -0,0 +1,498 @@
+"""
+L9 Orchestration - Request Scheduler
+====================================
+
+Admission control in front of UnifiedController.handle_request.
+
+Provides:
+- Global and per-tenant concurrency limits
+- Priority ordering of queued requests (CRITICAL → LOW, then earliest deadline)
+- Deadlines that are propagated to the controller so it can prune
+  optional phases (deliberate / simulate / reflect) when the budget is short
+- Load shedding: a bounded queue, eviction of the lowest-priority waiter
+  when a more important request arrives, and degraded (optional-phase-free)
+  execution when the queue is deep
+- Clear rejections via RequestRejectedError (reason + retry hint)
+
+Each in-flight request runs on its own UnifiedController instance drawn
+from a small pool, because the controller keeps per-request state.
+
+Usage:
+    scheduler = RequestScheduler(config=SchedulerConfig(max_concurrent=4))
+
+    try:
+        result = await scheduler.submit(
+            "Build a REST API for user management",
+            context={"project": "my-app"},
+            tenant_id="acme",
+            priority=RequestPriority.HIGH,
+            deadline_s=30.0,
+        )
+    except RequestRejectedError as e:
+        return {"error": e.reason.value, "retry_after_s": e.retry_after_s}
+
+Version: 1.0.0
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import itertools
+import structlog
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from enum import Enum, IntEnum
+from typing import Any, Callable, Optional
+
+from orchestration.unified_controller import ControllerResult
+
+logger = structlog.get_logger(__name__)
+
+try:
+    from telemetry.orchestration_metrics import (
+        record_scheduler_request,
+        set_scheduler_queue_depth,
+    )
+except ImportError:  # pragma: no cover - telemetry is optional
+
+    def record_scheduler_request(*args: Any, **kwargs: Any) -> None:  # type: ignore[misc]
+        return None
+
+    def set_scheduler_queue_depth(*args: Any, **kwargs: Any) -> None:  # type: ignore[misc]
+        return None
+
+
+# =============================================================================
+# Enums / Errors
+# =============================================================================
+
+
+class RequestPriority(IntEnum):
+    """Request priority (lower value = served first)."""
+
+    CRITICAL = 0
+    HIGH = 1
+    NORMAL = 2
+    LOW = 3
+
+
+class RejectionReason(str, Enum):
+    """Why the scheduler refused or abandoned a request."""
+
+    QUEUE_FULL = "queue_full"  # Queue at capacity, request not important enough
+    SHED = "shed"  # Evicted from the queue by a higher-priority request
+    DEADLINE_EXCEEDED = "deadline_exceeded"  # Deadline passed while queued
+    SHUTDOWN = "shutdown"  # Scheduler closed
+
+
+class RequestRejectedError(Exception):
+    """Raised when the scheduler will not run a request."""
+
+    def __init__(
+        self,
+        reason: RejectionReason,
+        tenant_id: str,
+        priority: RequestPriority,
+        retry_after_s: Optional[float] = None,
+    ):
+        self.reason = reason
+        self.tenant_id = tenant_id
+        self.priority = priority
+        self.retry_after_s = retry_after_s
+        super().__init__(
+            f"Request rejected ({reason.value}) for tenant={tenant_id} "
+            f"priority={priority.name}"
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "error": "request_rejected",
+            "reason": self.reason.value,
+            "tenant_id": self.tenant_id,
+            "priority": self.priority.name,
+            "retry_after_s": self.retry_after_s,
+        }
+
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+
+@dataclass
+class SchedulerConfig:
+    """Configuration for the request scheduler."""
+
+    # Concurrency
+    max_concurrent: int = 4
+    per_tenant_concurrency: int = 2
+
+    # Queueing / shedding
+    max_queue_depth: int = 100
+    degrade_queue_depth: int = 10  # Queue depth at which optional phases are shed
+    degraded_skip_phases: tuple[str, ...] = ("deliberate", "simulate")
+
+    # Deadlines (seconds); None = no default deadline
+    default_deadline_s: Optional[float] = 120.0
+
+
+# =============================================================================
+# Internal
+# =============================================================================
+
+
+@dataclass(order=True)
+class _PendingRequest:
+    sort_key: tuple[int, float, int]
+    tenant_id: str = field(compare=False)
+    priority: RequestPriority = field(compare=False)
+    enqueued_at: float = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+
+
+# =============================================================================
+# Scheduler
+# =============================================================================
+
+
+class RequestScheduler:
+    """
+    Priority- and deadline-aware scheduler for UnifiedController requests.
+
+    Requests are admitted immediately when a global slot and a tenant slot
+    are free; otherwise they wait in a priority queue ordered by
+    (priority, deadline, arrival). A bounded queue sheds the
+    lowest-priority waiter (or rejects the newcomer) when full.
+    """
+
+    def __init__(
+        self,
+        controller_factory: Optional[Callable[[], Any]] = None,
+        config: Optional[SchedulerConfig] = None,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            controller_factory: Zero-arg callable returning a controller with
+                an async ``handle_request(text, context, deadline=, skip_phases=)``
+                (default: UnifiedController())
+            config: Scheduler configuration
+        """
+        self._config = config or SchedulerConfig()
+        self._controller_factory = controller_factory or self._default_factory
+        self._idle_controllers: list[Any] = []
+
+        self._waiting: list[_PendingRequest] = []
+        self._seq = itertools.count()
+        self._running = 0
+        self._tenant_running: Counter[str] = Counter()
+        self._closed = False
+
+        # Stats
+        self._admitted = 0
+        self._completed = 0
+        self._rejected: Counter[str] = Counter()
+        self._degraded = 0
+        self._avg_service_s: Optional[float] = None
+
+        logger.info(
+            f"RequestScheduler initialized (max_concurrent={self._config.max_concurrent}, "
+            f"per_tenant={self._config.per_tenant_concurrency}, "
+            f"max_queue={self._config.max_queue_depth})"
+        )
+
+    @staticmethod
+    def _default_factory() -> Any:
+        from orchestration.unified_controller import UnifiedController
+
+        return UnifiedController()
+
+    # =========================================================================
+    # Public API
+    # =========================================================================
+
+    async def submit(
+        self,
+        text: str,
+        context: Optional[dict[str, Any]] = None,
+        *,
+        tenant_id: str = "default",
+        priority: RequestPriority = RequestPriority.NORMAL,
+        deadline_s: Optional[float] = None,
+    ) -> ControllerResult:
+        """
+        Run a request through the controller under admission control.
+
+        Args:
+            text: Natural language task description
+            context: Optional execution context (passed through)
+            tenant_id: Tenant for per-tenant concurrency accounting
+            priority: Request priority
+            deadline_s: Relative deadline in seconds (default: config)
+
+        Returns:
+            ControllerResult from the controller
+
+        Raises:
+            RequestRejectedError: If the request was refused or expired in queue
+        """
+        if self._closed:
+            self._reject(RejectionReason.SHUTDOWN, tenant_id, priority)
+
+        priority = RequestPriority(priority)
+        budget = deadline_s if deadline_s is not None else self._config.default_deadline_s
+        deadline = time.monotonic() + budget if budget is not None else None
+        enqueued_at = time.monotonic()
+
+        if not self._can_start(tenant_id) or self._has_eligible_waiter_ahead(
+            priority, deadline
+        ):
+            await self._wait_for_slot(tenant_id, priority, deadline, enqueued_at)
+        else:
+            self._acquire(tenant_id)
+
+        # Slot held from here on
+        try:
+            if deadline is not None and time.monotonic() >= deadline:
+                self._reject(RejectionReason.DEADLINE_EXCEEDED, tenant_id, priority)
+
+            wait_s = time.monotonic() - enqueued_at
+            self._admitted += 1
+            record_scheduler_request(priority.name, "admitted", wait_seconds=wait_s)
+
+            skip_phases = self._skip_phases_for(priority)
+            return await self._run(text, context, deadline, skip_phases)
+        finally:
+            self._release(tenant_id)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get scheduler statistics."""
+        return {
+            "running": self._running,
+            "queued": len(self._waiting),
+            "tenants_running": dict(self._tenant_running),
+            "admitted": self._admitted,
+            "completed": self._completed,
+            "rejected": dict(self._rejected),
+            "degraded": self._degraded,
+            "avg_service_s": self._avg_service_s,
+            "idle_controllers": len(self._idle_controllers),
+        }
+
+    async def close(self) -> None:
+        """Reject all queued requests and refuse new ones."""
+        self._closed = True
+        waiting, self._waiting = self._waiting, []
+        for pending in waiting:
+            if not pending.future.done():
+                pending.future.set_exception(
+                    RequestRejectedError(
+                        RejectionReason.SHUTDOWN, pending.tenant_id, pending.priority
+                    )
+                )
+        set_scheduler_queue_depth(0)
+
+    # =========================================================================
+    # Execution
+    # =========================================================================
+
+    async def _run(
+        self,
+        text: str,
+        context: Optional[dict[str, Any]],
+        deadline: Optional[float],
+        skip_phases: set[str],
+    ) -> ControllerResult:
+        """Run one request on a pooled controller."""
+        controller = (
+            self._idle_controllers.pop()
+            if self._idle_controllers
+            else self._controller_factory()
+        )
+        start = time.monotonic()
+        try:
+            return await controller.handle_request(
+                text,
+                context,
+                deadline=deadline,
+                skip_phases=skip_phases,
+            )
+        finally:
+            elapsed = time.monotonic() - start
+            self._avg_service_s = (
+                elapsed
+                if self._avg_service_s is None
+                else 0.8 * self._avg_service_s + 0.2 * elapsed
+            )
+            self._completed += 1
+            self._idle_controllers.append(controller)
+
+    def _skip_phases_for(self, priority: RequestPriority) -> set[str]:
+        """Shed optional phases for non-critical work when the queue is deep."""
+        if (
+            priority != RequestPriority.CRITICAL
+            and len(self._waiting) >= self._config.degrade_queue_depth
+        ):
+            self._degraded += 1
+            return set(self._config.degraded_skip_phases)
+        return set()
+
+    # =========================================================================
+    # Admission / Slots
+    # =========================================================================
+
+    def _can_start(self, tenant_id: str) -> bool:
+        return (
+            self._running < self._config.max_concurrent
+            and self._tenant_running[tenant_id] < self._config.per_tenant_concurrency
+        )
+
+    def _has_eligible_waiter_ahead(
+        self, priority: RequestPriority, deadline: Optional[float]
+    ) -> bool:
+        """True if a queued request that could run now would outrank this one."""
+        key = (int(priority), deadline if deadline is not None else float("inf"))
+        for pending in self._waiting:
+            if pending.sort_key[:2] > key:
+                return False
+            if self._tenant_running[pending.tenant_id] < self._config.per_tenant_concurrency:
+                return True
+        return False
+
+    def _acquire(self, tenant_id: str) -> None:
+        self._running += 1
+        self._tenant_running[tenant_id] += 1
+
+    def _release(self, tenant_id: str) -> None:
+        self._running -= 1
+        self._tenant_running[tenant_id] -= 1
+        if self._tenant_running[tenant_id] <= 0:
+            del self._tenant_running[tenant_id]
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Grant free slots to the best eligible waiters."""
+        index = 0
+        while self._running < self._config.max_concurrent and index < len(
+            self._waiting
+        ):
+            pending = self._waiting[index]
+            if pending.future.done():
+                self._waiting.pop(index)
+                continue
+            if self._tenant_running[pending.tenant_id] >= self._config.per_tenant_concurrency:
+                index += 1
+                continue
+            self._waiting.pop(index)
+            self._acquire(pending.tenant_id)
+            pending.future.set_result(True)
+        set_scheduler_queue_depth(len(self._waiting))
+
+    async def _wait_for_slot(
+        self,
+        tenant_id: str,
+        priority: RequestPriority,
+        deadline: Optional[float],
+        enqueued_at: float,
+    ) -> None:
+        """Queue the request and wait until _dispatch grants it a slot."""
+        if len(self._waiting) >= self._config.max_queue_depth:
+            self._shed_for(tenant_id, priority)
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        pending = _PendingRequest(
+            sort_key=(
+                int(priority),
+                deadline if deadline is not None else float("inf"),
+                next(self._seq),
+            ),
+            tenant_id=tenant_id,
+            priority=priority,
+            enqueued_at=enqueued_at,
+            future=future,
+        )
+        bisect.insort(self._waiting, pending)
+        set_scheduler_queue_depth(len(self._waiting))
+
+        timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+        try:
+            done, _ = await asyncio.wait({future}, timeout=timeout)
+        except asyncio.CancelledError:
+            self._abandon(pending)
+            raise
+
+        if not done:
+            self._abandon(pending)
+            self._reject(RejectionReason.DEADLINE_EXCEEDED, tenant_id, priority)
+
+        # Raises RequestRejectedError if the waiter was shed / shut down
+        future.result()
+
+    def _abandon(self, pending: _PendingRequest) -> None:
+        """Remove a waiter; give back its slot if it was granted concurrently."""
+        if pending.future.done() and not pending.future.cancelled():
+            if pending.future.exception() is None:
+                self._release(pending.tenant_id)
+            return
+        pending.future.cancel()
+        try:
+            self._waiting.remove(pending)
+        except ValueError:
+            pass
+        set_scheduler_queue_depth(len(self._waiting))
+
+    def _shed_for(self, tenant_id: str, priority: RequestPriority) -> None:
+        """Make room in a full queue or reject the newcomer."""
+        worst = self._waiting[-1]
+        if worst.priority > priority:
+            self._waiting.pop()
+            self._rejected[RejectionReason.SHED.value] += 1
+            record_scheduler_request(worst.priority.name, "rejected_shed")
+            worst.future.set_exception(
+                RequestRejectedError(
+                    RejectionReason.SHED,
+                    worst.tenant_id,
+                    worst.priority,
+                    retry_after_s=self._retry_after(),
+                )
+            )
+            logger.warning(
+                f"Shed queued {worst.priority.name} request for tenant "
+                f"{worst.tenant_id} in favour of {priority.name}"
+            )
+            return
+        self._reject(RejectionReason.QUEUE_FULL, tenant_id, priority)
+
+    def _retry_after(self) -> Optional[float]:
+        if self._avg_service_s is None:
+            return None
+        backlog = len(self._waiting) / max(1, self._config.max_concurrent)
+        return round(self._avg_service_s * (backlog + 1), 3)
+
+    def _reject(
+        self, reason: RejectionReason, tenant_id: str, priority: RequestPriority
+    ) -> None:
+        self._rejected[reason.value] += 1
+        record_scheduler_request(RequestPriority(priority).name, f"rejected_{reason.value}")
+        logger.warning(
+            f"Rejected request for tenant {tenant_id} "
+            f"({RequestPriority(priority).name}): {reason.value}"
+        )
+        raise RequestRejectedError(
+            reason,
+            tenant_id,
+            RequestPriority(priority),
+            retry_after_s=self._retry_after(),
+        )
+
+
+__all__ = [
+    "RequestScheduler",
+    "SchedulerConfig",
+    "RequestPriority",
+    "RejectionReason",
+    "RequestRejectedError",
+]
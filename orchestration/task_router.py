@@ -30,13 +30,19 @@ Security Features (v2.1.0):
 - Agent capability validation before routing
 - Trace ID / Correlation ID support
 
-Version: 2.1.0
+Performance (v2.2.0):
+- Bounded LRU cache of routing analysis keyed by normalized task text
+  and explicit type/complexity/risk overrides
+- Iterative Kahn ordering for dependency routing with cycle diagnostics
+
+Version: 2.2.0
 """
 
 from __future__ import annotations
 
 import structlog
 import re
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -163,6 +169,36 @@ class RoutingDecision:
         }
 
 
+class RoutingCycleError(ValueError):
+    """Raised when task dependencies contain a cycle."""
+
+    def __init__(self, cycle: list[str], unresolved: list[str]):
+        self.cycle = cycle
+        self.unresolved = unresolved
+        super().__init__(
+            f"Dependency cycle detected: {' -> '.join(cycle)} "
+            f"({len(unresolved)} task(s) could not be ordered)"
+        )
+
+
+@dataclass
+class _CachedRouting:
+    """Text-derived routing analysis reusable across identical tasks."""
+
+    task_type: TaskType
+    complexity: TaskComplexity
+    risk: TaskRisk
+    primary_route: TaskRoute
+    secondary_routes: list[TaskRoute]
+    confidence: float
+    reasoning: str
+    analysis: dict[str, Any]
+
+
+# Default bound for the routing-decision cache (entries)
+DEFAULT_ROUTING_CACHE_SIZE = 4096
+
+
 # =============================================================================
 # Task Analysis Patterns
 # =============================================================================
@@ -275,13 +311,24 @@ class TaskRouter:
         # decision.primary_route.target == ExecutionTarget.IR_WITH_CELLS
     """
 
-    def __init__(self):
-        """Initialize the task router."""
+    def __init__(self, cache_size: int = DEFAULT_ROUTING_CACHE_SIZE):
+        """
+        Initialize the task router.
+
+        Args:
+            cache_size: Max entries in the routing-decision cache (0 disables)
+        """
         self._routing_history: list[RoutingDecision] = []
         self._target_load: dict[ExecutionTarget, int] = {
             target: 0 for target in ExecutionTarget
         }
 
+        # Routing-decision cache (LRU)
+        self._cache_size = cache_size
+        self._decision_cache: OrderedDict[tuple, _CachedRouting] = OrderedDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
+
         # Compile regex patterns
         self._type_patterns = {
             task_type: [re.compile(p, re.IGNORECASE) for p in patterns]
@@ -317,10 +364,149 @@ class TaskRouter:
         Returns:
             RoutingDecision with target and metadata
         """
-        task_id = UUID(task.get("task_id", str(uuid4())))
+        return self._route(task, context, log=True)
+
+    def _route(
+        self,
+        task: dict[str, Any],
+        context: Optional[dict[str, Any]],
+        log: bool,
+    ) -> RoutingDecision:
+        """Route one task; batch callers pass log=False and log a summary."""
+        raw_task_id = task.get("task_id")
+        task_id = UUID(str(raw_task_id)) if raw_task_id else uuid4()
         task_text = task.get("text", task.get("description", ""))
         context = context or {}
 
+        cached = self._analyze_cached(task_text, task, context)
+        task_type = cached.task_type
+        complexity = cached.complexity
+        risk = cached.risk
+        primary_route = cached.primary_route
+
+        decision = RoutingDecision(
+            task_id=task_id,
+            task_type=task_type,
+            complexity=complexity,
+            risk=risk,
+            primary_route=primary_route,
+            secondary_routes=cached.secondary_routes,
+            confidence=cached.confidence,
+            reasoning=cached.reasoning,
+            analysis=cached.analysis,
+        )
+
+        # Update load tracking
+        self._target_load[primary_route.target] += 1
+
+        # Store in history
+        self._routing_history.append(decision)
+
+        if log:
+            logger.info(
+                f"Routed task {task_id}: type={task_type.value}, "
+                f"complexity={complexity.value}, risk={risk.value} → {primary_route.target.value}"
+            )
+
+        return decision
+
+    # =========================================================================
+    # Routing Cache
+    # =========================================================================
+
+    @staticmethod
+    def _length_band(length: int) -> int:
+        """
+        Bucket text length by the thresholds the analysis depends on.
+
+        Edges match _assess_complexity (< 50, > 500) and
+        _calculate_confidence (> 50, > 100).
+        """
+        if length < 50:
+            return 0
+        if length <= 50:
+            return 1
+        if length <= 100:
+            return 2
+        if length <= 500:
+            return 3
+        return 4
+
+    def _cache_key(self, task_text: str, task: dict[str, Any]) -> tuple:
+        """
+        Build the cache key for a task.
+
+        Classification is case-insensitive and whitespace-tolerant, so the
+        text is casefolded and whitespace-collapsed. Length only matters via
+        the thresholds in _assess_complexity/_calculate_confidence, so it is
+        keyed by band. Explicit type/complexity/risk overrides are included.
+        """
+        normalized = " ".join(task_text.split()).casefold()
+        return (
+            normalized,
+            self._length_band(len(task_text)),
+            task.get("type"),
+            task.get("complexity"),
+            task.get("risk"),
+        )
+
+    def _analyze_cached(
+        self,
+        task_text: str,
+        task: dict[str, Any],
+        context: dict[str, Any],
+    ) -> _CachedRouting:
+        """
+        Return routing analysis for a task, reusing cached results.
+
+        The returned routes and analysis are fresh copies, so callers may
+        mutate the decision (e.g. CapabilityEnforcedRouter rerouting).
+        """
+        key = self._cache_key(task_text, task) if self._cache_size > 0 else None
+
+        entry = self._decision_cache.get(key) if key is not None else None
+        if entry is not None:
+            self._cache_hits += 1
+            self._decision_cache.move_to_end(key)
+        else:
+            self._cache_misses += 1
+            entry = self._analyze(task_text, task, context)
+            if key is not None:
+                self._decision_cache[key] = entry
+                if len(self._decision_cache) > self._cache_size:
+                    self._decision_cache.popitem(last=False)
+
+        return _CachedRouting(
+            task_type=entry.task_type,
+            complexity=entry.complexity,
+            risk=entry.risk,
+            primary_route=self._copy_route(entry.primary_route),
+            secondary_routes=[self._copy_route(r) for r in entry.secondary_routes],
+            confidence=entry.confidence,
+            reasoning=entry.reasoning,
+            analysis={**entry.analysis, "text_length": len(task_text)},
+        )
+
+    @staticmethod
+    def _copy_route(route: TaskRoute) -> TaskRoute:
+        return TaskRoute(
+            target=route.target,
+            priority=route.priority,
+            requires_simulation=route.requires_simulation,
+            requires_collaboration=route.requires_collaboration,
+            cell_types=list(route.cell_types),
+            parameters=dict(route.parameters),
+            fallback_target=route.fallback_target,
+            estimated_duration_ms=route.estimated_duration_ms,
+        )
+
+    def _analyze(
+        self,
+        task_text: str,
+        task: dict[str, Any],
+        context: dict[str, Any],
+    ) -> _CachedRouting:
+        """Run the full (uncached) text analysis and route selection."""
         # Analyze task
         task_type = self._classify_task_type(task_text, task)
         complexity = self._assess_complexity(task_text, task)
@@ -348,8 +534,7 @@ class TaskRouter:
         # Build reasoning
         reasoning = self._build_reasoning(task_type, complexity, risk, primary_route)
 
-        decision = RoutingDecision(
-            task_id=task_id,
+        return _CachedRouting(
             task_type=task_type,
             complexity=complexity,
             risk=risk,
@@ -360,18 +545,20 @@ class TaskRouter:
             analysis=analysis,
         )
 
-        # Update load tracking
-        self._target_load[primary_route.target] += 1
-
-        # Store in history
-        self._routing_history.append(decision)
-
-        logger.info(
-            f"Routed task {task_id}: type={task_type.value}, "
-            f"complexity={complexity.value}, risk={risk.value} → {primary_route.target.value}"
-        )
+    def get_cache_stats(self) -> dict[str, int]:
+        """Get routing-decision cache statistics."""
+        return {
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "size": len(self._decision_cache),
+            "max_size": self._cache_size,
+        }
 
-        return decision
+    def clear_cache(self) -> None:
+        """Drop all cached routing analysis (e.g. after pattern changes)."""
+        self._decision_cache.clear()
+        self._cache_hits = 0
+        self._cache_misses = 0
 
     # =========================================================================
     # Task Classification
@@ -764,7 +951,9 @@ class TaskRouter:
         Returns:
             List of routing decisions
         """
-        return [self.route(task, context) for task in tasks]
+        decisions = [self._route(task, context, log=False) for task in tasks]
+        self._log_batch_summary("route_batch", decisions)
+        return decisions
 
     def route_with_dependencies(
         self,
@@ -774,42 +963,118 @@ class TaskRouter:
         """
         Route tasks considering dependencies.
 
+        Tasks are ordered with Kahn's algorithm (dependencies first, input
+        order preserved among independent tasks). Dependencies on unknown
+        task ids are ignored.
+
         Args:
             tasks: List of tasks with 'id' field
             dependencies: Map of task_id → list of dependency task_ids
 
         Returns:
             Ordered list of routing decisions
+
+        Raises:
+            RoutingCycleError: If the dependencies contain a cycle
         """
         # Build task map
         task_map = {t.get("id", str(uuid4())): t for t in tasks}
 
-        # Topological sort
-        ordered_ids: list[str] = []
-        visited: set[str] = set()
-
-        def visit(task_id: str) -> None:
-            if task_id in visited:
-                return
-            visited.add(task_id)
-            for dep_id in dependencies.get(task_id, []):
-                if dep_id in task_map:
-                    visit(dep_id)
-            ordered_ids.append(task_id)
-
-        for task_id in task_map:
-            visit(task_id)
+        ordered_ids = self._topological_order(task_map, dependencies)
 
         # Route in order
         decisions = []
         for task_id in ordered_ids:
             task = task_map[task_id]
             task["task_id"] = task_id
-            decision = self.route(task)
+            decision = self._route(task, None, log=False)
             decisions.append(decision)
 
+        self._log_batch_summary("route_with_dependencies", decisions)
         return decisions
 
+    def _log_batch_summary(
+        self, operation: str, decisions: list[RoutingDecision]
+    ) -> None:
+        """Log one summary line for a batch instead of one line per task."""
+        targets: dict[str, int] = {}
+        for decision in decisions:
+            target = decision.primary_route.target.value
+            targets[target] = targets.get(target, 0) + 1
+        logger.info(
+            f"{operation}: routed {len(decisions)} tasks → {targets} "
+            f"(cache hits={self._cache_hits}, misses={self._cache_misses})"
+        )
+
+    @staticmethod
+    def _topological_order(
+        task_map: dict[str, dict[str, Any]],
+        dependencies: dict[str, list[str]],
+    ) -> list[str]:
+        """Iterative Kahn ordering; raises RoutingCycleError on cycles."""
+        in_degree: dict[str, int] = {task_id: 0 for task_id in task_map}
+        dependents: dict[str, list[str]] = {task_id: [] for task_id in task_map}
+
+        for task_id in task_map:
+            for dep_id in dict.fromkeys(dependencies.get(task_id, [])):
+                if dep_id in task_map and dep_id != task_id:
+                    in_degree[task_id] += 1
+                    dependents[dep_id].append(task_id)
+                elif dep_id == task_id:
+                    raise RoutingCycleError([task_id, task_id], [task_id])
+
+        ready = deque(task_id for task_id, deg in in_degree.items() if deg == 0)
+        ordered_ids: list[str] = []
+
+        while ready:
+            task_id = ready.popleft()
+            ordered_ids.append(task_id)
+            for dependent in dependents[task_id]:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    ready.append(dependent)
+
+        if len(ordered_ids) < len(task_map):
+            unresolved = [t for t, deg in in_degree.items() if deg > 0]
+            cycle = TaskRouter._find_cycle(unresolved, task_map, dependencies)
+            logger.error(
+                f"Dependency cycle among {len(unresolved)} tasks: {' -> '.join(cycle)}"
+            )
+            raise RoutingCycleError(cycle, unresolved)
+
+        return ordered_ids
+
+    @staticmethod
+    def _find_cycle(
+        unresolved: list[str],
+        task_map: dict[str, dict[str, Any]],
+        dependencies: dict[str, list[str]],
+    ) -> list[str]:
+        """
+        Extract one concrete cycle from the nodes Kahn could not order.
+
+        Every unresolved node has an unresolved dependency, so walking
+        dependency edges from any of them must revisit a node.
+        """
+        remaining = set(unresolved)
+        position: dict[str, int] = {}
+        path: list[str] = []
+        node = unresolved[0]
+
+        while node not in position:
+            position[node] = len(path)
+            path.append(node)
+            node = next(
+                dep
+                for dep in dependencies.get(node, [])
+                if dep in task_map and dep in remaining
+            )
+
+        cycle = path[position[node] :]
+        # Report in execution direction (dependency -> dependent)
+        cycle.reverse()
+        return cycle + [cycle[0]]
+
     # =========================================================================
     # Load Management
     # =========================================================================
@@ -824,8 +1089,12 @@ class TaskRouter:
             self._target_load[target] = max(0, self._target_load[target] - 1)
 
     def get_load_summary(self) -> dict[str, int]:
-        """Get load summary for all targets."""
-        return {target.value: load for target, load in self._target_load.items()}
+        """Get load summary for all targets plus routing-cache counters."""
+        summary = {target.value: load for target, load in self._target_load.items()}
+        summary["routing_cache_hits"] = self._cache_hits
+        summary["routing_cache_misses"] = self._cache_misses
+        summary["routing_cache_size"] = len(self._decision_cache)
+        return summary
 
     # =========================================================================
     # History
@@ -46,6 +46,7 @@ Version: 2.0.0
 from __future__ import annotations
 
 import structlog
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -54,6 +55,23 @@ from uuid import UUID, uuid4
 
 logger = structlog.get_logger(__name__)
 
+try:
+    from telemetry.orchestration_metrics import (
+        record_controller_phase,
+        record_phase_skipped,
+    )
+except ImportError:  # pragma: no cover - telemetry is optional
+
+    def record_controller_phase(*args: Any, **kwargs: Any) -> None:  # type: ignore[misc]
+        return None
+
+    def record_phase_skipped(*args: Any, **kwargs: Any) -> None:  # type: ignore[misc]
+        return None
+
+
+# Phases that may be pruned under deadline pressure or load
+OPTIONAL_PHASES = ("deliberate", "simulate", "reflect")
+
 
 # =============================================================================
 # Enums
@@ -120,6 +138,19 @@ class ControllerConfig:
     # Execution
     real_execution: bool = False  # When True, actually modify files
 
+    # Deadline-aware phase pruning: initial per-phase cost estimates (ms).
+    # Refined at runtime with an EWMA of observed phase times.
+    phase_estimates_ms: dict[str, int] = field(
+        default_factory=lambda: {
+            "deliberate": 8000,
+            "simulate": 3000,
+            "plan": 200,
+            "execute": 2000,
+            "reflect": 300,
+        }
+    )
+    phase_estimate_alpha: float = 0.2
+
 
 # =============================================================================
 # State
@@ -140,6 +171,9 @@ class ControllerState:
     warnings: list[str] = field(default_factory=list)
     started_at: Optional[datetime] = None
     phase_times: dict[str, int] = field(default_factory=dict)
+    deadline: Optional[float] = None  # time.monotonic() deadline
+    skip_phases: set[str] = field(default_factory=set)
+    skipped_phases: list[str] = field(default_factory=list)
 
 
 # =============================================================================
@@ -183,6 +217,7 @@ class ControllerResult:
     # Timing
     duration_ms: int = 0
     phase_times: dict[str, int] = field(default_factory=dict)
+    skipped_phases: list[str] = field(default_factory=list)
 
     # Memory
     packets_emitted: int = 0
@@ -202,6 +237,7 @@ class ControllerResult:
             "corrections_made": self.corrections_made,
             "errors": self.errors,
             "duration_ms": self.duration_ms,
+            "skipped_phases": self.skipped_phases,
             "packets_emitted": self.packets_emitted,
         }
 
@@ -271,6 +307,11 @@ class UnifiedController:
         self._memory_client: Optional[Any] = None
         self._world_model: Optional[Any] = None
 
+        # Running per-phase cost estimates for deadline pruning
+        self._phase_estimates_ms: dict[str, float] = dict(
+            self._config.phase_estimates_ms
+        )
+
         logger.info(f"UnifiedController initialized in {self._config.mode.value} mode")
 
     # =========================================================================
@@ -397,6 +438,9 @@ class UnifiedController:
         self,
         text: str,
         context: Optional[dict[str, Any]] = None,
+        *,
+        deadline: Optional[float] = None,
+        skip_phases: Optional[set[str]] = None,
     ) -> ControllerResult:
         """
         Handle a request through the full L9 pipeline.
@@ -414,6 +458,11 @@ class UnifiedController:
                 - constraints: Additional constraints
                 - preferences: Execution preferences
                 - session_id: Session identifier
+            deadline: Optional ``time.monotonic()`` deadline. Optional phases
+                (deliberate/simulate/reflect) are pruned when the remaining
+                budget cannot cover them plus the mandatory phases.
+            skip_phases: Optional phases to skip unconditionally (e.g. when
+                the RequestScheduler is shedding load)
 
         Returns:
             ControllerResult with all pipeline outputs
@@ -421,7 +470,11 @@ class UnifiedController:
         self._ensure_components()
 
         # Reset state
-        self._state = ControllerState(started_at=datetime.utcnow())
+        self._state = ControllerState(
+            started_at=datetime.utcnow(),
+            deadline=deadline,
+            skip_phases=set(skip_phases or ()) & set(OPTIONAL_PHASES),
+        )
         result = ControllerResult()
 
         logger.info(
@@ -436,13 +489,18 @@ class UnifiedController:
             await self._phase_ir_pipeline(text, context or {}, result)
 
             # Phase 5: Deliberate (optional)
-            if self._config.require_deliberation and self._should_deliberate(result):
+            if (
+                self._config.require_deliberation
+                and self._should_deliberate(result)
+                and self._should_run_optional("deliberate")
+            ):
                 await self._phase_deliberate(text, result)
 
             # Phase 6: Simulate (optional)
             if (
                 self._config.require_simulation
                 and self._config.mode != ExecutionMode.FAST
+                and self._should_run_optional("simulate")
             ):
                 await self._phase_simulate(result)
 
@@ -456,8 +514,9 @@ class UnifiedController:
             # Phase 8: Execute
             await self._phase_execute(context or {}, result)
 
-            # Phase 9: Reflect
-            await self._phase_reflect(context or {}, result)
+            # Phase 9: Reflect (optional)
+            if self._should_run_optional("reflect"):
+                await self._phase_reflect(context or {}, result)
 
             # Complete
             self._state.phase = ControllerPhase.COMPLETE
@@ -479,6 +538,7 @@ class UnifiedController:
         result.errors = self._state.errors
         result.warnings = self._state.warnings
         result.phase_times = self._state.phase_times
+        result.skipped_phases = self._state.skipped_phases
         result.duration_ms = (
             self._elapsed_ms(self._state.started_at) if self._state.started_at else 0
         )
@@ -829,7 +889,8 @@ class UnifiedController:
                 if not self._state.current_plan:
                     await self._phase_plan(result)
                 await self._phase_execute(context or {}, result)
-                await self._phase_reflect(context or {}, result)
+                if self._should_run_optional("reflect"):
+                    await self._phase_reflect(context or {}, result)
                 result.success = True
 
         except Exception as e:
@@ -971,9 +1032,59 @@ class UnifiedController:
     # =========================================================================
 
     def _record_phase_time(self, phase: str, start_time: datetime) -> None:
-        """Record the duration of a phase."""
+        """Record the duration of a phase (state, histogram and estimate)."""
         duration_ms = self._elapsed_ms(start_time)
         self._state.phase_times[phase] = duration_ms
+        record_controller_phase(phase, duration_ms / 1000.0)
+
+        alpha = self._config.phase_estimate_alpha
+        previous = self._phase_estimates_ms.get(phase)
+        self._phase_estimates_ms[phase] = (
+            float(duration_ms)
+            if previous is None
+            else (1 - alpha) * previous + alpha * duration_ms
+        )
+
+    def _remaining_budget_ms(self) -> Optional[float]:
+        """Milliseconds left before the request deadline (None = unbounded)."""
+        if self._state.deadline is None:
+            return None
+        return (self._state.deadline - time.monotonic()) * 1000
+
+    def _should_run_optional(self, phase: str) -> bool:
+        """
+        Decide whether an optional phase fits in the remaining budget.
+
+        An optional phase runs only if its estimated cost plus the estimated
+        cost of the mandatory phases still ahead (plan, execute) fits before
+        the deadline. Reflect runs last, so it only has to fit itself.
+        """
+        reason: Optional[str] = None
+
+        if phase in self._state.skip_phases:
+            reason = "shed"
+        else:
+            remaining = self._remaining_budget_ms()
+            if remaining is not None:
+                needed = self._phase_estimates_ms.get(phase, 0.0)
+                if phase != "reflect":
+                    needed += self._phase_estimates_ms.get("plan", 0.0)
+                    needed += self._phase_estimates_ms.get("execute", 0.0)
+                if remaining < needed:
+                    reason = "deadline"
+
+        if reason is None:
+            return True
+
+        self._state.skipped_phases.append(phase)
+        self._state.warnings.append(f"Skipped optional phase '{phase}' ({reason})")
+        record_phase_skipped(phase, reason)
+        logger.info(f"Skipping optional phase {phase}: {reason}")
+        return False
+
+    def get_phase_estimates(self) -> dict[str, float]:
+        """Get the running per-phase cost estimates (ms)."""
+        return dict(self._phase_estimates_ms)
 
     def _elapsed_ms(self, start: datetime) -> int:
         """Calculate elapsed milliseconds from start time."""
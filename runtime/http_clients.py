@@ -0,0 +1,210 @@
+"""
+L9 Runtime - Shared HTTP Clients
+================================
+
+Long-lived httpx.AsyncClient instances, one connection pool per upstream,
+so Slack, AIOS, email, research and MCP calls reuse keep-alive connections
+instead of paying a TCP/TLS handshake per request.
+
+- Per-upstream limits and timeouts (UPSTREAMS, or configure())
+- HTTP/2 when the optional h2 package is installed (L9_HTTP2=false to
+  force HTTP/1.1)
+- Clients are bound to the event loop that created them; a different loop
+  (tests, worker restarts) gets fresh clients
+- close_http_clients() in the API lifespan shutdown
+
+Usage:
+    from runtime.http_clients import get_http_client
+
+    client = get_http_client("aios")
+    response = await client.post(f"{aios_base_url}/chat", json=payload)
+
+Env overrides (all upstreams): L9_HTTP_MAX_CONNECTIONS,
+L9_HTTP_MAX_KEEPALIVE, L9_HTTP_KEEPALIVE_EXPIRY, L9_HTTP2.
+
+Version: 1.0.0
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+import httpx
+import structlog
+
+try:
+    import h2  # noqa: F401
+
+    _has_h2 = True
+except ImportError:
+    _has_h2 = False
+
+logger = structlog.get_logger(__name__)
+
+HTTP2_ENABLED = _has_h2 and os.getenv("L9_HTTP2", "true").lower() == "true"
+_MAX_CONNECTIONS = os.getenv("L9_HTTP_MAX_CONNECTIONS")
+_MAX_KEEPALIVE = os.getenv("L9_HTTP_MAX_KEEPALIVE")
+_KEEPALIVE_EXPIRY = os.getenv("L9_HTTP_KEEPALIVE_EXPIRY")
+
+
+@dataclass(frozen=True)
+class UpstreamConfig:
+    """Connection pool and timeout settings for one upstream."""
+
+    timeout: float = 10.0
+    connect_timeout: float = 5.0
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    http2: bool = True
+    base_url: str = ""
+    headers: Tuple[Tuple[str, str], ...] = field(default_factory=tuple)
+
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=int(_MAX_CONNECTIONS or self.max_connections),
+            max_keepalive_connections=int(_MAX_KEEPALIVE or self.max_keepalive_connections),
+            keepalive_expiry=float(_KEEPALIVE_EXPIRY or self.keepalive_expiry),
+        )
+
+
+UPSTREAMS: Dict[str, UpstreamConfig] = {
+    "default": UpstreamConfig(),
+    "slack": UpstreamConfig(timeout=10.0, max_keepalive_connections=10),
+    "aios": UpstreamConfig(timeout=10.0, max_connections=200, max_keepalive_connections=50),
+    "email": UpstreamConfig(timeout=30.0),
+    "research": UpstreamConfig(timeout=300.0, connect_timeout=10.0, max_keepalive_connections=10),
+    "mcp": UpstreamConfig(timeout=60.0),
+}
+
+
+class HTTPClientRegistry:
+    """Creates and caches one httpx.AsyncClient per upstream (and event loop)."""
+
+    def __init__(self, upstreams: Optional[Mapping[str, UpstreamConfig]] = None):
+        self._upstreams: Dict[str, UpstreamConfig] = dict(upstreams or UPSTREAMS)
+        self._clients: Dict[Tuple[Any, ...], Tuple[httpx.AsyncClient, Any]] = {}
+        self._created = 0
+
+    def configure(self, name: str, **settings: Any) -> UpstreamConfig:
+        """Set or update an upstream's settings (applies to clients created later)."""
+        config = replace(self._upstreams.get(name, self._upstreams["default"]), **settings)
+        self._upstreams[name] = config
+        return config
+
+    def get(
+        self,
+        name: str = "default",
+        *,
+        base_url: Optional[str] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> httpx.AsyncClient:
+        """
+        Shared client for an upstream.
+
+        base_url, headers and timeout override the upstream config; each
+        distinct combination gets its own pool (e.g. one per API key).
+        """
+        config = self._upstreams.get(name) or self._upstreams["default"]
+        overrides: Dict[str, Any] = {}
+        if base_url is not None:
+            overrides["base_url"] = base_url
+        if headers:
+            overrides["headers"] = tuple(sorted(headers.items()))
+        if timeout is not None:
+            overrides["timeout"] = timeout
+        if overrides:
+            config = replace(config, **overrides)
+
+        loop = _running_loop()
+        key = (name, config)
+        cached = self._clients.get(key)
+        if cached is not None:
+            client, client_loop = cached
+            if client_loop is loop and not client.is_closed:
+                return client
+
+        client = httpx.AsyncClient(
+            base_url=config.base_url,
+            headers=dict(config.headers),
+            timeout=httpx.Timeout(config.timeout, connect=config.connect_timeout),
+            limits=config.limits(),
+            http2=HTTP2_ENABLED and config.http2,
+        )
+        self._clients[key] = (client, loop)
+        self._created += 1
+        logger.debug(
+            "http_client_created",
+            upstream=name,
+            http2=HTTP2_ENABLED and config.http2,
+            max_connections=config.limits().max_connections,
+        )
+        return client
+
+    async def aclose(self) -> None:
+        """Close every client created on the running loop; drop the rest."""
+        loop = _running_loop()
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client, client_loop in clients:
+            if client_loop is loop and not client.is_closed:
+                try:
+                    await client.aclose()
+                except Exception as e:
+                    logger.warning("http_client_close_failed", error=str(e))
+
+    def stats(self) -> Dict[str, Any]:
+        """Open clients per upstream and total clients created."""
+        open_clients: Dict[str, int] = {}
+        for (name, _), (client, _) in self._clients.items():
+            if not client.is_closed:
+                open_clients[name] = open_clients.get(name, 0) + 1
+        return {"http2": HTTP2_ENABLED, "open": open_clients, "created": self._created}
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+# =============================================================================
+# Singleton
+# =============================================================================
+
+_registry = HTTPClientRegistry()
+
+
+def get_http_registry() -> HTTPClientRegistry:
+    return _registry
+
+
+def get_http_client(
+    name: str = "default",
+    *,
+    base_url: Optional[str] = None,
+    headers: Optional[Mapping[str, str]] = None,
+    timeout: Optional[float] = None,
+) -> httpx.AsyncClient:
+    """Shared client for an upstream (see HTTPClientRegistry.get)."""
+    return _registry.get(name, base_url=base_url, headers=headers, timeout=timeout)
+
+
+async def close_http_clients() -> None:
+    """Close all shared clients (API lifespan shutdown)."""
+    await _registry.aclose()
+
+
+__all__ = [
+    "UpstreamConfig",
+    "UPSTREAMS",
+    "HTTPClientRegistry",
+    "get_http_registry",
+    "get_http_client",
+    "close_http_clients",
+]
@@ -0,0 +1,500 @@
+"""
+L9 Kernel Bundle - Compiled Kernel Cache
+
+Kernel loading used to re-parse every YAML file with the pure-Python
+loader and re-hash it on each call (load_kernel_stack, load_kernels,
+load_kernels_phase1, and get_enabled_rules via load_all_private_kernels).
+
+A KernelBundle is the compiled form of a set of kernel files:
+- parsed documents (with the C YAML loader when PyYAML was built with
+  libyaml)
+- SHA256 of each file, computed from the same bytes that were parsed
+- a pre-flattened, priority-sorted table of enabled rules
+- each file's (mtime_ns, size) stamp
+
+Bundles are serialized as JSON and cached in two tiers: in-process, and
+on disk under L9_KERNEL_BUNDLE_CACHE_DIR (default ~/.cache/l9/kernel_bundles;
+set L9_KERNEL_BUNDLE_CACHE=off to disable the disk tier). A cached bundle
+is valid while every source file's stamp is unchanged, so a warm load costs
+one os.stat per file plus json.loads. Each load returns fresh objects, so
+callers may mutate what they get. YAML values JSON lacks (non-string
+mapping keys, timestamps, binary, sets) are stored as tagged objects;
+a kernel set that still does not round-trip exactly is only cached
+in-process.
+
+Stamps are a load-speed shortcut, not proof that a file is unchanged:
+loaders that verify integrity pass verify=True, which re-hashes the files
+and recompiles the bundle if any digest differs.
+
+The cache directory is created 0700; cache files or directories that are
+not owned by the current user, or are writable by group or others, are
+ignored.
+
+Version: 1.0.0
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import os
+import tempfile
+import time
+from datetime import date, datetime
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import structlog
+import yaml
+
+logger = structlog.get_logger(__name__)
+
+# Bump when the KernelBundle layout changes (invalidates disk caches)
+BUNDLE_FORMAT_VERSION = 2
+
+# libyaml-backed loader when available (~10x faster than SafeLoader)
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "l9" / "kernel_bundles"
+CACHE_DIR_MODE = 0o700
+
+FileStamp = Tuple[int, int]  # (st_mtime_ns, st_size)
+
+
+def yaml_load(text: str | bytes) -> Any:
+    """Parse YAML with the fastest available safe loader."""
+    return yaml.load(text, Loader=YAML_LOADER)
+
+
+def file_stamp(path: Path | str) -> FileStamp:
+    """Cheap change detector for a file: (mtime_ns, size)."""
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size)
+
+
+def sha256_file(path: Path | str) -> str:
+    """SHA256 hex digest of a file's current bytes."""
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _is_private(path: Path) -> bool:
+    """Owned by this user and not writable by group or others."""
+    st = os.stat(path)
+    return st.st_uid == os.getuid() and not st.st_mode & 0o022
+
+
+@dataclass(frozen=True)
+class KernelSource:
+    """A kernel file to compile, with its discovery layer (if any)."""
+
+    path: str
+    layer: Optional[str] = None
+    layer_order: int = 50
+
+
+@dataclass
+class KernelBundle:
+    """
+    Compiled kernel set.
+
+    Attributes:
+        sources: Source files, in discovery order
+        documents: path -> parsed YAML (None for empty or unparseable files)
+        hashes: path -> SHA256 hex digest
+        stamps: path -> (mtime_ns, size) at compile time
+        rules: Enabled rules across all kernels, sorted by
+            (layer_order, kernel priority), each enriched with
+            _kernel_name and _kernel_priority
+        errors: path -> YAML parse error message
+        compiled_at: Compile time (epoch seconds)
+    """
+
+    sources: List[KernelSource]
+    documents: Dict[str, Any] = field(default_factory=dict)
+    hashes: Dict[str, str] = field(default_factory=dict)
+    stamps: Dict[str, FileStamp] = field(default_factory=dict)
+    rules: List[Dict[str, Any]] = field(default_factory=list)
+    errors: Dict[str, str] = field(default_factory=dict)
+    compiled_at: float = 0.0
+
+
+def _kernel_sort_key(source: KernelSource, document: Any) -> Tuple[int, int]:
+    """(layer_order, kernel.priority), matching load_all_private_kernels."""
+    kernel_info = document.get("kernel", {}) or {}
+    return (source.layer_order, int(kernel_info.get("priority", 100)))
+
+
+def compile_kernel_bundle(sources: Sequence[KernelSource]) -> KernelBundle:
+    """
+    Parse, hash and index a set of kernel files.
+
+    Args:
+        sources: Kernel files to compile
+
+    Returns:
+        KernelBundle (parse failures are recorded in bundle.errors)
+
+    Raises:
+        FileNotFoundError: If a source file does not exist
+    """
+    bundle = KernelBundle(sources=list(sources), compiled_at=time.time())
+
+    for source in bundle.sources:
+        stamp = file_stamp(source.path)
+        with open(source.path, "rb") as f:
+            data = f.read()
+
+        bundle.stamps[source.path] = stamp
+        bundle.hashes[source.path] = hashlib.sha256(data).hexdigest()
+        try:
+            bundle.documents[source.path] = yaml_load(data)
+        except yaml.YAMLError as e:
+            bundle.documents[source.path] = None
+            bundle.errors[source.path] = str(e)
+
+    bundle.rules = _flatten_rules(bundle)
+    return bundle
+
+
+def _flatten_rules(bundle: KernelBundle) -> List[Dict[str, Any]]:
+    """Pre-flattened rule table (same content and order as get_enabled_rules)."""
+    kernels = [
+        (source, bundle.documents[source.path])
+        for source in bundle.sources
+        if isinstance(bundle.documents[source.path], dict)
+    ]
+    kernels.sort(key=lambda item: _kernel_sort_key(*item))
+
+    rules: List[Dict[str, Any]] = []
+    for _, document in kernels:
+        kernel_info = document.get("kernel", {}) or {}
+        kernel_name = kernel_info.get("name", "unknown")
+        kernel_priority = kernel_info.get("priority", 100)
+        for rule in kernel_info.get("rules", []) or []:
+            if isinstance(rule, dict) and rule.get("enabled", True):
+                rules.append(
+                    {
+                        **rule,
+                        "_kernel_name": kernel_name,
+                        "_kernel_priority": kernel_priority,
+                    }
+                )
+    return rules
+
+
+# Tagged forms for YAML values JSON cannot hold: {"<tag>": payload}
+_TAGS = ("__map__", "__datetime__", "__date__", "__binary__", "__set__")
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, dict):
+        if all(isinstance(k, str) for k in value) and not (
+            len(value) == 1 and next(iter(value)) in _TAGS
+        ):
+            return {k: _encode(v) for k, v in value.items()}
+        return {"__map__": [[_encode(k), _encode(v)] for k, v in value.items()]}
+    if isinstance(value, list):
+        return [_encode(v) for v in value]
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, date):
+        return {"__date__": value.isoformat()}
+    if isinstance(value, bytes):
+        return {"__binary__": base64.b64encode(value).decode("ascii")}
+    if isinstance(value, (set, frozenset)):
+        return {"__set__": [_encode(v) for v in value]}
+    return value
+
+
+def _decode(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_decode(v) for v in value]
+    if not isinstance(value, dict):
+        return value
+    if len(value) == 1:
+        tag, payload = next(iter(value.items()))
+        if tag == "__map__":
+            return {_decode(k): _decode(v) for k, v in payload}
+        if tag == "__datetime__":
+            return datetime.fromisoformat(payload)
+        if tag == "__date__":
+            return date.fromisoformat(payload)
+        if tag == "__binary__":
+            return base64.b64decode(payload)
+        if tag == "__set__":
+            return {_decode(v) for v in payload}
+    return {k: _decode(v) for k, v in value.items()}
+
+
+def dump_bundle(bundle: KernelBundle) -> Optional[str]:
+    """
+    Serialize a bundle to JSON.
+
+    Returns:
+        JSON text, or None if the documents do not survive the round trip
+        (e.g. NaN values)
+    """
+    try:
+        text = json.dumps(
+            {
+                "format": BUNDLE_FORMAT_VERSION,
+                "sources": [[s.path, s.layer, s.layer_order] for s in bundle.sources],
+                "documents": _encode(bundle.documents),
+                "hashes": bundle.hashes,
+                "stamps": bundle.stamps,
+                "compiled_at": bundle.compiled_at,
+            },
+            allow_nan=False,
+        )
+    except (TypeError, ValueError):
+        return None
+    if _decode(json.loads(text)["documents"]) != bundle.documents:
+        return None
+    return text
+
+
+def restore_bundle(text: str) -> KernelBundle:
+    """Rebuild a KernelBundle from dump_bundle() output."""
+    data = json.loads(text)
+    if data.get("format") != BUNDLE_FORMAT_VERSION:
+        raise ValueError(f"unsupported bundle format {data.get('format')!r}")
+    bundle = KernelBundle(
+        sources=[KernelSource(path, layer, order) for path, layer, order in data["sources"]],
+        documents=_decode(data["documents"]),
+        hashes=data["hashes"],
+        stamps={path: tuple(stamp) for path, stamp in data["stamps"].items()},
+        compiled_at=data["compiled_at"],
+    )
+    bundle.rules = _flatten_rules(bundle)
+    return bundle
+
+
+# =============================================================================
+# Bundle Cache
+# =============================================================================
+
+
+class KernelBundleCache:
+    """
+    Two-tier (in-process + disk) cache of compiled kernel bundles, validated
+    by file stamps.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path | str] = None,
+        persist: Optional[bool] = None,
+    ):
+        """
+        Args:
+            cache_dir: Directory for serialized bundles
+                (L9_KERNEL_BUNDLE_CACHE_DIR or DEFAULT_CACHE_DIR)
+            persist: Whether to use the disk tier (default: unless
+                L9_KERNEL_BUNDLE_CACHE=off)
+        """
+        if persist is None:
+            persist = os.getenv("L9_KERNEL_BUNDLE_CACHE", "on").lower() not in (
+                "off",
+                "0",
+                "false",
+            )
+        self._persist = persist
+        self._cache_dir = Path(
+            cache_dir or os.getenv("L9_KERNEL_BUNDLE_CACHE_DIR") or DEFAULT_CACHE_DIR
+        )
+        # key -> (stamps, serialized bundle)
+        self._memory: Dict[str, Tuple[Dict[str, FileStamp], str]] = {}
+
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._compiles = 0
+        self._stale = 0
+
+    @staticmethod
+    def _key(sources: Sequence[KernelSource]) -> str:
+        identity = repr(
+            (BUNDLE_FORMAT_VERSION, [(s.path, s.layer, s.layer_order) for s in sources])
+        )
+        return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _is_fresh(sources: Sequence[KernelSource], stamps: Dict[str, FileStamp]) -> bool:
+        try:
+            return all(file_stamp(s.path) == stamps.get(s.path) for s in sources)
+        except OSError:
+            return False
+
+    def load(self, sources: Sequence[KernelSource], verify: bool = False) -> KernelBundle:
+        """
+        Get the compiled bundle for a set of kernel files.
+
+        Args:
+            sources: Kernel files, in discovery order
+            verify: Re-hash the files and recompile if a cached bundle's
+                digests differ (use whenever the hashes feed an integrity
+                check; stamps alone can be forged)
+
+        Returns:
+            KernelBundle with fresh (caller-owned) objects
+
+        Raises:
+            FileNotFoundError: If a source file does not exist
+        """
+        key = self._key(sources)
+
+        cached = self._memory.get(key)
+        tier = "memory"
+        if cached is None and self._persist:
+            # The disk copy was written alongside the memory copy, so only
+            # consult it when this process has not compiled the set yet
+            cached = self._read_disk(key)
+            tier = "disk"
+
+        if cached is not None:
+            stamps, text = cached
+            bundle = self._restore(sources, stamps, text, verify)
+            if bundle is not None:
+                if tier == "memory":
+                    self._memory_hits += 1
+                else:
+                    self._disk_hits += 1
+                    self._memory[key] = cached
+                return bundle
+            self._stale += 1
+            self._memory.pop(key, None)
+
+        bundle = compile_kernel_bundle(sources)
+        self._compiles += 1
+        if bundle.errors:
+            # Never cache a broken kernel set; report the errors every time
+            return bundle
+
+        text = dump_bundle(bundle)
+        if text is not None:
+            self._memory[key] = (dict(bundle.stamps), text)
+            if self._persist:
+                self._write_disk(key, bundle.stamps, text)
+        return bundle
+
+    def _restore(
+        self,
+        sources: Sequence[KernelSource],
+        stamps: Dict[str, FileStamp],
+        text: str,
+        verify: bool,
+    ) -> Optional[KernelBundle]:
+        """Cached bundle if still valid for sources, else None."""
+        if not self._is_fresh(sources, stamps):
+            return None
+        try:
+            bundle = restore_bundle(text)
+            if verify and any(
+                sha256_file(s.path) != bundle.hashes.get(s.path) for s in sources
+            ):
+                logger.warning("kernel_bundle.hash_mismatch", stamps_unchanged=True)
+                return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug("kernel_bundle.cache_restore_failed", error=str(e))
+            return None
+        return bundle
+
+    def _path(self, key: str) -> Path:
+        return self._cache_dir / f"{key}.json"
+
+    def _read_disk(self, key: str) -> Optional[Tuple[Dict[str, FileStamp], str]]:
+        path = self._path(key)
+        try:
+            if not (_is_private(self._cache_dir) and _is_private(path)):
+                logger.warning("kernel_bundle.cache_untrusted", path=str(path))
+                return None
+            text = path.read_text(encoding="utf-8")
+            stamps = json.loads(text)["stamps"]
+            return {p: tuple(stamp) for p, stamp in stamps.items()}, text
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug("kernel_bundle.cache_read_failed", error=str(e))
+            return None
+
+    def _write_disk(self, key: str, stamps: Dict[str, FileStamp], text: str) -> None:
+        try:
+            self._cache_dir.mkdir(mode=CACHE_DIR_MODE, parents=True, exist_ok=True)
+            if not _is_private(self._cache_dir):
+                logger.warning("kernel_bundle.cache_untrusted", path=str(self._cache_dir))
+                return
+            # mkstemp creates the file 0600
+            fd, tmp_path = tempfile.mkstemp(dir=self._cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp_path, self._path(key))
+        except Exception as e:
+            logger.debug("kernel_bundle.cache_write_failed", error=str(e))
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get hit/compile counters."""
+        return {
+            "entries": len(self._memory),
+            "memory_hits": self._memory_hits,
+            "disk_hits": self._disk_hits,
+            "compiles": self._compiles,
+            "stale": self._stale,
+            "persist": self._persist,
+            "cache_dir": str(self._cache_dir),
+            "yaml_loader": YAML_LOADER.__name__,
+        }
+
+    def clear_cache(self, persistent: bool = False) -> None:
+        """Drop the in-process tier (and the disk tier if persistent)."""
+        self._memory.clear()
+        if persistent and self._cache_dir.exists():
+            for path in self._cache_dir.glob("*.json"):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+
+_bundle_cache: Optional[KernelBundleCache] = None
+
+
+def get_kernel_bundle_cache() -> KernelBundleCache:
+    """Get the process-wide kernel bundle cache."""
+    global _bundle_cache
+    if _bundle_cache is None:
+        _bundle_cache = KernelBundleCache()
+    return _bundle_cache
+
+
+def load_kernel_bundle(paths: Sequence[Path | str], verify: bool = False) -> KernelBundle:
+    """
+    Load (compile or fetch from cache) the bundle for explicit kernel files.
+
+    Args:
+        paths: Kernel file paths, in load order
+        verify: Re-hash the files instead of trusting their stamps
+
+    Returns:
+        KernelBundle keyed by str(path)
+    """
+    sources = [KernelSource(path=str(p)) for p in paths]
+    return get_kernel_bundle_cache().load(sources, verify=verify)
+
+
+__all__ = [
+    "BUNDLE_FORMAT_VERSION",
+    "YAML_LOADER",
+    "KernelBundle",
+    "KernelBundleCache",
+    "KernelSource",
+    "compile_kernel_bundle",
+    "dump_bundle",
+    "file_stamp",
+    "get_kernel_bundle_cache",
+    "load_kernel_bundle",
+    "restore_bundle",
+    "sha256_file",
+    "yaml_load",
+]
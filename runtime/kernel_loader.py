@@ -4,7 +4,7 @@ L9 Kernel Loader - THE CHOKE POINT
 This is the ONLY way kernels enter the system.
 If this file isn't used → kernels are not real.
 
-Version: 2.1.0 - Consolidated from private_loader.py
+Version: 2.2.0 - Compiled kernel bundle cache (runtime.kernel_bundle)
 Features:
 - Agent kernel absorption (load_kernels)
 - KernelStack loading (load_kernel_stack)
@@ -13,6 +13,8 @@ Features:
 - Validation (validate_kernel_structure, validate_all_kernels)
 - Neo4j graph sync for kernel influence tracking
 - SHA256 integrity verification
+- Parsed kernels, hashes and rule table served from a stat-validated
+  KernelBundle cache
 """
 
 from __future__ import annotations
@@ -23,6 +25,14 @@ from typing import Any, Dict, List, Optional, Protocol, Tuple
 import yaml
 import structlog
 
+from runtime.kernel_bundle import (
+    KernelBundle,
+    KernelSource,
+    get_kernel_bundle_cache,
+    load_kernel_bundle,
+    yaml_load,
+)
+
 logger = structlog.get_logger(__name__)
 
 
@@ -123,7 +133,7 @@ def load_kernels(agent: Any, base_path: Optional[Path] = None) -> Any:
     boot_overlay_path = base_path / "config" / "boot_overlay.yaml"
     if boot_overlay_path.exists():
         try:
-            boot_overlay = yaml.safe_load(boot_overlay_path.read_text())
+            boot_overlay = yaml_load(boot_overlay_path.read_text())
             if boot_overlay and hasattr(agent, "apply_boot_overlay"):
                 agent.apply_boot_overlay(boot_overlay)
             logger.info("kernel_loader.boot_overlay_applied")
@@ -136,16 +146,20 @@ def load_kernels(agent: Any, base_path: Optional[Path] = None) -> Any:
 
     logger.info("kernel_loader.start: loading %d kernels", len(KERNEL_ORDER))
 
+    try:
+        bundle = load_kernel_bundle([base_path / p for p in KERNEL_ORDER])
+    except OSError as e:
+        logger.error("kernel_loader.error: %s", e)
+        raise RuntimeError(f"Kernel loading failed: {e}") from e
+
     loaded_count = 0
     for kernel_path in KERNEL_ORDER:
-        full_path = base_path / kernel_path
-
-        if not full_path.exists():
-            logger.warning("kernel_loader.missing: %s", kernel_path)
-            continue
+        full_path = str(base_path / kernel_path)
 
         try:
-            data = yaml.safe_load(full_path.read_text())
+            if full_path in bundle.errors:
+                raise yaml.YAMLError(bundle.errors[full_path])
+            data = bundle.documents[full_path]
             if data:
                 agent.absorb_kernel(data)
                 agent.kernels[kernel_path] = data
@@ -637,12 +651,19 @@ def load_kernel_stack(
                 f"Kernel file missing: {full_path} (id={kernel_id})"
             )
 
-        data = yaml.safe_load(full_path.read_text())
-        digest = _sha256_of_file(full_path)
+    bundle = load_kernel_bundle(
+        [base_dir / f for f in KERNEL_ID_MAP.values()], verify=verify_integrity
+    )
 
+    for kernel_id, filename in KERNEL_ID_MAP.items():
+        full_path = str(base_dir / filename)
+        if full_path in bundle.errors:
+            raise yaml.YAMLError(f"{full_path}: {bundle.errors[full_path]}")
+
+        data = bundle.documents[full_path]
         kernels_by_id[kernel_id] = data
         kernels_by_file[filename] = data
-        hashes[filename] = digest
+        hashes[filename] = bundle.hashes[full_path]
 
     # Optionally verify integrity against stored hashes
     if verify_integrity:
@@ -691,8 +712,8 @@ def load_kernel_file(file_path: Path) -> Optional[Dict[str, Any]]:
         Parsed kernel dict, or None on failure
     """
     try:
-        with open(file_path, "r") as f:
-            content = yaml.safe_load(f)
+        with open(file_path, "rb") as f:
+            content = yaml_load(f.read())
 
         if content is None:
             logger.warning(f"Empty kernel file: {file_path}")
@@ -711,6 +732,27 @@ def load_kernel_file(file_path: Path) -> Optional[Dict[str, Any]]:
         return None
 
 
+def _check_private_integrity(base_path: str, fail_on_tamper: bool) -> None:
+    """Run the kernel integrity check, raising on tampering if requested."""
+    try:
+        from core.kernels.integrity import check_kernel_integrity, IntegrityChange
+
+        changes = check_kernel_integrity(base_path)
+        if changes:
+            modified = [
+                p for p, c in changes.items() if c == IntegrityChange.MODIFIED
+            ]
+            if modified:
+                logger.warning(f"Kernel integrity changes detected: {changes}")
+                if fail_on_tamper:
+                    raise RuntimeError(
+                        f"Kernel tampering detected in files: {modified}. "
+                        "Aborting load for security."
+                    )
+    except ImportError:
+        logger.debug("Integrity module not available, skipping check")
+
+
 def load_all_private_kernels(
     base_path: str = DEFAULT_KERNEL_PATH,
     check_integrity: bool = True,
@@ -745,24 +787,61 @@ def load_all_private_kernels(
 
     # Integrity check
     if check_integrity:
-        try:
-            from core.kernels.integrity import check_kernel_integrity, IntegrityChange
+        _check_private_integrity(base_path, fail_on_tamper)
 
-            changes = check_kernel_integrity(base_path)
-            if changes:
-                modified = [
-                    p for p, c in changes.items() if c == IntegrityChange.MODIFIED
-                ]
-                if modified:
-                    logger.warning(f"Kernel integrity changes detected: {changes}")
-                    if fail_on_tamper:
-                        raise RuntimeError(
-                            f"Kernel tampering detected in files: {modified}. "
-                            "Aborting load for security."
-                        )
-        except ImportError:
-            logger.debug("Integrity module not available, skipping check")
+    kernel_root, use_layered, sources = _discover_kernel_sources(base)
+    bundle = get_kernel_bundle_cache().load(sources, verify=check_integrity)
+
+    for path, error in bundle.errors.items():
+        logger.error(f"YAML parse error in {path}: {error}")
+
+    # bundle.sources is in discovery order; stable sort preserves it for ties
+    kernels: List[Dict[str, Any]] = []
+    for source in bundle.sources:
+        kernel = bundle.documents.get(source.path)
+        if kernel is None:
+            if source.path not in bundle.errors:
+                logger.warning(f"Empty kernel file: {source.path}")
+            continue
+        if not isinstance(kernel, dict):
+            continue
+
+        kernel["_source_file"] = source.path
+        if source.layer is not None:
+            kernel.setdefault("_meta", {})
+            kernel["_meta"]["source_file"] = source.path
+            kernel["_meta"]["layer"] = source.layer
+            kernel["_meta"]["layer_order"] = source.layer_order
+        kernels.append(kernel)
+
+    # Sort kernels by (layer_order, kernel.priority)
+    def _sort_key(k: Dict[str, Any]) -> Tuple[int, int]:
+        layer_order = 50
+        meta = k.get("_meta") or {}
+        if isinstance(meta, dict):
+            layer_order = int(meta.get("layer_order", 50))
 
+        kernel_info = k.get("kernel", {}) or {}
+        priority = int(kernel_info.get("priority", 100))
+        return (layer_order, priority)
+
+    kernels.sort(key=_sort_key)
+
+    logger.info(
+        f"Loaded {len(kernels)} private kernels from {kernel_root} "
+        f"(base_path={base_path}, layered={use_layered})"
+    )
+
+    return kernels
+
+
+def _discover_kernel_sources(base: Path) -> Tuple[Path, bool, List[KernelSource]]:
+    """
+    Find kernel files under base in load order.
+
+    Returns:
+        (kernel_root, use_layered, sources)
+    """
     # Determine where kernel files live
     kernel_root = base / "kernels"
     if not kernel_root.exists():
@@ -782,7 +861,7 @@ def load_all_private_kernels(
             layer_dirs.append((layer_path, order, name))
 
     use_layered = len(layer_dirs) > 0
-    kernels: List[Dict[str, Any]] = []
+    sources: List[KernelSource] = []
 
     if use_layered:
         # Layered mode: iterate layers in order
@@ -791,40 +870,35 @@ def load_all_private_kernels(
         for ext in KERNEL_EXTENSIONS:
             for layer_path, order, layer_name in layer_dirs:
                 for file in layer_path.rglob(f"*{ext}"):
-                    kernel = load_kernel_file(file)
-                    if kernel:
-                        kernel.setdefault("_meta", {})
-                        kernel["_meta"]["source_file"] = str(file)
-                        kernel["_meta"]["layer"] = layer_name
-                        kernel["_meta"]["layer_order"] = order
-                        kernels.append(kernel)
+                    sources.append(
+                        KernelSource(path=str(file), layer=layer_name, layer_order=order)
+                    )
     else:
         # Fallback: flat scan under kernel_root
         for ext in KERNEL_EXTENSIONS:
             for file in kernel_root.rglob(f"*{ext}"):
-                kernel = load_kernel_file(file)
-                if kernel:
-                    kernels.append(kernel)
+                sources.append(KernelSource(path=str(file)))
 
-    # Sort kernels by (layer_order, kernel.priority)
-    def _sort_key(k: Dict[str, Any]) -> Tuple[int, int]:
-        layer_order = 50
-        meta = k.get("_meta") or {}
-        if isinstance(meta, dict):
-            layer_order = int(meta.get("layer_order", 50))
+    return kernel_root, use_layered, sources
 
-        kernel_info = k.get("kernel", {}) or {}
-        priority = int(kernel_info.get("priority", 100))
-        return (layer_order, priority)
 
-    kernels.sort(key=_sort_key)
+def load_kernel_bundle_for(
+    base_path: str = DEFAULT_KERNEL_PATH,
+) -> Optional[KernelBundle]:
+    """
+    Get the compiled KernelBundle for the kernels under base_path.
 
-    logger.info(
-        f"Loaded {len(kernels)} private kernels from {kernel_root} "
-        f"(base_path={base_path}, layered={use_layered})"
-    )
+    Args:
+        base_path: Base directory to scan for kernels
 
-    return kernels
+    Returns:
+        KernelBundle, or None if base_path does not exist
+    """
+    base = Path(base_path)
+    if not base.exists():
+        return None
+    _, _, sources = _discover_kernel_sources(base)
+    return get_kernel_bundle_cache().load(sources)
 
 
 def load_layered_kernels(
@@ -892,24 +966,16 @@ def get_enabled_rules(
     Returns:
         List of enabled rule dicts
     """
-    kernels = load_all_private_kernels(base_path)
-    rules: List[Dict[str, Any]] = []
-
-    for kernel in kernels:
-        kernel_info = kernel.get("kernel", {})
-        kernel_name = kernel_info.get("name", "unknown")
-        kernel_priority = kernel_info.get("priority", 100)
+    base = Path(base_path)
+    if not base.exists():
+        logger.warning(f"Kernel base path does not exist: {base_path}")
+        return []
 
-        for rule in kernel_info.get("rules", []):
-            if rule.get("enabled", True):
-                enriched = {
-                    **rule,
-                    "_kernel_name": kernel_name,
-                    "_kernel_priority": kernel_priority,
-                }
-                rules.append(enriched)
+    _check_private_integrity(base_path, fail_on_tamper=False)
 
-    return rules
+    bundle = load_kernel_bundle_for(base_path)
+    # Pre-flattened and sorted at compile time (see compile_kernel_bundle)
+    return bundle.rules if bundle else []
 
 
 def get_rules_by_type(
@@ -1019,8 +1085,8 @@ def validate_packet_protocol_rules() -> Dict[str, Any]:
             "mismatches": []
         }
 
-    with open(kernel_path, "r") as f:
-        protocol_data = yaml.safe_load(f)
+    with open(kernel_path, "rb") as f:
+        protocol_data = yaml_load(f.read())
 
     # Extract ordered filenames from load_sequence.order (dict with numeric keys)
     order_dict = protocol_data.get("load_sequence", {}).get("order", {})
@@ -1074,6 +1140,7 @@ __all__ = [
     "load_kernel_file",
     "load_all_private_kernels",
     "load_layered_kernels",
+    "load_kernel_bundle_for",
     # Query functions
     "get_kernel_by_name",
     "get_enabled_rules",
@@ -1006,7 +1006,7 @@ async def mcp_discover_and_register(**kwargs: Any) -> dict[str, Any]:
 
             try:
                 tools = await client.list_tools(server_id)
-                server_registered = 0
+                tool_defs = []
 
                 for tool in tools:
                     # Build full tool name: server_tool (OpenAI-compatible, no dots)
@@ -1027,21 +1027,23 @@ async def mcp_discover_and_register(**kwargs: Any) -> dict[str, Any]:
                         risk_level = "medium"
                         is_destructive = True
 
-                    tool_def = ToolDefinition(
-                        name=full_name,
-                        description=tool.description or f"{tool.name} via {server_id} MCP",
-                        category="mcp",
-                        scope="external",
-                        risk_level=risk_level,
-                        requires_igor_approval=requires_igor,
-                        is_destructive=is_destructive,
-                        external_apis=[server_id.title(), "MCP"],
-                        agent_id="L",
+                    tool_defs.append(
+                        ToolDefinition(
+                            name=full_name,
+                            description=tool.description or f"{tool.name} via {server_id} MCP",
+                            category="mcp",
+                            scope="external",
+                            risk_level=risk_level,
+                            requires_igor_approval=requires_igor,
+                            is_destructive=is_destructive,
+                            external_apis=[server_id.title(), "MCP"],
+                            agent_id="L",
+                        )
                     )
 
-                    if await ToolGraph.register_tool(tool_def):
-                        server_registered += 1
-                        total_registered += 1
+                # One bulk transaction per server
+                server_registered = await ToolGraph.register_tools(tool_defs)
+                total_registered += server_registered
 
                 results[server_id] = {
                     "discovered": len(tools),
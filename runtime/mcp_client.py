@@ -20,7 +20,7 @@ import structlog
 import os
 from typing import Any, Dict, List, Optional
 
-import httpx
+from runtime.http_clients import get_http_client
 
 logger = structlog.get_logger(__name__)
 
@@ -586,46 +586,46 @@ class MCPClient:
         user_id = arguments.pop("user_id", None) or os.getenv("MCP_USER_ID", "cursor")
 
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(
-                    f"{base_url}/mcp/call",
-                    headers={
-                        "Content-Type": "application/json",
-                        **headers,
-                    },
-                    json={
-                        "tool_name": tool_name,
-                        "arguments": arguments,
-                        "user_id": user_id,
-                    },
-                )
+            client = get_http_client("mcp")
+            response = await client.post(
+                f"{base_url}/mcp/call",
+                headers={
+                    "Content-Type": "application/json",
+                    **headers,
+                },
+                json={
+                    "tool_name": tool_name,
+                    "arguments": arguments,
+                    "user_id": user_id,
+                },
+            )
 
-                if response.status_code == 200:
-                    data = response.json()
-                    logger.info(
-                        "HTTP MCP tool call succeeded",
-                        server_id=server_id,
-                        tool_name=tool_name,
-                    )
-                    return {
-                        "success": True,
-                        "result": data.get("result"),
-                        "error": None,
-                    }
-                else:
-                    error_text = response.text
-                    logger.error(
-                        "HTTP MCP tool call failed",
-                        server_id=server_id,
-                        tool_name=tool_name,
-                        status=response.status_code,
-                        error=error_text,
-                    )
-                    return {
-                        "success": False,
-                        "error": f"HTTP {response.status_code}: {error_text}",
-                        "result": None,
-                    }
+            if response.status_code == 200:
+                data = response.json()
+                logger.info(
+                    "HTTP MCP tool call succeeded",
+                    server_id=server_id,
+                    tool_name=tool_name,
+                )
+                return {
+                    "success": True,
+                    "result": data.get("result"),
+                    "error": None,
+                }
+            else:
+                error_text = response.text
+                logger.error(
+                    "HTTP MCP tool call failed",
+                    server_id=server_id,
+                    tool_name=tool_name,
+                    status=response.status_code,
+                    error=error_text,
+                )
+                return {
+                    "success": False,
+                    "error": f"HTTP {response.status_code}: {error_text}",
+                    "result": None,
+                }
 
         except Exception as e:
             logger.error(
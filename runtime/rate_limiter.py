@@ -93,10 +93,17 @@ class RateLimiter:
         if await self._ensure_redis():
             try:
                 redis_key = f"rate_limit:{key}"
-                current = await self._redis_client.get_rate_limit(redis_key)
+                # Check + increment in one atomic round trip
+                allowed, count = (
+                    await self._redis_client.check_and_increment_rate_limit(
+                        redis_key,
+                        limit,
+                        ttl=self._window_seconds,
+                    )
+                )
 
-                if current >= limit:
-                    logger.debug(f"Rate limit exceeded for {key}: {current}/{limit}")
+                if not allowed:
+                    logger.debug(f"Rate limit exceeded for {key}: {count}/{limit}")
                     # Log to Neo4j (async, non-blocking)
                     import asyncio
 
@@ -105,12 +112,7 @@ class RateLimiter:
                     )
                     return False
 
-                # Increment
-                new_count = await self._redis_client.increment_rate_limit(
-                    redis_key,
-                    ttl=self._window_seconds,
-                )
-                logger.debug(f"Rate limit incremented for {key}: {new_count}/{limit}")
+                logger.debug(f"Rate limit incremented for {key}: {count}/{limit}")
                 return True
             except Exception as e:
                 logger.warning(
@@ -207,8 +209,7 @@ class RateLimiter:
                 else:
                     # Delete all rate limit keys
                     keys = await self._redis_client.keys("rate_limit:*")
-                    for k in keys:
-                        await self._redis_client.delete(k)
+                    await self._redis_client.delete_many(keys)
                 return
             except Exception:
                 pass
@@ -9,8 +9,9 @@ Provides:
 - Task queue backend
 - Rate limiting backend
 - Session state storage
+- Batched / pipelined operations (one round trip per call)
 
-Version: 1.0.0
+Version: 1.1.0
 """
 
 from __future__ import annotations
@@ -18,7 +19,10 @@ from __future__ import annotations
 import json
 import structlog
 import os
-from typing import Any, Optional
+import time
+import uuid
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Iterable, Mapping, Optional, Sequence, Union
 
 logger = structlog.get_logger(__name__)
 
@@ -28,6 +32,57 @@ logger = structlog.get_logger(__name__)
 # This prevents session state cross-contamination when Igor talks to both simultaneously
 DEFAULT_TENANT_ID = os.getenv("L9_TENANT_ID", "l-cto")
 
+# Client-side pool sizing and SCAN batch hint
+DEFAULT_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))
+DEFAULT_SCAN_COUNT = int(os.getenv("REDIS_SCAN_COUNT", "1000"))
+
+# Task payload TTL (seconds)
+TASK_TTL_SECONDS = 3600
+
+# =============================================================================
+# Lua Scripts (server-side, single round trip, atomic)
+# =============================================================================
+
+# KEYS[1] = queue zset, ARGV[1] = task key prefix, ARGV[2] = count
+# Pops up to N lowest-score members and returns their payloads, deleting them.
+DEQUEUE_SCRIPT = """
+local popped = redis.call('ZPOPMIN', KEYS[1], ARGV[2])
+local out = {}
+for i = 1, #popped, 2 do
+    local task_key = ARGV[1] .. popped[i]
+    local data = redis.call('GET', task_key)
+    if data then
+        redis.call('DEL', task_key)
+        table.insert(out, data)
+    end
+end
+return out
+"""
+
+# KEYS[1] = counter, ARGV[1] = ttl
+# INCR and set TTL on first increment.
+INCREMENT_SCRIPT = """
+local count = redis.call('INCR', KEYS[1])
+if count == 1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+return count
+"""
+
+# KEYS[1] = counter, ARGV[1] = limit, ARGV[2] = ttl
+# Returns {allowed (0/1), count}. Only increments when under the limit.
+CHECK_AND_INCREMENT_SCRIPT = """
+local current = tonumber(redis.call('GET', KEYS[1]) or '0')
+if current >= tonumber(ARGV[1]) then
+    return {0, current}
+end
+local count = redis.call('INCR', KEYS[1])
+if count == 1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[2])
+end
+return {1, count}
+"""
+
 # Try to import Redis
 try:
     import redis.asyncio as aioredis
@@ -37,6 +92,13 @@ except ImportError:
     _has_redis = False
     logger.warning("Redis not available - install with: pip install redis>=5.0.0")
 
+try:
+    from telemetry.redis_metrics import record_redis_command
+except ImportError:  # pragma: no cover - telemetry is optional
+
+    def record_redis_command(*args: Any, **kwargs: Any) -> None:  # type: ignore[misc]
+        return None
+
 
 class RedisClient:
     """
@@ -52,6 +114,8 @@ class RedisClient:
         db: int = 0,
         password: Optional[str] = None,
         decode_responses: bool = True,
+        max_connections: Optional[int] = None,
+        scan_count: Optional[int] = None,
     ):
         """
         Initialize Redis client.
@@ -62,7 +126,13 @@ class RedisClient:
             db: Redis database number (default: 0)
             password: Redis password (optional)
             decode_responses: Decode responses as strings (default: True)
+            max_connections: Connection pool size (default: REDIS_MAX_CONNECTIONS env or 50)
+            scan_count: COUNT hint for SCAN (default: REDIS_SCAN_COUNT env or 1000)
         """
+        self._max_connections = max_connections or DEFAULT_MAX_CONNECTIONS
+        self._scan_count = scan_count or DEFAULT_SCAN_COUNT
+        self._scripts: dict[str, Any] = {}
+
         if not _has_redis:
             self._client = None
             self._available = False
@@ -91,7 +161,7 @@ class RedisClient:
             return self._available
 
         try:
-            self._client = aioredis.Redis(
+            pool = aioredis.ConnectionPool(
                 host=self._host,
                 port=self._port,
                 db=self._db,
@@ -100,12 +170,17 @@ class RedisClient:
                 socket_connect_timeout=2,
                 socket_timeout=2,
                 retry_on_timeout=True,
+                max_connections=self._max_connections,
             )
+            self._client = aioredis.Redis(connection_pool=pool)
 
             # Test connection
             await self._client.ping()
             self._available = True
-            logger.info(f"Redis connected: {self._host}:{self._port}/{self._db}")
+            logger.info(
+                f"Redis connected: {self._host}:{self._port}/{self._db} "
+                f"(pool max_connections={self._max_connections})"
+            )
             return True
         except Exception as e:
             logger.warning(f"Redis connection failed: {e} - falling back to in-memory")
@@ -124,6 +199,7 @@ class RedisClient:
             finally:
                 self._client = None
                 self._available = False
+                self._scripts.clear()
 
     def is_available(self) -> bool:
         """Check if Redis is available."""
@@ -146,6 +222,34 @@ class RedisClient:
             return key
         return f"{tid}:{key}"
 
+    @asynccontextmanager
+    async def _timed(
+        self, command: str, batch_size: Optional[int] = None
+    ) -> AsyncIterator[None]:
+        """Record latency/status for one logical operation (one round trip)."""
+        start = time.perf_counter()
+        status = "ok"
+        try:
+            yield
+        except Exception:
+            status = "error"
+            raise
+        finally:
+            record_redis_command(
+                command,
+                status=status,
+                duration_seconds=time.perf_counter() - start,
+                batch_size=batch_size,
+            )
+
+    def _script(self, name: str, source: str) -> Any:
+        """Return a registered Lua script (EVALSHA with automatic EVAL fallback)."""
+        script = self._scripts.get(name)
+        if script is None:
+            script = self._client.register_script(source)
+            self._scripts[name] = script
+        return script
+
     # =========================================================================
     # Task Queue Operations
     # =========================================================================
@@ -171,26 +275,18 @@ class RedisClient:
             return None
 
         try:
-            import uuid
-
             task_id = str(uuid.uuid4())
             task_data["task_id"] = task_id
             task_data["priority"] = priority
 
-            # Store task data (with tenant prefix)
+            # Store task data and add to priority queue in one transaction
             prefixed_queue = self._prefixed_key(queue_name)
             task_key = f"{prefixed_queue}:task:{task_id}"
-            await self._client.setex(
-                task_key,
-                3600,  # 1 hour TTL
-                json.dumps(task_data),
-            )
-
-            # Add to priority queue (sorted set)
-            await self._client.zadd(
-                f"{prefixed_queue}:queue",
-                {task_id: priority},
-            )
+            async with self._timed("enqueue_task"):
+                pipe = self._client.pipeline(transaction=True)
+                pipe.setex(task_key, TASK_TTL_SECONDS, json.dumps(task_data))
+                pipe.zadd(f"{prefixed_queue}:queue", {task_id: priority})
+                await pipe.execute()
 
             logger.debug(
                 f"Enqueued task {task_id} to {prefixed_queue} with priority {priority}"
@@ -214,31 +310,109 @@ class RedisClient:
             return None
 
         try:
-            # Get highest priority task (lowest score) - with tenant prefix
+            # Pop highest priority task (lowest score), read and delete its
+            # payload atomically in one round trip
             prefixed_queue = self._prefixed_key(queue_name)
-            result = await self._client.zpopmin(f"{prefixed_queue}:queue", count=1)
+            async with self._timed("dequeue_task"):
+                payloads = await self._script("dequeue", DEQUEUE_SCRIPT)(
+                    keys=[f"{prefixed_queue}:queue"],
+                    args=[f"{prefixed_queue}:task:", 1],
+                )
 
-            if not result:
+            if not payloads:
                 return None
 
-            task_id, _ = result[0]
-            task_key = f"{prefixed_queue}:task:{task_id}"
-
-            # Get task data
-            task_data_str = await self._client.get(task_key)
-            if not task_data_str:
-                return None
-
-            # Delete task data
-            await self._client.delete(task_key)
-
-            task_data = json.loads(task_data_str)
-            logger.debug(f"Dequeued task {task_id} from {queue_name}")
+            task_data = json.loads(payloads[0])
+            logger.debug(f"Dequeued task {task_data.get('task_id')} from {queue_name}")
             return task_data
         except Exception as e:
             logger.error(f"Redis dequeue failed: {e}")
             return None
 
+    async def enqueue_many(
+        self,
+        queue_name: str,
+        tasks: Sequence[Union[dict[str, Any], tuple[dict[str, Any], int]]],
+        priority: int = 5,
+    ) -> list[str]:
+        """
+        Enqueue many tasks in a single MULTI/EXEC round trip.
+
+        Args:
+            queue_name: Queue name (e.g., "l9:tasks")
+            tasks: Task dicts, or (task_data, priority) tuples
+            priority: Default priority for bare task dicts
+
+        Returns:
+            Task IDs in input order, or [] if Redis unavailable / on failure
+        """
+        if not self.is_available() or not tasks:
+            return []
+
+        try:
+            prefixed_queue = self._prefixed_key(queue_name)
+            pipe = self._client.pipeline(transaction=True)
+            members: dict[str, int] = {}
+            task_ids: list[str] = []
+
+            for item in tasks:
+                if isinstance(item, tuple):
+                    task_data, task_priority = item
+                else:
+                    task_data, task_priority = item, priority
+                task_id = str(uuid.uuid4())
+                task_data["task_id"] = task_id
+                task_data["priority"] = task_priority
+                pipe.setex(
+                    f"{prefixed_queue}:task:{task_id}",
+                    TASK_TTL_SECONDS,
+                    json.dumps(task_data),
+                )
+                members[task_id] = task_priority
+                task_ids.append(task_id)
+
+            pipe.zadd(f"{prefixed_queue}:queue", members)
+
+            async with self._timed("enqueue_many", batch_size=len(task_ids)):
+                await pipe.execute()
+
+            logger.debug(f"Enqueued {len(task_ids)} tasks to {prefixed_queue}")
+            return task_ids
+        except Exception as e:
+            logger.error(f"Redis enqueue_many failed: {e}")
+            return []
+
+    async def dequeue_many(
+        self, queue_name: str, count: int
+    ) -> list[dict[str, Any]]:
+        """
+        Dequeue up to ``count`` highest priority tasks in one round trip.
+
+        Args:
+            queue_name: Queue name
+            count: Maximum number of tasks to pop
+
+        Returns:
+            Task data dicts in priority order (may be shorter than count)
+        """
+        if not self.is_available() or count <= 0:
+            return []
+
+        try:
+            prefixed_queue = self._prefixed_key(queue_name)
+            async with self._timed("dequeue_many", batch_size=count):
+                payloads = await self._script("dequeue", DEQUEUE_SCRIPT)(
+                    keys=[f"{prefixed_queue}:queue"],
+                    args=[f"{prefixed_queue}:task:", count],
+                )
+
+            tasks = [json.loads(p) for p in payloads or []]
+            logger.debug(f"Dequeued {len(tasks)} tasks from {queue_name}")
+            return tasks
+        except Exception as e:
+            logger.error(f"Redis dequeue_many failed: {e}")
+            return []
+
     async def queue_size(self, queue_name: str) -> int:
         """Get queue size."""
         if not self.is_available():
@@ -315,14 +489,46 @@ class RedisClient:
 
         try:
             prefixed = self._prefixed_key(key)
-            count = await self._client.incr(prefixed)
-            if count == 1:  # First increment, set TTL
-                await self._client.expire(prefixed, ttl)
-            return count
+            # INCR + EXPIRE-on-first-increment in one round trip
+            async with self._timed("increment_rate_limit"):
+                count = await self._script("increment", INCREMENT_SCRIPT)(
+                    keys=[prefixed], args=[ttl]
+                )
+            return int(count)
         except Exception as e:
             logger.error(f"Redis increment_rate_limit failed: {e}")
             return 0
 
+    async def check_and_increment_rate_limit(
+        self, key: str, limit: int, ttl: int = 60
+    ) -> tuple[bool, int]:
+        """
+        Atomically check a rate limit counter and increment it if under limit.
+
+        Replaces the GET + INCR (+ EXPIRE) sequence with one round trip.
+
+        Args:
+            key: Rate limit key
+            limit: Maximum count per window
+            ttl: Window length in seconds (default: 60)
+
+        Returns:
+            (allowed, count) - count is the post-increment value when allowed,
+            otherwise the current value
+
+        Raises:
+            RuntimeError: If Redis is unavailable (callers fall back to in-memory)
+        """
+        if not self.is_available():
+            raise RuntimeError("Redis unavailable")
+
+        prefixed = self._prefixed_key(key)
+        async with self._timed("check_and_increment_rate_limit"):
+            allowed, count = await self._script(
+                "check_and_increment", CHECK_AND_INCREMENT_SCRIPT
+            )(keys=[prefixed], args=[limit, ttl])
+        return bool(int(allowed)), int(count)
+
     async def get_task_context(self, task_id: str) -> dict:
         """
         Retrieve cached task state from Redis.
@@ -371,6 +577,33 @@ class RedisClient:
             logger.error(f"Redis set_task_context failed: {e}")
             return False
 
+    async def mget_task_context(
+        self, task_ids: Sequence[str]
+    ) -> dict[str, dict]:
+        """
+        Retrieve cached task state for many tasks with a single MGET.
+
+        Args:
+            task_ids: Task identifiers
+
+        Returns:
+            Mapping task_id -> context dict (missing tasks map to {})
+        """
+        if not self.is_available() or not task_ids:
+            return {}
+
+        try:
+            keys = [self._prefixed_key(f"task_context:{tid}") for tid in task_ids]
+            async with self._timed("mget_task_context", batch_size=len(keys)):
+                values = await self._client.mget(keys)
+            return {
+                tid: (json.loads(value) if value else {})
+                for tid, value in zip(task_ids, values)
+            }
+        except Exception as e:
+            logger.error(f"Redis mget_task_context failed: {e}")
+            return {}
+
     async def decrement_rate_limit(self, key: str) -> int:
         """Decrement rate limit counter."""
         if not self.is_available():
@@ -405,6 +638,30 @@ class RedisClient:
             logger.error(f"Redis get failed: {e}")
             return None
 
+    async def mget(
+        self, keys: Sequence[str], raw: bool = False
+    ) -> list[Optional[str]]:
+        """
+        Get many values with a single MGET.
+
+        Args:
+            keys: Keys to get
+            raw: If True, use keys as-is (no tenant prefix)
+
+        Returns:
+            Values in key order (None for missing keys)
+        """
+        if not self.is_available() or not keys:
+            return [None] * len(keys)
+
+        try:
+            prefixed = [k if raw else self._prefixed_key(k) for k in keys]
+            async with self._timed("mget", batch_size=len(prefixed)):
+                return list(await self._client.mget(prefixed))
+        except Exception as e:
+            logger.error(f"Redis mget failed: {e}")
+            return [None] * len(keys)
+
     async def set(
         self, key: str, value: str, ttl: Optional[int] = None, raw: bool = False
     ) -> bool:
@@ -431,6 +688,78 @@ class RedisClient:
             logger.error(f"Redis set failed: {e}")
             return False
 
+    async def set_many(
+        self,
+        mapping: Mapping[str, str],
+        ttl: Optional[int] = None,
+        raw: bool = False,
+    ) -> bool:
+        """
+        Set many key-values in one pipelined round trip.
+
+        Args:
+            mapping: Key -> value
+            ttl: Optional TTL in seconds applied to every key
+            raw: If True, use keys as-is (no tenant prefix)
+        """
+        if not self.is_available():
+            return False
+        if not mapping:
+            return True
+
+        try:
+            prefixed = {
+                (k if raw else self._prefixed_key(k)): v for k, v in mapping.items()
+            }
+            async with self._timed("set_many", batch_size=len(prefixed)):
+                if ttl:
+                    pipe = self._client.pipeline(transaction=False)
+                    for k, v in prefixed.items():
+                        pipe.setex(k, ttl, v)
+                    await pipe.execute()
+                else:
+                    await self._client.mset(prefixed)
+            return True
+        except Exception as e:
+            logger.error(f"Redis set_many failed: {e}")
+            return False
+
+    async def set_nx_many(
+        self,
+        keys: Sequence[str],
+        ttl: int,
+        value: str = "1",
+        raw: bool = False,
+    ) -> Optional[list[bool]]:
+        """
+        SET key value NX EX ttl for each key in one pipelined round trip.
+
+        Args:
+            keys: Keys to claim
+            ttl: TTL in seconds
+            value: Value stored under newly claimed keys
+            raw: If True, use keys as-is (no tenant prefix)
+
+        Returns:
+            Per key, True if it was newly set and False if it already
+            existed; None if Redis is unavailable or the call failed
+        """
+        if not self.is_available():
+            return None
+        if not keys:
+            return []
+
+        try:
+            pipe = self._client.pipeline(transaction=False)
+            for k in keys:
+                pipe.set(k if raw else self._prefixed_key(k), value, nx=True, ex=ttl)
+            async with self._timed("set_nx_many", batch_size=len(keys)):
+                results = await pipe.execute()
+            return [bool(r) for r in results]
+        except Exception as e:
+            logger.error(f"Redis set_nx_many failed: {e}")
+            return None
+
     async def delete(self, key: str, raw: bool = False) -> bool:
         """
         Delete key.
@@ -450,6 +779,31 @@ class RedisClient:
             logger.error(f"Redis delete failed: {e}")
             return False
 
+    async def delete_many(self, keys: Iterable[str], raw: bool = False) -> int:
+        """
+        Delete many keys with a single DEL.
+
+        Args:
+            keys: Keys to delete
+            raw: If True, use keys as-is (no tenant prefix)
+
+        Returns:
+            Number of keys removed
+        """
+        if not self.is_available():
+            return 0
+
+        prefixed = [k if raw else self._prefixed_key(k) for k in keys]
+        if not prefixed:
+            return 0
+
+        try:
+            async with self._timed("delete_many", batch_size=len(prefixed)):
+                return int(await self._client.delete(*prefixed))
+        except Exception as e:
+            logger.error(f"Redis delete_many failed: {e}")
+            return 0
+
     async def keys(self, pattern: str, raw: bool = False) -> list[str]:
         """
         Get keys matching pattern.
@@ -463,7 +817,13 @@ class RedisClient:
 
         try:
             prefixed = pattern if raw else self._prefixed_key(pattern)
-            return [key async for key in self._client.scan_iter(match=prefixed)]
+            async with self._timed("keys"):
+                return [
+                    key
+                    async for key in self._client.scan_iter(
+                        match=prefixed, count=self._scan_count
+                    )
+                ]
         except Exception as e:
             logger.error(f"Redis keys failed: {e}")
             return []
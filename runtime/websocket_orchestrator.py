@@ -10,21 +10,102 @@ Responsibilities:
 - Route incoming messages to the ws_bridge for task conversion
 - Dispatch outbound events to specific agents
 
-The module-level singleton `ws_orchestrator` is the canonical instance.
+Outbound frames are encoded once and queued per connection; a writer task
+per connection does the actual send, so one slow client never stalls a
+broadcast. When a connection's queue is full the slow-consumer policy
+applies:
+- drop: discard the new frame
+- coalesce: discard the oldest queued frame (frames queued with the same
+  coalesce_key are always replaced in place)
+- disconnect: close the connection (code 1013); the agent reconnects
 
-Version: 1.0.0
+A send that exceeds send_timeout disconnects the client under any policy.
+
+The module-level singleton `ws_orchestrator` is the canonical instance
+(L9_WS_SEND_QUEUE, L9_WS_SLOW_CONSUMER_POLICY, L9_WS_SEND_TIMEOUT).
+
+Version: 1.1.0
 """
 
 from __future__ import annotations
 
-import structlog
+import asyncio
+import json
+import os
+import time
+from collections import deque
 from datetime import datetime
-from typing import Any, Dict, Optional
+from enum import Enum
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
 
+import structlog
 from fastapi import WebSocket
 
 logger = structlog.get_logger(__name__)
 
+# Close code for slow consumers: "Try Again Later"
+SLOW_CONSUMER_CLOSE_CODE = 1013
+
+
+class SlowConsumerPolicy(str, Enum):
+    """What to do when a connection's send queue is full."""
+
+    DROP = "drop"
+    COALESCE = "coalesce"
+    DISCONNECT = "disconnect"
+
+
+def encode_frame(event: Any) -> str:
+    """
+    Encode an outbound event once (reused for every recipient).
+
+    Accepts a pydantic model (EventMessage), a mapping, or an already
+    encoded JSON string.
+    """
+    if isinstance(event, str):
+        return event
+    if hasattr(event, "model_dump_json"):
+        return event.model_dump_json()
+    return json.dumps(dict(event), separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def _event_type(event: Any) -> Any:
+    if isinstance(event, str):
+        return None
+    if hasattr(event, "model_dump_json"):
+        return getattr(event, "type", None)
+    return dict(event).get("type")
+
+
+class _Connection:
+    """One agent socket: bounded send queue plus its writer task."""
+
+    __slots__ = (
+        "agent_id",
+        "websocket",
+        "queue",
+        "wakeup",
+        "idle",
+        "writer",
+        "closing",
+        "sent",
+        "dropped",
+        "coalesced",
+    )
+
+    def __init__(self, agent_id: str, websocket: WebSocket) -> None:
+        self.agent_id = agent_id
+        self.websocket = websocket
+        self.queue: Deque[Tuple[Optional[str], str]] = deque()
+        self.wakeup = asyncio.Event()
+        self.idle = asyncio.Event()
+        self.idle.set()
+        self.writer: Optional[asyncio.Task] = None
+        self.closing = False
+        self.sent = 0
+        self.dropped = 0
+        self.coalesced = 0
+
 
 class WebSocketOrchestrator:
     """
@@ -33,10 +114,35 @@ class WebSocketOrchestrator:
     Thread-safe singleton - use `ws_orchestrator` module-level instance.
     """
 
-    def __init__(self) -> None:
-        self._connections: Dict[str, WebSocket] = {}
+    def __init__(
+        self,
+        max_queue: int = 256,
+        slow_consumer_policy: SlowConsumerPolicy = SlowConsumerPolicy.DISCONNECT,
+        send_timeout: float = 10.0,
+    ) -> None:
+        """
+        Args:
+            max_queue: Frames buffered per connection before the policy applies
+            slow_consumer_policy: drop, coalesce or disconnect
+            send_timeout: Seconds a single send may take before disconnecting
+        """
+        self._connections: Dict[str, _Connection] = {}
         self._metadata: Dict[str, Dict[str, Any]] = {}
         self._connected_at: Dict[str, datetime] = {}
+        self.max_queue = max_queue
+        self.slow_consumer_policy = SlowConsumerPolicy(slow_consumer_policy)
+        self.send_timeout = send_timeout
+
+        # Fan-out metrics
+        self._broadcasts = 0
+        self._frames_enqueued = 0
+        self._frames_sent = 0
+        self._frames_dropped = 0
+        self._frames_coalesced = 0
+        self._slow_disconnects = 0
+        self._send_errors = 0
+        self._fanout_us: Deque[float] = deque(maxlen=1024)
+        self._send_ms: Deque[float] = deque(maxlen=1024)
         logger.info("WebSocketOrchestrator initialized")
 
     # =========================================================================
@@ -57,7 +163,13 @@ class WebSocketOrchestrator:
             websocket: Active WebSocket connection
             metadata: Optional handshake metadata (capabilities, version, etc.)
         """
-        self._connections[agent_id] = websocket
+        previous = self._connections.pop(agent_id, None)
+        if previous is not None:
+            await self._stop_writer(previous)
+
+        conn = _Connection(agent_id, websocket)
+        conn.writer = asyncio.create_task(self._writer(conn), name=f"ws-writer:{agent_id}")
+        self._connections[agent_id] = conn
         self._metadata[agent_id] = metadata or {}
         self._connected_at[agent_id] = datetime.utcnow()
         logger.info(
@@ -73,9 +185,11 @@ class WebSocketOrchestrator:
         Args:
             agent_id: Agent to unregister
         """
-        self._connections.pop(agent_id, None)
+        conn = self._connections.pop(agent_id, None)
         self._metadata.pop(agent_id, None)
         self._connected_at.pop(agent_id, None)
+        if conn is not None:
+            await self._stop_writer(conn)
         logger.info("Agent %s unregistered", agent_id)
 
     def is_connected(self, agent_id: str) -> bool:
@@ -181,62 +295,227 @@ class WebSocketOrchestrator:
     # Outbound Dispatch
     # =========================================================================
 
-    async def dispatch_event(self, agent_id: str, event: Any) -> None:
+    async def dispatch_event(
+        self, agent_id: str, event: Any, coalesce_key: Optional[str] = None
+    ) -> bool:
         """
-        Send an event to a specific agent.
+        Queue an event for a specific agent.
 
         Args:
             agent_id: Target agent
-            event: EventMessage or dict to send
+            event: EventMessage, dict or pre-encoded JSON string
+            coalesce_key: Replace a still-queued frame with the same key
+
+        Returns:
+            False if the slow-consumer policy discarded the frame
 
         Raises:
             RuntimeError: If agent is not connected
         """
-        ws = self._connections.get(agent_id)
-        if ws is None:
+        conn = self._connections.get(agent_id)
+        if conn is None:
             raise RuntimeError(f"Agent {agent_id} is not connected")
 
-        # Serialize event
-        if hasattr(event, "model_dump"):
-            payload = event.model_dump(mode="json")
-        else:
-            payload = dict(event)
-
-        await ws.send_json(payload)
+        queued = self._enqueue(conn, encode_frame(event), coalesce_key)
         logger.debug(
-            "Dispatched event to agent %s: type=%s", agent_id, payload.get("type")
+            "Dispatched event to agent %s: type=%s", agent_id, _event_type(event)
         )
+        return queued
 
-    async def broadcast(self, event: Any, exclude: Optional[list[str]] = None) -> int:
+    async def broadcast(
+        self,
+        event: Any,
+        exclude: Optional[Iterable[str]] = None,
+        coalesce_key: Optional[str] = None,
+    ) -> int:
         """
         Broadcast an event to all connected agents.
 
+        The event is encoded once and queued on every connection; this
+        returns without waiting for any client.
+
         Args:
-            event: EventMessage or dict to send
-            exclude: Optional list of agent IDs to skip
+            event: EventMessage, dict or pre-encoded JSON string
+            exclude: Optional agent IDs to skip
+            coalesce_key: Replace still-queued frames with the same key
 
         Returns:
-            Number of agents the event was sent to
+            Number of agents the event was queued for
         """
-        exclude = exclude or []
+        start = time.perf_counter()
+        exclude = set(exclude or ())
+        frame = encode_frame(event)
         count = 0
 
-        for agent_id in list(self._connections.keys()):
+        for agent_id, conn in list(self._connections.items()):
             if agent_id in exclude:
                 continue
-            try:
-                await self.dispatch_event(agent_id, event)
+            if self._enqueue(conn, frame, coalesce_key):
                 count += 1
-            except Exception as e:
-                logger.warning("Failed to broadcast to %s: %s", agent_id, e)
 
+        self._broadcasts += 1
+        self._fanout_us.append((time.perf_counter() - start) * 1e6)
         return count
 
+    async def flush(self, timeout: Optional[float] = None) -> None:
+        """Wait until every connection's queue has been written out."""
+        waits = [conn.idle.wait() for conn in self._connections.values()]
+        if waits:
+            await asyncio.wait_for(asyncio.gather(*waits), timeout)
+
+    async def close(self) -> None:
+        """Stop all writer tasks (server shutdown)."""
+        for agent_id in list(self._connections):
+            await self.unregister(agent_id)
+
+    def get_fanout_metrics(self) -> Dict[str, Any]:
+        """Broadcast/send counters, latency percentiles and queue depths."""
+        depths = {a: len(c.queue) for a, c in self._connections.items()}
+        return {
+            "connections": len(self._connections),
+            "policy": self.slow_consumer_policy.value,
+            "max_queue": self.max_queue,
+            "broadcasts": self._broadcasts,
+            "frames_enqueued": self._frames_enqueued,
+            "frames_sent": self._frames_sent,
+            "frames_dropped": self._frames_dropped,
+            "frames_coalesced": self._frames_coalesced,
+            "slow_consumer_disconnects": self._slow_disconnects,
+            "send_errors": self._send_errors,
+            "broadcast_us": _percentiles(self._fanout_us),
+            "send_ms": _percentiles(self._send_ms),
+            "queue_depth_max": max(depths.values(), default=0),
+            "queue_depth_total": sum(depths.values()),
+            "per_agent": {
+                a: {"queued": len(c.queue), "sent": c.sent, "dropped": c.dropped, "coalesced": c.coalesced}
+                for a, c in self._connections.items()
+            },
+        }
+
+    # =========================================================================
+    # Send Queues
+    # =========================================================================
+
+    def _enqueue(self, conn: _Connection, frame: str, coalesce_key: Optional[str]) -> bool:
+        if conn.closing:
+            return False
+
+        if coalesce_key is not None:
+            for i, (key, _) in enumerate(conn.queue):
+                if key == coalesce_key:
+                    conn.queue[i] = (coalesce_key, frame)
+                    conn.coalesced += 1
+                    self._frames_coalesced += 1
+                    return True
+
+        if len(conn.queue) >= self.max_queue:
+            if self.slow_consumer_policy == SlowConsumerPolicy.DROP:
+                conn.dropped += 1
+                self._frames_dropped += 1
+                return False
+            if self.slow_consumer_policy == SlowConsumerPolicy.COALESCE:
+                conn.queue.popleft()
+                conn.dropped += 1
+                self._frames_dropped += 1
+            else:
+                self._disconnect_slow(conn, f"send queue full ({self.max_queue} frames)")
+                return False
+
+        conn.queue.append((coalesce_key, frame))
+        conn.idle.clear()
+        conn.wakeup.set()
+        self._frames_enqueued += 1
+        return True
+
+    async def _writer(self, conn: _Connection) -> None:
+        """Drain one connection's queue; the only task that sends on its socket."""
+        ws = conn.websocket
+        try:
+            while True:
+                if not conn.queue:
+                    conn.idle.set()
+                    conn.wakeup.clear()
+                    await conn.wakeup.wait()
+                    continue
+                _, frame = conn.queue.popleft()
+                start = time.perf_counter()
+                try:
+                    async with asyncio.timeout(self.send_timeout):
+                        await ws.send_text(frame)
+                except asyncio.TimeoutError:
+                    self._disconnect_slow(conn, f"send exceeded {self.send_timeout}s")
+                    return
+                self._send_ms.append((time.perf_counter() - start) * 1000)
+                conn.sent += 1
+                self._frames_sent += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._send_errors += 1
+            logger.warning("Send to agent %s failed: %s", conn.agent_id, e)
+            conn.closing = True
+            conn.queue.clear()
+            conn.idle.set()
+            if self._connections.get(conn.agent_id) is conn:
+                asyncio.create_task(self.unregister(conn.agent_id))
+
+    def _disconnect_slow(self, conn: _Connection, reason: str) -> None:
+        if conn.closing:
+            return
+        conn.closing = True
+        self._slow_disconnects += 1
+        self._frames_dropped += len(conn.queue)
+        conn.dropped += len(conn.queue)
+        conn.queue.clear()
+        conn.idle.set()
+        logger.warning("Disconnecting slow consumer %s: %s", conn.agent_id, reason)
+        asyncio.create_task(self._close_slow(conn))
+
+    async def _close_slow(self, conn: _Connection) -> None:
+        try:
+            async with asyncio.timeout(self.send_timeout):
+                await conn.websocket.close(code=SLOW_CONSUMER_CLOSE_CODE)
+        except Exception as e:
+            logger.debug("Close of slow consumer %s failed: %s", conn.agent_id, e)
+        if self._connections.get(conn.agent_id) is conn:
+            await self.unregister(conn.agent_id)
+
+    async def _stop_writer(self, conn: _Connection) -> None:
+        conn.closing = True
+        conn.idle.set()
+        writer = conn.writer
+        if writer is not None and writer is not asyncio.current_task() and not writer.done():
+            writer.cancel()
+            try:
+                await writer
+            except asyncio.CancelledError:
+                pass
+
+
+def _percentiles(samples: Deque[float]) -> Dict[str, float]:
+    if not samples:
+        return {"p50": 0.0, "p99": 0.0, "max": 0.0}
+    ordered = sorted(samples)
+    return {
+        "p50": round(ordered[len(ordered) // 2], 3),
+        "p99": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))], 3),
+        "max": round(ordered[-1], 3),
+    }
+
 
 # =============================================================================
 # Module-level Singleton
 # =============================================================================
 
-ws_orchestrator = WebSocketOrchestrator()
-
-__all__ = ["WebSocketOrchestrator", "ws_orchestrator"]
+ws_orchestrator = WebSocketOrchestrator(
+    max_queue=int(os.getenv("L9_WS_SEND_QUEUE", "256")),
+    slow_consumer_policy=SlowConsumerPolicy(os.getenv("L9_WS_SLOW_CONSUMER_POLICY", "disconnect")),
+    send_timeout=float(os.getenv("L9_WS_SEND_TIMEOUT", "10")),
+)
+
+__all__ = [
+    "WebSocketOrchestrator",
+    "SlowConsumerPolicy",
+    "encode_frame",
+    "ws_orchestrator",
+]
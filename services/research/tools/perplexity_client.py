@@ -20,6 +20,8 @@ from typing import Any, Optional
 
 import httpx
 
+from runtime.http_clients import get_http_client
+
 log = structlog.get_logger(__name__)
 
 
@@ -141,19 +143,13 @@ class PerplexityClient:
     def __init__(self, api_key: str):
         """Initialize client with API key."""
         self.api_key = api_key
-        self._client: Optional[httpx.AsyncClient] = None
 
     async def __aenter__(self):
         """Async context manager entry."""
-        self._client = httpx.AsyncClient(
-            timeout=httpx.Timeout(300.0, connect=10.0)  # 5 min for deep research
-        )
         return self
 
     async def __aexit__(self, *args):
-        """Async context manager exit."""
-        if self._client:
-            await self._client.aclose()
+        """Async context manager exit (the shared HTTP client stays open)."""
 
     async def search(self, request: PerplexityRequest) -> PerplexityResponse:
         """
@@ -183,10 +179,9 @@ class PerplexityClient:
         )
 
         try:
-            if not self._client:
-                self._client = httpx.AsyncClient(timeout=300.0)
-
-            response = await self._client.post(
+            # Shared "research" pool: 5 min read timeout for deep research
+            client = get_http_client("research")
+            response = await client.post(
                 f"{self.BASE_URL}/chat/completions",
                 headers={
                     "Authorization": f"Bearer {self.api_key}",
@@ -10,8 +10,7 @@ import structlog
 from abc import ABC, abstractmethod
 from typing import Any, Optional
 
-import httpx
-
+from runtime.http_clients import get_http_client
 from services.research.tools.perplexity_client import (
     PerplexityClient,
     get_perplexity_client,
@@ -159,25 +158,25 @@ class HTTPTool(BaseTool):
             return {"status": 400, "body": "No URL provided"}
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.request(
-                    method=method,
-                    url=url,
-                    headers=headers,
-                    json=body if body else None,
-                    timeout=30.0,
-                )
-
-                # Try to parse JSON
-                try:
-                    body_data = response.json()
-                except Exception:
-                    body_data = response.text
-
-                return {
-                    "status": response.status_code,
-                    "body": body_data,
-                }
+            client = get_http_client("research")
+            response = await client.request(
+                method=method,
+                url=url,
+                headers=headers,
+                json=body if body else None,
+                timeout=30.0,
+            )
+
+            # Try to parse JSON
+            try:
+                body_data = response.json()
+            except Exception:
+                body_data = response.text
+
+            return {
+                "status": response.status_code,
+                "body": body_data,
+            }
 
         except Exception as e:
             log.error("http_request_failed", error=str(e))
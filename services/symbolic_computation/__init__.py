@@ -7,10 +7,12 @@ mathematical computation capabilities.
 
 Author: AIOS
 Version: 1.0.0
+
+Note: SymbolicComputation (engine.py) logs through python-json-logger.
+It is imported lazily so the core package works without that dependency.
 """
 
 from .core import (
-    SymbolicComputation,
     ExpressionEvaluator,
     CodeGenerator,
 )
@@ -26,6 +28,17 @@ from .exceptions import (
     CodeGenerationError,
 )
 
+
+# Lazy import for the engine (python-json-logger)
+def __getattr__(name: str):
+    """Lazy import for SymbolicComputation."""
+    if name == "SymbolicComputation":
+        from .engine import SymbolicComputation
+
+        return SymbolicComputation
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __version__ = "1.0.0"
 __all__ = [
     "SymbolicComputation",
@@ -20,6 +20,8 @@ from pydantic import BaseModel, Field
 from services.symbolic_computation.config import SymbolicComputationConfig, get_config
 from services.symbolic_computation.core.models import (
     BackendType,
+    BatchComputationRequest,
+    BatchComputationResult,
     CodeGenRequest,
     CodeGenResult,
     CodeLanguage,
@@ -29,7 +31,10 @@ from services.symbolic_computation.core.models import (
     MetricsSummary,
     ValidationResult,
 )
-from services.symbolic_computation.core.expression_evaluator import ExpressionEvaluator
+from services.symbolic_computation.core.expression_evaluator import (
+    ExpressionEvaluator,
+    results_to_rows,
+)
 from services.symbolic_computation.core.code_generator import CodeGenerator
 from services.symbolic_computation.core.optimizer import Optimizer
 from services.symbolic_computation.core.validator import ExpressionValidator
@@ -181,6 +186,52 @@ async def evaluate_expression(
     return result
 
 
+@router.post("/evaluate_batch", response_model=BatchComputationResult)
+async def evaluate_batch(
+    request: BatchComputationRequest,
+    evaluator: ExpressionEvaluator = Depends(get_evaluator),
+    validator: ExpressionValidator = Depends(get_validator),
+) -> BatchComputationResult:
+    """
+    Evaluate a SymPy expression over columns of variable values.
+    
+    Each column holds one variable's values, one per row (all the same
+    length). The expression is compiled once and evaluated over the whole
+    batch; results has one value per row, or one [real, imag] pair per row
+    when the results are complex.
+    """
+    logger.info(
+        "evaluate_batch_request",
+        expr_len=len(request.expression),
+        backend=request.backend,
+        num_vars=len(request.columns),
+    )
+    
+    # Validate expression first
+    validation = validator.validate(request.expression)
+    if not validation.is_valid:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid expression: {'; '.join(validation.errors)}"
+        )
+    
+    # Evaluate
+    result = await evaluator.evaluate_batch(
+        expr=request.expression,
+        columns=request.columns,
+        backend=request.backend.value,
+        chunk_size=request.chunk_size,
+    )
+    
+    if result.error:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Batch evaluation failed: {result.error}"
+        )
+    
+    return result.model_copy(update={"results": results_to_rows(result.results)})
+
+
 @router.post("/generate_code", response_model=CodeGenResult)
 async def generate_code(
     request: CodeGenRequest,
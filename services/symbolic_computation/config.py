@@ -5,7 +5,7 @@ Loads configuration from environment variables and provides defaults.
 """
 
 import os
-from typing import Optional
+from typing import List, Optional
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from dotenv import load_dotenv
@@ -35,6 +35,16 @@ class SymbolicComputationConfig(BaseSettings):
         env="SYMBOLIC_CACHE_SIZE",
         description="Maximum cache size"
     )
+    redis_keyspace: str = Field(
+        default="symbolic",
+        env="SYMBOLIC_REDIS_KEYSPACE",
+        description="Redis key prefix for cached results"
+    )
+    redis_cache_ttl: int = Field(
+        default=3600,
+        env="SYMBOLIC_REDIS_CACHE_TTL",
+        description="Redis result cache TTL in seconds"
+    )
 
     # Performance settings
     default_backend: str = Field(
@@ -47,6 +57,11 @@ class SymbolicComputationConfig(BaseSettings):
         env="SYMBOLIC_ENABLE_METRICS",
         description="Enable performance metrics"
     )
+    batch_chunk_size: int = Field(
+        default=262144,
+        env="SYMBOLIC_BATCH_CHUNK_SIZE",
+        description="Rows evaluated per chunk in batch evaluation"
+    )
 
     # Code generation settings
     codegen_temp_dir: str = Field(
@@ -59,6 +74,21 @@ class SymbolicComputationConfig(BaseSettings):
         env="SYMBOLIC_DEFAULT_LANGUAGE",
         description="Default code generation language"
     )
+    artifact_cache_dir: str = Field(
+        default=os.path.join(os.path.expanduser("~"), ".cache", "sympy_codegen", "artifacts"),
+        env="SYMBOLIC_ARTIFACT_CACHE_DIR",
+        description="On-disk cache of compiled artifacts (private, kept across restarts)"
+    )
+    compile_workers: int = Field(
+        default=2,
+        env="SYMBOLIC_COMPILE_WORKERS",
+        description="Processes in the compilation pool"
+    )
+    compile_timeout: float = Field(
+        default=120.0,
+        env="SYMBOLIC_COMPILE_TIMEOUT",
+        description="Compiler timeout in seconds"
+    )
 
     # Logging settings
     log_level: str = Field(
@@ -83,7 +113,19 @@ class SymbolicComputationConfig(BaseSettings):
         env="SYMBOLIC_ALLOW_DANGEROUS_FUNCTIONS",
         description="Allow potentially dangerous functions"
     )
+    dangerous_functions: List[str] = Field(
+        default=["sympify", "parse_expr", "lambdify"],
+        env="SYMBOLIC_DANGEROUS_FUNCTIONS",
+        description="Functions blocked unless allow_dangerous_functions is set (they eval strings)"
+    )
+
+    def get_redis_key(self, expr_hash: str, backend: str) -> str:
+        """Cache key for an evaluation result."""
+        return f"{self.redis_keyspace}:{expr_hash}:{backend}"
 
+    def get_compiled_key(self, expr_hash: str) -> str:
+        """Cache key for a compiled function."""
+        return f"{self.redis_keyspace}:compiled:{expr_hash}"
 
 
 # Global configuration instance
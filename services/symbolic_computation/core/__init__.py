@@ -11,6 +11,8 @@ Version: 6.0.0
 from services.symbolic_computation.core.models import (
     ComputationRequest,
     ComputationResult,
+    BatchComputationRequest,
+    BatchComputationResult,
     CodeGenRequest,
     CodeGenResult,
     HealthStatus,
@@ -24,10 +26,13 @@ from services.symbolic_computation.core.optimizer import Optimizer
 from services.symbolic_computation.core.validator import ExpressionValidator
 from services.symbolic_computation.core.cache_manager import CacheManager
 from services.symbolic_computation.core.metrics import MetricsCollector
+from services.symbolic_computation.core.compile_pool import ArtifactCache, CompilePool
 
 __all__ = [
     "ComputationRequest",
     "ComputationResult",
+    "BatchComputationRequest",
+    "BatchComputationResult",
     "CodeGenRequest",
     "CodeGenResult",
     "HealthStatus",
@@ -40,5 +45,7 @@ __all__ = [
     "ExpressionValidator",
     "CacheManager",
     "MetricsCollector",
+    "ArtifactCache",
+    "CompilePool",
 ]
 
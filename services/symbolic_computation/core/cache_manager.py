@@ -34,10 +34,13 @@ class CacheManager:
     - Expressions: {keyspace}:{expr_hash}:{backend}
     - Compiled: {keyspace}:compiled:{expr_hash}
     
+    expr_hash covers the variable bindings when they are given, so the
+    same expression evaluated at different values gets separate entries.
+    
     Example:
         cache = CacheManager()
-        await cache.cache_expression("x**2", "numpy", 4.0)
-        result = await cache.get_cached_result("x**2", "numpy")
+        await cache.cache_expression("x**2", "numpy", 4.0, variables={"x": 2})
+        result = await cache.get_cached_result("x**2", "numpy", variables={"x": 2})
         print(result)  # 4.0
     """
     
@@ -76,6 +79,7 @@ class CacheManager:
         expr: str,
         backend: str,
         result: Any,
+        variables: Optional[Dict[str, Any]] = None,
     ) -> bool:
         """
         Cache an expression evaluation result.
@@ -84,11 +88,12 @@ class CacheManager:
             expr: Original expression string
             backend: Backend used for evaluation
             result: Computed result to cache
+            variables: Variable bindings the result was computed with
         
         Returns:
             True if cached successfully
         """
-        expr_hash = self._hash_expression(expr)
+        expr_hash = self._hash_expression(expr, variables)
         cache_key = self.config.get_redis_key(expr_hash, backend)
         
         try:
@@ -118,6 +123,7 @@ class CacheManager:
         self,
         expr: str,
         backend: str,
+        variables: Optional[Dict[str, Any]] = None,
     ) -> Optional[Any]:
         """
         Retrieve cached expression result.
@@ -125,11 +131,12 @@ class CacheManager:
         Args:
             expr: Original expression string
             backend: Backend used for evaluation
+            variables: Variable bindings to look up the result for
         
         Returns:
             Cached result if found, None otherwise
         """
-        expr_hash = self._hash_expression(expr)
+        expr_hash = self._hash_expression(expr, variables)
         cache_key = self.config.get_redis_key(expr_hash, backend)
         
         # L1: Check in-memory cache first
@@ -248,9 +255,20 @@ class CacheManager:
             )
             return None
     
-    def _hash_expression(self, expr: str) -> str:
-        """Generate hash for expression."""
-        return hashlib.sha256(expr.encode()).hexdigest()[:16]
+    def _hash_expression(
+        self,
+        expr: str,
+        variables: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """Generate hash for expression (and variable bindings, if given)."""
+        content = expr
+        if variables:
+            bindings = ",".join(
+                f"{name}={_canonical_value(value)}"
+                for name, value in sorted(variables.items())
+            )
+            content = f"{expr}|{bindings}"
+        return hashlib.sha256(content.encode()).hexdigest()[:16]
     
     def clear(self) -> None:
         """Clear all caches."""
@@ -274,3 +292,10 @@ class CacheManager:
             "max_size": self.config.cache_size,
         }
 
+
+def _canonical_value(value: Any) -> str:
+    """Stable text for a variable value (2, 2.0 and np.float64(2) match)."""
+    try:
+        return repr(float(value))
+    except (TypeError, ValueError):
+        return repr(value)
@@ -3,6 +3,8 @@ SymPy Code Generator
 =====================
 
 Generate compilable code from SymPy expressions in C, Fortran, Cython, or Python.
+compile_generated_async compiles C in the compilation pool (core.compile_pool),
+off the event loop and cached on disk.
 
 Version: 6.0.0
 """
@@ -22,6 +24,7 @@ from sympy import sympify
 from sympy.utilities.codegen import codegen
 
 from services.symbolic_computation.config import SymbolicComputationConfig, get_config
+from services.symbolic_computation.core.compile_pool import CompilePool, get_compile_pool
 from services.symbolic_computation.core.models import CodeGenResult, CodeLanguage
 
 logger = structlog.get_logger(__name__)
@@ -54,6 +57,7 @@ class CodeGenerator:
         self,
         config: Optional[SymbolicComputationConfig] = None,
         metrics_collector: Optional[any] = None,
+        compile_pool: Optional[CompilePool] = None,
     ):
         """
         Initialize the code generator.
@@ -61,13 +65,15 @@ class CodeGenerator:
         Args:
             config: Configuration instance (uses global if not provided)
             metrics_collector: Optional metrics collector for tracking
+            compile_pool: Compilation pool (default: shared process pool)
         """
         self.config = config or get_config()
         self.metrics_collector = metrics_collector
+        self.compile_pool = compile_pool
         self.logger = logger.bind(component="code_generator")
         
         # Ensure temp directory exists
-        self.config.codegen_temp_dir.mkdir(parents=True, exist_ok=True)
+        Path(self.config.codegen_temp_dir).mkdir(parents=True, exist_ok=True)
         
         self.logger.info(
             "code_generator_initialized",
@@ -181,10 +187,7 @@ class CodeGenerator:
         language: str,
     ) -> str:
         """Generate C or Fortran code using SymPy's codegen."""
-        from sympy.utilities.codegen import CCodeGen, FCodeGen, Routine
-        
-        # Create routine
-        routine = Routine(function_name, expr, argument_sequence=var_symbols)
+        from sympy.utilities.codegen import CCodeGen, FCodeGen
         
         # Select code generator
         if language.upper() == "C":
@@ -199,13 +202,16 @@ class CodeGenerator:
             function_name, expr, argument_sequence=var_symbols
         )
         
-        # Write to string
+        # Write to string (without the header include, so the source
+        # compiles on its own)
         source_lines = []
         for file_name, file_content in code_gen.write(
-            [result], str(self.config.codegen_temp_dir), to_files=False
+            [result], function_name, to_files=False, header=False, empty=False
         ):
             if file_name.endswith(('.c', '.f90', '.f')):
-                source_lines.append(file_content)
+                source_lines.append(
+                    file_content.replace(f'#include "{function_name}.h"\n', "")
+                )
         
         return "\n".join(source_lines) if source_lines else self._fallback_codegen(
             expr, var_symbols, function_name, language
@@ -271,6 +277,9 @@ def {function_name}({args}):
         """
         Compile generated code to executable function.
         
+        Runs the compiler in-process; async callers should use
+        compile_generated_async.
+        
         Args:
             source_code: Generated source code
             language: Source language
@@ -308,6 +317,47 @@ def {function_name}({args}):
             )
             return None
     
+    async def compile_generated_async(
+        self,
+        source_code: str,
+        language: str,
+        output_name: str = "compiled_fn",
+        arg_count: Optional[int] = None,
+    ) -> Optional[Callable]:
+        """
+        Compile generated code without blocking the event loop.
+        
+        C is built in the compilation pool and cached on disk by content,
+        so identical concurrent requests share one gcc run and restarts
+        reuse earlier builds. Other languages go through compile_generated.
+        
+        Args:
+            source_code: Generated source code
+            language: Source language
+            output_name: Name of the function to load
+            arg_count: Number of (double) arguments, for the C signature
+        
+        Returns:
+            Compiled callable function, or None if compilation fails
+        """
+        if language.upper() != "C":
+            return self.compile_generated(source_code, language, output_name)
+        
+        pool = self.compile_pool or get_compile_pool()
+        outcome = await pool.compile_c(source_code, output_name, arg_count=arg_count)
+        
+        if self.metrics_collector and self.config.enable_metrics:
+            await self.metrics_collector.record_compile_job(
+                expr=source_code,
+                language=language,
+                source=outcome.source,
+                duration_ms=outcome.duration_ms,
+                loop_blocked_ms=outcome.loop_blocked_ms,
+                success=outcome.fn is not None,
+            )
+        
+        return outcome.fn
+    
     def _compile_c_code(
         self,
         source_code: str,
@@ -316,7 +366,7 @@ def {function_name}({args}):
         """Compile C code to shared library and load."""
         import ctypes
         
-        temp_dir = self.config.codegen_temp_dir
+        temp_dir = Path(self.config.codegen_temp_dir)
         source_file = temp_dir / f"{output_name}.c"
         lib_file = temp_dir / f"{output_name}.so"
         
@@ -0,0 +1,484 @@
+"""
+SymPy Compilation Pool
+======================
+
+Runs compiler-heavy work (gcc for generated C, SymPy autowrap) in a process
+pool so async handlers never hold the event loop while a compiler runs.
+
+- In-flight dedup: concurrent requests for the same artifact await a
+  single compile
+- Content-addressed artifact cache on disk
+  ({artifact_cache_dir}/{key[:2]}/{key}/). The key hashes the source (or
+  expression and variables), language, compiler flags and Python ABI, so
+  artifacts built before a restart are loaded instead of recompiled.
+  Entries are built in a staging directory and renamed into place; a
+  partially written entry is never visible.
+- Entries are loaded into the process (dlopen / import), so the cache
+  root is created private (0700) and an entry is only trusted if it is
+  owned by this user and not writable by anyone else
+- Every request returns a CompileOutcome (memory / disk / shared /
+  compiled / failed) with its latency and the time it held the event
+  loop, which callers report via MetricsCollector.record_compile_job
+
+Build functions are module-level so they can be sent to worker processes.
+
+Version: 6.0.0
+"""
+
+from __future__ import annotations
+
+import asyncio
+import ctypes
+import hashlib
+import importlib.util
+import json
+import os
+import shutil
+import subprocess
+import sys
+import sysconfig
+import tempfile
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import structlog
+
+from services.symbolic_computation.config import SymbolicComputationConfig, get_config
+
+logger = structlog.get_logger(__name__)
+
+C_COMPILE_FLAGS = ("-shared", "-fPIC", "-O3")
+CACHE_DIR_MODE = 0o700
+CACHE_FILE_MODE = 0o600
+STAGING_MAX_AGE_SECONDS = 3600
+_ABI_TAG = f"{sys.implementation.cache_tag}-{sysconfig.get_platform()}"
+
+
+@dataclass
+class CompileOutcome:
+    """Result of a compile request."""
+    fn: Optional[Callable]
+    source: str  # memory | disk | shared | compiled | failed
+    duration_ms: float
+    loop_blocked_ms: float
+    error: Optional[str] = None
+
+
+def autowrap_target(language: str) -> Tuple[str, str]:
+    """(language, backend) for autowrap: C builds with Cython, Fortran with f2py."""
+    if language.upper() == "C":
+        return "C", "cython"
+    return "F95", "f2py"
+
+
+class ArtifactCache:
+    """
+    Content-addressed store of compiled artifacts on disk.
+
+    Each entry is a directory named by its key, holding the build outputs
+    and a meta.json describing how to load them.
+
+    Raises:
+        PermissionError: If the root directory belongs to another user
+    """
+
+    def __init__(self, root: Path | str):
+        self.root = Path(root).expanduser()
+        self.root.mkdir(mode=CACHE_DIR_MODE, parents=True, exist_ok=True)
+        if self.root.stat().st_uid != os.getuid():
+            raise PermissionError(f"artifact cache {self.root} is owned by another user")
+        os.chmod(self.root, CACHE_DIR_MODE)
+        self._staging_root = self.root / "staging"
+        self._staging_root.mkdir(mode=CACHE_DIR_MODE, exist_ok=True)
+        self._purge_stale_staging()
+
+    @staticmethod
+    def key(kind: str, **parts: Any) -> str:
+        """Content hash for an artifact (stable across processes and restarts)."""
+        payload = json.dumps({"kind": kind, "abi": _ABI_TAG, **parts}, sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+    def entry_dir(self, key: str) -> Path:
+        return self.root / key[:2] / key
+
+    def lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        """Metadata of a complete entry (with its directory), or None."""
+        entry = self.entry_dir(key)
+        meta_file = entry / "meta.json"
+        try:
+            if not (_is_trusted(entry) and _is_trusted(meta_file)):
+                logger.warning("artifact_untrusted", key=key, path=str(entry))
+                return None
+            meta = json.loads(meta_file.read_text())
+        except (OSError, ValueError):
+            return None
+        meta["dir"] = str(entry)
+        return meta
+
+    def staging_dir(self) -> Path:
+        """Fresh directory to build an entry in."""
+        return Path(tempfile.mkdtemp(dir=self._staging_root))
+
+    def commit(self, key: str, staging: Path, meta: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Move a finished build into place; the first writer of a key wins."""
+        fd = os.open(
+            staging / "meta.json", os.O_WRONLY | os.O_CREAT | os.O_TRUNC, CACHE_FILE_MODE
+        )
+        with os.fdopen(fd, "w") as f:
+            f.write(json.dumps(meta))
+        # Build outputs get their mode from the umask; lookup() only trusts
+        # entries nobody else can write, so set it explicitly
+        _make_private(staging)
+        target = self.entry_dir(key)
+        target.parent.mkdir(mode=CACHE_DIR_MODE, parents=True, exist_ok=True)
+        try:
+            os.rename(staging, target)
+        except OSError:
+            # Committed meanwhile by another request or process
+            shutil.rmtree(staging, ignore_errors=True)
+        return self.lookup(key)
+
+    def _purge_stale_staging(self) -> None:
+        """Remove builds abandoned by crashed processes."""
+        cutoff = time.time() - STAGING_MAX_AGE_SECONDS
+        for path in self._staging_root.iterdir():
+            try:
+                if path.stat().st_mtime < cutoff:
+                    shutil.rmtree(path, ignore_errors=True)
+            except OSError:
+                continue
+
+
+def _make_private(root: Path) -> None:
+    """chmod a build tree to 0700 directories and 0600 files."""
+    os.chmod(root, CACHE_DIR_MODE)
+    for dirpath, dirnames, filenames in os.walk(root):
+        for name in dirnames:
+            os.chmod(os.path.join(dirpath, name), CACHE_DIR_MODE)
+        for name in filenames:
+            os.chmod(os.path.join(dirpath, name), CACHE_FILE_MODE)
+
+
+def _is_trusted(path: Path) -> bool:
+    """Owned by this user and not writable by group or others."""
+    st = path.stat()
+    return st.st_uid == os.getuid() and not st.st_mode & 0o022
+
+
+# =============================================================================
+# Build functions (run in worker processes)
+# =============================================================================
+
+def build_shared_library(
+    source_code: str,
+    function_name: str,
+    timeout: float,
+    staging: str,
+) -> Dict[str, Any]:
+    """Compile C source into a shared library in staging."""
+    start = time.perf_counter()
+    source_file = Path(staging) / f"{function_name}.c"
+    library = f"{function_name}.so"
+    source_file.write_text(source_code)
+
+    result = subprocess.run(
+        ["gcc", *C_COMPILE_FLAGS, "-o", str(Path(staging) / library), str(source_file)],
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+    )
+
+    return {
+        "ok": result.returncode == 0,
+        "error": result.stderr[-2000:] if result.returncode else None,
+        "library": library,
+        "symbol": function_name,
+        "build_ms": (time.perf_counter() - start) * 1000,
+    }
+
+
+def build_autowrap_module(
+    expr: str,
+    variables: List[str],
+    language: str,
+    staging: str,
+) -> Dict[str, Any]:
+    """Build an autowrap extension module in staging."""
+    import sympy
+    from sympy.utilities.autowrap import autowrap
+
+    start = time.perf_counter()
+    language, backend = autowrap_target(language)
+    fn = autowrap(
+        sympy.sympify(expr),
+        args=[sympy.Symbol(v) for v in variables],
+        language=language,
+        backend=backend,
+        tempdir=staging,
+    )
+
+    # autowrap imported the module from staging; record how to load it again
+    for name, module in list(sys.modules.items()):
+        module_file = getattr(module, "__file__", None)
+        if not module_file or Path(module_file).parent != Path(staging):
+            continue
+        for attr, value in vars(module).items():
+            if value is fn:
+                sys.modules.pop(name, None)
+                return {
+                    "ok": True,
+                    "module": name,
+                    "file": Path(module_file).name,
+                    "symbol": attr,
+                    "build_ms": (time.perf_counter() - start) * 1000,
+                }
+
+    return {"ok": False, "error": "autowrap module not found in build directory"}
+
+
+# =============================================================================
+# Loaders (run in the service process)
+# =============================================================================
+
+def load_shared_library(meta: Dict[str, Any], arg_count: Optional[int] = None) -> Optional[Callable]:
+    """Function from a compiled shared library (doubles in, double out)."""
+    lib = ctypes.CDLL(str(Path(meta["dir"]) / meta["library"]))
+    fn = getattr(lib, meta["symbol"], None)
+    if fn is not None:
+        fn.restype = ctypes.c_double
+        if arg_count is not None:
+            fn.argtypes = [ctypes.c_double] * arg_count
+    return fn
+
+
+def load_extension_module(meta: Dict[str, Any]) -> Callable:
+    """Function from an autowrap extension module."""
+    spec = importlib.util.spec_from_file_location(
+        meta["module"], Path(meta["dir"]) / meta["file"]
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return getattr(module, meta["symbol"])
+
+
+class CompilePool:
+    """
+    Process pool for compilation with in-flight dedup and an on-disk cache.
+
+    Example:
+        pool = CompilePool()
+        outcome = await pool.compile_c(source_code, "quadratic", arg_count=1)
+        outcome.fn(3.0)  # 16.0
+    """
+
+    def __init__(
+        self,
+        config: Optional[SymbolicComputationConfig] = None,
+        executor: Optional[Executor] = None,
+    ):
+        """
+        Initialize the compilation pool.
+
+        Args:
+            config: Configuration instance (uses global if not provided)
+            executor: Executor for builds (default: a ProcessPoolExecutor
+                with config.compile_workers processes, created on first use)
+        """
+        self.config = config or get_config()
+        self.cache = ArtifactCache(self.config.artifact_cache_dir)
+        self.logger = logger.bind(component="compile_pool")
+
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._loaded: Dict[Tuple[str, Any], Callable] = {}
+
+    async def compile_c(
+        self,
+        source_code: str,
+        function_name: str,
+        arg_count: Optional[int] = None,
+    ) -> CompileOutcome:
+        """
+        Compile C source to a shared library and load function_name.
+
+        Args:
+            source_code: C source defining function_name
+            function_name: Exported function (doubles in, double out)
+            arg_count: Number of arguments, to declare ctypes argtypes
+        """
+        key = ArtifactCache.key(
+            "c", source=source_code, symbol=function_name, flags=C_COMPILE_FLAGS
+        )
+        return await self._compile(
+            key,
+            build=build_shared_library,
+            build_args=(source_code, function_name, self.config.compile_timeout),
+            load=lambda meta: load_shared_library(meta, arg_count),
+            load_key=(key, arg_count),
+        )
+
+    async def autowrap(
+        self,
+        expr: str,
+        variables: List[str],
+        language: str = "C",
+    ) -> CompileOutcome:
+        """
+        Build expr with SymPy autowrap (C via Cython, Fortran via f2py).
+
+        Args:
+            expr: SymPy expression as string
+            variables: Argument order of the compiled function
+            language: "C" or "Fortran"
+        """
+        key = ArtifactCache.key(
+            "autowrap", expr=expr, variables=list(variables), target=autowrap_target(language)
+        )
+        return await self._compile(
+            key,
+            build=build_autowrap_module,
+            build_args=(expr, list(variables), language),
+            load=load_extension_module,
+            load_key=(key, None),
+        )
+
+    def shutdown(self) -> None:
+        """Stop the worker processes (the disk cache is kept)."""
+        if self._executor is not None and self._owns_executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def _compile(
+        self,
+        key: str,
+        build: Callable[..., Dict[str, Any]],
+        build_args: Tuple[Any, ...],
+        load: Callable[[Dict[str, Any]], Optional[Callable]],
+        load_key: Tuple[str, Any],
+    ) -> CompileOutcome:
+        """Loaded function, else disk artifact, else in-flight or new build."""
+        start = time.perf_counter()
+
+        fn = self._loaded.get(load_key)
+        if fn is not None:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            return CompileOutcome(fn, "memory", elapsed_ms, elapsed_ms)
+
+        source = "disk"
+        meta = self.cache.lookup(key)
+        blocked = time.perf_counter() - start
+
+        try:
+            if meta is None:
+                task = self._inflight.get(key)
+                if task is None:
+                    source = "compiled"
+                    task = asyncio.ensure_future(self._build(key, build, build_args))
+                    self._inflight[key] = task
+                    task.add_done_callback(lambda done: self._forget(key, done))
+                else:
+                    source = "shared"
+                # Shielded: a cancelled caller must not cancel a shared build
+                meta, build_blocked = await asyncio.shield(task)
+                if source == "compiled":
+                    blocked += build_blocked
+
+            load_start = time.perf_counter()
+            fn = load(meta)
+            blocked += time.perf_counter() - load_start
+            if fn is None:
+                raise RuntimeError(f"symbol {meta.get('symbol')} not found")
+
+        except Exception as e:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self.logger.error(
+                "compile_failed",
+                key=key,
+                source=source,
+                error=str(e),
+            )
+            return CompileOutcome(None, "failed", elapsed_ms, blocked * 1000, error=str(e))
+
+        if len(self._loaded) >= self.config.cache_size:
+            del self._loaded[next(iter(self._loaded))]
+        self._loaded[load_key] = fn
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.logger.info(
+            "compile_completed",
+            key=key,
+            source=source,
+            duration_ms=elapsed_ms,
+            loop_blocked_ms=blocked * 1000,
+        )
+        return CompileOutcome(fn, source, elapsed_ms, blocked * 1000)
+
+    async def _build(
+        self,
+        key: str,
+        build: Callable[..., Dict[str, Any]],
+        build_args: Tuple[Any, ...],
+    ) -> Tuple[Dict[str, Any], float]:
+        """Run a build in the executor and commit it; returns (meta, seconds on the loop)."""
+        step = time.perf_counter()
+        staging = self.cache.staging_dir()
+
+        try:
+            # Submitting is synchronous (and starts worker processes on first use)
+            future = asyncio.get_running_loop().run_in_executor(
+                self._get_executor(), build, *build_args, str(staging)
+            )
+            blocked = time.perf_counter() - step
+            result = await future
+
+            step = time.perf_counter()
+            if not result.pop("ok"):
+                raise RuntimeError(result.get("error") or "build failed")
+            meta = self.cache.commit(key, staging, result)
+            blocked += time.perf_counter() - step
+        finally:
+            if staging.exists():
+                shutil.rmtree(staging, ignore_errors=True)
+
+        if meta is None:
+            raise RuntimeError(f"artifact {key} missing after commit")
+        return meta, blocked
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Retrieve the exception even if every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.config.compile_workers)
+        return self._executor
+
+
+# =============================================================================
+# Singleton
+# =============================================================================
+
+_pool: Optional[CompilePool] = None
+
+
+def get_compile_pool() -> CompilePool:
+    """Shared compilation pool for this process."""
+    global _pool
+    if _pool is None:
+        _pool = CompilePool()
+    return _pool
+
+
+def shutdown_compile_pool() -> None:
+    """Stop the shared pool's worker processes (API lifespan shutdown)."""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown()
+        _pool = None
@@ -3,26 +3,35 @@ SymPy Expression Evaluator
 ===========================
 
 Core expression evaluation engine with multi-backend support,
-caching, and governance integration.
+caching, and governance integration. evaluate_batch applies one compiled
+function to whole columns of variable bindings.
 
 Version: 6.0.0
 """
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import time
 from functools import lru_cache
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
 
+import numpy as np
 import structlog
 import sympy
 from sympy import sympify
 from sympy.utilities.lambdify import lambdify
 
 from services.symbolic_computation.config import SymbolicComputationConfig, get_config
+from services.symbolic_computation.core.compile_pool import (
+    CompilePool,
+    autowrap_target,
+    get_compile_pool,
+)
 from services.symbolic_computation.core.models import (
     BackendType,
+    BatchComputationResult,
     ComputationRequest,
     ComputationResult,
 )
@@ -50,6 +59,12 @@ class ExpressionEvaluator:
             backend="numpy"
         )
         print(result.result)  # 16.0
+        
+        batch = await evaluator.evaluate_batch(
+            expr="x**2 + 2*x + 1",
+            columns={"x": np.arange(1_000_000, dtype=np.float64)},
+        )
+        print(batch.results[:3])  # [1. 4. 9.]
     """
     
     def __init__(
@@ -57,6 +72,7 @@ class ExpressionEvaluator:
         config: Optional[SymbolicComputationConfig] = None,
         cache_manager: Optional[Any] = None,
         metrics_collector: Optional[Any] = None,
+        compile_pool: Optional[CompilePool] = None,
     ):
         """
         Initialize the expression evaluator.
@@ -65,14 +81,18 @@ class ExpressionEvaluator:
             config: Configuration instance (uses global if not provided)
             cache_manager: Optional cache manager for Redis caching
             metrics_collector: Optional metrics collector for performance tracking
+            compile_pool: Compilation pool for autowrap (default: shared process pool)
         """
         self.config = config or get_config()
         self.cache_manager = cache_manager
         self.metrics_collector = metrics_collector
+        self.compile_pool = compile_pool
         self.logger = logger.bind(component="expression_evaluator")
         
-        # Initialize LRU cache for compiled functions
-        self._compile_cache: Dict[str, Callable] = {}
+        # Parsed expressions, and compiled functions keyed by
+        # (expr, backend, variable order)
+        self._parse_cache: Dict[str, sympy.Expr] = {}
+        self._compile_cache: Dict[Tuple[str, str, Tuple[str, ...]], Callable] = {}
         
         self.logger.info(
             "expression_evaluator_initialized",
@@ -111,7 +131,9 @@ class ExpressionEvaluator:
         try:
             # Check cache first
             if self.cache_manager and self.config.cache_enabled:
-                cached = await self.cache_manager.get_cached_result(expr, backend)
+                cached = await self.cache_manager.get_cached_result(
+                    expr, backend, variables=variables
+                )
                 if cached is not None:
                     cache_hit = True
                     elapsed_ms = (time.perf_counter() - start_time) * 1000
@@ -124,24 +146,20 @@ class ExpressionEvaluator:
                         expression_hash=expr_hash,
                     )
             
-            # Parse and compile expression
-            parsed_expr = sympify(expr)
-            var_symbols = [sympy.Symbol(v) for v in variables.keys()]
-            
             # Get or compile lambdified function
-            compiled_fn = self._get_compiled_function(
-                expr, var_symbols, backend
-            )
+            var_names = list(variables)
+            compiled_fn = self._get_compiled_function(expr, var_names, backend)
             
             # Evaluate with variable values
-            var_values = [variables[str(s)] for s in var_symbols]
-            result = compiled_fn(*var_values) if var_values else compiled_fn()
+            result = compiled_fn(*(variables[name] for name in var_names))
             
             elapsed_ms = (time.perf_counter() - start_time) * 1000
             
             # Cache result
             if self.cache_manager and self.config.cache_enabled:
-                await self.cache_manager.cache_expression(expr, backend, result)
+                await self.cache_manager.cache_expression(
+                    expr, backend, result, variables=variables
+                )
             
             # Record metrics
             if self.metrics_collector and self.config.enable_metrics:
@@ -194,6 +212,118 @@ class ExpressionEvaluator:
                 error=str(e),
             )
     
+    async def evaluate_batch(
+        self,
+        expr: str,
+        columns: Mapping[str, Any],
+        backend: str = "numpy",
+        chunk_size: Optional[int] = None,
+    ) -> BatchComputationResult:
+        """
+        Evaluate a symbolic expression over columns of variable bindings.
+        
+        The expression is parsed and compiled once (shared with
+        evaluate_expression) and applied to the columns chunk by chunk.
+        With the numpy backend each chunk is one vectorized call; math and
+        mpmath are scalar-only and loop over the rows of a chunk. Batches
+        larger than one chunk run in a worker thread so the event loop
+        stays responsive. Batch results are not stored in the cache manager.
+        
+        Args:
+            expr: SymPy expression as string
+            columns: Variable name to column of values. Accepts NumPy arrays
+                (used without copying), sequences, and anything NumPy can
+                convert (Arrow arrays, pandas Series, buffer-protocol
+                objects). Columns must have equal length; scalars broadcast.
+            backend: Numerical backend ("numpy", "math", "mpmath")
+            chunk_size: Rows per chunk (default: config.batch_chunk_size)
+        
+        Returns:
+            BatchComputationResult with one value per row in results
+        """
+        start_time = time.perf_counter()
+        expr_hash = self._hash_expression(expr, backend)
+        chunk_size = chunk_size or self.config.batch_chunk_size
+        rows = 0
+        
+        try:
+            var_names = list(columns)
+            arrays = [_as_column(columns[name], name) for name in var_names]
+            rows = _batch_length(arrays)
+            num_chunks = -(-rows // chunk_size)
+
+            # Unbound symbols would come back as a symbolic object array
+            missing = sorted(
+                str(symbol)
+                for symbol in self._parse_expression(expr).free_symbols
+                if str(symbol) not in columns
+            )
+            if missing:
+                raise ValueError(f"no column for variables: {', '.join(missing)}")
+
+            compiled_fn = self._get_compiled_function(expr, var_names, backend)
+            
+            if num_chunks > 1:
+                results = await asyncio.to_thread(
+                    _evaluate_chunks, compiled_fn, arrays, rows, chunk_size, backend
+                )
+            else:
+                results = _evaluate_chunks(compiled_fn, arrays, rows, chunk_size, backend)
+            
+            elapsed_ms = (time.perf_counter() - start_time) * 1000
+            
+            if self.metrics_collector and self.config.enable_metrics:
+                await self.metrics_collector.record_evaluation(
+                    expr=expr,
+                    backend=backend,
+                    duration_ms=elapsed_ms,
+                    success=True,
+                )
+            
+            self.logger.info(
+                "batch_evaluated",
+                expr_hash=expr_hash,
+                backend=backend,
+                rows=rows,
+                chunks=num_chunks,
+                execution_time_ms=elapsed_ms,
+            )
+            
+            return BatchComputationResult(
+                results=results,
+                rows=rows,
+                chunks=num_chunks,
+                execution_time_ms=elapsed_ms,
+                backend_used=backend,
+                expression_hash=expr_hash,
+            )
+            
+        except Exception as e:
+            elapsed_ms = (time.perf_counter() - start_time) * 1000
+            self.logger.error(
+                "batch_evaluation_failed",
+                expr_hash=expr_hash,
+                rows=rows,
+                error=str(e),
+            )
+            
+            if self.metrics_collector and self.config.enable_metrics:
+                await self.metrics_collector.record_evaluation(
+                    expr=expr,
+                    backend=backend,
+                    duration_ms=elapsed_ms,
+                    success=False,
+                )
+            
+            return BatchComputationResult(
+                results=None,
+                rows=rows,
+                execution_time_ms=elapsed_ms,
+                backend_used=backend,
+                expression_hash=expr_hash,
+                error=str(e),
+            )
+    
     def compile_with_lambdify(
         self,
         expr: str,
@@ -211,7 +341,7 @@ class ExpressionEvaluator:
         Returns:
             Compiled callable function
         """
-        parsed_expr = sympify(expr)
+        parsed_expr = self._parse_expression(expr)
         var_symbols = [sympy.Symbol(v) for v in variables]
         
         compiled_fn = lambdify(var_symbols, parsed_expr, modules=modules)
@@ -235,6 +365,8 @@ class ExpressionEvaluator:
         Compile expression to C/Fortran function using autowrap.
         
         This provides ~500x performance improvement for complex expressions.
+        Runs the compiler in-process; async callers should use
+        compile_with_autowrap_async.
         
         Args:
             expr: SymPy expression as string
@@ -247,13 +379,15 @@ class ExpressionEvaluator:
         try:
             from sympy.utilities.autowrap import autowrap
             
-            parsed_expr = sympify(expr)
+            parsed_expr = self._parse_expression(expr)
             var_symbols = [sympy.Symbol(v) for v in variables]
+            autowrap_language, autowrap_backend = autowrap_target(language)
             
             compiled_fn = autowrap(
                 parsed_expr,
                 args=var_symbols,
-                language=language,
+                language=autowrap_language,
+                backend=autowrap_backend,
                 tempdir=str(self.config.codegen_temp_dir),
             )
             
@@ -274,19 +408,85 @@ class ExpressionEvaluator:
             # Fallback to lambdify
             return self.compile_with_lambdify(expr, variables)
     
+    async def compile_with_autowrap_async(
+        self,
+        expr: str,
+        variables: List[str],
+        language: str = "C",
+    ) -> Callable:
+        """
+        Compile expression with autowrap without blocking the event loop.
+        
+        The build runs in the compilation pool and the extension module is
+        cached on disk by content, so identical concurrent requests share one
+        build and restarts reuse earlier builds. Falls back to lambdify if
+        the build fails.
+        
+        Args:
+            expr: SymPy expression as string
+            variables: List of variable names
+            language: Target language ("C" or "Fortran")
+        
+        Returns:
+            Compiled callable function
+        """
+        pool = self.compile_pool or get_compile_pool()
+        outcome = await pool.autowrap(expr, variables, language)
+        
+        if self.metrics_collector and self.config.enable_metrics:
+            await self.metrics_collector.record_compile_job(
+                expr=expr,
+                language=language,
+                source=outcome.source,
+                duration_ms=outcome.duration_ms,
+                loop_blocked_ms=outcome.loop_blocked_ms,
+                success=outcome.fn is not None,
+            )
+        
+        if outcome.fn is not None:
+            return outcome.fn
+        
+        self.logger.warning(
+            "autowrap_failed_fallback_to_lambdify",
+            error=outcome.error,
+        )
+        return self.compile_with_lambdify(expr, variables)
+    
+    def _parse_expression(self, expr: str) -> sympy.Expr:
+        """Get or create parsed expression from cache."""
+        parsed_expr = self._parse_cache.get(expr)
+        if parsed_expr is not None:
+            return parsed_expr
+        
+        parsed_expr = sympify(expr)
+        
+        if len(self._parse_cache) >= self.config.cache_size:
+            oldest_key = next(iter(self._parse_cache))
+            del self._parse_cache[oldest_key]
+        
+        self._parse_cache[expr] = parsed_expr
+        return parsed_expr
+    
     def _get_compiled_function(
         self,
         expr: str,
-        var_symbols: List[sympy.Symbol],
+        var_names: Sequence[str],
         backend: str,
     ) -> Callable:
-        """Get or create compiled function from cache."""
-        cache_key = self._hash_expression(expr, backend)
+        """
+        Get or create compiled function from cache.
         
-        if cache_key in self._compile_cache:
-            return self._compile_cache[cache_key]
+        Keyed on the variable order as well: the compiled function takes
+        its arguments positionally in that order.
+        """
+        cache_key = (expr, backend, tuple(var_names))
         
-        parsed_expr = sympify(expr)
+        compiled_fn = self._compile_cache.get(cache_key)
+        if compiled_fn is not None:
+            return compiled_fn
+        
+        parsed_expr = self._parse_expression(expr)
+        var_symbols = [sympy.Symbol(name) for name in var_names]
         compiled_fn = lambdify(var_symbols, parsed_expr, modules=backend)
         
         # Store in LRU-like cache (simple dict with size limit)
@@ -304,7 +504,77 @@ class ExpressionEvaluator:
         return hashlib.sha256(content.encode()).hexdigest()[:16]
     
     def clear_cache(self) -> None:
-        """Clear the compiled function cache."""
+        """Clear the parsed expression and compiled function caches."""
+        self._parse_cache.clear()
         self._compile_cache.clear()
         self.logger.info("compile_cache_cleared")
 
+
+def results_to_rows(results: np.ndarray) -> list:
+    """
+    JSON-safe rows of a batch result.
+    
+    Rows are floats, or [real, imag] pairs for every row when any row is
+    complex (numpy complex dtypes, mpmath mpc values).
+    """
+    if results.dtype == object:
+        # mpmath values; JSON carries float64 precision anyway
+        results = results.astype(np.complex128)
+        if not results.imag.any():
+            results = results.real
+    if np.iscomplexobj(results):
+        results = np.stack([results.real, results.imag], axis=-1)
+    return results.tolist()
+
+
+def _as_column(values: Any, name: str) -> np.ndarray:
+    """Column of bindings as a 1-D array (0-d for a broadcast scalar)."""
+    array = np.asarray(values)
+    if array.ndim > 1:
+        raise ValueError(f"column '{name}' must be one-dimensional, got shape {array.shape}")
+    if array.dtype.kind in "biu":
+        array = array.astype(np.float64)
+    elif array.dtype.kind not in "fc":
+        raise ValueError(f"column '{name}' must be numeric, got dtype {array.dtype}")
+    return array
+
+
+def _batch_length(arrays: List[np.ndarray]) -> int:
+    """Common row count of the columns (1 if every column is a scalar)."""
+    lengths = {len(array) for array in arrays if array.ndim == 1}
+    if len(lengths) > 1:
+        raise ValueError(f"columns have different lengths: {sorted(lengths)}")
+    return lengths.pop() if lengths else 1
+
+
+def _evaluate_chunks(
+    compiled_fn: Callable,
+    arrays: List[np.ndarray],
+    rows: int,
+    chunk_size: int,
+    backend: str,
+) -> np.ndarray:
+    """Apply a compiled function to the columns, chunk_size rows at a time."""
+    apply = compiled_fn
+    if backend != BackendType.NUMPY.value and arrays:
+        # Scalar-only backends: one call per row
+        apply = np.frompyfunc(compiled_fn, len(arrays), 1)
+    
+    out: Optional[np.ndarray] = None
+    for start in range(0, rows, chunk_size):
+        stop = min(start + chunk_size, rows)
+        args = [array[start:stop] if array.ndim else array for array in arrays]
+        values = np.asarray(apply(*args))
+        if backend == BackendType.MATH.value:
+            values = values.astype(np.float64)
+        # Constant expressions (or all-scalar columns) come back as 0-d
+        values = np.broadcast_to(values, (stop - start,))
+        
+        if out is None:
+            out = np.empty(rows, dtype=values.dtype)
+        elif not np.can_cast(values.dtype, out.dtype, casting="safe"):
+            out = out.astype(np.result_type(out, values))
+        out[start:stop] = values
+    
+    return out if out is not None else np.empty(0, dtype=np.float64)
+
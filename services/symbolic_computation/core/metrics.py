@@ -28,6 +28,8 @@ class MetricsCollector:
     Tracks:
     - Expression evaluation times (by backend)
     - Code generation times (by language)
+    - Compile jobs: latency, artifact cache hits and event-loop
+      blocking time (in-memory only)
     - Cache hit rates
     - Error rates
     
@@ -70,6 +72,13 @@ class MetricsCollector:
         self._backend_usage: Dict[str, int] = {}
         self._language_usage: Dict[str, int] = {}
         
+        # Compile jobs (process-local; see core.compile_pool)
+        self._total_compile_jobs = 0
+        self._compile_time_sum = 0.0
+        self._loop_blocked_sum = 0.0
+        self._loop_blocked_max = 0.0
+        self._compile_sources: Dict[str, int] = {}
+        
         self.logger.info(
             "metrics_collector_initialized",
             postgres_enabled=postgres_client is not None,
@@ -180,6 +189,43 @@ class MetricsCollector:
             duration_ms=duration_ms,
         )
     
+    async def record_compile_job(
+        self,
+        expr: str,
+        language: str,
+        source: str,
+        duration_ms: float,
+        loop_blocked_ms: float,
+        success: bool,
+    ) -> None:
+        """
+        Record a compile request served by the compilation pool.
+        
+        Args:
+            expr: Expression or source that was compiled
+            language: Target language (C, Fortran)
+            source: Where the artifact came from (memory, disk, shared,
+                compiled, failed)
+            duration_ms: Latency seen by the caller in milliseconds
+            loop_blocked_ms: Time the request held the event loop
+            success: Whether a callable was produced
+        """
+        self._total_compile_jobs += 1
+        self._compile_time_sum += duration_ms
+        self._loop_blocked_sum += loop_blocked_ms
+        self._loop_blocked_max = max(self._loop_blocked_max, loop_blocked_ms)
+        self._compile_sources[source] = self._compile_sources.get(source, 0) + 1
+        
+        self.logger.debug(
+            "compile_job_recorded",
+            expr_hash=self._hash_expression(expr),
+            language=language,
+            source=source,
+            duration_ms=duration_ms,
+            loop_blocked_ms=loop_blocked_ms,
+            success=success,
+        )
+    
     async def get_metrics_summary(
         self,
         last_hours: int = 24,
@@ -220,8 +266,25 @@ class MetricsCollector:
             backend_usage=self._backend_usage.copy(),
             language_usage=self._language_usage.copy(),
             time_range_hours=last_hours,
+            **self._compile_summary(),
         )
     
+    def _compile_summary(self) -> Dict[str, Any]:
+        """Compile job fields of MetricsSummary (in-memory stats)."""
+        total = self._total_compile_jobs
+        reused = sum(
+            self._compile_sources.get(source, 0)
+            for source in ("memory", "disk", "shared")
+        )
+        return {
+            "total_compile_jobs": total,
+            "avg_compile_time_ms": round(self._compile_time_sum / total, 2) if total else 0.0,
+            "compile_cache_hit_rate": round(reused / total * 100, 2) if total else 0.0,
+            "avg_loop_blocked_ms": round(self._loop_blocked_sum / total, 3) if total else 0.0,
+            "max_loop_blocked_ms": round(self._loop_blocked_max, 3),
+            "compile_sources": self._compile_sources.copy(),
+        }
+    
     async def _persist_evaluation_metric(self, metric: Dict[str, Any]) -> None:
         """Persist evaluation metric to PostgreSQL."""
         try:
@@ -329,6 +392,7 @@ class MetricsCollector:
                 backend_usage=backend_usage,
                 language_usage=language_usage,
                 time_range_hours=last_hours,
+                **self._compile_summary(),
             )
             
         except Exception as e:
@@ -355,5 +419,10 @@ class MetricsCollector:
         self._cache_hits = 0
         self._backend_usage.clear()
         self._language_usage.clear()
+        self._total_compile_jobs = 0
+        self._compile_time_sum = 0.0
+        self._loop_blocked_sum = 0.0
+        self._loop_blocked_max = 0.0
+        self._compile_sources.clear()
         self.logger.info("metrics_reset")
 
@@ -63,6 +63,41 @@ class ComputationResult(BaseModel):
         }
 
 
+class BatchComputationRequest(BaseModel):
+    """Request model for batch (column) expression evaluation."""
+    expression: str = Field(..., description="SymPy expression as string")
+    columns: Dict[str, List[float]] = Field(
+        default_factory=dict,
+        description="Variable name to column of values (equal lengths)"
+    )
+    backend: BackendType = Field(
+        default=BackendType.NUMPY,
+        description="Numerical backend to use"
+    )
+    chunk_size: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="Rows per chunk (defaults to config batch_chunk_size)"
+    )
+
+
+class BatchComputationResult(BaseModel):
+    """Result model for batch expression evaluation."""
+    results: Any = Field(
+        ...,
+        description=(
+            "Computed values, one per row (NumPy array in-process; list over the API, "
+            "with [real, imag] pairs when complex)"
+        )
+    )
+    rows: int = Field(..., description="Number of rows evaluated")
+    chunks: int = Field(default=0, description="Number of chunks the rows were split into")
+    execution_time_ms: float = Field(..., description="Execution time in milliseconds")
+    backend_used: str = Field(..., description="Backend that was used")
+    expression_hash: str = Field(..., description="Hash of the expression")
+    error: Optional[str] = Field(default=None, description="Error message if failed")
+
+
 class CodeGenRequest(BaseModel):
     """Request model for code generation."""
     expression: str = Field(..., description="SymPy expression as string")
@@ -130,5 +165,11 @@ class MetricsSummary(BaseModel):
     cache_hit_rate: float = Field(default=0.0)
     backend_usage: Dict[str, int] = Field(default_factory=dict)
     language_usage: Dict[str, int] = Field(default_factory=dict)
+    total_compile_jobs: int = Field(default=0)
+    avg_compile_time_ms: float = Field(default=0.0)
+    compile_cache_hit_rate: float = Field(default=0.0)
+    avg_loop_blocked_ms: float = Field(default=0.0)
+    max_loop_blocked_ms: float = Field(default=0.0)
+    compile_sources: Dict[str, int] = Field(default_factory=dict)
     time_range_hours: int = Field(default=24)
 
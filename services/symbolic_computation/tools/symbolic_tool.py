@@ -15,7 +15,10 @@ from typing import Any, Dict, List, Optional
 import structlog
 
 from services.symbolic_computation.config import get_config
-from services.symbolic_computation.core.expression_evaluator import ExpressionEvaluator
+from services.symbolic_computation.core.expression_evaluator import (
+    ExpressionEvaluator,
+    results_to_rows,
+)
 from services.symbolic_computation.core.code_generator import CodeGenerator
 from services.symbolic_computation.core.optimizer import Optimizer
 from services.symbolic_computation.core.validator import ExpressionValidator
@@ -131,6 +134,57 @@ class SymPyTool:
             "error": result.error,
         }
     
+    async def evaluate_batch(
+        self,
+        expression: str,
+        columns: Dict[str, Any],
+        backend: str = "numpy",
+    ) -> Dict[str, Any]:
+        """
+        Evaluate a symbolic expression over columns of variable values.
+        
+        Args:
+            expression: SymPy expression as string
+            columns: Variable name to equal-length column of values
+                (lists, NumPy or Arrow arrays)
+            backend: Numerical backend (numpy, math, mpmath)
+        
+        Returns:
+            Dict with results (one per row, [real, imag] pairs if complex),
+            rows, execution_time_ms, error
+        """
+        self.logger.info(
+            "tool_evaluate_batch_called",
+            expr_len=len(expression),
+            backend=backend,
+            num_vars=len(columns),
+        )
+        
+        # Validate first
+        validation = self.validator.validate(expression)
+        if not validation.is_valid:
+            return {
+                "results": None,
+                "rows": 0,
+                "error": f"Validation failed: {'; '.join(validation.errors)}",
+                "execution_time_ms": 0,
+            }
+        
+        # Evaluate
+        result = await self.evaluator.evaluate_batch(
+            expr=expression,
+            columns=columns,
+            backend=backend,
+        )
+        
+        return {
+            "results": results_to_rows(result.results) if result.results is not None else None,
+            "rows": result.rows,
+            "execution_time_ms": result.execution_time_ms,
+            "backend_used": result.backend_used,
+            "error": result.error,
+        }
+    
     async def generate_code(
         self,
         expression: str,
@@ -281,6 +335,17 @@ class SymPyTool:
                 "category": "computation",
                 "requires_approval": False,
             },
+            {
+                "name": "symbolic_evaluate_batch",
+                "description": "Evaluate a symbolic expression over columns of variable values",
+                "parameters": {
+                    "expression": {"type": "string", "required": True},
+                    "columns": {"type": "object", "required": True},
+                    "backend": {"type": "string", "required": False, "default": "numpy"},
+                },
+                "category": "computation",
+                "requires_approval": False,
+            },
             {
                 "name": "symbolic_codegen",
                 "description": "Generate compilable code from expression",
@@ -0,0 +1,156 @@
+"""
+L9 Telemetry - Orchestration Metrics
+====================================
+
+Prometheus metrics for the UnifiedController pipeline and the
+RequestScheduler that fronts it.
+
+Tracks:
+- Per-phase latency (routing, compile, ..., reflect) as histograms
+- Optional phases pruned by deadline or load shedding
+- Scheduler admissions, rejections, queue depth and wait time
+
+Version: 1.0.0
+Author: L9 Enterprise
+
+Usage:
+    from telemetry.orchestration_metrics import record_controller_phase
+
+    record_controller_phase("simulate", duration_seconds=1.2)
+"""
+
+from __future__ import annotations
+
+import structlog
+from typing import Optional
+
+logger = structlog.get_logger(__name__)
+
+# Try to import prometheus_client, gracefully degrade if not available
+try:
+    from prometheus_client import Counter, Gauge, Histogram
+
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+    logger.warning("prometheus_client not installed - orchestration metrics disabled")
+
+
+# =============================================================================
+# Metric Definitions
+# =============================================================================
+
+if PROMETHEUS_AVAILABLE:
+    CONTROLLER_PHASE_DURATION = Histogram(
+        "l9_controller_phase_duration_seconds",
+        "Duration of UnifiedController pipeline phases in seconds",
+        ["phase"],
+        buckets=(0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+    )
+
+    CONTROLLER_PHASE_SKIPPED = Counter(
+        "l9_controller_phase_skipped_total",
+        "Optional controller phases skipped",
+        ["phase", "reason"],
+    )
+
+    SCHEDULER_REQUESTS_TOTAL = Counter(
+        "l9_scheduler_requests_total",
+        "Requests seen by the RequestScheduler",
+        ["priority", "outcome"],
+    )
+
+    SCHEDULER_QUEUE_DEPTH = Gauge(
+        "l9_scheduler_queue_depth",
+        "Requests waiting for an execution slot",
+    )
+
+    SCHEDULER_WAIT_SECONDS = Histogram(
+        "l9_scheduler_wait_seconds",
+        "Time requests spend queued before execution",
+        ["priority"],
+        buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0),
+    )
+
+
+# =============================================================================
+# Recording Functions
+# =============================================================================
+
+
+def record_controller_phase(phase: str, duration_seconds: float) -> None:
+    """
+    Record the duration of one controller phase.
+
+    Args:
+        phase: Phase name (routing, compile, validate, ..., reflect)
+        duration_seconds: Phase duration in seconds
+    """
+    if not PROMETHEUS_AVAILABLE:
+        return
+
+    try:
+        CONTROLLER_PHASE_DURATION.labels(phase=phase).observe(duration_seconds)
+    except Exception as e:
+        logger.warning("Failed to record controller phase metric", error=str(e))
+
+
+def record_phase_skipped(phase: str, reason: str) -> None:
+    """
+    Record an optional phase being pruned.
+
+    Args:
+        phase: Phase name (deliberate, simulate, reflect)
+        reason: Why it was skipped (deadline, shed)
+    """
+    if not PROMETHEUS_AVAILABLE:
+        return
+
+    try:
+        CONTROLLER_PHASE_SKIPPED.labels(phase=phase, reason=reason).inc()
+    except Exception as e:
+        logger.warning("Failed to record phase skipped metric", error=str(e))
+
+
+def record_scheduler_request(
+    priority: str,
+    outcome: str,
+    wait_seconds: Optional[float] = None,
+) -> None:
+    """
+    Record a scheduler admission decision.
+
+    Args:
+        priority: Request priority name
+        outcome: admitted, completed, rejected_<reason>
+        wait_seconds: Optional time spent queued
+    """
+    if not PROMETHEUS_AVAILABLE:
+        return
+
+    try:
+        SCHEDULER_REQUESTS_TOTAL.labels(priority=priority, outcome=outcome).inc()
+        if wait_seconds is not None:
+            SCHEDULER_WAIT_SECONDS.labels(priority=priority).observe(wait_seconds)
+    except Exception as e:
+        logger.warning("Failed to record scheduler metric", error=str(e))
+
+
+def set_scheduler_queue_depth(depth: int) -> None:
+    """Set the scheduler queue depth gauge."""
+    if not PROMETHEUS_AVAILABLE:
+        return
+
+    try:
+        SCHEDULER_QUEUE_DEPTH.set(depth)
+    except Exception as e:
+        logger.warning("Failed to set scheduler queue depth", error=str(e))
+
+
+__all__ = [
+    "PROMETHEUS_AVAILABLE",
+    "record_controller_phase",
+    "record_phase_skipped",
+    "record_scheduler_request",
+    "set_scheduler_queue_depth",
+]
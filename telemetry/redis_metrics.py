@@ -0,0 +1,113 @@
+"""
+L9 Telemetry - Redis Metrics
+============================
+
+Prometheus metrics for the L9 Redis client (runtime.redis_client).
+Tracks per-command latency, error counts and batch sizes so queue and
+rate-limiter hot paths can be watched on the /metrics endpoint.
+
+Version: 1.0.0
+Author: L9 Enterprise
+
+Usage:
+    from telemetry.redis_metrics import record_redis_command
+
+    start = time.perf_counter()
+    ...
+    record_redis_command("enqueue_task", "ok", time.perf_counter() - start)
+"""
+
+from __future__ import annotations
+
+import structlog
+from typing import Optional
+
+logger = structlog.get_logger(__name__)
+
+# Try to import prometheus_client, gracefully degrade if not available
+try:
+    from prometheus_client import Counter, Histogram
+
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+    logger.warning("prometheus_client not installed - redis metrics disabled")
+
+
+# =============================================================================
+# Metric Definitions
+# =============================================================================
+
+if PROMETHEUS_AVAILABLE:
+    REDIS_COMMAND_TOTAL = Counter(
+        "l9_redis_command_total",
+        "Total number of RedisClient operations",
+        ["command", "status"],
+    )
+
+    REDIS_COMMAND_DURATION = Histogram(
+        "l9_redis_command_duration_seconds",
+        "Duration of RedisClient operations (one round trip each) in seconds",
+        ["command"],
+        buckets=(
+            0.0001,
+            0.00025,
+            0.0005,
+            0.001,
+            0.0025,
+            0.005,
+            0.01,
+            0.025,
+            0.05,
+            0.1,
+            0.25,
+            0.5,
+            1.0,
+        ),
+    )
+
+    REDIS_BATCH_SIZE = Histogram(
+        "l9_redis_batch_size",
+        "Number of items carried by a batched RedisClient operation",
+        ["command"],
+        buckets=(1, 2, 5, 10, 25, 50, 100, 250, 500, 1000),
+    )
+
+
+# =============================================================================
+# Recording Functions
+# =============================================================================
+
+
+def record_redis_command(
+    command: str,
+    status: str = "ok",
+    duration_seconds: Optional[float] = None,
+    batch_size: Optional[int] = None,
+) -> None:
+    """
+    Record a RedisClient operation.
+
+    Args:
+        command: Logical operation name (enqueue_task, mget_task_context, ...)
+        status: Operation status (ok, error)
+        duration_seconds: Optional wall time of the round trip in seconds
+        batch_size: Optional number of items for batched operations
+    """
+    if not PROMETHEUS_AVAILABLE:
+        return
+
+    try:
+        REDIS_COMMAND_TOTAL.labels(command=command, status=status).inc()
+        if duration_seconds is not None:
+            REDIS_COMMAND_DURATION.labels(command=command).observe(duration_seconds)
+        if batch_size is not None:
+            REDIS_BATCH_SIZE.labels(command=command).observe(batch_size)
+    except Exception as e:
+        logger.warning("Failed to record redis command metric", error=str(e))
+
+
+__all__ = [
+    "PROMETHEUS_AVAILABLE",
+    "record_redis_command",
+]
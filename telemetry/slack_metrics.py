@@ -84,6 +84,19 @@ if PROMETHEUS_AVAILABLE:
         ["team_id"],
     )
 
+    SLACK_DEDUPE_CHECKS = Counter(
+        "l9_slack_dedupe_checks_total",
+        "Dedupe checks by answering tier (local, redis, postgres)",
+        ["tier", "result"],
+    )
+
+    SLACK_DEDUPE_DURATION = Histogram(
+        "l9_slack_dedupe_check_duration_seconds",
+        "Time for a dedupe check, by answering tier",
+        ["tier"],
+        buckets=(0.00001, 0.0001, 0.0005, 0.001, 0.005, 0.025, 0.1, 0.5),
+    )
+
     # Processing metrics
     SLACK_PROCESSING_DURATION = Histogram(
         "l9_slack_processing_duration_seconds",
@@ -188,6 +201,25 @@ def record_idempotent_hit(team_id: str) -> None:
         logger.warning("Failed to record idempotent hit metric", error=str(e))
 
 
+def record_dedupe_check(tier: str, result: str, duration_seconds: float) -> None:
+    """
+    Record a dedupe check.
+
+    Args:
+        tier: Tier that answered (local, redis, postgres, none)
+        result: duplicate, new or error
+        duration_seconds: Check duration in seconds
+    """
+    if not PROMETHEUS_AVAILABLE:
+        return
+
+    try:
+        SLACK_DEDUPE_CHECKS.labels(tier=tier, result=result).inc()
+        SLACK_DEDUPE_DURATION.labels(tier=tier).observe(duration_seconds)
+    except Exception as e:
+        logger.warning("Failed to record dedupe check metric", error=str(e))
+
+
 def record_slack_processing(
     event_type: str,
     duration_seconds: float,
@@ -327,6 +359,7 @@ __all__ = [
     "record_slack_request",
     "record_signature_verification",
     "record_idempotent_hit",
+    "record_dedupe_check",
     "record_slack_processing",
     "record_aios_call",
     "record_packet_write_error",
@@ -359,6 +359,47 @@ class TestSlackReply:
                 thread_ts="1234567890.000000",
             )
 
+    @pytest.mark.asyncio
+    async def test_streamed_reply_coalesces_updates(self, mock_slack_client):
+        """Test streamed deltas post one placeholder and coalesce updates."""
+        from core.schemas.ws_event_stream import EventMessage, EventType
+        from memory.slack_ingest import SlackStreamingReply
+
+        reply = SlackStreamingReply(
+            mock_slack_client, "C123", "1234567890.000000", update_interval=60
+        )
+        for word in ["Hello", " there", " from", " L"]:
+            await reply.on_event(
+                EventMessage(
+                    type=EventType.REASONING_DELTA,
+                    agent_id="l-cto",
+                    payload={"iteration": 1, "text": word},
+                )
+            )
+        await reply.finish("Hello there from L")
+
+        # First delta posts immediately; the rest are held by the coalescer
+        mock_slack_client.post_message.assert_awaited_once_with(
+            channel="C123", text="Hello", thread_ts="1234567890.000000"
+        )
+        mock_slack_client.update_message.assert_awaited_once_with(
+            channel="C123", ts="1234567890.123456", text="Hello there from L"
+        )
+        assert reply.updates == 1
+
+    @pytest.mark.asyncio
+    async def test_streamed_reply_without_deltas_posts_once(self, mock_slack_client):
+        """Test finish() posts the reply when nothing was streamed."""
+        from memory.slack_ingest import SlackStreamingReply
+
+        reply = SlackStreamingReply(mock_slack_client, "C123")
+        await reply.finish("Done")
+
+        mock_slack_client.post_message.assert_awaited_once_with(
+            channel="C123", text="Done", thread_ts=None
+        )
+        mock_slack_client.update_message.assert_not_awaited()
+
 
 # =============================================================================
 # Integration Tests
@@ -0,0 +1,162 @@
+"""
+L9 API Startup Orchestrator Tests
+=================================
+
+Tests for dependency-aware startup (api/startup.py).
+No external services required.
+
+Version: 1.0.0
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+startup_module = pytest.importorskip("api.startup")
+dependencies = pytest.importorskip("api.dependencies")
+
+StartupError = startup_module.StartupError
+StartupMode = startup_module.StartupMode
+StartupOrchestrator = startup_module.StartupOrchestrator
+require_subsystem = dependencies.require_subsystem
+
+
+def _recorder(log, name, delay=0.0, fail=False):
+    async def init():
+        log.append(f"start:{name}")
+        await asyncio.sleep(delay)
+        if fail:
+            raise RuntimeError(f"{name} down")
+        log.append(f"end:{name}")
+
+    return init
+
+
+@pytest.mark.asyncio
+async def test_independent_subsystems_initialize_concurrently():
+    log = []
+    startup = StartupOrchestrator()
+    for name in ("memory", "neo4j", "redis"):
+        startup.add(name, _recorder(log, name, delay=0.05))
+
+    start = time.perf_counter()
+    await startup.run()
+
+    assert time.perf_counter() - start < 0.12
+    assert startup.ready
+    assert all(s["status"] == "ready" for s in startup.status()["subsystems"].values())
+
+
+@pytest.mark.asyncio
+async def test_dependencies_finish_before_dependents_start():
+    log = []
+    startup = StartupOrchestrator()
+    startup.add("executor", _recorder(log, "executor"), depends_on=("memory", "governance"))
+    startup.add("governance", _recorder(log, "governance", 0.01), depends_on=("memory",))
+    startup.add("memory", _recorder(log, "memory", 0.01))
+
+    await startup.run()
+
+    assert log.index("end:memory") < log.index("start:governance")
+    assert log.index("end:governance") < log.index("start:executor")
+    assert startup.order() == ["memory", "governance", "executor"]
+
+
+@pytest.mark.asyncio
+async def test_failures_are_recorded_and_dependents_still_run():
+    log = []
+    startup = StartupOrchestrator()
+    startup.add("neo4j", _recorder(log, "neo4j", fail=True))
+    startup.add("permission_graph", _recorder(log, "permission_graph"), depends_on=("neo4j",))
+
+    await startup.run()
+
+    status = startup.status()
+    assert status["failed"] == ["neo4j"]
+    assert status["subsystems"]["neo4j"]["error"] == "neo4j down"
+    assert status["subsystems"]["permission_graph"]["status"] == "ready"
+
+
+@pytest.mark.asyncio
+async def test_critical_failure_aborts_and_cancels_the_rest():
+    log = []
+    startup = StartupOrchestrator()
+    startup.add("registry", _recorder(log, "registry", fail=True), critical=True)
+    startup.add("slow", _recorder(log, "slow", delay=5))
+
+    with pytest.raises(StartupError, match="registry"):
+        await startup.run()
+
+    assert startup.get("slow").status == "cancelled"
+    assert not startup.ready
+
+
+def test_unknown_dependencies_and_cycles_are_rejected():
+    startup = StartupOrchestrator()
+    startup.add("a", _recorder([], "a"), depends_on=("b",))
+    startup.add("b", _recorder([], "b"), depends_on=("a",))
+    with pytest.raises(StartupError, match="cycle: a -> b -> a"):
+        startup.order()
+
+    startup = StartupOrchestrator()
+    startup.add("a", _recorder([], "a"), depends_on=("missing",))
+    with pytest.raises(StartupError, match="unknown subsystem missing"):
+        startup.order()
+
+
+@pytest.mark.asyncio
+async def test_background_and_lazy_subsystems_do_not_block_startup():
+    log = []
+    startup = StartupOrchestrator()
+    startup.add("memory", _recorder(log, "memory"))
+    startup.add("sync", _recorder(log, "sync", 0.05), depends_on=("memory",), mode=StartupMode.BACKGROUND)
+    startup.add("research", _recorder(log, "research", 0.01), mode=StartupMode.LAZY)
+
+    await startup.run()
+    assert startup.status()["pending"] == ["sync"]
+    assert "start:research" not in log
+
+    await startup.wait_background(timeout=1)
+    assert startup.get("sync").status == "ready"
+
+    dependency = require_subsystem("research")
+    request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(startup_orchestrator=startup)))
+    await asyncio.gather(dependency(request), dependency(request), startup.ensure("research"))
+    assert log.count("start:research") == 1
+    assert startup.get("research").status == "ready"
+    await startup.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_initialization():
+    log = []
+    startup = StartupOrchestrator()
+    startup.add("memory", _recorder(log, "memory", 0.02), mode=StartupMode.LAZY)
+    startup.add("research", _recorder(log, "research", 0.02), depends_on=("memory",), mode=StartupMode.LAZY)
+    await startup.run()
+
+    first = asyncio.create_task(startup.ensure("research"))
+    await asyncio.sleep(0.01)
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+    assert (await startup.ensure("research")).status == "ready"
+    assert startup.get("memory").status == "ready"
+    assert log.count("start:research") == 1
+    await startup.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_sequential_mode_runs_one_subsystem_at_a_time():
+    log = []
+    startup = StartupOrchestrator(parallel=False)
+    startup.add("a", _recorder(log, "a", 0.01))
+    startup.add("b", _recorder(log, "b", 0.01))
+    startup.add("c", _recorder(log, "c"), depends_on=("a",))
+
+    await startup.run()
+
+    assert log == ["start:a", "end:a", "start:b", "end:b", "start:c", "end:c"]
@@ -15,11 +15,12 @@ import pytest
 PROJECT_ROOT = Path(__file__).parent.parent
 TESTS_ROOT = Path(__file__).parent
 
-# CRITICAL: Insert project root FIRST for real imports to work
+# CRITICAL: Project root must come BEFORE tests/ for real imports to work
+# (tests/memory, tests/api, ... would otherwise shadow the real packages)
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 if str(TESTS_ROOT) not in sys.path:
-    sys.path.insert(0, str(TESTS_ROOT))
+    sys.path.insert(sys.path.index(str(PROJECT_ROOT)) + 1, str(TESTS_ROOT))
 
 # Import mocks
 from mocks.kernel_mocks import (
@@ -0,0 +1,201 @@
+"""
+Context Window Tests
+====================
+
+Tests for the incremental, token-budgeted context window used by
+AgentInstance.assemble_context.
+"""
+
+from __future__ import annotations
+
+from core.agents.agent_instance import AgentInstance
+from core.agents.context_window import (
+    ContextTrimStrategy,
+    ContextWindow,
+    get_model_token_budget,
+)
+from core.agents.schemas import AgentConfig, AgentTask, TaskKind
+
+
+def _instance(**config) -> AgentInstance:
+    agent_config = AgentConfig(agent_id="L", system_prompt="You are L.", **config)
+    task = AgentTask(kind=TaskKind.QUERY, agent_id="L", source_id="igor", payload={})
+    return AgentInstance(config=agent_config, task=task)
+
+
+def _tool_turn(instance: AgentInstance, n: int, size: int = 2000) -> None:
+    call_id = f"call_{n}"
+    instance.add_assistant_message_with_tool_calls(
+        [
+            {
+                "id": call_id,
+                "type": "function",
+                "function": {"name": "memory_search", "arguments": "{}"},
+            }
+        ]
+    )
+    instance.add_tool_result("memory_search", call_id, "x" * size)
+
+
+def _assert_tool_pairing(messages: list[dict]) -> None:
+    """Every tool message must follow an assistant message that requested it."""
+    open_calls: set[str] = set()
+    for msg in messages:
+        if msg.get("tool_calls"):
+            open_calls = {c["id"] for c in msg["tool_calls"]}
+        elif msg["role"] == "tool":
+            assert msg["tool_call_id"] in open_calls
+
+
+def test_assemble_context_matches_full_history_under_budget():
+    instance = _instance()
+    instance.add_user_message("find the ledger")
+    _tool_turn(instance, 1, size=100)
+
+    context = instance.assemble_context()
+
+    assert context["messages"] == instance.get_messages_for_aios()
+    assert context["messages_prepared"] is True
+    assert context["system_prompt"] == "You are L."
+    stats = context["metadata"]["context_window"]
+    assert stats["tokens_saved"] == 0
+    assert stats["messages_sent"] == 3
+
+
+def test_incremental_sync_formats_only_new_entries():
+    window = ContextWindow(model="gpt-4o")
+    history = [{"role": "user", "content": "hello"}]
+
+    assert window.sync(history) == 1
+    history.append({"role": "assistant", "content": "hi"})
+    assert window.sync(history) == 1
+    assert window.sync(history) == 0
+
+    first = window.build()
+    assert window.build() == first
+    assert [m["role"] for m in first] == ["user", "assistant"]
+
+
+def test_drop_tool_results_elides_oldest_first():
+    instance = _instance(context_token_budget=6000, max_tokens=1000)
+    instance.add_user_message("research the ledger")
+    for n in range(10):
+        _tool_turn(instance, n)
+
+    context = instance.assemble_context()
+    messages = context["messages"]
+    stats = context["metadata"]["context_window"]
+
+    assert messages[0]["content"] == "research the ledger"
+    assert "elided" in messages[2]["content"]
+    assert messages[-1]["content"] == "x" * 2000
+    assert stats["tool_results_elided"] > 0
+    assert stats["tokens_saved"] > 0
+    assert stats["over_budget"] is False
+    _assert_tool_pairing(messages)
+
+
+def test_drop_tool_results_drops_oldest_turns_when_eliding_is_not_enough():
+    instance = _instance(context_token_budget=1500, max_tokens=200)
+    instance.add_user_message("research the ledger")
+    for n in range(200):
+        _tool_turn(instance, n, size=200)
+
+    context = instance.assemble_context()
+    stats = context["metadata"]["context_window"]
+
+    assert stats["messages_dropped"] > 0
+    assert stats["sent_tokens"] <= 1500 - 200
+    assert context["messages"][0]["content"] == "research the ledger"
+    _assert_tool_pairing(context["messages"])
+
+
+def test_summarize_strategy_replaces_oldest_turns():
+    instance = _instance(
+        context_token_budget=4000, max_tokens=500, context_strategy="summarize"
+    )
+    instance.add_user_message("research the ledger")
+    for n in range(10):
+        instance.add_assistant_message(f"Turn {n}: the ledger service is written in Go.")
+        _tool_turn(instance, n)
+
+    context = instance.assemble_context()
+    messages = context["messages"]
+    stats = context["metadata"]["context_window"]
+
+    assert messages[1]["content"].startswith("[Summary of")
+    assert "ledger service is written in Go" in messages[1]["content"]
+    assert stats["messages_summarized"] > 0
+    assert stats["strategy"] == ContextTrimStrategy.SUMMARIZE.value
+    _assert_tool_pairing(messages)
+
+
+def _parallel_tool_history(turns: int, calls: int) -> list[dict]:
+    history = [{"role": "user", "content": "research the ledger"}]
+    for n in range(turns):
+        call_ids = [f"call_{n}_{i}" for i in range(calls)]
+        history.append(
+            {
+                "role": "assistant",
+                "content": None,
+                "tool_calls": [
+                    {
+                        "id": call_id,
+                        "type": "function",
+                        "function": {"name": "memory_search", "arguments": "{}"},
+                    }
+                    for call_id in call_ids
+                ],
+            }
+        )
+        history.extend(
+            {"role": "tool", "tool_call_id": call_id, "name": "memory_search", "content": "x" * 400}
+            for call_id in call_ids
+        )
+    return history
+
+
+def test_keep_recent_boundary_inside_tool_group_keeps_group_whole():
+    # keep_recent=2 ends inside the last turn's 3 tool results
+    for strategy in (ContextTrimStrategy.DROP_TOOL_RESULTS, ContextTrimStrategy.SUMMARIZE):
+        window = ContextWindow(
+            model="gpt-4o", token_budget=400, strategy=strategy, keep_recent=2
+        )
+        window.sync(_parallel_tool_history(turns=4, calls=3))
+
+        messages = window.build()
+
+        assert messages[-4].get("tool_calls")
+        assert [m["tool_call_id"] for m in messages[-3:]] == [
+            "call_3_0",
+            "call_3_1",
+            "call_3_2",
+        ]
+        _assert_tool_pairing(messages)
+
+
+def test_tokens_saved_accumulates_across_iterations():
+    instance = _instance(context_token_budget=3000, max_tokens=500)
+    instance.add_user_message("go")
+    for n in range(6):
+        _tool_turn(instance, n)
+    first = instance.assemble_context()["metadata"]["context_window"]
+
+    _tool_turn(instance, 6)
+    second = instance.assemble_context()["metadata"]["context_window"]
+
+    assert second["total_tokens_saved"] == (
+        first["tokens_saved"] + second["tokens_saved"]
+    )
+    assert instance.to_trace_dict()["context_tokens_saved"] == (
+        second["total_tokens_saved"]
+    )
+
+
+def test_model_budget_lookup(monkeypatch):
+    monkeypatch.delenv("AGENT_CONTEXT_TOKEN_BUDGET", raising=False)
+    assert get_model_token_budget("gpt-4o-2024-08-06") == 120_000
+    assert get_model_token_budget("gpt-4-0613") == 7_500
+
+    monkeypatch.setenv("AGENT_CONTEXT_TOKEN_BUDGET", "9000")
+    assert get_model_token_budget("gpt-4o") == 9000
@@ -1207,6 +1207,357 @@ async def test_tool_call_packet_emitted(
     assert "call_id" in packet.payload
 
 
+# =============================================================================
+# Test: Multiple tool calls from one turn (parallel dispatch)
+# =============================================================================
+
+
+class ConcurrencyTrackingToolRegistry(MockToolRegistry):
+    """Tool registry whose dispatch sleeps and records peak concurrency."""
+
+    def __init__(self, delay: float = 0.02) -> None:
+        super().__init__()
+        self._delay = delay
+        self.active: int = 0
+        self.peak: int = 0
+
+    async def dispatch_tool_call(
+        self,
+        tool_id: str,
+        arguments: dict[str, Any],
+        context: dict[str, Any],
+    ) -> ToolCallResult:
+        """Dispatch after a short sleep, tracking overlapping calls."""
+        import asyncio
+
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self._delay)
+            return await super().dispatch_tool_call(tool_id, arguments, context)
+        finally:
+            self.active -= 1
+
+
+def _bind_tools(registry: MockToolRegistry, tool_ids: list[str]) -> None:
+    registry.set_approved_tools(
+        [
+            ToolBinding(
+                tool_id=tool_id,
+                display_name=tool_id,
+                description=tool_id,
+                input_schema={"type": "object"},
+            )
+            for tool_id in tool_ids
+        ]
+    )
+
+
+def _patch_catalog(monkeypatch, catalog: list[dict[str, Any]]) -> None:
+    from core.tools.tool_graph import ToolGraph
+
+    async def get_l_tool_catalog() -> list[dict[str, Any]]:
+        return catalog
+
+    monkeypatch.setattr(ToolGraph, "get_l_tool_catalog", staticmethod(get_l_tool_catalog))
+
+
+def _multi_tool_executor(
+    registry: MockToolRegistry,
+    mock_aios: MockAIOSRuntime,
+    mock_substrate: MockSubstrateService,
+    mock_agent_registry: MockAgentRegistry,
+    max_parallel_tool_calls: Optional[int] = None,
+) -> AgentExecutorService:
+    return AgentExecutorService(
+        aios_runtime=mock_aios,
+        tool_registry=registry,
+        substrate_service=mock_substrate,
+        agent_registry=mock_agent_registry,
+        default_agent_id="l9-standard-v1",
+        max_iterations=10,
+        max_parallel_tool_calls=max_parallel_tool_calls,
+    )
+
+
+@pytest.mark.asyncio
+async def test_read_only_tool_calls_dispatched_concurrently(
+    monkeypatch,
+    mock_aios: MockAIOSRuntime,
+    mock_substrate: MockSubstrateService,
+    mock_agent_registry: MockAgentRegistry,
+    sample_task: AgentTask,
+) -> None:
+    """
+    Contract: Independent read-only calls from one turn run concurrently.
+
+    Verifies:
+    - All requested calls are dispatched before the next AIOS call
+    - Calls overlap (peak concurrency > 1)
+    - Tool results are appended in request order
+    """
+    tool_ids = ["search_web", "memory_search", "lookup_docs"]
+    registry = ConcurrencyTrackingToolRegistry()
+    _bind_tools(registry, tool_ids)
+    _patch_catalog(monkeypatch, [{"name": t, "risk_level": "low", "read_only": True} for t in tool_ids])
+    executor = _multi_tool_executor(
+        registry, mock_aios, mock_substrate, mock_agent_registry
+    )
+
+    calls = [
+        ToolCallRequest(tool_id=t, arguments={"q": t}, task_id=sample_task.id, iteration=1)
+        for t in tool_ids
+    ]
+    mock_aios.set_responses(
+        [
+            AIOSResult.tool_requests(calls, tokens_used=30),
+            AIOSResult.response("Done", tokens_used=10),
+        ]
+    )
+
+    result = await executor.start_agent_task(sample_task)
+
+    assert isinstance(result, ExecutionResult)
+    assert result.status == "completed"
+    assert mock_aios.call_count == 2
+    assert registry.dispatch_count == 3
+    assert registry.peak == 3
+
+    messages = mock_aios.get_context_at(1)["messages"]
+    assistant = [m for m in messages if m.get("tool_calls")]
+    assert len(assistant) == 1
+    assert [tc["id"] for tc in assistant[0]["tool_calls"]] == [
+        str(c.call_id) for c in calls
+    ]
+    tool_messages = [m for m in messages if m.get("role") == "tool"]
+    assert [m["tool_call_id"] for m in tool_messages] == [str(c.call_id) for c in calls]
+
+
+@pytest.mark.asyncio
+async def test_side_effecting_tool_call_runs_alone(
+    monkeypatch,
+    mock_aios: MockAIOSRuntime,
+    mock_substrate: MockSubstrateService,
+    mock_agent_registry: MockAgentRegistry,
+    sample_task: AgentTask,
+) -> None:
+    """
+    Contract: Destructive or unknown tools are never dispatched concurrently.
+
+    Verifies:
+    - Dispatch order matches request order around the destructive call
+    - Peak concurrency stays at 1
+    """
+    registry = ConcurrencyTrackingToolRegistry()
+    _bind_tools(registry, ["search_web", "file_write", "unknown_tool"])
+    _patch_catalog(
+        monkeypatch,
+        [
+            {"name": "search_web", "risk_level": "low", "read_only": True},
+            {"name": "file_write", "risk_level": "medium", "is_destructive": True},
+        ],
+    )
+    executor = _multi_tool_executor(
+        registry, mock_aios, mock_substrate, mock_agent_registry
+    )
+
+    calls = [
+        ToolCallRequest(tool_id=t, task_id=sample_task.id, iteration=1)
+        for t in ["search_web", "file_write", "unknown_tool"]
+    ]
+    mock_aios.set_responses(
+        [
+            AIOSResult.tool_requests(calls, tokens_used=30),
+            AIOSResult.response("Done", tokens_used=10),
+        ]
+    )
+
+    await executor.start_agent_task(sample_task)
+
+    assert [c["tool_id"] for c in registry.dispatch_calls] == [
+        "search_web",
+        "file_write",
+        "unknown_tool",
+    ]
+    assert registry.peak == 1
+
+
+@pytest.mark.asyncio
+async def test_non_destructive_tool_without_read_only_flag_runs_alone(
+    monkeypatch,
+    mock_aios: MockAIOSRuntime,
+    mock_substrate: MockSubstrateService,
+    mock_agent_registry: MockAgentRegistry,
+    sample_task: AgentTask,
+) -> None:
+    """
+    Contract: Only tools marked read_only are dispatched concurrently.
+
+    mcp_call_tool is not destructive itself but may call tools that are.
+    """
+    tool_ids = ["mcp_call_tool", "neo4j_query", "memory_search"]
+    registry = ConcurrencyTrackingToolRegistry()
+    _bind_tools(registry, tool_ids)
+    _patch_catalog(
+        monkeypatch,
+        [
+            {"name": "mcp_call_tool", "risk_level": "medium", "is_destructive": False},
+            {"name": "neo4j_query", "risk_level": "low", "is_destructive": False},
+            {"name": "memory_search", "risk_level": "low", "read_only": True},
+        ],
+    )
+    executor = _multi_tool_executor(
+        registry, mock_aios, mock_substrate, mock_agent_registry
+    )
+
+    calls = [
+        ToolCallRequest(tool_id=t, task_id=sample_task.id, iteration=1)
+        for t in tool_ids
+    ]
+    mock_aios.set_responses(
+        [
+            AIOSResult.tool_requests(calls, tokens_used=30),
+            AIOSResult.response("Done", tokens_used=10),
+        ]
+    )
+
+    await executor.start_agent_task(sample_task)
+
+    assert [c["tool_id"] for c in registry.dispatch_calls] == tool_ids
+    assert registry.peak == 1
+
+
+@pytest.mark.asyncio
+async def test_parallel_tool_calls_respect_per_agent_cap(
+    monkeypatch,
+    mock_aios: MockAIOSRuntime,
+    mock_substrate: MockSubstrateService,
+    mock_agent_registry: MockAgentRegistry,
+    sample_task: AgentTask,
+) -> None:
+    """
+    Contract: max_parallel_tool_calls bounds concurrent dispatches per agent.
+    """
+    registry = ConcurrencyTrackingToolRegistry()
+    _bind_tools(registry, ["search_web"])
+    _patch_catalog(
+        monkeypatch, [{"name": "search_web", "risk_level": "low", "read_only": True}]
+    )
+    executor = _multi_tool_executor(
+        registry,
+        mock_aios,
+        mock_substrate,
+        mock_agent_registry,
+        max_parallel_tool_calls=2,
+    )
+
+    calls = [
+        ToolCallRequest(
+            tool_id="search_web", arguments={"q": i}, task_id=sample_task.id, iteration=1
+        )
+        for i in range(5)
+    ]
+    mock_aios.set_responses(
+        [
+            AIOSResult.tool_requests(calls, tokens_used=30),
+            AIOSResult.response("Done", tokens_used=10),
+        ]
+    )
+
+    result = await executor.start_agent_task(sample_task)
+
+    assert result.status == "completed"
+    assert registry.dispatch_count == 5
+    assert registry.peak == 2
+    assert len(result.tool_calls or []) == 5
+
+
+# =============================================================================
+# Test: Streamed reasoning is forwarded to the event sink
+# =============================================================================
+
+
+class StreamingAIOSRuntime(MockAIOSRuntime):
+    """Mock runtime that streams its response word by word."""
+
+    async def stream_reasoning(self, context: dict[str, Any]):
+        from core.aios.streaming import ReasoningDelta, ReasoningDeltaType
+
+        result = await self.execute_reasoning(context)
+        for i, word in enumerate((result.content or "").split(" ")):
+            yield ReasoningDelta(
+                type=ReasoningDeltaType.TEXT, text=word if i == 0 else f" {word}"
+            )
+        yield ReasoningDelta(type=ReasoningDeltaType.DONE, result=result)
+
+
+@pytest.mark.asyncio
+async def test_reasoning_deltas_forwarded_to_event_sink(
+    mock_tool_registry: MockToolRegistry,
+    mock_substrate: MockSubstrateService,
+    mock_agent_registry: MockAgentRegistry,
+    sample_task: AgentTask,
+) -> None:
+    """
+    Contract: With an event sink, token deltas are forwarded as
+    REASONING_DELTA events and the final result is unchanged.
+    """
+    from core.schemas.ws_event_stream import EventType
+
+    aios = StreamingAIOSRuntime()
+    aios.set_responses([AIOSResult.response("Streaming works fine", tokens_used=12)])
+    executor = AgentExecutorService(
+        aios_runtime=aios,
+        tool_registry=mock_tool_registry,
+        substrate_service=mock_substrate,
+        agent_registry=mock_agent_registry,
+        default_agent_id="l9-standard-v1",
+    )
+    events = []
+
+    async def sink(event) -> None:
+        events.append(event)
+
+    result = await executor.start_agent_task(sample_task, event_sink=sink)
+
+    assert result.status == "completed"
+    assert result.result == "Streaming works fine"
+    assert [e.type for e in events] == [EventType.REASONING_DELTA] * 3
+    assert "".join(e.payload["text"] for e in events) == "Streaming works fine"
+    assert all(e.payload["task_id"] == str(sample_task.id) for e in events)
+
+
+@pytest.mark.asyncio
+async def test_failing_event_sink_does_not_fail_task(
+    mock_tool_registry: MockToolRegistry,
+    mock_substrate: MockSubstrateService,
+    mock_agent_registry: MockAgentRegistry,
+    sample_task: AgentTask,
+) -> None:
+    """Contract: A broken sink (e.g. disconnected client) stops forwarding only."""
+    aios = StreamingAIOSRuntime()
+    aios.set_responses([AIOSResult.response("Still answered", tokens_used=5)])
+    executor = AgentExecutorService(
+        aios_runtime=aios,
+        tool_registry=mock_tool_registry,
+        substrate_service=mock_substrate,
+        agent_registry=mock_agent_registry,
+        default_agent_id="l9-standard-v1",
+    )
+    calls = 0
+
+    async def sink(event) -> None:
+        nonlocal calls
+        calls += 1
+        raise ConnectionError("client went away")
+
+    result = await executor.start_agent_task(sample_task, event_sink=sink)
+
+    assert result.status == "completed"
+    assert result.result == "Still answered"
+    assert calls == 1
+
+
 # =============================================================================
 # Public API
 # =============================================================================
@@ -0,0 +1,208 @@
+"""
+Trace Sink Tests
+================
+
+Tests for batched, sampled trace emission used by
+AgentExecutorService._emit_packet.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from core.agents.trace_sink import (
+    TraceClass,
+    TraceSamplingLevel,
+    TraceSink,
+    classify_packet,
+)
+
+
+class BulkSubstrate:
+    """Substrate exposing the bulk write API."""
+
+    def __init__(self, delay: float = 0.0):
+        self.batches: list[list] = []
+        self.single_writes = 0
+        self._delay = delay
+
+    async def write_packet(self, packet):
+        self.single_writes += 1
+
+    async def write_packets(self, packets):
+        await asyncio.sleep(self._delay)
+        self.batches.append(list(packets))
+        return [None] * len(packets)
+
+
+class SingleSubstrate:
+    """Substrate with only write_packet."""
+
+    def __init__(self):
+        self.packets: list = []
+
+    async def write_packet(self, packet):
+        self.packets.append(packet)
+
+
+def _trace(task_id: str, iteration: int, agent_id: str = "L") -> dict:
+    return {
+        "event": "iteration",
+        "task_id": task_id,
+        "agent_id": agent_id,
+        "iteration": iteration,
+    }
+
+
+@pytest.mark.asyncio
+async def test_emit_buffers_and_flushes_in_one_bulk_call():
+    substrate = BulkSubstrate()
+    sink = TraceSink(substrate, flush_interval=60)
+    thread_id = uuid4()
+
+    for i in range(5):
+        assert sink.emit("agent.executor.trace", _trace("t1", i), thread_id)
+    assert substrate.batches == []
+
+    assert await sink.flush("t1") == 5
+    assert len(substrate.batches) == 1
+    batch = substrate.batches[0]
+    assert [p.payload["iteration"] for p in batch] == [0, 1, 2, 3, 4]
+    assert batch[0].metadata.agent == "L"
+    assert batch[0].timestamp <= batch[-1].timestamp
+    assert substrate.single_writes == 0
+    await sink.close()
+
+
+@pytest.mark.asyncio
+async def test_flush_by_task_leaves_other_tasks_buffered():
+    substrate = SingleSubstrate()
+    sink = TraceSink(substrate, flush_interval=60)
+
+    sink.emit("agent.executor.trace", _trace("t1", 1), uuid4())
+    sink.emit("agent.executor.trace", _trace("t2", 1), uuid4())
+
+    assert await sink.flush("t1") == 1
+    assert sink.get_stats()["buffered"] == 1
+    assert await sink.flush() == 1
+    assert len(substrate.packets) == 2
+
+
+@pytest.mark.asyncio
+async def test_background_flusher_writes_without_explicit_flush():
+    substrate = BulkSubstrate()
+    sink = TraceSink(substrate, flush_interval=0.01)
+
+    sink.emit("agent.executor.trace", _trace("t1", 1), uuid4())
+    await asyncio.sleep(0.05)
+
+    assert sum(len(b) for b in substrate.batches) == 1
+    await sink.close()
+
+
+@pytest.mark.asyncio
+async def test_flush_waits_for_in_flight_background_write():
+    substrate = BulkSubstrate(delay=0.05)
+    sink = TraceSink(substrate, flush_interval=0.01)
+
+    sink.emit("agent.executor.trace", _trace("t1", 1), uuid4())
+    await asyncio.sleep(0.02)  # background flusher is now mid-write
+    assert substrate.batches == []
+
+    await sink.flush("t1")
+    assert sum(len(b) for b in substrate.batches) == 1
+    await sink.close()
+
+
+@pytest.mark.asyncio
+async def test_executor_close_drains_buffers_and_stops_flusher():
+    from core.agents.executor import AgentExecutorService
+
+    substrate = BulkSubstrate()
+    sink = TraceSink(substrate, flush_interval=60)
+    executor = AgentExecutorService(
+        aios_runtime=None,
+        tool_registry=None,
+        substrate_service=substrate,
+        agent_registry=None,
+        trace_sink=sink,
+    )
+    sink.emit("agent.executor.trace", _trace("t1", 1), uuid4())
+    flusher = sink._flusher
+
+    await executor.close()
+
+    assert sum(len(b) for b in substrate.batches) == 1
+    assert flusher.done()
+    assert sink.emit("agent.executor.trace", _trace("t1", 2), uuid4())
+    assert sink._flusher is None
+
+
+@pytest.mark.asyncio
+async def test_sampling_levels():
+    substrate = BulkSubstrate()
+    sink = TraceSink(substrate, flush_interval=60)
+    sink.set_agent_sampling("quiet", TraceSamplingLevel.ERRORS_ONLY)
+    sink.set_agent_sampling("brief", "summary_only")
+    thread_id = uuid4()
+
+    def emit_all(agent_id: str) -> None:
+        sink.emit("agent.executor.trace", _trace(agent_id, 1, agent_id), thread_id)
+        sink.emit(
+            "agent.executor.result",
+            {"task_id": agent_id, "agent_id": agent_id, "status": "completed"},
+            thread_id,
+        )
+        sink.emit(
+            "agent.executor.escalation",
+            {"task_id": agent_id, "agent_id": agent_id},
+            thread_id,
+        )
+
+    for agent_id in ("L", "brief", "quiet"):
+        emit_all(agent_id)
+    await sink.flush()
+
+    written = [p.packet_type for p in substrate.batches[0]]
+    by_agent = {
+        agent_id: [p.packet_type for p in substrate.batches[0] if p.metadata.agent == agent_id]
+        for agent_id in ("L", "brief", "quiet")
+    }
+    assert len(written) == 6
+    assert len(by_agent["L"]) == 3
+    assert by_agent["brief"] == ["agent.executor.result", "agent.executor.escalation"]
+    assert by_agent["quiet"] == ["agent.executor.escalation"]
+    assert sink.pop_task_stats("quiet")["sampled_out"] == 2
+
+
+def test_classify_packet():
+    assert classify_packet("agent.executor.trace", {"event": "iteration"}) == TraceClass.DETAIL
+    assert classify_packet("agent.executor.trace", {"event": "start"}) == TraceClass.SUMMARY
+    assert classify_packet("kernel.evolution.plan", {}) == TraceClass.SUMMARY
+    assert (
+        classify_packet("agent.executor.result", {"status": "failed"})
+        == TraceClass.CRITICAL
+    )
+    assert (
+        classify_packet("kernel.evolution.plan", {"requires_igor_approval": True})
+        == TraceClass.CRITICAL
+    )
+
+
+@pytest.mark.asyncio
+async def test_ring_buffer_drops_oldest_and_reports_savings():
+    substrate = BulkSubstrate(delay=0.01)
+    sink = TraceSink(substrate, buffer_size=3, flush_interval=60)
+
+    for i in range(5):
+        sink.emit("agent.executor.trace", _trace("t1", i), uuid4())
+    await sink.flush("t1")
+
+    assert [p.payload["iteration"] for p in substrate.batches[0]] == [2, 3, 4]
+    stats = sink.pop_task_stats("t1")
+    assert stats["dropped"] == 2
+    assert stats["estimated_ms_saved"] > 0
+    await sink.close()
@@ -78,3 +78,47 @@ async def test_execute_reasoning_mock():
         assert isinstance(result, AIOSResult)
         assert result.result_type == "response"
         assert result.content == "Test response"
+
+
+# =============================================================================
+# Test: Every tool call in a turn is returned
+# =============================================================================
+
+
+@pytest.mark.asyncio
+async def test_execute_reasoning_returns_all_tool_calls():
+    """
+    Contract: AIOSResult carries every tool call the model requested, in order.
+    """
+    with patch("core.aios.runtime.AsyncOpenAI") as mock_openai_class:
+        mock_client = AsyncMock()
+        mock_openai_class.return_value = mock_client
+
+        def _tool_call(name: str, arguments: str) -> MagicMock:
+            call = MagicMock()
+            call.function.name = name
+            call.function.arguments = arguments
+            return call
+
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].finish_reason = "tool_calls"
+        mock_response.choices[0].message.content = None
+        mock_response.choices[0].message.tool_calls = [
+            _tool_call("search_web", '{"query": "a"}'),
+            _tool_call("memory_search", '{"query": "b"}'),
+        ]
+        mock_response.usage.total_tokens = 50
+
+        mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
+
+        runtime = AIOSRuntime(api_key="test-key", model="gpt-4o")
+        result = await runtime.execute_reasoning(
+            {"messages": [{"role": "user", "content": "Hello"}], "tools": []}
+        )
+
+        assert result.result_type == "tool_call"
+        assert [c.tool_id for c in result.tool_calls] == ["search_web", "memory_search"]
+        assert result.tool_call == result.tool_calls[0]
+        assert result.tool_calls[1].arguments == {"query": "b"}
+        assert len({c.call_id for c in result.tool_calls}) == 2
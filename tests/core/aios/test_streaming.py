@@ -0,0 +1,113 @@
+"""
+Streaming Reasoning Tests
+=========================
+
+Tests for AIOSRuntime.stream_reasoning and the streaming primitives.
+Uses the local FakeStreamingChatClient - no external services required.
+"""
+
+import pytest
+
+from core.agents.schemas import AIOSResultType
+from core.aios.response_cache import CacheMode, LLMResponseCache
+from core.aios.runtime import AIOSRuntime
+from core.aios.streaming import DeltaCoalescer, ReasoningDeltaType
+from tests.mocks.llm_mocks import FakeStreamingChatClient
+
+
+def _context():
+    return {
+        "system_prompt": "You are L.",
+        "messages": [{"role": "user", "content": "Hello"}],
+        "tools": [],
+        "metadata": {"temperature": 0.0, "max_tokens": 500},
+    }
+
+
+def _runtime(client, cache=None):
+    runtime = AIOSRuntime(api_key="test-key", model="gpt-4o", response_cache=cache)
+    runtime._client = client
+    return runtime
+
+
+async def _collect(runtime):
+    return [delta async for delta in runtime.stream_reasoning(_context())]
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_text_deltas_then_result():
+    client = FakeStreamingChatClient(text="Hello there from L", total_tokens=37)
+
+    deltas = await _collect(_runtime(client))
+
+    texts = [d.text for d in deltas if d.type == ReasoningDeltaType.TEXT]
+    assert texts == ["Hello", " there", " from", " L"]
+    assert deltas[-1].type == ReasoningDeltaType.DONE
+    result = deltas[-1].result
+    assert result.result_type == AIOSResultType.RESPONSE
+    assert result.content == "Hello there from L"
+    assert result.tokens_used == 37
+    assert client.requests[0]["stream"] is True
+    assert client.requests[0]["stream_options"] == {"include_usage": True}
+
+
+@pytest.mark.asyncio
+async def test_stream_assembles_partial_tool_calls():
+    client = FakeStreamingChatClient(
+        tool_calls=[
+            {"name": "memory_search", "arguments": {"query": "ledger entries"}},
+            {"name": "gmp_run", "arguments": {"gmp_id": "GMP-7"}},
+        ],
+        argument_fragment_size=5,
+    )
+
+    deltas = await _collect(_runtime(client))
+
+    fragments = [d for d in deltas if d.type == ReasoningDeltaType.TOOL_CALL]
+    assert {d.tool_index for d in fragments} == {0, 1}
+    assert len(fragments) > 2
+    result = deltas[-1].result
+    assert result.result_type == AIOSResultType.TOOL_CALL
+    assert [r.tool_id for r in result.tool_calls] == ["memory_search", "gmp_run"]
+    assert result.tool_calls[0].arguments == {"query": "ledger entries"}
+    assert result.tool_calls[1].arguments == {"gmp_id": "GMP-7"}
+
+
+@pytest.mark.asyncio
+async def test_stream_served_from_cache_after_first_call():
+    cache = LLMResponseCache(mode=CacheMode.READ_WRITE)
+    client = FakeStreamingChatClient(text="Cached answer", total_tokens=50)
+    runtime = _runtime(client, cache)
+
+    await _collect(runtime)
+    deltas = await _collect(runtime)
+
+    assert len(client.requests) == 1
+    assert [d.type for d in deltas] == [ReasoningDeltaType.TEXT, ReasoningDeltaType.DONE]
+    assert deltas[0].text == "Cached answer"
+    assert deltas[-1].result.tokens_used == 0
+    assert cache.get_cache_stats()["tokens_saved"] == 50
+
+
+@pytest.mark.asyncio
+async def test_stream_error_ends_with_error_result():
+    class FailingClient(FakeStreamingChatClient):
+        async def _create(self, **kwargs):
+            raise RuntimeError("connection reset")
+
+    deltas = await _collect(_runtime(FailingClient()))
+
+    assert len(deltas) == 1
+    assert deltas[0].result.result_type == AIOSResultType.ERROR
+    assert "connection reset" in deltas[0].result.error
+
+
+def test_delta_coalescer_releases_first_delta_then_batches():
+    coalescer = DeltaCoalescer(min_interval=60, max_chars=10)
+
+    assert coalescer.add("Hi") == "Hi"
+    assert coalescer.add(" the") is None
+    assert coalescer.add("re") is None
+    assert coalescer.add(" friend") == " there friend"
+    assert coalescer.add("!") is None
+    assert coalescer.drain() == "!"
@@ -665,6 +665,138 @@ async def test_disabled_policies_are_skipped(temp_policy_dir: Path) -> None:
     assert result.policy_id is None
 
 
+# =============================================================================
+# Test: Compiled index matches linear first-match-wins evaluation
+# =============================================================================
+
+
+def _linear_decision(engine: GovernanceEngineService, subject, action, resource, context):
+    """Reference implementation: walk all policies in priority order."""
+    for policy in engine.policies:
+        if policy.matches(subject, action, resource, context):
+            return policy.id, policy.effect == PolicyEffect.ALLOW
+    return None, False
+
+
+def test_index_matches_linear_evaluation(temp_policy_dir: Path) -> None:
+    """
+    Contract: Indexed evaluation returns the same decision as a linear scan.
+
+    Covers exact, prefix, suffix and match-all patterns on subjects,
+    actions and resources, plus overlapping priorities.
+    """
+    policies = [
+        {"id": "deny-shell", "name": "Deny shell", "effect": "deny", "priority": 90,
+         "subjects": ["*"], "actions": ["tool.*"], "resources": ["shell_*"]},
+        {"id": "allow-l-tools", "name": "Allow L", "effect": "allow", "priority": 50,
+         "subjects": ["L", "l-cto"], "actions": ["tool.execute"], "resources": ["*"]},
+        {"id": "allow-read", "name": "Allow reads", "effect": "allow", "priority": 40,
+         "subjects": ["agent:*"], "actions": ["*.read"], "resources": ["*"]},
+        {"id": "deny-all-write", "name": "Deny writes", "effect": "deny", "priority": 30,
+         "subjects": [], "actions": ["*write*"], "resources": ["*_db"]},
+        {"id": "allow-fallback", "name": "Fallback", "effect": "allow", "priority": 0,
+         "subjects": ["*"], "actions": ["*"], "resources": ["public"]},
+    ]
+    create_policy_file(temp_policy_dir, "policies.yaml", policies)
+    engine = GovernanceEngineService(policy_dir=str(temp_policy_dir))
+
+    subjects = ["L", "l-cto", "agent:x", "user:1", "agent:"]
+    actions = ["tool.execute", "file.read", "db.write", "write_all", "tool.", "x"]
+    resources = ["shell_exec", "memory_search", "main_db", "public", "", "shell_"]
+
+    for subject in subjects:
+        for action in actions:
+            for resource in resources:
+                expected_id, expected_allowed = _linear_decision(
+                    engine, subject, action, resource, {}
+                )
+                result = engine.evaluate_sync(
+                    EvaluationRequest(subject=subject, action=action, resource=resource)
+                )
+                assert result.policy_id == expected_id, (subject, action, resource)
+                assert result.allowed is expected_allowed
+                assert engine.is_allowed(subject, action, resource) is expected_allowed
+
+
+def test_decision_cache_skips_conditional_policies(
+    temp_policy_dir: Path, conditional_policy: dict, simple_allow_policy: dict
+) -> None:
+    """
+    Contract: Only context-free decisions are memoized.
+
+    Verifies:
+    - Repeated context-free checks hit the cache
+    - Decisions involving conditional policies are re-evaluated per context
+    """
+    create_policy_file(
+        temp_policy_dir, "policies.yaml", [conditional_policy, simple_allow_policy]
+    )
+    engine = GovernanceEngineService(policy_dir=str(temp_policy_dir))
+
+    for _ in range(3):
+        assert engine.is_allowed("test-agent", "test.action", "test-resource")
+    stats = engine.get_cache_stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 2
+
+    assert engine.is_allowed("x", "conditional.action", "r", {"hour": 12}) is True
+    assert engine.is_allowed("x", "conditional.action", "r", {"hour": 22}) is False
+    assert engine.is_allowed("x", "conditional.action", "r", {"hour": 12}) is True
+    assert engine.get_cache_stats()["size"] == 1
+
+
+def test_reload_policies_invalidates_decision_cache(
+    tmp_path: Path, simple_allow_policy: dict
+) -> None:
+    """
+    Contract: reload_policies rebuilds the index and drops cached decisions.
+    """
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+    create_policy_file(first, "policies.yaml", [simple_allow_policy])
+    create_policy_file(second, "policies.yaml", [{**simple_allow_policy, "effect": "deny"}])
+
+    engine = GovernanceEngineService(policy_dir=str(first))
+    assert engine.is_allowed("test-agent", "test.action", "test-resource") is True
+
+    engine.reload_policies(str(second))
+
+    assert engine.get_cache_stats()["size"] == 0
+    assert engine.is_allowed("test-agent", "test.action", "test-resource") is False
+
+
+def test_evaluate_many(temp_policy_dir: Path) -> None:
+    """
+    Contract: evaluate_many returns one decision per resource.
+    """
+    policies = [
+        {"id": "deny-shell", "name": "Deny shell", "effect": "deny", "priority": 90,
+         "subjects": ["L"], "actions": ["tool.execute"], "resources": ["shell_exec"]},
+        {"id": "allow-l", "name": "Allow L", "effect": "allow", "priority": 50,
+         "subjects": ["L"], "actions": ["tool.execute"], "resources": ["*"]},
+    ]
+    create_policy_file(temp_policy_dir, "policies.yaml", policies)
+    engine = GovernanceEngineService(policy_dir=str(temp_policy_dir))
+
+    decisions = engine.evaluate_many(
+        subject="L",
+        action="tool.execute",
+        resources=["memory_search", "shell_exec", "web_search"],
+        context={"principal_id": "igor"},
+    )
+
+    assert decisions == {
+        "memory_search": True,
+        "shell_exec": False,
+        "web_search": True,
+    }
+    assert engine.evaluate_many("other", "tool.execute", ["memory_search"]) == {
+        "memory_search": False
+    }
+
+
 # =============================================================================
 # Public API
 # =============================================================================
@@ -0,0 +1,261 @@
+"""
+Span Export Pipeline Tests
+==========================
+
+Tests for the background batching exporter (core.observability.pipeline)
+and the batch-oriented file and substrate exporters.
+"""
+
+import asyncio
+import threading
+import time
+from datetime import datetime
+from typing import List
+
+import pytest
+
+from core.observability.config import ObservabilitySettings
+from core.observability.exporters import AsyncSpanExporter, JSONFileExporter, SubstrateExporter
+from core.observability.models import Span, SpanStatus
+from core.observability.pipeline import SpanExportPipeline
+from core.observability.service import ObservabilityService
+
+
+def _span(i: int = 0) -> Span:
+    return Span(
+        trace_id="t" * 32,
+        span_id=f"{i:016d}",
+        name="tool.run",
+        start_time=datetime.utcnow(),
+        duration_ms=1.0,
+        status=SpanStatus.OK,
+    )
+
+
+class RecordingAsyncExporter(AsyncSpanExporter):
+    def __init__(self):
+        self.batches: List[int] = []
+        self.threads: set = set()
+        self.flushes = 0
+
+    async def export_async(self, spans):
+        self.threads.add(threading.get_ident())
+        self.batches.append(len(spans))
+
+    async def flush(self):
+        self.flushes += 1
+
+
+class FakeBulkSubstrate:
+    def __init__(self):
+        self.bulk_calls: List[int] = []
+
+    async def write_packets(self, packets):
+        self.bulk_calls.append(len(packets))
+        return [type("Result", (), {"status": "ok"})() for _ in packets]
+
+    async def write_packet(self, packet):
+        raise AssertionError("per-span write_packet should not be used")
+
+
+def _lines(path) -> int:
+    with open(path) as f:
+        return sum(1 for _ in f)
+
+
+@pytest.mark.asyncio
+async def test_file_exporter_receives_batches_and_flushes_on_shutdown(tmp_path):
+    path = tmp_path / "spans.jsonl"
+    exporter = JSONFileExporter(str(path), fsync_interval=60)
+    pipeline = SpanExportPipeline([exporter], batch_size=100, schedule_delay=60)
+    pipeline.start()
+
+    for i in range(1000):
+        pipeline.submit(_span(i))
+    await pipeline.shutdown()
+
+    assert _lines(path) == 1000
+    assert pipeline.stats.exported == 1000
+    assert pipeline.stats.batches >= 10
+    assert exporter._file is None
+
+
+@pytest.mark.asyncio
+async def test_full_queue_drops_and_counts():
+    exporter = RecordingAsyncExporter()
+    pipeline = SpanExportPipeline(
+        [exporter], max_queue_size=10, loop=asyncio.get_running_loop()
+    )
+
+    accepted = [pipeline.submit(_span(i)) for i in range(15)]
+    await pipeline.shutdown()
+
+    assert accepted.count(False) == 5
+    assert pipeline.stats.dropped == 5
+    assert sum(exporter.batches) == 10
+
+
+class FailingExporter:
+    def __init__(self, fail_batches: int):
+        self.fail_batches = fail_batches
+        self.spans = 0
+
+    def export(self, spans):
+        if self.fail_batches:
+            self.fail_batches -= 1
+            raise IOError("disk full")
+        self.spans += len(spans)
+
+
+def test_failed_exports_are_counted_separately():
+    exporter = FailingExporter(fail_batches=1)
+    pipeline = SpanExportPipeline([exporter], batch_size=10, schedule_delay=0.01)
+    pipeline.start()
+
+    for i in range(30):
+        pipeline.submit(_span(i))
+    assert pipeline.force_flush(timeout=5)
+
+    stats = pipeline.stats
+    assert stats.submitted == 30
+    assert stats.exported == exporter.spans == 20
+    assert stats.failed == 10
+    assert stats.export_errors == 1
+    asyncio.run(pipeline.shutdown())
+
+
+def test_force_flush_waits_for_in_flight_batch_despite_drops():
+    exported: List[int] = []
+
+    class SlowExporter:
+        def export(self, spans):
+            time.sleep(0.05)
+            exported.append(len(spans))
+
+    pipeline = SpanExportPipeline(
+        [SlowExporter()], max_queue_size=5, batch_size=5, schedule_delay=60
+    )
+    pipeline.start()
+    for i in range(5):
+        pipeline.submit(_span(i))
+    time.sleep(0.01)  # first batch is now being exported
+    accepted = [pipeline.submit(_span(i)) for i in range(5, 15)]
+
+    assert pipeline.force_flush(timeout=5)
+    assert accepted.count(False) == 5
+    assert exported == [5, 5]
+    assert pipeline.stats.exported == 10
+    asyncio.run(pipeline.shutdown())
+
+
+@pytest.mark.asyncio
+async def test_async_exporter_runs_on_loop_with_one_call_per_batch():
+    exporter = RecordingAsyncExporter()
+    pipeline = SpanExportPipeline(
+        [exporter], batch_size=256, schedule_delay=0.01, loop=asyncio.get_running_loop()
+    )
+    pipeline.start()
+
+    for i in range(1000):
+        pipeline.submit(_span(i))
+    await asyncio.sleep(0.2)
+    await pipeline.shutdown()
+
+    assert sum(exporter.batches) == 1000
+    assert max(exporter.batches) <= 256
+    assert len(exporter.batches) < 20
+    assert exporter.threads == {threading.get_ident()}
+
+
+@pytest.mark.asyncio
+async def test_substrate_exporter_makes_one_bulk_call_per_batch():
+    pytest.importorskip("memory.substrate_models")
+    substrate = FakeBulkSubstrate()
+    exporter = SubstrateExporter(substrate, batch_size=1000)
+
+    await exporter.export_async([_span(i) for i in range(250)])
+    await exporter.flush()
+
+    assert substrate.bulk_calls == [250]
+    assert exporter.written == 250 and exporter.failed == 0
+
+
+def test_unwritable_span_file_counts_as_failed(tmp_path):
+    # A directory can't be opened for append, even as root
+    exporter = JSONFileExporter(str(tmp_path), fsync_interval=60)
+    pipeline = SpanExportPipeline([exporter], batch_size=10, schedule_delay=0.01)
+    pipeline.start()
+
+    for i in range(20):
+        pipeline.submit(_span(i))
+    assert pipeline.force_flush(timeout=5)
+
+    stats = pipeline.stats
+    assert stats.exported == 0
+    assert stats.failed == 20
+    assert stats.export_errors == stats.batches == 2
+    asyncio.run(pipeline.shutdown())
+
+
+class BrokenBulkSubstrate:
+    async def write_packets(self, packets):
+        raise ConnectionError("substrate down")
+
+
+class RejectingBulkSubstrate:
+    async def write_packets(self, packets):
+        statuses = ["ok", "error"] * (len(packets) // 2)
+        return [type("Result", (), {"status": status})() for status in statuses]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("substrate", [BrokenBulkSubstrate(), RejectingBulkSubstrate()])
+async def test_substrate_failures_count_as_failed(substrate):
+    pytest.importorskip("memory.substrate_models")
+    exporter = SubstrateExporter(substrate)
+    pipeline = SpanExportPipeline(
+        [exporter], batch_size=10, schedule_delay=0.01, loop=asyncio.get_running_loop()
+    )
+    pipeline.start()
+
+    for i in range(20):
+        pipeline.submit(_span(i))
+    await pipeline.shutdown()
+
+    stats = pipeline.stats
+    assert stats.exported == 0
+    assert stats.failed == 20
+    assert stats.export_errors == 2
+    assert exporter.written + exporter.failed == 20
+
+
+@pytest.mark.asyncio
+async def test_service_exports_through_pipeline(tmp_path):
+    path = tmp_path / "service_spans.jsonl"
+    service = ObservabilityService(
+        config=ObservabilitySettings(
+            exporters=["file"], substrate_enabled=False, file_export_path=str(path)
+        )
+    )
+    await service.initialize_exporters()
+
+    for i in range(300):
+        service.export_span(_span(i))
+    await service.shutdown()
+
+    assert _lines(path) == 300
+    assert service.pipeline is None
+
+
+@pytest.mark.slow
+def test_submit_cost_per_span():
+    pipeline = SpanExportPipeline([], max_queue_size=200_000, batch_size=1_000_000)
+    spans = [_span(i) for i in range(100_000)]
+
+    start = time.perf_counter()
+    for span in spans:
+        pipeline.submit(span)
+    per_span_us = (time.perf_counter() - start) / len(spans) * 1e6
+
+    print(f"\nsubmit: {per_span_us:.3f}us/span")
+    assert per_span_us < 10
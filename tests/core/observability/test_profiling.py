@@ -0,0 +1,111 @@
+"""
+Profiling Tests
+===============
+
+Tests for the sampling profiler, event-loop monitor and per-task profiling
+(core.observability.profiling).
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from core.observability import profiling
+from core.observability.profiling import (
+    EventLoopMonitor,
+    SamplingProfiler,
+    profile_agent_task,
+)
+
+
+def _spin(seconds: float) -> int:
+    end = time.perf_counter() + seconds
+    n = 0
+    while time.perf_counter() < end:
+        n += 1
+    return n
+
+
+def test_sampler_collects_collapsed_stacks_from_threads():
+    profiler = SamplingProfiler(interval=0.001)
+    worker = threading.Thread(target=_spin, args=(0.3,))
+
+    profiler.start()
+    worker.start()
+    worker.join()
+    profiler.stop()
+
+    collapsed = profiler.collapsed()
+    assert profiler.samples > 0
+    assert "_spin (" in collapsed
+    for line in collapsed.splitlines():
+        stack, count = line.rsplit(" ", 1)
+        assert int(count) >= 1 and stack
+    assert any("_spin" in f["function"] for f in profiler.top_functions(5))
+    assert not profiler.running
+
+
+@pytest.mark.asyncio
+async def test_sampler_attributes_loop_samples_to_tasks():
+    profiler = SamplingProfiler(interval=0.001, loop=asyncio.get_running_loop())
+
+    async def busy():
+        _spin(0.2)
+
+    profiler.start()
+    await asyncio.create_task(busy(), name="busy-task")
+    await asyncio.sleep(0.05)
+    profiler.stop()
+
+    cpu = profiler.task_cpu_ms()
+    busy_ms = next(ms for name, ms in cpu.items() if name.startswith("busy-task"))
+    assert busy_ms > 50
+    assert profiler.report()["task_cpu_ms"] == cpu
+
+
+@pytest.mark.asyncio
+async def test_loop_monitor_captures_blocking_call():
+    monitor = EventLoopMonitor(interval=0.01, slow_callback_threshold=0.05)
+    monitor.start()
+    await asyncio.sleep(0.05)
+
+    time.sleep(0.2)  # blocks the loop
+    await asyncio.sleep(0.05)
+    await monitor.stop()
+
+    report = monitor.report()
+    assert report["lag_samples"] > 0
+    assert report["lag_max_ms"] >= 100
+    assert len(report["blocking_events"]) == 1
+    event = report["blocking_events"][0]
+    assert event["blocked_ms"] >= 50
+    assert "test_loop_monitor_captures_blocking_call" in event["stack"]
+
+
+@pytest.mark.asyncio
+async def test_profile_agent_task_separates_wall_and_cpu(tmp_path):
+    async with profile_agent_task("agent-task-1", interval=0.001, output_dir=str(tmp_path)) as profile:
+        _spin(0.1)
+        await asyncio.sleep(0.2)
+
+    assert profile.wall_ms >= 300
+    assert 30 < profile.cpu_ms < 200
+    assert profile.thread_cpu_ms < profile.wall_ms
+    assert "_spin" in profile.collapsed
+    assert (tmp_path / "agent-task-1.collapsed").read_text().strip() == profile.collapsed
+
+
+@pytest.mark.asyncio
+async def test_process_session_start_status_stop():
+    status = profiling.start_profiling(interval=0.001)
+    _spin(0.05)
+    await asyncio.sleep(0.05)
+    stopped = await profiling.stop_profiling()
+
+    assert status["profiler"]["running"] is True
+    assert stopped["profiler"]["running"] is False
+    assert stopped["profiler"]["samples"] > 0
+    assert stopped["event_loop"]["running"] is False
+    assert profiling.get_collapsed_stacks()
@@ -0,0 +1,151 @@
+"""
+Streaming Metrics Tests
+=======================
+
+Tests for the fixed-memory metrics core (core.observability.streaming) and
+the APIs served from it.
+"""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from core.observability.aggregation import MetricsAggregator
+from core.observability.config import ObservabilitySettings
+from core.observability.models import LLMGenerationSpan, Span, SpanStatus
+from core.observability.service import ObservabilityService
+from core.observability.streaming import QuantileSketch, StreamingMetrics, WindowedCounter
+
+
+def _span(name: str, duration_ms: float, status: SpanStatus = SpanStatus.OK, **attributes) -> Span:
+    start = datetime.utcnow()
+    return Span(
+        trace_id="t" * 32,
+        span_id="s" * 16,
+        name=name,
+        start_time=start,
+        end_time=start + timedelta(milliseconds=duration_ms),
+        duration_ms=duration_ms,
+        status=status,
+        attributes=attributes,
+    )
+
+
+def _exact(values, q):
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+def test_sketch_quantiles_within_relative_accuracy():
+    rng = random.Random(7)
+    values = [rng.lognormvariate(3, 1.2) for _ in range(50_000)]
+    sketch = QuantileSketch(relative_accuracy=0.01)
+    for v in values:
+        sketch.add(v)
+
+    for q in (0.5, 0.9, 0.95, 0.99):
+        assert sketch.quantile(q) == pytest.approx(_exact(values, q), rel=0.02)
+    assert sketch.max == max(values)
+    assert sketch.mean == pytest.approx(sum(values) / len(values))
+    assert sketch.bucket_count < 2048
+
+
+def test_sketch_merge_matches_single_sketch():
+    rng = random.Random(11)
+    values = [rng.uniform(1, 5000) for _ in range(10_000)]
+    whole, left, right = QuantileSketch(), QuantileSketch(), QuantileSketch()
+    for i, v in enumerate(values):
+        whole.add(v)
+        (left if i % 2 else right).add(v)
+
+    left.merge(right)
+
+    assert left.count == whole.count
+    for q in (0.5, 0.95, 0.99):
+        assert left.quantile(q) == whole.quantile(q)
+
+
+def test_sketch_bucket_count_is_bounded():
+    sketch = QuantileSketch(max_buckets=64)
+    for exponent in range(-20, 300):
+        sketch.add(1.1 ** exponent)
+
+    assert sketch.bucket_count <= 64
+    assert sketch.quantile(0.99) == pytest.approx(1.1 ** 295, rel=0.02)
+
+
+def test_windowed_counter_expires_old_buckets():
+    counter = WindowedCounter(window_sec=10, buckets=10)
+    counter.add(5, now=100.0)
+    counter.add(3, now=105.0)
+
+    assert counter.total(now=105.5) == 8
+    assert counter.total(now=112.0) == 3
+    assert counter.total(now=200.0) == 0
+    assert counter.rate(now=105.5) == pytest.approx(0.8)
+
+
+def test_streaming_metrics_keeps_bounded_recent_spans_and_series():
+    metrics = StreamingMetrics(recent_capacity=100, max_series=5)
+    for i in range(1000):
+        metrics.record(_span(f"tool.t{i % 20}", i + 1, SpanStatus.ERROR if i % 10 == 0 else SpanStatus.OK))
+
+    sre = metrics.sre_metrics()
+    assert len(metrics.recent) == 100
+    assert len(metrics.series) <= 6
+    assert sre["span_count"] == 1000
+    assert sre["error_count"] == 100
+    assert sre["error_rate"] == pytest.approx(0.1)
+    assert sre["max_latency_ms"] == 1000
+    assert sre["p50_latency_ms"] == pytest.approx(500, rel=0.02)
+    assert sre["spans_per_sec"] > 0
+
+
+def test_aggregator_list_api_served_from_sketches():
+    spans = [_span("agent.L.task", d) for d in range(1, 101)]
+    spans.append(_span("tool.search", 10, SpanStatus.ERROR))
+
+    sre = MetricsAggregator.compute_sre_metrics(spans)
+    empty = MetricsAggregator.compute_sre_metrics([])
+
+    assert sre["span_count"] == 101
+    assert sre["errors_by_type"] == {"tool.search": 1}
+    assert sre["p95_latency_ms"] == pytest.approx(95, rel=0.02)
+    assert empty["span_count"] == 0 and empty["p99_latency_ms"] == 0
+
+
+def test_agent_kpis_by_name_and_agent_attribute():
+    metrics = StreamingMetrics()
+    metrics.record(_span("agent.L.task", 100))
+    metrics.record(_span("tool.search", 20, agent_id="L"))
+    metrics.record(_span("tool.search", 30, SpanStatus.ERROR, agent_id="other"))
+    start = datetime.utcnow()
+    metrics.record(
+        LLMGenerationSpan(
+            trace_id="t", span_id="s", name="llm.L.generate", start_time=start,
+            duration_ms=50, status=SpanStatus.OK, cost_usd=0.25,
+        )
+    )
+
+    kpis = MetricsAggregator.compute_agent_kpis(metrics, "L")
+
+    assert kpis["success_rate"] == 1.0
+    assert kpis["tool_efficiency"] == 1.0
+    assert kpis["total_cost_usd"] == pytest.approx(0.25)
+    assert kpis["avg_latency_ms"] == pytest.approx((100 + 20 + 50) / 3)
+    assert MetricsAggregator.compute_agent_kpis(metrics, "nobody") == {}
+
+
+@pytest.mark.asyncio
+async def test_service_memory_is_bounded():
+    service = ObservabilityService(
+        config=ObservabilitySettings(exporters=[], substrate_enabled=False, recent_span_capacity=50)
+    )
+    for i in range(500):
+        service.export_span(_span("tool.run", i + 1))
+
+    metrics = await service.compute_metrics()
+    assert len(service.spans) == 50
+    assert metrics["span_count"] == 500
+    assert metrics["p99_latency_ms"] == pytest.approx(495, rel=0.02)
@@ -266,6 +266,61 @@ class TestHashAlgorithmProperties:
         assert len(hashes) == 100
 
 
+class TestCanonicalBytesCache:
+    """Test the cached canonical byte form used for hashing."""
+
+    def test_canonical_bytes_match_legacy_format(self):
+        """Cached bytes are identical to the sorted-key json.dumps form."""
+        packet = PacketEnvelope(
+            packet_type="test",
+            payload={"b": [1, 2], "a": {"z": uuid4()}},
+            timestamp=datetime(2024, 1, 1, 12, 0, 0),
+            metadata=PacketMetadata(agent="L", session_id="s1"),
+        )
+        legacy = json.dumps(
+            {
+                "payload": packet.payload,
+                "metadata": packet.metadata.model_dump(),
+                "timestamp": packet.timestamp.isoformat(),
+            },
+            sort_keys=True,
+            default=str,
+        ).encode("utf-8")
+
+        assert packet.canonical_bytes() == legacy
+        assert packet.canonical_bytes() is packet.canonical_bytes()
+        assert packet.compute_content_hash() == hashlib.sha256(legacy).hexdigest()
+
+    def test_model_copy_recomputes(self):
+        """Copies with updates do not reuse the original's cached bytes."""
+        packet = PacketEnvelope(packet_type="test", payload={"data": 1})
+        original = packet.compute_content_hash()
+        changed = packet.model_copy(update={"payload": {"data": 2}})
+
+        assert changed.compute_content_hash() != original
+        assert packet.with_content_hash().verify_integrity()
+
+    def test_cache_does_not_affect_equality(self):
+        """A packet with a cached hash still equals an identical one."""
+        timestamp = datetime(2024, 1, 1, 12, 0, 0)
+        packet_id = uuid4()
+        packet1 = PacketEnvelope(packet_id=packet_id, packet_type="test", payload={}, timestamp=timestamp)
+        packet2 = PacketEnvelope(packet_id=packet_id, packet_type="test", payload={}, timestamp=timestamp)
+
+        packet1.compute_content_hash()
+
+        assert packet1 == packet2
+
+    def test_verify_integrity_detects_in_place_mutation(self):
+        """verify_integrity recomputes instead of trusting the cache."""
+        packet = PacketEnvelope(packet_type="test", payload={"data": "value"}).with_content_hash()
+        packet.compute_content_hash()
+
+        packet.payload["data"] = "tampered"
+
+        assert not packet.verify_integrity()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
 
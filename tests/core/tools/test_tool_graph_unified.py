@@ -327,6 +327,88 @@ async def test_get_catalog_neo4j_unavailable():
         assert catalog == []
 
 
+# =============================================================================
+# Test Bulk Registration and Buffered Tool Call Logging
+# =============================================================================
+
+@pytest.mark.asyncio
+async def test_register_tools_uses_one_transaction():
+    """Test bulk registration sends UNWIND statements in one transaction."""
+    from core.tools.tool_graph import MERGE_AGENT_TOOLS_QUERY, MERGE_TOOLS_QUERY
+
+    mock_neo4j = AsyncMock()
+    mock_neo4j.run_write_transaction = AsyncMock(return_value=True)
+
+    tools = [
+        ToolDefinition(name="a_tool", external_apis=["GitHub"], agent_id="L"),
+        ToolDefinition(
+            name="b_tool",
+            external_apis=["GitHub", "Slack"],
+            internal_dependencies=["a_tool"],
+            agent_id="L",
+        ),
+    ]
+    with patch.object(ToolGraph, '_get_neo4j', return_value=mock_neo4j):
+        count = await ToolGraph.register_tools(tools)
+
+    assert count == 2
+    mock_neo4j.run_write_transaction.assert_awaited_once()
+    mock_neo4j.create_entity.assert_not_called()
+    mock_neo4j.create_relationship.assert_not_called()
+
+    statements = dict(mock_neo4j.run_write_transaction.call_args.args[0])
+    assert [row["id"] for row in statements[MERGE_TOOLS_QUERY]["rows"]] == ["a_tool", "b_tool"]
+    agent_rows = statements[MERGE_AGENT_TOOLS_QUERY]["rows"]
+    assert {(r["source"], r["target"]) for r in agent_rows} == {("L", "a_tool"), ("L", "b_tool")}
+
+
+@pytest.mark.asyncio
+async def test_register_tools_falls_back_per_tool():
+    """Test a failed bulk transaction falls back to register_tool."""
+    mock_neo4j = AsyncMock()
+    mock_neo4j.run_write_transaction = AsyncMock(return_value=False)
+
+    tools = [ToolDefinition(name="a_tool"), ToolDefinition(name="b_tool")]
+    with patch.object(ToolGraph, '_get_neo4j', return_value=mock_neo4j):
+        count = await ToolGraph.register_tools(tools)
+
+    assert count == 2
+    assert mock_neo4j.create_entity.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_tool_call_logger_batches_events():
+    """Test log_tool_call is buffered and written in one UNWIND batch."""
+    from core.tools.tool_graph import LOG_TOOL_CALLS_QUERY, ToolCallEventLogger
+
+    mock_neo4j = AsyncMock()
+    mock_neo4j.run_write_transaction = AsyncMock(return_value=True)
+    call_logger = ToolCallEventLogger(flush_interval=60)
+
+    with patch.object(ToolGraph, '_get_neo4j', return_value=mock_neo4j), \
+            patch("core.tools.tool_graph.get_tool_call_logger", return_value=call_logger):
+        for i in range(5):
+            assert await ToolGraph.log_tool_call("a_tool", "L", success=i % 2 == 0)
+        mock_neo4j.run_write_transaction.assert_not_awaited()
+
+        await call_logger.close()
+
+    mock_neo4j.run_write_transaction.assert_awaited_once()
+    (query, params), = mock_neo4j.run_write_transaction.call_args.args[0]
+    assert query == LOG_TOOL_CALLS_QUERY
+    assert len(params["rows"]) == 5
+    assert params["rows"][0]["properties"]["event_type"] == "tool_call"
+    assert call_logger.get_stats()["written"] == 5
+    mock_neo4j.create_event.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_log_tool_call_neo4j_unavailable():
+    """Test log_tool_call reports False without Neo4j."""
+    with patch.object(ToolGraph, '_get_neo4j', return_value=None):
+        assert await ToolGraph.log_tool_call("a_tool", "L", success=True) is False
+
+
 # =============================================================================
 # Test Exports
 # =============================================================================
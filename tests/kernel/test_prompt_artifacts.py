@@ -0,0 +1,82 @@
+"""
+Prompt Artifact Tests
+=====================
+
+Tests for the versioned system prompt cache in core.kernels.prompt_builder.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from core.kernels import prompt_builder
+from runtime.kernel_loader import KernelStack
+
+
+def _stack(identity_mission: str, identity_hash: str) -> KernelStack:
+    identity = {"identity": {"designation": "L", "mission": identity_mission}}
+    return KernelStack(
+        kernels_by_id={"identity": identity},
+        kernels_by_file={"02_identity_kernel.yaml": identity},
+        hashes={"02_identity_kernel.yaml": identity_hash},
+        base_dir=Path("."),
+    )
+
+
+@pytest.fixture
+def stack_holder(monkeypatch):
+    holder = {"stack": _stack("Ship it.", "a" * 64)}
+    monkeypatch.setattr(prompt_builder, "get_kernel_stack", lambda: holder["stack"])
+    prompt_builder.invalidate_prompt_cache()
+    yield holder
+    prompt_builder.invalidate_prompt_cache()
+
+
+def test_artifact_built_once_per_stack(stack_holder):
+    first = prompt_builder.get_system_prompt_artifact()
+    second = prompt_builder.get_system_prompt_artifact()
+
+    assert second is first
+    assert "Mission: Ship it." in first.text
+    assert first.version == first.stack_hash[:12]
+    assert first.token_count > 0
+    assert prompt_builder.build_system_prompt_from_kernels() == first.text
+    stats = prompt_builder.get_prompt_cache_stats()
+    assert stats["builds"] >= 1 and stats["entries"] == 1
+
+
+def test_new_stack_hash_produces_new_version(stack_holder):
+    before = prompt_builder.get_system_prompt_artifact()
+
+    stack_holder["stack"] = _stack("Ship it faster.", "b" * 64)
+    after = prompt_builder.get_system_prompt_artifact()
+
+    assert after.version != before.version
+    assert "faster" in after.text
+
+
+def test_invalidate_forces_rebuild(stack_holder):
+    before = prompt_builder.get_system_prompt_artifact()
+    prompt_builder.invalidate_prompt_cache()
+
+    assert prompt_builder.lookup_prompt_tokens(before.text) is None
+    assert prompt_builder.get_system_prompt_artifact() is not before
+
+
+def test_lookup_prompt_tokens_reuses_measurement(stack_holder):
+    artifact = prompt_builder.get_system_prompt_artifact()
+
+    assert prompt_builder.lookup_prompt_tokens(artifact.text) == artifact.token_count
+    assert prompt_builder.lookup_prompt_tokens(artifact.text, "gpt-4o") == artifact.tokens_for("gpt-4o")
+    assert prompt_builder.lookup_prompt_tokens("not a cached prompt") is None
+
+
+def test_context_window_uses_precomputed_prefix_tokens():
+    from core.agents.context_window import ContextWindow
+
+    window = ContextWindow(model="gpt-4o")
+    window.prefix(lambda: "You are L.", measure=lambda text: 1234)
+    window.sync([])
+    window.build()
+
+    assert window.stats.prefix_tokens == 1234
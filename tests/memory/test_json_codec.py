@@ -0,0 +1,137 @@
+"""
+JSON Codec Tests
+================
+
+Tests for the substrate JSON/JSONB codec (memory.json_codec) and the
+single-dump packet_store column extraction.
+"""
+
+import json
+from contextlib import asynccontextmanager
+from datetime import datetime
+from enum import Enum
+from uuid import uuid4
+
+import pytest
+
+from memory import json_codec, substrate_repository
+
+
+class Color(str, Enum):
+    RED = "red"
+
+
+def test_dumps_round_trips_native_types():
+    packet_id = uuid4()
+    value = {
+        "id": packet_id,
+        "at": datetime(2024, 1, 1, 12, 0, 0, 123456),
+        "color": Color.RED,
+        "tags": ("a", "b"),
+        "nested": {"n": 1.5, "none": None},
+    }
+
+    decoded = json_codec.loads(json_codec.dumps(value))
+
+    assert decoded == {
+        "id": str(packet_id),
+        "at": "2024-01-01T12:00:00.123456",
+        "color": "red",
+        "tags": ["a", "b"],
+        "nested": {"n": 1.5, "none": None},
+    }
+    assert json_codec.loads(json_codec.dumps_bytes(value)) == decoded
+
+
+def test_encode_jsonb_passes_through_pre_serialized_text():
+    text = json.dumps({"already": "encoded"})
+
+    assert json_codec.encode_jsonb(text) is text
+    assert json.loads(json_codec.encode_jsonb({"a": 1})) == {"a": 1}
+
+
+@pytest.mark.asyncio
+async def test_register_json_codecs_sets_json_and_jsonb():
+    calls = []
+
+    class FakeConnection:
+        async def set_type_codec(self, typename, **kwargs):
+            calls.append((typename, kwargs["schema"], kwargs["encoder"], kwargs["decoder"]))
+
+    await json_codec.register_json_codecs(FakeConnection())
+
+    assert [c[:2] for c in calls] == [("jsonb", "pg_catalog"), ("json", "pg_catalog")]
+    assert calls[0][2] is json_codec.encode_jsonb
+    assert calls[0][3] is json_codec.decode_jsonb
+
+
+class FakeFactsConnection:
+    """Stores knowledge_facts rows the way a codec-registered connection would."""
+
+    def __init__(self):
+        self.rows = {}
+
+    async def execute(self, query, fact_id, subject, predicate, obj, confidence, source, created_at):
+        self.rows[fact_id] = {
+            "fact_id": fact_id,
+            "subject": subject,
+            "predicate": predicate,
+            "object": json_codec.encode_jsonb(obj),
+            "confidence": confidence,
+            "source_packet": source,
+            "created_at": created_at,
+        }
+
+    async def fetch(self, query, subject, *args):
+        return [
+            {**row, "object": json_codec.decode_jsonb(row["object"])}
+            for row in self.rows.values()
+            if row["subject"] == subject
+        ]
+
+
+class FakePool:
+    def __init__(self, conn):
+        self.conn = conn
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield self.conn
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("value", ["Python", "123", "true", 123, True, {"k": ["v"]}])
+async def test_fact_object_round_trips_through_repository(value):
+    repo = substrate_repository.SubstrateRepository("postgresql://unused")
+    repo._pool = FakePool(FakeFactsConnection())
+
+    await repo.insert_knowledge_fact("lang", "is", value)
+    (fact,) = await repo.get_facts_by_subject("lang")
+
+    assert fact.object == value
+    assert type(fact.object) is type(value)
+
+
+def test_packet_columns_single_dump():
+    from memory.substrate_models import PacketEnvelope
+
+    parent = uuid4()
+    envelope = PacketEnvelope(
+        packet_type="event",
+        payload={"text": "hi"},
+        metadata={"agent": "L", "session_id": "s1", "importance": 0.7},
+        provenance={"source": "slack"},
+        lineage={"parent_ids": [parent]},
+        tags=["t"],
+    )
+
+    columns = substrate_repository.packet_columns(envelope)
+
+    assert len(columns) == 15
+    assert columns[0] == envelope.packet_id
+    assert json.loads(columns[2]) == json.loads(envelope.model_dump_json())
+    assert json.loads(columns[4]) == {"agent": "L"}
+    assert json.loads(columns[5])["source"] == "slack"
+    assert columns[7] == [parent]
+    assert columns[8] == ["t"]
+    assert columns[11:15] == ("s1", "shared", None, 0.7)
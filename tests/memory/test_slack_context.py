@@ -0,0 +1,92 @@
+"""
+Slack Context Retrieval Tests
+=============================
+
+Tests for concurrent thread-context / semantic-hit lookups in
+memory.slack_ingest (deadline, failures, duplicate short-circuit).
+No external services required.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from memory import slack_ingest
+
+
+def _task(result=None, delay=0.0, error=None):
+    async def lookup():
+        await asyncio.sleep(delay)
+        if error:
+            raise error
+        return result
+
+    return asyncio.create_task(lookup())
+
+
+@pytest.mark.asyncio
+async def test_lookups_run_concurrently():
+    tasks = {
+        "thread_context": _task({"packets": [1]}, delay=0.1),
+        "semantic_hits": _task({"results": [2]}, delay=0.1),
+    }
+    start = time.perf_counter()
+    context = await slack_ingest._await_context(tasks, deadline=1.0)
+
+    assert time.perf_counter() - start < 0.18
+    assert context == {"thread_context": {"packets": [1]}, "semantic_hits": {"results": [2]}}
+
+
+@pytest.mark.asyncio
+async def test_deadline_and_failures_yield_empty_context():
+    slow = _task({"packets": [1]}, delay=5)
+    tasks = {
+        "thread_context": slow,
+        "semantic_hits": _task(error=RuntimeError("search down")),
+    }
+    start = time.perf_counter()
+    context = await slack_ingest._await_context(tasks, deadline=0.05)
+    await asyncio.sleep(0)
+
+    assert time.perf_counter() - start < 0.5
+    assert context == {"thread_context": {}, "semantic_hits": {}}
+    assert slow.cancelled()
+
+
+class _Substrate:
+    def __init__(self):
+        self.context_calls = 0
+        self._repository = self
+
+    async def search_packets_by_thread(self, thread_id, limit):
+        self.context_calls += 1
+        return []
+
+    async def semantic_search(self, request):
+        self.context_calls += 1
+        raise AssertionError("not reached")
+
+
+@pytest.mark.asyncio
+async def test_duplicate_cancels_context_lookups(monkeypatch):
+    substrate = _Substrate()
+
+    async def duplicate(**kwargs):
+        return {"is_duplicate": True, "reason": "event_id_match", "tier": "local"}
+
+    monkeypatch.setattr(slack_ingest, "_check_duplicate", duplicate)
+    payload = {
+        "type": "event_callback",
+        "event_id": "Ev1",
+        "team_id": "T1",
+        "event": {"type": "message", "channel": "C1", "user": "U1", "text": "hi", "ts": "1.0"},
+    }
+
+    result = await slack_ingest.handle_slack_events(
+        b"{}", payload, substrate, slack_client=None, aios_base_url="http://aios"
+    )
+    await asyncio.sleep(0)
+
+    assert result == {"ok": True, "deduplicated": True}
+    assert substrate.context_calls == 0
@@ -0,0 +1,210 @@
+"""
+Slack Dedupe Tests
+==================
+
+Tests for the layered Slack event dedupe (memory.slack_dedupe):
+in-process TTL set, Redis SET NX claim, Postgres fallback.
+No external services required.
+"""
+
+import time
+from contextlib import asynccontextmanager
+
+import pytest
+
+from memory import slack_dedupe, slack_ingest
+
+SlackDedupeService = slack_dedupe.SlackDedupeService
+TTLKeySet = slack_dedupe.TTLKeySet
+
+EVENT = dict(event_id="Ev1", team_id="T1", channel_id="C1", ts="1700000000.0001", user_id="U1")
+
+
+class FakeRedis:
+    def __init__(self, available=True):
+        self.keys = {}
+        self.available = available
+        self.calls = 0
+
+    def is_available(self):
+        return self.available
+
+    async def set_nx_many(self, keys, ttl, value="1", raw=False):
+        self.calls += 1
+        out = []
+        for k in keys:
+            out.append(k not in self.keys)
+            self.keys.setdefault(k, ttl)
+        return out
+
+    async def delete_many(self, keys, raw=False):
+        return sum(self.keys.pop(k, None) is not None for k in keys)
+
+
+class FakeSubstrate:
+    def __init__(self, row=None, fail=False):
+        self.queries = 0
+        self.row = row
+        self.fail = fail
+        self._repository = self
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield self
+
+    async def fetchrow(self, sql, *args):
+        self.queries += 1
+        if self.fail:
+            raise RuntimeError("db down")
+        return self.row
+
+
+@pytest.mark.asyncio
+async def test_retry_on_same_worker_answered_locally():
+    redis = FakeRedis()
+    substrate = FakeSubstrate()
+    dedupe = SlackDedupeService(redis_client=redis)
+
+    first = await dedupe.check(substrate, **EVENT)
+    retry = await dedupe.check(substrate, **EVENT)
+
+    assert first == {"is_duplicate": False, "tier": "redis"}
+    assert retry == {"is_duplicate": True, "reason": "event_id_match", "tier": "local"}
+    assert redis.calls == 1
+    assert substrate.queries == 0
+
+
+@pytest.mark.asyncio
+async def test_retry_on_other_worker_answered_by_redis():
+    redis = FakeRedis()
+    substrate = FakeSubstrate()
+    worker_a = SlackDedupeService(redis_client=redis)
+    worker_b = SlackDedupeService(redis_client=redis)
+
+    await worker_a.check(substrate, **EVENT)
+    retry = await worker_b.check(substrate, **EVENT)
+    # Same message re-sent under a new event_id
+    resent = await SlackDedupeService(redis_client=redis).check(
+        substrate, **{**EVENT, "event_id": "Ev2"}
+    )
+
+    assert retry["is_duplicate"] and retry["tier"] == "redis"
+    assert resent == {"is_duplicate": True, "reason": "composite_match", "tier": "redis"}
+    assert substrate.queries == 0
+
+
+@pytest.mark.asyncio
+async def test_postgres_fallback_when_redis_unavailable():
+    row = {"packet_id": "p-1", "event_id": "Ev1"}
+    dedupe = SlackDedupeService(redis_client=FakeRedis(available=False))
+
+    result = await dedupe.check(FakeSubstrate(row=row), **EVENT)
+    assert result == {
+        "is_duplicate": True,
+        "reason": "event_id_match",
+        "packet_id": "p-1",
+        "tier": "postgres",
+    }
+
+    failed = await SlackDedupeService(use_redis=False).check(FakeSubstrate(fail=True), **EVENT)
+    assert failed == {"is_duplicate": False, "reason": "dedupe_check_failed", "tier": "postgres"}
+
+
+@pytest.mark.asyncio
+async def test_stats_and_events_without_keys():
+    dedupe = SlackDedupeService(redis_client=FakeRedis())
+    substrate = FakeSubstrate()
+
+    assert await dedupe.check(substrate, None, None, None, None, None) == {
+        "is_duplicate": False,
+        "tier": "none",
+    }
+    await dedupe.check(substrate, **EVENT)
+    await dedupe.check(substrate, **EVENT)
+
+    stats = dedupe.stats()
+    assert stats["tiers"]["redis"]["new"] == 1
+    assert stats["tiers"]["local"]["duplicate"] == 1
+    assert stats["tiers"]["none"]["new"] == 1
+    assert stats["local_keys"] == 2
+
+
+@pytest.mark.asyncio
+async def test_release_lets_the_retry_through_on_every_worker():
+    redis = FakeRedis()
+    substrate = FakeSubstrate()
+    worker_a = SlackDedupeService(redis_client=redis)
+    worker_b = SlackDedupeService(redis_client=redis)
+
+    await worker_a.check(substrate, **EVENT)
+    await worker_a.release(**EVENT)
+
+    assert redis.keys == {}
+    assert (await worker_a.check(substrate, **EVENT))["is_duplicate"] is False
+    await worker_a.release(**EVENT)
+    assert (await worker_b.check(substrate, **EVENT))["is_duplicate"] is False
+
+
+@pytest.mark.asyncio
+async def test_failed_processing_releases_claim_for_slack_retry(monkeypatch):
+    dedupe = SlackDedupeService(redis_client=FakeRedis())
+    attempts = []
+
+    async def no_context(**kwargs):
+        return {}
+
+    async def process(**kwargs):
+        attempts.append(kwargs["normalized"]["event_id"])
+        if len(attempts) == 1:
+            raise RuntimeError("AIOS down")
+        return {"ok": True}
+
+    monkeypatch.setattr(slack_ingest, "slack_dedupe", dedupe)
+    monkeypatch.setattr(slack_ingest, "_retrieve_thread_context", no_context)
+    monkeypatch.setattr(slack_ingest, "_retrieve_semantic_hits", no_context)
+    monkeypatch.setattr(slack_ingest, "_process_slack_event", process)
+    payload = {
+        "type": "event_callback",
+        "event_id": "Ev1",
+        "team_id": "T1",
+        "event": {"type": "message", "channel": "C1", "user": "U1", "text": "hi", "ts": "1.0"},
+    }
+
+    async def deliver():
+        return await slack_ingest.handle_slack_events(
+            b"{}", payload, FakeSubstrate(), slack_client=None, aios_base_url="http://aios"
+        )
+
+    with pytest.raises(RuntimeError):
+        await deliver()
+    assert await deliver() == {"ok": True}
+    assert await deliver() == {"ok": True, "deduplicated": True}
+    assert attempts == ["Ev1", "Ev1"]
+
+
+def test_ttl_key_set_expiry_and_bound():
+    keys = TTLKeySet(ttl_seconds=10, max_size=3)
+    keys.add("a", now=0)
+    assert keys.contains("a", now=9.9)
+    assert not keys.contains("a", now=10)
+
+    for i, key in enumerate("bcde"):
+        keys.add(key, now=20 + i)
+    assert len(keys) == 3
+    assert not keys.contains("b", now=24)
+    assert keys.contains("e", now=24)
+
+
+@pytest.mark.asyncio
+async def test_local_hit_is_microseconds():
+    dedupe = SlackDedupeService(redis_client=FakeRedis())
+    substrate = FakeSubstrate()
+    await dedupe.check(substrate, **EVENT)
+
+    n = 2000
+    start = time.perf_counter()
+    for _ in range(n):
+        await dedupe.check(substrate, **EVENT)
+    per_check_us = (time.perf_counter() - start) / n * 1e6
+
+    assert per_check_us < 200
@@ -27,6 +27,15 @@ from tests.mocks.orchestrator_mocks import (
     MockToolRegistry,
 )
 
+from tests.mocks.llm_mocks import (
+    FakeChatStream,
+    FakeStreamingChatClient,
+)
+
+from tests.mocks.neo4j_mocks import (
+    FakeNeo4jDriver,
+)
+
 __all__ = [
     "KernelState",
     "KernelViolationError",
@@ -38,4 +47,7 @@ __all__ = [
     "get_wm_status",
     "MockRedis",
     "MockToolRegistry",
+    "FakeChatStream",
+    "FakeStreamingChatClient",
+    "FakeNeo4jDriver",
 ]
@@ -0,0 +1,133 @@
+"""
+LLM Mock Implementations
+========================
+
+Local fake of the OpenAI chat completions client for streaming tests.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from types import SimpleNamespace
+from typing import Any, Optional
+
+
+def _chunk(
+    content: Optional[str] = None,
+    tool_calls: Optional[list[Any]] = None,
+    finish_reason: Optional[str] = None,
+    usage: Optional[Any] = None,
+) -> SimpleNamespace:
+    choices = []
+    if content is not None or tool_calls is not None or finish_reason is not None:
+        choices.append(
+            SimpleNamespace(
+                delta=SimpleNamespace(content=content, tool_calls=tool_calls),
+                finish_reason=finish_reason,
+            )
+        )
+    return SimpleNamespace(choices=choices, usage=usage)
+
+
+class FakeChatStream:
+    """Async iterator over pre-built stream chunks."""
+
+    def __init__(self, chunks: list[SimpleNamespace], delay: float = 0.0):
+        self._chunks = chunks
+        self._delay = delay
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for chunk in self._chunks:
+            if self._delay:
+                await asyncio.sleep(self._delay)
+            yield chunk
+
+
+class FakeStreamingChatClient:
+    """
+    Fake AsyncOpenAI client whose chat.completions.create streams a scripted
+    response.
+
+    Text is split into word-sized deltas; each tool call is split into a
+    header chunk (id + name) and argument fragments, as OpenAI streams them.
+    Usage is reported in a final choice-less chunk (stream_options
+    include_usage).
+
+    Usage:
+        client = FakeStreamingChatClient(text="Hello there")
+        runtime._client = client
+        async for delta in runtime.stream_reasoning(context): ...
+    """
+
+    def __init__(
+        self,
+        text: str = "",
+        tool_calls: Optional[list[dict[str, Any]]] = None,
+        total_tokens: int = 42,
+        delay: float = 0.0,
+        argument_fragment_size: int = 8,
+    ):
+        """
+        Args:
+            text: Assistant content to stream
+            tool_calls: Tool calls to stream, as {"name": ..., "arguments": dict}
+            total_tokens: Usage reported in the final chunk
+            delay: Seconds to wait before each chunk
+            argument_fragment_size: Characters per arguments fragment
+        """
+        self._text = text
+        self._tool_calls = tool_calls or []
+        self._total_tokens = total_tokens
+        self._delay = delay
+        self._fragment_size = max(argument_fragment_size, 1)
+        self.requests: list[dict[str, Any]] = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    async def _create(self, **kwargs: Any) -> FakeChatStream:
+        self.requests.append(kwargs)
+        return FakeChatStream(self._build_chunks(), delay=self._delay)
+
+    def _build_chunks(self) -> list[SimpleNamespace]:
+        chunks = []
+        if self._text:
+            words = self._text.split(" ")
+            for i, word in enumerate(words):
+                chunks.append(_chunk(content=word if i == 0 else f" {word}"))
+
+        for index, call in enumerate(self._tool_calls):
+            chunks.append(
+                _chunk(
+                    tool_calls=[
+                        SimpleNamespace(
+                            index=index,
+                            id=f"call_{index}_{call['name']}",
+                            function=SimpleNamespace(name=call["name"], arguments=""),
+                        )
+                    ]
+                )
+            )
+            arguments = json.dumps(call.get("arguments", {}))
+            for start in range(0, len(arguments), self._fragment_size):
+                chunks.append(
+                    _chunk(
+                        tool_calls=[
+                            SimpleNamespace(
+                                index=index,
+                                id=None,
+                                function=SimpleNamespace(
+                                    name=None,
+                                    arguments=arguments[start : start + self._fragment_size],
+                                ),
+                            )
+                        ]
+                    )
+                )
+
+        finish_reason = "tool_calls" if self._tool_calls else "stop"
+        chunks.append(_chunk(finish_reason=finish_reason))
+        chunks.append(_chunk(usage=SimpleNamespace(total_tokens=self._total_tokens)))
+        return chunks
@@ -0,0 +1,106 @@
+"""
+Neo4j Mock Implementations
+==========================
+
+Fake AsyncDriver for exercising Neo4jClient without a database. Every
+session.run / tx.run and every transaction commit counts as one round trip
+and optionally sleeps to simulate network latency.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Optional
+
+
+class FakeNeo4jResult:
+    """Result with the subset of the AsyncResult API Neo4jClient uses."""
+
+    def __init__(self, records: Optional[list[dict[str, Any]]] = None):
+        self._records = records or []
+
+    async def single(self) -> Optional[dict[str, Any]]:
+        return self._records[0] if self._records else None
+
+    async def data(self) -> list[dict[str, Any]]:
+        return list(self._records)
+
+    async def consume(self) -> None:
+        return None
+
+
+class FakeNeo4jTransaction:
+    """Managed transaction passed to execute_write work functions."""
+
+    def __init__(self, driver: "FakeNeo4jDriver"):
+        self._driver = driver
+
+    async def run(self, query: str, **parameters: Any) -> FakeNeo4jResult:
+        return await self._driver._run(query, parameters, in_transaction=True)
+
+
+class FakeNeo4jSession:
+    """Async session context manager."""
+
+    def __init__(self, driver: "FakeNeo4jDriver"):
+        self._driver = driver
+
+    async def __aenter__(self) -> "FakeNeo4jSession":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        return None
+
+    async def run(self, query: str, **parameters: Any) -> FakeNeo4jResult:
+        return await self._driver._run(query, parameters, in_transaction=False)
+
+    async def execute_write(self, work: Any) -> Any:
+        result = await work(FakeNeo4jTransaction(self._driver))
+        await self._driver._round_trip()  # COMMIT
+        self._driver.transactions += 1
+        return result
+
+
+class FakeNeo4jDriver:
+    """
+    Fake neo4j AsyncDriver.
+
+    Usage:
+        driver = FakeNeo4jDriver(latency=0.001)
+        client = Neo4jClient()
+        client._driver, client._available = driver, True
+    """
+
+    def __init__(self, latency: float = 0.0):
+        """
+        Args:
+            latency: Seconds slept per round trip
+        """
+        self.latency = latency
+        self.round_trips = 0
+        self.transactions = 0
+        self.queries: list[tuple[str, dict[str, Any]]] = []
+
+    def session(self, database: Optional[str] = None) -> FakeNeo4jSession:
+        return FakeNeo4jSession(self)
+
+    async def close(self) -> None:
+        return None
+
+    async def _round_trip(self) -> None:
+        self.round_trips += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+    async def _run(
+        self, query: str, parameters: dict[str, Any], in_transaction: bool
+    ) -> FakeNeo4jResult:
+        await self._round_trip()
+        self.queries.append((query, parameters))
+        # Single-statement writes (create_entity / create_relationship) read
+        # back one record; bulk UNWIND writes return nothing
+        return FakeNeo4jResult([] if in_transaction else [{"id": "ok", "rel": "ok"}])
+
+    def rows_written(self, query: str) -> int:
+        """Total UNWIND rows sent with a given query."""
+        return sum(len(params.get("rows", [])) for q, params in self.queries if q == query)
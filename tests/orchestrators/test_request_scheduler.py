@@ -0,0 +1,238 @@
+"""
+Request Scheduler Tests
+=======================
+
+Tests for admission control in front of UnifiedController.handle_request
+and deadline-based pruning of optional controller phases.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from orchestration.request_scheduler import (
+    RejectionReason,
+    RequestPriority,
+    RequestRejectedError,
+    RequestScheduler,
+    SchedulerConfig,
+)
+from orchestration.unified_controller import (
+    ControllerConfig,
+    ControllerResult,
+    UnifiedController,
+)
+
+
+class _SlowController:
+    """Controller stand-in that records concurrency and call arguments."""
+
+    active = 0
+    peak = 0
+    calls: list[dict] = []
+
+    def __init__(self, delay: float = 0.05):
+        self._delay = delay
+
+    async def handle_request(self, text, context, deadline=None, skip_phases=None):
+        cls = type(self)
+        cls.active += 1
+        cls.peak = max(cls.peak, cls.active)
+        cls.calls.append({"text": text, "skip_phases": skip_phases})
+        try:
+            await asyncio.sleep(self._delay)
+        finally:
+            cls.active -= 1
+        return ControllerResult(success=True)
+
+
+@pytest.fixture(autouse=True)
+def _reset_slow_controller():
+    _SlowController.active = 0
+    _SlowController.peak = 0
+    _SlowController.calls = []
+
+
+@pytest.mark.asyncio
+async def test_per_tenant_concurrency_limit():
+    scheduler = RequestScheduler(
+        controller_factory=_SlowController,
+        config=SchedulerConfig(max_concurrent=8, per_tenant_concurrency=2),
+    )
+
+    results = await asyncio.gather(
+        *[scheduler.submit(f"t{i}", tenant_id="acme") for i in range(6)]
+    )
+
+    assert all(r.success for r in results)
+    assert _SlowController.peak == 2
+    assert scheduler.get_stats()["completed"] == 6
+
+
+@pytest.mark.asyncio
+async def test_priority_order_when_saturated():
+    scheduler = RequestScheduler(
+        controller_factory=_SlowController,
+        config=SchedulerConfig(max_concurrent=1, per_tenant_concurrency=1),
+    )
+
+    blocker = asyncio.create_task(scheduler.submit("blocker"))
+    await asyncio.sleep(0)
+    low = asyncio.create_task(scheduler.submit("low", priority=RequestPriority.LOW))
+    high = asyncio.create_task(
+        scheduler.submit("high", priority=RequestPriority.HIGH)
+    )
+    await asyncio.gather(blocker, low, high)
+
+    order = [c["text"] for c in _SlowController.calls]
+    assert order == ["blocker", "high", "low"]
+
+
+@pytest.mark.asyncio
+async def test_queue_full_sheds_lowest_priority():
+    scheduler = RequestScheduler(
+        controller_factory=_SlowController,
+        config=SchedulerConfig(
+            max_concurrent=1, per_tenant_concurrency=1, max_queue_depth=1
+        ),
+    )
+
+    blocker = asyncio.create_task(scheduler.submit("blocker"))
+    await asyncio.sleep(0)
+    low = asyncio.create_task(scheduler.submit("low", priority=RequestPriority.LOW))
+    await asyncio.sleep(0)
+
+    # Same priority as nothing better queued -> newcomer rejected
+    with pytest.raises(RequestRejectedError) as exc:
+        await scheduler.submit("low2", priority=RequestPriority.LOW)
+    assert exc.value.reason == RejectionReason.QUEUE_FULL
+
+    # Higher priority evicts the queued LOW request
+    critical = asyncio.create_task(
+        scheduler.submit("critical", priority=RequestPriority.CRITICAL)
+    )
+    with pytest.raises(RequestRejectedError) as exc:
+        await low
+    assert exc.value.reason == RejectionReason.SHED
+
+    await asyncio.gather(blocker, critical)
+    assert scheduler.get_stats()["rejected"] == {"queue_full": 1, "shed": 1}
+
+
+@pytest.mark.asyncio
+async def test_deadline_expires_in_queue():
+    scheduler = RequestScheduler(
+        controller_factory=lambda: _SlowController(delay=0.2),
+        config=SchedulerConfig(max_concurrent=1, per_tenant_concurrency=1),
+    )
+
+    blocker = asyncio.create_task(scheduler.submit("blocker"))
+    await asyncio.sleep(0)
+    with pytest.raises(RequestRejectedError) as exc:
+        await scheduler.submit("late", deadline_s=0.01)
+    assert exc.value.reason == RejectionReason.DEADLINE_EXCEEDED
+
+    await blocker
+    assert scheduler.get_stats()["running"] == 0
+    assert scheduler.get_stats()["queued"] == 0
+
+
+@pytest.mark.asyncio
+async def test_deep_queue_degrades_optional_phases():
+    scheduler = RequestScheduler(
+        controller_factory=_SlowController,
+        config=SchedulerConfig(
+            max_concurrent=1, per_tenant_concurrency=1, degrade_queue_depth=1
+        ),
+    )
+
+    await asyncio.gather(*[scheduler.submit(f"t{i}") for i in range(3)])
+
+    skipped = [c["skip_phases"] for c in _SlowController.calls]
+    assert {"deliberate", "simulate"} in skipped
+    assert scheduler.get_stats()["degraded"] >= 1
+
+
+# =============================================================================
+# UnifiedController deadline pruning
+# =============================================================================
+
+
+def _stub_controller(config: ControllerConfig) -> UnifiedController:
+    """UnifiedController with every component replaced by a cheap stub."""
+    controller = UnifiedController(config)
+    graph = SimpleNamespace(graph_id="g1", set_status=lambda status: None)
+    plan = SimpleNamespace(plan_id="p1", steps=[])
+    enum = lambda v: SimpleNamespace(value=v)  # noqa: E731
+
+    async def deliberate(task, initial_graph):
+        return SimpleNamespace(
+            final_graph=graph, final_score=1.0, total_rounds=1, consensus_reached=True
+        )
+
+    async def execute(plan_, context):
+        return SimpleNamespace(
+            step_results=[],
+            artifacts={},
+            packets_emitted=0,
+            completed_steps=0,
+            failed_steps=0,
+            status=enum("completed"),
+        )
+
+    controller._router = SimpleNamespace(
+        route=lambda task, context: SimpleNamespace(
+            task_type=enum("code"),
+            complexity=enum("high"),
+            risk=enum("low"),
+            primary_route=SimpleNamespace(target=enum("ir_pipeline")),
+            confidence=1.0,
+        )
+    )
+
+    async def ir_pipeline(text, context, result):
+        controller._state.current_graph = graph
+
+    controller._phase_ir_pipeline = ir_pipeline
+    controller._deliberation = SimpleNamespace(deliberate=deliberate)
+    controller._plan_adapter = SimpleNamespace(to_execution_plan=lambda g: plan)
+    controller._plan_executor = SimpleNamespace(execute=execute)
+    controller._should_use_cells = lambda result: False
+    return controller
+
+
+@pytest.mark.asyncio
+async def test_controller_prunes_optional_phases_on_short_deadline():
+    config = ControllerConfig(
+        require_simulation=False,
+        auto_self_correct=False,
+        phase_estimates_ms={"deliberate": 5000, "plan": 10, "execute": 10, "reflect": 1},
+    )
+    controller = _stub_controller(config)
+    controller._should_deliberate = lambda result: True
+
+    result = await controller.handle_request(
+        "build it", deadline=time.monotonic() + 1.0
+    )
+
+    assert result.success
+    assert result.skipped_phases == ["deliberate"]
+    assert "deliberate" not in result.phase_times
+    assert "reflect" in result.phase_times
+
+
+@pytest.mark.asyncio
+async def test_controller_honours_explicit_skip_phases():
+    controller = _stub_controller(
+        ControllerConfig(require_simulation=False, auto_self_correct=False)
+    )
+
+    result = await controller.handle_request("build it", skip_phases={"reflect"})
+
+    assert result.success
+    assert result.skipped_phases == ["reflect"]
+    assert "plan" in controller.get_phase_estimates()
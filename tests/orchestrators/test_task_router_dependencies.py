@@ -0,0 +1,121 @@
+"""
+Task Router Dependency Ordering Tests
+=====================================
+
+Tests for Kahn-based dependency ordering, cycle diagnostics and the
+routing-decision cache in TaskRouter.
+"""
+
+from __future__ import annotations
+
+from uuid import uuid4
+
+import pytest
+
+from orchestration.task_router import (
+    RoutingCycleError,
+    TaskRouter,
+    TaskType,
+)
+
+
+def _ids(n: int) -> list[str]:
+    return [str(uuid4()) for _ in range(n)]
+
+
+def test_dependencies_routed_before_dependents():
+    a, b, c, d = _ids(4)
+    tasks = [
+        {"id": d, "text": "deploy the service to staging"},
+        {"id": c, "text": "write tests for the parser"},
+        {"id": b, "text": "implement the parser"},
+        {"id": a, "text": "design the parser schema"},
+    ]
+    deps = {d: [c], c: [b], b: [a]}
+
+    decisions = TaskRouter().route_with_dependencies(tasks, deps)
+
+    assert [str(x.task_id) for x in decisions] == [a, b, c, d]
+
+
+def test_independent_tasks_keep_input_order_and_unknown_deps_ignored():
+    a, b, c = _ids(3)
+    tasks = [{"id": a, "text": "x"}, {"id": b, "text": "y"}, {"id": c, "text": "z"}]
+
+    decisions = TaskRouter().route_with_dependencies(tasks, {b: ["missing"]})
+
+    assert [str(x.task_id) for x in decisions] == [a, b, c]
+
+
+def test_cycle_raises_with_diagnostics():
+    a, b, c, d = _ids(4)
+    tasks = [{"id": t, "text": "implement"} for t in (a, b, c, d)]
+    deps = {a: [c], b: [a], c: [b], d: [a]}
+
+    with pytest.raises(RoutingCycleError) as exc:
+        TaskRouter().route_with_dependencies(tasks, deps)
+
+    cycle = exc.value.cycle
+    assert cycle[0] == cycle[-1]
+    assert set(cycle) == {a, b, c}
+    assert set(exc.value.unresolved) == {a, b, c, d}
+
+
+def test_self_dependency_is_a_cycle():
+    a = str(uuid4())
+    with pytest.raises(RoutingCycleError):
+        TaskRouter().route_with_dependencies([{"id": a, "text": "x"}], {a: [a]})
+
+
+def test_cache_hits_on_normalized_text_and_reported_in_load_summary():
+    router = TaskRouter()
+
+    first = router.route({"text": "Implement   the OAuth2 login flow"})
+    second = router.route({"text": "implement the oauth2 login flow"})
+
+    assert first.decision_id != second.decision_id
+    assert first.primary_route is not second.primary_route
+    assert first.primary_route.target == second.primary_route.target
+    summary = router.get_load_summary()
+    assert summary["routing_cache_hits"] == 1
+    assert summary["routing_cache_misses"] == 1
+    assert summary[first.primary_route.target.value] == 2
+
+
+def test_cache_respects_explicit_type_and_is_bounded():
+    router = TaskRouter(cache_size=2)
+
+    general = router.route({"text": "do the thing"})
+    design = router.route({"text": "do the thing", "type": "design"})
+    assert general.task_type == TaskType.GENERAL
+    assert design.task_type == TaskType.DESIGN
+
+    router.route({"text": "another thing"})
+    assert router.get_cache_stats()["size"] == 2
+
+
+def test_cached_decision_mutation_does_not_leak():
+    router = TaskRouter()
+    decision = router.route({"text": "design the system architecture"})
+    original_target = decision.primary_route.target
+    decision.primary_route.cell_types.append("intruder")
+    decision.primary_route = decision.secondary_routes[0]
+
+    again = router.route({"text": "design the system architecture"})
+
+    assert "intruder" not in again.primary_route.cell_types
+    assert again.primary_route.target == original_target
+
+
+def test_cache_separates_length_thresholds():
+    router = TaskRouter()
+    # Same normalized text; raw lengths straddle the confidence threshold
+    at_threshold = "x" * 49 + " "
+    over_threshold = "x" * 49 + "  "
+    assert len(at_threshold) == 50 and len(over_threshold) == 51
+
+    over = router.route({"text": over_threshold})
+    at = router.route({"text": at_threshold})
+
+    assert router.get_cache_stats()["size"] == 2
+    assert over.confidence == pytest.approx(at.confidence + 0.05)
@@ -0,0 +1,134 @@
+"""
+Batch Ingestion Benchmark
+=========================
+
+BatchIngestionEngine throughput (upgrades.packet_envelope.scalability):
+
+- Engine: validation + record encoding + COPY hand-off against a fake
+  pool (CPU ceiling of the ingester itself)
+- Postgres: row-by-row INSERT (SubstrateRepository.insert_packet style)
+  vs COPY + INSERT ... ON CONFLICT, against a real database. Set
+  L9_BENCH_DATABASE_URL to a scratch Postgres to run it.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from contextlib import asynccontextmanager
+from uuid import uuid4
+
+import pytest
+
+scalability = pytest.importorskip("upgrades.packet_envelope.scalability")
+
+PACKETS = 20_000
+BENCH_TABLE = "l9_bench_packet_store"
+
+
+def _packets(n: int) -> list:
+    return [
+        {
+            "id": str(uuid4()),
+            "packet_type": "event",
+            "payload": {"text": f"message {i} " * 10, "n": i},
+            "timestamp": "2026-01-05T12:00:00Z",
+            "metadata": {"agent": "L", "session_id": "s1"},
+            "tags": ["bench"],
+        }
+        for i in range(n)
+    ]
+
+
+class _NullConnection:
+    @asynccontextmanager
+    async def transaction(self):
+        yield
+
+    async def execute(self, sql, *args):
+        pass
+
+    async def copy_records_to_table(self, table, records, columns):
+        self._ids = [r[0] for r in records]
+
+    async def fetch(self, sql):
+        return [{"packet_id": pid} for pid in self._ids]
+
+
+class _NullPool:
+    @asynccontextmanager
+    async def acquire(self):
+        yield _NullConnection()
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_engine_throughput():
+    engine = scalability.BatchIngestionEngine(batch_size=1000, pool=_NullPool())
+    request = scalability.BatchIngestRequest(batch_id="bench", packets=_packets(PACKETS))
+
+    start = time.perf_counter()
+    result = await engine.ingest_batch(request)
+    elapsed = time.perf_counter() - start
+
+    rate = PACKETS / elapsed
+    print(f"\nengine: {rate:,.0f} packets/s ({elapsed * 1000:.0f}ms for {PACKETS})")
+    assert result.successful_packets == PACKETS
+    assert rate > 5000
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+@pytest.mark.skipif(
+    not os.getenv("L9_BENCH_DATABASE_URL"), reason="L9_BENCH_DATABASE_URL not set"
+)
+async def test_postgres_copy_vs_row_inserts():
+    asyncpg = pytest.importorskip("asyncpg")
+    pool = await asyncpg.create_pool(os.environ["L9_BENCH_DATABASE_URL"], min_size=4, max_size=10)
+    columns = ", ".join(scalability.PACKET_STORE_COLUMNS)
+    placeholders = ", ".join(f"${i}" for i in range(1, 16))
+    try:
+        async with pool.acquire() as conn:
+            await conn.execute(f"DROP TABLE IF EXISTS {BENCH_TABLE}")
+            await conn.execute(
+                f"""
+                CREATE TABLE {BENCH_TABLE} (
+                    packet_id UUID PRIMARY KEY, packet_type TEXT NOT NULL,
+                    envelope JSONB NOT NULL, timestamp TIMESTAMPTZ NOT NULL,
+                    routing JSONB, provenance JSONB, thread_id UUID,
+                    parent_ids UUID[] DEFAULT '{{}}', tags TEXT[] DEFAULT '{{}}',
+                    ttl TIMESTAMP, content_hash TEXT, session_id TEXT,
+                    scope TEXT DEFAULT 'shared', trace_id TEXT, importance_score FLOAT
+                )
+                """
+            )
+
+        rows = [scalability.packet_to_record(p) for p in _packets(2000)]
+        start = time.perf_counter()
+        async with pool.acquire() as conn:
+            for row in rows:
+                await conn.execute(
+                    f"INSERT INTO {BENCH_TABLE} ({columns}) VALUES ({placeholders}) "
+                    f"ON CONFLICT (packet_id) DO NOTHING",
+                    *row,
+                )
+        row_rate = len(rows) / (time.perf_counter() - start)
+
+        engine = scalability.BatchIngestionEngine(
+            batch_size=1000,
+            max_concurrent_batches=4,
+            sink=scalability.PostgresPacketSink(pool, table=BENCH_TABLE),
+        )
+        request = scalability.BatchIngestRequest(batch_id="bench", packets=_packets(PACKETS))
+        start = time.perf_counter()
+        result = await engine.ingest_batch(request)
+        copy_rate = PACKETS / (time.perf_counter() - start)
+
+        print(f"\nrow INSERT: {row_rate:,.0f} packets/s\nCOPY engine: {copy_rate:,.0f} packets/s")
+        assert result.successful_packets == PACKETS
+        assert copy_rate > row_rate
+        assert copy_rate > 1000
+    finally:
+        async with pool.acquire() as conn:
+            await conn.execute(f"DROP TABLE IF EXISTS {BENCH_TABLE}")
+        await pool.close()
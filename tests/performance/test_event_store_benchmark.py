@@ -0,0 +1,78 @@
+"""
+Event Store Rebuild Benchmark
+=============================
+
+ReadModel rebuild time over a segmented-file event log
+(upgrades.packet_envelope.event_log.FileEventLog):
+
+- Full replay: every event decoded and applied from offset 0
+- Snapshot: latest projection snapshot loaded, then only the tail replayed
+
+The log holds L9_BENCH_EVENTS events (default 1M) over 100k packets,
+snapshotted 1% before the end.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+
+import pytest
+
+scalability = pytest.importorskip("upgrades.packet_envelope.scalability")
+event_log = pytest.importorskip("upgrades.packet_envelope.event_log")
+
+EVENTS = int(os.getenv("L9_BENCH_EVENTS", "1000000"))
+PACKETS = 100_000
+APPEND_BATCH = 10_000
+
+
+def _batch(start: int, n: int) -> list:
+    Event = scalability.Event
+    events = []
+    for i in range(start, start + n):
+        packet = f"pkt-{i % PACKETS}"
+        if i < PACKETS:
+            events.append(Event(f"evt-{i}", "PacketIngested", packet, {"source": "bench", "size_bytes": i}))
+        else:
+            events.append(Event(f"evt-{i}", "LineageUpdated", packet, {"parent_id": f"pkt-{(i * 7) % PACKETS}"}))
+    return events
+
+
+async def _fill(store, start: int, end: int) -> None:
+    for offset in range(start, end, APPEND_BATCH):
+        await store.append_events(_batch(offset, min(APPEND_BATCH, end - offset)))
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_rebuild_with_and_without_snapshot(tmp_path):
+    store = scalability.EventStore(snapshot_interval=APPEND_BATCH, log=event_log.FileEventLog(str(tmp_path)))
+    snapshot_at = EVENTS - EVENTS // 100
+    await _fill(store, 0, snapshot_at)
+    live = scalability.ReadModel()
+    await live.catch_up(store)
+    await live.snapshot(store)
+    await _fill(store, snapshot_at, EVENTS)
+    await live.catch_up(store)
+
+    start = time.perf_counter()
+    full = scalability.ReadModel()
+    full_replayed = await full.rebuild(store, use_snapshot=False)
+    full_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    fast = scalability.ReadModel()
+    tail_replayed = await fast.rebuild(store)
+    snapshot_seconds = time.perf_counter() - start
+    await store.close()
+
+    print(
+        f"\n{EVENTS:,} events: full replay {full_seconds:.2f}s ({EVENTS / full_seconds:,.0f} events/s)"
+        f"\nsnapshot + {tail_replayed:,} tail events: {snapshot_seconds:.2f}s"
+    )
+    assert full_replayed == EVENTS and tail_replayed == EVENTS - snapshot_at
+    assert fast.last_offset == full.last_offset == live.last_offset == EVENTS - 1
+    assert fast.packets == full.packets
+    assert fast.lineage_graph == full.lineage_graph
+    assert snapshot_seconds < full_seconds
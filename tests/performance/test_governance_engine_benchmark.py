@@ -0,0 +1,132 @@
+"""
+Governance Engine Benchmark
+===========================
+
+1k policies x 200 tools: filtering the tool list for an agent the way
+ExecutorToolRegistry.get_approved_tools does, comparing a linear
+Policy.matches scan with the compiled index, the bulk evaluate_many API
+and the warm decision cache.
+"""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import pytest
+import yaml
+
+from core.governance.engine import GovernanceEngineService
+from core.governance.schemas import PolicyEffect
+
+POLICY_COUNT = 1000
+TOOL_COUNT = 200
+AGENTS = ["L", "l-cto", "agent:research", "agent:ops"]
+
+
+def _policies() -> list[dict]:
+    policies = []
+    for i in range(POLICY_COUNT):
+        kind = i % 4
+        if kind == 0:
+            # Agent + tool specific grants
+            policy = {
+                "subjects": [AGENTS[i % len(AGENTS)]],
+                "actions": ["tool.execute"],
+                "resources": [f"tool_{i % TOOL_COUNT}"],
+            }
+        elif kind == 1:
+            # Unrelated actions (file/db/api governance)
+            policy = {
+                "subjects": ["*"],
+                "actions": [f"service{i}.call"],
+                "resources": ["*"],
+            }
+        elif kind == 2:
+            # Prefix wildcards on resources
+            policy = {
+                "subjects": [f"agent:team{i}"],
+                "actions": ["tool.*"],
+                "resources": [f"tool_{i % 20}*"],
+            }
+        else:
+            # Suffix wildcard actions
+            policy = {
+                "subjects": ["agent:*"],
+                "actions": [f"*.op{i}"],
+                "resources": ["*"],
+            }
+        policies.append(
+            {
+                "id": f"policy-{i}",
+                "name": f"Policy {i}",
+                "effect": "allow" if i % 3 else "deny",
+                "priority": i % 100,
+                **policy,
+            }
+        )
+    return policies
+
+
+@pytest.fixture(scope="module")
+def engine(tmp_path_factory) -> GovernanceEngineService:
+    policy_dir: Path = tmp_path_factory.mktemp("policies")
+    with open(policy_dir / "policies.yaml", "w") as f:
+        yaml.dump({"policies": _policies()}, f)
+    return GovernanceEngineService(policy_dir=str(policy_dir))
+
+
+def _linear_is_allowed(policies, subject, action, resource, context) -> bool:
+    for policy in policies:
+        if policy.matches(subject, action, resource, context):
+            return policy.effect == PolicyEffect.ALLOW
+    return False
+
+
+@pytest.mark.slow
+def test_tool_filtering_1k_policies_200_tools(engine: GovernanceEngineService):
+    tools = [f"tool_{i}" for i in range(TOOL_COUNT)]
+    context = {"principal_id": "igor"}
+    policies = engine.policies
+
+    start = time.perf_counter()
+    linear = {
+        agent: {t: _linear_is_allowed(policies, agent, "tool.execute", t, context) for t in tools}
+        for agent in AGENTS
+    }
+    linear_s = time.perf_counter() - start
+
+    engine.clear_cache()
+    start = time.perf_counter()
+    indexed = {
+        agent: {t: engine.is_allowed(agent, "tool.execute", t, context) for t in tools}
+        for agent in AGENTS
+    }
+    indexed_s = time.perf_counter() - start
+
+    engine.clear_cache()
+    start = time.perf_counter()
+    bulk = {
+        agent: engine.evaluate_many(agent, "tool.execute", tools, context)
+        for agent in AGENTS
+    }
+    bulk_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    warm = {
+        agent: engine.evaluate_many(agent, "tool.execute", tools, context)
+        for agent in AGENTS
+    }
+    warm_s = time.perf_counter() - start
+
+    print(
+        f"\n{POLICY_COUNT} policies x {TOOL_COUNT} tools x {len(AGENTS)} agents: "
+        f"linear={linear_s * 1000:.1f}ms indexed={indexed_s * 1000:.1f}ms "
+        f"evaluate_many={bulk_s * 1000:.1f}ms cached={warm_s * 1000:.1f}ms"
+    )
+
+    assert indexed == linear
+    assert bulk == linear
+    assert warm == linear
+    assert indexed_s < linear_s
+    assert warm_s < linear_s
@@ -0,0 +1,118 @@
+"""
+Shared HTTP Client Benchmark
+============================
+
+p50/p99 latency of an AIOS-style POST /chat against a local keep-alive
+stub server:
+
+- per-request httpx.AsyncClient (the old slack_ingest path: new client,
+  new connection every message)
+- shared pooled client from runtime.http_clients
+
+Plus Slack context retrieval: sequential vs concurrent lookups
+(memory.slack_ingest._await_context) with stub latencies.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import statistics
+import time
+
+import httpx
+import pytest
+
+http_clients = pytest.importorskip("runtime.http_clients")
+
+REQUESTS = 100
+BODY = b'{"reply":"ok"}'
+
+
+async def _handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    try:
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = 0
+            for line in head.split(b"\r\n"):
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":", 1)[1])
+            if length:
+                await reader.readexactly(length)
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                b"Content-Length: %d\r\nConnection: keep-alive\r\n\r\n%s" % (len(BODY), BODY)
+            )
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+def _percentiles(samples: list) -> tuple:
+    ordered = sorted(samples)
+    p50 = statistics.median(ordered)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    return p50 * 1000, p99 * 1000
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_shared_client_latency_vs_per_request_client():
+    server = await asyncio.start_server(_handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    url = f"http://127.0.0.1:{port}/chat"
+    payload = {"message": "hello", "system_prompt": "You are L."}
+
+    per_request = []
+    for _ in range(REQUESTS):
+        start = time.perf_counter()
+        async with httpx.AsyncClient(timeout=10.0) as client:
+            (await client.post(url, json=payload)).raise_for_status()
+        per_request.append(time.perf_counter() - start)
+
+    registry = http_clients.HTTPClientRegistry()
+    shared = []
+    for _ in range(REQUESTS):
+        start = time.perf_counter()
+        (await registry.get("aios").post(url, json=payload)).raise_for_status()
+        shared.append(time.perf_counter() - start)
+    await registry.aclose()
+    server.close()
+    await server.wait_closed()
+
+    old_p50, old_p99 = _percentiles(per_request)
+    new_p50, new_p99 = _percentiles(shared)
+    print(
+        f"\nper-request client: p50 {old_p50:.2f}ms p99 {old_p99:.2f}ms"
+        f"\nshared client:      p50 {new_p50:.2f}ms p99 {new_p99:.2f}ms"
+    )
+    assert new_p50 < old_p50 / 2
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_concurrent_context_lookups():
+    slack_ingest = pytest.importorskip("memory.slack_ingest")
+
+    async def lookup(delay: float) -> dict:
+        await asyncio.sleep(delay)
+        return {"results": []}
+
+    start = time.perf_counter()
+    await lookup(0.03)
+    await lookup(0.05)
+    sequential = time.perf_counter() - start
+
+    start = time.perf_counter()
+    await slack_ingest._await_context(
+        {
+            "thread_context": asyncio.create_task(lookup(0.03)),
+            "semantic_hits": asyncio.create_task(lookup(0.05)),
+        },
+        deadline=1.0,
+    )
+    concurrent = time.perf_counter() - start
+
+    print(f"\ncontext lookups: sequential {sequential * 1000:.0f}ms, concurrent {concurrent * 1000:.0f}ms")
+    assert concurrent < sequential * 0.8
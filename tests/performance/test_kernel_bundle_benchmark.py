@@ -0,0 +1,88 @@
+"""
+Kernel Bundle Benchmark
+=======================
+
+Agent boot over the repo's 10 system kernels (runtime.kernel_loader
+.load_kernels):
+
+- Uncached: what every boot paid before the bundle cache (pure-Python
+  SafeLoader parse + separate SHA256 read per file)
+- Cold: first boot with an empty cache (one read per file, C loader)
+- Warm: new process, bundle restored from disk after a stat check
+- Hot: same process, bundle served from memory
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from runtime import kernel_bundle
+from runtime.kernel_bundle import KernelBundleCache
+from runtime.kernel_loader import KERNEL_ORDER, load_kernels
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+BOOTS = 20
+
+
+class _Agent:
+    def absorb_kernel(self, kernel_data):
+        pass
+
+    def set_system_context(self, context):
+        self.system_context = context
+
+
+def _uncached_boot() -> None:
+    for kernel_path in KERNEL_ORDER:
+        full_path = REPO_ROOT / kernel_path
+        yaml.load(full_path.read_text(), Loader=yaml.SafeLoader)
+        hashlib.sha256(full_path.read_bytes()).hexdigest()
+
+
+def _boot(cache: KernelBundleCache) -> float:
+    with patch.object(kernel_bundle, "_bundle_cache", cache):
+        start = time.perf_counter()
+        load_kernels(_Agent(), base_path=REPO_ROOT)
+        return time.perf_counter() - start
+
+
+def _best_of(fn, n: int = BOOTS) -> float:
+    return min(fn() for _ in range(n))
+
+
+def _timed_uncached() -> float:
+    start = time.perf_counter()
+    _uncached_boot()
+    return time.perf_counter() - start
+
+
+@pytest.mark.slow
+def test_cold_vs_warm_agent_boot(tmp_path):
+    if not all((REPO_ROOT / p).exists() for p in KERNEL_ORDER):
+        pytest.skip("system kernels not present")
+
+    uncached_s = _best_of(_timed_uncached, 5)
+
+    cache_dir = tmp_path / "bundles"
+    cold_s = _boot(KernelBundleCache(cache_dir=cache_dir, persist=True))
+    warm_s = _best_of(lambda: _boot(KernelBundleCache(cache_dir=cache_dir, persist=True)))
+
+    hot_cache = KernelBundleCache(cache_dir=cache_dir, persist=True)
+    _boot(hot_cache)
+    hot_s = _best_of(lambda: _boot(hot_cache))
+
+    print(
+        f"\nboot {len(KERNEL_ORDER)} kernels ({kernel_bundle.YAML_LOADER.__name__}): "
+        f"uncached={uncached_s * 1000:.1f}ms cold={cold_s * 1000:.1f}ms "
+        f"warm={warm_s * 1000:.2f}ms hot={hot_s * 1000:.2f}ms"
+    )
+
+    assert hot_cache.get_cache_stats()["compiles"] == 0
+    assert warm_s < uncached_s / 5
+    assert hot_s < uncached_s / 5
@@ -0,0 +1,103 @@
+"""
+Packet Codec Benchmark
+======================
+
+packet_store encode/decode cost per packet, before and after the JSONB
+codec layer:
+
+- Legacy insert: model_dump(mode="json") + json.dumps for envelope,
+  routing and provenance, plus a second metadata model_dump
+- Codec insert: one model_dump, orjson encode (memory.json_codec),
+  columns taken from the single dump (packet_columns)
+- Decode: json.loads vs the codec decoder registered on the pool
+- Hash: uncached sorted-key dump vs cached canonical bytes
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from core.schemas.packet_envelope_v2 import PacketEnvelope as PacketEnvelopeV2
+from memory import json_codec
+from memory import substrate_repository as repository
+from memory.substrate_models import PacketEnvelope
+
+PACKETS = 2000
+
+
+def _payload(i: int) -> dict:
+    return {
+        "text": f"message {i} " * 20,
+        "entities": [{"name": f"e{j}", "score": j / 10, "id": str(uuid4())} for j in range(10)],
+        "context": {"channel": "C123", "thread_ts": "1700000000.000100", "user": "U42"},
+    }
+
+
+def _envelopes() -> list:
+    return [
+        PacketEnvelope(
+            packet_type="event",
+            payload=_payload(i),
+            metadata={"agent": "L", "session_id": "s1", "importance": 0.5},
+            provenance={"source": "slack"},
+            lineage={"parent_ids": [uuid4()]},
+            tags=["slack", "inbound"],
+        )
+        for i in range(PACKETS)
+    ]
+
+
+def _legacy_columns(envelope) -> tuple:
+    metadata_dict = envelope.metadata.model_dump() if envelope.metadata else {}
+    return (
+        json.dumps(envelope.model_dump(mode="json")),
+        json.dumps({"agent": envelope.metadata.agent if envelope.metadata else None}),
+        json.dumps(envelope.provenance.model_dump(mode="json") if envelope.provenance else None),
+        metadata_dict.get("content_hash"),
+        metadata_dict.get("session_id"),
+        metadata_dict.get("importance"),
+    )
+
+
+def _per_packet_us(fn, items) -> float:
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for item in items:
+            fn(item)
+        best = min(best, time.perf_counter() - start)
+    return best / len(items) * 1e6
+
+
+@pytest.mark.slow
+def test_packet_codec_benchmark():
+    envelopes = _envelopes()
+    encoded = [repository.packet_columns(e)[2] for e in envelopes]
+
+    legacy_insert = _per_packet_us(_legacy_columns, envelopes)
+    codec_insert = _per_packet_us(repository.packet_columns, envelopes)
+    legacy_decode = _per_packet_us(json.loads, encoded)
+    codec_decode = _per_packet_us(json_codec.decode_jsonb, encoded)
+
+    v2 = [PacketEnvelopeV2(packet_type="event", payload=_payload(i), timestamp=datetime(2024, 1, 1)) for i in range(PACKETS)]
+    uncached_hash = _per_packet_us(lambda p: p._build_canonical_bytes(), v2)
+    for p in v2:
+        p.compute_content_hash()
+    cached_hash = _per_packet_us(lambda p: p.compute_content_hash(), v2)
+
+    print(
+        f"\norjson={json_codec.ORJSON_AVAILABLE}"
+        f"\ninsert args: legacy {legacy_insert:.1f}us -> codec {codec_insert:.1f}us"
+        f" ({1e6 / legacy_insert:.0f} -> {1e6 / codec_insert:.0f} packets/s/core)"
+        f"\ndecode: json {legacy_decode:.1f}us -> codec {codec_decode:.1f}us"
+        f"\nhash: uncached {uncached_hash:.1f}us -> cached {cached_hash:.1f}us"
+    )
+    assert codec_insert < legacy_insert
+    assert cached_hash < uncached_hash
+    if json_codec.ORJSON_AVAILABLE:
+        assert codec_decode < legacy_decode
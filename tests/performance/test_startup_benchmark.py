@@ -0,0 +1,92 @@
+"""
+Cold-Start Benchmark
+====================
+
+API lifespan startup time with the StartupOrchestrator (api/startup.py):
+sequential (L9_STARTUP_PARALLEL=false, the old lifespan order) vs
+dependency-aware parallel.
+
+Subsystems are local stand-ins with the same graph and modes as
+api/server.py lifespan and representative latencies (network round-trips
+as asyncio sleeps, blocking setup as time.sleep so it holds the loop).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+startup_module = pytest.importorskip("api.startup")
+
+EAGER = startup_module.StartupMode.EAGER
+BACKGROUND = startup_module.StartupMode.BACKGROUND
+LAZY = startup_module.StartupMode.LAZY
+
+# name: (depends_on, mode, awaited seconds, blocking seconds)
+STAND_INS = {
+    "memory": ((), EAGER, 0.35, 0.02),  # migrations + pool + embeddings client
+    "research": ((), LAZY, 0.10, 0.0),
+    "governance": (("memory",), EAGER, 0.0, 0.04),  # policy YAML
+    "housekeeping": (("memory",), EAGER, 0.0, 0.005),
+    "agent_executor": (("memory", "governance"), EAGER, 0.05, 0.08),  # kernels
+    "slack": ((), EAGER, 0.0, 0.005),
+    "neo4j": ((), EAGER, 0.20, 0.0),
+    "neo4j_graph": (("neo4j",), BACKGROUND, 0.60, 0.0),
+    "redis": ((), EAGER, 0.05, 0.0),
+    "rate_limiter": ((), EAGER, 0.0, 0.001),
+    "permission_graph": (("neo4j",), EAGER, 0.0, 0.001),
+    "agent_bootstrap": (("memory",), EAGER, 0.10, 0.01),
+    "l_tools": (("agent_executor", "neo4j"), EAGER, 0.15, 0.01),
+    "memory_tools": (("agent_executor",), EAGER, 0.0, 0.005),
+    "prometheus": ((), EAGER, 0.0, 0.005),
+    "stage3": (("memory", "neo4j"), EAGER, 0.05, 0.01),
+    "graph_agent_state": (("memory", "neo4j"), EAGER, 0.05, 0.0),
+    "observability": (("memory", "governance", "agent_executor"), EAGER, 0.05, 0.01),
+    "world_model_runtime": (("memory",), BACKGROUND, 0.10, 0.0),
+    "consolidation": (("memory",), BACKGROUND, 0.0, 0.005),
+    "graph_wm_sync": (("neo4j",), BACKGROUND, 0.10, 0.0),
+    "tool_pattern_extraction": (("neo4j",), BACKGROUND, 0.05, 0.0),
+}
+
+
+def _stand_in(awaited: float, blocking: float):
+    async def init():
+        if blocking:
+            time.sleep(blocking)
+        await asyncio.sleep(awaited)
+
+    return init
+
+
+async def _cold_start(parallel: bool) -> tuple:
+    startup = startup_module.StartupOrchestrator(parallel=parallel)
+    for name, (deps, mode, awaited, blocking) in STAND_INS.items():
+        startup.add(name, _stand_in(awaited, blocking), depends_on=deps, mode=mode)
+    start = time.perf_counter()
+    await startup.run()
+    ready = time.perf_counter() - start
+    await startup.wait_background(timeout=10)
+    settled = time.perf_counter() - start
+    status = startup.status()
+    await startup.shutdown()
+    return ready, settled, status
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_cold_start_parallel_vs_sequential():
+    seq_ready, seq_settled, _ = await _cold_start(parallel=False)
+    par_ready, par_settled, status = await _cold_start(parallel=True)
+
+    # The old lifespan also awaited background subsystems before serving
+    print(
+        f"\nsequential: serving after {seq_settled * 1000:.0f}ms (old lifespan)"
+        f"\nparallel:   serving after {par_ready * 1000:.0f}ms, background settled at {par_settled * 1000:.0f}ms"
+        f"\nsum of subsystem time: {status['sum_of_subsystem_ms']:.0f}ms"
+    )
+    assert not status["failed"] and not status["pending"]
+    assert status["subsystems"]["research"]["status"] == "pending"
+    assert par_ready < seq_settled / 2
+    assert par_settled < seq_settled
@@ -0,0 +1,102 @@
+"""
+Symbolic Compilation Benchmark
+==============================
+
+Event-loop stalls while compiling generated C for 8 distinct expressions
+(each requested twice, concurrently):
+
+- in-handler: CodeGenerator.compile_generated, gcc runs on the event loop
+  (the old path)
+- pool: CodeGenerator.compile_generated_async, gcc in the process pool
+  with in-flight dedup and the on-disk artifact cache
+
+Plus a "restart": a fresh pool over the same artifact cache directory.
+A heartbeat task ticking every 5ms measures the longest loop stall.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import shutil
+import time
+
+import pytest
+
+from services.symbolic_computation.config import SymbolicComputationConfig
+from services.symbolic_computation.core.code_generator import CodeGenerator
+from services.symbolic_computation.core.compile_pool import CompilePool
+
+EXPRESSIONS = 8
+TICK = 0.005
+
+
+async def _heartbeat(stalls: list, stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        before = time.perf_counter()
+        await asyncio.sleep(TICK)
+        stalls.append(time.perf_counter() - before - TICK)
+
+
+async def _measure(run) -> tuple:
+    stalls: list = []
+    stop = asyncio.Event()
+    beat = asyncio.create_task(_heartbeat(stalls, stop))
+    await asyncio.sleep(TICK)
+    start = time.perf_counter()
+    fns = await run()
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await beat
+    return elapsed, max(stalls) * 1000, fns
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+@pytest.mark.skipif(shutil.which("gcc") is None, reason="gcc not installed")
+async def test_compile_in_handler_vs_pool(tmp_path):
+    config = SymbolicComputationConfig(
+        artifact_cache_dir=str(tmp_path / "artifacts"),
+        codegen_temp_dir=str(tmp_path / "codegen"),
+        compile_workers=4,
+    )
+    generator = CodeGenerator(config=config)
+    sources = []
+    for i in range(EXPRESSIONS):
+        generated = await generator.generate_code(
+            expr=f"x**{i + 2} + {i}*x + sin(x)", variables=["x"], language="C", function_name=f"f{i}"
+        )
+        sources.append((generated.source_code, f"f{i}"))
+    requests = sources * 2
+
+    async def handler(source, name):
+        return generator.compile_generated(source, "C", name)
+
+    def pooled(pool):
+        async def run():
+            generator.compile_pool = pool
+            return await asyncio.gather(
+                *[generator.compile_generated_async(s, "C", n, arg_count=1) for s, n in requests]
+            )
+        return run
+
+    sync_elapsed, sync_stall, _ = await _measure(
+        lambda: asyncio.gather(*[handler(s, n) for s, n in requests])
+    )
+
+    pool = CompilePool(config=config)
+    pool_elapsed, pool_stall, fns = await _measure(pooled(pool))
+    pool.shutdown()
+
+    restarted = CompilePool(config=config)
+    restart_elapsed, restart_stall, _ = await _measure(pooled(restarted))
+    restarted.shutdown()
+
+    print(
+        f"\nin-handler: {sync_elapsed * 1000:.0f}ms for {len(requests)} compiles, max loop stall {sync_stall:.1f}ms"
+        f"\npool:       {pool_elapsed * 1000:.0f}ms ({EXPRESSIONS} gcc runs), max loop stall {pool_stall:.1f}ms"
+        f"\nrestart:    {restart_elapsed * 1000:.1f}ms from the artifact cache, max loop stall {restart_stall:.1f}ms"
+    )
+    assert all(fn is not None for fn in fns)
+    assert fns[1](1.0) == pytest.approx(2.0 + 0.8414709848078965)
+    assert pool_stall < sync_stall / 5
+    assert restart_elapsed < pool_elapsed / 5
@@ -0,0 +1,70 @@
+"""
+Task Router Benchmark
+=====================
+
+Routing a large long-plan style task list (5k tasks, many near-identical
+texts, chained dependencies) with and without the routing-decision cache.
+"""
+
+from __future__ import annotations
+
+import time
+from uuid import uuid4
+
+import pytest
+
+from orchestration.task_router import TaskRouter
+
+TASK_COUNT = 5000
+TEMPLATES = [
+    "Implement GMP step {n}: update the existing module",
+    "Write tests for the parser component",
+    "Review the API endpoint contract",
+    "Fix the failing integration test",
+    "Document the deployment process",
+]
+
+
+def _plan(count: int) -> tuple[list[dict], dict[str, list[str]]]:
+    tasks, deps, prev = [], {}, None
+    for i in range(count):
+        task_id = str(uuid4())
+        # Near-identical texts: only ~50 distinct variants
+        text = TEMPLATES[i % len(TEMPLATES)].format(n=i % 10)
+        tasks.append({"id": task_id, "text": text})
+        if prev is not None:
+            deps[task_id] = [prev]
+        prev = task_id
+    return tasks, deps
+
+
+def _time_routing(router: TaskRouter, count: int) -> float:
+    tasks, deps = _plan(count)
+    start = time.perf_counter()
+    decisions = router.route_with_dependencies(tasks, deps)
+    elapsed = time.perf_counter() - start
+    assert len(decisions) == count
+    return elapsed
+
+
+@pytest.mark.slow
+def test_route_with_dependencies_5k_tasks_cached_vs_uncached():
+    uncached = _time_routing(TaskRouter(cache_size=0), TASK_COUNT)
+    router = TaskRouter()
+    cached = _time_routing(router, TASK_COUNT)
+
+    stats = router.get_cache_stats()
+    print(
+        f"\n5k-task route_with_dependencies: uncached={uncached * 1000:.1f}ms "
+        f"cached={cached * 1000:.1f}ms hits={stats['hits']} misses={stats['misses']}"
+    )
+
+    assert stats["misses"] <= 50
+    assert stats["hits"] == TASK_COUNT - stats["misses"]
+    assert cached < uncached
+
+
+@pytest.mark.slow
+def test_deep_dependency_chain_has_no_recursion_limit():
+    # The old recursive visit() hit RecursionError on long chains
+    _time_routing(TaskRouter(), 20000)
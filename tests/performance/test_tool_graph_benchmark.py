@@ -0,0 +1,125 @@
+"""
+Tool Graph Benchmark
+====================
+
+Neo4jClient on a fake AsyncDriver with 1 ms per round trip:
+
+- Startup: registering L9_TOOLS + L_INTERNAL_TOOLS one tool at a time
+  (register_tool) vs one UNWIND transaction (register_tools)
+- Per tool call: the old synchronous three-write log_tool_call vs the
+  buffered ToolCallEventLogger, plus the cost of draining its buffer
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from core.tools.tool_graph import (
+    L9_TOOLS,
+    L_INTERNAL_TOOLS,
+    LOG_TOOL_CALLS_QUERY,
+    MERGE_TOOLS_QUERY,
+    ToolCallEventLogger,
+    ToolGraph,
+)
+from tests.mocks.neo4j_mocks import FakeNeo4jDriver
+
+try:
+    from memory.graph_client import Neo4jClient
+except ImportError as e:
+    pytest.skip(f"Could not import memory.graph_client: {e}", allow_module_level=True)
+
+ROUND_TRIP_S = 0.001
+TOOL_CALLS = 200
+
+
+def _client(driver: FakeNeo4jDriver) -> Neo4jClient:
+    client = Neo4jClient()
+    client._driver = driver
+    client._database = "neo4j"
+    client._available = True
+    return client
+
+
+async def _synchronous_log_tool_call(neo4j: Neo4jClient, tool_name: str, agent_id: str) -> None:
+    """log_tool_call before buffering: one event write plus two relationship writes."""
+    event_id = f"tool_call:{uuid4()}"
+    await neo4j.create_event(
+        event_id=event_id,
+        event_type="tool_call",
+        timestamp=datetime.utcnow().isoformat(),
+        properties={"tool_name": tool_name, "agent_id": agent_id, "success": True},
+    )
+    await neo4j.create_relationship("Event", event_id, "Tool", tool_name, "INVOKED")
+    await neo4j.create_relationship("Event", event_id, "Agent", agent_id, "BY_AGENT")
+
+
+@pytest.mark.slow
+async def test_startup_registration_per_tool_vs_bulk():
+    tools = L9_TOOLS + L_INTERNAL_TOOLS
+
+    per_tool_driver = FakeNeo4jDriver(latency=ROUND_TRIP_S)
+    with patch.object(ToolGraph, "_get_neo4j", return_value=_client(per_tool_driver)):
+        start = time.perf_counter()
+        per_tool_count = 0
+        for tool in tools:
+            per_tool_count += await ToolGraph.register_tool(tool)
+        per_tool_s = time.perf_counter() - start
+
+    bulk_driver = FakeNeo4jDriver(latency=ROUND_TRIP_S)
+    with patch.object(ToolGraph, "_get_neo4j", return_value=_client(bulk_driver)):
+        start = time.perf_counter()
+        bulk_count = await ToolGraph.register_tools(tools)
+        bulk_s = time.perf_counter() - start
+
+    print(
+        f"\nregister {len(tools)} tools: per-tool={per_tool_s * 1000:.1f}ms "
+        f"({per_tool_driver.round_trips} round trips) "
+        f"bulk={bulk_s * 1000:.1f}ms ({bulk_driver.round_trips} round trips)"
+    )
+
+    assert per_tool_count == bulk_count == len(tools)
+    assert bulk_driver.transactions == 1
+    assert bulk_driver.rows_written(MERGE_TOOLS_QUERY) == len(tools)
+    assert bulk_driver.round_trips <= 8
+    assert bulk_s < per_tool_s
+
+
+@pytest.mark.slow
+async def test_tool_call_logging_overhead():
+    sync_driver = FakeNeo4jDriver(latency=ROUND_TRIP_S)
+    sync_client = _client(sync_driver)
+    start = time.perf_counter()
+    for i in range(TOOL_CALLS):
+        await _synchronous_log_tool_call(sync_client, f"tool_{i % 10}", "L")
+    sync_s = time.perf_counter() - start
+
+    buffered_driver = FakeNeo4jDriver(latency=ROUND_TRIP_S)
+    call_logger = ToolCallEventLogger(batch_size=100, flush_interval=60)
+    with patch.object(ToolGraph, "_get_neo4j", return_value=_client(buffered_driver)), \
+            patch("core.tools.tool_graph.get_tool_call_logger", return_value=call_logger):
+        start = time.perf_counter()
+        for i in range(TOOL_CALLS):
+            await ToolGraph.log_tool_call(f"tool_{i % 10}", "L", success=True)
+        buffered_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        await call_logger.close()
+        drain_s = time.perf_counter() - start
+
+    print(
+        f"\n{TOOL_CALLS} tool calls: synchronous={sync_s * 1000:.1f}ms "
+        f"({sync_s / TOOL_CALLS * 1000:.3f}ms/call, {sync_driver.round_trips} round trips) "
+        f"buffered={buffered_s * 1000:.1f}ms ({buffered_s / TOOL_CALLS * 1000:.3f}ms/call) "
+        f"drain={drain_s * 1000:.1f}ms ({buffered_driver.round_trips} round trips)"
+    )
+
+    assert sync_driver.round_trips == TOOL_CALLS * 3
+    assert buffered_driver.rows_written(LOG_TOOL_CALLS_QUERY) == TOOL_CALLS
+    assert buffered_driver.transactions == 2
+    assert buffered_s < sync_s / 10
@@ -0,0 +1,71 @@
+"""
+WebSocket Fan-out Benchmark
+===========================
+
+WebSocketOrchestrator.broadcast latency as connected clients grow, with one
+slow client (50ms per send) among them. Broadcast encodes once and queues
+per connection, so its latency tracks the enqueue loop, not the slowest
+socket; the old per-recipient await paid the slow send on every broadcast.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from core.schemas.ws_event_stream import EventMessage, EventType
+
+websocket_orchestrator = pytest.importorskip("runtime.websocket_orchestrator")
+
+BROADCASTS = 50
+SLOW_SEND_S = 0.05
+
+
+class _Socket:
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.frames = 0
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, data):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.frames += 1
+
+    async def close(self, code: int = 1000):
+        pass
+
+
+async def _broadcast_ms(clients: int) -> float:
+    orch = websocket_orchestrator.WebSocketOrchestrator(
+        max_queue=BROADCASTS * 2,
+        slow_consumer_policy=websocket_orchestrator.SlowConsumerPolicy.COALESCE,
+    )
+    await orch.register("slow", _Socket(SLOW_SEND_S))
+    for i in range(clients - 1):
+        await orch.register(f"agent-{i}", _Socket())
+
+    event = EventMessage(type=EventType.LOG, payload={"msg": "x" * 256})
+    start = time.perf_counter()
+    for _ in range(BROADCASTS):
+        await orch.broadcast(event)
+    elapsed = (time.perf_counter() - start) / BROADCASTS * 1000
+    await orch.close()
+    return elapsed
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_broadcast_latency_with_slow_consumer():
+    results = {n: await _broadcast_ms(n) for n in (10, 100, 1000)}
+
+    for n, ms in results.items():
+        print(f"\n{n:>5} clients: {ms:.3f}ms per broadcast")
+    # Sequential delivery would cost >= SLOW_SEND_S per broadcast
+    assert results[1000] < SLOW_SEND_S * 1000 / 5
+    # Per-client cost stays constant (enqueue only)
+    assert results[1000] / 1000 < results[10] / 10 * 5
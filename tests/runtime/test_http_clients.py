@@ -0,0 +1,80 @@
+"""
+L9 Tests - Shared HTTP client registry
+
+Ensures:
+- One pooled client per upstream is reused across calls.
+- Overrides (base_url, headers, timeout) get their own pool.
+- Upstream limits/timeouts are applied; unknown upstreams use defaults.
+- A different event loop gets a fresh client; aclose() closes them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from runtime import http_clients
+from runtime.http_clients import HTTPClientRegistry, UpstreamConfig
+
+
+@pytest.mark.asyncio
+async def test_client_reused_per_upstream():
+    registry = HTTPClientRegistry()
+
+    aios = registry.get("aios")
+    assert registry.get("aios") is aios
+    assert registry.get("slack") is not aios
+    assert registry.get("unknown-upstream") is not registry.get("default")
+    assert registry.stats()["open"]["aios"] == 1
+
+    await registry.aclose()
+    assert aios.is_closed
+    assert registry.stats()["open"] == {}
+
+
+@pytest.mark.asyncio
+async def test_overrides_get_their_own_pool():
+    registry = HTTPClientRegistry()
+
+    a = registry.get("email", base_url="https://a.example", headers={"Authorization": "Bearer 1"})
+    b = registry.get("email", base_url="https://a.example", headers={"Authorization": "Bearer 2"})
+    again = registry.get("email", base_url="https://a.example", headers={"Authorization": "Bearer 1"})
+
+    assert a is again
+    assert a is not b
+    assert str(a.base_url) == "https://a.example"
+    assert a.headers["Authorization"] == "Bearer 1"
+    await registry.aclose()
+
+
+@pytest.mark.asyncio
+async def test_upstream_config_applied():
+    registry = HTTPClientRegistry(
+        {"default": UpstreamConfig(), "research": UpstreamConfig(timeout=300.0, connect_timeout=10.0)}
+    )
+    registry.configure("aios", timeout=2.5)
+
+    research = registry.get("research")
+    assert research.timeout == httpx.Timeout(300.0, connect=10.0)
+    assert registry.get("aios").timeout.read == 2.5
+    assert registry.get("aios", timeout=1.0).timeout.read == 1.0
+    await registry.aclose()
+
+
+def test_new_event_loop_gets_new_client():
+    registry = HTTPClientRegistry()
+
+    async def get():
+        return registry.get("aios")
+
+    first = asyncio.run(get())
+    second = asyncio.run(get())
+    assert first is not second
+    assert registry.stats()["created"] == 2
+
+
+def test_http2_only_with_h2_installed():
+    if not http_clients._has_h2:
+        assert http_clients.HTTP2_ENABLED is False
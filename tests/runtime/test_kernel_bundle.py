@@ -0,0 +1,195 @@
+"""
+Kernel Bundle Tests
+===================
+
+Tests for the compiled kernel bundle cache (runtime.kernel_bundle) and the
+loaders that read from it. Uses temporary kernel trees only.
+"""
+
+import json
+import os
+
+import pytest
+import yaml
+
+from runtime.kernel_bundle import (
+    KernelBundleCache,
+    KernelSource,
+    compile_kernel_bundle,
+)
+
+
+def _write_kernel(path, name, priority, rules):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        yaml.safe_dump({"kernel": {"name": name, "version": "1.0.0", "priority": priority, "rules": rules}})
+    )
+
+
+def _bump_mtime(path):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def kernel_tree(tmp_path):
+    root = tmp_path / "private" / "kernels"
+    _write_kernel(
+        root / "00_system" / "b.yaml",
+        "system_b",
+        20,
+        [{"id": "b1", "type": "safety"}, {"id": "b2", "type": "safety", "enabled": False}],
+    )
+    _write_kernel(root / "00_system" / "a.yaml", "system_a", 10, [{"id": "a1", "type": "capability"}])
+    _write_kernel(root / "90_project" / "p.yaml", "project", 1, [{"id": "p1", "type": "capability"}])
+    return tmp_path / "private"
+
+
+def _sources(kernel_tree):
+    return [
+        KernelSource(str(kernel_tree / "kernels" / "90_project" / "p.yaml"), "90_project", 90),
+        KernelSource(str(kernel_tree / "kernels" / "00_system" / "b.yaml"), "00_system", 0),
+        KernelSource(str(kernel_tree / "kernels" / "00_system" / "a.yaml"), "00_system", 0),
+    ]
+
+
+def test_compiled_rules_are_flattened_and_priority_sorted(kernel_tree):
+    bundle = compile_kernel_bundle(_sources(kernel_tree))
+
+    assert [r["id"] for r in bundle.rules] == ["a1", "b1", "p1"]
+    assert bundle.rules[0]["_kernel_name"] == "system_a"
+    assert bundle.rules[1]["_kernel_priority"] == 20
+    assert len(bundle.hashes) == 3 and not bundle.errors
+
+
+def test_warm_load_served_from_memory_and_disk(kernel_tree, tmp_path):
+    cache_dir = tmp_path / "bundles"
+    sources = _sources(kernel_tree)
+
+    first = KernelBundleCache(cache_dir=cache_dir, persist=True)
+    cold = first.load(sources)
+    warm = first.load(sources)
+    assert first.get_cache_stats()["compiles"] == 1
+    assert first.get_cache_stats()["memory_hits"] == 1
+
+    # Callers own what they get back
+    warm.rules[0]["id"] = "mutated"
+    assert first.load(sources).rules[0]["id"] == "a1"
+
+    # A new process reads the serialized bundle instead of re-parsing
+    second = KernelBundleCache(cache_dir=cache_dir, persist=True)
+    restored = second.load(sources)
+    assert second.get_cache_stats()["disk_hits"] == 1
+    assert second.get_cache_stats()["compiles"] == 0
+    assert restored.hashes == cold.hashes
+
+
+def test_modified_kernel_invalidates_bundle(kernel_tree, tmp_path):
+    cache = KernelBundleCache(cache_dir=tmp_path / "bundles", persist=True)
+    sources = _sources(kernel_tree)
+    before = cache.load(sources)
+
+    path = kernel_tree / "kernels" / "00_system" / "a.yaml"
+    _write_kernel(path, "system_a", 10, [{"id": "a1", "type": "capability"}, {"id": "a2", "type": "capability"}])
+    _bump_mtime(path)
+    after = cache.load(sources)
+
+    assert cache.get_cache_stats()["stale"] == 1
+    assert cache.get_cache_stats()["compiles"] == 2
+    assert [r["id"] for r in after.rules] == ["a1", "a2", "b1", "p1"]
+    assert after.hashes[str(path)] != before.hashes[str(path)]
+
+
+def test_parse_errors_are_reported_and_not_cached(kernel_tree, tmp_path):
+    broken = kernel_tree / "kernels" / "00_system" / "a.yaml"
+    broken.write_text("kernel: [unclosed")
+    cache = KernelBundleCache(cache_dir=tmp_path / "bundles", persist=True)
+
+    bundle = cache.load(_sources(kernel_tree))
+    cache.load(_sources(kernel_tree))
+
+    assert str(broken) in bundle.errors
+    assert [r["id"] for r in bundle.rules] == ["b1", "p1"]
+    assert cache.get_cache_stats()["compiles"] == 2
+    assert not list((tmp_path / "bundles").glob("*.json"))
+
+
+def _rewrite_keeping_stamp(path, text):
+    """Tamper with a file without changing its (mtime_ns, size)."""
+    st = os.stat(path)
+    assert len(text.encode()) == st.st_size
+    path.write_text(text)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+def test_verify_rehashes_when_stamp_is_forged(kernel_tree, tmp_path):
+    from core.kernels.integrity import hash_file
+
+    cache = KernelBundleCache(cache_dir=tmp_path / "bundles", persist=True)
+    sources = _sources(kernel_tree)
+    path = kernel_tree / "kernels" / "00_system" / "a.yaml"
+    before = cache.load(sources)
+    digest = hash_file(path)
+
+    _rewrite_keeping_stamp(path, path.read_text().replace("system_a", "system_x"))
+    after = cache.load(sources, verify=True)
+
+    assert hash_file(path) != digest
+    assert after.hashes[str(path)] == hash_file(path) != before.hashes[str(path)]
+    assert after.documents[str(path)]["kernel"]["name"] == "system_x"
+    assert cache.get_cache_stats()["compiles"] == 2
+
+
+def test_disk_cache_is_private_json(kernel_tree, tmp_path):
+    cache_dir = tmp_path / "bundles"
+    sources = _sources(kernel_tree)
+    KernelBundleCache(cache_dir=cache_dir, persist=True).load(sources)
+
+    (entry,) = cache_dir.glob("*.json")
+    assert json.loads(entry.read_text())["hashes"]
+    assert cache_dir.stat().st_mode & 0o777 == 0o700
+    assert entry.stat().st_mode & 0o777 == 0o600
+
+    # A cache file others could have written is ignored
+    os.chmod(entry, 0o666)
+    reader = KernelBundleCache(cache_dir=cache_dir, persist=True)
+    reader.load(sources)
+    assert reader.get_cache_stats()["disk_hits"] == 0
+    assert reader.get_cache_stats()["compiles"] == 1
+
+
+def test_yaml_only_values_survive_the_disk_cache(kernel_tree, tmp_path):
+    path = kernel_tree / "kernels" / "00_system" / "a.yaml"
+    path.write_text(
+        path.read_text()
+        + "released: 2024-01-01\n"
+        + "order: {1: first, 2: second}\n"
+        + "tags: !!set {x, y}\n"
+        + "blob: !!binary aGk=\n"
+        + "odd: {__map__: 1}\n"
+    )
+    cache_dir = tmp_path / "bundles"
+    compiled = KernelBundleCache(cache_dir=cache_dir, persist=True).load(_sources(kernel_tree))
+
+    reader = KernelBundleCache(cache_dir=cache_dir, persist=True)
+    restored = reader.load(_sources(kernel_tree))
+
+    assert reader.get_cache_stats()["disk_hits"] == 1
+    assert restored.documents == compiled.documents
+    assert restored.documents[str(path)]["order"] == {1: "first", 2: "second"}
+    assert restored.rules == compiled.rules
+
+
+def test_private_loader_reads_rules_from_bundle(kernel_tree, monkeypatch):
+    from runtime import kernel_loader
+
+    # The integrity check tracks the repo's own kernels, not temp trees
+    monkeypatch.setattr(kernel_loader, "_check_private_integrity", lambda *a, **kw: None)
+
+    kernels = kernel_loader.load_all_private_kernels(str(kernel_tree), check_integrity=False)
+    rules = kernel_loader.get_enabled_rules(str(kernel_tree))
+
+    assert [k["kernel"]["name"] for k in kernels] == ["system_a", "system_b", "project"]
+    assert kernels[0]["_meta"]["layer"] == "00_system"
+    assert kernels[2]["_source_file"].endswith("p.yaml")
+    assert [r["id"] for r in rules] == ["a1", "b1", "p1"]
@@ -0,0 +1,275 @@
+"""
+L9 Tests - RedisClient batched / pipelined operations
+
+Uses an in-memory fake of redis.asyncio that counts network round trips
+(one per command, pipeline.execute() or script call) and emulates the
+client's Lua scripts in Python.
+
+Ensures:
+- enqueue_task / dequeue_task / increment_rate_limit are one round trip each.
+- enqueue_many / dequeue_many / mget_task_context / set_many preserve ordering.
+- set_nx_many claims only absent keys in one round trip.
+- RateLimiter.check_and_increment uses the atomic check-and-increment path.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from runtime import redis_client as rc
+from runtime.redis_client import RedisClient
+
+
+class _FakePipeline:
+    def __init__(self, redis: "_FakeRedis"):
+        self._redis = redis
+        self._ops: list[tuple[str, tuple]] = []
+
+    def setex(self, key, ttl, value):
+        self._ops.append(("setex", (key, ttl, value)))
+        return self
+
+    def zadd(self, key, mapping):
+        self._ops.append(("zadd", (key, mapping)))
+        return self
+
+    def set(self, key, value, nx=False, ex=None):
+        self._ops.append(("set", (key, value, nx, ex)))
+        return self
+
+    async def execute(self):
+        self._redis.round_trips += 1
+        results = []
+        for name, args in self._ops:
+            results.append(getattr(self._redis, f"_{name}")(*args))
+        return results
+
+
+class _FakeRedis:
+    """Minimal redis.asyncio.Redis stand-in (decode_responses=True)."""
+
+    def __init__(self) -> None:
+        self.kv: dict[str, str] = {}
+        self.zsets: dict[str, dict[str, float]] = {}
+        self.ttls: dict[str, int] = {}
+        self.round_trips = 0
+
+    # -- sync helpers (shared by pipeline and scripts) --------------------
+    def _setex(self, key, ttl, value):
+        self.kv[key] = str(value)
+        self.ttls[key] = ttl
+        return True
+
+    def _set(self, key, value, nx=False, ex=None):
+        if nx and key in self.kv:
+            return None
+        self.kv[key] = str(value)
+        if ex:
+            self.ttls[key] = ex
+        return True
+
+    def _zadd(self, key, mapping):
+        self.zsets.setdefault(key, {}).update(mapping)
+        return len(mapping)
+
+    def _zpopmin(self, key, count):
+        zset = self.zsets.get(key, {})
+        members = sorted(zset.items(), key=lambda kv: kv[1])[:count]
+        for member, _ in members:
+            del zset[member]
+        return members
+
+    # -- async API ---------------------------------------------------------
+    def pipeline(self, transaction: bool = True):
+        return _FakePipeline(self)
+
+    def register_script(self, source: str):
+        impl = {
+            rc.DEQUEUE_SCRIPT: self._dequeue_script,
+            rc.INCREMENT_SCRIPT: self._increment_script,
+            rc.CHECK_AND_INCREMENT_SCRIPT: self._check_and_increment_script,
+        }[source]
+
+        async def _call(keys, args):
+            self.round_trips += 1
+            return impl(keys, args)
+
+        return _call
+
+    def _dequeue_script(self, keys, args):
+        prefix, count = args
+        out = []
+        for member, _ in self._zpopmin(keys[0], int(count)):
+            data = self.kv.pop(prefix + member, None)
+            if data is not None:
+                out.append(data)
+        return out
+
+    def _increment_script(self, keys, args):
+        count = int(self.kv.get(keys[0], 0)) + 1
+        self.kv[keys[0]] = str(count)
+        if count == 1:
+            self.ttls[keys[0]] = int(args[0])
+        return count
+
+    def _check_and_increment_script(self, keys, args):
+        current = int(self.kv.get(keys[0], 0))
+        if current >= int(args[0]):
+            return [0, current]
+        return [1, self._increment_script(keys, [args[1]])]
+
+    async def get(self, key):
+        self.round_trips += 1
+        return self.kv.get(key)
+
+    async def mget(self, keys):
+        self.round_trips += 1
+        return [self.kv.get(k) for k in keys]
+
+    async def mset(self, mapping):
+        self.round_trips += 1
+        self.kv.update({k: str(v) for k, v in mapping.items()})
+        return True
+
+    async def setex(self, key, ttl, value):
+        self.round_trips += 1
+        return self._setex(key, ttl, value)
+
+    async def delete(self, *keys):
+        self.round_trips += 1
+        return sum(1 for k in keys if self.kv.pop(k, None) is not None)
+
+    async def zcard(self, key):
+        self.round_trips += 1
+        return len(self.zsets.get(key, {}))
+
+    async def scan_iter(self, match: str, count: int | None = None):
+        import fnmatch
+
+        self.round_trips += 1
+        for key in list(self.kv):
+            if fnmatch.fnmatch(key, match):
+                yield key
+
+
+@pytest.fixture
+def fake_redis() -> _FakeRedis:
+    return _FakeRedis()
+
+
+@pytest.fixture
+def client(fake_redis: _FakeRedis) -> RedisClient:
+    c = RedisClient(max_connections=8, scan_count=250)
+    c._client = fake_redis
+    c._available = True
+    return c
+
+
+@pytest.mark.asyncio
+async def test_enqueue_and_dequeue_are_single_round_trips(client, fake_redis):
+    task_id = await client.enqueue_task("l9:tasks", {"name": "a"}, priority=3)
+    assert task_id is not None
+    assert fake_redis.round_trips == 1
+
+    fake_redis.round_trips = 0
+    task = await client.dequeue_task("l9:tasks")
+    assert task["task_id"] == task_id
+    assert task["priority"] == 3
+    assert fake_redis.round_trips == 1
+    # payload removed together with the queue entry
+    assert not any(":task:" in k for k in fake_redis.kv)
+
+
+@pytest.mark.asyncio
+async def test_dequeue_empty_queue_returns_none(client):
+    assert await client.dequeue_task("l9:empty") is None
+
+
+@pytest.mark.asyncio
+async def test_enqueue_many_dequeue_many_priority_order(client, fake_redis):
+    ids = await client.enqueue_many(
+        "l9:tasks",
+        [({"name": "low"}, 9), ({"name": "high"}, 1), {"name": "default"}],
+    )
+    assert len(ids) == 3
+    assert fake_redis.round_trips == 1
+
+    fake_redis.round_trips = 0
+    tasks = await client.dequeue_many("l9:tasks", 10)
+    assert [t["name"] for t in tasks] == ["high", "default", "low"]
+    assert fake_redis.round_trips == 1
+    assert await client.queue_size("l9:tasks") == 0
+
+
+@pytest.mark.asyncio
+async def test_mget_task_context_and_set_many(client, fake_redis):
+    await client.set_task_context("t1", {"step": 1})
+    fake_redis.round_trips = 0
+
+    contexts = await client.mget_task_context(["t1", "missing"])
+    assert contexts == {"t1": {"step": 1}, "missing": {}}
+    assert fake_redis.round_trips == 1
+
+    fake_redis.round_trips = 0
+    assert await client.set_many({"a": "1", "b": "2"}, ttl=30)
+    assert fake_redis.round_trips == 1
+    assert await client.mget(["a", "b", "c"]) == ["1", "2", None]
+
+
+@pytest.mark.asyncio
+async def test_set_nx_many_claims_absent_keys(client, fake_redis):
+    assert await client.set_nx_many(["k1", "k2"], ttl=60) == [True, True]
+    assert fake_redis.round_trips == 1
+
+    fake_redis.round_trips = 0
+    assert await client.set_nx_many(["k2", "k3"], ttl=60) == [False, True]
+    assert fake_redis.round_trips == 1
+    assert fake_redis.ttls[f"{rc.DEFAULT_TENANT_ID}:k3"] == 60
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_paths_single_round_trip(client, fake_redis):
+    assert await client.increment_rate_limit("rate_limit:x", ttl=60) == 1
+    assert fake_redis.round_trips == 1
+
+    fake_redis.round_trips = 0
+    allowed, count = await client.check_and_increment_rate_limit(
+        "rate_limit:y", limit=2, ttl=60
+    )
+    assert (allowed, count) == (True, 1)
+    assert fake_redis.round_trips == 1
+
+    await client.check_and_increment_rate_limit("rate_limit:y", limit=2)
+    allowed, count = await client.check_and_increment_rate_limit(
+        "rate_limit:y", limit=2
+    )
+    assert (allowed, count) == (False, 2)
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_uses_atomic_redis_path(client, fake_redis):
+    from runtime.rate_limiter import RateLimiter
+
+    limiter = RateLimiter(window_seconds=60)
+    limiter._redis_client = client
+    limiter._redis_available = True
+
+    assert await limiter.check_and_increment("google", limit=1) is True
+    fake_redis.round_trips = 0
+    assert await limiter.check_and_increment("google", limit=1) is False
+    assert fake_redis.round_trips == 1
+
+    await limiter.reset()
+    assert await limiter.get_usage("google") == 0
+
+
+@pytest.mark.asyncio
+async def test_unavailable_client_batch_apis_degrade():
+    c = RedisClient()
+    assert await c.enqueue_many("q", [{"a": 1}]) == []
+    assert await c.dequeue_many("q", 5) == []
+    assert await c.mget_task_context(["t"]) == {}
+    assert await c.set_many({"a": "1"}) is False
+    assert await c.set_nx_many(["a"], ttl=60) is None
+    assert await c.mget(["a"]) == [None]
+    assert await c.keys("*") == []
@@ -0,0 +1,200 @@
+"""
+L9 Tests - WebSocketOrchestrator Fan-out
+Version: 1.0.0
+
+Covers:
+- single encode per broadcast
+- slow consumer isolation
+- drop / coalesce / disconnect policies
+- coalesce_key replacement
+- fan-out metrics
+"""
+
+import asyncio
+import json
+
+import pytest
+
+try:
+    from runtime.websocket_orchestrator import (
+        SlowConsumerPolicy,
+        WebSocketOrchestrator,
+        encode_frame,
+    )
+
+    HAS_ORCHESTRATOR = True
+except ImportError:
+    HAS_ORCHESTRATOR = False
+
+from core.schemas.ws_event_stream import EventMessage, EventType
+
+
+class FakeWebSocket:
+    def __init__(self, delay: float = 0.0):
+        self.sent = []
+        self.delay = delay
+        self.gate = None
+        self.closed = False
+        self.close_code = None
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, data):
+        if self.gate is not None:
+            await self.gate.wait()
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.sent.append(json.loads(data))
+
+    async def close(self, code: int = 1000):
+        self.closed = True
+        self.close_code = code
+
+
+def _event(n: int) -> EventMessage:
+    return EventMessage(type=EventType.LOG, payload={"n": n})
+
+
+pytestmark = [
+    pytest.mark.skipif(not HAS_ORCHESTRATOR, reason="WebSocketOrchestrator not importable"),
+    pytest.mark.asyncio,
+]
+
+
+async def test_broadcast_encodes_once(monkeypatch):
+    orch = WebSocketOrchestrator()
+    sockets = [FakeWebSocket() for _ in range(5)]
+    for i, ws in enumerate(sockets):
+        await orch.register(f"a{i}", ws)
+
+    calls = []
+    original = EventMessage.model_dump_json
+
+    def counting(self, *args, **kwargs):
+        calls.append(1)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(EventMessage, "model_dump_json", counting)
+    event = _event(1)
+    assert await orch.broadcast(event) == 5
+    await orch.flush(timeout=1)
+
+    assert len(calls) == 1
+    expected = json.loads(encode_frame(event))
+    assert all(ws.sent == [expected] for ws in sockets)
+    await orch.close()
+
+
+async def test_slow_consumer_does_not_block_broadcast():
+    orch = WebSocketOrchestrator()
+    slow = FakeWebSocket()
+    slow.gate = asyncio.Event()
+    fast = FakeWebSocket()
+    await orch.register("slow", slow)
+    await orch.register("fast", fast)
+
+    for n in range(3):
+        assert await asyncio.wait_for(orch.broadcast(_event(n)), 0.5) == 2
+    await asyncio.sleep(0.01)
+
+    assert [f["payload"]["n"] for f in fast.sent] == [0, 1, 2]
+    assert slow.sent == []
+
+    slow.gate.set()
+    await orch.flush(timeout=1)
+    assert [f["payload"]["n"] for f in slow.sent] == [0, 1, 2]
+    await orch.close()
+
+
+async def _fill(policy):
+    orch = WebSocketOrchestrator(max_queue=2, slow_consumer_policy=policy)
+    ws = FakeWebSocket()
+    ws.gate = asyncio.Event()
+    await orch.register("a", ws)
+    results = [await orch.dispatch_event("a", _event(0))]
+    await asyncio.sleep(0)  # writer picks up frame 0 and blocks on the gate
+    results += [await orch.dispatch_event("a", _event(n)) for n in range(1, 5)]
+    return orch, ws, results
+
+
+async def test_drop_policy_discards_new_frames():
+    orch, ws, results = await _fill(SlowConsumerPolicy.DROP)
+    ws.gate.set()
+    await orch.flush(timeout=1)
+
+    # frame 0 is in flight, 1-2 queued, 3-4 dropped
+    assert results == [True, True, True, False, False]
+    assert [f["payload"]["n"] for f in ws.sent] == [0, 1, 2]
+    assert orch.get_fanout_metrics()["frames_dropped"] == 2
+    await orch.close()
+
+
+async def test_coalesce_policy_keeps_newest_frames():
+    orch, ws, results = await _fill(SlowConsumerPolicy.COALESCE)
+    ws.gate.set()
+    await orch.flush(timeout=1)
+
+    assert all(results)
+    assert [f["payload"]["n"] for f in ws.sent] == [0, 3, 4]
+    assert orch.is_connected("a")
+    await orch.close()
+
+
+async def test_disconnect_policy_closes_slow_consumer():
+    orch, ws, results = await _fill(SlowConsumerPolicy.DISCONNECT)
+    await asyncio.sleep(0.01)
+
+    assert results[-1] is False
+    assert ws.closed and ws.close_code == 1013
+    assert not orch.is_connected("a")
+    assert orch.get_fanout_metrics()["slow_consumer_disconnects"] == 1
+
+
+async def test_send_timeout_disconnects():
+    orch = WebSocketOrchestrator(send_timeout=0.05)
+    ws = FakeWebSocket()
+    ws.gate = asyncio.Event()
+    await orch.register("a", ws)
+
+    await orch.dispatch_event("a", _event(1))
+    await asyncio.sleep(0.1)
+
+    assert ws.closed
+    assert not orch.is_connected("a")
+
+
+async def test_coalesce_key_replaces_queued_frame():
+    orch = WebSocketOrchestrator()
+    ws = FakeWebSocket()
+    ws.gate = asyncio.Event()
+    await orch.register("a", ws)
+
+    await orch.broadcast(_event(0))
+    await asyncio.sleep(0)  # writer picks up frame 0
+    await orch.broadcast(_event(1), coalesce_key="status")
+    await orch.broadcast(_event(2), coalesce_key="status")
+    ws.gate.set()
+    await orch.flush(timeout=1)
+
+    assert [f["payload"]["n"] for f in ws.sent] == [0, 2]
+    metrics = orch.get_fanout_metrics()
+    assert metrics["frames_coalesced"] == 1
+    assert metrics["frames_sent"] == 2
+    assert metrics["broadcasts"] == 3
+    await orch.close()
+
+
+async def test_failed_send_unregisters_agent():
+    orch = WebSocketOrchestrator()
+
+    class Broken(FakeWebSocket):
+        async def send_text(self, data):
+            raise ConnectionError("gone")
+
+    await orch.register("a", Broken())
+    await orch.dispatch_event("a", {"type": "log", "payload": {}})
+    await asyncio.sleep(0.01)
+
+    assert not orch.is_connected("a")
+    assert orch.get_fanout_metrics()["send_errors"] == 1
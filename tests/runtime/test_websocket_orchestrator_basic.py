@@ -9,6 +9,8 @@ Covers:
 - broadcast
 """
 
+import json
+
 import pytest
 
 # Try to import the orchestrator - may fail if runtime path not in sys.path
@@ -35,6 +37,9 @@ class FakeWebSocket:
     async def send_json(self, data):
         self.sent.append(data)
 
+    async def send_text(self, data):
+        self.sent.append(json.loads(data))
+
     async def close(self, code: int = 1000):
         self.closed = True
         self.close_code = code
@@ -71,6 +76,7 @@ class TestWebSocketOrchestratorBasic:
         )
 
         await orch.dispatch_event("agent-1", event)
+        await orch.flush(timeout=1)
 
         assert len(ws.sent) == 1
         frame = ws.sent[0]
@@ -97,6 +103,7 @@ class TestWebSocketOrchestratorBasic:
         )
 
         count = await orch.broadcast(event, exclude={"a2"})
+        await orch.flush(timeout=1)
 
         assert count == 2
         assert len(ws1.sent) == 1
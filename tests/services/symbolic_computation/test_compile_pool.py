@@ -0,0 +1,246 @@
+"""
+Tests for the SymPy Compilation Pool
+====================================
+
+Tests for CompilePool / ArtifactCache covering:
+- Content-addressed artifact cache
+- In-flight dedup of concurrent compiles
+- Reuse of artifacts across pool restarts
+- Private cache directory and untrusted entries
+- SymPy autowrap (Cython) builds
+- Compile metrics via CodeGenerator
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from services.symbolic_computation.config import SymbolicComputationConfig
+from services.symbolic_computation.core.code_generator import CodeGenerator
+from services.symbolic_computation.core import compile_pool
+from services.symbolic_computation.core.compile_pool import ArtifactCache, CompilePool
+from services.symbolic_computation.core.metrics import MetricsCollector
+
+requires_gcc = pytest.mark.skipif(shutil.which("gcc") is None, reason="gcc not installed")
+requires_cython = pytest.mark.skipif(
+    importlib.util.find_spec("Cython") is None, reason="Cython not installed"
+)
+
+QUADRATIC_C = """#include <math.h>
+double quadratic(double x) {
+   return pow(x, 2) + 2*x + 1;
+}
+"""
+
+
+@pytest.fixture
+def group_writable_umask():
+    previous = os.umask(0o002)
+    yield
+    os.umask(previous)
+
+
+@pytest.fixture
+def config(tmp_path):
+    return SymbolicComputationConfig(
+        artifact_cache_dir=str(tmp_path / "artifacts"),
+        codegen_temp_dir=str(tmp_path / "codegen"),
+        compile_workers=2,
+    )
+
+
+class TestArtifactCache:
+    """Tests for the on-disk artifact cache."""
+
+    def test_key_is_content_addressed(self):
+        """Test that keys depend on content, not argument order."""
+        key = ArtifactCache.key("c", source="a", symbol="f")
+
+        assert key == ArtifactCache.key("c", symbol="f", source="a")
+        assert key != ArtifactCache.key("c", source="b", symbol="f")
+
+    def test_commit_and_lookup(self, tmp_path):
+        """Test that committed entries are found and the first writer wins."""
+        cache = ArtifactCache(tmp_path)
+        key = ArtifactCache.key("c", source="a")
+        assert cache.lookup(key) is None
+
+        first = cache.staging_dir()
+        (first / "out.so").write_text("first")
+        meta = cache.commit(key, first, {"library": "out.so"})
+
+        second = cache.staging_dir()
+        (second / "out.so").write_text("second")
+        cache.commit(key, second, {"library": "out.so"})
+
+        assert meta["library"] == "out.so"
+        assert (cache.entry_dir(key) / "out.so").read_text() == "first"
+        assert not first.exists() and not second.exists()
+
+    def test_root_is_private(self, tmp_path):
+        """Test that the cache root is created (or tightened to) mode 0700."""
+        created = ArtifactCache(tmp_path / "new")
+        shared = tmp_path / "shared"
+        shared.mkdir(mode=0o777)
+        os.chmod(shared, 0o777)
+        ArtifactCache(shared)
+
+        assert created.root.stat().st_mode & 0o777 == 0o700
+        assert shared.stat().st_mode & 0o777 == 0o700
+
+    def test_root_owned_by_another_user_is_refused(self, tmp_path, monkeypatch):
+        """Test that a root planted by another user is not used."""
+        other_uid = os.getuid() + 1
+        monkeypatch.setattr(compile_pool.os, "getuid", lambda: other_uid)
+
+        with pytest.raises(PermissionError):
+            ArtifactCache(tmp_path / "artifacts")
+
+    def test_untrusted_entries_are_ignored(self, tmp_path, monkeypatch):
+        """Test that entries writable by others or owned by another user are not loaded."""
+        cache = ArtifactCache(tmp_path)
+        key = ArtifactCache.key("c", source="a")
+        cache.commit(key, cache.staging_dir(), {"library": "out.so"})
+        assert cache.lookup(key) is not None
+
+        os.chmod(cache.entry_dir(key), 0o777)
+        assert cache.lookup(key) is None
+
+        os.chmod(cache.entry_dir(key), 0o700)
+        other_uid = os.getuid() + 1
+        monkeypatch.setattr(compile_pool.os, "getuid", lambda: other_uid)
+        assert cache.lookup(key) is None
+
+    def test_commit_is_private_regardless_of_umask(self, tmp_path, group_writable_umask):
+        """Test that committed entries are trusted under a group-writable umask."""
+        cache = ArtifactCache(tmp_path)
+        key = ArtifactCache.key("c", source="a")
+        staging = cache.staging_dir()
+        (staging / "out.so").write_text("built")
+        (staging / "build").mkdir()
+
+        assert cache.commit(key, staging, {"library": "out.so"}) is not None
+        entry = cache.entry_dir(key)
+        assert (entry / "meta.json").stat().st_mode & 0o777 == 0o600
+        assert (entry / "out.so").stat().st_mode & 0o777 == 0o600
+        assert (entry / "build").stat().st_mode & 0o777 == 0o700
+
+
+@requires_gcc
+class TestCompilePool:
+    """Tests for compiling C through the pool."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_compile(self, config):
+        """Test in-flight dedup and the in-memory fast path."""
+        pool = CompilePool(config=config)
+        try:
+            outcomes = await asyncio.gather(
+                *[pool.compile_c(QUADRATIC_C, "quadratic", arg_count=1) for _ in range(4)]
+            )
+            again = await pool.compile_c(QUADRATIC_C, "quadratic", arg_count=1)
+        finally:
+            pool.shutdown()
+
+        assert sorted(o.source for o in outcomes) == ["compiled", "shared", "shared", "shared"]
+        assert all(o.fn(3.0) == 16.0 for o in outcomes)
+        assert again.source == "memory"
+
+    @pytest.mark.asyncio
+    async def test_artifacts_survive_restart(self, config):
+        """Test that a new pool loads the earlier build from disk."""
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            first = await CompilePool(config=config, executor=executor).compile_c(
+                QUADRATIC_C, "quadratic", arg_count=1
+            )
+            restarted = await CompilePool(config=config, executor=executor).compile_c(
+                QUADRATIC_C, "quadratic", arg_count=1
+            )
+
+        assert first.source == "compiled"
+        assert restarted.source == "disk"
+        assert restarted.fn(1.0) == 4.0
+
+    @pytest.mark.asyncio
+    async def test_compile_under_group_writable_umask(self, config, group_writable_umask):
+        """Test that builds are cached and reused under umask 002."""
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            first = await CompilePool(config=config, executor=executor).compile_c(
+                QUADRATIC_C, "quadratic", arg_count=1
+            )
+            restarted = await CompilePool(config=config, executor=executor).compile_c(
+                QUADRATIC_C, "quadratic", arg_count=1
+            )
+
+        assert first.source == "compiled", first.error
+        assert restarted.source == "disk"
+        assert restarted.fn(2.0) == 9.0
+
+    @pytest.mark.asyncio
+    async def test_failed_compile(self, config):
+        """Test that compiler errors are returned and nothing is cached."""
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pool = CompilePool(config=config, executor=executor)
+            outcome = await pool.compile_c("double broken(", "broken")
+
+        assert outcome.fn is None
+        assert outcome.source == "failed"
+        assert "error" in outcome.error
+        assert list(pool.cache._staging_root.iterdir()) == []
+
+
+@requires_gcc
+class TestCodeGeneratorCompilation:
+    """Tests for generate -> compile through CodeGenerator."""
+
+    @pytest.mark.asyncio
+    async def test_generated_c_compiles_off_loop(self, config):
+        """Test compile_generated_async end to end with metrics."""
+        metrics = MetricsCollector(config=config)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            generator = CodeGenerator(
+                config=config,
+                metrics_collector=metrics,
+                compile_pool=CompilePool(config=config, executor=executor),
+            )
+            generated = await generator.generate_code(
+                expr="x**2 + y", variables=["x", "y"], language="C", function_name="f"
+            )
+            fn = await generator.compile_generated_async(
+                generated.source_code, "C", "f", arg_count=2
+            )
+            await generator.compile_generated_async(generated.source_code, "C", "f", arg_count=2)
+
+        assert fn(3.0, 1.0) == 10.0
+        summary = await metrics.get_metrics_summary()
+        assert summary.total_compile_jobs == 2
+        assert summary.compile_sources == {"compiled": 1, "memory": 1}
+        assert summary.compile_cache_hit_rate == 50.0
+        assert summary.max_loop_blocked_ms < summary.avg_compile_time_ms * 2
+
+
+@requires_gcc
+@requires_cython
+class TestAutowrap:
+    """Tests for SymPy autowrap builds (C via Cython)."""
+
+    @pytest.mark.asyncio
+    async def test_autowrap_builds_and_survives_restart(self, config):
+        """Test that an autowrap module is built once and reloaded from disk."""
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            first = await CompilePool(config=config, executor=executor).autowrap(
+                "x**2 + y", ["x", "y"]
+            )
+            restarted = await CompilePool(config=config, executor=executor).autowrap(
+                "x**2 + y", ["x", "y"]
+            )
+
+        assert first.source == "compiled", first.error
+        assert restarted.source == "disk"
+        assert restarted.fn(3.0, 1.0) == 10.0
@@ -6,6 +6,7 @@ Tests for ExpressionEvaluator class covering:
 - Happy path evaluation
 - Multiple backends
 - Caching behavior
+- Batch (column) evaluation
 - Error handling
 
 Target: >=85% coverage, >=95% pass rate
@@ -13,9 +14,11 @@ Target: >=85% coverage, >=95% pass rate
 
 from __future__ import annotations
 
+import numpy as np
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from services.symbolic_computation.core.cache_manager import CacheManager
 from services.symbolic_computation.core.expression_evaluator import ExpressionEvaluator
 from services.symbolic_computation.core.models import ComputationResult
 from services.symbolic_computation.config import SymbolicComputationConfig
@@ -199,6 +202,115 @@ class TestCaching:
         assert result.cache_hit is True
 
 
+    @pytest.mark.asyncio
+    async def test_results_are_keyed_on_variable_values(self):
+        """Test that a cached result is only reused for the same bindings."""
+        evaluator = ExpressionEvaluator(cache_manager=CacheManager())
+        
+        first = await evaluator.evaluate_expression("x - y", {"x": 5, "y": 2})
+        other = await evaluator.evaluate_expression("x - y", {"y": 2, "x": 7})
+        again = await evaluator.evaluate_expression("x - y", {"y": 2.0, "x": 5.0})
+        
+        assert (first.result, first.cache_hit) == (3.0, False)
+        assert (other.result, other.cache_hit) == (5.0, False)
+        assert (again.result, again.cache_hit) == (3.0, True)
+    
+    def test_expression_parsed_once(self):
+        """Test that compiling for new variable orders reuses the parse."""
+        evaluator = ExpressionEvaluator()
+        
+        f_xy = evaluator._get_compiled_function("x - y", ["x", "y"], "numpy")
+        f_yx = evaluator._get_compiled_function("x - y", ["y", "x"], "numpy")
+        
+        assert evaluator._get_compiled_function("x - y", ["x", "y"], "numpy") is f_xy
+        assert len(evaluator._parse_cache) == 1
+        assert len(evaluator._compile_cache) == 2
+        assert f_xy(5, 2) == 3
+        assert f_yx(5, 2) == -3
+
+
+class TestBatchEvaluation:
+    """Tests for column (batch) evaluation."""
+    
+    @pytest.fixture
+    def evaluator(self):
+        return ExpressionEvaluator()
+    
+    @pytest.mark.asyncio
+    async def test_batch_matches_scalar(self, evaluator):
+        """Test that batch results match per-row evaluation."""
+        x = np.linspace(-2, 2, 50)
+        y = np.arange(50)
+        
+        batch = await evaluator.evaluate_batch("x**2 + sin(y)", {"x": x, "y": y})
+        
+        assert batch.error is None
+        assert batch.rows == 50
+        for i in (0, 17, 49):
+            scalar = await evaluator.evaluate_expression(
+                "x**2 + sin(y)", {"x": x[i], "y": y[i]}
+            )
+            assert batch.results[i] == pytest.approx(scalar.result)
+    
+    @pytest.mark.asyncio
+    async def test_chunked_and_threaded(self, evaluator):
+        """Test that inputs larger than one chunk are split and reassembled."""
+        x = np.arange(10, dtype=np.float64)
+        
+        batch = await evaluator.evaluate_batch("2*x + c", {"x": x, "c": 1.0}, chunk_size=3)
+        
+        assert batch.chunks == 4
+        np.testing.assert_array_equal(batch.results, 2 * x + 1)
+    
+    @pytest.mark.asyncio
+    async def test_constant_and_empty_batches(self, evaluator):
+        """Test constant expressions broadcast and empty columns."""
+        constant = await evaluator.evaluate_batch("42", {"x": [1, 2, 3]})
+        empty = await evaluator.evaluate_batch("x + 1", {"x": []})
+        
+        np.testing.assert_array_equal(constant.results, [42, 42, 42])
+        assert empty.rows == 0
+        assert len(empty.results) == 0
+    
+    @pytest.mark.asyncio
+    async def test_scalar_backends(self, evaluator):
+        """Test math and mpmath backends evaluate row by row."""
+        x = [0.0, 1.0, 4.0]
+        
+        math_batch = await evaluator.evaluate_batch("sqrt(x)", {"x": x}, backend="math")
+        mp_batch = await evaluator.evaluate_batch("sqrt(x)", {"x": x}, backend="mpmath")
+        
+        assert math_batch.results.dtype == np.float64
+        np.testing.assert_allclose(math_batch.results, [0.0, 1.0, 2.0])
+        assert [float(v) for v in mp_batch.results] == [0.0, 1.0, 2.0]
+    
+    @pytest.mark.asyncio
+    async def test_memoryview_columns(self, evaluator):
+        """Test buffer-protocol columns are accepted."""
+        x = np.arange(4, dtype=np.float64)
+        
+        batch = await evaluator.evaluate_batch("x * 3", {"x": memoryview(x)})
+        
+        np.testing.assert_array_equal(batch.results, x * 3)
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "expr,columns,message",
+        [
+            ("x + y", {"x": [1, 2]}, "no column for variables: y"),
+            ("x + y", {"x": [1, 2], "y": [1, 2, 3]}, "different lengths"),
+            ("x", {"x": [[1, 2], [3, 4]]}, "one-dimensional"),
+            ("x", {"x": ["a", "b"]}, "numeric"),
+        ],
+    )
+    async def test_invalid_columns(self, evaluator, expr, columns, message):
+        """Test that bad columns return an error result."""
+        batch = await evaluator.evaluate_batch(expr, columns)
+        
+        assert batch.results is None
+        assert message in batch.error
+
+
 class TestErrorHandling:
     """Tests for error handling."""
     
@@ -214,13 +214,67 @@ class TestSymPyToolIntegration:
         """Test tool definition generation."""
         definitions = tool.get_tool_definitions()
         
-        assert len(definitions) == 3
+        assert len(definitions) == 4
         names = [d["name"] for d in definitions]
         assert "symbolic_evaluate" in names
+        assert "symbolic_evaluate_batch" in names
         assert "symbolic_codegen" in names
         assert "symbolic_optimize" in names
 
 
+class TestBatchRoute:
+    """Integration tests for POST /symbolic/evaluate_batch."""
+    
+    @pytest.fixture
+    def client(self):
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+        from services.symbolic_computation.api.routes import router
+        
+        app = FastAPI()
+        app.include_router(router)
+        return TestClient(app)
+    
+    def test_evaluate_batch(self, client):
+        """Test batch evaluation returns one value per row."""
+        response = client.post(
+            "/symbolic/evaluate_batch",
+            json={"expression": "x**2 + y", "columns": {"x": [1, 2, 3], "y": [0, 1, 2]}},
+        )
+        
+        assert response.status_code == 200
+        body = response.json()
+        assert body["results"] == [1.0, 5.0, 11.0]
+        assert body["rows"] == 3
+    
+    @pytest.mark.parametrize(
+        "expression,backend,expected",
+        [
+            ("sqrt(x)", "mpmath", [[0.0, 1.0], [2.0, 0.0]]),
+            ("I*x", "numpy", [[0.0, -1.0], [0.0, 4.0]]),
+        ],
+    )
+    def test_complex_results_are_real_imag_pairs(self, client, expression, backend, expected):
+        """Test complex results serialize as [real, imag] pairs on every backend."""
+        x = [-1, 4]
+        response = client.post(
+            "/symbolic/evaluate_batch",
+            json={"expression": expression, "columns": {"x": x}, "backend": backend},
+        )
+        
+        assert response.status_code == 200
+        assert response.json()["results"] == expected
+    
+    def test_dangerous_expression_is_rejected(self, client):
+        """Test the validator runs before batch evaluation."""
+        response = client.post(
+            "/symbolic/evaluate_batch",
+            json={"expression": "sympify('x')", "columns": {"x": [1]}},
+        )
+        
+        assert response.status_code == 400
+
+
 class TestOptimizerIntegration:
     """Integration tests for Optimizer."""
     
@@ -0,0 +1,123 @@
+"""
+ExecutorToolRegistry approved-tool binding cache.
+
+Ensures:
+- Repeated get_approved_tools calls reuse the cached bindings.
+- register/enable/disable, approve/revoke and policy reload invalidate it.
+- Precomputed tool definitions match AgentInstance.get_tool_definitions.
+"""
+
+from pathlib import Path
+
+import yaml
+
+from core.agents.agent_instance import AgentInstance
+from core.agents.schemas import AgentConfig, AgentTask, TaskKind
+from core.tools.base_registry import ToolMetadata, ToolRegistry, ToolType
+from core.tools.registry_adapter import ExecutorToolRegistry
+
+
+def _registry(*tool_ids: str) -> ToolRegistry:
+    registry = ToolRegistry()
+    for tool_id in tool_ids:
+        registry.register(
+            ToolMetadata(
+                id=tool_id,
+                name=tool_id,
+                description=f"{tool_id} tool",
+                tool_type=ToolType.CUSTOM,
+            )
+        )
+    return registry
+
+
+def _ids(bindings) -> list[str]:
+    return [b.tool_id for b in bindings]
+
+
+def test_bindings_cached_until_tool_set_changes():
+    base = _registry("memory_search", "web_search")
+    adapter = ExecutorToolRegistry(base_registry=base, governance_enabled=False)
+
+    first = adapter.get_approved_tools("L", "igor")
+    second = adapter.get_approved_tools("L", "igor")
+    assert _ids(first) == _ids(second) == ["memory_search", "web_search"]
+    assert adapter.get_binding_cache_stats()["hits"] == 1
+
+    base.disable("web_search")
+    assert _ids(adapter.get_approved_tools("L", "igor")) == ["memory_search"]
+
+    base.enable("web_search")
+    adapter.register_tool("calc", "Calc", "calculator", executor=lambda: 1)
+    assert _ids(adapter.get_approved_tools("L", "igor")) == [
+        "memory_search",
+        "web_search",
+        "calc",
+    ]
+
+
+def test_approve_and_revoke_invalidate_bindings():
+    adapter = ExecutorToolRegistry(
+        base_registry=_registry("memory_search", "http_request"),
+        governance_enabled=True,
+    )
+
+    assert _ids(adapter.get_approved_tools("L", "igor")) == ["memory_search"]
+
+    adapter.approve_tool("L", "http_request")
+    assert "http_request" in _ids(adapter.get_approved_tools("L", "igor"))
+
+    adapter.revoke_tool("L", "http_request")
+    assert "http_request" not in _ids(adapter.get_approved_tools("L", "igor"))
+
+
+def test_policy_reload_invalidates_bindings(tmp_path: Path):
+    from core.governance.engine import GovernanceEngineService
+
+    def write(directory: Path, effect: str) -> Path:
+        directory.mkdir()
+        policy = {
+            "id": "l-tools",
+            "name": "L tools",
+            "effect": effect,
+            "subjects": ["L"],
+            "actions": ["tool.execute"],
+            "resources": ["*"],
+        }
+        with open(directory / "policies.yaml", "w") as f:
+            yaml.dump({"policies": [policy]}, f)
+        return directory
+
+    allow_dir = write(tmp_path / "allow", "allow")
+    deny_dir = write(tmp_path / "deny", "deny")
+
+    engine = GovernanceEngineService(policy_dir=str(allow_dir))
+    adapter = ExecutorToolRegistry(
+        base_registry=_registry("memory_search"), governance_engine=engine
+    )
+    assert _ids(adapter.get_approved_tools("L", "igor")) == ["memory_search"]
+
+    engine.reload_policies(str(deny_dir))
+    assert adapter.get_approved_tools("L", "igor") == []
+
+
+def test_precomputed_definitions_match_agent_instance():
+    adapter = ExecutorToolRegistry(
+        base_registry=_registry("memory_search", "web_search"),
+        governance_enabled=False,
+    )
+    bindings = adapter.get_approved_tools("L", "igor")
+    definitions = adapter.get_tool_definition_set("L", "igor")
+
+    config = AgentConfig(agent_id="L", personality_id="L", tools=bindings)
+    task = AgentTask(kind=TaskKind.QUERY, agent_id="L", source_id="igor", payload={})
+
+    lazy = AgentInstance(config=config, task=task)
+    precomputed = AgentInstance(config=config, task=task, tool_definitions=definitions)
+
+    assert precomputed.get_tool_definitions() == lazy.get_tool_definitions()
+    assert [d["function"]["name"] for d in definitions.definitions] == [
+        "memory_search",
+        "web_search",
+    ]
+    assert precomputed.has_tool("web_search")
@@ -0,0 +1,171 @@
+"""
+Batch Ingestion Tests
+=====================
+
+Tests for the COPY-based BatchIngestionEngine
+(upgrades.packet_envelope.scalability) against a fake asyncpg pool.
+"""
+
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from uuid import UUID, uuid4
+
+import pytest
+
+scalability = pytest.importorskip("upgrades.packet_envelope.scalability")
+
+BatchIngestRequest = scalability.BatchIngestRequest
+BatchIngestionEngine = scalability.BatchIngestionEngine
+InMemoryIdempotencyStore = scalability.InMemoryIdempotencyStore
+PACKET_STORE_COLUMNS = scalability.PACKET_STORE_COLUMNS
+
+
+class FakeConnection:
+    def __init__(self, pool):
+        self.pool = pool
+        self.staged = []
+
+    @asynccontextmanager
+    async def transaction(self):
+        yield
+        self.staged = []
+
+    async def execute(self, sql, *args):
+        self.pool.statements.append(sql.strip().split()[0])
+
+    async def copy_records_to_table(self, table, records, columns):
+        records = list(records)
+        assert tuple(columns) == PACKET_STORE_COLUMNS
+        for record in records:
+            if record[1] == "poison":
+                raise ValueError("invalid input syntax for type json")
+        self.pool.copies.append(len(records))
+        self.staged = records
+
+    async def fetch(self, sql):
+        assert "ON CONFLICT (packet_id) DO NOTHING" in sql
+        inserted = []
+        for record in self.staged:
+            if record[0] not in self.pool.stored:
+                self.pool.stored[record[0]] = record
+                inserted.append({"packet_id": record[0]})
+        return inserted
+
+
+class FakePool:
+    def __init__(self):
+        self.stored = {}
+        self.copies = []
+        self.statements = []
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield FakeConnection(self)
+
+
+def _packets(n, start=0, **extra):
+    return [
+        {
+            "id": f"pkt-{i}",
+            "payload": {"data": i},
+            "timestamp": "2026-01-05T12:00:00Z",
+            **extra,
+        }
+        for i in range(start, start + n)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_sub_batches_are_copied_and_stored():
+    pool = FakePool()
+    engine = BatchIngestionEngine(batch_size=100, pool=pool)
+
+    result = await engine.ingest_batch(BatchIngestRequest(batch_id="b1", packets=_packets(250)))
+
+    assert result.successful_packets == 250 and result.failed_packets == 0
+    assert sorted(pool.copies) == [50, 100, 100]
+    record = next(iter(pool.stored.values()))
+    envelope = json.loads(record[2])
+    assert isinstance(record[0], UUID)
+    assert envelope["metadata"]["external_id"].startswith("pkt-")
+    assert envelope["payload"] == {"data": int(envelope["metadata"]["external_id"][4:])}
+
+
+@pytest.mark.asyncio
+async def test_existing_and_repeated_packets_are_duplicates():
+    pool = FakePool()
+    engine = BatchIngestionEngine(batch_size=50, pool=pool)
+    await engine.ingest_batch(BatchIngestRequest(batch_id="b1", packets=_packets(10)))
+
+    packets = _packets(20) + _packets(1, start=15)
+    result = await engine.ingest_batch(BatchIngestRequest(batch_id="b2", packets=packets))
+
+    assert result.successful_packets == 21
+    assert result.duplicate_packets == 11
+    assert len(pool.stored) == 20
+
+
+@pytest.mark.asyncio
+async def test_bad_packets_are_reported_by_index_and_the_rest_stored():
+    pool = FakePool()
+    engine = BatchIngestionEngine(batch_size=64, pool=pool)
+    packets = _packets(100)
+    packets[3] = {"payload": {}, "timestamp": "2026-01-05T12:00:00Z"}
+    packets[40]["timestamp"] = "not-a-date"
+    packets[77]["packet_type"] = "poison"
+
+    result = await engine.ingest_batch(BatchIngestRequest(batch_id="b3", packets=packets))
+
+    assert result.successful_packets == 97
+    assert result.failed_packets == 3
+    by_index = {e["index"]: e for e in result.errors}
+    assert set(by_index) == {3, 40, 77}
+    assert by_index[3]["stage"] == "validation" and "id" in by_index[3]["error"]
+    assert by_index[40]["packet"] == "pkt-40"
+    assert by_index[77]["stage"] == "write" and by_index[77]["packet"] == "pkt-77"
+    assert len(pool.stored) == 97
+
+
+@pytest.mark.asyncio
+async def test_idempotency_key_replays_result_and_dedupes_in_flight():
+    pool = FakePool()
+    store = InMemoryIdempotencyStore()
+    engine = BatchIngestionEngine(batch_size=10, pool=pool, idempotency_store=store)
+    request = BatchIngestRequest(batch_id="b4", packets=_packets(30), idempotency_key="key-1")
+
+    first, concurrent = await asyncio.gather(
+        engine.ingest_batch(request), engine.ingest_batch(request)
+    )
+    replay = await engine.ingest_batch(request)
+
+    assert first is concurrent
+    assert replay.successful_packets == 30 and replay.batch_id == "b4"
+    assert len(pool.copies) == 3
+    assert (await store.get("key-1"))["successful_packets"] == 30
+
+
+@pytest.mark.asyncio
+async def test_idempotency_entries_expire():
+    store = InMemoryIdempotencyStore()
+    await store.set("k", {"v": 1}, ttl_seconds=0)
+
+    assert await store.get("k") is None
+
+
+@pytest.mark.asyncio
+async def test_connection_failure_fails_every_packet_in_sub_batch():
+    class BrokenPool(FakePool):
+        @asynccontextmanager
+        async def acquire(self):
+            raise ConnectionError("connection refused")
+            yield
+
+    engine = BatchIngestionEngine(batch_size=5, pool=BrokenPool())
+    packets = _packets(5) + [{"id": str(uuid4()), "payload": {}, "timestamp": "bad"}]
+
+    result = await engine.ingest_batch(BatchIngestRequest(batch_id="b5", packets=packets))
+
+    assert result.successful_packets == 0
+    assert [e["index"] for e in result.errors] == [0, 1, 2, 3, 4, 5]
+    assert {e["stage"] for e in result.errors[:5]} == {"write"}
@@ -0,0 +1,144 @@
+"""
+Event Store Tests
+=================
+
+Tests for the offset-based EventStore, ReadModel snapshots and
+StreamConsumer (upgrades.packet_envelope.scalability) over the in-memory
+and segmented-file event logs (upgrades.packet_envelope.event_log).
+"""
+
+import os
+
+import pytest
+
+scalability = pytest.importorskip("upgrades.packet_envelope.scalability")
+event_log = pytest.importorskip("upgrades.packet_envelope.event_log")
+
+Event = scalability.Event
+EventStore = scalability.EventStore
+ReadModel = scalability.ReadModel
+StreamConsumer = scalability.StreamConsumer
+FileEventLog = event_log.FileEventLog
+
+
+def _events(n, start=0):
+    events = []
+    for i in range(start, start + n):
+        events.append(
+            Event(
+                event_id=f"evt-{i}",
+                event_type="PacketIngested",
+                aggregate_id=f"pkt-{i % 10}",
+                data={"source": "l9/test", "size_bytes": i},
+            )
+        )
+        events.append(
+            Event(
+                event_id=f"lin-{i}",
+                event_type="LineageUpdated",
+                aggregate_id=f"pkt-{i % 10}",
+                data={"parent_id": "root"},
+            )
+        )
+    return events
+
+
+@pytest.mark.asyncio
+async def test_file_log_offsets_survive_reopen_and_roll_segments(tmp_path):
+    store = EventStore(log=FileEventLog(str(tmp_path), segment_bytes=2048))
+    offsets = await store.append_events(_events(50))
+    await store.close()
+
+    store = EventStore(log=FileEventLog(str(tmp_path), segment_bytes=2048))
+    assert offsets == list(range(100))
+    assert await store.end_offset() == 100
+    assert await store.append_event(_events(1, start=50)[0]) == 100
+    assert len(os.listdir(tmp_path / "log")) > 2
+
+    batch = await store.read(94, 10)
+    assert [o for o, _ in batch] == list(range(94, 101))
+    assert batch[0][1].event_id == "evt-47"
+    history = await store.get_events("pkt-3", from_version=2)
+    assert [e.event_id for e in history] == ["evt-13", "lin-13", "evt-23", "lin-23", "evt-33", "lin-33", "evt-43", "lin-43"]
+    await store.close()
+
+
+@pytest.mark.asyncio
+async def test_torn_tail_is_truncated_on_open(tmp_path):
+    store = EventStore(log=FileEventLog(str(tmp_path)))
+    await store.append_events(_events(5))
+    await store.close()
+    segment = tmp_path / "log" / f"{0:020d}.log"
+    with open(segment, "ab") as f:
+        f.write(b"\x40\x00\x00\x00garbage")
+
+    store = EventStore(log=FileEventLog(str(tmp_path)))
+    assert await store.end_offset() == 10
+    assert await store.append_event(_events(1, start=5)[0]) == 10
+    assert (await store.read(10, 1))[0][1].event_id == "evt-5"
+    await store.close()
+
+
+@pytest.mark.asyncio
+async def test_read_model_rebuilds_from_snapshot_plus_tail(tmp_path):
+    store = EventStore(log=FileEventLog(str(tmp_path)))
+    await store.append_events(_events(100))
+    live = ReadModel()
+    assert await live.catch_up(store, batch_size=16, snapshot_interval=50) == 200
+    await store.append_events(_events(10, start=100))
+    await live.catch_up(store)
+
+    rebuilt = ReadModel()
+    replayed = await rebuilt.rebuild(store)
+    full = ReadModel()
+    await full.rebuild(store, use_snapshot=False)
+
+    snapshot_offset, _ = await store.load_snapshot("read_model")
+    assert replayed == 219 - snapshot_offset
+    assert rebuilt.last_offset == full.last_offset == 219
+    assert rebuilt.packets == full.packets == live.packets
+    assert len(await rebuilt.query_lineage("root")) == 110
+    await store.close()
+
+
+@pytest.mark.asyncio
+async def test_consumer_commits_group_offset_and_dead_letters_failures():
+    store = EventStore()
+    await store.append_events(_events(5))
+    seen = []
+
+    async def handler(event):
+        if event.event_id == "evt-2":
+            raise RuntimeError("boom")
+        seen.append(event.event_id)
+
+    consumer = StreamConsumer("projector", [handler], event_store=store, batch_size=4)
+    assert await consumer.poll_once() == 4
+    assert await store.committed_offset("projector") == 4
+    assert await consumer.poll_once() == 4
+    assert await consumer.poll_once() == 2
+    assert await consumer.poll_once() == 0
+
+    assert len(seen) == 9
+    dlq = await store.read_dlq()
+    assert len(dlq) == 1
+    assert dlq[0][1]["offset"] == 4 and dlq[0][1]["event"]["event_id"] == "evt-2"
+    assert "boom" in dlq[0][1]["error"]
+
+    other = StreamConsumer("audit", [handler], event_store=store)
+    assert await store.committed_offset("audit") == 0
+    await store.append_events(_events(1, start=5))
+    resumed = StreamConsumer("projector", [handler], event_store=store)
+    resumed.offset = await store.committed_offset("projector")
+    assert await resumed.poll_once() == 2
+    assert other.offset == 0
+
+
+@pytest.mark.asyncio
+async def test_aggregate_snapshots_track_versions():
+    store = EventStore(snapshot_interval=4)
+    await store.append_events(_events(4))
+
+    snapshot = await store.get_snapshot("pkt-1")
+    assert snapshot.aggregate_version == 2
+    assert snapshot.state == {"event_count": 2, "last_offset": 3}
@@ -8,8 +8,11 @@ Tests for world model initialization and status.
 import sys
 from pathlib import Path
 
-# Add tests directory to path for mock imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "tests"))
+# Add tests directory to path for mock imports (after the project root, so
+# tests/core and tests/memory do not shadow the real packages)
+TESTS_DIR = str(Path(__file__).parent.parent.parent / "tests")
+if TESTS_DIR not in sys.path:
+    sys.path.append(TESTS_DIR)
 
 from mocks.world_model_mocks import get_wm_status
 
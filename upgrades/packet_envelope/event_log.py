@@ -0,0 +1,499 @@
+"""
+upgrades/packet_envelope/event_log.py
+Durable append-only event logs for the Phase 4 event store
+
+Backends share one async interface (records are JSON-able dicts):
+
+  append(records) -> offsets          monotonically increasing, gap-free
+  read(from_offset, max_records)      batch fetch -> [(offset, record)]
+  end_offset()                        next offset to be assigned
+  commit_offset(group, next_offset) / get_offset(group)
+  save_snapshot(name, offset, state) / load_snapshot(name)
+  dlq_append(record) / dlq_read(from_offset, max_records)
+  close()
+
+  • InMemoryEventLog: tests and single-process use
+  • FileEventLog: segmented, memory-mapped local files (CRC-checked frames,
+    torn tails truncated on open), consumer offsets and snapshots written
+    atomically next to the segments
+  • PostgresEventLog: event_log / event_consumer_offsets / event_snapshots /
+    event_dlq tables (migration 0014_event_log); appends are serialized with
+    an advisory lock so offsets follow commit order
+"""
+
+import asyncio
+import bisect
+import json
+import logging
+import mmap
+import os
+import struct
+import zlib
+from array import array
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+LogRecord = Tuple[int, Dict[str, Any]]
+
+DEFAULT_SEGMENT_BYTES = 64 * 1024 * 1024
+SEGMENT_SUFFIX = ".log"
+
+# Frame header: payload length, CRC32 of payload
+_FRAME = struct.Struct("<II")
+
+
+def _dumps(obj: Any) -> bytes:
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str)
+    return json.dumps(obj, default=str, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(data: Any) -> Any:
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(bytes(data))
+
+
+def _atomic_write(path: str, data: bytes, fsync: bool) -> None:
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+        if fsync:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+# ============================================================================
+# IN-MEMORY
+# ============================================================================
+
+
+class InMemoryEventLog:
+    """Event log kept in process memory (not durable)"""
+
+    def __init__(self):
+        self._records: List[Dict[str, Any]] = []
+        self._offsets: Dict[str, int] = {}
+        self._snapshots: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+        self._dlq: List[Dict[str, Any]] = []
+
+    async def append(self, records: Sequence[Dict[str, Any]]) -> List[int]:
+        start = len(self._records)
+        self._records.extend(records)
+        return list(range(start, len(self._records)))
+
+    async def read(self, from_offset: int, max_records: int = 1000) -> List[LogRecord]:
+        end = min(from_offset + max_records, len(self._records))
+        return [(o, self._records[o]) for o in range(max(from_offset, 0), end)]
+
+    async def end_offset(self) -> int:
+        return len(self._records)
+
+    async def commit_offset(self, group: str, next_offset: int) -> None:
+        self._offsets[group] = next_offset
+
+    async def get_offset(self, group: str) -> Optional[int]:
+        return self._offsets.get(group)
+
+    async def save_snapshot(self, name: str, offset: int, state: Dict[str, Any]) -> None:
+        self._snapshots[name] = (offset, state)
+
+    async def load_snapshot(self, name: str) -> Optional[Tuple[int, Dict[str, Any]]]:
+        return self._snapshots.get(name)
+
+    async def dlq_append(self, record: Dict[str, Any]) -> int:
+        self._dlq.append(record)
+        return len(self._dlq) - 1
+
+    async def dlq_read(self, from_offset: int = 0, max_records: int = 100) -> List[LogRecord]:
+        end = min(from_offset + max_records, len(self._dlq))
+        return [(o, self._dlq[o]) for o in range(max(from_offset, 0), end)]
+
+    async def close(self) -> None:
+        pass
+
+
+# ============================================================================
+# SEGMENTED FILES
+# ============================================================================
+
+
+class _Segment:
+    """One segment file: frames for offsets [base_offset, base_offset + len(positions))"""
+
+    __slots__ = ("base_offset", "path", "positions", "size", "_file", "_mmap", "_mapped")
+
+    def __init__(self, base_offset: int, path: str):
+        self.base_offset = base_offset
+        self.path = path
+        self.positions = array("Q")
+        self.size = 0
+        self._file = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._mapped = 0
+
+    def recover(self) -> None:
+        """Index frames; truncate a torn or corrupt tail."""
+        size = os.path.getsize(self.path)
+        pos = 0
+        if size:
+            with open(self.path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                while pos + _FRAME.size <= size:
+                    length, crc = _FRAME.unpack_from(mm, pos)
+                    end = pos + _FRAME.size + length
+                    if end > size or zlib.crc32(mm[pos + _FRAME.size : end]) != crc:
+                        break
+                    self.positions.append(pos)
+                    pos = end
+        if pos != size:
+            logger.warning(f"Truncating torn tail of {self.path} at byte {pos} (was {size})")
+            with open(self.path, "r+b") as f:
+                f.truncate(pos)
+        self.size = pos
+
+    def view(self) -> mmap.mmap:
+        if self._mmap is None or self._mapped < self.size:
+            if self._mmap is not None:
+                self._mmap.close()
+            if self._file is None:
+                self._file = open(self.path, "rb")
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._mapped = self.size
+        return self._mmap
+
+    def read(self, index: int) -> Dict[str, Any]:
+        mm = self.view()
+        pos = self.positions[index]
+        length, _ = _FRAME.unpack_from(mm, pos)
+        start = pos + _FRAME.size
+        return _loads(mm[start : start + length])
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class SegmentedLog:
+    """
+    Synchronous segmented append-only log.
+
+    Segments are named by their base offset (00000000000000000000.log) and
+    rolled at segment_bytes. Reads go through read-only mmaps.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+        fsync: bool = False,
+    ):
+        """
+        Args:
+            directory: Segment directory (created if missing)
+            segment_bytes: Roll to a new segment past this size
+            fsync: fsync after every append (otherwise flushed only)
+        """
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.fsync = fsync
+        os.makedirs(directory, exist_ok=True)
+
+        self._segments: List[_Segment] = []
+        self._bases: List[int] = []
+        for name in sorted(os.listdir(directory)):
+            if name.endswith(SEGMENT_SUFFIX):
+                segment = _Segment(int(name[: -len(SEGMENT_SUFFIX)]), os.path.join(directory, name))
+                segment.recover()
+                self._segments.append(segment)
+                self._bases.append(segment.base_offset)
+        if not self._segments:
+            self._new_segment(0)
+        self._writer = open(self._segments[-1].path, "ab")
+
+    @property
+    def end_offset(self) -> int:
+        last = self._segments[-1]
+        return last.base_offset + len(last.positions)
+
+    def _new_segment(self, base_offset: int) -> _Segment:
+        path = os.path.join(self.directory, f"{base_offset:020d}{SEGMENT_SUFFIX}")
+        open(path, "ab").close()
+        segment = _Segment(base_offset, path)
+        self._segments.append(segment)
+        self._bases.append(base_offset)
+        return segment
+
+    def append(self, payloads: Sequence[bytes]) -> int:
+        """
+        Append encoded records.
+
+        Returns:
+            Offset of the first record
+        """
+        first = self.end_offset
+        pending = list(payloads)
+        while pending:
+            segment = self._segments[-1]
+            buffer = bytearray()
+            taken = 0
+            for payload in pending:
+                segment.positions.append(segment.size + len(buffer))
+                buffer += _FRAME.pack(len(payload), zlib.crc32(payload))
+                buffer += payload
+                taken += 1
+                if segment.size + len(buffer) >= self.segment_bytes:
+                    break
+            del pending[:taken]
+            self._writer.write(buffer)
+            self._writer.flush()
+            if self.fsync:
+                os.fsync(self._writer.fileno())
+            segment.size += len(buffer)
+
+            if segment.size >= self.segment_bytes:
+                self._writer.close()
+                self._new_segment(self.end_offset)
+                self._writer = open(self._segments[-1].path, "ab")
+        return first
+
+    def read(self, from_offset: int, max_records: int) -> List[LogRecord]:
+        out: List[LogRecord] = []
+        offset = max(from_offset, 0)
+        end = min(offset + max_records, self.end_offset)
+        while offset < end:
+            segment = self._segments[bisect.bisect_right(self._bases, offset) - 1]
+            base = segment.base_offset
+            stop = min(end, base + len(segment.positions))
+            mm = segment.view()
+            positions = segment.positions
+            unpack_from = _FRAME.unpack_from
+            for o in range(offset, stop):
+                pos = positions[o - base]
+                start = pos + _FRAME.size
+                out.append((o, _loads(mm[start : start + unpack_from(mm, pos)[0]])))
+            offset = stop
+        return out
+
+    def close(self) -> None:
+        self._writer.close()
+        for segment in self._segments:
+            segment.close()
+
+
+class FileEventLog:
+    """
+    Durable local event log: segmented memory-mapped files.
+
+    Layout:
+        <directory>/log/*.log          event segments
+        <directory>/dlq/*.log          dead-letter segments
+        <directory>/offsets.json       consumer group offsets
+        <directory>/snapshots/*.snap   projection snapshots
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+        fsync: bool = False,
+    ):
+        self.directory = directory
+        self.fsync = fsync
+        self._log = SegmentedLog(os.path.join(directory, "log"), segment_bytes, fsync)
+        self._dlq = SegmentedLog(os.path.join(directory, "dlq"), segment_bytes, fsync)
+        self._snapshot_dir = os.path.join(directory, "snapshots")
+        os.makedirs(self._snapshot_dir, exist_ok=True)
+        self._offsets_path = os.path.join(directory, "offsets.json")
+        self._offsets: Dict[str, int] = {}
+        if os.path.exists(self._offsets_path):
+            with open(self._offsets_path, "rb") as f:
+                self._offsets = _loads(f.read())
+
+    async def append(self, records: Sequence[Dict[str, Any]]) -> List[int]:
+        first = self._log.append([_dumps(r) for r in records])
+        return list(range(first, first + len(records)))
+
+    async def read(self, from_offset: int, max_records: int = 1000) -> List[LogRecord]:
+        return self._log.read(from_offset, max_records)
+
+    async def end_offset(self) -> int:
+        return self._log.end_offset
+
+    async def commit_offset(self, group: str, next_offset: int) -> None:
+        self._offsets[group] = next_offset
+        _atomic_write(self._offsets_path, _dumps(self._offsets), self.fsync)
+
+    async def get_offset(self, group: str) -> Optional[int]:
+        return self._offsets.get(group)
+
+    def _snapshot_path(self, name: str) -> str:
+        safe = "".join(c if c.isalnum() or c in "-_." else "_" for c in name)
+        return os.path.join(self._snapshot_dir, f"{safe}.snap")
+
+    async def save_snapshot(self, name: str, offset: int, state: Dict[str, Any]) -> None:
+        data = _dumps({"offset": offset, "created_at": datetime.utcnow().isoformat(), "state": state})
+        await asyncio.to_thread(_atomic_write, self._snapshot_path(name), data, self.fsync)
+
+    async def load_snapshot(self, name: str) -> Optional[Tuple[int, Dict[str, Any]]]:
+        path = self._snapshot_path(name)
+        if not os.path.exists(path):
+            return None
+        with open(path, "rb") as f:
+            snapshot = _loads(f.read())
+        return snapshot["offset"], snapshot["state"]
+
+    async def dlq_append(self, record: Dict[str, Any]) -> int:
+        return self._dlq.append([_dumps(record)])
+
+    async def dlq_read(self, from_offset: int = 0, max_records: int = 100) -> List[LogRecord]:
+        return self._dlq.read(from_offset, max_records)
+
+    async def close(self) -> None:
+        self._log.close()
+        self._dlq.close()
+
+
+# ============================================================================
+# POSTGRES
+# ============================================================================
+
+# Serializes appenders so offsets are gap-free and follow commit order
+_APPEND_LOCK_KEY = 0x4C39_4556  # "L9EV"
+
+
+class PostgresEventLog:
+    """Event log in Postgres (migration 0014_event_log)"""
+
+    def __init__(self, pool: Any):
+        """
+        Args:
+            pool: asyncpg pool
+        """
+        self._pool = pool
+
+    async def append(self, records: Sequence[Dict[str, Any]]) -> List[int]:
+        payloads = [_dumps(r).decode("utf-8") for r in records]
+        async with self._pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.execute("SELECT pg_advisory_xact_lock($1)", _APPEND_LOCK_KEY)
+                first = await conn.fetchval(
+                    "SELECT COALESCE(MAX(event_offset) + 1, 0) FROM event_log"
+                )
+                offsets = list(range(first, first + len(payloads)))
+                await conn.execute(
+                    """
+                    INSERT INTO event_log (event_offset, record)
+                    SELECT o, r::jsonb FROM unnest($1::bigint[], $2::text[]) AS t(o, r)
+                    """,
+                    offsets,
+                    payloads,
+                )
+        return offsets
+
+    async def read(self, from_offset: int, max_records: int = 1000) -> List[LogRecord]:
+        async with self._pool.acquire() as conn:
+            rows = await conn.fetch(
+                """
+                SELECT event_offset, record::text AS record FROM event_log
+                WHERE event_offset >= $1 ORDER BY event_offset LIMIT $2
+                """,
+                from_offset,
+                max_records,
+            )
+        return [(row["event_offset"], _loads(row["record"])) for row in rows]
+
+    async def end_offset(self) -> int:
+        async with self._pool.acquire() as conn:
+            return await conn.fetchval("SELECT COALESCE(MAX(event_offset) + 1, 0) FROM event_log")
+
+    async def commit_offset(self, group: str, next_offset: int) -> None:
+        async with self._pool.acquire() as conn:
+            await conn.execute(
+                """
+                INSERT INTO event_consumer_offsets (consumer_group, next_offset, updated_at)
+                VALUES ($1, $2, NOW())
+                ON CONFLICT (consumer_group) DO UPDATE
+                    SET next_offset = EXCLUDED.next_offset, updated_at = NOW()
+                """,
+                group,
+                next_offset,
+            )
+
+    async def get_offset(self, group: str) -> Optional[int]:
+        async with self._pool.acquire() as conn:
+            return await conn.fetchval(
+                "SELECT next_offset FROM event_consumer_offsets WHERE consumer_group = $1",
+                group,
+            )
+
+    async def save_snapshot(self, name: str, offset: int, state: Dict[str, Any]) -> None:
+        async with self._pool.acquire() as conn:
+            await conn.execute(
+                """
+                INSERT INTO event_snapshots (name, event_offset, state, created_at)
+                VALUES ($1, $2, $3::text::jsonb, NOW())
+                ON CONFLICT (name) DO UPDATE
+                    SET event_offset = EXCLUDED.event_offset, state = EXCLUDED.state,
+                        created_at = NOW()
+                """,
+                name,
+                offset,
+                _dumps(state).decode("utf-8"),
+            )
+
+    async def load_snapshot(self, name: str) -> Optional[Tuple[int, Dict[str, Any]]]:
+        async with self._pool.acquire() as conn:
+            row = await conn.fetchrow(
+                "SELECT event_offset, state::text AS state FROM event_snapshots WHERE name = $1",
+                name,
+            )
+        return (row["event_offset"], _loads(row["state"])) if row else None
+
+    async def dlq_append(self, record: Dict[str, Any]) -> int:
+        async with self._pool.acquire() as conn:
+            return await conn.fetchval(
+                """
+                INSERT INTO event_dlq (consumer_group, event_offset, record, error)
+                VALUES ($1, $2, $3::text::jsonb, $4) RETURNING id
+                """,
+                record.get("group"),
+                record.get("offset"),
+                _dumps(record).decode("utf-8"),
+                record.get("error"),
+            )
+
+    async def dlq_read(self, from_offset: int = 0, max_records: int = 100) -> List[LogRecord]:
+        async with self._pool.acquire() as conn:
+            rows = await conn.fetch(
+                "SELECT id, record::text AS record FROM event_dlq WHERE id >= $1 ORDER BY id LIMIT $2",
+                from_offset,
+                max_records,
+            )
+        return [(row["id"], _loads(row["record"])) for row in rows]
+
+    async def close(self) -> None:
+        pass
+
+
+__all__ = [
+    "InMemoryEventLog",
+    "SegmentedLog",
+    "FileEventLog",
+    "PostgresEventLog",
+    "LogRecord",
+]
@@ -14,16 +14,44 @@ TECHNICAL SPECS:
   • Read model projections (Elasticsearch)
   • Stream processing (Kafka/Redis Streams)
   • Materialized views
-  • Event store with snapshots
+  • Event store with snapshots (segmented file / Postgres event log)
 """
 
 import asyncio
+import gc
+import json
 import logging
-from collections import deque
-from dataclasses import dataclass, field
-from datetime import datetime
+import time
+import uuid
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Awaitable, Callable, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from upgrades.packet_envelope.event_log import InMemoryEventLog
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+try:
+    import asyncpg
+
+    _RECORD_ERRORS: Tuple[type, ...] = (
+        ValueError,
+        TypeError,
+        asyncpg.DataError,
+        asyncpg.IntegrityConstraintViolationError,
+    )
+except ImportError:
+    asyncpg = None
+    _RECORD_ERRORS = (ValueError, TypeError)
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +59,140 @@ logger = logging.getLogger(__name__)
 # BATCH INGESTION
 # ============================================================================
 
+# Non-UUID packet ids map deterministically into packet_store's UUID key
+PACKET_ID_NAMESPACE = uuid.UUID("848f69b3-a205-4efe-a40d-d048b9767a67")
+
+PACKET_STORE_COLUMNS: Tuple[str, ...] = (
+    "packet_id",
+    "packet_type",
+    "envelope",
+    "timestamp",
+    "routing",
+    "provenance",
+    "thread_id",
+    "parent_ids",
+    "tags",
+    "ttl",
+    "content_hash",
+    "session_id",
+    "scope",
+    "trace_id",
+    "importance_score",
+)
+_JSON_COLUMNS = ("envelope", "routing", "provenance")
+
+STAGING_TABLE = "l9_packet_ingest_staging"
+
+# JSON columns are staged as text so binary COPY never depends on the
+# connection's jsonb codec; the merge casts them
+_STAGING_DDL = f"""
+CREATE TEMP TABLE IF NOT EXISTS {STAGING_TABLE} (
+    packet_id UUID,
+    packet_type TEXT,
+    envelope TEXT,
+    timestamp TIMESTAMPTZ,
+    routing TEXT,
+    provenance TEXT,
+    thread_id UUID,
+    parent_ids UUID[],
+    tags TEXT[],
+    ttl TIMESTAMP,
+    content_hash TEXT,
+    session_id TEXT,
+    scope TEXT,
+    trace_id TEXT,
+    importance_score DOUBLE PRECISION
+) ON COMMIT DELETE ROWS
+"""
+
+
+def _json_dumps(obj: Any) -> str:
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(obj, default=str, separators=(",", ":"))
+
+
+def _packet_uuid(value: Any) -> uuid.UUID:
+    if isinstance(value, uuid.UUID):
+        return value
+    try:
+        return uuid.UUID(str(value))
+    except ValueError:
+        return uuid.uuid5(PACKET_ID_NAMESPACE, str(value))
+
+
+def _parse_timestamp(value: Any) -> datetime:
+    if isinstance(value, datetime):
+        ts = value
+    elif isinstance(value, str):
+        ts = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    else:
+        raise ValueError(f"Invalid timestamp: {value!r}")
+    return ts if ts.tzinfo else ts.replace(tzinfo=timezone.utc)
+
+
+def packet_to_record(packet: Dict[str, Any]) -> tuple:
+    """
+    Convert a validated ingest packet into a packet_store record
+    (values in PACKET_STORE_COLUMNS order).
+
+    Non-UUID ids are mapped with uuid5 and kept as metadata.external_id.
+    """
+    packet_id = _packet_uuid(packet["id"])
+    timestamp = _parse_timestamp(packet["timestamp"])
+    payload = packet["payload"]
+    if not isinstance(payload, dict):
+        raise ValueError("payload must be a JSON object")
+
+    metadata = dict(packet.get("metadata") or {})
+    if str(packet_id) != str(packet["id"]):
+        metadata.setdefault("external_id", str(packet["id"]))
+    packet_type = packet.get("packet_type") or packet.get("type") or "event"
+    provenance = packet.get("provenance")
+    confidence = packet.get("confidence")
+    lineage = packet.get("lineage") or {}
+    parent_ids = [_packet_uuid(p) for p in lineage.get("parent_ids") or []]
+    thread_id = _packet_uuid(packet["thread_id"]) if packet.get("thread_id") else None
+    tags = [str(t) for t in packet.get("tags") or []]
+    ttl = None
+    if packet.get("ttl"):
+        ttl = _parse_timestamp(packet["ttl"]).astimezone(timezone.utc).replace(tzinfo=None)
+
+    importance = metadata.get("importance")
+    if importance is None and isinstance(confidence, dict):
+        importance = confidence.get("score")
+
+    envelope = {
+        "packet_id": str(packet_id),
+        "packet_type": packet_type,
+        "timestamp": timestamp.isoformat(),
+        "payload": payload,
+        "metadata": metadata,
+        "provenance": provenance,
+        "confidence": confidence,
+        "thread_id": str(thread_id) if thread_id else None,
+        "lineage": lineage or None,
+        "tags": tags,
+        "ttl": ttl.isoformat() if ttl else None,
+    }
+    return (
+        packet_id,
+        packet_type,
+        _json_dumps(envelope),
+        timestamp,
+        _json_dumps({"agent": metadata.get("agent")}),
+        _json_dumps(provenance),
+        thread_id,
+        parent_ids,
+        tags,
+        ttl,
+        metadata.get("content_hash"),
+        metadata.get("session_id"),
+        metadata.get("scope", "shared"),
+        metadata.get("trace_id"),
+        importance,
+    )
+
 
 @dataclass
 class BatchIngestRequest:
@@ -54,12 +216,166 @@ class BatchIngestResult:
     errors: List[Dict[str, Any]] = field(default_factory=list)
     duration_ms: float = 0.0
     timestamp: datetime = field(default_factory=datetime.utcnow)
+    duplicate_packets: int = 0  # already stored; counted as successful
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["timestamp"] = self.timestamp.isoformat()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BatchIngestResult":
+        data = dict(data)
+        if isinstance(data.get("timestamp"), str):
+            data["timestamp"] = datetime.fromisoformat(data["timestamp"])
+        return cls(**data)
+
+
+# ----------------------------------------------------------------------------
+# Sinks
+# ----------------------------------------------------------------------------
+
+
+class PostgresPacketSink:
+    """
+    Writes packet_store records with binary COPY into a per-connection temp
+    staging table, then merges with INSERT ... ON CONFLICT DO NOTHING.
+    One transaction and two round trips per sub-batch.
+    """
+
+    def __init__(self, pool: Any, table: str = "packet_store"):
+        """
+        Args:
+            pool: asyncpg pool
+            table: Target table (packet_store schema)
+        """
+        self._pool = pool
+        self.table = table
+        columns = ", ".join(PACKET_STORE_COLUMNS)
+        select = ", ".join(
+            f"{c}::jsonb" if c in _JSON_COLUMNS else c for c in PACKET_STORE_COLUMNS
+        )
+        self._merge_sql = (
+            f"INSERT INTO {table} ({columns}) SELECT {select} FROM {STAGING_TABLE} "
+            f"ON CONFLICT (packet_id) DO NOTHING RETURNING packet_id"
+        )
+
+    async def write(self, records: Sequence[tuple]) -> Set[uuid.UUID]:
+        """
+        Write records.
+
+        Returns:
+            packet_ids actually inserted (the rest already existed)
+        """
+        async with self._pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.execute(_STAGING_DDL)
+                await conn.copy_records_to_table(
+                    STAGING_TABLE, records=records, columns=PACKET_STORE_COLUMNS
+                )
+                rows = await conn.fetch(self._merge_sql)
+        return {row["packet_id"] for row in rows}
+
+
+# ----------------------------------------------------------------------------
+# Idempotency stores
+# ----------------------------------------------------------------------------
+
+
+class InMemoryIdempotencyStore:
+    """Process-local idempotency results with TTL (single-instance deployments)"""
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        return value
+
+    async def set(self, key: str, value: Dict[str, Any], ttl_seconds: int) -> None:
+        self._entries[key] = (time.monotonic() + ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+class RedisIdempotencyStore:
+    """Idempotency results in Redis (SET NX EX), shared across instances"""
+
+    def __init__(self, client: Any, prefix: str = "l9:ingest:idempotency:"):
+        """
+        Args:
+            client: redis.asyncio client
+            prefix: Key prefix
+        """
+        self._client = client
+        self.prefix = prefix
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        raw = await self._client.get(self.prefix + key)
+        return json.loads(raw) if raw else None
+
+    async def set(self, key: str, value: Dict[str, Any], ttl_seconds: int) -> None:
+        # NX: the first completed result wins for the TTL
+        await self._client.set(
+            self.prefix + key, _json_dumps(value), ex=ttl_seconds, nx=True
+        )
+
+
+class PostgresIdempotencyStore:
+    """Idempotency results in Postgres (migration 0013_ingest_idempotency)"""
+
+    def __init__(self, pool: Any, table: str = "ingest_idempotency"):
+        self._pool = pool
+        self.table = table
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        async with self._pool.acquire() as conn:
+            raw = await conn.fetchval(
+                f"SELECT result FROM {self.table} WHERE key = $1 AND expires_at > NOW()",
+                key,
+            )
+        if raw is None:
+            return None
+        return json.loads(raw) if isinstance(raw, (str, bytes)) else raw
+
+    async def set(self, key: str, value: Dict[str, Any], ttl_seconds: int) -> None:
+        async with self._pool.acquire() as conn:
+            await conn.execute(
+                f"""
+                INSERT INTO {self.table} (key, result, expires_at)
+                VALUES ($1, $2::text::jsonb, NOW() + make_interval(secs => $3))
+                ON CONFLICT (key) DO UPDATE
+                    SET result = EXCLUDED.result, expires_at = EXCLUDED.expires_at
+                    WHERE {self.table}.expires_at <= NOW()
+                """,
+                key,
+                _json_dumps(value),
+                float(ttl_seconds),
+            )
+
+
+# ----------------------------------------------------------------------------
+# Engine
+# ----------------------------------------------------------------------------
 
 
 class BatchIngestionEngine:
     """
     High-throughput batch ingestion
     Optimized for 1000s packets/second
+
+    Sub-batches are COPY'd into packet_store through PostgresPacketSink;
+    packet ids are idempotent (ON CONFLICT DO NOTHING) and whole requests
+    are idempotent by idempotency_key. Without a pool, packets are only
+    validated.
     """
 
     def __init__(
@@ -67,12 +383,36 @@ class BatchIngestionEngine:
         batch_size: int = 1000,
         max_concurrent_batches: int = 10,
         db_pool_size: int = 20,
+        pool: Any = None,
+        sink: Any = None,
+        idempotency_store: Any = None,
+        idempotency_ttl_seconds: int = 3600,
     ):
+        """
+        Args:
+            batch_size: Packets per COPY sub-batch
+            max_concurrent_batches: Sub-batches written concurrently
+            db_pool_size: Pool size hint (pool is owned by the caller)
+            pool: asyncpg pool; builds a PostgresPacketSink
+            sink: Explicit sink (object with async write(records) -> inserted ids)
+            idempotency_store: Store for idempotency_key results
+                (InMemory/Redis/PostgresIdempotencyStore; in-memory by default)
+            idempotency_ttl_seconds: How long a key's result is replayed
+        """
         self.batch_size = batch_size
         self.max_concurrent_batches = max_concurrent_batches
         self.db_pool_size = db_pool_size
         self.logger = logger
 
+        self.sink = sink or (PostgresPacketSink(pool) if pool is not None else None)
+        self.idempotency_store = idempotency_store or InMemoryIdempotencyStore()
+        self.idempotency_ttl_seconds = idempotency_ttl_seconds
+        self._inflight: Dict[str, "asyncio.Future[BatchIngestResult]"] = {}
+        if self.sink is None:
+            self.logger.warning(
+                "BatchIngestionEngine has no database pool: packets are validated, not stored"
+            )
+
         # Metrics
         self.total_packets_ingested = 0
         self.total_batches_processed = 0
@@ -81,8 +421,41 @@ class BatchIngestionEngine:
     async def ingest_batch(self, request: BatchIngestRequest) -> BatchIngestResult:
         """
         Ingest batch of packets
-        Returns immediately with status, completes asynchronously
+
+        Concurrent requests with the same idempotency_key share one
+        execution; completed results are replayed for the key's TTL.
         """
+        key = request.idempotency_key
+        if not key:
+            return await self._ingest(request)
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.logger.info(f"Batch {request.batch_id} (idempotent, in flight)")
+            return await asyncio.shield(inflight)
+
+        future: "asyncio.Future[BatchIngestResult]" = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            cached = await self._check_idempotency(key)
+            if cached:
+                self.logger.info(f"Batch {request.batch_id} (idempotent)")
+                result = cached
+            else:
+                result = await self._ingest(request)
+                # Failed batches are retryable, not replayed
+                if result.successful_packets or not result.failed_packets:
+                    await self._cache_result(key, result)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # mark retrieved
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _ingest(self, request: BatchIngestRequest) -> BatchIngestResult:
         start_time = asyncio.get_event_loop().time()
 
         result = BatchIngestResult(
@@ -93,28 +466,19 @@ class BatchIngestionEngine:
         )
 
         try:
-            # Check idempotency
-            if request.idempotency_key:
-                cached_result = await self._check_idempotency(request.idempotency_key)
-                if cached_result:
-                    self.logger.info(f"Batch {request.batch_id} (idempotent)")
-                    return cached_result
-
             # Split into smaller batches for parallel processing
-            sub_batches = [
-                request.packets[i : i + self.batch_size]
-                for i in range(0, len(request.packets), self.batch_size)
-            ]
+            offsets = range(0, len(request.packets), self.batch_size)
+            sub_batches = [request.packets[i : i + self.batch_size] for i in offsets]
 
             # Process in parallel
             semaphore = asyncio.Semaphore(self.max_concurrent_batches)
 
-            async def process_sub_batch(packets: List):
+            async def process_sub_batch(packets: List, offset: int):
                 async with semaphore:
-                    return await self._process_sub_batch(packets)
+                    return await self._process_sub_batch(packets, offset)
 
             results = await asyncio.gather(
-                *[process_sub_batch(batch) for batch in sub_batches],
+                *[process_sub_batch(b, o) for b, o in zip(sub_batches, offsets)],
                 return_exceptions=True,
             )
 
@@ -122,21 +486,17 @@ class BatchIngestionEngine:
             for idx, sub_result in enumerate(results):
                 if isinstance(sub_result, Exception):
                     result.failed_packets += len(sub_batches[idx])
-                    result.errors.append(
-                        {
-                            "error": str(sub_result),
-                            "timestamp": datetime.utcnow().isoformat(),
-                        }
+                    result.errors.extend(
+                        self._packet_errors(
+                            sub_batches[idx], offsets[idx], sub_result, "write"
+                        )
                     )
                 else:
                     result.successful_packets += sub_result["successful"]
                     result.failed_packets += sub_result["failed"]
+                    result.duplicate_packets += sub_result["duplicates"]
                     result.errors.extend(sub_result["errors"])
 
-            # Cache result for idempotency
-            if request.idempotency_key:
-                await self._cache_result(request.idempotency_key, result)
-
             # Update metrics
             self.total_packets_ingested += result.successful_packets
             self.total_batches_processed += 1
@@ -152,46 +512,106 @@ class BatchIngestionEngine:
 
             self.logger.info(
                 f"Batch {request.batch_id}: "
-                f"{result.successful_packets}/{result.total_packets} successful "
+                f"{result.successful_packets}/{result.total_packets} successful, "
+                f"{result.duplicate_packets} duplicates "
                 f"({duration_ms:.1f}ms)"
             )
 
         except Exception as e:
             self.logger.error(f"Batch ingestion failed: {e}", exc_info=True)
             result.failed_packets = len(request.packets)
+            result.successful_packets = 0
             result.errors.append({"error": str(e)})
 
         return result
 
-    async def _process_sub_batch(self, packets: List) -> Dict[str, Any]:
-        """Process a single sub-batch"""
-        successful = 0
-        failed = 0
-        errors = []
+    async def _process_sub_batch(self, packets: List, offset: int = 0) -> Dict[str, Any]:
+        """Validate, encode and write a single sub-batch"""
+        errors: List[Dict[str, Any]] = []
+        records: List[tuple] = []
+        indexes: List[int] = []
+        seen: Set[uuid.UUID] = set()
+        duplicates = 0
 
-        # Validate packets
-        validated = []
-        for packet in packets:
+        for i, packet in enumerate(packets):
             try:
-                validated.append(self._validate_packet(packet))
-                successful += 1
+                record = packet_to_record(self._validate_packet(packet))
             except Exception as e:
-                failed += 1
-                errors.append({"packet": packet.get("id"), "error": str(e)})
+                errors.append(self._packet_error(packet, offset + i, e, "validation"))
+                continue
+            if record[0] in seen:
+                duplicates += 1
+                continue
+            seen.add(record[0])
+            records.append(record)
+            indexes.append(offset + i)
+
+        if self.sink is None or not records:
+            successful = len(records)
+        else:
+            successful, already_stored, write_errors = await self._write_records(
+                records, indexes, packets, offset
+            )
+            duplicates += already_stored
+            errors.extend(write_errors)
+
+        return {
+            "successful": successful + duplicates,
+            "failed": len(errors),
+            "duplicates": duplicates,
+            "errors": errors,
+        }
+
+    async def _write_records(
+        self,
+        records: List[tuple],
+        indexes: List[int],
+        packets: List,
+        offset: int,
+    ) -> Tuple[int, int, List[Dict[str, Any]]]:
+        """
+        Write records; on a data error, bisect to isolate the bad packets so
+        the rest of the sub-batch is still stored.
 
-        # Bulk insert to database
+        Returns:
+            (inserted, already_stored, errors)
+        """
         try:
-            # Simulated DB insert (production: use connection pool)
-            await asyncio.sleep(0.01)  # Simulate I/O
+            inserted = await self.sink.write(records)
+            return len(inserted), len(records) - len(inserted), []
+        except _RECORD_ERRORS as e:
+            if len(records) == 1:
+                packet = packets[indexes[0] - offset]
+                return 0, 0, [self._packet_error(packet, indexes[0], e, "write")]
+            mid = len(records) // 2
+            left = await self._write_records(records[:mid], indexes[:mid], packets, offset)
+            right = await self._write_records(records[mid:], indexes[mid:], packets, offset)
+            return left[0] + right[0], left[1] + right[1], left[2] + right[2]
         except Exception as e:
+            # Connection-level failure: every packet in the sub-batch failed
             self.logger.error(f"Bulk insert failed: {e}")
-            failed += successful
-            successful = 0
+            return 0, 0, [
+                self._packet_error(packets[i - offset], i, e, "write") for i in indexes
+            ]
 
-        return {"successful": successful, "failed": failed, "errors": errors}
+    @staticmethod
+    def _packet_error(packet: Any, index: int, error: Exception, stage: str) -> Dict[str, Any]:
+        return {
+            "index": index,
+            "packet": packet.get("id") if isinstance(packet, dict) else None,
+            "stage": stage,
+            "error": str(error),
+        }
+
+    def _packet_errors(
+        self, packets: List, offset: int, error: Exception, stage: str
+    ) -> List[Dict[str, Any]]:
+        return [self._packet_error(p, offset + i, error, stage) for i, p in enumerate(packets)]
 
     def _validate_packet(self, packet: Dict) -> Dict:
         """Validate individual packet"""
+        if not isinstance(packet, dict):
+            raise ValueError("Packet must be an object")
         required_fields = ["id", "payload", "timestamp"]
         for field_name in required_fields:
             if field_name not in packet:
@@ -200,13 +620,21 @@ class BatchIngestionEngine:
 
     async def _check_idempotency(self, key: str) -> Optional[BatchIngestResult]:
         """Check if batch already processed"""
-        # TODO: Check cache
-        return None
+        try:
+            cached = await self.idempotency_store.get(key)
+        except Exception as e:
+            self.logger.warning(f"Idempotency lookup failed for {key}: {e}")
+            return None
+        return BatchIngestResult.from_dict(cached) if cached else None
 
     async def _cache_result(self, key: str, result: BatchIngestResult):
         """Cache result for idempotency"""
-        # TODO: Store in cache (Redis/Memcached)
-        pass
+        try:
+            await self.idempotency_store.set(
+                key, result.to_dict(), self.idempotency_ttl_seconds
+            )
+        except Exception as e:
+            self.logger.warning(f"Idempotency store failed for {key}: {e}")
 
 
 # ============================================================================
@@ -246,6 +674,27 @@ class Event:
     timestamp: datetime = field(default_factory=datetime.utcnow)
     command_id: Optional[str] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "event_id": self.event_id,
+            "event_type": self.event_type,
+            "aggregate_id": self.aggregate_id,
+            "data": self.data,
+            "timestamp": self.timestamp.isoformat(),
+            "command_id": self.command_id,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Event":
+        return cls(
+            event_id=data["event_id"],
+            event_type=data["event_type"],
+            aggregate_id=data["aggregate_id"],
+            data=data.get("data") or {},
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            command_id=data.get("command_id"),
+        )
+
 
 class CommandHandler:
     """Handles commands and produces events"""
@@ -303,15 +752,34 @@ class CommandHandler:
         return events
 
 
+@contextmanager
+def _gc_paused():
+    """
+    Pause cyclic GC while a projection is rebuilt. Replay only allocates
+    acyclic dicts/lists, and GC passes over the growing projection would
+    otherwise dominate large rebuilds.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
 class ReadModel:
     """
     Materialized read model for queries
-    Updated by event handlers
+    Updated by event handlers; rebuilt from the latest snapshot plus the
+    tail of the event log
     """
 
-    def __init__(self):
+    def __init__(self, name: str = "read_model"):
+        self.name = name
         self.packets: Dict[str, Dict] = {}
         self.lineage_graph: Dict[str, List[str]] = {}
+        self.last_offset = -1  # last event log offset applied
         self.logger = logger
 
     async def handle_event(self, event: Event):
@@ -319,6 +787,10 @@ class ReadModel:
         Update read model based on event
         Async to support eventual consistency
         """
+        self.apply(event)
+
+    def apply(self, event: Event, offset: Optional[int] = None) -> None:
+        """Apply one event (synchronous; used for replay)"""
         if event.event_type == "PacketIngested":
             self.packets[event.aggregate_id] = {
                 "packet_id": event.aggregate_id,
@@ -334,6 +806,9 @@ class ReadModel:
                     self.lineage_graph[parent_id] = []
                 self.lineage_graph[parent_id].append(event.aggregate_id)
 
+        if offset is not None:
+            self.last_offset = offset
+
     async def query_packet(self, packet_id: str) -> Optional[Dict]:
         """Query packet from read model"""
         return self.packets.get(packet_id)
@@ -342,6 +817,85 @@ class ReadModel:
         """Query lineage from read model"""
         return self.lineage_graph.get(packet_id, [])
 
+    def to_state(self) -> Dict[str, Any]:
+        """Serializable projection state"""
+        return {
+            "packets": {
+                pid: {**p, "created_at": p["created_at"].isoformat()}
+                for pid, p in self.packets.items()
+            },
+            "lineage_graph": self.lineage_graph,
+        }
+
+    def load_state(self, state: Dict[str, Any]) -> None:
+        """Replace projection state with a snapshot's"""
+        self.packets = {
+            pid: {**p, "created_at": datetime.fromisoformat(p["created_at"])}
+            for pid, p in state.get("packets", {}).items()
+        }
+        self.lineage_graph = {k: list(v) for k, v in state.get("lineage_graph", {}).items()}
+
+    async def snapshot(self, store: "EventStore") -> None:
+        """Persist projection state at last_offset"""
+        await store.save_snapshot(self.name, self.last_offset, self.to_state())
+
+    async def catch_up(
+        self,
+        store: "EventStore",
+        batch_size: int = 10000,
+        snapshot_interval: Optional[int] = None,
+    ) -> int:
+        """
+        Apply events after last_offset
+
+        Args:
+            store: Event store to read from
+            batch_size: Events per fetch
+            snapshot_interval: Snapshot every N applied offsets (None = never)
+
+        Returns:
+            Number of events applied
+        """
+        applied = 0
+        snapshot_at = self.last_offset
+        with _gc_paused():
+            while True:
+                batch = await store.read(self.last_offset + 1, batch_size)
+                if not batch:
+                    break
+                for offset, event in batch:
+                    self.apply(event, offset)
+                applied += len(batch)
+                if snapshot_interval and self.last_offset - snapshot_at >= snapshot_interval:
+                    await self.snapshot(store)
+                    snapshot_at = self.last_offset
+        return applied
+
+    async def rebuild(
+        self,
+        store: "EventStore",
+        use_snapshot: bool = True,
+        batch_size: int = 10000,
+        snapshot_interval: Optional[int] = None,
+    ) -> int:
+        """
+        Rebuild from the latest snapshot (if any) plus tail replay
+
+        Returns:
+            Number of events replayed after the snapshot
+        """
+        self.packets = {}
+        self.lineage_graph = {}
+        self.last_offset = -1
+        if use_snapshot:
+            with _gc_paused():
+                snapshot = await store.load_snapshot(self.name)
+                if snapshot is not None:
+                    offset, state = snapshot
+                    self.load_state(state)
+                    self.last_offset = offset
+        return await self.catch_up(store, batch_size, snapshot_interval)
+
 
 # ============================================================================
 # STREAMING CONSUMER
@@ -352,63 +906,99 @@ class StreamConsumer:
     """
     Streaming event consumer
     Processes events from event store in order
-    Supports multiple consumer groups
+    Supports multiple consumer groups (offsets committed per group)
     """
 
     def __init__(
         self,
         consumer_group: str,
         event_handlers: List[Callable[[Event], Awaitable[None]]],
+        event_store: Optional["EventStore"] = None,
+        batch_size: int = 100,
+        poll_interval: float = 1.0,
+        max_retries: int = 3,
     ):
+        """
+        Args:
+            consumer_group: Group name; the committed offset is shared by its members
+            event_handlers: Async handlers run for every event
+            event_store: Store to consume from
+            batch_size: Events per fetch
+            poll_interval: Sleep when caught up (seconds)
+            max_retries: Attempts per event before it goes to the DLQ
+        """
         self.consumer_group = consumer_group
         self.event_handlers = event_handlers
+        self.event_store = event_store
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_retries = max_retries
         self.logger = logger
-        self.offset = 0
+        self.offset = 0  # next offset to read
         self.is_running = False
 
-    async def start(self, from_offset: int = 0):
-        """Start consuming events"""
+    async def start(self, from_offset: Optional[int] = None):
+        """Start consuming events (from the group's committed offset by default)"""
         self.is_running = True
-        self.offset = from_offset
+        if from_offset is None and self.event_store is not None:
+            from_offset = await self.event_store.committed_offset(self.consumer_group)
+        self.offset = from_offset or 0
 
         self.logger.info(
-            f"Consumer {self.consumer_group} starting from offset {from_offset}"
+            f"Consumer {self.consumer_group} starting from offset {self.offset}"
         )
 
         while self.is_running:
-            # Get next batch of events (simulated)
-            events = await self._fetch_events(self.offset, batch_size=100)
+            if not await self.poll_once():
+                await asyncio.sleep(self.poll_interval)  # Wait before retry
 
-            if not events:
-                await asyncio.sleep(1)  # Wait before retry
-                continue
+    async def poll_once(self) -> int:
+        """
+        Fetch and process one batch, then commit the group offset
+
+        Returns:
+            Number of events processed (including dead-lettered ones)
+        """
+        batch = await self._fetch_events(self.offset, batch_size=self.batch_size)
+        if not batch:
+            return 0
 
-            # Process each event
-            for event in events:
+        for offset, event in batch:
+            error: Optional[Exception] = None
+            for _ in range(self.max_retries):
                 try:
                     for handler in self.event_handlers:
                         await handler(event)
-
-                    self.offset += 1
-
+                    error = None
+                    break
                 except Exception as e:
-                    self.logger.error(f"Error processing event {event.event_id}: {e}")
-                    # Dead-letter queue
-                    await self._send_to_dlq(event)
+                    error = e
+            if error is not None:
+                self.logger.error(f"Error processing event {event.event_id}: {error}")
+                # Dead-letter queue
+                await self._send_to_dlq(event, offset, error)
+            self.offset = offset + 1
+
+        if self.event_store is not None:
+            await self.event_store.commit_offset(self.consumer_group, self.offset)
+        return len(batch)
 
     async def stop(self):
         """Stop consuming"""
         self.is_running = False
         self.logger.info(f"Consumer {self.consumer_group} stopped")
 
-    async def _fetch_events(self, from_offset: int, batch_size: int) -> List[Event]:
-        """Fetch events from event store"""
-        # TODO: Implement event store query
-        return []
+    async def _fetch_events(self, from_offset: int, batch_size: int) -> List[Tuple[int, Event]]:
+        """Fetch (offset, event) pairs from event store"""
+        if self.event_store is None:
+            return []
+        return await self.event_store.read(from_offset, batch_size)
 
-    async def _send_to_dlq(self, event: Event):
+    async def _send_to_dlq(self, event: Event, offset: int = -1, error: Optional[Exception] = None):
         """Send failed event to dead-letter queue"""
         self.logger.error(f"DLQ: {event.event_id}")
+        if self.event_store is not None:
+            await self.event_store.send_to_dlq(self.consumer_group, offset, event, error)
 
 
 # ============================================================================
@@ -430,53 +1020,137 @@ class EventStore:
     """
     Event store with snapshot support
     Enables efficient aggregate reconstruction
+
+    Events live in an append-only log (event_log.InMemoryEventLog by default,
+    FileEventLog or PostgresEventLog for durability). Offsets are
+    monotonically increasing; projection snapshots, consumer-group offsets
+    and the DLQ are kept by the same log.
     """
 
-    def __init__(self, snapshot_interval: int = 100):
-        self.events: List[Event] = []
+    def __init__(self, snapshot_interval: int = 100, log: Any = None):
+        """
+        Args:
+            snapshot_interval: Aggregate snapshot every N appended events
+            log: Event log backend (defaults to in-memory)
+        """
+        self.log = log if log is not None else InMemoryEventLog()
         self.snapshots: Dict[str, Snapshot] = {}
         self.snapshot_interval = snapshot_interval
         self.logger = logger
 
-    async def append_event(self, event: Event) -> int:
-        """Append event to store"""
-        self.events.append(event)
-
-        # Create snapshot every N events
-        if len(self.events) % self.snapshot_interval == 0:
-            await self._create_snapshot()
+        # aggregate_id -> offsets, covering log offsets below _indexed_until
+        self._aggregate_offsets: Dict[str, List[int]] = {}
+        self._indexed_until = 0
+        self._dirty_aggregates: Set[str] = set()
+        self._appended = 0
 
-        return len(self.events) - 1
+    async def append_event(self, event: Event) -> int:
+        """Append event to store; returns its offset"""
+        return (await self.append_events([event]))[0]
+
+    async def append_events(self, events: Sequence[Event]) -> List[int]:
+        """Append events in one log write; returns their offsets"""
+        offsets = await self.log.append([e.to_dict() for e in events])
+        if offsets and offsets[0] == self._indexed_until:
+            for offset, event in zip(offsets, events):
+                self._index(offset, event)
+            self._indexed_until = offsets[-1] + 1
+
+        for _ in events:
+            self._appended += 1
+            # Create snapshot every N events
+            if self._appended % self.snapshot_interval == 0:
+                await self._create_snapshot()
+
+        return offsets
+
+    async def read(self, from_offset: int = 0, max_events: int = 1000) -> List[Tuple[int, Event]]:
+        """Batch fetch (offset, event) pairs starting at from_offset"""
+        records = await self.log.read(from_offset, max_events)
+        return [(offset, Event.from_dict(record)) for offset, record in records]
+
+    async def end_offset(self) -> int:
+        """Next offset to be assigned"""
+        return await self.log.end_offset()
 
     async def get_events(
         self, aggregate_id: str, from_version: int = 0
     ) -> List[Event]:
-        """Get events for aggregate"""
-        return [
-            e
-            for e in self.events
-            if e.aggregate_id == aggregate_id and len(self.events) >= from_version
-        ]
+        """Get events for aggregate (from_version = index into its history)"""
+        await self._catch_up_index()
+        events = []
+        for offset in self._aggregate_offsets.get(aggregate_id, [])[from_version:]:
+            events.extend(event for _, event in await self.read(offset, 1))
+        return events
 
     async def get_snapshot(self, aggregate_id: str) -> Optional[Snapshot]:
         """Get latest snapshot"""
         return self.snapshots.get(aggregate_id)
 
+    async def save_snapshot(self, name: str, offset: int, state: Dict[str, Any]) -> None:
+        """Persist a projection snapshot taken at offset"""
+        await self.log.save_snapshot(name, offset, state)
+
+    async def load_snapshot(self, name: str) -> Optional[Tuple[int, Dict[str, Any]]]:
+        """Latest projection snapshot as (offset, state)"""
+        return await self.log.load_snapshot(name)
+
+    async def commit_offset(self, consumer_group: str, next_offset: int) -> None:
+        """Record the next offset a consumer group will read"""
+        await self.log.commit_offset(consumer_group, next_offset)
+
+    async def committed_offset(self, consumer_group: str) -> int:
+        """Next offset for a consumer group (0 if it never committed)"""
+        offset = await self.log.get_offset(consumer_group)
+        return offset if offset is not None else 0
+
+    async def send_to_dlq(
+        self,
+        consumer_group: str,
+        offset: int,
+        event: Event,
+        error: Optional[Exception] = None,
+    ) -> None:
+        """Dead-letter an event a consumer group failed to process"""
+        await self.log.dlq_append(
+            {
+                "group": consumer_group,
+                "offset": offset,
+                "event": event.to_dict(),
+                "error": str(error) if error is not None else None,
+                "failed_at": datetime.utcnow().isoformat(),
+            }
+        )
+
+    async def read_dlq(self, from_offset: int = 0, max_records: int = 100) -> List[Tuple[int, Dict[str, Any]]]:
+        """Read dead-lettered entries"""
+        return await self.log.dlq_read(from_offset, max_records)
+
+    async def close(self) -> None:
+        await self.log.close()
+
+    def _index(self, offset: int, event: Event) -> None:
+        self._aggregate_offsets.setdefault(event.aggregate_id, []).append(offset)
+        self._dirty_aggregates.add(event.aggregate_id)
+
+    async def _catch_up_index(self, batch_size: int = 10000) -> None:
+        """Index events appended by other writers or before this process started"""
+        while True:
+            batch = await self.log.read(self._indexed_until, batch_size)
+            if not batch:
+                return
+            for offset, record in batch:
+                self._aggregate_offsets.setdefault(record["aggregate_id"], []).append(offset)
+                self._dirty_aggregates.add(record["aggregate_id"])
+            self._indexed_until = batch[-1][0] + 1
+
     async def _create_snapshot(self):
-        """Create snapshot from events"""
-        # Group events by aggregate
-        aggregates: Dict[str, List[Event]] = {}
-        for event in self.events:
-            if event.aggregate_id not in aggregates:
-                aggregates[event.aggregate_id] = []
-            aggregates[event.aggregate_id].append(event)
-
-        # Create snapshot for each aggregate
-        for agg_id, events in aggregates.items():
-            snapshot = Snapshot(
+        """Snapshot aggregates that changed since the last snapshot"""
+        for agg_id in self._dirty_aggregates:
+            offsets = self._aggregate_offsets[agg_id]
+            self.snapshots[agg_id] = Snapshot(
                 aggregate_id=agg_id,
-                aggregate_version=len(events),
-                state={"event_count": len(events)},
+                aggregate_version=len(offsets),
+                state={"event_count": len(offsets), "last_offset": offsets[-1]},
             )
-            self.snapshots[agg_id] = snapshot
-
+        self._dirty_aggregates.clear()